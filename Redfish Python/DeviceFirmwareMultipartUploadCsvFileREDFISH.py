@@ -1,7 +1,7 @@
 #!/usr/bin/python3
 #
 # _author_ = Texas Roemer <Texas_Roemer@Dell.com>
-# _version_ = 2.0
+# _version_ = 3.1
 #
 # Copyright (c) 2024, Dell, Inc.
 #
@@ -17,18 +17,28 @@
 # iDRAC IP	        iDRAC Username	iDRAC Password  
 # 192.168.0.120	        root            calvin		
 # 192.168.0.130	        root            calvin  
+#
+# Script pseudo code workflow:
+#
+# 1. Read the CSV file and get iDRAC IP, username and password for each iDRAC.
+# 2. Memory map the firmware image once, all upload workers send the same mapped image so the file is not re-opened or re-read for each iDRAC.
+# 3. Upload the image and create the update job for multiple iDRACs at the same time, argument --max-workers sets how many iDRACs (default 10).
+#    Use arguments --host-bandwidth and --total-bandwidth to limit upload speed per iDRAC and for all iDRACs.
+# 4. Job watcher thread polls all job IDs in one loop as soon as each job is created, while uploads to other iDRACs are still running.
 
 import argparse
+import concurrent.futures
 import csv
 import getpass
 import json
 import logging
+import mmap
 import os
-import platform
+import queue
 import re
 import requests
-import subprocess
 import sys
+import threading
 import time
 import warnings
 
@@ -42,134 +52,227 @@ parser.add_argument('--script-examples', action="store_true", help='Prints scrip
 parser.add_argument('--get', help='Get current supported devices for firmware updates and their current firmware versions', action="store_true", required=False)
 parser.add_argument('--location', help='Pass in the full directory path location of the firmware image. Make sure to also pass in the name of the Dell Update package (DUP) executable, example: C:\\Users\\admin\\Downloads\\Diagnostics_Application_CH7FG_WN64_4301A42_4301.43.EXE', required=False)
 parser.add_argument('--csv-filename', help='Pass in full directory path and name of csv file which contains details for all iDRACs, see script comments for CSV content example', dest="csv_filename", required=False)
+parser.add_argument('--max-workers', help='Max number of iDRACs to upload the firmware image to at the same time, default value is 10. Pass in 1 to upload to one iDRAC at a time.', dest="max_workers", type=int, default=10, required=False)
+parser.add_argument('--host-bandwidth', help='Max upload speed to each iDRAC in MB per second, by default upload speed is not limited', dest="host_bandwidth", type=float, required=False)
+parser.add_argument('--total-bandwidth', help='Max upload speed for all iDRACs combined in MB per second, by default upload speed is not limited', dest="total_bandwidth", type=float, required=False)
 
 args = vars(parser.parse_args())
 logging.basicConfig(format='%(message)s', stream=sys.stdout, level=logging.INFO)
 
 def script_examples():
-    print("""\n- DeviceFirmwareMultipartUploadCsvFileREDFISH.py -ip 192.168.0.120 -u root --location C:\\Users\\administrator\\Downloads\\BIOS_8MRPC_C6420_WN64_2.11.2.EXE --csv-filename C:\\Users\\administrator\\Downloads\\idrac_details.csv, this example will update BIOS firmware for all iDRACs listed in the CSV file.""")
+    print("""\n- DeviceFirmwareMultipartUploadCsvFileREDFISH.py --location C:\\Users\\administrator\\Downloads\\BIOS_8MRPC_C6420_WN64_2.11.2.EXE --csv-filename C:\\Users\\administrator\\Downloads\\idrac_details.csv, this example will update BIOS firmware for all iDRACs listed in the CSV file, uploading to 10 iDRACs at the same time.
+    \n- DeviceFirmwareMultipartUploadCsvFileREDFISH.py --location Network_Firmware_6JHDW_WN64_22.31.6_01.EXE --csv-filename idrac_details.csv --max-workers 50 --host-bandwidth 20 --total-bandwidth 400, this example will update NIC firmware for all iDRACs listed in the CSV file, uploading to 50 iDRACs at the same time. Upload speed is limited to 20 MB per second for each iDRAC and 400 MB per second for all iDRACs.""")
     sys.exit(0)
-    
-def download_image_create_update_job(idrac_ip, idrac_username, idrac_password, idrac_count):
-    global start_time
-    start_time = datetime.now()
-    logging.info("- INFO, extracting payload from update package for iDRAC %s to create update job" % idrac_ip)
-    url = "https://%s/redfish/v1/UpdateService/MultipartUpload" % idrac_ip
+
+class BandwidthLimiter(object):
+    # Each upload thread reserves the time needed to send a block at the max speed, thread sleeps until its reserved time. One limiter is shared by all threads for total bandwidth.
+    def __init__(self, megabytes_per_second):
+        self.bytes_per_second = megabytes_per_second * 1048576.0
+        self.lock = threading.Lock()
+        self.next_send_time = time.monotonic()
+
+    def consume(self, size):
+        with self.lock:
+            current_time = time.monotonic()
+            if self.next_send_time < current_time:
+                self.next_send_time = current_time
+            wait_time = self.next_send_time - current_time
+            self.next_send_time += size / self.bytes_per_second
+        if wait_time > 0:
+            time.sleep(wait_time)
+
+class MultipartUploadStream(object):
+    # Streams the multipart/form-data body for MultipartUpload from the memory mapped firmware image. Each read() returns a memoryview slice of the mapped image, image data is not copied for each iDRAC.
+    # requests uses len() to set Content-Length header and calls read() for each block to send.
+    def __init__(self, payload, image_name, image_view, bandwidth_limiters=None, chunk_size=1024*1024):
+        self.boundary = os.urandom(16).hex()
+        self.content_type = "multipart/form-data; boundary=%s" % self.boundary
+        self.chunk_size = chunk_size
+        self.bandwidth_limiters = bandwidth_limiters or []
+        body_start = ('--%s\r\nContent-Disposition: form-data; name="UpdateParameters"\r\nContent-Type: application/json\r\n\r\n%s\r\n'
+                      '--%s\r\nContent-Disposition: form-data; name="UpdateFile"; filename="%s"\r\nContent-Type: application/octet-stream\r\n\r\n'
+                      % (self.boundary, json.dumps(payload), self.boundary, image_name)).encode()
+        body_end = ("\r\n--%s--\r\n" % self.boundary).encode()
+        self.parts = [memoryview(body_start), image_view, memoryview(body_end)]
+        self.total_size = sum(len(i) for i in self.parts)
+        self.part_offset = 0
+
+    def __len__(self):
+        return self.total_size
+
+    def read(self, size=-1):
+        if size is None or size < 0 or size > self.chunk_size:
+            size = self.chunk_size
+        while self.parts and self.part_offset >= len(self.parts[0]):
+            self.parts.pop(0)
+            self.part_offset = 0
+        if not self.parts:
+            return b""
+        chunk = self.parts[0][self.part_offset:self.part_offset + size]
+        self.part_offset += len(chunk)
+        for i in self.bandwidth_limiters:
+            i.consume(len(chunk))
+        return chunk
+
+def get_csv_idracs(file_path):
+    idracs = []
+    with open(file_path, 'r', newline='') as csv_file:
+        csv_reader = csv.reader(csv_file)
+        for line_data in csv_reader:
+            if not line_data or "idrac ip" in line_data[0].lower():
+                continue
+            idrac = {"iDRAC IP": line_data[0].strip(), "iDRAC Username": line_data[1].strip(), "iDRAC Password": line_data[2].strip(), "Job ID": "", "Job Status": "", "Message": ""}
+            idrac["session"] = requests.Session()
+            idrac["session"].auth = (idrac["iDRAC Username"], idrac["iDRAC Password"])
+            idracs.append(idrac)
+    return idracs
+
+def download_image_create_update_job(idrac, image_view, total_bandwidth_limiter, job_queue):
+    logging.info("- INFO, uploading update package to iDRAC %s to create update job" % idrac["iDRAC IP"])
+    url = "https://%s/redfish/v1/UpdateService/MultipartUpload" % idrac["iDRAC IP"]
     payload = {"Targets": [], "@Redfish.OperationApplyTime": "Immediate", "Oem": {}}
-    files = {
-         'UpdateParameters': (None, json.dumps(payload), 'application/json'),
-         'UpdateFile': (os.path.basename(args["location"]), open(args["location"], 'rb'), 'application/octet-stream')
-    }
-    response = requests.post(url, files=files, verify=False,auth=(idrac_username,idrac_password))
+    bandwidth_limiters = []
+    if args["host_bandwidth"]:
+        bandwidth_limiters.append(BandwidthLimiter(args["host_bandwidth"]))
+    if total_bandwidth_limiter:
+        bandwidth_limiters.append(total_bandwidth_limiter)
+    upload_stream = MultipartUploadStream(payload, os.path.basename(args["location"]), image_view, bandwidth_limiters)
+    try:
+        response = idrac["session"].post(url, data=upload_stream, headers={'Content-Type': upload_stream.content_type}, verify=verify_cert)
+    except requests.RequestException as error_message:
+        idrac["Job Status"] = "Failed"
+        idrac["Message"] = "POST command failed to upload update package, error: %s" % error_message
+        logging.error("- FAIL, POST command failed to upload update package for iDRAC %s, error: %s" % (idrac["iDRAC IP"], error_message))
+        return
     if response.status_code != 202:
-        data = response.json()
-        logging.error("- FAIL, status code %s returned, detailed error: %s" % (response.status_code,data))
+        idrac["Job Status"] = "Failed"
+        idrac["Message"] = "status code %s returned, detailed error: %s" % (response.status_code, response.text)
+        logging.error("- FAIL, status code %s returned for iDRAC %s, detailed error: %s" % (response.status_code, idrac["iDRAC IP"], response.text))
         return
     try:
-        job_id = response.headers['Location'].split("/")[-1]
+        idrac["Job ID"] = response.headers['Location'].split("/")[-1]
     except:
-        logging.error("- FAIL, unable to locate job ID in header for iDRAC %s" % idrac_ip)
+        idrac["Job Status"] = "Failed"
+        idrac["Message"] = "unable to locate job ID in header"
+        logging.error("- FAIL, unable to locate job ID in header for iDRAC %s" % idrac["iDRAC IP"])
         return
-    logging.info("- PASS, update job ID %s successfully created for iDRAC %s" % (job_id, idrac_ip))
-    idrac_details_dict["idrac%s" % str(idrac_count)].append(job_id)
-
-def loop_check_final_job_status(idrac_ip, idrac_username, idrac_password, job_id):
-    retry_count = 1
-    while True:
-        if retry_count == 20:
-            logging.warning("- WARNING, GET command retry count of 20 has been reached, script will exit")
-            sys.exit(0)
-        check_idrac_connection(idrac_ip)
-        try:
-            response = requests.get('https://%s/redfish/v1/Managers/iDRAC.Embedded.1/Oem/Dell/Jobs/%s' % (idrac_ip, job_id), verify=False, auth=(idrac_username, idrac_password))
-        except requests.ConnectionError as error_message:
-            logging.info("- INFO, GET request failed due to connection error, retry")
-            time.sleep(10)
-            retry_count += 1
-            continue 
-        current_time = str((datetime.now()-start_time))[0:7]
-        if response.status_code != 200:
-            logging.error("\n- FAIL, GET command failed to check job status, return code %s" % response.status_code)
-            logging.error("Extended Info Message: {0}".format(response.json()))
-            return
-        data = response.json()
-        if str(current_time)[0:7] >= "0:50:00":
-            logging.error("\n- FAIL: Timeout of 50 minutes has been hit, script stopped\n")
-            return
-        elif "fail" in data['Message'].lower() or "fail" in data['JobState'].lower():
-            logging.error("\n- FAIL: job ID %s failed" % job_id)
-            return
-        elif "completed successfully" in data['Message']:
-            logging.info("- PASS, job ID %s successfully marked completed for iDRAC %s" % (job_id, idrac_ip))
-            return
-        else:
-            logging.info("- INFO, %s not marked completed, current status: \"%s\"" % (job_id, data['Message'].rstrip(".")))
-            time.sleep(5)
-
-def check_idrac_connection(idrac_ip):
-    run_network_connection_function = ""
-    if platform.system().lower() == "windows":
-        ping_command = "ping -n 3 %s" % idrac_ip
-    elif platform.system().lower() == "linux":
-        ping_command = "ping -c 3 %s" % idrac_ip
-    else:
-        logging.error("- FAIL, unable to determine OS type, check iDRAC connection function will not execute")
-        run_network_connection_function = "fail"
-    execute_command = subprocess.call(ping_command, stdout=subprocess.PIPE, shell=True)
-    if execute_command != 0:
-        ping_status = "lost"
+    idrac["Start Time"] = datetime.now()
+    logging.info("- PASS, update job ID %s successfully created for iDRAC %s" % (idrac["Job ID"], idrac["iDRAC IP"]))
+    job_queue.put(idrac)
+
+def check_job_status(idrac):
+    if str(datetime.now() - idrac["Start Time"])[0:7] >= "0:50:00":
+        idrac["Job Status"] = "Timeout"
+        idrac["Message"] = "Timeout of 50 minutes has been hit"
+        logging.error("- FAIL, timeout of 50 minutes has been hit for job ID %s, iDRAC %s" % (idrac["Job ID"], idrac["iDRAC IP"]))
+        return
+    try:
+        response = idrac["session"].get('https://%s/redfish/v1/Managers/iDRAC.Embedded.1/Oem/Dell/Jobs/%s' % (idrac["iDRAC IP"], idrac["Job ID"]), verify=verify_cert, timeout=60)
+        if response.status_code == 200:
+            data = response.json()
+            job_message = str(data['Message'])
+            job_state = str(data['JobState'])
+    except (requests.RequestException, ValueError, KeyError, TypeError) as error_message:
+        # Connection error, timeout or incomplete job payload while iDRAC is busy applying the update, job is checked again next loop
+        idrac["Retry Count"] = idrac.get("Retry Count", 0) + 1
+        idrac["Message"] = "GET command failed to check job status, error: %s" % error_message
+        logging.info("- INFO, GET request failed for iDRAC %s, error: %s, retry" % (idrac["iDRAC IP"], error_message))
+        if idrac["Retry Count"] == 20:
+            idrac["Job Status"] = "Failed"
+            idrac["Message"] = "GET command retry count of 20 has been reached, last error: %s" % error_message
+            logging.warning("- WARNING, GET command retry count of 20 has been reached for iDRAC %s" % idrac["iDRAC IP"])
+        return
+    if response.status_code != 200:
+        idrac["Job Status"] = "Failed"
+        idrac["Message"] = "GET command failed to check job status, return code %s" % response.status_code
+        logging.error("- FAIL, GET command failed to check job status for iDRAC %s, return code %s" % (idrac["iDRAC IP"], response.status_code))
+        logging.error("Extended Info Message: {0}".format(response.text))
+        return
+    idrac["Retry Count"] = 0
+    if "fail" in job_message.lower() or "fail" in job_state.lower():
+        idrac["Job Status"] = "Failed"
+        idrac["Message"] = job_message
+        logging.error("- FAIL: job ID %s failed for iDRAC %s, failed message is: %s" % (idrac["Job ID"], idrac["iDRAC IP"], job_message))
+    elif "completed successfully" in job_message:
+        idrac["Job Status"] = "Completed"
+        idrac["Message"] = job_message
+        logging.info("- PASS, job ID %s successfully marked completed for iDRAC %s" % (idrac["Job ID"], idrac["iDRAC IP"]))
     else:
-        ping_status = "good"
-        pass
-    if ping_status == "lost":
-            logging.info("- INFO, iDRAC network connection lost due to slow network response, waiting 30 seconds to access iDRAC again")
-            time.sleep(30)
+        logging.info("- INFO, job ID %s not marked completed for iDRAC %s, current status: \"%s\"" % (idrac["Job ID"], idrac["iDRAC IP"], job_message.rstrip(".")))
+
+def watch_job_status(job_queue, uploads_complete):
+    # Runs in a background thread, jobs are added from the job queue as soon as the update job is created and all running jobs are polled in one loop
+    running_jobs = []
+    with concurrent.futures.ThreadPoolExecutor(max_workers=args["max_workers"]) as executor:
+        while True:
             while True:
-                if run_network_connection_function == "fail":
+                try:
+                    running_jobs.append(job_queue.get_nowait())
+                except queue.Empty:
                     break
-                execute_command=subprocess.call(ping_command, stdout=subprocess.PIPE)
-                if execute_command != 0:
-                    ping_status = "lost"
-                else:
-                    ping_status = "good"
-                if ping_status == "lost":
-                    logging.info("- INFO, unable to ping iDRAC IP, script will wait 30 seconds and try again")
-                    time.sleep(30)
-                    continue
-                else:
+            if running_jobs == []:
+                if uploads_complete.is_set() and job_queue.empty():
                     break
-            while True:
+                time.sleep(1)
+                continue
+            futures = {executor.submit(check_job_status, i): i for i in running_jobs}
+            for future in concurrent.futures.as_completed(futures):
+                # Any other failure only stops checking the job for this iDRAC, the watcher keeps running for all other iDRACs
                 try:
-                    response = requests.get('https://%s/redfish/v1/JobService/Jobs/%s' % (idrac_ip, job_id), verify=False, auth=(idrac_username, idrac_password))
-                except requests.ConnectionError as error_message:
-                    logging.info("- INFO, GET request failed due to connection error, retry")
-                    time.sleep(10)
-                    continue
-                break
+                    future.result()
+                except Exception as error_message:
+                    futures[future]["Job Status"] = "Failed"
+                    futures[future]["Message"] = "unable to check job status, error: %s" % error_message
+                    logging.error("- FAIL, unable to check job status for iDRAC %s, error: %s" % (futures[future]["iDRAC IP"], error_message))
+            running_jobs = [i for i in running_jobs if not i["Job Status"]]
+            if [i for i in running_jobs if i.get("Retry Count")]:
+                time.sleep(30)
+            elif running_jobs:
+                time.sleep(5)
+
+def update_idracs(idracs):
+    # Image is memory mapped once and shared read only by all upload threads
+    with open(args["location"], "rb") as image_file:
+        image_mmap = mmap.mmap(image_file.fileno(), 0, access=mmap.ACCESS_READ)
+    image_view = memoryview(image_mmap)
+    total_bandwidth_limiter = None
+    if args["total_bandwidth"]:
+        total_bandwidth_limiter = BandwidthLimiter(args["total_bandwidth"])
+    job_queue = queue.Queue()
+    uploads_complete = threading.Event()
+    job_watcher = threading.Thread(target=watch_job_status, args=(job_queue, uploads_complete))
+    job_watcher.start()
+    start_time = datetime.now()
+    logging.info("- INFO, uploading update package to %s iDRAC(s), max %s iDRAC(s) at the same time" % (len(idracs), args["max_workers"]))
+    try:
+        with concurrent.futures.ThreadPoolExecutor(max_workers=args["max_workers"]) as executor:
+            list(executor.map(lambda x: download_image_create_update_job(x, image_view, total_bandwidth_limiter, job_queue), idracs))
+    finally:
+        uploads_complete.set()
+    logging.info("- INFO, upload complete for all iDRACs in %s, script will now wait for all update jobs to be marked completed" % str(datetime.now() - start_time)[0:7])
+    job_watcher.join()
+    # If an upload failed, the traceback can still reference a slice of the image, mmap is then closed once garbage collected
+    try:
+        image_view.release()
+        image_mmap.close()
+    except BufferError:
+        pass
+
+def print_final_job_results(idracs):
+    logging.info("\n- Final job status results for all iDRACs -\n")
+    for i in idracs:
+        logging.info("iDRAC %s, job ID: %s, job status: %s, message: %s" % (i["iDRAC IP"], i["Job ID"], i["Job Status"], i["Message"]))
 
 if __name__ == "__main__":
+    verify_cert = False
     if args["script_examples"]:
         script_examples()
     elif args["location"] and args["csv_filename"]:
-        idrac_details_dict = {}
-        file_path = args["csv_filename"]
-        count = 1
-        # Get contents from CSV file 
-        with open(file_path, 'r', newline='') as csv_file:
-            csv_reader = csv.reader(csv_file)
-            for row in csv_reader:
-                if "iDRAC IP" in row[0]:
-                    continue
-                else:
-                    idrac_dict_name = "idrac%s" % count
-                    idrac_details_dict[idrac_dict_name]= row
-                    count += 1
-        idrac_count = 1
-        for i in idrac_details_dict.items():
-            download_image_create_update_job(i[1][0], i[1][1], i[1][2], idrac_count)
-            idrac_count += 1
-        logging.info("- INFO, script will now loop polling job ID created for each iDRAC")
-        for i in idrac_details_dict.items():
-            loop_check_final_job_status(i[1][0], i[1][1], i[1][2], i[1][3])
+        if not os.path.isfile(args["location"]) or os.path.getsize(args["location"]) == 0:
+            logging.error("\n- FAIL, unable to locate firmware image \"%s\" or file is empty" % args["location"])
+            sys.exit(0)
+        idracs = get_csv_idracs(args["csv_filename"])
+        update_idracs(idracs)
+        print_final_job_results(idracs)
     else:
         logging.error("\n- FAIL, invalid argument values or not all required parameters passed in. See help text or argument --script-examples for more details.")
@@ -3,7 +3,7 @@
 # DeviceFirmwareMultipartUploadREDFISH.py. Python script using Redfish API to update a device firmware with DMTF MultipartUpload. Supported file image types are Windows DUPs, d7/d9 image or pm files.
 #
 # _author_ = Texas Roemer <Texas_Roemer@Dell.com>
-# _version_ = 10.0
+# _version_ = 12.0
 #
 # Copyright (c) 2020, Dell, Inc.
 #
@@ -17,10 +17,12 @@
 
 import argparse
 import getpass
+import io
 import json
 import logging
 import os
 import platform
+import random
 import re
 import requests
 import subprocess
@@ -110,6 +112,54 @@ def get_FW_inventory():
         pprint(i)
         print("\n")
 
+class MultipartUploadStream(object):
+    # Streams the multipart/form-data body for MultipartUpload, the firmware image is read from disk in chunks while requests sends the body so memory use stays flat regardless of image size.
+    # requests uses len() to set Content-Length header and calls read() for each block to send.
+    def __init__(self, payload, image_path, chunk_size=1024*1024, progress_callback=None):
+        self.boundary = os.urandom(16).hex()
+        self.content_type = "multipart/form-data; boundary=%s" % self.boundary
+        self.chunk_size = chunk_size
+        self.progress_callback = progress_callback
+        body_start = ('--%s\r\nContent-Disposition: form-data; name="UpdateParameters"\r\nContent-Type: application/json\r\n\r\n%s\r\n'
+                      '--%s\r\nContent-Disposition: form-data; name="UpdateFile"; filename="%s"\r\nContent-Type: application/octet-stream\r\n\r\n'
+                      % (self.boundary, json.dumps(payload), self.boundary, os.path.basename(image_path))).encode()
+        body_end = ("\r\n--%s--\r\n" % self.boundary).encode()
+        self.image_size = os.path.getsize(image_path)
+        self.total_size = len(body_start) + self.image_size + len(body_end)
+        self.parts = [io.BytesIO(body_start), open(image_path, "rb"), io.BytesIO(body_end)]
+        self.bytes_read = 0
+        self.percent_complete = -1
+
+    def __len__(self):
+        return self.total_size
+
+    def read(self, size=-1):
+        if size is None or size < 0 or size > self.chunk_size:
+            size = self.chunk_size
+        chunk = b""
+        while len(chunk) < size and self.parts:
+            data = self.parts[0].read(size - len(chunk))
+            if not data:
+                self.parts.pop(0).close()
+                continue
+            chunk += data
+        self.bytes_read += len(chunk)
+        percent_complete = int(self.bytes_read * 100 / self.total_size)
+        if self.progress_callback and percent_complete != self.percent_complete:
+            self.percent_complete = percent_complete
+            self.progress_callback(self.bytes_read, self.total_size)
+        return chunk
+
+    def close(self):
+        for i in self.parts:
+            i.close()
+        self.parts = []
+
+def upload_progress(bytes_read, total_size):
+    percent_complete = int(bytes_read * 100 / total_size)
+    if percent_complete and percent_complete % 10 == 0:
+        logging.info("- INFO, uploaded %s of %s MB (%s%%)" % (round(bytes_read / 1048576.0, 1), round(total_size / 1048576.0, 1), percent_complete))
+
 def download_image_create_update_job():
     global job_id
     global start_time
@@ -120,17 +170,16 @@ def download_image_create_update_job():
         payload = {"Targets": [], "@Redfish.OperationApplyTime": "Immediate", "Oem": {}}
     else:
         payload = {"Targets": [], "@Redfish.OperationApplyTime": "OnReset", "Oem": {}}
-    files = {
-         'UpdateParameters': (None, json.dumps(payload), 'application/json'),
-         'UpdateFile': (os.path.basename(args["location"]), open(args["location"], 'rb'), 'application/octet-stream')
-    }
-
-    if args["x"]:
-        headers = {'X-Auth-Token': args["x"]}
-        response = requests.post(url, files=files, headers=headers, verify=verify_cert)
-    else:
-        response = requests.post(url, files=files, verify=verify_cert,auth=(idrac_username,idrac_password))
-    
+    upload_stream = MultipartUploadStream(payload, args["location"], progress_callback=upload_progress)
+    headers = {'Content-Type': upload_stream.content_type}
+    try:
+        if args["x"]:
+            headers['X-Auth-Token'] = args["x"]
+            response = requests.post(url, data=upload_stream, headers=headers, verify=verify_cert)
+        else:
+            response = requests.post(url, data=upload_stream, headers=headers, verify=verify_cert,auth=(idrac_username,idrac_password))
+    finally:
+        upload_stream.close()
     if response.status_code != 202:
         data = response.json()
         logging.error("- FAIL, status code %s returned, detailed error: %s" % (response.status_code,data))
@@ -179,33 +228,35 @@ def check_job_status():
                 response = requests.get('https://%s/redfish/v1/TaskService/Tasks/%s' % (idrac_ip, job_id), verify=verify_cert, auth=(idrac_username, idrac_password))
         except requests.exceptions.ConnectTimeout as json_error:
             print("ConnectTimeout:", json_error)
-            time.sleep(180)
+            time.sleep(get_retry_interval(retry_count))
             retry_count += 1
             continue
         except json.decoder.JSONDecodeError as json_error:
             print("JSONDecodeError:", json_error)
-            time.sleep(180)
+            time.sleep(get_retry_interval(retry_count))
             retry_count += 1
             continue
         except requests.exceptions.ConnectionError as error_message:
-            logging.info("- INFO, GET request failed due to connection error, retry in 30 seconds")
-            time.sleep(30)
+            retry_interval = get_retry_interval(retry_count)
+            logging.info("- INFO, GET request failed due to connection error, retry in %s seconds" % int(retry_interval))
+            time.sleep(retry_interval)
             retry_count += 1
             continue
         except requests.exceptions.RequestException as req_error:
             print("RequestException:", req_error)
-            time.sleep(180)
+            time.sleep(get_retry_interval(retry_count))
             retry_count += 1
             continue
         try:
             data = response.json()
         except:
-            logging.warning("- WARNING, unable to get JSON data response from GET request, script will retry in 1 minute")
-            time.sleep(60)
+            retry_interval = get_retry_interval(retry_count)
+            logging.warning("- WARNING, unable to get JSON data response from GET request, script will retry in %s seconds" % int(retry_interval))
+            time.sleep(retry_interval)
             retry_count +=1 
             continue
         if response.status_code == 200 or response.status_code == 202:
-            time.sleep(1)
+            logging.debug("- PASS, GET request passed to check job status")
         elif response.status_code == 404:
             if idrac_update == "yes":
                 if args["x"]:
@@ -226,22 +277,25 @@ def check_job_status():
                     logging.info("\n- JOB ID %s completed in %s" % (job_id, current_time))
                     sys.exit(0)
             else:
-                time.sleep(10)
+                time.sleep(get_retry_interval(retry_count))
                 retry_count +=1
                 continue
         elif response.status_code == 500:
-            logging.warning("- WARNING, status code 500 returned for internal server error, GET request will retry in 1 minute")
-            time.sleep(60)
+            retry_interval = get_retry_interval(retry_count, response)
+            logging.warning("- WARNING, status code 500 returned for internal server error, GET request will retry in %s seconds" % int(retry_interval))
+            time.sleep(retry_interval)
             retry_count +=1 
             continue
         elif response.status_code == 401 and idrac_update == "yes":
-            logging.warning("- WARNING, status code 401 detected for iDRAC firmware update, GET will retry in 1 minute")
-            time.sleep(60)
+            retry_interval = get_retry_interval(retry_count, response)
+            logging.warning("- WARNING, status code 401 detected for iDRAC firmware update, GET will retry in %s seconds" % int(retry_interval))
+            time.sleep(retry_interval)
             retry_count +=1 
             continue
         elif response.status_code == 503:
-            logging.warning("- WARNING, status code 503 returned for service unavailable, GET request will retry in 1 minute")
-            time.sleep(60)
+            retry_interval = get_retry_interval(retry_count, response)
+            logging.warning("- WARNING, status code 503 returned for service unavailable, GET request will retry in %s seconds" % int(retry_interval))
+            time.sleep(retry_interval)
             retry_count +=1 
             continue
         elif response.status_code == 401:
@@ -253,8 +307,9 @@ def check_job_status():
         try:
             message_string = data["Messages"]
         except:
-            logging.warning("- WARNING, unable to get Messages property value from JSON response, script will retry in 1 minute")
-            time.sleep(60)
+            retry_interval = get_retry_interval(retry_count)
+            logging.warning("- WARNING, unable to get Messages property value from JSON response, script will retry in %s seconds" % int(retry_interval))
+            time.sleep(retry_interval)
             retry_count += 1
             if idrac_update == "yes":
                 if args["x"]:
@@ -275,7 +330,7 @@ def check_job_status():
                     logging.info("\n- JOB ID %s completed in %s" % (job_id, current_time))
                     sys.exit(0)
                 else:
-                    time.sleep(10)
+                    time.sleep(get_retry_interval(retry_count))
                     retry_count +=1
                     continue
         if "fail" in data['Oem']['Dell']['Message'].lower() or "error" in data['Oem']['Dell']['Message'].lower() or "unable" in data['Oem']['Dell']['Message'].lower():
@@ -325,12 +380,13 @@ def check_job_status():
             break
         else:
             logging.info("- INFO: %s, execution time: %s" % (message_string[0]["Message"].rstrip("."), current_time))
-            time.sleep(1)
+            wait_for_job_event()
             continue
 
 
 def loop_check_final_job_status():
     retry_count = 1
+    connection_lost_count = 1
     while True:
         if retry_count == 20:
             logging.warning("- WARNING, GET command retry count of 20 has been reached, script will exit")
@@ -342,28 +398,30 @@ def loop_check_final_job_status():
             else:
                 response = requests.get('https://%s/redfish/v1/Managers/iDRAC.Embedded.1/Oem/Dell/Jobs/%s' % (idrac_ip, job_id), verify=verify_cert,auth=(idrac_username, idrac_password))
             if response.status_code == 500:
-                logging.info("- WARNING, iDRAC connection lost, script will sleep 3 minutes and then retry GET request")
-                time.sleep(180)
+                retry_interval = get_retry_interval(connection_lost_count, response)
+                connection_lost_count += 1
+                logging.info("- WARNING, iDRAC connection lost, script will sleep %s seconds and then retry GET request" % int(retry_interval))
+                time.sleep(retry_interval)
                 check_idrac_connection()
                 continue
         except requests.exceptions.ConnectTimeout as json_error:
             print("ConnectTimeout:", json_error)
-            time.sleep(180)
+            time.sleep(get_retry_interval(retry_count))
             retry_count += 1
             continue
         except json.decoder.JSONDecodeError as json_error:
             print("JSONDecodeError:", json_error)
-            time.sleep(180)
+            time.sleep(get_retry_interval(retry_count))
             retry_count += 1
             continue
         except requests.exceptions.ConnectionError as error_message:
             logging.info("- INFO, GET request failed due to connection error, retry")
-            time.sleep(10)
+            time.sleep(get_retry_interval(retry_count))
             retry_count += 1
             continue
         except requests.exceptions.RequestException as req_error:
             print("RequestException:", req_error)
-            time.sleep(180)
+            time.sleep(get_retry_interval(retry_count))
             retry_count += 1
             continue
         current_time = str((datetime.now()-start_time))[0:7]
@@ -389,7 +447,7 @@ def loop_check_final_job_status():
             sys.exit(0)
         else:
             logging.info("- INFO, JobStatus not completed, current status: \"%s\", execution time: \"%s\"" % (data['Message'].rstrip("."), current_time))
-            time.sleep(1)
+            wait_for_job_event()
 
 def oem_ac_power_cycle():
     if args["x"]:
@@ -571,6 +629,51 @@ def check_idrac_connection():
                     continue
                 break
 
+def get_retry_interval(retry_count, response=None, max_interval=180):
+    # Return seconds to wait before retrying a failed job status GET request, exponential backoff with jitter starting at 10 seconds up to max_interval. Retry-After header returned by iDRAC is honored.
+    if response is not None:
+        retry_after = response.headers.get("Retry-After", "")
+        if retry_after.isdigit():
+            return int(retry_after)
+    return min(10 * 2 ** (retry_count - 1), max_interval) * random.uniform(0.8, 1.2)
+
+def wait_for_job_event(timeout=60):
+    # Wait on iDRAC server sent event (SSE) stream for an event about the job ID instead of polling the job every second. Stream is kept open between calls so events are not missed. If iDRAC does not support SSE, falls back to 1 second poll interval.
+    global sse_response
+    global sse_lines
+    if sse_response == "not supported":
+        time.sleep(1)
+        return
+    if sse_response is None:
+        try:
+            if args["x"]:
+                response = requests.get('https://%s/redfish/v1/SSE' % idrac_ip, verify=verify_cert, headers={'X-Auth-Token': args["x"], 'Accept': 'text/event-stream'}, stream=True, timeout=(30, timeout))
+            else:
+                response = requests.get('https://%s/redfish/v1/SSE' % idrac_ip, verify=verify_cert, auth=(idrac_username, idrac_password), headers={'Accept': 'text/event-stream'}, stream=True, timeout=(30, timeout))
+        except requests.exceptions.RequestException:
+            time.sleep(1)
+            return
+        if response.status_code != 200:
+            logging.debug("- INFO, iDRAC SSE not supported, status code %s returned, job status will be polled" % response.status_code)
+            response.close()
+            sse_response = "not supported"
+            time.sleep(1)
+            return
+        sse_response = response
+        sse_lines = sse_response.iter_lines(chunk_size=1, decode_unicode=True)
+    wait_start_time = time.time()
+    try:
+        for line in sse_lines:
+            if line and line.startswith("data:") and job_id in line:
+                return
+            if time.time() - wait_start_time >= timeout:
+                return
+    except requests.exceptions.RequestException:
+        # No event received within timeout or connection lost due to iDRAC reboot, stream will be opened again on next call
+        pass
+    sse_response.close()
+    sse_response = None
+
 
 if __name__ == "__main__":
     if args["script_examples"]:
@@ -593,6 +696,7 @@ if __name__ == "__main__":
             verify_cert = False
         check_supported_idrac_version()
         get_server_generation()
+        sse_response = None
     else:
         logging.error("\n- FAIL, invalid argument values or not all required parameters passed in. See help text or argument --script-examples for more details.")
         sys.exit(0)
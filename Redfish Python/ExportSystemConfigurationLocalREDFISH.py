@@ -3,7 +3,7 @@
 # ExportServerConfigurationLocalREDFISH. Python script using Redfish API with OEM extension to export the system configuration locally. By default, POST command print all attributes to the screen. This script will also capture these attributes into a file.
 #
 # _author_ = Texas Roemer <Texas_Roemer@Dell.com>
-# _version_ = 13.0
+# _version_ = 14.0
 #
 # Copyright (c) 2017, Dell, Inc.
 #
@@ -21,6 +21,7 @@ import json
 import logging
 import os
 import platform
+import random
 import re
 import requests
 import subprocess
@@ -49,6 +50,7 @@ parser.add_argument('--directory-path', help='Pass in directory path where you w
 
 args = vars(parser.parse_args())
 logging.basicConfig(format='%(message)s', stream=sys.stdout, level=logging.INFO)
+poll_state = {"interval": None, "percent_complete": None}
 
 def script_examples():
     print("""\n- ExportSystemConfigurationLocalREDFISH.py -ip 192.168.0.120 -u root -p calvin --target ALL, this example will export all components locally in XML format.
@@ -108,6 +110,22 @@ def get_target_values():
         for i in data["Actions"]["Oem"]["#OemManager.ExportSystemConfiguration"]["ShareParameters"]["Target@Redfish.AllowableValues"]:
             print(i)
 
+def get_poll_interval(response, data, min_interval=1, max_interval=10):
+    # Return seconds to wait before next job status GET request. Interval resets to min_interval when job PercentComplete changes, otherwise backs off exponentially with jitter up to max_interval. Retry-After header returned by iDRAC is honored.
+    retry_after = response.headers.get("Retry-After", "")
+    if retry_after.isdigit():
+        return int(retry_after)
+    try:
+        percent_complete = data['Oem']['Dell']['PercentComplete']
+    except:
+        percent_complete = None
+    if poll_state["interval"] is None or percent_complete != poll_state["percent_complete"]:
+        poll_state["interval"] = min_interval
+    else:
+        poll_state["interval"] = min(poll_state["interval"] * 2, max_interval)
+    poll_state["percent_complete"] = percent_complete
+    return poll_state["interval"] * random.uniform(0.8, 1.2)
+
 def export_scp_file_locally():
     if idrac_version >= 10:
         url = 'https://%s/redfish/v1/Managers/iDRAC.Embedded.1/Actions/Oem/OemManager.ExportSystemConfiguration' % idrac_ip
@@ -245,7 +263,7 @@ def export_scp_file_locally():
             sys.exit(0)
         current_time = (datetime.now()-start_time)
         if response.status_code == 202 or response.status_code == 200:
-            time.sleep(1)
+            logging.debug("- PASS, GET request passed to check job status")
         else:
             logging.error("- ERROR:, GET job ID details failed, error code: %s" % response.status_code)
             logging.error(data)
@@ -254,7 +272,7 @@ def export_scp_file_locally():
             logging.error("\n- FAIL, Timeout of 10 minutes has been reached before marking the job completed.")
             sys.exit(0)
         elif data['Oem']['Dell']['Message'] == None:
-            time.sleep(5)
+            time.sleep(get_poll_interval(response, data))
             continue
         elif "unable" in data['Oem']['Dell']['Message'].lower():
             logging.error("- FAIL, job completed but issue detected: error: %s" % data['Oem']['Dell']['Message'])
@@ -262,10 +280,9 @@ def export_scp_file_locally():
         else:
             try:
                 logging.info("- INFO, \"%s\", percent complete: %s" % (data['Oem']['Dell']['Message'],data['Oem']['Dell']['PercentComplete']))
-                time.sleep(1)
             except:
                 logging.info("- INFO, unable to print job status message, trying again")
-                time.sleep(1)
+            time.sleep(get_poll_interval(response, data))
             continue
 
 if __name__ == "__main__":
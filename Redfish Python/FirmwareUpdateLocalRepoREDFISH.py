@@ -1,7 +1,7 @@
 #!/usr/bin/python3
 #
 # _author_ = Texas Roemer <administrator@Dell.com>
-# _version_ = 12.0
+# _version_ = 15.1
 #
 # Copyright (c) 2023, Dell, Inc.
 #
@@ -14,8 +14,10 @@
 #
 
 import argparse
+import concurrent.futures
 import getpass
 import glob
+import io
 import json
 import logging
 import os
@@ -47,6 +49,9 @@ parser.add_argument('--script-examples', action="store_true", help='Prints scrip
 parser.add_argument('--get', help='Get current supported devices for firmware updates and their current firmware versions', action="store_true", required=False)
 parser.add_argument('--location', help='Pass in the full directory path location of the directory which contains all Dell update packages (DUP). Note: only Windows DUPs are supported by iDRAC interfaces to perform updates. Note: make sure only DUPs are in this directory and no other files, directories. Note: If planning to update iDRAC, make sure the DUP name package contains the word idrac (default DUP name does contain wording iDRAC, recommended not to change it)', required=False)
 parser.add_argument('--block-same-version', help='Pass in this argument to block same version update. If the update package matches version device firmwae version, update will not occur.', action="store_true", dest="block_same_version", required=False)
+parser.add_argument('--plan', help='Pass in this argument to only apply update packages which are newer than the installed device firmware. Each update package supported device IDs and version are compared against current firmware inventory before uploading.', action="store_true", required=False)
+parser.add_argument('--dry-run', help='Pass in this argument to print the update plan (which update packages will be applied or skipped) without performing any updates', action="store_true", dest="dry_run", required=False)
+parser.add_argument('--dup-cache-file', help='Pass in file name used to cache update package versions for arguments --block-same-version, --plan and --dry-run, default value is dup_version_cache.json. Update packages are only read again if the file size or modified time changes.', dest="dup_cache_file", default="dup_version_cache.json", required=False)
 parser.add_argument('--target', help='Pass in the absolute URI device path of target device to update. Note this argument is only required when updating a device which supports PLDM firmware update and you are using the image file, not the Windows DUP to perform the update. Note if passing in multiple URI targets use a comma separator. Argument example value: /redfish/v1/Chassis/System.Embedded.1/NetworkAdapters/NIC.Slot.1/Ports/NIC.Slot.1-1', required=False)
 parser.add_argument('--non-dup-file-name', help='Pass in non Windows DUP file name for the target device. Note you must also use --target argument to pass in the device URI which supports this non exe file. Note if passing in multiple non Windows DUP files use a comma separator but make sure this count aligns with --target count', dest="non_dup_file_name", required=False)
 
@@ -54,7 +59,10 @@ args = vars(parser.parse_args())
 logging.basicConfig(format='%(message)s', stream=sys.stdout, level=logging.INFO)
 
 def script_examples():
-    print("""\n- FirmwareUpdateLocalRepoREDFISH.py -ip 192.168.0.120 -u root -p calvin --location C:\\Users\\administrator\\Downloads\\R740xd_repo, this example will apply updates for all DUP packages detected in this directory path.""")
+    print("""\n- FirmwareUpdateLocalRepoREDFISH.py -ip 192.168.0.120 -u root -p calvin --location C:\\Users\\administrator\\Downloads\\R740xd_repo, this example will apply updates for all DUP packages detected in this directory path.
+    \n- FirmwareUpdateLocalRepoREDFISH.py -ip 192.168.0.120 -u root -p calvin --location C:\\Users\\administrator\\Downloads\\R740xd_repo --block-same-version, this example will apply updates for all DUP packages detected in this directory path, skipping packages with the same version already installed. Package versions are cached in dup_version_cache.json so next script run only reads new or changed packages.
+    \n- FirmwareUpdateLocalRepoREDFISH.py -ip 192.168.0.120 -u root -p calvin --location C:\\Users\\administrator\\Downloads\\R740xd_repo --dry-run, this example will print which update packages are newer than installed firmware and will be applied, no updates are performed.
+    \n- FirmwareUpdateLocalRepoREDFISH.py -ip 192.168.0.120 -u root -p calvin --location C:\\Users\\administrator\\Downloads\\R740xd_repo --plan, this example will only upload and apply update packages which are newer than installed firmware.""")
     sys.exit(0)
 
 # Example of local directory contents containing Dell DUPs:
@@ -95,6 +103,67 @@ def get_FW_inventory():
         pprint(i)
         print("\n")
 
+class MultipartUploadStream(object):
+    # Streams the multipart/form-data body for MultipartUpload, the firmware image is read from disk in chunks while requests sends the body so memory use stays flat regardless of image size.
+    # requests uses len() to set Content-Length header and calls read() for each block to send.
+    def __init__(self, payload, image_path, chunk_size=1024*1024, progress_callback=None):
+        self.boundary = os.urandom(16).hex()
+        self.content_type = "multipart/form-data; boundary=%s" % self.boundary
+        self.chunk_size = chunk_size
+        self.progress_callback = progress_callback
+        body_start = ('--%s\r\nContent-Disposition: form-data; name="UpdateParameters"\r\nContent-Type: application/json\r\n\r\n%s\r\n'
+                      '--%s\r\nContent-Disposition: form-data; name="UpdateFile"; filename="%s"\r\nContent-Type: application/octet-stream\r\n\r\n'
+                      % (self.boundary, json.dumps(payload), self.boundary, os.path.basename(image_path))).encode()
+        body_end = ("\r\n--%s--\r\n" % self.boundary).encode()
+        self.image_size = os.path.getsize(image_path)
+        self.total_size = len(body_start) + self.image_size + len(body_end)
+        self.parts = [io.BytesIO(body_start), open(image_path, "rb"), io.BytesIO(body_end)]
+        self.bytes_read = 0
+        self.percent_complete = -1
+
+    def __len__(self):
+        return self.total_size
+
+    def read(self, size=-1):
+        if size is None or size < 0 or size > self.chunk_size:
+            size = self.chunk_size
+        chunk = b""
+        while len(chunk) < size and self.parts:
+            data = self.parts[0].read(size - len(chunk))
+            if not data:
+                self.parts.pop(0).close()
+                continue
+            chunk += data
+        self.bytes_read += len(chunk)
+        percent_complete = int(self.bytes_read * 100 / self.total_size)
+        if self.progress_callback and percent_complete != self.percent_complete:
+            self.percent_complete = percent_complete
+            self.progress_callback(self.bytes_read, self.total_size)
+        return chunk
+
+    def close(self):
+        for i in self.parts:
+            i.close()
+        self.parts = []
+
+def upload_progress(bytes_read, total_size):
+    percent_complete = int(bytes_read * 100 / total_size)
+    if percent_complete and percent_complete % 10 == 0:
+        logging.info("- INFO, uploaded %s of %s MB (%s%%)" % (round(bytes_read / 1048576.0, 1), round(total_size / 1048576.0, 1), percent_complete))
+
+def post_multipart_upload(url, payload, firmware_image_device):
+    upload_stream = MultipartUploadStream(payload, firmware_image_device, progress_callback=upload_progress)
+    headers = {'Content-Type': upload_stream.content_type}
+    try:
+        if args["x"]:
+            headers['X-Auth-Token'] = args["x"]
+            response = requests.post(url, data=upload_stream, headers=headers, verify=verify_cert)
+        else:
+            response = requests.post(url, data=upload_stream, headers=headers, verify=verify_cert,auth=(idrac_username,idrac_password))
+    finally:
+        upload_stream.close()
+    return response
+
 def download_image_create_update_job(firmware_image_device):
     global job_id
     global idrac_dup_package
@@ -123,15 +192,7 @@ def download_image_create_update_job(firmware_image_device):
         logging.info("\n- INFO, uploading update package \"%s\" to create update job, this may take a few minutes depending on firmware image size" % firmware_image_device.split("\\")[-1])                                                                                                                                                                           
         url = "https://%s/redfish/v1/UpdateService/MultipartUpload" % idrac_ip
         payload = {"Targets": [], "@Redfish.OperationApplyTime": "OnReset", "Oem": {}}
-        files = {
-             'UpdateParameters': (None, json.dumps(payload), 'application/json'),
-             'UpdateFile': (os.path.basename(firmware_image_device), open(firmware_image_device, 'rb'), 'application/octet-stream')
-        }
-        if args["x"]:
-            headers = {'X-Auth-Token': args["x"]}
-            response = requests.post(url, files=files, headers=headers, verify=verify_cert)
-        else:
-            response = requests.post(url, files=files, verify=verify_cert,auth=(idrac_username,idrac_password))
+        response = post_multipart_upload(url, payload, firmware_image_device)
         
         if response.status_code != 202:
             data = response.json()
@@ -154,16 +215,8 @@ def download_image_create_update_job_no_DUP_image(firmware_image_device, target_
     logging.info("\n- INFO, uploading update package \"%s\" to create update job, this may take a few minutes depending on firmware image size" % firmware_image_device.split("\\")[-1])                                                                                                                                                                           
     url = "https://%s/redfish/v1/UpdateService/MultipartUpload" % idrac_ip
     payload = {"Targets": [target_uri], "@Redfish.OperationApplyTime": "OnReset", "Oem": {}}
-    files = {
-         'UpdateParameters': (None, json.dumps(payload), 'application/json'),
-         'UpdateFile': (os.path.basename(firmware_image_device), open(firmware_image_device, 'rb'), 'application/octet-stream')
-    }
     check_valid_dup = firmware_image_device.split("\\")[-1]
-    if args["x"]:
-        headers = {'X-Auth-Token': args["x"]}
-        response = requests.post(url, files=files, headers=headers, verify=verify_cert)
-    else:
-        response = requests.post(url, files=files, verify=verify_cert,auth=(idrac_username,idrac_password))
+    response = post_multipart_upload(url, payload, firmware_image_device)
     
     if response.status_code != 202:
         data = response.json()
@@ -180,110 +233,100 @@ def download_image_create_update_job_no_DUP_image(firmware_image_device, target_
         sys.exit(0)
     logging.info("- PASS, update job ID %s successfully created for firmware package \"%s\"" % (job_id, firmware_image_device.split("\\")[-1]))
 
-def check_same_version(dup_name):
-    if not dup_name.lower().endswith("exe"):
-        remove_dup_list.append(dup_name)
-        return
-    logging.info("- INFO, checking update package \"%s\" image version against current device version installed" % dup_name)
-    exe_file = args["location"] + "\\" + dup_name
-    if not os.path.exists(exe_file):
-        print(f"- FAIL, EXE file {exe_file} not found")
-        sys.exit(1) 
+def extract_package_xml_self_extractor(exe_file):
     temp_dir = tempfile.mkdtemp(prefix="exe_extract_")
     try:
-        #print(f"- INFO, extracting EXE contents to temporary directory: {temp_dir}")
         try:
-            with zipfile.ZipFile(exe_file, 'r') as zip_ref:
-                zip_ref.extractall(temp_dir)
-            #print("- PASS, successfully extracted EXE file as ZIP archive")
-        except zipfile.BadZipFile:
-            print("- WARNING, EXE file is not a standard ZIP archive")
-            print("- INFO, attempting to extract as self-extracting archive...")
-            extract_cmd = [exe_file, "/e", temp_dir, "/y"]
-            try:
-                import subprocess
-                result = subprocess.run(extract_cmd, capture_output=True, text=True, timeout=30)
-                if result.returncode != 0:
-                    print(f"- FAIL, self-extractor failed with return code: {result.returncode}")
-                    print(f"- ERROR: {result.stderr}")
-                    sys.exit(1)
-            except subprocess.TimeoutExpired:
-                print("- FAIL, extraction timed out after 30 seconds")
-                sys.exit(1)
-            except FileNotFoundError:
-                print("- FAIL, subprocess module not available or command failed")
-                sys.exit(1)
-        #print("- INFO, searching for package.xml file...")
-        package_xml_path = None
+            result = subprocess.run([exe_file, "/e", temp_dir, "/y"], capture_output=True, text=True, timeout=30)
+        except (subprocess.TimeoutExpired, OSError) as error_message:
+            raise ValueError("update package is not a standard ZIP archive and self-extractor failed, error: %s" % error_message)
+        if result.returncode != 0:
+            raise ValueError("update package is not a standard ZIP archive and self-extractor failed with return code %s, error: %s" % (result.returncode, result.stderr))
         for root, dirs, files in os.walk(temp_dir):
             for file in files:
-                if file.lower() == 'package.xml':
-                    package_xml_path = os.path.join(root, file)
-                    #print(f"- INFO, found package.xml at: {package_xml_path}")
-                    break
-            if package_xml_path:
-                break
-        if not package_xml_path:
-            print("- FAIL, package.xml file not found in extracted contents")
-            print("- INFO, extracted files (first 20):")
-            extracted_files = []
-            for root, dirs, files in os.walk(temp_dir):
-                for file in files[:20]:
-                    rel_path = os.path.relpath(os.path.join(root, file), temp_dir)
-                    extracted_files.append(rel_path)
-                if len(extracted_files) >= 20:
-                    break  
-            for file in extracted_files:
-                print(f"  - {file}")
-            sys.exit(1)
-        #print("- INFO, reading and parsing package.xml")
+                if file.lower() == "package.xml":
+                    with open(os.path.join(root, file), "rb") as package_xml_file:
+                        return package_xml_file.read()
+        raise ValueError("package.xml file not found in extracted contents")
+    finally:
+        shutil.rmtree(temp_dir, ignore_errors=True)
+
+def get_dup_package_details(exe_file):
+    # Executed in process pool worker. DUP is a ZIP archive, only package.xml member is read using the ZIP central directory, the DUP is not extracted
+    try:
+        with zipfile.ZipFile(exe_file, 'r') as zip_ref:
+            package_xml_names = [i for i in zip_ref.namelist() if i.split("/")[-1].lower() == "package.xml"]
+            if package_xml_names == []:
+                raise ValueError("package.xml file not found in update package, files (first 20): %s" % ", ".join(zip_ref.namelist()[:20]))
+            xml_content = zip_ref.read(min(package_xml_names, key=len))
+    except zipfile.BadZipFile:
+        xml_content = extract_package_xml_self_extractor(exe_file)
+    try:
+        root = ET.fromstring(xml_content)
+    except ET.ParseError as error_message:
+        raise ValueError("XML parsing failed for package.xml: %s" % error_message)
+    vendor_version = root.attrib.get('vendorVersion')
+    device_ids = []
+    for elem in root.iter():
+        tag = elem.tag.split("}")[-1].lower()
+        if not vendor_version:
+            if tag == 'vendorversion' and elem.text:
+                vendor_version = elem.text
+            elif 'vendorVersion' in elem.attrib:
+                vendor_version = elem.attrib['vendorVersion']
+        if tag == "device" and "componentID" in elem.attrib:
+            device_ids.append(elem.attrib["componentID"])
+        elif tag == "pciinfo":
+            device_ids.append(":".join(elem.attrib.get(i, "") for i in ["vendorID", "deviceID", "subVendorID", "subDeviceID"]))
+    if not vendor_version:
+        raise ValueError("vendorVersion property not found in package.xml")
+    return {"vendorVersion": vendor_version.strip(), "Device IDs": sorted(set(device_ids))}
+
+def get_dup_versions(dup_names):
+    # Package details are cached in --dup-cache-file using DUP full path, file size and modified time. Only new or changed DUPs are read, using a process pool
+    dup_cache = {}
+    if os.path.exists(args["dup_cache_file"]):
         try:
-            with open(package_xml_path, 'r', encoding='utf-8', errors='ignore') as f:
-                xml_content = f.read()
+            with open(args["dup_cache_file"], "r") as cache_file:
+                dup_cache = json.load(cache_file)
+        except ValueError:
+            logging.warning("- WARNING, unable to read DUP cache file \"%s\", cache will be recreated" % args["dup_cache_file"])
+    dup_versions = {}
+    cache_misses = {}
+    for i in dup_names:
+        exe_file = os.path.abspath(os.path.join(args["location"], i))
+        file_stat = os.stat(exe_file)
+        cache_entry = dup_cache.get(exe_file)
+        if cache_entry and cache_entry["Size"] == file_stat.st_size and cache_entry["Modified Time"] == file_stat.st_mtime_ns:
+            dup_versions[i] = cache_entry
+        else:
+            cache_misses[i] = (exe_file, file_stat)
+    if cache_misses == {}:
+        return dup_versions
+    logging.info("- INFO, reading version from %s update package(s), %s update package(s) found in cache" % (len(cache_misses), len(dup_versions)))
+    with concurrent.futures.ProcessPoolExecutor(max_workers=min(len(cache_misses), os.cpu_count() or 1)) as executor:
+        futures = {executor.submit(get_dup_package_details, i[0]): dup_name for dup_name, i in cache_misses.items()}
+        for future in concurrent.futures.as_completed(futures):
+            dup_name = futures[future]
             try:
-                root = ET.fromstring(xml_content)
-                vendor_version = None
-                if 'vendorVersion' in root.attrib:
-                    vendor_version = root.attrib['vendorVersion']
-                else:
-                    for elem in root.iter():
-                        if elem.tag.lower() == 'vendorversion':
-                            vendor_version = elem.text
-                            break
-                        if 'vendorVersion' in elem.attrib:
-                            vendor_version = elem.attrib['vendorVersion']
-                            break
-                
-                if vendor_version:
-                    return vendor_version.strip()
-                else:
-                    print("- FAIL, vendorVersion property not found in package.xml")
-                    print("- INFO, available elements and attributes:")
-                    for elem in root.iter():
-                        print(f"  Element: {elem.tag}")
-                        if elem.attrib:
-                            for attr, value in elem.attrib.items():
-                                print(f"    Attribute: {attr} = {value}")
-                        if elem.text and elem.text.strip():
-                            print(f"    Text: {elem.text.strip()}")
-                    sys.exit(1) 
-            except ET.ParseError as e:
-                print(f"- FAIL, XML parsing failed: {e}")
+                package_details = future.result()
+            except ValueError as error_message:
+                logging.error("- FAIL, unable to get version for update package \"%s\", error: %s" % (dup_name, error_message))
                 sys.exit(1)
-        except Exception as e:
-            print(f"- FAIL, error reading package.xml: {e}")
-            sys.exit(1)
-    except Exception as e:
-        print(f"- FAIL, error during extraction: {e}")
-        sys.exit(1)
-    finally:
-        try:
-            shutil.rmtree(temp_dir)
-            #print(f"- INFO, cleaned up temporary directory: {temp_dir}")
-        except Exception as e:
-            print(f"- WARNING, could not clean up temp directory: {e}")
-    
-            
+            exe_file, file_stat = cache_misses[dup_name]
+            package_details["Size"] = file_stat.st_size
+            package_details["Modified Time"] = file_stat.st_mtime_ns
+            dup_cache[exe_file] = package_details
+            dup_versions[dup_name] = package_details
+    cache_dir = os.path.dirname(os.path.abspath(args["dup_cache_file"]))
+    try:
+        with tempfile.NamedTemporaryFile("w", dir=cache_dir, delete=False) as cache_file:
+            json.dump(dup_cache, cache_file)
+        os.replace(cache_file.name, args["dup_cache_file"])
+    except OSError as error_message:
+        logging.warning("- WARNING, unable to write DUP cache file \"%s\", error: %s" % (args["dup_cache_file"], error_message))
+    return dup_versions
+
 def idrac_cpld_update(firmware_image_device):
     global update_job_id
     global cpld_run
@@ -294,10 +337,6 @@ def idrac_cpld_update(firmware_image_device):
         cpld_run == True    
     url = "https://%s/redfish/v1/UpdateService/MultipartUpload" % idrac_ip
     payload = {"Targets": [], "@Redfish.OperationApplyTime": "OnReset", "Oem": {}}
-    files = {
-         'UpdateParameters': (None, json.dumps(payload), 'application/json'),
-         'UpdateFile': (os.path.basename(firmware_image_device), open(firmware_image_device, 'rb'), 'application/octet-stream')
-    }
     check_valid_dup = firmware_image_device.split("\\")[-1]
     if check_valid_dup.lower().endswith("exe") or check_valid_dup.lower().endswith("d10") or check_valid_dup.lower().endswith("d9"):
         logging.debug("- PASS, valid image detectec to update the device")
@@ -305,11 +344,7 @@ def idrac_cpld_update(firmware_image_device):
         logging.warning("- WARNING, invalid file detected '%s', update will not run" % check_valid_dup)
         job_id_created = "no"
         return
-    if args["x"]:
-        headers = {'X-Auth-Token': args["x"]}
-        response = requests.post(url, files=files, headers=headers, verify=verify_cert)
-    else:
-        response = requests.post(url, files=files, verify=verify_cert,auth=(idrac_username,idrac_password))
+    response = post_multipart_upload(url, payload, firmware_image_device)
     if response.status_code != 202:
         logging.error("- FAIL, POST command failed status code %s returned" % response.status_code)
         try:
@@ -455,15 +490,7 @@ def chassis_update(firmware_image_device, dup_name):
         return
     url = "https://%s/redfish/v1/UpdateService/MultipartUpload" % idrac_ip
     payload = {"Targets": [], "@Redfish.OperationApplyTime": "OnReset", "Oem": {}}
-    files = {
-         'UpdateParameters': (None, json.dumps(payload), 'application/json'),
-         'UpdateFile': (os.path.basename(firmware_image_device), open(firmware_image_device, 'rb'), 'application/octet-stream')
-    }
-    if args["x"]:
-        headers = {'X-Auth-Token': args["x"]}
-        response = requests.post(url, files=files, headers=headers, verify=verify_cert)
-    else:
-        response = requests.post(url, files=files, verify=verify_cert,auth=(idrac_username,idrac_password))
+    response = post_multipart_upload(url, payload, firmware_image_device)
     if response.status_code != 202:
         data = response.json()
         logging.error("- FAIL, status code %s returned, detailed error: %s" % (response.status_code,data))
@@ -881,17 +908,126 @@ def oem_ac_power_cycle():
         logging.error(response.json())
         sys.exit(1)
 
-def get_FW_inventory_same_version_check(current_version_detected, dup_name):
-    same_version_flag = "no"
+def compare_versions(version_1, version_2):
+    # Returns -1, 0 or 1. Versions are compared by number and letter parts, example: 2.16.1 < 2.17.0 and 4301A73 < 4301A74
+    # Same code as compare_versions() in InstallFromRepositoryREDFISH.py, any change must be made in both scripts so both agree on which version is newer
+    version_1_parts = [int(i) if i.isdigit() else i.lower() for i in re.findall(r"\d+|[A-Za-z]+", version_1)]
+    version_2_parts = [int(i) if i.isdigit() else i.lower() for i in re.findall(r"\d+|[A-Za-z]+", version_2)]
+    for i, ii in zip(version_1_parts, version_2_parts):
+        if i == ii:
+            continue
+        if type(i) != type(ii):
+            i, ii = str(i), str(ii)
+        return -1 if i < ii else 1
+    # Extra trailing zero parts do not make a version newer, example: 1.0 == 1.0.0
+    if [i for i in version_1_parts[len(version_2_parts):] if i != 0]:
+        return 1
+    if [i for i in version_2_parts[len(version_1_parts):] if i != 0]:
+        return -1
+    return 0
+
+def get_firmware_inventory_member(uri):
+    if args["x"]:
+        response = requests.get('https://%s%s' % (idrac_ip, uri), verify=verify_cert, headers={'X-Auth-Token': args["x"]})
+    else:
+        response = requests.get('https://%s%s' % (idrac_ip, uri), verify=verify_cert, auth=(idrac_username, idrac_password))
+    if response.status_code != 200:
+        logging.error("\n- ERROR, GET request failed to get firmware inventory member %s, status code %s returned" % (uri, response.status_code))
+        sys.exit(0)
+    return response.json()
+
+def get_installed_firmware_inventory():
+    # Firmware inventory is collected once with $expand and used to plan updates for all update packages
     if args["x"]:
-        response = requests.get('https://%s/redfish/v1/UpdateService/FirmwareInventory' % idrac_ip, verify=verify_cert, headers={'X-Auth-Token': args["x"]})
+        response = requests.get('https://%s/redfish/v1/UpdateService/FirmwareInventory?$expand=*($levels=1)' % idrac_ip, verify=verify_cert, headers={'X-Auth-Token': args["x"]})
     else:
-        response = requests.get('https://%s/redfish/v1/UpdateService/FirmwareInventory' % idrac_ip, verify=verify_cert, auth=(idrac_username, idrac_password))
+        response = requests.get('https://%s/redfish/v1/UpdateService/FirmwareInventory?$expand=*($levels=1)' % idrac_ip, verify=verify_cert, auth=(idrac_username, idrac_password))
     data = response.json()
     if response.status_code != 200:
         logging.error("\n- ERROR, GET request failed to get firmware inventory, error: \n%s" % data)
         sys.exit(0)
+    # iDRAC versions which do not support $expand only return the member URIs, each installed member is then GET at the same time
+    if [i for i in data['Members'] if list(i.keys()) == ["@odata.id"]] != []:
+        installed_uris = [i["@odata.id"] for i in data['Members'] if i["@odata.id"].rstrip("/").split("/")[-1].startswith("Installed")]
+        logging.info("- INFO, $expand not supported, getting %s installed firmware inventory members" % len(installed_uris))
+        with concurrent.futures.ThreadPoolExecutor(max_workers=8) as executor:
+            data['Members'] = list(executor.map(get_firmware_inventory_member, installed_uris))
+    installed_devices = []
     for i in data['Members']:
+        if not i.get("Id", "").startswith("Installed"):
+            continue
+        software_inventory = i.get("Oem", {}).get("Dell", {}).get("DellSoftwareInventory", {})
+        installed_devices.append({"Name": i.get("Name", ""), "Version": i.get("Version", ""), "Component ID": str(software_inventory.get("ComponentID") or i.get("SoftwareId") or ""),
+                                  "PCI IDs": [str(software_inventory.get(ii) or "").lower() for ii in ["VendorID", "DeviceID", "SubVendorID", "SubDeviceID"]]})
+    if installed_devices == []:
+        logging.error("\n- ERROR, no installed devices detected in firmware inventory, unable to create update plan")
+        sys.exit(0)
+    return installed_devices
+
+def get_package_installed_devices(package_details, installed_devices):
+    # Package device IDs are component IDs or PCI IDs in format vendorID:deviceID:subVendorID:subDeviceID
+    matching_devices = []
+    for i in installed_devices:
+        for device_id in package_details["Device IDs"]:
+            if ":" not in device_id:
+                if i["Component ID"] not in ["", "0"] and device_id == i["Component ID"]:
+                    break
+            else:
+                package_pci_ids = device_id.lower().split(":")
+                if package_pci_ids[0:2] == i["PCI IDs"][0:2] and all(ii == iii or not ii or not iii for ii, iii in zip(package_pci_ids[2:], i["PCI IDs"][2:])):
+                    break
+        else:
+            continue
+        matching_devices.append(i)
+    return matching_devices
+
+def create_update_plan(dup_names):
+    dup_versions = get_dup_versions([i for i in dup_names if i.lower().endswith("exe")])
+    installed_devices = get_installed_firmware_inventory()
+    update_plan = []
+    for i in dup_names:
+        plan = {"Update Package": i, "Package Version": "", "Installed Devices": [], "Update": True, "Reason": ""}
+        if i not in dup_versions:
+            plan["Reason"] = "unable to read version from update package, update package will be applied"
+            update_plan.append(plan)
+            continue
+        plan["Package Version"] = dup_versions[i]["vendorVersion"]
+        matching_devices = get_package_installed_devices(dup_versions[i], installed_devices)
+        plan["Installed Devices"] = ["%s %s" % (ii["Name"], ii["Version"]) for ii in matching_devices]
+        if matching_devices == []:
+            plan["Update"] = False
+            plan["Reason"] = "no installed device detected for this update package"
+        elif [ii for ii in matching_devices if compare_versions(plan["Package Version"], ii["Version"]) > 0]:
+            plan["Reason"] = "newer version detected"
+        else:
+            plan["Update"] = False
+            plan["Reason"] = "same or newer version already installed"
+        update_plan.append(plan)
+    return update_plan
+
+def print_update_plan(update_plan):
+    logging.info("\n- Firmware update plan for iDRAC %s -\n" % idrac_ip)
+    for i in update_plan:
+        logging.info("%s \"%s\", package version: %s, %s" % ("UPDATE" if i["Update"] else "SKIP", i["Update Package"], i["Package Version"] or "unknown", i["Reason"]))
+        for ii in i["Installed Devices"]:
+            logging.info("    installed: %s" % ii)
+    logging.info("\n- INFO, %s update package(s) will be applied, %s update package(s) will be skipped" % (len([i for i in update_plan if i["Update"]]), len([i for i in update_plan if not i["Update"]])))
+
+def get_FW_inventory_same_version_check(current_version_detected, dup_name):
+    global firmware_inventory_members
+    same_version_flag = "no"
+    # Firmware inventory is only collected once and used to check all update packages
+    if firmware_inventory_members == []:
+        if args["x"]:
+            response = requests.get('https://%s/redfish/v1/UpdateService/FirmwareInventory' % idrac_ip, verify=verify_cert, headers={'X-Auth-Token': args["x"]})
+        else:
+            response = requests.get('https://%s/redfish/v1/UpdateService/FirmwareInventory' % idrac_ip, verify=verify_cert, auth=(idrac_username, idrac_password))
+        data = response.json()
+        if response.status_code != 200:
+            logging.error("\n- ERROR, GET request failed to get firmware inventory, error: \n%s" % data)
+            sys.exit(0)
+        firmware_inventory_members = data['Members']
+    for i in firmware_inventory_members:
         for ii in i.items():
             if current_version_detected in ii[1] and "Installed" in ii[1]:
                 same_version_flag = "yes"
@@ -944,6 +1080,7 @@ if __name__ == "__main__":
         cpld_run = False
         update_jobs_need_server_reboot = []
         remove_dup_list = []    
+        firmware_inventory_members = []
         from pathlib import Path
         directory_path = Path(args["location"]).resolve()
         directory_dups = os.listdir(args["location"])
@@ -977,11 +1114,21 @@ if __name__ == "__main__":
             else:
                 logging.error("\n- WARNING, either directory path empty, contains no valid update images or all detected updates are complete")
                 sys.exit(0)
-        if args["block_same_version"]:
+        if args["plan"] or args["dry_run"]:
+            update_plan = create_update_plan(directory_dups)
+            print_update_plan(update_plan)
+            if args["dry_run"]:
+                sys.exit(0)
+            remove_dup_list = [i["Update Package"] for i in update_plan if not i["Update"]]
+        elif args["block_same_version"]:
             logging.info("\n- INFO, argument --block-same-version detected to check update package version against installed version. This process may take a few minutes to complete depending on number of update packages\n")
+            dup_versions = get_dup_versions([i for i in directory_dups if i.lower().endswith("exe")])
             for ii in directory_dups:
-                DUP_version = check_same_version(ii)
-                get_FW_inventory_same_version_check(DUP_version, ii)
+                if ii not in dup_versions:
+                    remove_dup_list.append(ii)
+                    continue
+                logging.info("- INFO, checking update package \"%s\" image version against current device version installed" % ii)
+                get_FW_inventory_same_version_check(dup_versions[ii]["vendorVersion"], ii)
         if directory_dups == []:
             logging.error("\n- WARNING, either directory path is empty, no valid update packages detected or all detected updates completed")
             sys.exit(0)
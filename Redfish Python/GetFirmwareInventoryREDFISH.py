@@ -3,7 +3,7 @@
 # GetFirmwareInventoryREDFISH. Python script using Redfish API DMTF method to get current firmware version for all devices iDRAC supports for updates. 
 #
 # _author_ = Texas Roemer <Texas_Roemer@Dell.com>
-# _version_ = 8.0
+# _version_ = 9.0
 #
 # Copyright (c) 2018, Dell, Inc.
 #
@@ -17,8 +17,10 @@
 
 import argparse
 import getpass
+import hashlib
 import json
 import logging
+import os
 import re
 import requests
 import sys
@@ -36,12 +38,15 @@ parser.add_argument('-p', help='iDRAC password. If you do not pass in argument -
 parser.add_argument('-x', help='Pass in X-Auth session token for executing Redfish calls. All Redfish calls will use X-Auth token instead of username/password', required=False)
 parser.add_argument('--ssl', help='SSL cert verification for all Redfish calls, pass in value \"true\" or \"false\". By default, this argument is not required and script ignores validating SSL cert for all Redfish calls.', required=False)
 parser.add_argument('--script-examples', help='Get executing script examples', action="store_true", dest="script_examples", required=False)
+parser.add_argument('--cache-dir', help='Pass in directory to cache firmware inventory response. On next run, firmware inventory is only downloaded again if it changed on the iDRAC (validated using ETag/If-None-Match). Same cache directory can be used for multiple iDRACs and by IdracRedfishSupport module RedfishCache.', dest="cache_dir", required=False)
+parser.add_argument('--cache-max-size', help='Max size of cache directory in MB, least recently used cached responses are deleted once over this size. Default value is 100', dest="cache_max_size", type=float, default=100, required=False)
 
 args = vars(parser.parse_args())
 logging.basicConfig(format='%(message)s', stream=sys.stdout, level=logging.INFO)
 
 def script_examples():
-    print("""\n- GetFirmwareInventoryREDFISH.py -ip 192.168.0.120 -u root -p calvin, this example will return firmware inventory, current versions for all devices detected in the server.""")
+    print("""\n- GetFirmwareInventoryREDFISH.py -ip 192.168.0.120 -u root -p calvin, this example will return firmware inventory, current versions for all devices detected in the server.
+    \n- GetFirmwareInventoryREDFISH.py -ip 192.168.0.120 -u root -p calvin --cache-dir redfish_cache, this example will return firmware inventory and cache it, next run will only download firmware inventory if it changed.""")
     sys.exit(0)
 
 def check_supported_idrac_version():
@@ -57,14 +62,56 @@ def check_supported_idrac_version():
         logging.warning("\n- WARNING, iDRAC version installed does not support this feature using Redfish API")
         sys.exit(0)
     
+def evict_cache():
+    cache_files = []
+    for i in os.listdir(args["cache_dir"]):
+        if i.endswith(".json"):
+            file_stat = os.stat(os.path.join(args["cache_dir"], i))
+            cache_files.append((file_stat.st_mtime, file_stat.st_size, os.path.join(args["cache_dir"], i)))
+    cache_size = sum(i[1] for i in cache_files)
+    for i in sorted(cache_files):
+        if cache_size <= args["cache_max_size"] * 1024 * 1024:
+            break
+        os.remove(i[2])
+        cache_size -= i[1]
+
+def get_with_cache(url):
+    # GET request using on-disk cache, cached response is sent to iDRAC using If-None-Match header and used if iDRAC returns status code 304 (not modified)
+    cache_filename = os.path.join(args["cache_dir"], "%s.json" % hashlib.sha1(url.encode()).hexdigest())
+    headers = {}
+    cache_entry = None
+    if os.path.exists(cache_filename):
+        with open(cache_filename, "r") as cache_file:
+            cache_entry = json.load(cache_file)
+        headers["If-None-Match"] = cache_entry["etag"]
+    if args["x"]:
+        headers["X-Auth-Token"] = args["x"]
+        response = requests.get(url, verify=verify_cert, headers=headers)
+    else:
+        response = requests.get(url, verify=verify_cert, headers=headers, auth=(idrac_username, idrac_password))
+    if response.status_code == 304 and cache_entry:
+        logging.info("- INFO, firmware inventory not changed since last run, using cached response")
+        os.utime(cache_filename, None)
+        return 200, json.loads(cache_entry["body"])
+    if response.status_code == 200 and "ETag" in response.headers:
+        if not os.path.isdir(args["cache_dir"]):
+            os.makedirs(args["cache_dir"])
+        with open(cache_filename, "w") as cache_file:
+            json.dump({"url": url, "etag": response.headers["ETag"], "headers": dict(response.headers), "body": response.text}, cache_file)
+        evict_cache()
+    return response.status_code, response.json()
+
 def get_FW_inventory():
     logging.info("\n- INFO, getting current firmware inventory for iDRAC %s -\n" % idrac_ip)
-    if args["x"]:
+    if args["cache_dir"]:
+        status_code, data = get_with_cache('https://%s/redfish/v1/UpdateService/FirmwareInventory?$expand=*($levels=1)' % idrac_ip)
+    elif args["x"]:
         response = requests.get('https://%s/redfish/v1/UpdateService/FirmwareInventory?$expand=*($levels=1)' % idrac_ip, verify=verify_cert, headers={'X-Auth-Token': args["x"]})
+        status_code, data = response.status_code, response.json()
     else:
         response = requests.get('https://%s/redfish/v1/UpdateService/FirmwareInventory?$expand=*($levels=1)' % idrac_ip, verify=verify_cert, auth=(idrac_username, idrac_password))
-    data = response.json()
-    if response.status_code != 200:
+        status_code, data = response.status_code, response.json()
+    if status_code != 200:
         logging.error("\n- ERROR, GET request failed to get firmware inventory, error: \n%s" % data)
         sys.exit(0)
     print(json.dumps(data['Members'], indent=4))
@@ -0,0 +1,449 @@
+#!/usr/bin/python3
+#
+# GetFleetInventoryREDFISH. Python script using Redfish API DMTF to get hardware, storage, PCIe and firmware inventory for multiple iDRACs and write one Parquet or Arrow dataset per sweep.
+#
+# _author_ = Texas Roemer <Texas_Roemer@Dell.com>
+# _version_ = 3.3
+#
+# Copyright (c) 2026, Dell, Inc.
+#
+# This software is licensed to you under the GNU General Public License,
+# version 2 (GPLv2). There is NO WARRANTY for this software, express or
+# implied, including the implied warranties of MERCHANTABILITY or FITNESS
+# FOR A PARTICULAR PURPOSE. You should have received a copy of GPLv2
+# along with this software; if not, see
+# http://www.gnu.org/licenses/old-licenses/gpl-2.0.txt.
+#
+#
+# This script requires pyarrow module installed (pip3 install pyarrow).
+#
+# CSV file example:
+#
+#iDRAC IP,iDRAC Username,iDRAC Password
+#10.10.1.10,root,calvin
+#11.11.1.11,root,calvin
+#
+# Note: If iDRAC username or password is not set for an iDRAC, script will use arguments -u and -p.
+#
+# Each sweep creates one directory under --output-dir named sweep=<UTC timestamp> with 2 files:
+#
+# inventory.parquet: one row per component (System, Manager, Processor, Memory, StorageController, Drive, PowerSupply, NetworkAdapter, PCIeDevice and Firmware) for each iDRAC.
+# Columns: sweep_time, host, service_tag, system_model, component_class, fqdd, name, manufacturer, model, serial, part_number, firmware, health, state, resource_digest
+#
+# hosts.parquet: one row per iDRAC with sweep status, columns: sweep_time, host, status, error, duration_seconds, component_count, change_count, service_tag, system_model
+#
+# changes.ndjson (only created with argument --snapshot-dir): one JSON line per component added, removed or changed since the last successful sweep of the iDRAC.
+# Changes are detected using resource_digest, SHA-256 digest of the component Redfish resource (sorted keys, OData annotations and sensor readings removed).
+# Snapshot directory holds one file per iDRAC with the digest of each component, snapshot files are only updated once the sweep is complete. If getting inventory fails for an iDRAC, its snapshot is not changed.
+#
+# Sweep directory is only created once the sweep is complete. Query all sweeps using pandas, DuckDB or any other Parquet/Arrow reader, DuckDB example:
+#
+# SELECT sweep, model, firmware, count(*) FROM read_parquet('fleet_inventory/*/inventory.parquet', hive_partitioning=true) WHERE component_class = 'Drive' GROUP BY ALL
+
+import argparse
+import concurrent.futures
+import csv
+import getpass
+import hashlib
+import json
+import logging
+import os
+import re
+import requests
+import shutil
+import ssl
+import sys
+import threading
+import time
+import warnings
+import weakref
+
+from datetime import datetime, timezone
+
+warnings.filterwarnings("ignore")
+
+parser = argparse.ArgumentParser(description="Python script using Redfish API DMTF to get hardware, storage, PCIe and firmware inventory for multiple iDRACs at the same time and write one Parquet or Arrow dataset per sweep with typed columns for analytics using pandas or DuckDB. Requires pyarrow module.")
+parser.add_argument('--script-examples', action="store_true", help='Prints script examples')
+parser.add_argument('--csv-filename', help='Pass in CSV filename with iDRAC IP, username and password for each iDRAC. See script header for file example.', dest="csv_filename", required=False)
+parser.add_argument('-u', help='Default iDRAC username, used if username is not set for an iDRAC in the CSV file', required=False)
+parser.add_argument('-p', help='Default iDRAC password, used if password is not set for an iDRAC in the CSV file. If you pass in -u but not -p, script will prompt to enter user password which will not be echoed to the screen.', required=False)
+parser.add_argument('--ssl', help='SSL cert verification for all Redfish calls, pass in value \"true\" or \"false\". By default, this argument is not required and script ignores validating SSL cert for all Redfish calls.', required=False)
+parser.add_argument('--output-dir', help='Directory where the sweep dataset is created, default value is fleet_inventory', dest="output_dir", default="fleet_inventory", required=False)
+parser.add_argument('--format', help='Dataset file format, supported values: parquet and arrow. Default value is parquet.', choices=["parquet", "arrow"], default="parquet", required=False)
+parser.add_argument('--max-workers', help='Max number of iDRACs to get inventory from at the same time, default value is 32', dest="max_workers", type=int, default=32, required=False)
+parser.add_argument('--host-workers', help='Max number of Redfish GET requests sent to one iDRAC at the same time, default value is 4', dest="host_workers", type=int, default=4, required=False)
+parser.add_argument('--batch-size', help='Number of component rows written to the dataset at the same time, default value is 100000', dest="batch_size", type=int, default=100000, required=False)
+parser.add_argument('--snapshot-dir', help='Pass in snapshot directory to also create changes.ndjson file in the sweep directory with only components added, removed or changed since the last sweep for each iDRAC. Pass in the same directory for each sweep.', dest="snapshot_dir", required=False)
+parser.add_argument('--timeout', help='Timeout in seconds for each Redfish call, default value is 60', type=int, default=60, required=False)
+
+args = vars(parser.parse_args())
+logging.basicConfig(format='%(message)s', stream=sys.stdout, level=logging.INFO)
+
+# Sensor readings and timestamps which change without any inventory change, these are not part of the resource digest
+VOLATILE_PROPERTIES = ["Reading", "ReadingCelsius", "LastPowerOutputWatts", "PowerInputWatts", "PowerOutputWatts", "LineInputVoltage", "PowerConsumedWatts", "PowerMetrics",
+    "PredictedMediaLifeLeftPercent", "DateTime", "LastResetTime", "LastSystemInventoryTime", "LastUpdateTime"]
+
+def script_examples():
+    print("""\n- GetFleetInventoryREDFISH.py --csv-filename idracs.csv, this example will get inventory for all iDRACs in the CSV file, 32 iDRACs at the same time and create Parquet dataset in directory fleet_inventory.
+    \n- GetFleetInventoryREDFISH.py --csv-filename idracs.csv -u root --max-workers 200 --output-dir /data/fleet_inventory, this example will prompt to enter password for root user, used for all iDRACs which do not have username or password set in the CSV file, get inventory for 200 iDRACs at the same time.
+    \n- GetFleetInventoryREDFISH.py --csv-filename idracs.csv --format arrow, this example will create Arrow IPC dataset instead of Parquet.
+    \n- GetFleetInventoryREDFISH.py --csv-filename idracs.csv --snapshot-dir fleet_snapshots, this example will create Parquet dataset and changes.ndjson file with only components added, removed or changed since the last sweep.""")
+    sys.exit(0)
+
+def get_pyarrow():
+    try:
+        import pyarrow
+        import pyarrow.ipc
+        import pyarrow.parquet
+    except ImportError:
+        logging.error("\n- FAIL, pyarrow module is required to create the fleet inventory dataset, install using \"pip3 install pyarrow\"")
+        sys.exit(0)
+    return pyarrow
+
+def get_schemas(pa):
+    # Low cardinality columns are dictionary encoded, this keeps the dataset small and makes group by on these columns fast
+    sweep_time = pa.field("sweep_time", pa.timestamp("ms", tz="UTC"), nullable=False)
+    host = pa.field("host", pa.string(), nullable=False)
+    inventory_schema = pa.schema([sweep_time, host, ("service_tag", pa.string()), ("system_model", pa.dictionary(pa.int32(), pa.string())),
+        ("component_class", pa.dictionary(pa.int8(), pa.string())), ("fqdd", pa.string()), ("name", pa.string()), ("manufacturer", pa.dictionary(pa.int32(), pa.string())),
+        ("model", pa.dictionary(pa.int32(), pa.string())), ("serial", pa.string()), ("part_number", pa.string()), ("firmware", pa.dictionary(pa.int32(), pa.string())),
+        ("health", pa.dictionary(pa.int8(), pa.string())), ("state", pa.dictionary(pa.int8(), pa.string())), ("resource_digest", pa.string())])
+    hosts_schema = pa.schema([sweep_time, host, ("status", pa.dictionary(pa.int8(), pa.string())), ("error", pa.string()), ("duration_seconds", pa.float32()),
+        ("component_count", pa.int32()), ("change_count", pa.int32()), ("service_tag", pa.string()), ("system_model", pa.string())])
+    return inventory_schema, hosts_schema
+
+class ResumableSSLSocket(ssl.SSLSocket):
+    # TLS session is saved before the connection is closed, with TLS 1.3 the session ticket is only received after the handshake
+    def _real_close(self):
+        if getattr(self, "tls_session_key", None) is not None:
+            with tls_sessions_lock:
+                save_tls_session(self.tls_session_key, self)
+        super()._real_close()
+
+class ResumableSSLContext(ssl.SSLContext):
+    # New connections to an iDRAC resume the TLS session of the last connection to the iDRAC (abbreviated handshake) instead of a full TLS handshake
+    sslsocket_class = ResumableSSLSocket
+
+    def wrap_socket(self, sock, *args, **kwargs):
+        key = (kwargs.get("server_hostname"), sock.getpeername()[:2])
+        with tls_sessions_lock:
+            for ssl_socket in list(tls_sockets.get(key, ())):
+                save_tls_session(key, ssl_socket)
+            if key in tls_sessions and time.time() < tls_sessions[key].time + tls_sessions[key].timeout:
+                kwargs["session"] = tls_sessions[key]
+        ssl_socket = super().wrap_socket(sock, *args, **kwargs)
+        ssl_socket.tls_session_key = key
+        with tls_sessions_lock:
+            tls_sockets.setdefault(key, weakref.WeakSet()).add(ssl_socket)
+            tls_handshakes["resumed" if ssl_socket.session_reused else "full"] += 1
+        return ssl_socket
+
+def save_tls_session(key, ssl_socket):
+    try:
+        session = ssl_socket.session
+        tls_version = ssl_socket.version()
+    except (OSError, ValueError):
+        return
+    if session is not None and (session.has_ticket or tls_version != "TLSv1.3"):
+        tls_sessions[key] = session
+
+def get_tls_context():
+    context = ResumableSSLContext(ssl.PROTOCOL_TLS_CLIENT)
+    # urllib3 sets verify_mode for each connection based on verify argument and checks the hostname itself
+    context.check_hostname = False
+    if verify_cert:
+        context.load_default_certs()
+    else:
+        context.verify_mode = ssl.CERT_NONE
+    return context
+
+class ResumableHTTPAdapter(requests.adapters.HTTPAdapter):
+    # HTTPS connections to all iDRACs are opened using the shared ResumableSSLContext
+    def init_poolmanager(self, *args, **kwargs):
+        kwargs["ssl_context"] = tls_context
+        return super().init_poolmanager(*args, **kwargs)
+
+def get_csv_idracs(file_path):
+    idracs = []
+    with open(file_path, 'r', newline='') as csv_file:
+        csv_reader = csv.reader(csv_file)
+        for line_data in csv_reader:
+            line_data = [i.strip() for i in line_data]
+            if not line_data or not line_data[0] or line_data[0].startswith("#") or "idrac ip" in line_data[0].lower():
+                continue
+            line_data += [""] * (3 - len(line_data))
+            idracs.append({"iDRAC IP": line_data[0], "iDRAC Username": line_data[1] or idrac_username, "iDRAC Password": line_data[2] or idrac_password})
+    return idracs
+
+def get_uri(idrac, uri):
+    response = idrac["session"].get('https://%s%s' % (idrac["iDRAC IP"], uri), verify=verify_cert, timeout=args["timeout"])
+    if response.status_code != 200:
+        raise RuntimeError("GET command failed for URI %s, status code %s returned" % (uri, response.status_code))
+    return response.json()
+
+def get_uris(idrac, uris):
+    # GET multiple URIs from one iDRAC at the same time using --host-workers threads, responses are returned in the same order as the URIs
+    with concurrent.futures.ThreadPoolExecutor(max_workers=args["host_workers"]) as executor:
+        return list(executor.map(lambda x: get_uri(idrac, x), uris))
+
+def get_collection_members(idrac, uri):
+    # One $expand GET per collection. If members come back as links only, $expand is turned off for this iDRAC and members are fetched in parallel
+    if idrac["Expand Supported"]:
+        data = get_uri(idrac, "%s?$expand=.($levels=1)" % uri)
+        if [i for i in data["Members"] if list(i.keys()) == ["@odata.id"]] == []:
+            return data["Members"]
+        idrac["Expand Supported"] = False
+    else:
+        data = get_uri(idrac, uri)
+    return get_uris(idrac, [i["@odata.id"] for i in data["Members"]])
+
+def get_controller_drives(idrac, controllers):
+    # With $expand, all drives for a controller are returned with one GET. If iDRAC does not support $expand, each drive is fetched at the same time using get_uris()
+    if idrac["Expand Supported"]:
+        expanded_controllers = get_uris(idrac, ["%s?$expand=.($levels=1)" % i["@odata.id"] for i in controllers])
+        drives = [ii for i in expanded_controllers for ii in i.get("Drives", [])]
+        if [i for i in drives if list(i.keys()) == ["@odata.id"]] == []:
+            return drives
+        idrac["Expand Supported"] = False
+    return get_uris(idrac, [ii["@odata.id"] for i in controllers for ii in i.get("Drives", [])])
+
+def get_normalized_resource(data):
+    # Removes OData annotations except @odata.id and volatile properties so the resource digest only changes if the component changed
+    if isinstance(data, dict):
+        return {i: get_normalized_resource(ii) for i, ii in data.items() if (not i.startswith("@odata.") or i == "@odata.id") and i not in VOLATILE_PROPERTIES}
+    elif isinstance(data, list):
+        return [get_normalized_resource(i) for i in data]
+    return data
+
+def get_component_row(component_class, resource, fqdd=None, firmware=None, source_resource=None):
+    # Property values are converted to string so each column has one type for all iDRACs. Digest is created for source_resource if passed in, used when the row is created from part of a resource
+    status = resource.get("Status") or {}
+    row = {"component_class": component_class, "fqdd": fqdd or resource.get("Id"), "name": resource.get("Name"), "manufacturer": resource.get("Manufacturer"), "model": resource.get("Model"),
+        "serial": resource.get("SerialNumber"), "part_number": resource.get("PartNumber"), "firmware": firmware or resource.get("FirmwareVersion"), "health": status.get("Health"), "state": status.get("State")}
+    row = {i: str(ii) if ii is not None and ii != "" else None for i, ii in row.items()}
+    row["resource"] = get_normalized_resource(source_resource or resource)
+    row["resource_digest"] = hashlib.sha256(json.dumps(row["resource"], sort_keys=True, separators=(",", ":")).encode()).hexdigest()
+    return row
+
+def get_firmware_fqdd(resource):
+    # FirmwareInventory Id includes the installed version (Installed-<component ID>-<version>__<FQDD>), version is removed so a firmware update is reported as changed instead of removed and added
+    firmware_id = resource.get("Id", "")
+    if re.match(r"^Installed-[^-]*-.*__", firmware_id):
+        return re.sub(r"^(Installed-[^-]*)-.*?__", r"\1__", firmware_id)
+    software_inventory = ((resource.get("Oem") or {}).get("Dell") or {}).get("DellSoftwareInventory") or {}
+    if software_inventory.get("ComponentID") and software_inventory.get("FQDD"):
+        return "Installed-%s__%s" % (software_inventory["ComponentID"], software_inventory["FQDD"])
+    return firmware_id
+
+def get_idrac_components(idrac):
+    system = get_uri(idrac, '/redfish/v1/Systems/System.Embedded.1')
+    idrac["Service Tag"] = system.get("SKU")
+    idrac["System Model"] = system.get("Model")
+    system_row = get_component_row("System", system, fqdd="System.Embedded.1", firmware=system.get("BiosVersion"))
+    system_row["health"] = (system.get("Status") or {}).get("HealthRollup") or system_row["health"]
+    components = [system_row]
+    manager = get_uri(idrac, '/redfish/v1/Managers/iDRAC.Embedded.1')
+    components.append(get_component_row("Manager", manager, fqdd="iDRAC.Embedded.1"))
+    for i in get_collection_members(idrac, '/redfish/v1/Systems/System.Embedded.1/Processors'):
+        components.append(get_component_row("Processor", i))
+    for i in get_collection_members(idrac, '/redfish/v1/Systems/System.Embedded.1/Memory'):
+        components.append(get_component_row("Memory", i))
+    controllers = get_collection_members(idrac, '/redfish/v1/Systems/System.Embedded.1/Storage')
+    for i in controllers:
+        storage_controller = (i.get("StorageControllers") or [{}])[0]
+        row = get_component_row("StorageController", storage_controller, fqdd=i["Id"], source_resource=i)
+        row["name"] = row["name"] or i.get("Name")
+        components.append(row)
+    for i in get_controller_drives(idrac, controllers):
+        components.append(get_component_row("Drive", i, firmware=i.get("Revision")))
+    power = get_uri(idrac, '/redfish/v1/Chassis/System.Embedded.1/Power')
+    for i in power.get("PowerSupplies", []):
+        try:
+            fqdd = i["Oem"]["Dell"]["DellPowerSupply"]["Id"]
+        except (KeyError, TypeError):
+            fqdd = i.get("MemberId") or i.get("Name")
+        components.append(get_component_row("PowerSupply", i, fqdd=fqdd))
+    for i in get_collection_members(idrac, '/redfish/v1/Chassis/System.Embedded.1/NetworkAdapters'):
+        controller = (i.get("Controllers") or [{}])[0]
+        components.append(get_component_row("NetworkAdapter", i, firmware=controller.get("FirmwarePackageVersion")))
+    for i in get_uris(idrac, [i["@odata.id"] for i in system.get("PCIeDevices", [])]):
+        components.append(get_component_row("PCIeDevice", i))
+    firmware_inventory = get_uri(idrac, '/redfish/v1/UpdateService/FirmwareInventory?$expand=*($levels=1)')
+    if [i for i in firmware_inventory["Members"] if list(i.keys()) == ["@odata.id"]] != []:
+        firmware_inventory["Members"] = get_uris(idrac, [i["@odata.id"] for i in firmware_inventory["Members"]])
+    for i in firmware_inventory["Members"]:
+        if i.get("Id", "").startswith("Installed"):
+            components.append(get_component_row("Firmware", i, fqdd=get_firmware_fqdd(i), firmware=i.get("Version")))
+    return components
+
+def get_snapshot_file(host):
+    return os.path.join(args["snapshot_dir"], "%s.json" % host.replace(":", "_"))
+
+def get_snapshot_changes(host, components):
+    # Components are compared with the snapshot from the last successful sweep using the resource digest. New snapshot is saved as .new file and only replaces the snapshot once the sweep is complete
+    try:
+        with open(get_snapshot_file(host), "r") as json_file:
+            previous_snapshot = json.load(json_file)["Components"]
+    except (OSError, ValueError, KeyError):
+        previous_snapshot = {}
+    snapshot = {}
+    changes = []
+    for i in components:
+        key = "%s/%s" % (i["component_class"], i["fqdd"])
+        snapshot[key] = {"Component Class": i["component_class"], "FQDD": i["fqdd"], "Digest": i["resource_digest"]}
+        if key not in previous_snapshot:
+            changes.append({"change": "added", "component_class": i["component_class"], "fqdd": i["fqdd"], "resource_digest": i["resource_digest"], "previous_digest": None, "component": i})
+        elif previous_snapshot[key]["Digest"] != i["resource_digest"]:
+            changes.append({"change": "changed", "component_class": i["component_class"], "fqdd": i["fqdd"], "resource_digest": i["resource_digest"], "previous_digest": previous_snapshot[key]["Digest"], "component": i})
+    for i in previous_snapshot.items():
+        if i[0] not in snapshot:
+            changes.append({"change": "removed", "component_class": i[1]["Component Class"], "fqdd": i[1]["FQDD"], "resource_digest": None, "previous_digest": i[1]["Digest"], "component": None})
+    with open(get_snapshot_file(host) + ".new", "w") as json_file:
+        json.dump({"iDRAC IP": host, "Components": snapshot}, json_file)
+    return changes
+
+def get_idrac_inventory(idrac):
+    # Errors are returned in the host result so one iDRAC failing does not stop the sweep for the other iDRACs
+    idrac["session"] = requests.Session()
+    idrac["session"].mount("https://", ResumableHTTPAdapter(pool_maxsize=args["host_workers"]))
+    idrac["session"].auth = (idrac["iDRAC Username"], idrac["iDRAC Password"])
+    idrac["Expand Supported"] = True
+    idrac["Service Tag"] = None
+    idrac["System Model"] = None
+    result = {"host": idrac["iDRAC IP"], "status": "PASS", "error": None, "duration_seconds": 0, "component_count": 0, "change_count": None, "components": [], "changes": []}
+    start_time = time.time()
+    try:
+        result["components"] = get_idrac_components(idrac)
+        if args["snapshot_dir"]:
+            result["changes"] = get_snapshot_changes(idrac["iDRAC IP"], result["components"])
+            result["change_count"] = len(result["changes"])
+    except Exception as error_message:
+        result["status"] = "FAIL"
+        result["error"] = str(error_message) or type(error_message).__name__
+    finally:
+        idrac["session"].close()
+    result["duration_seconds"] = round(time.time() - start_time, 2)
+    result["component_count"] = len(result["components"])
+    result["service_tag"] = idrac["Service Tag"]
+    result["system_model"] = idrac["System Model"]
+    return result
+
+class DatasetWriter(object):
+    # Component rows are buffered and written as one record batch (Parquet row group) every --batch-size rows, memory used does not grow with the number of iDRACs
+    def __init__(self, pa, file_path, schema, file_format):
+        self.pa = pa
+        self.rows = []
+        if file_format == "parquet":
+            self.writer = pa.parquet.ParquetWriter(file_path, schema, compression="zstd")
+        else:
+            # Arrow IPC file format does not allow dictionary values to change between record batches, dictionary columns are written as plain string columns
+            schema = pa.schema([pa.field(i.name, i.type.value_type, nullable=i.nullable) if pa.types.is_dictionary(i.type) else i for i in schema])
+            self.sink = pa.OSFile(file_path, "wb")
+            self.writer = pa.ipc.new_file(self.sink, schema)
+        self.schema = schema
+
+    def write_rows(self, rows):
+        self.rows.extend(rows)
+        if len(self.rows) >= args["batch_size"]:
+            self.flush()
+
+    def flush(self):
+        if self.rows == []:
+            return
+        columns = [self.pa.array([i[ii.name] for i in self.rows], type=ii.type) for ii in self.schema]
+        self.writer.write_batch(self.pa.RecordBatch.from_arrays(columns, schema=self.schema))
+        self.rows = []
+
+    def close(self):
+        self.flush()
+        self.writer.close()
+        if hasattr(self, "sink"):
+            self.sink.close()
+
+def get_fleet_inventory():
+    pa = get_pyarrow()
+    idracs = get_csv_idracs(args["csv_filename"])
+    if idracs == []:
+        logging.error("\n- FAIL, no iDRACs detected in CSV file \"%s\"" % args["csv_filename"])
+        sys.exit(0)
+    inventory_schema, hosts_schema = get_schemas(pa)
+    sweep_time = datetime.now(timezone.utc).replace(microsecond=0)
+    sweep_dir = os.path.join(args["output_dir"], "sweep=%s" % sweep_time.strftime("%Y%m%dT%H%M%SZ"))
+    # Sweep is written to a directory starting with underscore, ignored by Parquet/Arrow dataset readers, and renamed once complete
+    temp_sweep_dir = os.path.join(args["output_dir"], "_%s" % os.path.basename(sweep_dir))
+    os.makedirs(temp_sweep_dir, exist_ok=True)
+    inventory_writer = DatasetWriter(pa, os.path.join(temp_sweep_dir, "inventory.%s" % args["format"]), inventory_schema, args["format"])
+    if args["snapshot_dir"]:
+        os.makedirs(args["snapshot_dir"], exist_ok=True)
+        changes_file = open(os.path.join(temp_sweep_dir, "changes.ndjson"), "w")
+    hosts = []
+    component_count = 0
+    change_count = {"added": 0, "removed": 0, "changed": 0}
+    logging.info("\n- INFO, getting inventory for %s iDRAC(s), max %s iDRAC(s) at the same time\n" % (len(idracs), args["max_workers"]))
+    try:
+        with concurrent.futures.ThreadPoolExecutor(max_workers=args["max_workers"]) as executor:
+            futures = [executor.submit(get_idrac_inventory, i) for i in idracs]
+            for future in concurrent.futures.as_completed(futures):
+                result = future.result()
+                host_details = {"sweep_time": sweep_time, "host": result["host"], "service_tag": result["service_tag"], "system_model": result["system_model"]}
+                for i in result["components"]:
+                    i.update(host_details)
+                for i in result["changes"]:
+                    change_count[i["change"]] += 1
+                    change = {"sweep_time": sweep_time.isoformat(), "host": result["host"]}
+                    change.update(i)
+                    if change["component"]:
+                        change["component"] = {ii[0]: ii[1] for ii in change["component"].items() if ii[0] != "sweep_time"}
+                    changes_file.write(json.dumps(change) + "\n")
+                del result["changes"]
+                for i in result["components"]:
+                    del i["resource"]
+                inventory_writer.write_rows(result.pop("components"))
+                component_count += result["component_count"]
+                result["sweep_time"] = sweep_time
+                hosts.append(result)
+                if result["status"] == "PASS":
+                    logging.info("- PASS, iDRAC %s, %s components in %s seconds (%s of %s)" % (result["host"], result["component_count"], result["duration_seconds"], len(hosts), len(idracs)))
+                else:
+                    logging.error("- FAIL, iDRAC %s, %s (%s of %s)" % (result["host"], result["error"], len(hosts), len(idracs)))
+        inventory_writer.close()
+        hosts_writer = DatasetWriter(pa, os.path.join(temp_sweep_dir, "hosts.%s" % args["format"]), hosts_schema, args["format"])
+        hosts_writer.write_rows(hosts)
+        hosts_writer.close()
+        if args["snapshot_dir"]:
+            changes_file.close()
+        os.rename(temp_sweep_dir, sweep_dir)
+    except BaseException:
+        # Sweep did not complete, remove the partial sweep directory
+        shutil.rmtree(temp_sweep_dir, ignore_errors=True)
+        raise
+    passed = len([i for i in hosts if i["status"] == "PASS"])
+    logging.info("\n- INFO, sweep complete, PASS: %s, FAIL: %s, %s component rows written to \"%s\"" % (passed, len(hosts) - passed, component_count, sweep_dir))
+    logging.info("- INFO, TLS handshakes, full: %s, resumed: %s" % (tls_handshakes["full"], tls_handshakes["resumed"]))
+    if args["snapshot_dir"]:
+        for i in hosts:
+            if i["status"] == "PASS":
+                os.replace(get_snapshot_file(i["host"]) + ".new", get_snapshot_file(i["host"]))
+        logging.info("- INFO, changes since last sweep, added: %s, removed: %s, changed: %s, written to \"%s\"" % (change_count["added"], change_count["removed"], change_count["changed"], os.path.join(sweep_dir, "changes.ndjson")))
+
+if __name__ == "__main__":
+    if args["script_examples"]:
+        script_examples()
+    if args["csv_filename"]:
+        idrac_username = args["u"] or ""
+        idrac_password = args["p"] or ""
+        if args["u"] and not args["p"]:
+            idrac_password = getpass.getpass("\n- Argument -p not detected, pass in iDRAC user %s password: " % args["u"])
+        if args["ssl"] and args["ssl"].lower() == "true":
+            verify_cert = True
+        else:
+            verify_cert = False
+        tls_sessions = {}
+        tls_sockets = {}
+        tls_sessions_lock = threading.Lock()
+        tls_handshakes = {"full": 0, "resumed": 0}
+        tls_context = get_tls_context()
+        get_fleet_inventory()
+    else:
+        logging.error("\n- FAIL, invalid argument values or not all required parameters passed in. See help text or argument --script-examples for more details.")
+        sys.exit(0)
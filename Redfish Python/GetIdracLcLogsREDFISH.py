@@ -3,7 +3,7 @@
 # GetIdracLcLogsREDFISH. Python script using Redfish API to get iDRAC LC logs.
 #
 # _author_ = Texas Roemer <Texas_Roemer@Dell.com>
-# _version_ = 15.0
+# _version_ = 18.2
 #
 # Copyright (c) 2017, Dell, Inc.
 #	
@@ -16,19 +16,23 @@
 #
 
 import argparse
+import concurrent.futures
 import getpass
+import itertools
 import json
 import logging
 import os
 import re
 import requests
 import shutil
+import sqlite3
 import sys
+import tempfile
 import time
 import warnings
 
 from pprint import pprint
-from datetime import datetime
+from datetime import datetime, timezone
 
 warnings.filterwarnings("ignore")
 
@@ -49,6 +53,11 @@ parser.add_argument('--get-fail', help='Get only failed entries from LC logs (se
 parser.add_argument('--get-message-id', help='Get only entries for a specific message ID. To get the correct message ID string format to pass in use argument --get-all to return complete LC logs. iDRAC9 examples of correct message string ID value to pass in: IDRAC.2.9.PDR1001, IDRAC.2.9.LC011. Note: You can also pass in an abbreviated message ID value, example: IDRAC.2.9.LC which will return any message ID that starts with LC. Note: iDRAC8 has a different message ID format, run --get-all argument to see string format.', dest="get_message_id", required=False)
 parser.add_argument('--dump-to-json-file', help='Pass in this argument to dump LC log entries to JSON file(s) which you can then parse the JSON output. Note: Multiple JSON files may be created due to the LC logs file size since Redfish can only report 50 entries at a time.', dest="dump_to_json_file", action="store_true", required=False)
 parser.add_argument('--convert-json-output', help='Pass in this argument to dump output to the screen in JSON format instead of python object which then can be parsed using other tools', action="store_true", dest="convert_json_output", required=False)
+parser.add_argument('--since-last', help='Get only LC log entries created since the last --since-last run for this iDRAC and append them to NDJSON file (one JSON entry per line). Created timestamp of the last entry synced per iDRAC is stored in state file, see argument --state-file. First run for an iDRAC gets complete LC logs.', action="store_true", dest="since_last", required=False)
+parser.add_argument('--state-file', help='Pass in state file name used with argument --since-last, default value is idrac_log_sync_state.json. Lock file <state file>.lock is also created to allow multiple --since-last runs at the same time.', dest="state_file", default="idrac_log_sync_state.json", required=False)
+parser.add_argument('--ndjson-file', help='Pass in NDJSON file name to append new LC log entries to with argument --since-last, default value is <iDRAC IP>_LC_logs.ndjson', dest="ndjson_file", required=False)
+parser.add_argument('--db-file', help='Pass in SQLite database file name to store LC log entries in a local indexed database, entries already in the database are skipped. Use with argument --since-last to only add new entries. Database can be queried for one or multiple iDRACs using script QueryIdracLogsDatabaseREDFISH.py without accessing the iDRAC.', dest="db_file", required=False)
+parser.add_argument('--max-workers', help='Max number of LC log pages to get from iDRAC at the same time, default value is 4', dest="max_workers", type=int, default=4, required=False)
 args = vars(parser.parse_args())
 logging.basicConfig(format='%(message)s', stream=sys.stdout, level=logging.INFO)
 
@@ -59,6 +68,8 @@ def script_examples():
     \n- GetIdracLcLogsREDFISH.py -ip 192.168.0.120 -u root -p calvin --get-severity critical, this example will return only critical entries detected.
     \n- GetIdracLcLogsREDFISH.py -ip 192.168.0.120 -u root -p calvin --get-severity warning, this example will return only warning entries detected and also redirect output in JSON format to a directory folder created by the script.
     \n- GetIdracLcLogsREDFISH.py -ip 192.168.0.120 -u root -p calvin --get-category systemhealth, this example will return only system health category entries detected.
+    \n- GetIdracLcLogsREDFISH.py -ip 192.168.0.120 -u root -p calvin --since-last, this example will append only LC log entries created since the last run for this iDRAC to file 192.168.0.120_LC_logs.ndjson.
+    \n- GetIdracLcLogsREDFISH.py -ip 192.168.0.120 -u root -p calvin --since-last --db-file idrac_logs.db, this example will append only LC log entries created since the last run to NDJSON file and add them to SQLite database file idrac_logs.db, run QueryIdracLogsDatabaseREDFISH.py to query the database.
     \n- GetIdracLcLogsREDFISH.py -ip 192.168.0.120 -u root -p calvin --get-date-range --start-date 2023-03-15T14:55:10-05:00 --end-date 2023-03-15T14:57:07-05:00, this example will return only LC Log entries within this start and date range.""")
     sys.exit(0)
 
@@ -114,469 +125,315 @@ def get_server_generation():
         sys.exit(0)
 
 
-def get_specific_severity_logs(x):
-    if not args["convert_json_output"]:
-        logging.info("\n- INFO, this may take 30 seconds to 1 minute to collect all iDRAC LC logs depending on log file size")
-    if args["dump_to_json_file"]:
-        try:
-            shutil.rmtree("%s_LC_log_JSON_files" % idrac_ip)
-        except:
-            logging.debug("- INFO, directory does not exist, skipping")
-        directory_name = "%s_LC_log_JSON_files" % idrac_ip
-        directory_path = os.mkdir(directory_name)
-    uri = x
-    if args["get_severity"].lower() == "informational":
-        filter_uri = "%s?$filter=Severity eq 'OK'" % uri
-    elif args["get_severity"].lower() == "critical":
-        filter_uri = "%s?$filter=Severity eq 'Critical'" % uri
-    elif args["get_severity"].lower() == "warning":
-        filter_uri = "%s?$filter=Severity eq 'Warning'" % uri
-    else:
-        logging.error("\n- WARNING, invalid value passed in for argument --get-severity")
-        sys.exit(0)
-    if args["x"]:
-        response = requests.get('https://%s/%s' % (idrac_ip, filter_uri), verify=verify_cert, headers={'X-Auth-Token': args["x"]})
-    else:
-        response = requests.get('https://%s/%s' % (idrac_ip, filter_uri), verify=verify_cert, auth=(idrac_username, idrac_password))
-    lc_logs_list = []
-    data = response.json()
-    if response.status_code == 401:
-        logging.warning("\n- WARNING, status code %s returned. Incorrect iDRAC username/password or invalid privilege detected." % response.status_code)
-        sys.exit(0)
-    elif response.status_code != 200:
-        logging.warning("\n- WARNING, iDRAC version installed does not support this feature using Redfish API")
-        sys.exit(0)
-    elif "Members" not in data.keys():
-        logging.warning("- WARNING, 'Members' key not detected in JSON response, unable to get LC logs. Manually check iDRAC interfaces to confirm you can view LC logs")
-        sys.exit(0)
-    elif data["Members"] == []:
-        logging.info("\n- WARNING, no \"%s\" severity entries detected in iDRAC LC logs" % args["get_severity"])
-        sys.exit(0)
-    else:
-        if args["convert_json_output"]:
-            json_output = json.dumps(data["Members"])
-            create_json_output_list = []
-            create_json_output_list.append(json_output)
+def create_json_dump_directory():
+    try:
+        shutil.rmtree("%s_LC_log_JSON_files" % idrac_ip)
+    except:
+        logging.debug("- INFO, directory does not exist, skipping")
+    directory_name = "%s_LC_log_JSON_files" % idrac_ip
+    os.mkdir(directory_name)
+    return directory_name
+
+def get_lc_log_page(uri):
+    # GET one page of LC log entries, returns None when there are no more entries to get. Only the $skip out of range error means end of log, any other failed GET is retried and script exits if it still fails so the log is never silently cut short
+    retry_count = 0
+    while True:
+        if args["x"]:
+            response = http_session.get('https://%s%s' % (idrac_ip, uri), verify=verify_cert, headers={'X-Auth-Token': args["x"]})
         else:
-            lc_logs_list.append(data)
-        if args["dump_to_json_file"]:
-            filename = directory_name + "/lclog_entries_1.json"
-            open_file = open(filename,"w")
-            json.dump(data, open_file)
-            open_file.close()
-            file_count = 2
-    if "Members@odata.nextLink" in data.keys():
-        skip_uri = data["Members@odata.nextLink"]
-        number_list = [i for i in range (1,100001) if i % 50 == 0]
-        for seq in number_list:
-            skip_uri = re.sub("skip=.*","skip=%s" % seq, skip_uri)
-            if args["x"]:
-                response = requests.get('https://%s%s' % (idrac_ip, skip_uri), verify=verify_cert, headers={'X-Auth-Token': args["x"]})
-            else:
-                response = requests.get('https://%s%s' % (idrac_ip, skip_uri), verify=verify_cert, auth=(idrac_username, idrac_password))
+            response = http_session.get('https://%s%s' % (idrac_ip, uri), verify=verify_cert, auth=(idrac_username, idrac_password))
+        try:
             data = response.json()
-            if "Members" not in data.keys():
-                logging.debug("-WARNING, 'Members' key not detected in JSON response, script will exit loop for skip query")
-                break
-            if response.status_code == 500:
-                break
-            elif response.status_code != 200:
-                if "query parameter $skip is out of range" in data["error"]["@Message.ExtendedInfo"][0]["Message"]:
-                    break
-                else:
-                    logging.error("\n- FAIL, GET request failed using skip query parameter, status code %s returned. Detailed error results: \n%s" % (response.status_code,data))    
-                    sys.exit(0)
-            elif "Members" in data.keys():
-                if data["Members"] == []:
-                    break
-            if args["convert_json_output"]:
-                json_output = json.dumps(data["Members"])
-                print(json_output)
-            else:
-                lc_logs_list.append(data)
-            if args["dump_to_json_file"]:
-                filename = directory_name + "/lclog_entries_%s.json" % file_count
-                open_file = open(filename, "w")
-                json.dump(data, open_file)
-                open_file.close()
-                file_count += 1
-    if args["convert_json_output"]:
-        print(json.dumps(create_json_output_list))
-    elif args["dump_to_json_file"]:
-        pprint(lc_logs_list)
-        logging.info("\n- INFO, JSON dump log files copied to directory %s" % directory_name)
-    else:
-        pprint(lc_logs_list)
+        except ValueError:
+            data = response.text
+        if response.status_code == 200:
+            break
+        if "query parameter $skip is out of range" in str(data):
+            return None
+        if response.status_code == 500 and retry_count < 3:
+            retry_count += 1
+            logging.debug("- INFO, GET request failed using skip query parameter, status code 500 returned, retry %s" % retry_count)
+            time.sleep(5)
+            continue
+        logging.error("\n- FAIL, GET request failed using skip query parameter, status code %s returned. Detailed error results: \n%s" % (response.status_code,data))
+        sys.exit(0)
+    if "Members" not in data.keys() or data["Members"] == []:
+        logging.debug("- WARNING, 'Members' key not detected or empty in JSON response, no more LC log entries to get")
+        return None
+    return data
 
-def get_date_range(x):
-    if args["dump_to_json_file"]:
-        try:
-            shutil.rmtree("%s_LC_log_JSON_files" % idrac_ip)
-        except:
-            logging.debug("- INFO, directory does not exist, skipping")
-        directory_name = "%s_LC_log_JSON_files" % idrac_ip
-        directory_path = os.mkdir(directory_name)
-    logging.info("\n- INFO, this may take 30 seconds to 1 minute to collect all iDRAC LC logs depending on log file size")
-    uri = x
-    date_range_uri = "%s?$filter=Created ge '%s' and Created le '%s'" % (uri, args["start_date"], args["end_date"])
+def get_lc_log_pages(uri):
+    # Generator returning LC log pages in order. Members@odata.count from the first page is used to get all remaining $skip pages at the same time using --max-workers threads, only a small window of pages is held in memory
+    first_page_uri = "/%s" % uri.lstrip("/")
     if args["x"]:
-        response = requests.get('https://%s/%s' % (idrac_ip, date_range_uri), verify=verify_cert, headers={'X-Auth-Token': args["x"]})
+        response = http_session.get('https://%s%s' % (idrac_ip, first_page_uri), verify=verify_cert, headers={'X-Auth-Token': args["x"]})
     else:
-        response = requests.get('https://%s/%s' % (idrac_ip, date_range_uri), verify=verify_cert, auth=(idrac_username, idrac_password))
-    data = response.json()
-    lc_logs_list = []
+        response = http_session.get('https://%s%s' % (idrac_ip, first_page_uri), verify=verify_cert, auth=(idrac_username, idrac_password))
     if response.status_code == 401:
         logging.warning("\n- WARNING, status code %s returned. Incorrect iDRAC username/password or invalid privilege detected." % response.status_code)
         sys.exit(0)
     elif response.status_code != 200:
         logging.warning("\n- WARNING, iDRAC version installed does not support this feature using Redfish API")
         sys.exit(0)
-    elif "Members" not in data.keys():
+    data = response.json()
+    if "Members" not in data.keys():
         logging.warning("- WARNING, 'Members' key not detected in JSON response, unable to get LC logs. Manually check iDRAC interfaces to confirm you can view LC logs")
         sys.exit(0)
-    elif data["Members"] == []:
-        logging.info("- WARNING, no iDRAC LC logs detected within the date range specified")
-        sys.exit(0)
+    if data["Members"] == []:
+        return
+    yield data
+    if "Members@odata.nextLink" not in data.keys():
+        return
+    skip_uri = data["Members@odata.nextLink"]
+    page_size = len(data["Members"])
+    if "Members@odata.count" in data.keys():
+        skip_values = iter(range(page_size, data["Members@odata.count"], page_size))
     else:
-        if args["convert_json_output"]:
-            json_output = json.dumps(data["Members"])
-            print(json_output)
-        else:
-            lc_logs_list.append(data)
-        if args["dump_to_json_file"]:
-            filename = directory_name + "/lclog_entries_1.json"
-            open_file = open(filename,"w")
-            json.dump(data, open_file)
-            open_file.close()
-            file_count = 2
-    if "Members@odata.nextLink" in data.keys():
-        skip_uri = data["Members@odata.nextLink"]
-        number_list = [i for i in range (1,100001) if i % 50 == 0]
-        for seq in number_list:
-            skip_uri = re.sub("skip=.*","skip=%s" % seq, skip_uri)
-            if args["x"]:
-                response = requests.get('https://%s%s' % (idrac_ip, skip_uri), verify=verify_cert, headers={'X-Auth-Token': args["x"]})
-            else:
-                response = requests.get('https://%s%s' % (idrac_ip, skip_uri), verify=verify_cert, auth=(idrac_username, idrac_password))
-            data = response.json()
-            if "Members" not in data.keys():
-                logging.debug("- WARNING, 'Members' key not detected in JSON response, script will exit skip query loop.")
+        # Total entry count not reported, keep getting pages until iDRAC returns no more entries
+        skip_values = itertools.count(page_size, page_size)
+    with concurrent.futures.ThreadPoolExecutor(max_workers=args["max_workers"]) as executor:
+        futures = []
+        for skip in itertools.islice(skip_values, args["max_workers"] * 2):
+            futures.append(executor.submit(get_lc_log_page, re.sub(r"skip=\d+", "skip=%s" % skip, skip_uri)))
+        while futures:
+            data = futures.pop(0).result()
+            if data is None:
+                for future in futures:
+                    future.cancel()
                 break
-            elif response.status_code == 500:
-                break
-            elif response.status_code != 200:
-                if "query parameter $skip is out of range" in data["error"]["@Message.ExtendedInfo"][0]["Message"]:
-                    break
-                else:
-                    logging.error("\n- FAIL, GET request failed using skip query parameter, status code %s returned. Detailed error results: \n%s" % (response.status_code,data))    
-                    sys.exit(0)
-            elif "Members" in data.keys():
-                if data["Members"] == []:
-                    break
-            if args["dump_to_json_file"]:
-                json_output = json.dumps(data["Members"])
-                print(json_output)
-            else:
-                lc_logs_list.append(data)
-            if args["dump_to_json_file"]:
-                filename = directory_name + "/lclog_entries_%s.json" % file_count
-                open_file = open(filename, "w")
-                json.dump(data, open_file)
-                open_file.close()
-                file_count += 1
-    if not args["dump_to_json_file"]:
-        pprint(lc_logs_list)
-    if args["dump_to_json_file"]:
-        logging.info("\n- INFO, JSON dump log files copied to directory %s" % directory_name)
+            for skip in itertools.islice(skip_values, 1):
+                futures.append(executor.submit(get_lc_log_page, re.sub(r"skip=\d+", "skip=%s" % skip, skip_uri)))
+            yield data
 
-        
-def get_LC_logs(x):
+def get_lc_log_entries(uri):
+    # Generator returning LC log entries in order, see get_lc_log_pages()
+    for data in get_lc_log_pages(uri):
+        for i in data["Members"]:
+            yield i
+
+def output_lc_log_pages(uri, no_entries_message):
+    # Stream each LC log page to the screen and JSON dump file as soon as it is received
     if args["dump_to_json_file"]:
-        try:
-            shutil.rmtree("%s_LC_log_JSON_files" % idrac_ip)
-        except:
-            logging.debug("- INFO, directory does not exist, skipping")
-        directory_name = "%s_LC_log_JSON_files" % idrac_ip
-        directory_path = os.mkdir(directory_name)
+        directory_name = create_json_dump_directory()
     if not args["convert_json_output"]:
         logging.info("\n- INFO, this may take 30 seconds to 1 minute to collect all iDRAC LC logs depending on log file size")
-    uri = x
-    if args["x"]:
-        response = requests.get('https://%s/%s' % (idrac_ip, uri), verify=verify_cert, headers={'X-Auth-Token': args["x"]})
-    else:
-        response = requests.get('https://%s/%s' % (idrac_ip, uri), verify=verify_cert, auth=(idrac_username, idrac_password))
-    lc_logs_list = []
-    data = response.json()
-    if "Members" not in data.keys():
-        logging.warning("- WARNING, 'Members' key not detected in JSON response, unable to get LC logs. Manually check iDRAC interfaces to confirm you can view LC logs")
-        sys.exit(0)
-    elif response.status_code == 401:
-        logging.warning("\n- WARNING, status code %s returned. Incorrect iDRAC username/password or invalid privilege detected." % response.status_code)
-        sys.exit(0)
-    elif response.status_code != 200:
-        logging.warning("\n- WARNING, iDRAC version installed does not support this feature using Redfish API")
-        sys.exit(0)
-    elif data["Members"] == []:
-        logging.info("\n- WARNING, 'Members' collection is empty, no LC logs detected, script will exit")
-        sys.exit(0)
-    else:
+    file_count = 0
+    entry_count = 0
+    for data in get_lc_log_pages(uri):
+        file_count += 1
         if args["convert_json_output"]:
-            json_output = json.dumps(data["Members"])
-            create_json_output_list = []
-            create_json_output_list.append(json_output)
+            # Output is one JSON array of all entries, written as each page is received
+            for i in data["Members"]:
+                if entry_count == 0:
+                    sys.stdout.write("[%s" % json.dumps(i))
+                else:
+                    sys.stdout.write(",\n%s" % json.dumps(i))
+                entry_count += 1
         else:
-            lc_logs_list.append(data)
+            pprint(data)
         if args["dump_to_json_file"]:
-            filename = directory_name + "/lclog_entries_1.json"
-            open_file = open(filename,"w")
-            json.dump(data, open_file)
-            open_file.close()
-            file_count = 2
-    if "Members@odata.nextLink" in data.keys():
-        skip_uri = data["Members@odata.nextLink"]
-        number_list = [i for i in range (1,100001) if i % 50 == 0]
-        for seq in number_list:
-            skip_uri = re.sub("skip=.*","skip=%s" % seq, skip_uri)
-            if args["x"]:
-                response = requests.get('https://%s%s' % (idrac_ip, skip_uri), verify=verify_cert, headers={'X-Auth-Token': args["x"]})
-            else:
-                response = requests.get('https://%s%s' % (idrac_ip, skip_uri), verify=verify_cert, auth=(idrac_username, idrac_password))
-            data = response.json()
-            if "Members" not in data.keys():
-                logging.debug("- WARNING, 'Members' key not detected in JSON response, script will exit looping skip query")
-                break
-            elif response.status_code == 500:
-                break
-            elif response.status_code != 200:
-                if "query parameter $skip is out of range" in data["error"]["@Message.ExtendedInfo"][0]["Message"]:
-                    break
-                else:
-                    logging.error("\n- FAIL, GET request failed using skip query parameter, status code %s returned. Detailed error results: \n%s" % (response.status_code,data))    
-                    sys.exit(0)
-            elif "Members" in data.keys():
-                if data["Members"] == []:
-                    break
-                if args["convert_json_output"]:
-                    json_output = json.dumps(data["Members"])
-                    create_json_output_list.append(json_output)
-                else:
-                    lc_logs_list.append(data)
-            if args["dump_to_json_file"]:
-                filename = directory_name + "/lclog_entries_%s.json" % file_count
-                open_file = open(filename, "w")
+            filename = directory_name + "/lclog_entries_%s.json" % file_count
+            with open(filename, "w") as open_file:
                 json.dump(data, open_file)
-                open_file.close()
-                file_count += 1
+    if file_count == 0:
+        logging.info("\n- WARNING, %s" % no_entries_message)
+        sys.exit(0)
     if args["convert_json_output"]:
-        print(json.dumps(create_json_output_list))
-    elif args["dump_to_json_file"]:
-        pprint(lc_logs_list)
+        print("]")
+    if args["dump_to_json_file"]:
         logging.info("\n- INFO, JSON dump log files copied to directory %s" % directory_name)
-    else:
-        pprint(lc_logs_list)
 
-def get_LC_log_failures(x):
+def output_lc_log_entries(uri, entry_filter, no_entries_message):
+    # Stream LC log entries matching entry_filter to the screen and JSON dump file as soon as each page is received
     if args["dump_to_json_file"]:
-        try:
-            shutil.rmtree("%s_LC_log_JSON_files" % idrac_ip)
-        except:
-            logging.debug("- INFO, directory does not exist, skipping")
-        directory_name = "%s_LC_log_JSON_files" % idrac_ip
-        directory_path = os.mkdir(directory_name)
+        directory_name = create_json_dump_directory()
+        open_file = open(directory_name + "/lclog_entries_1.json", "w")
     logging.info("\n- INFO, this may take 30 seconds to 1 minute to collect all iDRAC LC logs depending on log file size\n")
-    uri = x
-    if args["x"]:
-        response = requests.get('https://%s/%s' % (idrac_ip, uri), verify=verify_cert, headers={'X-Auth-Token': args["x"]})
-    else:
-        response = requests.get('https://%s/%s' % (idrac_ip, uri), verify=verify_cert, auth=(idrac_username, idrac_password))
-    data = response.json()
-    lc_logs_list = []
-    if "Members" not in data.keys():
-        logging.warning("- WARNING, 'Members' key not detected in JSON response, unable to get LC logs. Manually check iDRAC interfaces to confirm you can view LC logs")
-        sys.exit(0)
-    for i in data['Members']:
-        if "unable" in i["Message"].lower() or "fail" in i["Message"].lower() or "error" in i["Message"].lower() or "fault" in i["Message"].lower():
-            lc_logs_list.append(i)
-    if "Members@odata.nextLink" in data.keys():
-        skip_uri = data["Members@odata.nextLink"]
-        number_list = [i for i in range (1,100001) if i % 50 == 0]
-        for seq in number_list:
-            skip_uri = re.sub("skip=.*","skip=%s" % seq, skip_uri)
-            if args["x"]:
-                response = requests.get('https://%s%s' % (idrac_ip, skip_uri), verify=verify_cert, headers={'X-Auth-Token': args["x"]})
+    entry_count = 0
+    for i in get_lc_log_entries(uri):
+        if not entry_filter(i):
+            continue
+        if args["convert_json_output"]:
+            print(json.dumps(i))
+        else:
+            pprint(i)
+        if args["dump_to_json_file"]:
+            if entry_count == 0:
+                open_file.write("[%s" % json.dumps(i))
             else:
-                response = requests.get('https://%s%s' % (idrac_ip, skip_uri), verify=verify_cert, auth=(idrac_username, idrac_password))
-            data = response.json()
-            if "Members" not in data.keys():
-                logging.debug("- WARNING, 'Members' key not detected in JSON response, script will exit loop skip query")
-                pprint(lc_logs_list)
-                if args["dump_to_json_file"]:
-                    filename = directory_name + "/lclog_entries_1.json"
-                    open_file = open(filename,"w")
-                    json.dump(lc_logs_list, open_file)
-                    open_file.close()
-                    logging.info("\n- INFO, JSON dump log files copied to directory %s" % directory_name)
-                break
-            elif response.status_code == 500:
-                break
-            elif response.status_code != 200:
-                if "query parameter $skip is out of range" in data["error"]["@Message.ExtendedInfo"][0]["Message"]:
-                    break
-                else:
-                    logging.error("\n- FAIL, GET request failed using skip query parameter, status code %s returned. Detailed error results: \n%s" % (response.status_code,data))    
-                    sys.exit(0)
-            elif "Members" in data.keys():
-                if data["Members"] == []:
-                    break
-            for i in data['Members']:
-                if "unable" in i["Message"].lower() or "fail" in i["Message"].lower() or "fail" in i["Message"].lower() or "error" in i["Message"].lower():
-                    lc_logs_list.append(i)
-    if lc_logs_list == []:
-        logging.warning("\n- WARNING, no LC log events detected with keywords unable, fail or error in message string")
-        sys.exit(0)
-    pprint(lc_logs_list)
+                open_file.write(", %s" % json.dumps(i))
+        entry_count += 1
     if args["dump_to_json_file"]:
-        filename = directory_name + "/lclog_entries_1.json"
-        open_file = open(filename,"w")
-        json.dump(lc_logs_list, open_file)
+        if entry_count != 0:
+            open_file.write("]")
         open_file.close()
-        logging.info("\n- INFO, JSON dump log files copied to directory %s" % directory_name)      
-
-def get_message_id(x):
+        if entry_count == 0:
+            shutil.rmtree(directory_name)
+    if entry_count == 0:
+        logging.warning("\n- WARNING, %s" % no_entries_message)
+        sys.exit(0)
     if args["dump_to_json_file"]:
-        try:
-            shutil.rmtree("%s_LC_log_JSON_files" % idrac_ip)
-        except:
-            logging.debug("- INFO, directory does not exist, skipping")
-        directory_name = "%s_LC_log_JSON_files" % idrac_ip
-        directory_path = os.mkdir(directory_name)
-    logging.info("\n- INFO, this may take 30 seconds to 1 minute to collect all iDRAC LC logs depending on log file size\n")
-    uri = x
-    uri = "%s?$filter=MessageId eq '%s'" % (uri, args["get_message_id"])
-    if args["x"]:
-        response = requests.get('https://%s/%s' % (idrac_ip, uri), verify=verify_cert, headers={'X-Auth-Token': args["x"]})
+        logging.info("\n- INFO, JSON dump log files copied to directory %s" % directory_name)
+
+def get_specific_severity_logs(x):
+    if args["get_severity"].lower() == "informational":
+        filter_uri = "%s?$filter=Severity eq 'OK'" % x
+    elif args["get_severity"].lower() == "critical":
+        filter_uri = "%s?$filter=Severity eq 'Critical'" % x
+    elif args["get_severity"].lower() == "warning":
+        filter_uri = "%s?$filter=Severity eq 'Warning'" % x
     else:
-        response = requests.get('https://%s/%s' % (idrac_ip, uri), verify=verify_cert, auth=(idrac_username, idrac_password))
-    data = response.json()
-    lc_logs_list = []
-    if "Members" not in data.keys():
-        logging.warning("- WARNING, 'Members' key not detected in JSON response, unable to get LC logs. Manually check iDRAC interfaces to confirm you can view LC logs")
-        sys.exit(0)
-    elif response.status_code == 401:
-        logging.warning("\n- WARNING, status code %s returned. Incorrect iDRAC username/password or invalid privilege detected." % response.status_code)
-        sys.exit(0)
-    elif response.status_code != 200:
-        logging.warning("\n- WARNING, iDRAC version installed does not support this feature using Redfish API")
-        sys.exit(0)
-    elif data["Members"] == []:
-        logging.info("- WARNING, no iDRAC LC logs detected with message ID %s" % args["get_message_id"])
+        logging.error("\n- WARNING, invalid value passed in for argument --get-severity")
         sys.exit(0)
-    else:
-        lc_logs_list.append(data)
-        if args["dump_to_json_file"]:
-            filename = directory_name + "/lclog_entries_1.json"
-            open_file = open(filename,"w")
-            json.dump(data, open_file)
-            open_file.close()
-            file_count = 2
-    if "Members@odata.nextLink" in data.keys():
-        skip_uri = data["Members@odata.nextLink"]
-        number_list = [i for i in range (1,100001) if i % 50 == 0]
-        for seq in number_list:
-            skip_uri = re.sub("skip=.*","skip=%s" % seq, skip_uri)
-            if args["x"]:
-                response = requests.get('https://%s%s' % (idrac_ip, skip_uri), verify=verify_cert, headers={'X-Auth-Token': args["x"]})
-            else:
-                response = requests.get('https://%s%s' % (idrac_ip, skip_uri), verify=verify_cert, auth=(idrac_username, idrac_password))
-            data = response.json()
-            if "Members" not in data.keys():
-                logging.debug("- WARNING, 'Members' key not detected in JSON response, script will exit loop skip query")
-                break
-            elif response.status_code == 500:
-                break
-            elif response.status_code != 200:
-                if "query parameter $skip is out of range" in data["error"]["@Message.ExtendedInfo"][0]["Message"]:
-                    break
-                else:
-                    logging.error("\n- FAIL, GET request failed using skip query parameter, status code %s returned. Detailed error results: \n%s" % (response.status_code,data))    
-                    sys.exit(0)
-            elif "Members" in data.keys():
-                if data["Members"] == []:
-                    break
-            lc_logs_list.append(data)
-            if args["dump_to_json_file"]:
-                filename = directory_name + "/lclog_entries_%s.json" % file_count
-                open_file = open(filename, "w")
-                json.dump(data, open_file)
-                open_file.close()
-                file_count += 1
-    pprint(lc_logs_list)
-    if args["dump_to_json_file"]:
-        logging.info("\n- INFO, JSON dump log files copied to directory %s" % directory_name)    
+    output_lc_log_pages(filter_uri, "no \"%s\" severity entries detected in iDRAC LC logs" % args["get_severity"])
+
+def get_date_range(x):
+    date_range_uri = "%s?$filter=Created ge '%s' and Created le '%s'" % (x, args["start_date"], args["end_date"])
+    output_lc_log_pages(date_range_uri, "no iDRAC LC logs detected within the date range specified")
+
+def get_LC_logs(x):
+    output_lc_log_pages(x, "'Members' collection is empty, no LC logs detected, script will exit")
+
+def get_LC_log_failures(x):
+    def entry_filter(i):
+        return "unable" in i["Message"].lower() or "fail" in i["Message"].lower() or "error" in i["Message"].lower() or "fault" in i["Message"].lower()
+    output_lc_log_entries(x, entry_filter, "no LC log events detected with keywords unable, fail or error in message string")
+
+def get_message_id(x):
+    uri = "%s?$filter=MessageId eq '%s'" % (x, args["get_message_id"])
+    output_lc_log_pages(uri, "no iDRAC LC logs detected with message ID %s" % args["get_message_id"])
 
 def get_category_entries(x):
     if args["get_category"].lower() not in ["audit", "configuration", "updates", "systemhealth", "storage"]:
         logging.info("\n- WARNING, invalid value entered for argument --get-category, see help text for supported values")
         sys.exit(0)
-    if args["dump_to_json_file"]:
-        try:
-            shutil.rmtree("%s_LC_log_JSON_files" % idrac_ip)
-        except:
-            logging.debug("- INFO, directory does not exist, skipping")
-        directory_name = "%s_LC_log_JSON_files" % idrac_ip
-        directory_path = os.mkdir(directory_name)
-    logging.info("\n- INFO, this may take 30 seconds to 1 minute to collect all iDRAC LC logs depending on log file size\n")
-    uri = x
-    if args["x"]:
-        response = requests.get('https://%s/%s' % (idrac_ip, uri), verify=verify_cert, headers={'X-Auth-Token': args["x"]})
+    def entry_filter(i):
+        return i["Oem"]["Dell"]["Category"].lower() == args["get_category"].lower()
+    output_lc_log_entries(x, entry_filter, "no LC log events detected for category %s" % args["get_category"])
+
+def read_sync_state():
+    # State file stores last synced entry Created timestamp and entry Ids with that timestamp per iDRAC and log type, shared by GetIdracLcLogsREDFISH.py and GetIdracSelLogsREDFISH.py
+    if not os.path.exists(args["state_file"]):
+        return {}
+    with open(args["state_file"], "r") as state_file:
+        return json.load(state_file)
+
+def lock_sync_state():
+    # State file is shared by all iDRACs and both log scripts, lock file makes sure concurrent --since-last runs do not overwrite each other's last synced entry
+    lock_file = open("%s.lock" % args["state_file"], "a+")
+    try:
+        import fcntl
+        fcntl.flock(lock_file.fileno(), fcntl.LOCK_EX)
+    except ImportError:
+        import msvcrt
+        while True:
+            try:
+                lock_file.seek(0)
+                msvcrt.locking(lock_file.fileno(), msvcrt.LK_LOCK, 1)
+                break
+            except OSError:
+                continue
+    return lock_file
+
+def save_sync_state(log_name, entries):
+    lock_file = lock_sync_state()
+    try:
+        state = read_sync_state()
+        last_created = entries[-1]["Created"]
+        last_ids = [i["Id"] for i in entries if get_created_datetime(i["Created"]) == get_created_datetime(last_created)]
+        last_sync = state.get(idrac_ip, {}).get(log_name, {})
+        if last_sync and get_created_datetime(last_sync["Created"]) > get_created_datetime(last_created):
+            # Another run already synced newer entries for this iDRAC
+            return
+        if last_sync and get_created_datetime(last_sync["Created"]) == get_created_datetime(last_created):
+            last_ids = last_sync["Ids"] + [i for i in last_ids if i not in last_sync["Ids"]]
+        state.setdefault(idrac_ip, {})[log_name] = {"Created": last_created, "Ids": last_ids, "Last Sync": str(datetime.now())}
+        with tempfile.NamedTemporaryFile("w", dir=os.path.dirname(os.path.abspath(args["state_file"])), prefix=".%s." % os.path.basename(args["state_file"]), suffix=".tmp", delete=False) as state_file:
+            json.dump(state, state_file, indent=4)
+        os.replace(state_file.name, args["state_file"])
+    finally:
+        lock_file.close()
+
+def get_created_datetime(created):
+    return datetime.strptime(created, "%Y-%m-%dT%H:%M:%S%z")
+
+def is_new_entry(entry, last_sync):
+    if not last_sync:
+        return True
+    entry_created = get_created_datetime(entry["Created"])
+    last_created = get_created_datetime(last_sync["Created"])
+    return entry_created > last_created or (entry_created == last_created and entry["Id"] not in last_sync["Ids"])
+
+def append_ndjson_file(filename, entries):
+    with open(filename, "a") as ndjson_file:
+        for i in entries:
+            ndjson_file.write("%s\n" % json.dumps(i))
+
+def get_since_last(x):
+    last_sync = read_sync_state().get(idrac_ip, {}).get("Lclog", {})
+    if last_sync:
+        logging.info("\n- INFO, getting LC log entries created since %s" % last_sync["Created"])
+        uri = "%s?$filter=Created ge '%s'" % (x, last_sync["Created"].replace("+", "%2B"))
     else:
-        response = requests.get('https://%s/%s' % (idrac_ip, uri), verify=verify_cert, auth=(idrac_username, idrac_password))
-    data = response.json()
-    lc_logs_list = []
-    if "Members" not in data.keys():
-        logging.warning("- WARNING, 'Members' key not detected in JSON response, unable to get LC logs. Manually check iDRAC interfaces to confirm you can view LC logs")
+        logging.info("\n- INFO, no previous sync detected for iDRAC %s in state file %s, getting complete LC logs" % (idrac_ip, args["state_file"]))
+        uri = x
+    # LC log returns newest entries first, only the new entries are held in memory to append them oldest first
+    new_entries = [i for i in get_lc_log_entries(uri) if is_new_entry(i, last_sync)]
+    if args["ndjson_file"]:
+        ndjson_filename = args["ndjson_file"]
+    else:
+        ndjson_filename = "%s_LC_logs.ndjson" % idrac_ip
+    if new_entries == []:
+        logging.info("- INFO, no new LC log entries detected since last sync")
         sys.exit(0)
-    for i in data['Members']:
-        if i["Oem"]["Dell"]["Category"].lower() == args["get_category"].lower():
-            lc_logs_list.append(i)
-    if "Members@odata.nextLink" in data.keys():
-        skip_uri = data["Members@odata.nextLink"]
-        number_list = [i for i in range (1,100001) if i % 50 == 0]
-        for seq in number_list:
-            skip_uri = re.sub("skip=.*","skip=%s" % seq, skip_uri)
-            if args["x"]:
-                response = requests.get('https://%s%s' % (idrac_ip, skip_uri), verify=verify_cert, headers={'X-Auth-Token': args["x"]})
-            else:
-                response = requests.get('https://%s%s' % (idrac_ip, skip_uri), verify=verify_cert, auth=(idrac_username, idrac_password))
-            data = response.json()
-            if "Members" not in data.keys():
-                logging.warning("- WARNING, 'Members' key not detected in JSON response, script will exit loop skip query")
-                break
-            elif response.status_code == 500:
+    new_entries.sort(key=lambda x: get_created_datetime(x["Created"]))
+    append_ndjson_file(ndjson_filename, new_entries)
+    if args["db_file"]:
+        insert_log_database("Lclog", new_entries)
+    save_sync_state("Lclog", new_entries)
+    logging.info("- PASS, %s new LC log entries appended to file %s" % (len(new_entries), ndjson_filename))
+
+def create_log_database(db_file):
+    # Same database schema is used by GetIdracLcLogsREDFISH.py, GetIdracSelLogsREDFISH.py and QueryIdracLogsDatabaseREDFISH.py
+    connection = sqlite3.connect(db_file)
+    connection.execute("CREATE TABLE IF NOT EXISTS log_entries (idrac_ip TEXT, log_name TEXT, id TEXT, created TEXT, created_utc TEXT, message_id TEXT, message_key TEXT, severity TEXT, category TEXT, message TEXT, entry TEXT, PRIMARY KEY (idrac_ip, log_name, id, created))")
+    connection.execute("CREATE INDEX IF NOT EXISTS log_entries_created_utc ON log_entries (created_utc)")
+    connection.execute("CREATE INDEX IF NOT EXISTS log_entries_message_id ON log_entries (message_id COLLATE NOCASE)")
+    connection.execute("CREATE INDEX IF NOT EXISTS log_entries_message_key ON log_entries (message_key COLLATE NOCASE)")
+    connection.execute("CREATE INDEX IF NOT EXISTS log_entries_severity ON log_entries (severity, created_utc)")
+    connection.execute("CREATE INDEX IF NOT EXISTS log_entries_category ON log_entries (category, created_utc)")
+    connection.execute("CREATE INDEX IF NOT EXISTS log_entries_idrac_created_utc ON log_entries (idrac_ip, log_name, created_utc)")
+    return connection
+
+def get_log_database_row(log_name, entry):
+    try:
+        category = entry["Oem"]["Dell"]["Category"]
+    except:
+        category = ""
+    message_id = entry.get("MessageId") or ""
+    created_utc = get_created_datetime(entry["Created"]).astimezone(timezone.utc).strftime("%Y-%m-%dT%H:%M:%S")
+    return (idrac_ip, log_name, entry["Id"], entry["Created"], created_utc, message_id, message_id.split(".")[-1], entry.get("Severity") or "", category, entry.get("Message") or "", json.dumps(entry))
+
+def insert_log_database(log_name, entries):
+    # Entries are inserted in batches as they are received, entries already in the database are skipped. Returns number of entries added
+    connection = create_log_database(args["db_file"])
+    entries = iter(entries)
+    start_total_changes = connection.total_changes
+    with connection:
+        while True:
+            batch = [get_log_database_row(log_name, i) for i in itertools.islice(entries, 500)]
+            if batch == []:
                 break
-            elif response.status_code != 200:
-                if "query parameter $skip is out of range" in data["error"]["@Message.ExtendedInfo"][0]["Message"]:
-                    break
-                else:
-                    logging.error("\n- FAIL, GET request failed using skip query parameter, status code %s returned. Detailed error results: \n%s" % (response.status_code,data))    
-                    sys.exit(0)
-            elif "Members" in data.keys():
-                if data["Members"] == []:
-                    break
-            for i in data['Members']:
-                if i["Oem"]["Dell"]["Category"].lower() == args["get_category"].lower():
-                    lc_logs_list.append(i)
-    if lc_logs_list == []:
-        logging.warning("\n- WARNING, no LC log events detected for category %s" % args["get_category"])
-        sys.exit(0)
-    pprint(lc_logs_list)
-    if args["dump_to_json_file"]:
-        filename = directory_name + "/lclog_entries_1.json"
-        open_file = open(filename,"w")
-        json.dump(lc_logs_list, open_file)
-        open_file.close()
-        logging.info("\n- INFO, JSON dump log files copied to directory %s" % directory_name)
-        
+            connection.executemany("INSERT OR IGNORE INTO log_entries VALUES (?,?,?,?,?,?,?,?,?,?,?)", batch)
+    entries_added = connection.total_changes - start_total_changes
+    connection.close()
+    return entries_added
+
+def ingest_LC_logs(x):
+    logging.info("\n- INFO, this may take 30 seconds to 1 minute to collect all iDRAC LC logs depending on log file size")
+    entries_added = insert_log_database("Lclog", get_lc_log_entries(x))
+    logging.info("- PASS, %s new LC log entries added to database file %s" % (entries_added, args["db_file"]))
+
 
 if __name__ == "__main__":
     if args["script_examples"]:
@@ -597,6 +454,8 @@ if __name__ == "__main__":
                 verify_cert = False
         else:
             verify_cert = False
+        http_session = requests.Session()
+        http_session.mount("https://", requests.adapters.HTTPAdapter(pool_maxsize=args["max_workers"]))
         get_server_generation()
         if "12G" in server_generation or "13G" in server_generation:
             uri_string = "redfish/v1/Managers/iDRAC.Embedded.1/Logs/Lclog"
@@ -609,7 +468,11 @@ if __name__ == "__main__":
     else:
         logging.error("\n- FAIL, invalid argument values or not all required parameters passed in. See help text or argument --script-examples for more details.")
         sys.exit(0)
-    if args["get_fail"]:
+    if args["since_last"]:
+        get_since_last(uri_string)
+    elif args["db_file"]:
+        ingest_LC_logs(uri_string)
+    elif args["get_fail"]:
         get_LC_log_failures(uri_string)
     elif args["get_date_range"] and args["start_date"] and args["end_date"]:
         get_date_range(uri_string)    
@@ -7,7 +7,7 @@
 # NOTE: Possible supported values for attribute_group parameter are: idrac, lc and system.
 #
 # _author_ = Texas Roemer <Texas_Roemer@Dell.com>
-# _version_ = 11.0
+# _version_ = 12.0
 #
 # Copyright (c) 2017, Dell, Inc.
 #
@@ -46,6 +46,7 @@ parser.add_argument('--group-name', help='Get attributes pass in the group name.
 parser.add_argument('--attribute-name', help='Get specific attribute value, pass in the attribute name. Make sure to also pass in --group-name argument.', dest="attribute_name", required=False)
 parser.add_argument('--get-registry', help='Get the attribute registry for all iDRAC, System and LC attributes. This option is helpful for viewing attributes to see if they are read only or read write, supported possible values.', dest="get_registry", action="store_true", required=False)
 parser.add_argument('--registry-attribute', help='Get attribute registry information for a specific attribute, pass in the attribute name', dest="registry_attribute", required=False)
+parser.add_argument('--registry-cache-dir', help='Pass in directory to cache the attribute registry. Registry is the same for all servers with the same model and iDRAC version, registry is only downloaded once per model and iDRAC version and reused from the cache directory on next script run. Same cache directory can be used for multiple iDRACs.', dest="registry_cache_dir", required=False)
 
 args = vars(parser.parse_args())
 logging.basicConfig(format='%(message)s', stream=sys.stdout, level=logging.INFO)
@@ -54,7 +55,8 @@ def script_examples():
     print("""\n- GetIdracLcSystemAttributesREDFISH.py -ip 192.168.0.120 -u root -p calvin --group-name idrac, this example wil get all iDRAC attributes and echo them to the screen along with copy output to a file.
     \n- GetIdracLcSystemAttributesREDFISH.py -ip 192.168.0.120 -u root -p calvin --group-name idrac --attribute-name LDAPRoleGroup.1.Privilege, this example will only return current value for attribute LDAPRoleGroup.1.Privilege.
     \n- GetIdracLcSystemAttributesREDFISH.py -ip 192.168.0.120 -u root -p calvin --get-registry, this example will return the attribute registry for iDRAC, LC and System attributes.
-    \n- GetIdracLcSystemAttributesREDFISH.py -ip 192.168.0.120 -x b21af7b065989c576f4011ac554b2b61 --registry-attribute SNMPAlert.7.State, this example using iDRAC x-auth token session will return registry information for only attribute SNMPAlert.7.State.""")
+    \n- GetIdracLcSystemAttributesREDFISH.py -ip 192.168.0.120 -x b21af7b065989c576f4011ac554b2b61 --registry-attribute SNMPAlert.7.State, this example using iDRAC x-auth token session will return registry information for only attribute SNMPAlert.7.State.
+    \n- GetIdracLcSystemAttributesREDFISH.py -ip 192.168.0.120 -u root -p calvin --registry-attribute SNMPAlert.7.State --registry-cache-dir registry_cache, this example will return registry information for attribute SNMPAlert.7.State from the cache directory, registry is only downloaded if not already cached for this server model and iDRAC version.""")
     sys.exit(0)
 
 def check_supported_idrac_version():
@@ -70,18 +72,49 @@ def check_supported_idrac_version():
         logging.warning("\n- WARNING, iDRAC version installed does not support this feature using Redfish API")
         sys.exit(0)
 
+def get_uri(uri):
+    if args["x"]:
+        response = requests.get('https://%s%s' % (idrac_ip, uri), verify=verify_cert, headers={'X-Auth-Token': args["x"]})
+    else:
+        response = requests.get('https://%s%s' % (idrac_ip, uri), verify=verify_cert, auth=(idrac_username, idrac_password))
+    data = response.json()
+    if response.status_code != 200:
+        logging.error("\n- FAIL, GET command failed for URI %s, status code %s returned" % (uri, response.status_code))
+        logging.error(data)
+        sys.exit(0)
+    return data
+
+def get_registry():
+    # Attribute registry is the same for all servers with the same model and iDRAC version. If argument --registry-cache-dir is passed in, registry is only downloaded once per model and iDRAC version and saved in the cache directory for next script run or other iDRACs. Registry is returned indexed by attribute name.
+    registry_entries = None
+    if args["registry_cache_dir"]:
+        model = get_uri("/redfish/v1/Systems/System.Embedded.1").get("Model", "")
+        firmware_version = get_uri("/redfish/v1/Managers/iDRAC.Embedded.1").get("FirmwareVersion", "")
+        cache_filename = os.path.join(args["registry_cache_dir"], "%s.json" % re.sub(r"[^\w.-]", "_", "idrac_%s_%s" % (model, firmware_version)))
+        if os.path.exists(cache_filename):
+            with open(cache_filename, "r") as cache_file:
+                registry_entries = json.load(cache_file)
+            logging.info("- INFO, using cached attribute registry \"%s\"" % cache_filename)
+    if not registry_entries:
+        registry_entries = get_uri("/redfish/v1/Registries/ManagerAttributeRegistry/ManagerAttributeRegistry.v1_0_0.json")['RegistryEntries']
+        if args["registry_cache_dir"]:
+            if not os.path.isdir(args["registry_cache_dir"]):
+                os.makedirs(args["registry_cache_dir"])
+            with open(cache_filename, "w") as cache_file:
+                json.dump(registry_entries, cache_file)
+    registry = {"Attributes": {}, "Dependencies": registry_entries.get("Dependencies", [])}
+    for i in registry_entries['Attributes']:
+        registry["Attributes"][i["AttributeName"]] = i
+    return registry
+
 def get_attribute_registry():
     try:
         os.remove("idrac_attribute_registry.txt")
     except:
         logging.info("- INFO, unable to locate file %s, skipping step" % "idrac_attribute_registry.txt")
     open_file = open("idrac_attribute_registry.txt","w")
-    if args["x"]:
-        response = requests.get('https://%s/redfish/v1/Registries/ManagerAttributeRegistry/ManagerAttributeRegistry.v1_0_0.json' % idrac_ip, verify=verify_cert, headers={'X-Auth-Token': args["x"]})
-    else:
-        response = requests.get('https://%s/redfish/v1/Registries/ManagerAttributeRegistry/ManagerAttributeRegistry.v1_0_0.json' % idrac_ip, verify=verify_cert, auth=(idrac_username, idrac_password))
-    data = response.json()
-    for i in data['RegistryEntries']['Attributes']:
+    registry = get_registry()
+    for i in registry['Attributes'].values():
         for ii in i.items():
             message = "%s: %s" % (ii[0], ii[1])
             open_file.writelines(message)
@@ -96,17 +129,12 @@ def get_attribute_registry():
 
 def attribute_registry_get_specific_attribute():
     logging.info("\n- INFO, searching attribute registry for attribute \"%s\"" % args["registry_attribute"])
-    if args["x"]:
-        response = requests.get('https://%s/redfish/v1/Registries/ManagerAttributeRegistry/ManagerAttributeRegistry.v1_0_0.json' % idrac_ip, verify=verify_cert, headers={'X-Auth-Token': args["x"]})
-    else:
-        response = requests.get('https://%s/redfish/v1/Registries/ManagerAttributeRegistry/ManagerAttributeRegistry.v1_0_0.json' % idrac_ip, verify=verify_cert, auth=(idrac_username, idrac_password))
-    data = response.json()
-    for i in data['RegistryEntries']['Attributes']:
-        if args["registry_attribute"] in i.values():
-            logging.info("\n- Attribute Registry information for attribute \"%s\" -\n" % args["registry_attribute"])
-            for ii in i.items():
-                print("%s: %s" % (ii[0],ii[1]))
-            sys.exit(0)
+    registry = get_registry()
+    if args["registry_attribute"] in registry['Attributes']:
+        logging.info("\n- Attribute Registry information for attribute \"%s\" -\n" % args["registry_attribute"])
+        for i in registry['Attributes'][args["registry_attribute"]].items():
+            print("%s: %s" % (i[0],i[1]))
+        sys.exit(0)
     logging.error("\n- FAIL, unable to locate attribute \"%s\" in the registry. Make sure you typed the attribute name correct since its case sensitive" % args["registry_attribute"])
         
 def get_attribute_group():
@@ -3,7 +3,7 @@
 # GetIdracMessageRegistryREDFISH. Python script using Redfish API with OEM extension to get iDRAC message registry.
 #
 # _author_ = Texas Roemer <Texas_Roemer@Dell.com>
-# _version_ = 5.0
+# _version_ = 6.0
 #
 # Copyright (c) 2020, Dell, Inc.
 #
@@ -43,13 +43,18 @@ parser.add_argument('--ssl', help='SSL cert verification for all Redfish calls,
 parser.add_argument('--script-examples', help='Get executing script examples', action="store_true", dest="script_examples", required=False) 
 parser.add_argument('--get', help='Get message registry details', action="store_true", required=False)
 parser.add_argument('--message-id', help='Get information for only a specific message id, pass in the message ID string', dest="message_id", required=False)
+parser.add_argument('--message-id-prefix', help='Get information for all message IDs starting with this value, example: PDR3', dest="message_id_prefix", required=False)
+parser.add_argument('--search', help='Get information for all message IDs where message or resolution string contains all words passed in (case insensitive). Can be combined with --message-id-prefix.', required=False)
+parser.add_argument('--registry-cache-dir', help='Pass in directory to cache message registry. Registry is only downloaded once per iDRAC version and reused from the cache directory on next script run. Same cache directory can be used for multiple iDRACs.', dest="registry_cache_dir", required=False)
 
 args = vars(parser.parse_args())
 logging.basicConfig(format='%(message)s', stream=sys.stdout, level=logging.INFO)
 
 def script_examples():
     print("""\n- GetIdracMessageRegistryREDFISH.py -ip 192.168.0.120 -u root -p calvin --get, this example will get the complete message registry, print to the screen and also capture in a text file.
-    \n- GetIdracMessageRegistryREDFISH.py -ip 192.168.0.120 -u root -p calvin --message-id SYS409, this example will return information for only message ID SYS409.""")
+    \n- GetIdracMessageRegistryREDFISH.py -ip 192.168.0.120 -u root -p calvin --message-id SYS409, this example will return information for only message ID SYS409.
+    \n- GetIdracMessageRegistryREDFISH.py -ip 192.168.0.120 -u root -p calvin --message-id-prefix PDR3 --registry-cache-dir registry_cache, this example will return information for all message IDs starting with PDR3 using message registry from the cache directory, registry is only downloaded if not already cached for this iDRAC version.
+    \n- GetIdracMessageRegistryREDFISH.py -ip 192.168.0.120 -u root -p calvin --search "disk failed", this example will return all message IDs with message or resolution string containing words disk and failed.""")
     sys.exit(0)
 
 def get_server_generation():
@@ -72,18 +77,41 @@ def get_server_generation():
         sys.exit(0)
 
 
-def check_supported_idrac_version(x):
-    if args["x"]:
-        response = requests.get('https://%s/redfish/v1/Registries/Messages/%s' % (idrac_ip, x), verify=verify_cert, headers={'X-Auth-Token': args["x"]})
-    else:
-        response = requests.get('https://%s/redfish/v1/Registries/Messages/%s' % (idrac_ip, x), verify=verify_cert, auth=(idrac_username, idrac_password))
-    data = response.json()
-    if response.status_code == 401:
-        logging.warning("\n- WARNING, status code %s returned. Incorrect iDRAC username/password or invalid privilege detected." % response.status_code)
-        sys.exit(0)
-    elif response.status_code != 200:
-        logging.warning("\n- WARNING, iDRAC version installed does not support this feature using Redfish API")
-        sys.exit(0)
+def get_registry(x):
+    # Message registry is the same for all iDRACs with the same iDRAC version. If argument --registry-cache-dir is passed in, registry is only downloaded once per iDRAC version and saved in the cache directory for next script run or other iDRACs.
+    global messages
+    messages = None
+    if args["registry_cache_dir"]:
+        if args["x"]:
+            response = requests.get('https://%s/redfish/v1/Managers/iDRAC.Embedded.1?$select=FirmwareVersion' % idrac_ip, verify=verify_cert, headers={'X-Auth-Token': args["x"]})
+        else:
+            response = requests.get('https://%s/redfish/v1/Managers/iDRAC.Embedded.1?$select=FirmwareVersion' % idrac_ip, verify=verify_cert, auth=(idrac_username, idrac_password))
+        if response.status_code != 200:
+            logging.warning("\n- WARNING, unable to get iDRAC version, status code %s returned" % response.status_code)
+            sys.exit(0)
+        cache_filename = os.path.join(args["registry_cache_dir"], "%s.json" % re.sub(r"[^\w.-]", "_", "%s_%s" % (x, response.json().get("FirmwareVersion", ""))))
+        if os.path.exists(cache_filename):
+            with open(cache_filename, "r") as cache_file:
+                messages = json.load(cache_file)
+            logging.info("- INFO, using cached message registry \"%s\"" % cache_filename)
+    if messages is None:
+        if args["x"]:
+            response = requests.get('https://%s/redfish/v1/Registries/Messages/%s' % (idrac_ip, x), verify=verify_cert, headers={'X-Auth-Token': args["x"]})
+        else:
+            response = requests.get('https://%s/redfish/v1/Registries/Messages/%s' % (idrac_ip, x), verify=verify_cert, auth=(idrac_username, idrac_password))
+        data = response.json()
+        if response.status_code == 401:
+            logging.warning("\n- WARNING, status code %s returned. Incorrect iDRAC username/password or invalid privilege detected." % response.status_code)
+            sys.exit(0)
+        elif response.status_code != 200:
+            logging.warning("\n- WARNING, iDRAC version installed does not support this feature using Redfish API")
+            sys.exit(0)
+        messages = data['Messages']
+        if args["registry_cache_dir"]:
+            if not os.path.isdir(args["registry_cache_dir"]):
+                os.makedirs(args["registry_cache_dir"])
+            with open(cache_filename, "w") as cache_file:
+                json.dump(messages, cache_file)
 
 def get_message_registry(x):
     try:
@@ -91,12 +119,7 @@ def get_message_registry(x):
     except:
         logging.info("- INFO, unable to locate file %s, skipping step" % "message_registry.txt")
     open_file = open("message_registry.txt","w")
-    if args["x"]:
-        response = requests.get('https://%s/redfish/v1/Registries/Messages/%s' % (idrac_ip, x), verify=verify_cert, headers={'X-Auth-Token': args["x"]})
-    else:
-        response = requests.get('https://%s/redfish/v1/Registries/Messages/%s' % (idrac_ip, x), verify=verify_cert, auth=(idrac_username, idrac_password))
-    data = response.json()
-    for i in data['Messages'].items():
+    for i in messages.items():
         pprint(i), print("\n")
         message = "Message ID: %s" % i[0]
         open_file.writelines("\n%s"% message)
@@ -109,20 +132,38 @@ def get_message_registry(x):
     logging.info("\n- INFO, output also captured in \"message_registry.txt\" file")
 
 def get_specific_message_id(x):
-    if args["x"]:
-        response = requests.get('https://%s/redfish/v1/Registries/Messages/%s' % (idrac_ip, x), verify=verify_cert, headers={'X-Auth-Token': args["x"]})
-    else:
-        response = requests.get('https://%s/redfish/v1/Registries/Messages/%s' % (idrac_ip, x), verify=verify_cert, auth=(idrac_username, idrac_password))
-    data = response.json()
-    for i in data['Messages'].items():
-        if i[0].lower() == args["message_id"].lower():
-            logging.info("\nMessage ID: %s" % i[0])
-            for ii in i[1].items():
-                print("%s: %s" % (ii[0], ii[1]))
-            print("\n")
-            sys.exit(0)
+    # Message ID can include the registry prefix, example: IDRAC.2.9.SYS409
+    message_id = args["message_id"].split(".")[-1]
+    if message_id not in messages:
+        message_id = {i.lower(): i for i in messages}.get(message_id.lower())
+    if message_id:
+        logging.info("\nMessage ID: %s" % message_id)
+        for i in messages[message_id].items():
+            print("%s: %s" % (i[0], i[1]))
+        print("\n")
+        sys.exit(0)
     logging.error("\n - FAIL, either invalid message ID was passed in or message ID does not exist on this iDRAC version")
 
+def find_message_ids(x):
+    search_words = re.findall(r"\w+", (args["search"] or "").lower())
+    message_id_prefix = (args["message_id_prefix"] or "").split(".")[-1].upper()
+    found_count = 0
+    for i in messages.items():
+        if not i[0].upper().startswith(message_id_prefix):
+            continue
+        # Each search word also matches words starting with it, example: "fail" matches "failed"
+        message_words = re.findall(r"\w+", ("%s %s" % (i[1].get("Message", ""), i[1].get("Resolution", ""))).lower())
+        if not all(any(ii.startswith(iii) for ii in message_words) for iii in search_words):
+            continue
+        logging.info("\nMessage ID: %s" % i[0])
+        for ii in i[1].items():
+            print("%s: %s" % (ii[0], ii[1]))
+        found_count += 1
+    if found_count == 0:
+        logging.error("\n - FAIL, no message IDs found matching message ID prefix or search string")
+    else:
+        logging.info("\n- INFO, %s message ID(s) found" % found_count)
+
     
 if __name__ == "__main__":
     if args["script_examples"]:
@@ -151,7 +192,7 @@ if __name__ == "__main__":
         else:
             registry_name = "iDRACMessageRegistry"
             
-        check_supported_idrac_version(registry_name)
+        get_registry(registry_name)
     else:
         logging.error("\n- FAIL, invalid argument values or not all required parameters passed in. See help text or argument --script-examples for more details.")
         sys.exit(0)
@@ -159,5 +200,7 @@ if __name__ == "__main__":
         get_message_registry(registry_name)
     elif args["message_id"]:
         get_specific_message_id(registry_name)
+    elif args["message_id_prefix"] or args["search"]:
+        find_message_ids(registry_name)
     else:
         logging.error("\n- FAIL, invalid argument values or not all required parameters passed in. See help text or argument --script-examples for more details.")
@@ -3,7 +3,7 @@
 # GetIdracSelLogsREDFISH. Python script using Redfish API to get iDRAC System Event Logs (SEL) logs.
 #
 # _author_ = Texas Roemer <Texas_Roemer@Dell.com>
-# _version_ = 4.0
+# _version_ = 6.1
 #
 # Copyright (c) 2020, Dell, Inc.
 #
@@ -19,15 +19,18 @@ import argparse
 import getpass
 import json
 import logging
+import itertools
 import os
 import re
 import requests
+import sqlite3
 import sys
+import tempfile
 import time
 import warnings
 
 from pprint import pprint
-from datetime import datetime
+from datetime import datetime, timezone
 
 warnings.filterwarnings("ignore")
 
@@ -40,11 +43,17 @@ parser.add_argument('--ssl', help='SSL cert verification for all Redfish calls,
 parser.add_argument('--script-examples', help='Get executing script examples', action="store_true", dest="script_examples", required=False)
 parser.add_argument('--get', help='Get current iDRAC SEL log', action="store_true", required=False)
 parser.add_argument('--clear', help='Clear iDRAC SEL log', action="store_true", required=False)
+parser.add_argument('--since-last', help='Get only SEL entries created since the last --since-last run for this iDRAC and append them to NDJSON file (one JSON entry per line). Created timestamp of the last entry synced per iDRAC is stored in state file, see argument --state-file. First run for an iDRAC gets complete SEL.', action="store_true", dest="since_last", required=False)
+parser.add_argument('--state-file', help='Pass in state file name used with argument --since-last, default value is idrac_log_sync_state.json (same state file can be used for LC logs script GetIdracLcLogsREDFISH.py). Lock file <state file>.lock is also created to allow multiple --since-last runs at the same time.', dest="state_file", default="idrac_log_sync_state.json", required=False)
+parser.add_argument('--ndjson-file', help='Pass in NDJSON file name to append new SEL entries to with argument --since-last, default value is <iDRAC IP>_SEL_logs.ndjson', dest="ndjson_file", required=False)
+parser.add_argument('--db-file', help='Pass in SQLite database file name to store SEL entries in a local indexed database, entries already in the database are skipped. Use with argument --since-last to only add new entries. Database can be queried for one or multiple iDRACs using script QueryIdracLogsDatabaseREDFISH.py without accessing the iDRAC.', dest="db_file", required=False)
 args = vars(parser.parse_args())
 logging.basicConfig(format='%(message)s', stream=sys.stdout, level=logging.INFO)
 
 def script_examples():
     print("""\n- GetIdracSelLogsREDFISH.py -ip 192.168.0.120 -u root -p calvin --get, this example will get the complete iDRAC system event log.
+    \n- GetIdracSelLogsREDFISH.py -ip 192.168.0.120 -u root -p calvin --since-last, this example will append only SEL entries created since the last run for this iDRAC to file 192.168.0.120_SEL_logs.ndjson.
+    \n- GetIdracSelLogsREDFISH.py -ip 192.168.0.120 -u root -p calvin --db-file idrac_logs.db, this example will add complete SEL to SQLite database file idrac_logs.db, run QueryIdracLogsDatabaseREDFISH.py to query the database.
     \n- GetIdracSelLogsREDFISH.py -ip 192.168.0.120 -u root -p calvin --clear, this example will clear iDRAC system event log.""")
     sys.exit(0)
 
@@ -128,6 +137,171 @@ def get_SEL_logs():
     open_file.close()
     sys.exit(0)
 
+def read_sync_state():
+    # State file stores last synced entry Created timestamp and entry Ids with that timestamp per iDRAC and log type, shared by GetIdracLcLogsREDFISH.py and GetIdracSelLogsREDFISH.py
+    if not os.path.exists(args["state_file"]):
+        return {}
+    with open(args["state_file"], "r") as state_file:
+        return json.load(state_file)
+
+def lock_sync_state():
+    # State file is shared by all iDRACs and both log scripts, lock file makes sure concurrent --since-last runs do not overwrite each other's last synced entry
+    lock_file = open("%s.lock" % args["state_file"], "a+")
+    try:
+        import fcntl
+        fcntl.flock(lock_file.fileno(), fcntl.LOCK_EX)
+    except ImportError:
+        import msvcrt
+        while True:
+            try:
+                lock_file.seek(0)
+                msvcrt.locking(lock_file.fileno(), msvcrt.LK_LOCK, 1)
+                break
+            except OSError:
+                continue
+    return lock_file
+
+def save_sync_state(log_name, entries):
+    lock_file = lock_sync_state()
+    try:
+        state = read_sync_state()
+        last_created = entries[-1]["Created"]
+        last_ids = [i["Id"] for i in entries if get_created_datetime(i["Created"]) == get_created_datetime(last_created)]
+        last_sync = state.get(idrac_ip, {}).get(log_name, {})
+        if last_sync and get_created_datetime(last_sync["Created"]) > get_created_datetime(last_created):
+            # Another run already synced newer entries for this iDRAC
+            return
+        if last_sync and get_created_datetime(last_sync["Created"]) == get_created_datetime(last_created):
+            last_ids = last_sync["Ids"] + [i for i in last_ids if i not in last_sync["Ids"]]
+        state.setdefault(idrac_ip, {})[log_name] = {"Created": last_created, "Ids": last_ids, "Last Sync": str(datetime.now())}
+        with tempfile.NamedTemporaryFile("w", dir=os.path.dirname(os.path.abspath(args["state_file"])), prefix=".%s." % os.path.basename(args["state_file"]), suffix=".tmp", delete=False) as state_file:
+            json.dump(state, state_file, indent=4)
+        os.replace(state_file.name, args["state_file"])
+    finally:
+        lock_file.close()
+
+def get_created_datetime(created):
+    return datetime.strptime(created, "%Y-%m-%dT%H:%M:%S%z")
+
+def is_new_entry(entry, last_sync):
+    if not last_sync:
+        return True
+    entry_created = get_created_datetime(entry["Created"])
+    last_created = get_created_datetime(last_sync["Created"])
+    return entry_created > last_created or (entry_created == last_created and entry["Id"] not in last_sync["Ids"])
+
+def append_ndjson_file(filename, entries):
+    with open(filename, "a") as ndjson_file:
+        for i in entries:
+            ndjson_file.write("%s\n" % json.dumps(i))
+
+def get_SEL_since_last():
+    last_sync = read_sync_state().get(idrac_ip, {}).get("Sel", {})
+    if last_sync:
+        logging.info("\n- INFO, getting iDRAC SEL entries created since %s" % last_sync["Created"])
+    else:
+        logging.info("\n- INFO, no previous sync detected for iDRAC %s in state file %s, getting complete SEL" % (idrac_ip, args["state_file"]))
+    if iDRAC_version == "old":
+        uri = "/redfish/v1/Managers/iDRAC.Embedded.1/Logs/Sel"
+    elif iDRAC_version == "new":
+        uri = "/redfish/v1/Managers/iDRAC.Embedded.1/LogServices/Sel/Entries"
+    new_entries = []
+    while uri:
+        if args["x"]:
+            response = requests.get('https://%s%s' % (idrac_ip, uri), verify=verify_cert, headers={'X-Auth-Token': args["x"]})
+        else:
+            response = requests.get('https://%s%s' % (idrac_ip, uri), verify=verify_cert, auth=(idrac_username, idrac_password))
+        if response.status_code != 200:
+            logging.error("\n- ERROR, GET command failed to get iDRAC SEL entries, status code %s returned" % response.status_code)
+            sys.exit(0)
+        data = response.json()
+        if "Members" not in data or data["Members"] == []:
+            break
+        page_new_entries = [i for i in data["Members"] if is_new_entry(i, last_sync)]
+        new_entries.extend(page_new_entries)
+        # SEL entries are returned newest first, once a page has entries already synced there are no newer entries on the next pages
+        newest_first = get_created_datetime(data["Members"][0]["Created"]) >= get_created_datetime(data["Members"][-1]["Created"])
+        if newest_first and len(page_new_entries) < len(data["Members"]):
+            break
+        uri = data.get("Members@odata.nextLink", "")
+    if args["ndjson_file"]:
+        ndjson_filename = args["ndjson_file"]
+    else:
+        ndjson_filename = "%s_SEL_logs.ndjson" % idrac_ip
+    if new_entries == []:
+        logging.info("- INFO, no new SEL entries detected since last sync")
+        sys.exit(0)
+    new_entries.sort(key=lambda x: get_created_datetime(x["Created"]))
+    append_ndjson_file(ndjson_filename, new_entries)
+    if args["db_file"]:
+        insert_log_database("Sel", new_entries)
+    save_sync_state("Sel", new_entries)
+    logging.info("- PASS, %s new SEL entries appended to file %s" % (len(new_entries), ndjson_filename))
+    sys.exit(0)
+
+def create_log_database(db_file):
+    # Same database schema is used by GetIdracLcLogsREDFISH.py, GetIdracSelLogsREDFISH.py and QueryIdracLogsDatabaseREDFISH.py
+    connection = sqlite3.connect(db_file)
+    connection.execute("CREATE TABLE IF NOT EXISTS log_entries (idrac_ip TEXT, log_name TEXT, id TEXT, created TEXT, created_utc TEXT, message_id TEXT, message_key TEXT, severity TEXT, category TEXT, message TEXT, entry TEXT, PRIMARY KEY (idrac_ip, log_name, id, created))")
+    connection.execute("CREATE INDEX IF NOT EXISTS log_entries_created_utc ON log_entries (created_utc)")
+    connection.execute("CREATE INDEX IF NOT EXISTS log_entries_message_id ON log_entries (message_id COLLATE NOCASE)")
+    connection.execute("CREATE INDEX IF NOT EXISTS log_entries_message_key ON log_entries (message_key COLLATE NOCASE)")
+    connection.execute("CREATE INDEX IF NOT EXISTS log_entries_severity ON log_entries (severity, created_utc)")
+    connection.execute("CREATE INDEX IF NOT EXISTS log_entries_category ON log_entries (category, created_utc)")
+    connection.execute("CREATE INDEX IF NOT EXISTS log_entries_idrac_created_utc ON log_entries (idrac_ip, log_name, created_utc)")
+    return connection
+
+def get_log_database_row(log_name, entry):
+    try:
+        category = entry["Oem"]["Dell"]["Category"]
+    except:
+        category = ""
+    message_id = entry.get("MessageId") or ""
+    created_utc = get_created_datetime(entry["Created"]).astimezone(timezone.utc).strftime("%Y-%m-%dT%H:%M:%S")
+    return (idrac_ip, log_name, entry["Id"], entry["Created"], created_utc, message_id, message_id.split(".")[-1], entry.get("Severity") or "", category, entry.get("Message") or "", json.dumps(entry))
+
+def insert_log_database(log_name, entries):
+    # Entries are inserted in batches as they are received, entries already in the database are skipped. Returns number of entries added
+    connection = create_log_database(args["db_file"])
+    entries = iter(entries)
+    start_total_changes = connection.total_changes
+    with connection:
+        while True:
+            batch = [get_log_database_row(log_name, i) for i in itertools.islice(entries, 500)]
+            if batch == []:
+                break
+            connection.executemany("INSERT OR IGNORE INTO log_entries VALUES (?,?,?,?,?,?,?,?,?,?,?)", batch)
+    entries_added = connection.total_changes - start_total_changes
+    connection.close()
+    return entries_added
+
+def get_SEL_entries():
+    # Generator returning all SEL entries, following Members@odata.nextLink
+    if iDRAC_version == "old":
+        uri = "/redfish/v1/Managers/iDRAC.Embedded.1/Logs/Sel"
+    elif iDRAC_version == "new":
+        uri = "/redfish/v1/Managers/iDRAC.Embedded.1/LogServices/Sel/Entries"
+    while uri:
+        if args["x"]:
+            response = requests.get('https://%s%s' % (idrac_ip, uri), verify=verify_cert, headers={'X-Auth-Token': args["x"]})
+        else:
+            response = requests.get('https://%s%s' % (idrac_ip, uri), verify=verify_cert, auth=(idrac_username, idrac_password))
+        if response.status_code != 200:
+            logging.error("\n- ERROR, GET command failed to get iDRAC SEL entries, status code %s returned" % response.status_code)
+            sys.exit(0)
+        data = response.json()
+        if "Members" not in data or data["Members"] == []:
+            break
+        for i in data["Members"]:
+            yield i
+        uri = data.get("Members@odata.nextLink", "")
+
+def ingest_SEL():
+    logging.info("\n- INFO, getting iDRAC SEL details, this may take 15-30 seconds to complete depending on log size")
+    entries_added = insert_log_database("Sel", get_SEL_entries())
+    logging.info("- PASS, %s new SEL entries added to database file %s" % (entries_added, args["db_file"]))
+    sys.exit(0)
+
 def clear_SEL():
     url = 'https://%s/redfish/v1/Managers/iDRAC.Embedded.1/LogServices/Sel/Actions/LogService.ClearLog' % (idrac_ip)
     payload = {}
@@ -169,6 +343,10 @@ if __name__ == "__main__":
         get_iDRAC_version()
     if args["clear"]:
         clear_SEL()
+    elif args["since_last"]:
+        get_SEL_since_last()
+    elif args["db_file"]:
+        ingest_SEL()
     elif args["get"]:
         get_SEL_logs()
     else:
@@ -3,7 +3,7 @@
 # GetSetBiosAttributesREDFISH. Python script using Redfish API DMTF to either get or set BIOS attributes using Redfish SettingApplyTime.
 #
 # _author_ = Texas Roemer <Texas_Roemer@Dell.com>
-# _version_ = 19.0
+# _version_ = 20.0
 #
 # Copyright (c) 2019, Dell, Inc.
 #
@@ -20,6 +20,7 @@ import configparser
 import getpass
 import json
 import logging
+import os
 import re
 import requests
 import sys
@@ -52,9 +53,11 @@ parser.add_argument('--reboot', help='Pass in argument to reboot the server now
 parser.add_argument('--maintenance-reboot', help='Pass in the type of maintenance window job type you want to create. Pass in \"autoreboot\" if you want the server to automatically reboot and apply the changes once the maintenance windows has been hit. Pass in \"noreboot\" if you don\'t want the server to automatically reboot once the maintenance window time has hit. If you select this option, user will have to reboot the server to apply the configuration job.', dest="maintenance_reboot", required=False)
 parser.add_argument('--start-time', help='Maintenance window start date/time, pass it in this format \"YYYY-MM-DDTHH:MM:SS(+/-)HH:MM\"', dest="start_time", required=False)
 parser.add_argument('--duration-time', help='Maintenance window duration time(amount of time allowed to execute and complete the config job), pass in a value in seconds', dest="duration_time", required=False)
+parser.add_argument('--registry-cache-dir', help='Pass in directory to cache BIOS attribute registry. Registry is the same for all servers with the same model and BIOS version, registry is only downloaded once per model and BIOS version and reused from the cache directory on next script run. Same cache directory can be used for multiple iDRACs.', dest="registry_cache_dir", required=False)
 parser.add_argument('--config-file', help='Pass in the directory path and name of the config ini file. Execute --config-ini-file-examples argument to see ini file format examples.', dest="config_file", required=False)
 
 args = vars(parser.parse_args())
+bios_registry_cache = {}
 
 if args["quiet"]:
     logging.basicConfig(format='%(message)s', stream=sys.stdout, level=logging.WARNING)
@@ -65,6 +68,7 @@ def script_examples():
     print("""\n- GetSetBiosAttributesREDFISH.py -ip 192.168.0.120 -u root -p calvin --get, this example will get all BIOS attributes.
     \n- GetSetBiosAttributesREDFISH.py -ip 192.168.0.120 -u root -p calvin --get-attributes BiosMode,SysProfile this example will return multiple BIOS attributes.
     \n- GetSetBiosAttributesREDFISH.py -ip 192.168.0.120 -u root --get-attribute SetBootOrderEn, this example will first prompt to enter iDRAC user password, then return details for this specific attribute.
+    \n- GetSetBiosAttributesREDFISH.py -ip 192.168.0.120 -u root -p calvin --attribute-names MemTest --attribute-values Disabled --reboot --registry-cache-dir registry_cache, this example will set BIOS attribute MemTest using BIOS attribute registry from the cache directory, registry is only downloaded if not already cached for this server model and BIOS version.
     \n- GetSetBiosAttributesREDFISH.py -ip 192.168.0.120 -x 3fe2401de68b718b5ce2761cb0651aac --get-registry, this example using iDRAC X-auth token session will return attribute registry details. 
     \n- GetSetBiosAttributesREDFISH.py -ip 192.168.0.120 -u root -p calvin --attribute-names MemTest --attribute-values Disabled --maintenance-reboot autoreboot --start-time "2018-10-30T20:10:10-05:00" --duration-time 600, this example shows setting BIOS attribute using scheduled start time with maintenance window. Once the scheduled time has elapsed, server will auto reboot to execute config job.
     \n- GetSetBiosAttributesREDFISH.py -ip 192.168.0.120 -u root -p calvin --attribute-names EmbSata,NvmeMode --attribute-values RaidMode,Raid --reboot, this example shows setting multiple BIOS attributes with reboot now to apply.
@@ -180,22 +184,56 @@ def get_multiple_bios_attributes():
     logging.info(output)
     sys.exit(0)
 
-def bios_registry():
-    try:
-        os.remove("bios_attribute_registry.txt")
-    except:
-        pass
-    open_file = open("bios_attribute_registry.txt","a")
+def get_bios_registry(idrac_ip=""):
+    # BIOS attribute registry is the same for all servers with the same model and BIOS version. Registry is only downloaded once per model and BIOS version, kept in memory indexed by attribute name and if argument --registry-cache-dir is passed in, saved in the cache directory for next script run or other iDRACs.
     if args["x"]:
-        response = requests.get('https://%s/redfish/v1/Systems/System.Embedded.1/Bios/BiosRegistry' % idrac_ip, verify=verify_cert, headers={'X-Auth-Token': args["x"]})
+        response = requests.get('https://%s/redfish/v1/Systems/System.Embedded.1' % idrac_ip, verify=verify_cert, headers={'X-Auth-Token': args["x"]})
     else:
-        response = requests.get('https://%s/redfish/v1/Systems/System.Embedded.1/Bios/BiosRegistry' % idrac_ip, verify=verify_cert,auth=(idrac_username, idrac_password))
+        response = requests.get('https://%s/redfish/v1/Systems/System.Embedded.1' % idrac_ip, verify=verify_cert,auth=(idrac_username, idrac_password))
     data = response.json()
     if response.status_code != 200:
-        logging.error("\n- FAIL, GET command failed to get BIOS attribute registry, status code %s returned" % response.status_code)
+        logging.error("\n- FAIL, GET command failed to get server model and BIOS version, status code %s returned" % response.status_code)
         logging.error(data)
         sys.exit(0)
-    for i in data['RegistryEntries']['Attributes']:
+    registry_key = re.sub(r"[^\w.-]", "_", "bios_%s_%s" % (data.get("Model", ""), data.get("BiosVersion", "")))
+    if registry_key in bios_registry_cache:
+        return bios_registry_cache[registry_key]
+    registry_entries = None
+    if args["registry_cache_dir"]:
+        cache_filename = os.path.join(args["registry_cache_dir"], "%s.json" % registry_key)
+        if os.path.exists(cache_filename):
+            with open(cache_filename, "r") as cache_file:
+                registry_entries = json.load(cache_file)
+            logging.info("- INFO, using cached BIOS attribute registry \"%s\"" % cache_filename)
+    if not registry_entries:
+        if args["x"]:
+            response = requests.get('https://%s/redfish/v1/Systems/System.Embedded.1/Bios/BiosRegistry' % idrac_ip, verify=verify_cert, headers={'X-Auth-Token': args["x"]})
+        else:
+            response = requests.get('https://%s/redfish/v1/Systems/System.Embedded.1/Bios/BiosRegistry' % idrac_ip, verify=verify_cert,auth=(idrac_username, idrac_password))
+        data = response.json()
+        if response.status_code != 200:
+            logging.error("\n- FAIL, GET command failed to get BIOS attribute registry, status code %s returned" % response.status_code)
+            logging.error(data)
+            sys.exit(0)
+        registry_entries = data['RegistryEntries']
+        if args["registry_cache_dir"]:
+            if not os.path.isdir(args["registry_cache_dir"]):
+                os.makedirs(args["registry_cache_dir"])
+            with open(cache_filename, "w") as cache_file:
+                json.dump(registry_entries, cache_file)
+    bios_registry_cache[registry_key] = {"Attributes": {}, "Dependencies": registry_entries.get("Dependencies", [])}
+    for i in registry_entries['Attributes']:
+        bios_registry_cache[registry_key]["Attributes"][i["AttributeName"]] = i
+    return bios_registry_cache[registry_key]
+
+def bios_registry():
+    try:
+        os.remove("bios_attribute_registry.txt")
+    except:
+        pass
+    open_file = open("bios_attribute_registry.txt","a")
+    registry = get_bios_registry(idrac_ip)
+    for i in registry['Attributes'].values():
         for ii in i.items():
             pprint(i)
             print("\n")
@@ -214,16 +252,8 @@ def bios_registry_dependencies():
     except:
         pass
     open_file = open("bios_attribute_dependencies.txt","a")
-    if args["x"]:
-        response = requests.get('https://%s/redfish/v1/Systems/System.Embedded.1/Bios/BiosRegistry' % idrac_ip, verify=verify_cert, headers={'X-Auth-Token': args["x"]})
-    else:
-        response = requests.get('https://%s/redfish/v1/Systems/System.Embedded.1/Bios/BiosRegistry' % idrac_ip, verify=verify_cert,auth=(idrac_username, idrac_password))
-    data = response.json()
-    if response.status_code != 200:
-        logging.error("\n- FAIL, GET command failed to get BIOS attribute registry, status code %s returned" % response.status_code)
-        logging.error(data)
-        sys.exit(0)
-    for i in data['RegistryEntries']['Dependencies']:
+    registry = get_bios_registry(idrac_ip)
+    for i in registry['Dependencies']:
         for ii in i.items():
             pprint(i)
             print("\n")
@@ -238,21 +268,11 @@ def bios_registry_dependencies():
 
 def bios_registry_get_specific_attribute():
     logging.info("\n- INFO, searching BIOS registry for attribute \"%s\"" % args["get_registry_attribute"])
-    if args["x"]:
-        response = requests.get('https://%s/redfish/v1/Systems/System.Embedded.1/Bios/BiosRegistry' % idrac_ip, verify=verify_cert, headers={'X-Auth-Token': args["x"]})
-    else:
-        response = requests.get('https://%s/redfish/v1/Systems/System.Embedded.1/Bios/BiosRegistry' % idrac_ip, verify=verify_cert,auth=(idrac_username, idrac_password))
-    data = response.json()
-    if response.status_code != 200:
-        logging.error("\n- FAIL, GET command failed to get BIOS attribute registry, status code %s returned" % response.status_code)
-        logging.error(data)
-        sys.exit(0)
-    for i in data['RegistryEntries']['Attributes']:
-        if args["get_registry_attribute"] in i.values():
-            logging.info("\n- Attribute Registry information for attribute \"%s\" -\n" % args["get_registry_attribute"])
-            for ii in i.items():
-                pprint(i)
-                return
+    registry = get_bios_registry(idrac_ip)
+    if args["get_registry_attribute"] in registry['Attributes']:
+        logging.info("\n- Attribute Registry information for attribute \"%s\" -\n" % args["get_registry_attribute"])
+        pprint(registry['Attributes'][args["get_registry_attribute"]])
+        return
     logging.error("\n- FAIL, unable to locate attribute \"%s\" in the registry. Make sure you typed the attribute name correct since its case sensitive" % args["get_registry_attribute"])
     
 def create_bios_attribute_dict(idrac_ip="",attribute_names="", attribute_values=""):
@@ -268,20 +288,10 @@ def create_bios_attribute_dict(idrac_ip="",attribute_names="", attribute_values=
         attribute_values = args["attribute_values"].split(",")
     for i,ii in zip(attribute_names, attribute_values):
         bios_attribute_payload["Attributes"][i] = ii
-    if args["x"]:
-        response = requests.get('https://%s/redfish/v1/Systems/System.Embedded.1/Bios/BiosRegistry' % idrac_ip, verify=verify_cert, headers={'X-Auth-Token': args["x"]})
-    else:
-        response = requests.get('https://%s/redfish/v1/Systems/System.Embedded.1/Bios/BiosRegistry' % idrac_ip, verify=verify_cert,auth=(idrac_username, idrac_password))
-    data = response.json()
-    if response.status_code != 200:
-        logging.error("\n- FAIL, GET command failed to get BIOS attribute registry, status code %s returned" % response.status_code)
-        logging.error(data)
-        sys.exit(0)
+    registry = get_bios_registry(idrac_ip)
     for i in bios_attribute_payload["Attributes"].items():
-        for ii in data['RegistryEntries']['Attributes']:
-            if i[0] in ii.values():
-                if ii['Type'] == "Integer":
-                    bios_attribute_payload['Attributes'][i[0]] = int(i[1])
+        if registry['Attributes'].get(i[0], {}).get('Type') == "Integer":
+            bios_attribute_payload['Attributes'][i[0]] = int(i[1])
     logging.info("\n- INFO, setting BIOS attribute(s) for iDRAC %s -\n" % idrac_ip)
     for i in bios_attribute_payload["Attributes"].items():
         logging.info("Attribute Name: %s, setting new value to: %s" % (i[0], i[1]))
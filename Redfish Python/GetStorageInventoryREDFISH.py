@@ -3,7 +3,7 @@
 # GetStorageInventoryREDFISH. Python script using Redfish API DMTF to get storage inventory: controllers, disks and backplanes.
 #
 # _author_ = Texas Roemer <Texas_Roemer@Dell.com>
-# _version_ = 7.0
+# _version_ = 8.1
 #
 # Copyright (c) 2017, Dell, Inc.
 #
@@ -16,6 +16,7 @@
 #
 
 import argparse
+import concurrent.futures
 import getpass
 import json
 import logging
@@ -43,6 +44,9 @@ parser.add_argument('--get-controllers', help='Get server storage controller inf
 parser.add_argument('--get-disks', help='Get server storage disks information', action="store_true", dest="get_disks", required=False)
 parser.add_argument('--get-virtualdisks', help='Get server storage virtual disk information', action="store_true", dest="get_virtualdisks", required=False)
 parser.add_argument('--get-backplanes', help='Get server storage backplane information', action="store_true", dest="get_backplanes", required=False)
+parser.add_argument('--get-topology', help='Get server storage topology, controllers with volumes, drives and enclosure slot for each drive', action="store_true", dest="get_topology", required=False)
+parser.add_argument('--json-file', help='Pass in this argument with --get-topology to also save the complete storage topology to a JSON file, pass in the file name', dest="json_file", required=False)
+parser.add_argument('--max-workers', help='Max number of Redfish GET requests sent to iDRAC at the same time, default value is 8', dest="max_workers", type=int, default=8, required=False)
 
 args=vars(parser.parse_args())
 logging.basicConfig(format='%(message)s', stream=sys.stdout, level=logging.INFO)
@@ -51,7 +55,8 @@ def script_examples():
     print("""\n- GetStorageInventoryREDFISH.py -ip 192.168.0.120 -u root -p calvin --get-controllers, this example will get details for all controllers detected.
     \n- GetStorageInventoryREDFISH.py -ip 192.168.0.120 -u root -p calvin --get-disks, this example will get details for all disks detected for all controllers.
     \n- GetStorageInventoryREDFISH.py -ip 192.168.0.120 -u root -p calvin --get-virtualdisks, this example will get details for all virtualdisks detected for all controllers.
-    \n- GetStorageInventoryREDFISH.py -ip 192.168.0.120 -u root -p calvin --get-backplanes, this example will get details for all backplanes(enclosures) detected.""")
+    \n- GetStorageInventoryREDFISH.py -ip 192.168.0.120 -u root -p calvin --get-backplanes, this example will get details for all backplanes(enclosures) detected.
+    \n- GetStorageInventoryREDFISH.py -ip 192.168.0.120 -u root -p calvin --get-topology --json-file storage_topology.json, this example will get storage topology for all controllers (controller -> volumes -> drives -> enclosure slot) and save the complete topology to a JSON file.""")
     sys.exit(0)
 
 def check_supported_idrac_version():
@@ -81,32 +86,135 @@ def get_controllers():
         pprint(i)
         print("\n")
     
-def get_disks():
+def get_uri(uri):
     if args["x"]:
-        response = requests.get('https://%s/redfish/v1/Systems/System.Embedded.1/Storage' % idrac_ip, verify=verify_cert, headers={'X-Auth-Token': args["x"]})   
+        response = http_session.get('https://%s%s' % (idrac_ip, uri), verify=verify_cert, headers={'X-Auth-Token': args["x"]})
     else:
-        response = requests.get('https://%s/redfish/v1/Systems/System.Embedded.1/Storage' % idrac_ip, verify=verify_cert,auth=(idrac_username, idrac_password))
-    data = response.json()
-    controller_list = []
-    for i in data['Members']:
-        controller_list.append(i['@odata.id'].split("/")[-1])
-    for i in controller_list:
-        if args["x"]:
-            response = requests.get('https://%s/redfish/v1/Systems/System.Embedded.1/Storage/%s?$select=Drives' % (idrac_ip, i), verify=verify_cert, headers={'X-Auth-Token': args["x"]})   
-        else:
-            response = requests.get('https://%s/redfish/v1/Systems/System.Embedded.1/Storage/%s?$select=Drives' % (idrac_ip, i), verify=verify_cert,auth=(idrac_username, idrac_password))
-        data = response.json()
-        if data["Drives"] == []:
-            logging.warning("\n- WARNING, no drives detected for controller %s\n" % i)
+        response = http_session.get('https://%s%s' % (idrac_ip, uri), verify=verify_cert, auth=(idrac_username, idrac_password))
+    if response.status_code != 200:
+        logging.error("\n- FAIL, GET command failed for URI %s, status code %s returned, error: %s" % (uri, response.status_code, response.text))
+        sys.exit(0)
+    return response.json()
+
+def get_uris(uris):
+    # Parallel GET for a list of URIs, max --max-workers requests at once, results are in URI order
+    with concurrent.futures.ThreadPoolExecutor(max_workers=args["max_workers"]) as executor:
+        return list(executor.map(get_uri, uris))
+
+def get_expanded_uri(uri):
+    # GET with $expand, returns None if iDRAC rejects the $expand query so the caller can fall back to getting each member
+    if args["x"]:
+        response = http_session.get('https://%s%s?$expand=.($levels=1)' % (idrac_ip, uri), verify=verify_cert, headers={'X-Auth-Token': args["x"]})
+    else:
+        response = http_session.get('https://%s%s?$expand=.($levels=1)' % (idrac_ip, uri), verify=verify_cert, auth=(idrac_username, idrac_password))
+    if response.status_code != 200:
+        logging.debug("- INFO, $expand query not supported for URI %s, status code %s returned" % (uri, response.status_code))
+        return None
+    return response.json()
+
+def get_collection_members(uri):
+    # Members are returned expanded in one GET when iDRAC supports $expand, otherwise (query rejected or member links only) member links are fetched with get_uris()
+    global expand_supported
+    data = None
+    if expand_supported:
+        data = get_expanded_uri(uri)
+        if data is not None and [i for i in data["Members"] if list(i.keys()) == ["@odata.id"]] == []:
+            return data["Members"]
+        expand_supported = False
+    if data is None:
+        data = get_uri(uri)
+    return get_uris([i["@odata.id"] for i in data["Members"]])
+
+def get_drives_volumes(controllers):
+    # With $expand, drives and volumes are returned with one GET per controller and one GET per volume collection, all sent at the same time. If iDRAC does not support $expand, all drives and volumes for all controllers are fetched at the same time using get_uris()
+    global expand_supported
+    volume_collections = [i["Volumes"]["@odata.id"] for i in controllers if "Volumes" in i]
+    if expand_supported:
+        with concurrent.futures.ThreadPoolExecutor(max_workers=args["max_workers"]) as executor:
+            data = list(executor.map(get_expanded_uri, [i["@odata.id"] for i in controllers] + volume_collections))
+        if None not in data:
+            drives = [ii for i in data[:len(controllers)] for ii in i.get("Drives", [])]
+            volumes = [ii for i in data[len(controllers):] for ii in i["Members"]]
+            if [i for i in drives + volumes if list(i.keys()) == ["@odata.id"]] == []:
+                return drives, volumes
+        expand_supported = False
+    drive_uris = [ii["@odata.id"] for i in controllers for ii in i.get("Drives", [])]
+    volume_uris = [ii["@odata.id"] for i in get_uris(volume_collections) for ii in i["Members"]]
+    data = get_uris(drive_uris + volume_uris)
+    return data[:len(drive_uris)], data[len(drive_uris):]
+
+def get_drive_slot(drive):
+    if "PhysicalLocation" in drive and "LocationOrdinalValue" in drive["PhysicalLocation"].get("PartLocation", {}):
+        return drive["PhysicalLocation"]["PartLocation"]["LocationOrdinalValue"]
+    try:
+        return drive["Oem"]["Dell"]["DellPhysicalDisk"]["Slot"]
+    except (KeyError, TypeError):
+        return None
+
+def get_storage_topology():
+    # Storage topology is fetched in 3 steps, each step sends at most --max-workers GET requests at the same time: controllers, drives and volumes for all controllers, then enclosures.
+    # Resources are linked using Id: controller -> volumes -> drives -> enclosure slot
+    controllers = get_collection_members('/redfish/v1/Systems/System.Embedded.1/Storage')
+    drives, volumes = get_drives_volumes(controllers)
+    enclosure_uris = []
+    for i in [ii["@odata.id"] for i in controllers for ii in i.get("Links", {}).get("Enclosures", [])] + [i["Links"]["Chassis"]["@odata.id"] for i in drives if "Chassis" in i.get("Links", {})]:
+        if i not in enclosure_uris:
+            enclosure_uris.append(i)
+    enclosures = get_uris(enclosure_uris)
+    topology = {"Controllers": {}, "Volumes": {}, "Drives": {}, "Enclosures": {}}
+    for i in enclosures:
+        topology["Enclosures"][i["Id"]] = {"Resource": i, "Controllers": [], "Slots": {}}
+    for i in controllers:
+        topology["Controllers"][i["Id"]] = {"Resource": i, "Volumes": [], "Drives": [ii["@odata.id"].split("/")[-1] for ii in i.get("Drives", [])], "Enclosures": []}
+        for ii in i.get("Links", {}).get("Enclosures", []):
+            enclosure = ii["@odata.id"].split("/")[-1]
+            topology["Controllers"][i["Id"]]["Enclosures"].append(enclosure)
+            topology["Enclosures"][enclosure]["Controllers"].append(i["Id"])
+    for i in volumes:
+        controller = i["@odata.id"].split("/")[-3]
+        topology["Volumes"][i["Id"]] = {"Resource": i, "Controller": controller, "Drives": [ii["@odata.id"].split("/")[-1] for ii in i.get("Links", {}).get("Drives", [])]}
+        topology["Controllers"][controller]["Volumes"].append(i["Id"])
+    for i in drives:
+        drive = {"Resource": i, "Controller": i["@odata.id"].split("/")[-3], "Volumes": [], "Enclosure": None, "Slot": get_drive_slot(i)}
+        for ii in topology["Volumes"].items():
+            if i["Id"] in ii[1]["Drives"]:
+                drive["Volumes"].append(ii[0])
+        if "Chassis" in i.get("Links", {}):
+            drive["Enclosure"] = i["Links"]["Chassis"]["@odata.id"].split("/")[-1]
+            topology["Enclosures"][drive["Enclosure"]]["Slots"][str(drive["Slot"])] = i["Id"]
+            if drive["Controller"] not in topology["Enclosures"][drive["Enclosure"]]["Controllers"]:
+                topology["Enclosures"][drive["Enclosure"]]["Controllers"].append(drive["Controller"])
+        topology["Drives"][i["Id"]] = drive
+    return topology
+
+def get_topology():
+    topology = get_storage_topology()
+    logging.info("\n- Storage topology for iDRAC %s, %s controller(s), %s volume(s), %s drive(s), %s enclosure(s) -" % (idrac_ip, len(topology["Controllers"]), len(topology["Volumes"]), len(topology["Drives"]), len(topology["Enclosures"])))
+    for i in topology["Controllers"].items():
+        logging.info("\nController %s, enclosure(s): %s" % (i[0], ", ".join(i[1]["Enclosures"]) or "None"))
+        for volume in i[1]["Volumes"]:
+            logging.info("    Volume %s, RAID type: %s" % (volume, topology["Volumes"][volume]["Resource"].get("RAIDType")))
+            for drive in topology["Volumes"][volume]["Drives"]:
+                logging.info("        Drive %s, enclosure: %s, slot: %s" % (drive, topology["Drives"][drive]["Enclosure"], topology["Drives"][drive]["Slot"]))
+        drives = [ii for ii in i[1]["Drives"] if topology["Drives"][ii]["Volumes"] == []]
+        if drives != []:
+            logging.info("    Drives not part of a volume:")
+            for drive in drives:
+                logging.info("        Drive %s, enclosure: %s, slot: %s" % (drive, topology["Drives"][drive]["Enclosure"], topology["Drives"][drive]["Slot"]))
+    if args["json_file"]:
+        with open(args["json_file"], "w") as json_file:
+            json.dump(topology, json_file, indent=4)
+        logging.info("\n- INFO, storage topology also saved to file \"%s\"" % args["json_file"])
+
+def get_disks():
+    topology = get_storage_topology()
+    for i in topology["Controllers"].items():
+        if i[1]["Drives"] == []:
+            logging.warning("\n- WARNING, no drives detected for controller %s\n" % i[0])
         else:
-            logging.info("\n- INFO, drives detected for controller %s -\n" % i)
-            for i in data["Drives"]:
-                for ii in i.items():
-                    if args["x"]:
-                        response = requests.get('https://%s%s' % (idrac_ip, ii[1]), verify=verify_cert, headers={'X-Auth-Token': args["x"]})   
-                    else:
-                        response = requests.get('https://%s%s' % (idrac_ip, ii[1]), verify=verify_cert,auth=(idrac_username, idrac_password))
-                pprint(response.json())
+            logging.info("\n- INFO, drives detected for controller %s -\n" % i[0])
+            for ii in i[1]["Drives"]:
+                pprint(topology["Drives"][ii]["Resource"])
 
 def get_backplanes():
     if args["x"]:
@@ -125,37 +233,17 @@ def get_backplanes():
                 pprint(response.json())
 
 def get_virtualdisks():
-    if args["x"]:
-        response = requests.get('https://%s/redfish/v1/Systems/System.Embedded.1/Storage' % idrac_ip, verify=verify_cert, headers={'X-Auth-Token': args["x"]})   
-    else:
-        response = requests.get('https://%s/redfish/v1/Systems/System.Embedded.1/Storage' % idrac_ip, verify=verify_cert,auth=(idrac_username, idrac_password))
-    data = response.json()
-    controller_list = []
-    for i in data['Members']:
-        controller_list.append(i['@odata.id'].split("/")[-1])
-    for i in controller_list:
-        if args["x"]:
-            response = requests.get('https://%s/redfish/v1/Systems/System.Embedded.1/Storage/%s/Volumes' % (idrac_ip, i),verify=verify_cert, headers={'X-Auth-Token': args["x"]})
+    topology = get_storage_topology()
+    for i in topology["Controllers"].items():
+        if i[1]["Volumes"] == []:
+            logging.error("\n- WARNING, no volume(s) detected for controller %s\n" % i[0])
         else:
-            response = requests.get('https://%s/redfish/v1/Systems/System.Embedded.1/Storage/%s/Volumes' % (idrac_ip, i),verify=verify_cert, auth=(idrac_username, idrac_password))
-        data = response.json()
-        vd_list = []
-        if data['Members'] == []:
-            logging.error("\n- WARNING, no volume(s) detected for controller %s\n" % i)
-        else:
-            logging.info("\n- Volume(s) detected for %s controller -\n" % i)
-            for i in data['Members']:
-                vd_list.append(i['@odata.id'].split("/")[-1])
-        for ii in vd_list:
-            if args["x"]:
-                response = requests.get('https://%s/redfish/v1/Systems/System.Embedded.1/Storage/Volumes/%s' % (idrac_ip, ii),verify=verify_cert, headers={'X-Auth-Token': args["x"]})
-            else:
-                response = requests.get('https://%s/redfish/v1/Systems/System.Embedded.1/Storage/Volumes/%s' % (idrac_ip, ii),verify=verify_cert, auth=(idrac_username, idrac_password))
-            data = response.json()
-            for i in data.items():
-                pprint(i)
-            print("\n")
-                
+            logging.info("\n- Volume(s) detected for %s controller -\n" % i[0])
+            for ii in i[1]["Volumes"]:
+                for iii in topology["Volumes"][ii]["Resource"].items():
+                    pprint(iii)
+                print("\n")
+
 if __name__ == "__main__":
     if args["script_examples"]:
         script_examples()
@@ -175,6 +263,9 @@ if __name__ == "__main__":
                 verify_cert = False
         else:
             verify_cert = False
+        http_session = requests.Session()
+        http_session.mount("https://", requests.adapters.HTTPAdapter(pool_maxsize=args["max_workers"]))
+        expand_supported = True
         check_supported_idrac_version()
     else:
         logging.error("\n- FAIL, invalid argument values or not all required parameters passed in. See help text or argument --script-examples for more details.")
@@ -187,5 +278,7 @@ if __name__ == "__main__":
         get_backplanes()
     elif args["get_virtualdisks"]:
         get_virtualdisks()
+    elif args["get_topology"]:
+        get_topology()
     else:
         logging.error("\n- FAIL, invalid argument values or not all required parameters passed in. See help text or argument --script-examples for more details.")
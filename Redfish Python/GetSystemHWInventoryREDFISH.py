@@ -3,7 +3,7 @@
 # GetSystemHWInventoryREDFISH. Python script using Redfish API to get system hardware inventory
 #
 # _author_ = Texas Roemer <Texas_Roemer@Dell.com>
-# _version_ = 9.0
+# _version_ = 10.1
 #
 # Copyright (c) 2018, Dell, Inc.
 #
@@ -16,6 +16,7 @@
 #
 
 import argparse
+import concurrent.futures
 import getpass
 import json
 import logging
@@ -47,13 +48,16 @@ parser.add_argument('--powersupply', help='Get power supply information', action
 parser.add_argument('--storage', help='Get storage information', action="store_true", required=False)
 parser.add_argument('--network', help='Get network device information', action="store_true", required=False)
 parser.add_argument('--all', help='Get all system/device information', action="store_true", required=False)
+parser.add_argument('--json-file', help='Pass in file name to also save inventory as one JSON document, example: hw_inventory.json', dest="json_file", required=False)
+parser.add_argument('--max-workers', help='Max number of GET requests to run at the same time when iDRAC does not support $expand or to get linked resources, default value is 8', dest="max_workers", type=int, default=8, required=False)
 args = vars(parser.parse_args())
 logging.basicConfig(format='%(message)s', stream=sys.stdout, level=logging.INFO)
 
 def script_examples():
     print("""\n- GetSystemHWInventoryREDFISH.py -ip 192.168.0.120 -u root -p calvin --memory, this example will get only memory information.
     \n- GetSystemHWInventoryREDFISH.py -ip 192.168.0.120 -u root -p calvin --processor --memory, this example will get only processor and memory information.
-    \n- GetSystemHWInventoryREDFISH.py -ip 192.168.0.120 -u root -p calvin --all, this example will get all system information: general system information, processor, memory, fans, power supplies, hard drives, storage controllers, network devices""")
+    \n- GetSystemHWInventoryREDFISH.py -ip 192.168.0.120 -u root -p calvin --all, this example will get all system information: general system information, processor, memory, fans, power supplies, hard drives, storage controllers, network devices
+    \n- GetSystemHWInventoryREDFISH.py -ip 192.168.0.120 -u root -p calvin --all --json-file hw_inventory.json, this example will get all system information and also save it as one JSON document in file hw_inventory.json.""")
     sys.exit(0)
 
 def check_supported_idrac_version():
@@ -69,20 +73,69 @@ def check_supported_idrac_version():
         logging.warning("\n- WARNING, iDRAC version installed does not support this feature using Redfish API")
         sys.exit(0)
 
-def get_system_information():
+def get_uri(uri, select=""):
+    # Properties passed in select are requested using $select, if iDRAC does not support $select complete resource is returned
+    global select_supported
+    if select and select_supported:
+        uri_query = "%s?$select=%s" % (uri, select)
+    else:
+        uri_query = uri
     if args["x"]:
-        response = requests.get('https://%s/redfish/v1/Systems/System.Embedded.1' % idrac_ip, verify=verify_cert, headers={'X-Auth-Token': args["x"]})
+        response = http_session.get('https://%s%s' % (idrac_ip, uri_query), verify=verify_cert, headers={'X-Auth-Token': args["x"]})
     else:
-        response = requests.get('https://%s/redfish/v1/Systems/System.Embedded.1' % idrac_ip, verify=verify_cert, auth=(idrac_username, idrac_password))
-    data = response.json()
+        response = http_session.get('https://%s%s' % (idrac_ip, uri_query), verify=verify_cert, auth=(idrac_username, idrac_password))
+    if select and select_supported and (response.status_code != 200 or [i for i in select.split(",") if i not in response.json()]):
+        select_supported = False
+        return get_uri(uri)
     if response.status_code != 200:
-        print("\n- FAIL, get command failed, error: %s" % data)
+        logging.error("\n- FAIL, GET command failed for URI %s, status code %s returned, error: %s" % (uri, response.status_code, response.text))
         sys.exit(0)
+    return response.json()
+
+def get_uris(uris):
+    # Runs get_uri() for each URI on up to --max-workers threads, list of responses keeps the URI order
+    with concurrent.futures.ThreadPoolExecutor(max_workers=args["max_workers"]) as executor:
+        return list(executor.map(get_uri, uris))
+
+def get_expanded_uri(uri):
+    # GET with $expand, returns None if iDRAC rejects the $expand query so the caller can fall back to getting each member
+    if args["x"]:
+        response = http_session.get('https://%s%s?$expand=.($levels=1)' % (idrac_ip, uri), verify=verify_cert, headers={'X-Auth-Token': args["x"]})
     else:
-        message = "\n---- System Information ----\n"
-        open_file.writelines(message)
-        open_file.writelines("\n")
-        print(message)
+        response = http_session.get('https://%s%s?$expand=.($levels=1)' % (idrac_ip, uri), verify=verify_cert, auth=(idrac_username, idrac_password))
+    if response.status_code != 200:
+        logging.debug("- INFO, $expand query not supported for URI %s, status code %s returned" % (uri, response.status_code))
+        return None
+    return response.json()
+
+def get_collection_members(uri):
+    # Try $expand first so the whole collection comes back in one response, if iDRAC rejects $expand or only returns member links $expand is turned off and each member is fetched in parallel
+    global expand_supported
+    data = None
+    if expand_supported:
+        data = get_expanded_uri(uri)
+        if data is not None and [i for i in data["Members"] if list(i.keys()) == ["@odata.id"]] == []:
+            return data["Members"]
+        expand_supported = False
+    if data is None:
+        data = get_uri(uri)
+    return get_uris([i["@odata.id"] for i in data["Members"]])
+
+def get_normalized_resource(data):
+    # Removes OData annotations except @odata.id from resources added to the JSON inventory document
+    if isinstance(data, dict):
+        return {i: get_normalized_resource(ii) for i, ii in data.items() if not i.startswith("@odata.") or i == "@odata.id"}
+    elif isinstance(data, list):
+        return [get_normalized_resource(i) for i in data]
+    return data
+
+def get_system_information():
+    data = get_uri('/redfish/v1/Systems/System.Embedded.1')
+    inventory["System"] = get_normalized_resource(data)
+    message = "\n---- System Information ----\n"
+    open_file.writelines(message)
+    open_file.writelines("\n")
+    print(message)
     for i in data.items():
         if i[0] == "Oem":
             for ii in i[1]['Dell']['DellSystem'].items():
@@ -90,314 +143,181 @@ def get_system_information():
                     message = "%s: %s" % (ii[0], ii[1])
                     open_file.writelines(message)
                     open_file.writelines("\n")
-                    print(message)       
+                    print(message)
         elif i[0] == "Model" or i[0] == "AssetTag" or i[0] == "BiosVersion" or i[0] == "HostName" or i[0] == "Manufacturer" or i[0] == "System" or i[0] == "SKU" or i[0] == "SerialNumber" or i[0] == "Status":
                 message = "%s: %s" % (i[0], i[1])
                 open_file.writelines(message)
                 open_file.writelines("\n")
                 print(message)
-    
+
 def get_memory_information():
-    if args["x"]:
-        response = requests.get('https://%s/redfish/v1/Systems/System.Embedded.1/Memory' % idrac_ip, verify=verify_cert, headers={'X-Auth-Token': args["x"]})
-    else:
-        response = requests.get('https://%s/redfish/v1/Systems/System.Embedded.1/Memory' % idrac_ip, verify=verify_cert, auth=(idrac_username, idrac_password))
-    data = response.json()
-    if response.status_code != 200:
-        logging.error("\n- FAIL, get command failed, error: %s" % data)
-        sys.exit(0)
-    else:
-        message = "\n---- Memory Information ----"
-        open_file.writelines(message)
-        open_file.writelines("\n")
-        print(message)
-    for i in data['Members']:
-        dimm = i['@odata.id'].split("/")[-1]
+    members = get_collection_members('/redfish/v1/Systems/System.Embedded.1/Memory')
+    inventory["Memory"] = get_normalized_resource(members)
+    message = "\n---- Memory Information ----"
+    open_file.writelines(message)
+    open_file.writelines("\n")
+    print(message)
+    for sub_data in members:
+        dimm = sub_data['@odata.id'].split("/")[-1]
         try:
             dimm_slot = re.search("DIMM.+",dimm).group()
         except:
             logging.error("\n- FAIL, unable to get dimm slot info")
             sys.exit(0)
-        if args["x"]:
-            response = requests.get('https://%s%s' % (idrac_ip, i['@odata.id']), verify=verify_cert, headers={'X-Auth-Token': args["x"]})
-        else:
-            response = requests.get('https://%s%s' % (idrac_ip, i['@odata.id']), verify=verify_cert, auth=(idrac_username, idrac_password))
-        sub_data = response.json()
-        if response.status_code != 200:
-            logging.error("\n- FAIL, get command failed, error: %s" % sub_data)
-            sys.exit(0)
-        else:
-            message = "\n- Memory details for %s -\n" % dimm_slot
-            open_file.writelines(message)
-            open_file.writelines("\n")
-            print(message)
-            for ii in sub_data.items():
-                if ii[0] == 'Oem':
-                    for iii in ii[1]['Dell']['DellMemory'].items():
+        message = "\n- Memory details for %s -\n" % dimm_slot
+        open_file.writelines(message)
+        open_file.writelines("\n")
+        print(message)
+        for ii in sub_data.items():
+            if ii[0] == 'Oem':
+                for iii in ii[1]['Dell']['DellMemory'].items():
+                    if iii[0] != '@odata.context' or iii[0] != '@odata.type':
+                        message = "%s: %s" % (iii[0], iii[1])
+                        open_file.writelines(message)
+                        open_file.writelines("\n")
+                        print(message)
+            else:
+                message = "%s: %s" % (ii[0], ii[1])
+                open_file.writelines(message)
+                open_file.writelines("\n")
+                print(message)
+
+def get_cpu_information():
+    members = get_collection_members('/redfish/v1/Systems/System.Embedded.1/Processors')
+    inventory["Processors"] = get_normalized_resource(members)
+    message = "\n---- Processor Information ----"
+    open_file.writelines(message)
+    open_file.writelines("\n")
+    print(message)
+    for sub_data in members:
+        cpu = sub_data['@odata.id'].split("/")[-1]
+        message = "\n- Processor details for %s -\n" % cpu
+        open_file.writelines(message)
+        open_file.writelines("\n")
+        print(message)
+        for ii in sub_data.items():
+            if ii[0] == 'Oem':
+                if 'DellProcessor' not in ii[1]['Dell']:
+                    continue
+                else:
+                    for iii in ii[1]['Dell']['DellProcessor'].items():
                         if iii[0] != '@odata.context' or iii[0] != '@odata.type':
                             message = "%s: %s" % (iii[0], iii[1])
                             open_file.writelines(message)
                             open_file.writelines("\n")
                             print(message)
-                else:
-                    message = "%s: %s" % (ii[0], ii[1])
+            else:
+                message = "%s: %s" % (ii[0], ii[1])
+                open_file.writelines(message)
+                open_file.writelines("\n")
+                print(message)
+
+def get_linked_resources(link_name):
+    # CooledBy and PoweredBy links point to Thermal or Power resource fragments (example: /redfish/v1/Chassis/System.Embedded.1/Thermal#/Fans/0), each resource is only fetched once
+    data = get_uri('/redfish/v1/Systems/System.Embedded.1', select="Links")
+    uris = []
+    for i in data['Links'][link_name]:
+        uri = i['@odata.id'].split("#")[0]
+        if uri not in uris:
+            uris.append(uri)
+    return get_uris(uris)
+
+def get_fan_information():
+    message = "\n---- Fan Information ----\n"
+    open_file.writelines(message)
+    open_file.writelines("\n")
+    print(message)
+    inventory["Fans"] = []
+    resources = get_linked_resources('CooledBy')
+    if resources == []:
+        logging.warning("\n- WARNING, no fans detected for system")
+    for data_get in resources:
+        if "Fans" not in data_get.keys():
+            inventory["Fans"].append(get_normalized_resource(data_get))
+            for ii in data_get.items():
+                message = "%s: %s" %  (ii[0], ii[1])
+                open_file.writelines(message)
+                print(message)
+                message = "\n"
+                open_file.writelines(message)
+            message = "\n"
+            open_file.writelines(message)
+            print(message)
+        else:
+            inventory["Fans"].extend(get_normalized_resource(data_get["Fans"]))
+            for i in data_get["Fans"]:
+                message = "\n- Details for %s -\n" % i["FanName"]
+                open_file.writelines(message)
+                print(message)
+                message = "\n"
+                open_file.writelines(message)
+                for ii in i.items():
+                    message = "%s: %s" %  (ii[0], ii[1])
+                    open_file.writelines(message)
+                    print(message)
+                    message = "\n"
+                    open_file.writelines(message)
+
+def get_ps_details(power_supply):
+    message = "\n- Details for %s -\n" % power_supply["Name"]
+    open_file.writelines(message)
+    open_file.writelines("\n")
+    print(message)
+    for i in power_supply.items():
+        if i[0] == "Oem":
+            try:
+                for ii in i[1]["Dell"]["DellPowerSupply"].items():
+                    message = "%s: %s" % (ii[0],ii[1])
                     open_file.writelines(message)
                     open_file.writelines("\n")
                     print(message)
-    
-def get_cpu_information():
-    if args["x"]:
-        response = requests.get('https://%s/redfish/v1/Systems/System.Embedded.1/Processors' % idrac_ip, verify=verify_cert, headers={'X-Auth-Token': args["x"]})
-    else:
-        response = requests.get('https://%s/redfish/v1/Systems/System.Embedded.1/Processors' % idrac_ip, verify=verify_cert, auth=(idrac_username, idrac_password))
-    data = response.json()
-    if response.status_code != 200:
-        logging.error("\n- FAIL, get command failed, error: %s" % data)
-        sys.exit(0)
-    else:
-        message = "\n---- Processor Information ----"
-        open_file.writelines(message)
-        open_file.writelines("\n")
-        print(message)
-    for i in data['Members']:
-        cpu = i['@odata.id'].split("/")[-1]
-        if args["x"]:
-            response = requests.get('https://%s%s' % (idrac_ip, i['@odata.id']), verify=verify_cert, headers={'X-Auth-Token': args["x"]})
-        else:
-            response = requests.get('https://%s%s' % (idrac_ip, i['@odata.id']), verify=verify_cert, auth=(idrac_username, idrac_password))
-        sub_data = response.json()
-        if response.status_code != 200:
-            print("\n- FAIL, get command failed, error: %s" % sub_data)
-            sys.exit(0)
+            except:
+                logging.error("- FAIL, unable to find Dell PowerSupply OEM information")
+                sys.exit(0)
         else:
-            message = "\n- Processor details for %s -\n" % cpu
+            message = "%s: %s" % (i[0],i[1])
             open_file.writelines(message)
             open_file.writelines("\n")
             print(message)
-            for ii in sub_data.items():
-                if ii[0] == 'Oem':
-                    if 'DellProcessor' not in ii[1]['Dell']:
-                        continue
-                    else:
-                        for iii in ii[1]['Dell']['DellProcessor'].items():
-                            if iii[0] != '@odata.context' or iii[0] != '@odata.type':
-                                message = "%s: %s" % (iii[0], iii[1])
-                                open_file.writelines(message)
-                                open_file.writelines("\n")
-                                print(message)
-                else:
-                    message = "%s: %s" % (ii[0], ii[1])
-                    open_file.writelines(message)
-                    open_file.writelines("\n")
-                    print(message)
 
-def get_fan_information():
-    if args["x"]:
-        response = requests.get('https://%s/redfish/v1/Systems/System.Embedded.1' % idrac_ip, verify=verify_cert, headers={'X-Auth-Token': args["x"]})
-    else:
-        response = requests.get('https://%s/redfish/v1/Systems/System.Embedded.1' % idrac_ip, verify=verify_cert, auth=(idrac_username, idrac_password))
-    data = response.json()
-    if response.status_code != 200:
-        print("\n- FAIL, get command failed, error: %s" % data)
-        sys.exit(0)
-    else:
-        message = "\n---- Fan Information ----\n"
-        open_file.writelines(message)
-        open_file.writelines("\n")
-        print(message)
-    fan_list = []
-    if data['Links']['CooledBy'] == []:
-        logging.warning("\n- WARNING, no fans detected for system")
-    else:
-        for i in data['Links']['CooledBy']:
-            for ii in i.items():
-                fan_list.append(ii[1])
-        for i in fan_list:
-            if args["x"]:
-                response = requests.get('https://%s%s' % (idrac_ip, i), verify=verify_cert, headers={'X-Auth-Token': args["x"]})
-            else:
-                response = requests.get('https://%s%s' % (idrac_ip, i), verify=verify_cert, auth=(idrac_username, idrac_password))
-            if response.status_code != 200:
-                logging.error("\n- FAIL, get command failed, error: %s" % data)
-                sys.exit(0)
-            else:
-                data_get = response.json()
-                if "Fans" not in data_get.keys():
-                    for ii in data_get.items():
-                        message = "%s: %s" %  (ii[0], ii[1])
-                        open_file.writelines(message)
-                        print(message)
-                        message = "\n"
-                        open_file.writelines(message)
-                    message = "\n"
-                    open_file.writelines(message)
-                    print(message)
-                else:
-                    count = 0
-                    while True:
-                        if count == len(fan_list):
-                            return
-                        for i in data_get["Fans"]:
-                            message = "\n- Details for %s -\n" % i["FanName"]
-                            count += 1
-                            open_file.writelines(message)
-                            print(message)
-                            message = "\n"
-                            open_file.writelines(message)
-                            for ii in i.items():
-                                message = "%s: %s" %  (ii[0], ii[1])
-                                open_file.writelines(message)
-                                print(message)
-                                message = "\n"
-                                open_file.writelines(message)
-                                
 def get_ps_information():
-    if args["x"]:
-        response = requests.get('https://%s/redfish/v1/Systems/System.Embedded.1' % idrac_ip, verify=verify_cert, headers={'X-Auth-Token': args["x"]})
-    else:
-        response = requests.get('https://%s/redfish/v1/Systems/System.Embedded.1' % idrac_ip, verify=verify_cert, auth=(idrac_username, idrac_password))
-    data = response.json()
-    if response.status_code != 200:
-        logging.error("\n- FAIL, get command failed, error: %s" % data)
-        sys.exit(0)
-    else:
-        message = "\n---- Power Supply Information ----\n"
-        open_file.writelines(message)
-        open_file.writelines("\n")
-        print(message)
-    if data['Links']['PoweredBy'] == []:
-        logging.error("- WARNING, no power supplies detected for system")       
-    else:
-        for i in data['Links']['PoweredBy']:
-            for ii in i.items():
-                if args["x"]:
-                    response = requests.get('https://%s%s' % (idrac_ip, ii[1]), verify=verify_cert, headers={'X-Auth-Token': args["x"]})
-                else:
-                    response = requests.get('https://%s%s' % (idrac_ip, ii[1]), verify=verify_cert, auth=(idrac_username, idrac_password))
-                if response.status_code != 200:
-                    logging.error("\n- FAIL, get command failed, error: %s" % data)
-                    sys.exit(0)
-                else:
-                    data_get = response.json()
-                    if "PowerSupplies" not in data_get.keys():
-                        message = "\n- Details for %s -\n" % data_get["Name"]
+    message = "\n---- Power Supply Information ----\n"
+    open_file.writelines(message)
+    open_file.writelines("\n")
+    print(message)
+    inventory["Power Supplies"] = []
+    resources = get_linked_resources('PoweredBy')
+    if resources == []:
+        logging.error("- WARNING, no power supplies detected for system")
+    for data_get in resources:
+        if "PowerSupplies" not in data_get.keys():
+            inventory["Power Supplies"].append(get_normalized_resource(data_get))
+            get_ps_details(data_get)
+        else:
+            inventory["Power Supplies"].extend(get_normalized_resource(data_get["PowerSupplies"]))
+            for i in data_get["PowerSupplies"]:
+                get_ps_details(i)
+                print("\n")
+                open_file.writelines("\n")
+            if "PowerControl" in data_get.keys():
+                inventory["Power Control"] = get_normalized_resource(data_get["PowerControl"])
+                for i in data_get["PowerControl"]:
+                    for ii in i.items():
+                        message = "%s: %s" % (ii[0],ii[1])
                         open_file.writelines(message)
                         open_file.writelines("\n")
                         print(message)
-                        for i in data_get.items():
-                            if i[0] == "Oem":
-                                try:
-                                    for ii in i[1]["Dell"]["DellPowerSupply"].items():
-                                        message = "%s: %s" % (ii[0],ii[1])
-                                        open_file.writelines(message)
-                                        open_file.writelines("\n")
-                                        print(message)
-                                except:
-                                    logging.error("- FAIL, unable to find Dell PowerSupply OEM information")
-                                    sys.exit(0)
-                            else:
-                                message = "%s: %s" % (i[0],i[1])
-                                open_file.writelines(message)
-                                open_file.writelines("\n")
-                                print(message)             
-                    else:
-                        if len(data['Links']['PoweredBy']) == 1:
-                            message = "\n- Details for %s -\n" % data_get["PowerSupplies"][0]["Name"]
-                            open_file.writelines(message)
-                            open_file.writelines("\n")
-                            print(message)
-                            for i in data_get.items():
-                                if i[0] == "PowerSupplies":
-                                    for ii in i[1]:
-                                        for iii in ii.items():
-                                            if iii[0] == "Oem":
-                                                try:
-                                                    for iiii in iii[1]["Dell"]["DellPowerSupply"].items():
-                                                        message = "%s: %s" % (iiii[0],iiii[1])
-                                                        open_file.writelines(message)
-                                                        open_file.writelines("\n")
-                                                        print(message)
-                                                except:
-                                                    logging.error("- FAIL, unable to find Dell PowerSupply OEM information")
-                                                    sys.exit(0)
-                                                
-                                            else:
-                                                message = "%s: %s" % (iii[0],iii[1])
-                                                open_file.writelines(message)
-                                                open_file.writelines("\n")
-                                                print(message)
-                                elif i[0] == "PowerControl" and i[0] != "Voltages":
-                                    for ii in i[1]:
-                                        for iii in ii.items():
-                                            message = "%s: %s" % (iii[0],iii[1])
-                                            open_file.writelines(message)
-                                            open_file.writelines("\n")
-                                            print(message)
-                                else:
-                                    message = "%s: %s" % (i[0],i[1])
-                                    open_file.writelines(message)
-                                    open_file.writelines("\n")
-                                    print(message)
-                            print("\n")
-                            open_file.writelines("\n")
-                        else:
-                            for i in data_get.items():
-                                if i[0] == "PowerSupplies":
-                                    psu_ids = i[1]
-                            count = 0
-                            while True:
-                                if len(psu_ids) == count:
-                                    return
-                                else:
-                                    for i in psu_ids:
-                                        message = "\n- Details for %s -\n" % i["Name"]
-                                        open_file.writelines(message)
-                                        open_file.writelines("\n")
-                                        print(message)
-                                        for ii in i.items():
-                                            if ii[0] == "Oem":
-                                                try:
-                                                    for iii in ii[1]["Dell"]["DellPowerSupply"].items():
-                                                        message = "%s: %s" % (iii[0],iii[1])
-                                                        open_file.writelines(message)
-                                                        open_file.writelines("\n")
-                                                        print(message)
-                                                except:
-                                                    logging.error("- FAIL, unable to find Dell PowerSupply OEM information")
-                                                    sys.exit(0)
-                                            else:
-                                                message = "%s: %s" % (ii[0],ii[1])
-                                                open_file.writelines(message)
-                                                open_file.writelines("\n")
-                                                print(message)
-                                        print("\n")
-                                        count += 1
 
 def get_storage_controller_information():
-    global controller_list
+    global controllers
     message = "\n---- Controller Information ----"
     open_file.writelines(message)
     open_file.writelines("\n")
     print(message)
-    controller_list = []
-    if args["x"]:
-        response = requests.get('https://%s/redfish/v1/Systems/System.Embedded.1/Storage' % idrac_ip, verify=verify_cert, headers={'X-Auth-Token': args["x"]})
-    else:
-        response = requests.get('https://%s/redfish/v1/Systems/System.Embedded.1/Storage' % idrac_ip, verify=verify_cert, auth=(idrac_username, idrac_password))
-    if response.status_code != 200:
-        logging.error("\n- FAIL, get command failed, error: %s" % data)
-        sys.exit(0)
-    data = response.json()
-    for i in data["Members"]:
-        for ii in i.items():
-            controller_list.append(ii[1])
-    for i in controller_list:
-        if args["x"]:
-            response = requests.get('https://%s%s' % (idrac_ip, i), verify=verify_cert, headers={'X-Auth-Token': args["x"]})
-        else:
-            response = requests.get('https://%s%s' % (idrac_ip, i), verify=verify_cert, auth=(idrac_username, idrac_password))
-        data = response.json()
-        message = "\n - Detailed controller information for %s -\n" % i.split("/")[-1]
+    controllers = get_collection_members('/redfish/v1/Systems/System.Embedded.1/Storage')
+    inventory["Storage Controllers"] = get_normalized_resource(controllers)
+    for data in controllers:
+        message = "\n - Detailed controller information for %s -\n" % data["@odata.id"].split("/")[-1]
         open_file.writelines(message)
         open_file.writelines("\n")
         print(message)
@@ -428,72 +348,65 @@ def get_storage_controller_information():
                         message = "%s: %s" % (ii[0],ii[1])
                         open_file.writelines(message)
                         open_file.writelines("\n")
-                        print(message)        
+                        print(message)
             else:
                 message = "%s: %s" % (i[0], i[1])
                 open_file.writelines(message)
                 open_file.writelines("\n")
                 print(message)
 
+def get_controller_drives(controllers):
+    # With $expand, all drives for a controller are returned with one GET, controllers are fetched at the same time. If iDRAC does not support $expand, each drive is fetched at the same time using get_uris()
+    global expand_supported
+    if expand_supported:
+        with concurrent.futures.ThreadPoolExecutor(max_workers=args["max_workers"]) as executor:
+            expanded_controllers = list(executor.map(lambda x: get_expanded_uri(x["@odata.id"]), controllers))
+        if None not in expanded_controllers:
+            drives = [ii for i in expanded_controllers for ii in i['Drives']]
+            if [i for i in drives if list(i.keys()) == ["@odata.id"]] == []:
+                return drives
+        expand_supported = False
+    return get_uris([ii['@odata.id'] for i in controllers for ii in i['Drives']])
+
 def get_storage_disks_information():
     message = "\n---- Disk Information ----"
     open_file.writelines(message)
     open_file.writelines("\n")
     print(message)
-    for i in controller_list:
-        if args["x"]:
-            response = requests.get('https://%s/redfish/v1/Systems/System.Embedded.1/Storage/%s' % (idrac_ip, i.split("/")[-1]), verify=verify_cert, headers={'X-Auth-Token': args["x"]})
-        else:
-            response = requests.get('https://%s/redfish/v1/Systems/System.Embedded.1/Storage/%s' % (idrac_ip, i.split("/")[-1]), verify=verify_cert, auth=(idrac_username, idrac_password))
-        data = response.json()
-        if response.status_code != 200:
-            logging.error("- FAIL, GET command failed, detailed error information: %s" % data)
-            sys.exit(0)
-        if data['Drives'] == []:
-            message = "\n- WARNING, no drives detected for %s" % i.split("/")[-1]
+    for i in controllers:
+        if i['Drives'] == []:
+            message = "\n- WARNING, no drives detected for %s" % i["@odata.id"].split("/")[-1]
             open_file.writelines(message)
             open_file.writelines("\n")
             print(message)
-        else:
-            for i in data['Drives']:
-                for ii in i.items():
-                    if args["x"]:
-                        response = requests.get('https://%s%s' % (idrac_ip, ii[1]), verify=verify_cert, headers={'X-Auth-Token': args["x"]})
-                    else:
-                        response = requests.get('https://%s%s' % (idrac_ip, ii[1]), verify=verify_cert, auth=(idrac_username, idrac_password))
-                    data = response.json()
-                    message = "\n - Detailed drive information for %s -\n" % ii[1].split("/")[-1]
+    drives = get_controller_drives([i for i in controllers if i['Drives'] != []])
+    inventory["Drives"] = get_normalized_resource(drives)
+    for data in drives:
+        message = "\n - Detailed drive information for %s -\n" % data["@odata.id"].split("/")[-1]
+        open_file.writelines(message)
+        open_file.writelines("\n")
+        print(message)
+        for ii in data.items():
+            if ii[0] == 'Oem':
+                for iii in ii[1]['Dell']['DellPhysicalDisk'].items():
+                    message = "%s: %s" % (iii[0],iii[1])
                     open_file.writelines(message)
                     open_file.writelines("\n")
                     print(message)
-                    for ii in data.items():
-                        if ii[0] == 'Oem':
-                            for iii in ii[1]['Dell']['DellPhysicalDisk'].items():
-                                message = "%s: %s" % (iii[0],iii[1])
-                                open_file.writelines(message)
-                                open_file.writelines("\n")
-                                print(message)
-                        elif ii[0] == 'Status':
-                            for iii in ii[1].items():
-                                message = "%s: %s" % (iii[0],iii[1])
-                                open_file.writelines(message)
-                                open_file.writelines("\n")
-                                print(message)
-                        else:
-                            message = "%s: %s" % (ii[0],ii[1])
-                            open_file.writelines(message)
-                            open_file.writelines("\n")
-                            print(message)
-                
+            elif ii[0] == 'Status':
+                for iii in ii[1].items():
+                    message = "%s: %s" % (iii[0],iii[1])
+                    open_file.writelines(message)
+                    open_file.writelines("\n")
+                    print(message)
+            else:
+                message = "%s: %s" % (ii[0],ii[1])
+                open_file.writelines(message)
+                open_file.writelines("\n")
+                print(message)
+
 def get_backplane_information():
-    if args["x"]:
-        response = requests.get('https://%s/redfish/v1/Chassis' % idrac_ip, verify=verify_cert, headers={'X-Auth-Token': args["x"]})
-    else:
-        response = requests.get('https://%s/redfish/v1/Chassis' % idrac_ip, verify=verify_cert, auth=(idrac_username, idrac_password))
-    data = response.json()
-    if response.status_code != 200:
-        logging.error("\n- FAIL, get command failed, error is: %s" % data)
-        sys.exit(0)
+    data = get_uri('/redfish/v1/Chassis')
     message = "\n---- Backplane Information ----"
     open_file.writelines(message)
     open_file.writelines("\n")
@@ -503,16 +416,16 @@ def get_backplane_information():
         backplane = i['@odata.id']
         if "Enclosure" in backplane:
             backplane_URI_list.append(backplane)
+    inventory["Backplanes"] = []
     if backplane_URI_list == []:
         message = "- WARNING, no backplane information detected for system\n"
         open_file.writelines(message)
         open_file.writelines("\n")
         print(message)
-        sys.exit(0)
-    for i in backplane_URI_list:
-        response = requests.get('https://%s%s' % (idrac_ip, i),verify=False,auth=(idrac_username, idrac_password))
-        data = response.json()
-        message = "\n- Detailed backplane information for %s -\n" % i.split("/")[-1]
+        return
+    for data in get_uris(backplane_URI_list):
+        inventory["Backplanes"].append(get_normalized_resource(data))
+        message = "\n- Detailed backplane information for %s -\n" % data["@odata.id"].split("/")[-1]
         open_file.writelines(message)
         open_file.writelines("\n")
         print(message)
@@ -530,40 +443,18 @@ def get_backplane_information():
                 message = "%s: %s" % (iii[0], iii[1])
                 open_file.writelines(message)
                 open_file.writelines("\n")
-                print(message)   
+                print(message)
 
 def get_network_information():
-    if args["x"]:
-        response = requests.get('https://%s/redfish/v1/Chassis/System.Embedded.1/NetworkAdapters' % idrac_ip, verify=verify_cert, headers={'X-Auth-Token': args["x"]})   
-    else:
-        response = requests.get('https://%s/redfish/v1/Chassis/System.Embedded.1/NetworkAdapters' % idrac_ip, verify=verify_cert,auth=(idrac_username, idrac_password))
-    data = response.json()
-    network_device_list = []
-    for i in data['Members']:
-        for ii in i.items():
-            network_device = ii[1].split("/")[-1]
-            network_device_list.append(network_device)
-    for i in network_device_list:
-        port_list = []
-        if args["x"]:
-            response = requests.get('https://%s/redfish/v1/Chassis/System.Embedded.1/NetworkAdapters/%s/NetworkDeviceFunctions' % (idrac_ip, i), verify=verify_cert, headers={'X-Auth-Token': args["x"]})   
-        else:
-            response = requests.get('https://%s/redfish/v1/Chassis/System.Embedded.1/NetworkAdapters/%s/NetworkDeviceFunctions' % (idrac_ip, i), verify=verify_cert,auth=(idrac_username, idrac_password))
-        data = response.json()
-        for i in data['Members']:
-            for ii in i.items():
-                port_list.append(ii[1].split("/")[-1])
-    for i in network_device_list:
-        device_id = i.split("-")[0]
-        if args["x"]:
-            response = requests.get('https://%s/redfish/v1/Chassis/System.Embedded.1/NetworkAdapters/%s' % (idrac_ip, i), verify=verify_cert, headers={'X-Auth-Token': args["x"]})
-        else:
-            response = requests.get('https://%s/redfish/v1/Chassis/System.Embedded.1/NetworkAdapters/%s' % (idrac_ip, i), verify=verify_cert, auth=(idrac_username, idrac_password))
-        data = response.json()
-        if response.status_code != 200:
-            logging.error("\n- FAIL, get command failed, error is: %s" % data)
-            sys.exit(0)
-        message = "\n---- Network Device Information for %s ----\n" % i
+    network_devices = get_collection_members('/redfish/v1/Chassis/System.Embedded.1/NetworkAdapters')
+    # Port collections for all network devices are fetched at the same time
+    with concurrent.futures.ThreadPoolExecutor(max_workers=args["max_workers"]) as executor:
+        network_ports = list(executor.map(lambda x: get_collection_members(x["NetworkDeviceFunctions"]["@odata.id"]), network_devices))
+    network_ports = [i for ii in network_ports for i in ii]
+    inventory["Network Adapters"] = get_normalized_resource(network_devices)
+    inventory["Network Ports"] = get_normalized_resource(network_ports)
+    for data in network_devices:
+        message = "\n---- Network Device Information for %s ----\n" % data["@odata.id"].split("/")[-1]
         open_file.writelines(message)
         open_file.writelines("\n")
         print(message)
@@ -579,19 +470,8 @@ def get_network_information():
                 open_file.writelines(message)
                 open_file.writelines("\n")
                 print(message)
-    for i in port_list:
-        device_id = i.split("-")[0]
-        if device_id == "NIC.Embedded.2" or device_id == "NIC.Embedded.3" or device_id == "NIC.Embedded.4":
-            device_id = "NIC.Embedded.1"
-        if args["x"]:
-            response = requests.get('https://%s/redfish/v1/Chassis/System.Embedded.1/NetworkAdapters/%s/NetworkDeviceFunctions/%s' % (idrac_ip, device_id, i), verify=verify_cert, headers={'X-Auth-Token': args["x"]})
-        else:
-            response = requests.get('https://%s/redfish/v1/Chassis/System.Embedded.1/NetworkAdapters/%s/NetworkDeviceFunctions/%s' % (idrac_ip, device_id, i), verify=verify_cert, auth=(idrac_username, idrac_password))
-        data = response.json()
-        if response.status_code != 200:
-            logging.error("\n- FAIL, get command failed, error is: %s" % data)
-            sys.exit(0)
-        message = "\n---- Network Port Information for %s ----\n" % i
+    for data in network_ports:
+        message = "\n---- Network Port Information for %s ----\n" % data["@odata.id"].split("/")[-1]
         open_file.writelines(message)
         open_file.writelines("\n")
         print(message)
@@ -601,7 +481,7 @@ def get_network_information():
                     message = "%s: %s" % (ii[0],ii[1])
                     open_file.writelines(message)
                     open_file.writelines("\n")
-                    print(message)  
+                    print(message)
             else:
                 message = "%s: %s" % (i[0], i[1])
                 open_file.writelines(message)
@@ -627,6 +507,10 @@ if __name__ == "__main__":
                 verify_cert = False
         else:
             verify_cert = False
+        http_session = requests.Session()
+        http_session.mount("https://", requests.adapters.HTTPAdapter(pool_maxsize=args["max_workers"]))
+        expand_supported = True
+        select_supported = True
         check_supported_idrac_version()
     else:
         logging.error("\n- FAIL, invalid argument values or not all required parameters passed in. See help text or argument --script-examples for more details.")
@@ -639,6 +523,7 @@ if __name__ == "__main__":
     date_timestamp = datetime.now()
     current_date_time="- Data collection timestamp: %s-%s-%s  %s:%s:%s\n" % (date_timestamp.month, date_timestamp.day, date_timestamp.year, date_timestamp.hour, date_timestamp.minute, date_timestamp.second)
     open_file.writelines(current_date_time)
+    inventory = {"iDRAC IP": idrac_ip, "Timestamp": str(date_timestamp)}
     if args["system"]:
         get_system_information()
     if args["memory"]:
@@ -666,3 +551,7 @@ if __name__ == "__main__":
         get_backplane_information()
         get_network_information()
     open_file.close()
+    if args["json_file"]:
+        with open(args["json_file"], "w") as json_file:
+            json.dump(inventory, json_file, indent=4)
+        logging.info("\n- INFO, inventory JSON document saved to file \"%s\"" % args["json_file"])
@@ -3,7 +3,7 @@
 # InstallFromRepositoryREDFISH. Python script using Redfish API with OEM extension to either get firmware version for all devices, get repository update list or install firmware from a repository on a network share.
 #
 # _author_ = Texas Roemer <Texas_Roemer@Dell.com>
-# _version_ = 19.0
+# _version_ = 20.1
 #
 # Copyright (c) 2019, Dell, Inc.
 #
@@ -16,7 +16,12 @@
 #
 
 import argparse
+import concurrent.futures
+import csv
+import functools
 import getpass
+import gzip
+import hashlib
 import json
 import logging
 import os
@@ -25,8 +30,10 @@ import re
 import requests
 import subprocess
 import sys
+import tempfile
 import time
 import warnings
+import xml.etree.ElementTree as ET
 
 from datetime import datetime
 from pprint import pprint
@@ -57,6 +64,11 @@ parser.add_argument('--rebootneeded', help='Pass in True to reboot the server to
 parser.add_argument('--catalogfile', help='Name of the catalog file on the repository. If the catalog file name is Catalog.xml on the network share, you don\'t need to pass in this argument', required=False)
 parser.add_argument('--apply-same-versions', help='This property indicates if same firmware version detected on the repository should be installed. Pass in a value of True indicates perform force re-installing of the same version. NOTE: This argument is optional.', dest="apply_same_versions", required=False)
 parser.add_argument('--apply-downgrade-versions', help='This property indicates if downgrading firmware version is allowed if an older version is detected on the repository for any device, pass in a value of True to downgrade. If only upgrades required pass in a value of False. NOTE: This argument is optional.', dest="apply_downgrade_versions", required=False)
+parser.add_argument('--get-applicable-updates', help='Get applicable updates for the server using a local catalog file, the catalog is parsed locally and not by the iDRAC. Argument --local-catalog is also required. To get applicable updates for multiple iDRACs use argument --csv-filename.', action="store_true", dest="get_applicable_updates", required=False)
+parser.add_argument('--local-catalog', help='Pass in local catalog file path, supported files are Catalog.xml or Catalog.xml.gz downloaded from Dell repository (example: https://downloads.dell.com/catalog/Catalog.xml.gz)', dest="local_catalog", required=False)
+parser.add_argument('--catalog-cache-dir', help='Pass in directory to cache catalog index, default value is catalog_cache. Catalog is only parsed again when the catalog file changes.', dest="catalog_cache_dir", default="catalog_cache", required=False)
+parser.add_argument('--csv-filename', help='Pass in CSV filename with iDRAC IP, iDRAC Username and iDRAC Password columns to get applicable updates for multiple iDRACs', dest="csv_filename", required=False)
+parser.add_argument('--max-workers', help='Max number of iDRACs to get applicable updates for at the same time, default value is 10', dest="max_workers", type=int, default=10, required=False)
 args=vars(parser.parse_args())
 logging.basicConfig(format='%(message)s', stream=sys.stdout, level=logging.INFO)
 
@@ -66,7 +78,9 @@ def script_examples():
     \n- InstallFromRepositoryREDFISH.py -ip 192.168.0.120 -u root -p calvin --get-critical-info, this example will get critical information from repo update list. 
     \n- InstallFromRepositoryREDFISH.py -ip 192.168.0.120 -u root -p calvin --install --shareip 192.168.0.130 --sharename cifs_share_vm\\R740xd_repo --username administrator --password password --applyupdate False --sharetype CIFS, this example to going to download the catalog file from the CIFS share repository but not install any updates. It\'s recommended now to execute the script with --get-repo-list argument to verify the repo update list.
     \n- InstallFromRepositoryREDFISH.py -ip 192.168.0.120 -u root -p calvin --install --shareip 192.168.0.130 --sharename cifs_share_vm\\R740xd_repo --username administrator --password password --applyupdate True --sharetype CIFS --rebootneeded True, this example is going to install updates from the CIFS share repository and apply them. If updates need a server reboot to apply, it will also reboot the server.
-    \n- InstallFromRepositoryREDFISH.py -ip 192.168.0.120 -u root -p calvin --install --shareip downloads.dell.com --sharetype HTTPS --applyupdate True --rebootneeded True, this example shows using Dell HTTPS downloads repository which is recommended to use. This repository is updated with the latest firmware versions for all devices iDRAC supports for updates.""")
+    \n- InstallFromRepositoryREDFISH.py -ip 192.168.0.120 -u root -p calvin --install --shareip downloads.dell.com --sharetype HTTPS --applyupdate True --rebootneeded True, this example shows using Dell HTTPS downloads repository which is recommended to use. This repository is updated with the latest firmware versions for all devices iDRAC supports for updates.
+    \n- InstallFromRepositoryREDFISH.py -ip 192.168.0.120 -u root -p calvin --get-applicable-updates --local-catalog C:\\Users\\administrator\\Downloads\\Catalog.xml.gz, this example will return devices which have a newer firmware version in the local catalog file.
+    \n- InstallFromRepositoryREDFISH.py --get-applicable-updates --local-catalog Catalog.xml.gz --csv-filename idrac_details.csv --max-workers 50, this example will return applicable updates for all iDRACs in the CSV file, catalog is only parsed once for all iDRACs.""")
     sys.exit(0)
 
 def check_supported_idrac_version():
@@ -109,6 +123,172 @@ def get_FW_inventory():
         pprint(i)
         print("\n")  
 
+def compare_versions(version_1, version_2):
+    # Copy of compare_versions() in FirmwareUpdateLocalRepoREDFISH.py, keep the code identical. Returns -1 (older), 0 (same) or 1 (newer) comparing number and letter parts
+    version_1_parts = [int(i) if i.isdigit() else i.lower() for i in re.findall(r"\d+|[A-Za-z]+", version_1)]
+    version_2_parts = [int(i) if i.isdigit() else i.lower() for i in re.findall(r"\d+|[A-Za-z]+", version_2)]
+    for i, ii in zip(version_1_parts, version_2_parts):
+        if i == ii:
+            continue
+        if type(i) != type(ii):
+            i, ii = str(i), str(ii)
+        return -1 if i < ii else 1
+    # Only non zero extra parts count, 1.0 and 1.0.0 are the same version
+    if [i for i in version_1_parts[len(version_2_parts):] if i != 0]:
+        return 1
+    if [i for i in version_2_parts[len(version_1_parts):] if i != 0]:
+        return -1
+    return 0
+
+def get_catalog_package(software_component):
+    package = {"Name": "", "Version": software_component.get("vendorVersion", ""), "Path": software_component.get("path", ""), "Criticality": "", "Component Type": "", "Systems": [], "Devices": []}
+    for i in software_component.iter():
+        tag = i.tag.split("}")[-1]
+        if tag == "Name" and not package["Name"]:
+            package["Name"] = "".join(i.itertext()).strip()
+        elif tag == "Criticality":
+            package["Criticality"] = i.get("value", "")
+        elif tag == "ComponentType":
+            package["Component Type"] = i.get("value", "")
+        elif tag == "Model" and i.get("systemID"):
+            package["Systems"].append(i.get("systemID").upper())
+        elif tag == "Device" and i.get("componentID"):
+            package["Devices"].append(i.get("componentID"))
+        elif tag == "PCIInfo":
+            package["Devices"].append(":".join(i.get(ii, "").lower() for ii in ["vendorID", "deviceID", "subVendorID", "subDeviceID"]))
+    return package
+
+def get_catalog_index(catalog_file):
+    # Catalog index is cached in --catalog-cache-dir using the catalog SHA-256 hash, catalog is only parsed again when the catalog file changes
+    catalog_hash = hashlib.sha256()
+    with open(catalog_file, "rb") as open_file:
+        for i in iter(lambda: open_file.read(1048576), b""):
+            catalog_hash.update(i)
+    cache_filename = os.path.join(args["catalog_cache_dir"], "catalog_index_%s.json" % catalog_hash.hexdigest())
+    if os.path.exists(cache_filename):
+        with open(cache_filename, "r") as cache_file:
+            return json.load(cache_file)
+    logging.info("- INFO, creating index for catalog file \"%s\"" % catalog_file)
+    # Index packages by system ID and device ID (component ID or PCI IDs), packages with no supported systems listed are indexed under system ID *
+    catalog_index = {"Catalog": os.path.basename(catalog_file), "Catalog Hash": catalog_hash.hexdigest(), "Packages": [], "Systems": {}}
+    if catalog_file.lower().endswith(".gz"):
+        catalog_stream = gzip.open(catalog_file, "rb")
+    else:
+        catalog_stream = open(catalog_file, "rb")
+    # iterparse streams the catalog, each top level element is cleared after it is parsed so the complete catalog XML tree is never held in memory
+    depth = 0
+    root = None
+    with catalog_stream:
+        try:
+            for event, elem in ET.iterparse(catalog_stream, events=("start", "end")):
+                if event == "start":
+                    if root is None:
+                        root = elem
+                    depth += 1
+                    continue
+                depth -= 1
+                if depth != 1:
+                    continue
+                if elem.tag.split("}")[-1] == "SoftwareComponent" and elem.get("path", "").lower().endswith(".exe"):
+                    package = get_catalog_package(elem)
+                    package_index = len(catalog_index["Packages"])
+                    for system_id in package.pop("Systems") or ["*"]:
+                        system_packages = catalog_index["Systems"].setdefault(system_id, {})
+                        for device_id in package["Devices"]:
+                            if package_index not in system_packages.setdefault(device_id, []):
+                                system_packages[device_id].append(package_index)
+                    catalog_index["Packages"].append(package)
+                root.clear()
+        except ET.ParseError as error_message:
+            logging.error("\n- FAIL, unable to parse catalog file \"%s\", error: %s" % (catalog_file, error_message))
+            sys.exit(0)
+    os.makedirs(args["catalog_cache_dir"], exist_ok=True)
+    with tempfile.NamedTemporaryFile("w", dir=args["catalog_cache_dir"], delete=False) as cache_file:
+        json.dump(catalog_index, cache_file)
+    os.replace(cache_file.name, cache_filename)
+    logging.info("- INFO, catalog index created, %s update packages detected for %s system IDs" % (len(catalog_index["Packages"]), len(catalog_index["Systems"])))
+    return catalog_index
+
+def get_firmware_inventory_member(idrac, uri):
+    response = idrac["session"].get('https://%s%s' % (idrac["iDRAC IP"], uri), verify=verify_cert)
+    if response.status_code != 200:
+        raise requests.RequestException("GET command failed to get firmware inventory member %s, status code %s returned" % (uri, response.status_code))
+    return response.json()
+
+def get_applicable_updates(idrac, catalog_index):
+    response = idrac["session"].get('https://%s/redfish/v1/Systems/System.Embedded.1' % idrac["iDRAC IP"], verify=verify_cert)
+    if response.status_code != 200:
+        raise requests.RequestException("GET command failed to get system ID, status code %s returned" % response.status_code)
+    system_id = response.json().get("Oem", {}).get("Dell", {}).get("DellSystem", {}).get("SystemID")
+    if system_id is None:
+        raise requests.RequestException("unable to locate system ID for the server")
+    system_id = "%04X" % int(system_id)
+    response = idrac["session"].get('https://%s/redfish/v1/UpdateService/FirmwareInventory?$expand=*($levels=1)' % idrac["iDRAC IP"], verify=verify_cert)
+    if response.status_code != 200:
+        raise requests.RequestException("GET command failed to get firmware inventory, status code %s returned" % response.status_code)
+    members = response.json()['Members']
+    # iDRAC versions which do not support $expand only return member URIs, installed members are then fetched at the same time
+    if [i for i in members if list(i.keys()) == ["@odata.id"]] != []:
+        installed_uris = [i["@odata.id"] for i in members if i["@odata.id"].rstrip("/").split("/")[-1].startswith("Installed")]
+        with concurrent.futures.ThreadPoolExecutor(max_workers=8) as executor:
+            members = list(executor.map(lambda x: get_firmware_inventory_member(idrac, x), installed_uris))
+    system_packages = catalog_index["Systems"].get(system_id, {})
+    all_system_packages = catalog_index["Systems"].get("*", {})
+    applicable_updates = []
+    for i in members:
+        if not i.get("Id", "").startswith("Installed"):
+            continue
+        software_inventory = i.get("Oem", {}).get("Dell", {}).get("DellSoftwareInventory", {})
+        device_ids = []
+        component_id = str(software_inventory.get("ComponentID") or i.get("SoftwareId") or "")
+        if component_id not in ["", "0"]:
+            device_ids.append(component_id)
+        if software_inventory.get("VendorID") and software_inventory.get("DeviceID"):
+            device_ids.append(":".join(str(software_inventory.get(ii) or "").lower() for ii in ["VendorID", "DeviceID", "SubVendorID", "SubDeviceID"]))
+        package_indexes = set()
+        for device_id in device_ids:
+            package_indexes.update(system_packages.get(device_id, []))
+            package_indexes.update(all_system_packages.get(device_id, []))
+        if not package_indexes:
+            continue
+        latest_package = max((catalog_index["Packages"][ii] for ii in package_indexes), key=functools.cmp_to_key(lambda x, y: compare_versions(x["Version"], y["Version"])))
+        if compare_versions(latest_package["Version"], i.get("Version", "")) > 0:
+            applicable_updates.append({"Device Name": i.get("Name", ""), "Installed Version": i.get("Version", ""), "Available Version": latest_package["Version"], "Package Path": latest_package["Path"], "Criticality": {"1": "Recommended", "2": "Urgent", "3": "Optional"}.get(latest_package["Criticality"], "NA")})
+    return applicable_updates
+
+def get_idrac_applicable_updates(idrac, catalog_index):
+    try:
+        idrac["Applicable Updates"] = get_applicable_updates(idrac, catalog_index)
+    except (requests.RequestException, ValueError) as error_message:
+        idrac["Error"] = str(error_message)
+    except KeyError as error_message:
+        idrac["Error"] = "key %s not found in iDRAC response" % error_message
+
+def get_applicable_updates_all_idracs(idracs):
+    catalog_index = get_catalog_index(args["local_catalog"])
+    # Catalog is indexed once and used to compute applicable updates for all iDRACs at the same time, iDRAC is only used to get system ID and firmware inventory
+    with concurrent.futures.ThreadPoolExecutor(max_workers=args["max_workers"]) as executor:
+        list(executor.map(lambda x: get_idrac_applicable_updates(x, catalog_index), idracs))
+    for i in idracs:
+        if i.get("Error"):
+            logging.error("\n- FAIL, unable to get applicable updates for iDRAC %s, error: %s" % (i["iDRAC IP"], i["Error"]))
+            continue
+        logging.info("\n- Applicable updates from catalog \"%s\" for iDRAC %s: %s -\n" % (catalog_index["Catalog"], i["iDRAC IP"], len(i["Applicable Updates"])))
+        for ii in i["Applicable Updates"]:
+            logging.info("%s, installed version: %s, available version: %s, criticality: %s, package: %s" % (ii["Device Name"], ii["Installed Version"], ii["Available Version"], ii["Criticality"], ii["Package Path"]))
+
+def get_csv_idracs(file_path):
+    idracs = []
+    with open(file_path, 'r', newline='') as csv_file:
+        csv_reader = csv.reader(csv_file)
+        for line_data in csv_reader:
+            if not line_data or "idrac ip" in line_data[0].lower():
+                continue
+            idrac = {"iDRAC IP": line_data[0].strip(), "session": requests.Session()}
+            idrac["session"].auth = (line_data[1].strip(), line_data[2].strip())
+            idracs.append(idrac)
+    return idracs
+
 def get_repo_based_update_list():
     try:
         os.remove("repo_based_update_list.xml")
@@ -152,30 +332,18 @@ def get_device_name_criticality_info():
         logging.error("\n- FAIL, POST command failed to get repo update list, status code is %s" % (response.status_code))
         logging.error("\n- POST command failure results:\n %s" % data)
         sys.exit(0)
+    # Repo update list is CIM XML, each INSTANCE element is one update package with PROPERTY elements
     try:
-        get_all_devices = re.findall("Criticality.+BaseLocation",data["PackageList"])
-    except:
-        logging.error("- FAIL, regex was unable to parse the XML to get criticality data")
+        root = ET.fromstring(data["PackageList"])
+    except ET.ParseError:
+        logging.error("- FAIL, unable to parse the XML to get criticality data")
         sys.exit(0)
-    for i in get_all_devices:
-        get_critical_value = re.search("Criticality.+?/",i).group()
-        if "1" in get_critical_value:
-            critical_string_value = "Criticality = (1)Recommended"
-        elif "2" in get_critical_value:
-            critical_string_value = "Criticality = (2)Urgent"
-        elif "3" in get_critical_value:
-            critical_string_value = "Criticality = (3)Optional"
-        else:
-            critical_string_value = "Criticality = NA"
-        try:
-            get_display_name = re.search("DisplayName.+?/VALUE",i).group()
-            get_display_name = re.sub("DisplayName\" TYPE=\"string\"><VALUE>","",get_display_name)
-            get_display_name = re.sub("</VALUE","",get_display_name)
-        except:
-            logging.error("- FAIL, regex was unable to parse the XML to get device name")
-            sys.exit(0)
-        get_display_name = "DeviceName = " + get_display_name
-        print(get_display_name)
+    for i in root.iter("INSTANCE"):
+        properties = {}
+        for ii in i.iter("PROPERTY"):
+            properties[ii.get("NAME")] = ii.findtext("VALUE", default="")
+        critical_string_value = {"1": "Criticality = (1)Recommended", "2": "Criticality = (2)Urgent", "3": "Criticality = (3)Optional"}.get(properties.get("Criticality", ""), "Criticality = NA")
+        print("DeviceName = %s" % properties.get("DisplayName", ""))
         print(critical_string_value)
         print("\n")
         
@@ -397,6 +565,13 @@ def check_schedule_update_job():
 if __name__ == "__main__":
     if args["script_examples"]:
         script_examples()
+    if args["get_applicable_updates"] and args["local_catalog"] and args["csv_filename"]:
+        if args["ssl"] and args["ssl"].lower() == "true":
+            verify_cert = True
+        else:
+            verify_cert = False
+        get_applicable_updates_all_idracs(get_csv_idracs(args["csv_filename"]))
+        sys.exit(0)
     if args["ip"] or args["ssl"] or args["u"] or args["p"] or args["x"]:
         idrac_ip = args["ip"]
         idrac_username = args["u"]
@@ -425,6 +600,13 @@ if __name__ == "__main__":
         get_repo_based_update_list()
     elif args["get_critical_info"]:
         get_device_name_criticality_info()
+    elif args["get_applicable_updates"] and args["local_catalog"]:
+        idrac = {"iDRAC IP": idrac_ip, "session": requests.Session()}
+        if args["x"]:
+            idrac["session"].headers.update({'X-Auth-Token': args["x"]})
+        else:
+            idrac["session"].auth = (idrac_username, idrac_password)
+        get_applicable_updates_all_idracs([idrac])
     elif args["install"] and args["shareip"] and args["sharetype"]:
         install_from_repository()
         logging.info("- INFO, script will now loop checking the repo update job status")
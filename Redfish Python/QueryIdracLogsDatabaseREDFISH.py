@@ -0,0 +1,152 @@
+#!/usr/bin/python3
+#
+# QueryIdracLogsDatabaseREDFISH. Python script to query iDRAC LC and SEL log entries stored in a local SQLite database for one or multiple iDRACs.
+#
+# _author_ = Texas Roemer <Texas_Roemer@Dell.com>
+# _version_ = 1.0
+#
+# Copyright (c) 2026, Dell, Inc.
+#
+# This software is licensed to you under the GNU General Public License,
+# version 2 (GPLv2). There is NO WARRANTY for this software, express or
+# implied, including the implied warranties of MERCHANTABILITY or FITNESS
+# FOR A PARTICULAR PURPOSE. You should have received a copy of GPLv2
+# along with this software; if not, see
+# http://www.gnu.org/licenses/old-licenses/gpl-2.0.txt.
+#
+#
+# Database file is created and updated by scripts GetIdracLcLogsREDFISH.py and GetIdracSelLogsREDFISH.py using argument --db-file.
+# Pass in the same database file name for all iDRACs to query log entries across multiple iDRACs. This script does not access the iDRAC.
+
+import argparse
+import json
+import logging
+import os
+import sqlite3
+import sys
+
+from datetime import datetime, timedelta, timezone
+from pprint import pprint
+
+parser = argparse.ArgumentParser(description="Python script to query iDRAC LC and SEL log entries stored in a local SQLite database for one or multiple iDRACs. Database is created by scripts GetIdracLcLogsREDFISH.py and GetIdracSelLogsREDFISH.py using argument --db-file.")
+parser.add_argument('--script-examples', help='Get executing script examples', action="store_true", dest="script_examples", required=False)
+parser.add_argument('--db-file', help='Pass in SQLite database file name', dest="db_file", required=False)
+parser.add_argument('--idrac-ip', help='Get only entries for specific iDRAC IP. To pass in multiple iDRAC IPs, use a comma separator', dest="idrac_ip", required=False)
+parser.add_argument('--log', help='Get only entries for specific log, supported values: lc and sel. If not passed in, entries for both logs are returned', choices=["lc", "sel"], required=False)
+parser.add_argument('--severity', help='Get only specific severity entries. Supported values: informational, warning or critical', choices=["informational", "warning", "critical"], required=False)
+parser.add_argument('--category', help='Get only specific category entries. Supported values: audit, configuration, updates, systemhealth or storage', required=False)
+parser.add_argument('--message-id', help='Get only entries for a specific message ID. You can pass in full message ID (example: IDRAC.2.9.PDR1001) or the start of the message ID without the registry prefix (example: PDR3 returns any message ID that starts with PDR3)', dest="message_id", required=False)
+parser.add_argument('--start-date', help='Get only entries created on or after this date. Value must be in this format: YYYY-MM-DDTHH:MM:SS-offset (example: 2023-03-14T10:10:10-05:00)', dest="start_date", required=False)
+parser.add_argument('--end-date', help='Get only entries created on or before this date. Value must be in this format: YYYY-MM-DDTHH:MM:SS-offset (example: 2023-03-15T14:55:10-05:00)', dest="end_date", required=False)
+parser.add_argument('--last-hours', help='Get only entries created in the last number of hours', dest="last_hours", type=float, required=False)
+parser.add_argument('--search', help='Get only entries where the message string contains this value', required=False)
+parser.add_argument('--get-idracs', help='Return only iDRAC IPs which have matching entries with the number of entries and last entry timestamp for each iDRAC', action="store_true", dest="get_idracs", required=False)
+parser.add_argument('--limit', help='Max number of entries to return, default value is 1000. Pass in 0 to return all entries', type=int, default=1000, required=False)
+parser.add_argument('--convert-json-output', help='Pass in this argument to dump output to the screen in JSON format instead of python object which then can be parsed using other tools', action="store_true", dest="convert_json_output", required=False)
+args = vars(parser.parse_args())
+logging.basicConfig(format='%(message)s', stream=sys.stdout, level=logging.INFO)
+
+def script_examples():
+    print("""\n- QueryIdracLogsDatabaseREDFISH.py --db-file idrac_logs.db --severity critical --last-hours 24, this example will return critical LC and SEL entries logged in the last 24 hours for all iDRACs in the database.
+    \n- QueryIdracLogsDatabaseREDFISH.py --db-file idrac_logs.db --message-id PDR3 --last-hours 24 --get-idracs, this example will return which iDRACs logged message ID starting with PDR3 in the last 24 hours.
+    \n- QueryIdracLogsDatabaseREDFISH.py --db-file idrac_logs.db --idrac-ip 192.168.0.120 --log lc --category storage, this example will return storage category LC log entries for one iDRAC.
+    \n- QueryIdracLogsDatabaseREDFISH.py --db-file idrac_logs.db --start-date 2023-03-15T14:55:10-05:00 --end-date 2023-03-15T14:57:07-05:00 --convert-json-output, this example will return entries within this date range for all iDRACs in JSON format.""")
+    sys.exit(0)
+
+def get_utc_timestamp(date_value):
+    try:
+        return datetime.strptime(date_value, "%Y-%m-%dT%H:%M:%S%z").astimezone(timezone.utc).strftime("%Y-%m-%dT%H:%M:%S")
+    except ValueError:
+        logging.error("\n- FAIL, invalid date value \"%s\", value must be in this format: YYYY-MM-DDTHH:MM:SS-offset" % date_value)
+        sys.exit(0)
+
+def create_query():
+    where = []
+    parameters = []
+    if args["idrac_ip"]:
+        idrac_ips = [i.strip() for i in args["idrac_ip"].split(",")]
+        where.append("idrac_ip IN (%s)" % ",".join("?" * len(idrac_ips)))
+        parameters.extend(idrac_ips)
+    if args["log"]:
+        where.append("log_name = ?")
+        parameters.append({"lc": "Lclog", "sel": "Sel"}[args["log"]])
+    if args["severity"]:
+        where.append("severity = ?")
+        parameters.append({"informational": "OK", "warning": "Warning", "critical": "Critical"}[args["severity"]])
+    if args["category"]:
+        where.append("category = ? COLLATE NOCASE")
+        parameters.append(args["category"])
+    if args["message_id"]:
+        if "." in args["message_id"]:
+            where.append("message_id LIKE ?")
+        else:
+            where.append("message_key LIKE ?")
+        parameters.append("%s%%" % args["message_id"])
+    if args["start_date"]:
+        where.append("created_utc >= ?")
+        parameters.append(get_utc_timestamp(args["start_date"]))
+    if args["end_date"]:
+        where.append("created_utc <= ?")
+        parameters.append(get_utc_timestamp(args["end_date"]))
+    if args["last_hours"]:
+        where.append("created_utc >= ?")
+        parameters.append((datetime.now(timezone.utc) - timedelta(hours=args["last_hours"])).strftime("%Y-%m-%dT%H:%M:%S"))
+    if args["search"]:
+        where.append("message LIKE ?")
+        parameters.append("%%%s%%" % args["search"])
+    if where:
+        where_string = " WHERE %s" % " AND ".join(where)
+    else:
+        where_string = ""
+    if args["get_idracs"]:
+        query = "SELECT idrac_ip, COUNT(*), MAX(created_utc) FROM log_entries%s GROUP BY idrac_ip ORDER BY idrac_ip" % where_string
+    else:
+        query = "SELECT idrac_ip, log_name, entry FROM log_entries%s ORDER BY created_utc DESC, idrac_ip" % where_string
+        if args["limit"]:
+            query += " LIMIT %s" % args["limit"]
+    return query, parameters
+
+def query_database():
+    if not os.path.exists(args["db_file"]):
+        logging.error("\n- FAIL, database file \"%s\" not found. Use argument --db-file with script GetIdracLcLogsREDFISH.py or GetIdracSelLogsREDFISH.py to create the database" % args["db_file"])
+        sys.exit(0)
+    connection = sqlite3.connect(args["db_file"])
+    query, parameters = create_query()
+    try:
+        rows = connection.execute(query, parameters).fetchall()
+    except sqlite3.DatabaseError as error_message:
+        logging.error("\n- FAIL, unable to query database file \"%s\", error: %s" % (args["db_file"], error_message))
+        sys.exit(0)
+    connection.close()
+    if rows == []:
+        logging.info("\n- WARNING, no log entries detected matching the query")
+        sys.exit(0)
+    if args["get_idracs"]:
+        idracs = [{"iDRAC IP": i[0], "Entries": i[1], "Last Entry UTC": i[2]} for i in rows]
+        if args["convert_json_output"]:
+            print(json.dumps(idracs))
+        else:
+            logging.info("\n- INFO, %s iDRAC(s) detected with matching log entries\n" % len(idracs))
+            for i in idracs:
+                print("%s, entries: %s, last entry (UTC): %s" % (i["iDRAC IP"], i["Entries"], i["Last Entry UTC"]))
+        return
+    entries = []
+    for i in rows:
+        entry = json.loads(i[2])
+        entry["iDRAC IP"] = i[0]
+        entry["Log"] = i[1]
+        entries.append(entry)
+    if args["convert_json_output"]:
+        print(json.dumps(entries))
+    else:
+        pprint(entries)
+        logging.info("\n- INFO, %s log entries returned" % len(entries))
+
+if __name__ == "__main__":
+    if args["script_examples"]:
+        script_examples()
+    if args["db_file"]:
+        query_database()
+    else:
+        logging.error("\n- FAIL, invalid argument values or not all required parameters passed in. See help text or argument --script-examples for more details.")
+        sys.exit(0)
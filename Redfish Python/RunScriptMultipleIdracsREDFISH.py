@@ -0,0 +1,207 @@
+#!/usr/bin/python3
+#
+# RunScriptMultipleIdracsREDFISH. Python script to execute any Redfish python script from this directory against multiple iDRACs at the same time.
+#
+# _author_ = Texas Roemer <Texas_Roemer@Dell.com>
+# _version_ = 1.1
+#
+# Copyright (c) 2026, Dell, Inc.
+#
+# This software is licensed to you under the GNU General Public License,
+# version 2 (GPLv2). There is NO WARRANTY for this software, express or
+# implied, including the implied warranties of MERCHANTABILITY or FITNESS
+# FOR A PARTICULAR PURPOSE. You should have received a copy of GPLv2
+# along with this software; if not, see
+# http://www.gnu.org/licenses/old-licenses/gpl-2.0.txt.
+#
+#
+# Inventory CSV file example:
+#
+#iDRAC IP	iDRAC Username	iDRAC Password
+#10.10.1.10	root	        calvin
+#11.11.1.11	root	        calvin
+#
+# Inventory YAML file example (requires PyYAML module, pip3 install pyyaml):
+#
+#- iDRAC IP: 10.10.1.10
+#  iDRAC Username: root
+#  iDRAC Password: calvin
+#- iDRAC IP: 11.11.1.11
+#
+# Note: If iDRAC username or password is not set for an iDRAC, script will use arguments -u and -p.
+#
+# Script pseudo code workflow:
+#
+# 1. Read the inventory file and get iDRAC IP, username and password for each iDRAC.
+# 2. Execute the script for each iDRAC on a thread or process pool, each iDRAC runs in its own output directory so files created by the script are not overwritten.
+# 3. Write one JSON or CSV report with results for all iDRACs.
+
+import argparse
+import concurrent.futures
+import csv
+import getpass
+import json
+import logging
+import os
+import shlex
+import subprocess
+import sys
+import time
+import warnings
+
+from datetime import datetime
+
+warnings.filterwarnings("ignore")
+
+parser = argparse.ArgumentParser(description="Python script to execute any Redfish python script from this directory against multiple iDRACs at the same time. Script executes the selected script once per iDRAC passing in -ip, -u and -p arguments and aggregates results for all iDRACs into one JSON or CSV report.")
+parser.add_argument('--script-examples', action="store_true", help='Prints script examples')
+parser.add_argument('--inventory', help='Pass in inventory filename, either CSV (.csv) or YAML (.yml or .yaml) file. See script header for file examples.', required=False)
+parser.add_argument('--script', help='Pass in Redfish python script name to execute for all iDRACs, example: GetFirmwareInventoryREDFISH.py. If the script is not in current directory, script will check this script directory.', required=False)
+parser.add_argument('--script-args', help='Pass in arguments to execute with the script besides -ip, -u and -p. Make sure to surround the value with double quotes, example: --script-args \"--get-attributes\"', dest="script_args", default="", required=False)
+parser.add_argument('-u', help='Default iDRAC username, used if username is not set for an iDRAC in the inventory file', required=False)
+parser.add_argument('-p', help='Default iDRAC password, used if password is not set for an iDRAC in the inventory file. If you pass in -u but not -p, script will prompt to enter user password which will not be echoed to the screen.', required=False)
+parser.add_argument('--max-workers', help='Max number of iDRACs to execute at the same time, default value is 10', dest="max_workers", type=int, default=10, required=False)
+parser.add_argument('--pool', help='Pool type used to execute the script, supported values: thread and process. Default value is thread.', choices=["thread", "process"], default="thread", required=False)
+parser.add_argument('--timeout', help='Timeout in seconds for the script to complete for each iDRAC, default value is 7200 (2 hours)', type=int, default=7200, required=False)
+parser.add_argument('--output-dir', help='Directory where each iDRAC output directory and the report are created, default value is fleet_output', dest="output_dir", default="fleet_output", required=False)
+parser.add_argument('--report', help='Pass in report filename, supported extensions are .json and .csv. Default value is fleet_report.json', default="fleet_report.json", required=False)
+
+args = vars(parser.parse_args())
+logging.basicConfig(format='%(message)s', stream=sys.stdout, level=logging.INFO)
+
+def script_examples():
+    print("""\n- RunScriptMultipleIdracsREDFISH.py --inventory idracs.csv --script GetFirmwareInventoryREDFISH.py, this example will get firmware inventory for all iDRACs in the CSV file, executing 10 iDRACs at the same time.
+    \n- RunScriptMultipleIdracsREDFISH.py --inventory idracs.yml --script GetSetBiosAttributesREDFISH.py --script-args \"--attribute-names MemTest --attribute-values Disabled --reboot\" --max-workers 50 --report bios_report.csv, this example will set BIOS attribute for all iDRACs in the YAML file, executing 50 iDRACs at the same time and create CSV report.
+    \n- RunScriptMultipleIdracsREDFISH.py --inventory idracs.csv -u root --script GetSystemHWInventoryREDFISH.py --script-args \"--all\" --pool process, this example will prompt to enter password for root user, used for all iDRACs which do not have username or password set in the CSV file.""")
+    sys.exit(0)
+
+def get_inventory(filename):
+    idracs = []
+    if filename.lower().endswith((".yml", ".yaml")):
+        try:
+            import yaml
+        except ImportError:
+            logging.error("\n- FAIL, PyYAML module is required to read YAML inventory file, install using \"pip3 install pyyaml\" or use CSV inventory file")
+            sys.exit(0)
+        with open(filename, "r") as yaml_file:
+            yaml_data = yaml.safe_load(yaml_file) or []
+        for i in yaml_data:
+            idracs.append({"iDRAC IP": str(i.get("iDRAC IP", "")), "iDRAC Username": str(i.get("iDRAC Username") or ""), "iDRAC Password": str(i.get("iDRAC Password") or "")})
+    else:
+        with open(filename, "r", newline="") as csv_file:
+            # Sniffer is not able to detect the delimiter when the file only has one column (iDRAC IP only), default to comma delimiter
+            try:
+                dialect = csv.Sniffer().sniff(csv_file.read(2048), delimiters=",\t;")
+            except csv.Error:
+                dialect = csv.excel
+            csv_file.seek(0)
+            csv_reader = csv.reader(csv_file, dialect)
+            for line_data in csv_reader:
+                line_data = [i.strip() for i in line_data]
+                if not line_data or not line_data[0] or line_data[0].startswith("#") or "idrac ip" in line_data[0].lower():
+                    continue
+                line_data += [""] * (3 - len(line_data))
+                idracs.append({"iDRAC IP": line_data[0], "iDRAC Username": line_data[1], "iDRAC Password": line_data[2]})
+    for i in idracs:
+        if not i["iDRAC Username"]:
+            i["iDRAC Username"] = idrac_username
+        if not i["iDRAC Password"]:
+            i["iDRAC Password"] = idrac_password
+    return [i for i in idracs if i["iDRAC IP"]]
+
+def run_script(script_path, script_args, idrac, output_dir, timeout):
+    idrac_output_dir = os.path.join(output_dir, idrac["iDRAC IP"].replace(":", "_"))
+    os.makedirs(idrac_output_dir, exist_ok=True)
+    command = [sys.executable, script_path, "-ip", idrac["iDRAC IP"]]
+    if idrac["iDRAC Username"]:
+        command += ["-u", idrac["iDRAC Username"]]
+    if idrac["iDRAC Password"]:
+        command += ["-p", idrac["iDRAC Password"]]
+    command += shlex.split(script_args)
+    result = {"iDRAC IP": idrac["iDRAC IP"], "Status": "", "Return Code": "", "Duration Seconds": 0, "Output Directory": idrac_output_dir, "Errors": [], "Output": ""}
+    start_time = time.time()
+    try:
+        process = subprocess.run(command, cwd=idrac_output_dir, stdin=subprocess.DEVNULL, stdout=subprocess.PIPE, stderr=subprocess.STDOUT, universal_newlines=True, timeout=timeout)
+        result["Return Code"] = process.returncode
+        result["Output"] = process.stdout
+    except subprocess.TimeoutExpired as error_message:
+        result["Status"] = "TIMEOUT"
+        result["Output"] = error_message.stdout or ""
+        if isinstance(result["Output"], bytes):
+            result["Output"] = result["Output"].decode(errors="replace")
+    result["Duration Seconds"] = round(time.time() - start_time, 1)
+    # Scripts log failures as "- FAIL" or "- ERROR" messages and do not always return a non zero exit code
+    result["Errors"] = [i.strip() for i in result["Output"].splitlines() if "- FAIL" in i or "- ERROR" in i or "Traceback" in i]
+    if not result["Status"]:
+        if result["Return Code"] != 0 or result["Errors"]:
+            result["Status"] = "FAIL"
+        else:
+            result["Status"] = "PASS"
+    with open(os.path.join(idrac_output_dir, "script_output.txt"), "w") as output_file:
+        output_file.write(result["Output"])
+    return result
+
+def write_report(results, report_filename):
+    if report_filename.lower().endswith(".csv"):
+        with open(report_filename, "w", newline="") as csv_file:
+            csv_writer = csv.writer(csv_file)
+            csv_writer.writerow(["iDRAC IP", "Status", "Return Code", "Duration Seconds", "Output Directory", "Errors", "Last Message"])
+            for i in results:
+                output_lines = [ii.strip() for ii in i["Output"].splitlines() if ii.strip()]
+                csv_writer.writerow([i["iDRAC IP"], i["Status"], i["Return Code"], i["Duration Seconds"], i["Output Directory"], " | ".join(i["Errors"]), output_lines[-1] if output_lines else ""])
+    else:
+        with open(report_filename, "w") as json_file:
+            json.dump({"Script": args["script"], "Script Arguments": args["script_args"], "Report Created": str(datetime.now()), "Results": results}, json_file, indent=4)
+
+def run_fleet():
+    script_path = args["script"]
+    if not os.path.isfile(script_path):
+        script_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), args["script"])
+    if not os.path.isfile(script_path):
+        logging.error("\n- FAIL, unable to locate script \"%s\"" % args["script"])
+        sys.exit(0)
+    script_path = os.path.abspath(script_path)
+    idracs = get_inventory(args["inventory"])
+    if idracs == []:
+        logging.error("\n- FAIL, no iDRACs detected in inventory file \"%s\"" % args["inventory"])
+        sys.exit(0)
+    output_dir = os.path.abspath(args["output_dir"])
+    os.makedirs(output_dir, exist_ok=True)
+    if args["pool"] == "process":
+        executor_class = concurrent.futures.ProcessPoolExecutor
+    else:
+        executor_class = concurrent.futures.ThreadPoolExecutor
+    logging.info("\n- INFO, executing script %s for %s iDRAC(s), max %s iDRAC(s) at the same time\n" % (os.path.basename(script_path), len(idracs), args["max_workers"]))
+    results = []
+    start_time = datetime.now()
+    with executor_class(max_workers=args["max_workers"]) as executor:
+        # Keep the inventory file index for each iDRAC, report is created in the same order as the inventory file
+        futures = {executor.submit(run_script, script_path, args["script_args"], i, output_dir, args["timeout"]): index for index, i in enumerate(idracs)}
+        for future in concurrent.futures.as_completed(futures):
+            try:
+                result = future.result()
+            except Exception as error_message:
+                result = {"iDRAC IP": idracs[futures[future]]["iDRAC IP"], "Status": "FAIL", "Return Code": "", "Duration Seconds": 0, "Output Directory": "", "Errors": [str(error_message)], "Output": ""}
+            results.append((futures[future], result))
+            logging.info("- %s, iDRAC %s completed in %s seconds (%s of %s)" % (result["Status"], result["iDRAC IP"], result["Duration Seconds"], len(results), len(idracs)))
+    results = [i[1] for i in sorted(results, key=lambda x: x[0])]
+    report_filename = args["report"]
+    if not os.path.isabs(report_filename):
+        report_filename = os.path.join(output_dir, report_filename)
+    write_report(results, report_filename)
+    passed = len([i for i in results if i["Status"] == "PASS"])
+    logging.info("\n- INFO, script execution complete for all iDRACs, total time: %s. PASS: %s, FAIL/TIMEOUT: %s" % (str(datetime.now() - start_time)[0:7], passed, len(results) - passed))
+    logging.info("- INFO, report created \"%s\"" % report_filename)
+
+if __name__ == "__main__":
+    if args["script_examples"]:
+        script_examples()
+    if args["inventory"] and args["script"]:
+        idrac_username = args["u"] or ""
+        idrac_password = args["p"] or ""
+        if args["u"] and not args["p"]:
+            idrac_password = getpass.getpass("\n- Argument -p not detected, pass in iDRAC user %s password: " % args["u"])
+        run_fleet()
+    else:
+        logging.error("\n- FAIL, invalid argument values or not all required parameters passed in. See help text or argument --script-examples for more details.")
+        sys.exit(0)
@@ -1,7 +1,7 @@
 #!/usr/bin/python3
 #
 # _author_ = Texas Roemer <Texas_Roemer@Dell.com>
-# _version_ = 1.0
+# _version_ = 2.1
 #
 # Copyright (c) 2025, Dell, Inc.
 #
@@ -29,6 +29,8 @@
 #
 # 1. Read the CSV file and get attribute names and values or each iDRAC listed.
 # 2. Script will loop through each iDRAC setting the attribute values as stated in the CSV file. 
+#    Before setting attributes, attribute names and values are validated against the attribute registry (type, possible values, min/max, read only and dependencies), iDRACs with invalid attributes are skipped.
+#    Registry is downloaded once per server model and iDRAC version, use argument --registry-cache-dir to also cache it between script runs.
 
 
 
@@ -37,6 +39,7 @@ import csv
 import getpass
 import json
 import logging
+import os
 import re
 import requests
 import sys
@@ -57,12 +60,16 @@ parser.add_argument('-p', help='iDRAC password, this is only supported to get at
 parser.add_argument('--get-idrac-attributes', help='Get all supported iDRAC attributes', action="store_true", dest="get_idrac_attributes", required=False)
 parser.add_argument('--get-system-attributes', help='Get all supported system attributes', action="store_true", dest="get_system_attributes", required=False)
 parser.add_argument('--get-lc-attributes', help='Get all supported lifecycle controller (LC) attributes', dest="get_lc_attributes", action="store_true", required=False)
+parser.add_argument('--registry-cache-dir', help='Pass in directory to cache the attribute registry used to validate attributes. Registry is only downloaded once per server model and iDRAC version and reused from the cache directory on next script run.', dest="registry_cache_dir", required=False)
+parser.add_argument('--skip-validation', help='Skip validating attribute names and values against the attribute registry before setting attributes', action="store_true", dest="skip_validation", required=False)
 
 args = vars(parser.parse_args())
 logging.basicConfig(format='%(message)s', stream=sys.stdout, level=logging.INFO)
+idrac_registry_cache = {}
 
 def script_examples():
     print("""\n- SetIdracLcSystemAttributesMultipleIdracsCsvFileREDFISH.py --csv-filename idrac_details.csv, this example will configure multiple attributes for multiple iDRACs using CSV file.
+    \n- SetIdracLcSystemAttributesMultipleIdracsCsvFileREDFISH.py --csv-filename idrac_details.csv --registry-cache-dir registry_cache, this example will configure multiple attributes for multiple iDRACs using CSV file, attribute registry used to validate attributes is cached in directory registry_cache.
     \n- python SetIdracLcSystemAttributesMultipleIdracsCsvFileREDFISH.py -ip 192.168.0.120 -u root -p calvin --get-idrac-attributes, this example will return iDRAC attributes for one iDRAC.""")
     return
 
@@ -93,12 +100,133 @@ def get_lc_attributes():
         sys.exit(0)
     pprint(data)
 
+def get_idrac_registry():
+    # Attribute registry is the same for all servers with the same model and iDRAC version, registry is only downloaded once per model and iDRAC version and shared by all iDRACs
+    model_version = []
+    for uri, property_name in [("Systems/System.Embedded.1", "Model"), ("Managers/iDRAC.Embedded.1", "FirmwareVersion")]:
+        response = requests.get('https://%s/redfish/v1/%s' % (idrac_ip, uri), verify=verify_cert,auth=(idrac_username, idrac_password))
+        data = response.json()
+        if response.status_code != 200:
+            logging.error("\n- FAIL, GET command failed to get server model and iDRAC version for iDRAC %s, status code %s returned" % (idrac_ip, response.status_code))
+            logging.error(data)
+            return None
+        model_version.append(data.get(property_name, ""))
+    registry_key = re.sub(r"[^\w.-]", "_", "idrac_%s_%s" % tuple(model_version))
+    if registry_key in idrac_registry_cache:
+        return idrac_registry_cache[registry_key]
+    registry_entries = None
+    if args["registry_cache_dir"]:
+        cache_filename = os.path.join(args["registry_cache_dir"], "%s.json" % registry_key)
+        if os.path.exists(cache_filename):
+            with open(cache_filename, "r") as cache_file:
+                registry_entries = json.load(cache_file)
+    if not registry_entries:
+        response = requests.get('https://%s/redfish/v1/Registries/ManagerAttributeRegistry/ManagerAttributeRegistry.v1_0_0.json' % idrac_ip, verify=verify_cert, auth=(idrac_username, idrac_password))
+        data = response.json()
+        if response.status_code != 200:
+            logging.error("\n- FAIL, GET command failed to get attribute registry for iDRAC %s, status code %s returned" % (idrac_ip, response.status_code))
+            logging.error(data)
+            return None
+        registry_entries = data["RegistryEntries"]
+        if args["registry_cache_dir"]:
+            if not os.path.isdir(args["registry_cache_dir"]):
+                os.makedirs(args["registry_cache_dir"])
+            with open(cache_filename, "w") as cache_file:
+                json.dump(registry_entries, cache_file)
+    idrac_registry_cache[registry_key] = {"Attributes": {}, "Dependencies": registry_entries.get("Dependencies", [])}
+    for i in registry_entries["Attributes"]:
+        idrac_registry_cache[registry_key]["Attributes"][i["AttributeName"]] = i
+    return idrac_registry_cache[registry_key]
+
+def check_map_from(map_from, attribute_values):
+    # True only when the MapFrom conditions evaluate true for the attribute values (terms joined by MapTerms AND/OR). Unknown condition, property or attribute returns False.
+    conditions_met = None
+    for i in map_from:
+        if i.get("MapFromProperty", "CurrentValue") != "CurrentValue" or i.get("MapFromAttribute") not in attribute_values:
+            return False
+        attribute_value = attribute_values[i["MapFromAttribute"]]
+        map_from_value = i.get("MapFromValue")
+        try:
+            condition_met = {"EQU": attribute_value == map_from_value, "NEQ": attribute_value != map_from_value, "GTR": attribute_value > map_from_value, "GEQ": attribute_value >= map_from_value, "LSS": attribute_value < map_from_value, "LEQ": attribute_value <= map_from_value}[i.get("MapFromCondition", "EQU")]
+        except (KeyError, TypeError):
+            return False
+        if conditions_met is None:
+            conditions_met = condition_met
+        elif i.get("MapTerms") == "OR":
+            conditions_met = conditions_met or condition_met
+        else:
+            conditions_met = conditions_met and condition_met
+    return bool(conditions_met)
+
+def validate_attributes(registry, attributes, current_attributes):
+    # Attribute checks match AttributeRegistryCache.validate_attributes() in IdracRedfishSupport module, keep both in sync. Unknown attribute name, ReadOnly, wrong type, value not in possible values, out of range LowerBound/UpperBound or MinLength/MaxLength is an error and attributes are not set. ValueExpression and registry dependencies are only reported as warnings, final check is done by the iDRAC. Returns converted attributes, errors and warnings.
+    validated_attributes = {}
+    errors = []
+    warnings = []
+    for attribute_name, attribute_value in attributes.items():
+        attribute = registry["Attributes"].get(attribute_name)
+        if attribute is None:
+            errors.append("attribute \"%s\" not found in the attribute registry, attribute name is case sensitive" % attribute_name)
+            continue
+        if attribute.get("ReadOnly"):
+            errors.append("attribute \"%s\" is read only" % attribute_name)
+            continue
+        if attribute.get("Type") == "Integer":
+            try:
+                attribute_value = int(attribute_value)
+            except (TypeError, ValueError):
+                errors.append("value \"%s\" for attribute \"%s\" is not an integer" % (attribute_value, attribute_name))
+                continue
+            if "LowerBound" in attribute and attribute_value < attribute["LowerBound"] or "UpperBound" in attribute and attribute_value > attribute["UpperBound"]:
+                errors.append("value %s for attribute \"%s\" is out of range, supported range: %s to %s" % (attribute_value, attribute_name, attribute.get("LowerBound", ""), attribute.get("UpperBound", "")))
+                continue
+        elif attribute.get("Type") == "Enumeration":
+            possible_values = [i["ValueName"] for i in attribute.get("Value", [])]
+            if possible_values and attribute_value not in possible_values:
+                errors.append("value \"%s\" for attribute \"%s\" is not a possible value, possible values: %s" % (attribute_value, attribute_name, ", ".join(possible_values)))
+                continue
+        elif attribute.get("Type") == "Boolean":
+            if str(attribute_value).lower() not in ["true", "false"]:
+                errors.append("value \"%s\" for attribute \"%s\" is not a boolean, possible values: true, false" % (attribute_value, attribute_name))
+                continue
+            attribute_value = str(attribute_value).lower() == "true"
+        elif attribute.get("Type") in ["String", "Password"]:
+            attribute_value = str(attribute_value)
+            if len(attribute_value) < attribute.get("MinLength", 0) or "MaxLength" in attribute and len(attribute_value) > attribute["MaxLength"]:
+                errors.append("value for attribute \"%s\" has length %s, supported length: %s to %s" % (attribute_name, len(attribute_value), attribute.get("MinLength", 0), attribute.get("MaxLength", "")))
+                continue
+            try:
+                if attribute.get("ValueExpression") and not re.search(attribute["ValueExpression"], attribute_value):
+                    warnings.append("value \"%s\" for attribute \"%s\" does not match value expression %s, iDRAC may reject the value" % (attribute_value, attribute_name, attribute["ValueExpression"]))
+            except re.error:
+                pass
+        validated_attributes[attribute_name] = attribute_value
+    attribute_values = dict(current_attributes)
+    attribute_values.update(validated_attributes)
+    for i in registry["Dependencies"]:
+        dependency = i.get("Dependency", {})
+        attribute_name = dependency.get("MapToAttribute")
+        if i.get("Type") != "Map" or attribute_name not in validated_attributes or not check_map_from(dependency.get("MapFrom", []), attribute_values):
+            continue
+        conditions = " ".join("%s %s %s %s" % (ii.get("MapTerms", ""), ii["MapFromAttribute"], ii.get("MapFromCondition", "EQU"), ii.get("MapFromValue")) for ii in dependency["MapFrom"]).strip()
+        map_to_property = dependency.get("MapToProperty")
+        map_to_value = dependency.get("MapToValue")
+        if map_to_property in ["ReadOnly", "GrayOut"] and map_to_value is True:
+            warnings.append("attribute \"%s\" may be read only when %s" % (attribute_name, conditions))
+        elif map_to_property == "CurrentValue" and validated_attributes[attribute_name] != map_to_value:
+            warnings.append("iDRAC may set attribute \"%s\" value to \"%s\" when %s" % (attribute_name, map_to_value, conditions))
+        elif map_to_property == "LowerBound" and isinstance(validated_attributes[attribute_name], int) and validated_attributes[attribute_name] < map_to_value:
+            warnings.append("value %s for attribute \"%s\" may be rejected, lower bound is %s when %s" % (validated_attributes[attribute_name], attribute_name, map_to_value, conditions))
+        elif map_to_property == "UpperBound" and isinstance(validated_attributes[attribute_name], int) and validated_attributes[attribute_name] > map_to_value:
+            warnings.append("value %s for attribute \"%s\" may be rejected, upper bound is %s when %s" % (validated_attributes[attribute_name], attribute_name, map_to_value, conditions))
+    return validated_attributes, errors, warnings
 
 def set_attributes():
     global idrac_ip
     global idrac_username
     global idrac_password 
     attributes_dict = {}
+    current_attributes = {}
     set_idrac_attributes = {"Attributes":{}}
     set_system_attributes = {"Attributes":{}}
     set_lc_attributes = {"Attributes":{}}
@@ -118,6 +246,7 @@ def set_attributes():
         logging.error("\n- FAIL, GET command failed to get iDRAC attributes to build dict, status code %s returned" % response.status_code)
         logging.error(data)
         sys.exit(0)
+    current_attributes.update(data["Attributes"])
     for i in attributes_dict.items():
         if i[0] in data["Attributes"].keys():
             set_idrac_attributes["Attributes"][i[0]] = i[1]
@@ -128,6 +257,7 @@ def set_attributes():
         logging.error("\n- FAIL, GET command failed to get System attributes to build dict, status code %s returned" % response.status_code)
         logging.error(data)
         sys.exit(0)
+    current_attributes.update(data["Attributes"])
     for i in attributes_dict.items():
         if i[0] in data["Attributes"].keys():
             set_system_attributes["Attributes"][i[0]] = i[1]
@@ -138,21 +268,31 @@ def set_attributes():
         logging.error("\n- FAIL, GET command failed to get LC attributes to build dict, status code %s returned" % response.status_code)
         logging.error(data)
         sys.exit(0)
+    current_attributes.update(data["Attributes"])
     for i in attributes_dict.items():
         if i[0] in data["Attributes"].keys():
             set_lc_attributes["Attributes"][i[0]] = i[1]
+    registry = get_idrac_registry()
+    if not registry:
+        return
+    if not args["skip_validation"]:
+        validated_attributes, errors, warnings = validate_attributes(registry, attributes_dict, current_attributes)
+        for i in warnings:
+            logging.warning("- WARNING, iDRAC %s: %s" % (idrac_ip, i))
+        if errors:
+            logging.error("\n- FAIL, attribute validation failed for iDRAC %s, attributes not set:" % idrac_ip)
+            for i in errors:
+                logging.error("  %s" % i)
+            return
+        for i in [set_idrac_attributes, set_system_attributes, set_lc_attributes]:
+            for ii in i["Attributes"]:
+                i["Attributes"][ii] = validated_attributes[ii]
     # Set iDRAC attributes
     if set_idrac_attributes["Attributes"] != {}:
         logging.info("- INFO, setting iDRAC attributes for iDRAC %s: %s" % (idrac_ip, set_idrac_attributes["Attributes"]))
         for i in set_idrac_attributes["Attributes"].items():
-            response = requests.get('https://%s/redfish/v1/Registries/ManagerAttributeRegistry/ManagerAttributeRegistry.v1_0_0.json' % idrac_ip, verify=verify_cert, auth=(idrac_username, idrac_password))
-            data = response.json()
-            for ii in data['RegistryEntries']['Attributes']:
-                if i[0] in ii.values():
-                    for iii in ii.items():
-                        if iii[0] == "Type":
-                            if iii[1] == "Integer":
-                                set_idrac_attributes["Attributes"][i[0]] = int(i[1])
+            if registry["Attributes"].get(i[0], {}).get("Type") == "Integer":
+                set_idrac_attributes["Attributes"][i[0]] = int(i[1])
         url = 'https://%s/redfish/v1/Managers/iDRAC.Embedded.1/Oem/Dell/DellAttributes/iDRAC.Embedded.1' % idrac_ip
         payload = set_idrac_attributes
         headers = {'content-type': 'application/json'}
@@ -173,14 +313,8 @@ def set_attributes():
     if set_system_attributes["Attributes"] != {}:
         logging.info("- INFO, setting System attributes for iDRAC %s: %s" % (idrac_ip, set_system_attributes["Attributes"]))
         for i in set_system_attributes["Attributes"].items():
-            response = requests.get('https://%s/redfish/v1/Registries/ManagerAttributeRegistry/ManagerAttributeRegistry.v1_0_0.json' % idrac_ip, verify=verify_cert, auth=(idrac_username, idrac_password))
-            data = response.json()
-            for ii in data['RegistryEntries']['Attributes']:
-                if i[0] in ii.values():
-                    for iii in ii.items():
-                        if iii[0] == "Type":
-                            if iii[1] == "Integer":
-                                set_system_attributes["Attributes"][i[0]] = int(i[1])
+            if registry["Attributes"].get(i[0], {}).get("Type") == "Integer":
+                set_system_attributes["Attributes"][i[0]] = int(i[1])
         url = 'https://%s/redfish/v1/Managers/iDRAC.Embedded.1/Oem/Dell/DellAttributes/System.Embedded.1' % idrac_ip
         payload = set_system_attributes
         headers = {'content-type': 'application/json'}
@@ -201,14 +335,8 @@ def set_attributes():
     if set_lc_attributes["Attributes"] != {}:
         logging.info("- INFO, setting LC attributes for iDRAC %s: %s" % (idrac_ip, set_lc_attributes["Attributes"]))
         for i in set_lc_attributes["Attributes"].items():
-            response = requests.get('https://%s/redfish/v1/Registries/ManagerAttributeRegistry/ManagerAttributeRegistry.v1_0_0.json' % idrac_ip, verify=verify_cert, auth=(idrac_username, idrac_password))
-            data = response.json()
-            for ii in data['RegistryEntries']['Attributes']:
-                if i[0] in ii.values():
-                    for iii in ii.items():
-                        if iii[0] == "Type":
-                            if iii[1] == "Integer":
-                                set_lc_attributes["Attributes"][i[0]] = int(i[1])
+            if registry["Attributes"].get(i[0], {}).get("Type") == "Integer":
+                set_lc_attributes["Attributes"][i[0]] = int(i[1])
         url = 'https://%s/redfish/v1/Managers/iDRAC.Embedded.1/Oem/Dell/DellAttributes/LifecycleController.Embedded.1' % idrac_ip
         payload = set_lc_attributes
         headers = {'content-type': 'application/json'}
@@ -1,7 +1,7 @@
 #!/usr/bin/python3
 #
 # _author_ = Texas Roemer <Texas_Roemer@Dell.com>
-# _version_ = 1.0
+# _version_ = 3.3
 #
 # Copyright (c) 2025, Dell, Inc.
 #
@@ -27,20 +27,25 @@
 # Script pseudo code workflow:
 #
 # 1. Read the CSV file and get attribute names and values or each iDRAC listed.
-# 2. Create a BIOS config job to set attributes, confirm job is scheduled and reboot the server.
-# 3. Script will repeat step 2 for each iDRAC until all iDRACs have jobs created (this is done so all jobs can run in parallel on all iDRACs).
-# 4. Loop each job until marked completed for all iDRACs.
+# 2. Validate attribute names and values against the BIOS attribute registry (type, possible values, min/max, read only and dependencies), iDRACs with invalid attributes are skipped.
+#    Registry is downloaded once per server model and BIOS version, use argument --registry-cache-dir to also cache it between script runs.
+# 3. Create a BIOS config job to set attributes, confirm job is scheduled and reboot the server.
+# 4. Steps 2 and 3 are executed for multiple iDRACs at the same time, argument --max-workers sets how many iDRACs (default 10).
+# 5. Loop polling all job IDs in one loop until marked completed or failed for all iDRACs.
 
 
 
 import argparse
+import concurrent.futures
 import csv
 import getpass
 import json
 import logging
+import os
 import re
 import requests
 import sys
+import threading
 import time
 import warnings
 
@@ -56,12 +61,23 @@ parser.add_argument('-ip',help='iDRAC IP address, this is only supported to get
 parser.add_argument('-u', help='iDRAC username, this is only supported to get BIOS attributes for one iDRAC.', required=False)
 parser.add_argument('-p', help='iDRAC password, this is only supported to get BIOS attributes for one iDRAC.', required=False)
 parser.add_argument('--get', help='Get all BIOS attributes', action="store_true", required=False)
+parser.add_argument('--max-workers', help='Max number of iDRACs to create BIOS config job and reboot at the same time, default value is 10', dest="max_workers", type=int, default=10, required=False)
+parser.add_argument('--registry-cache-dir', help='Pass in directory to cache BIOS attribute registry used to validate attributes. Registry is only downloaded once per server model and BIOS version and reused from the cache directory on next script run.', dest="registry_cache_dir", required=False)
+parser.add_argument('--skip-validation', help='Skip validating attribute names and values against the BIOS attribute registry before creating the config job', action="store_true", dest="skip_validation", required=False)
 
 args = vars(parser.parse_args())
 logging.basicConfig(format='%(message)s', stream=sys.stdout, level=logging.INFO)
+bios_registry_cache = {}
+bios_registry_lock = threading.Lock()
+bios_registry_locks = {}
+
+class IdracJobError(Exception):
+    pass
 
 def script_examples():
     print("""\n- python SetMultipleBiosAttributesMultipleIdracsCsvFileREDFISH.py --csv-filename idrac_details.csv, this example will configure multiple attributes for multiple iDRACs using CSV file.
+    \n- python SetMultipleBiosAttributesMultipleIdracsCsvFileREDFISH.py --csv-filename idrac_details.csv --max-workers 50, this example will configure multiple attributes for multiple iDRACs using CSV file, creating config jobs and rebooting 50 iDRACs at the same time.
+    \n- python SetMultipleBiosAttributesMultipleIdracsCsvFileREDFISH.py --csv-filename idrac_details.csv --registry-cache-dir registry_cache, this example will configure multiple attributes for multiple iDRACs using CSV file, BIOS attribute registry used to validate attributes is cached in directory registry_cache.
     \n- python SetMultipleBiosAttributesMultipleIdracsCsvFileREDFISH.py -ip 192.168.0.120 -u root -p calvin --get, this example will return BIOS attributes for one iDRAC.""")
     return
 
@@ -74,134 +90,312 @@ def get_bios_attributes():
         sys.exit(0)
     pprint(data)
 
+def get_csv_idracs(file_path):
+    idracs = []
+    with open(file_path, 'r', newline='') as csv_file:
+        csv_reader = csv.reader(csv_file)
+        for line_number, line_data in enumerate(csv_reader, start=1):
+            try:
+                if "idrac ip" in line_data[0].lower():
+                    csv_row_names = line_data
+                    csv_row_names[0] = "iDRAC IP"
+                    continue
+                else:
+                    idrac_details_attribute_values = line_data
+            except:
+                break
+            idrac = {"iDRAC IP": "", "iDRAC Username": "", "iDRAC Password": "", "Attributes": {}, "Job ID": "", "Job Status": "", "Message": ""}
+            for i,ii in zip(csv_row_names, idrac_details_attribute_values):
+                if "idrac ip" in i.lower():
+                    idrac["iDRAC IP"] = ii
+                elif "idrac username" in i.lower():
+                    idrac["iDRAC Username"] = ii
+                elif "idrac password" in i.lower():
+                    idrac["iDRAC Password"] = ii
+                else:
+                    idrac["Attributes"][i] = ii
+            idrac["session"] = requests.Session()
+            idrac["session"].auth = (idrac["iDRAC Username"], idrac["iDRAC Password"])
+            idracs.append(idrac)
+    return idracs
 
-def set_bios_attributes():
-    global job_id
-    global idrac_ip
-    global idrac_username
-    global idrac_password
-    payload = {"@Redfish.SettingsApplyTime":{"ApplyTime":"OnReset"},"Attributes":{}}
-    for i in attribute_dict.items():
-        if "idrac ip" in i[0].lower():
-            idrac_ip = i[1]
-        elif "idrac username" in i[0].lower():
-            idrac_username = i[1]
-        elif "idrac password" in i[0].lower():
-            idrac_password = i[1]
+def get_bios_registry(idrac):
+    # BIOS attribute registry is the same for all servers with the same model and BIOS version, registry is only downloaded once per model and BIOS version and shared by all iDRACs. Lock is per model and BIOS version so only iDRACs waiting on the same registry download wait on each other.
+    response = idrac["session"].get('https://%s/redfish/v1/Systems/System.Embedded.1' % idrac["iDRAC IP"], verify=verify_cert)
+    if response.status_code != 200:
+        raise IdracJobError("GET command failed to get server model and BIOS version, status code %s returned, detailed error results: %s" % (response.status_code, response.text))
+    data = response.json()
+    registry_key = re.sub(r"[^\w.-]", "_", "bios_%s_%s" % (data.get("Model", ""), data.get("BiosVersion", "")))
+    with bios_registry_lock:
+        registry_lock = bios_registry_locks.setdefault(registry_key, threading.Lock())
+    with registry_lock:
+        if registry_key in bios_registry_cache:
+            return bios_registry_cache[registry_key]
+        registry_entries = None
+        if args["registry_cache_dir"]:
+            cache_filename = os.path.join(args["registry_cache_dir"], "%s.json" % registry_key)
+            if os.path.exists(cache_filename):
+                with open(cache_filename, "r") as cache_file:
+                    registry_entries = json.load(cache_file)
+        if not registry_entries:
+            response = idrac["session"].get('https://%s/redfish/v1/Systems/System.Embedded.1/Bios/BiosRegistry' % idrac["iDRAC IP"], verify=verify_cert)
+            if response.status_code != 200:
+                raise IdracJobError("GET command failed to get BIOS attribute registry, status code %s returned, detailed error results: %s" % (response.status_code, response.text))
+            registry_entries = response.json()["RegistryEntries"]
+            if args["registry_cache_dir"]:
+                if not os.path.isdir(args["registry_cache_dir"]):
+                    os.makedirs(args["registry_cache_dir"])
+                with open(cache_filename, "w") as cache_file:
+                    json.dump(registry_entries, cache_file)
+        bios_registry_cache[registry_key] = {"Attributes": {}, "Dependencies": registry_entries.get("Dependencies", [])}
+        for i in registry_entries["Attributes"]:
+            bios_registry_cache[registry_key]["Attributes"][i["AttributeName"]] = i
+        return bios_registry_cache[registry_key]
+
+def check_map_from(map_from, attribute_values):
+    # Check if registry dependency MapFrom conditions are met, MapFrom terms are combined using MapTerms (AND or OR). Returns False if a condition can't be checked.
+    conditions_met = None
+    for i in map_from:
+        if i.get("MapFromProperty", "CurrentValue") != "CurrentValue" or i.get("MapFromAttribute") not in attribute_values:
+            return False
+        attribute_value = attribute_values[i["MapFromAttribute"]]
+        map_from_value = i.get("MapFromValue")
+        try:
+            condition_met = {"EQU": attribute_value == map_from_value, "NEQ": attribute_value != map_from_value, "GTR": attribute_value > map_from_value, "GEQ": attribute_value >= map_from_value, "LSS": attribute_value < map_from_value, "LEQ": attribute_value <= map_from_value}[i.get("MapFromCondition", "EQU")]
+        except (KeyError, TypeError):
+            return False
+        if conditions_met is None:
+            conditions_met = condition_met
+        elif i.get("MapTerms") == "OR":
+            conditions_met = conditions_met or condition_met
         else:
-            payload["Attributes"][i[0]] = i[1]
-    url = 'https://%s/redfish/v1/Systems/System.Embedded.1/Bios/Settings' % (idrac_ip)
+            conditions_met = conditions_met and condition_met
+    return bool(conditions_met)
+
+def validate_attributes(registry, attributes, current_attributes):
+    # Same checks as AttributeRegistryCache.validate_attributes() in IdracRedfishSupport module. Bad attribute name, ReadOnly, type, possible value, LowerBound/UpperBound or MinLength/MaxLength fails the iDRAC before the config job is created. ValueExpression and registry dependency results are only warnings since iDRAC makes the final decision on these. Returns attributes with values converted to the registry type, list of errors and list of warnings.
+    validated_attributes = {}
+    errors = []
+    warnings = []
+    for attribute_name, attribute_value in attributes.items():
+        attribute = registry["Attributes"].get(attribute_name)
+        if attribute is None:
+            errors.append("attribute \"%s\" not found in the attribute registry, attribute name is case sensitive" % attribute_name)
+            continue
+        if attribute.get("ReadOnly"):
+            errors.append("attribute \"%s\" is read only" % attribute_name)
+            continue
+        if attribute.get("Type") == "Integer":
+            try:
+                attribute_value = int(attribute_value)
+            except (TypeError, ValueError):
+                errors.append("value \"%s\" for attribute \"%s\" is not an integer" % (attribute_value, attribute_name))
+                continue
+            if "LowerBound" in attribute and attribute_value < attribute["LowerBound"] or "UpperBound" in attribute and attribute_value > attribute["UpperBound"]:
+                errors.append("value %s for attribute \"%s\" is out of range, supported range: %s to %s" % (attribute_value, attribute_name, attribute.get("LowerBound", ""), attribute.get("UpperBound", "")))
+                continue
+        elif attribute.get("Type") == "Enumeration":
+            possible_values = [i["ValueName"] for i in attribute.get("Value", [])]
+            if possible_values and attribute_value not in possible_values:
+                errors.append("value \"%s\" for attribute \"%s\" is not a possible value, possible values: %s" % (attribute_value, attribute_name, ", ".join(possible_values)))
+                continue
+        elif attribute.get("Type") == "Boolean":
+            if str(attribute_value).lower() not in ["true", "false"]:
+                errors.append("value \"%s\" for attribute \"%s\" is not a boolean, possible values: true, false" % (attribute_value, attribute_name))
+                continue
+            attribute_value = str(attribute_value).lower() == "true"
+        elif attribute.get("Type") in ["String", "Password"]:
+            attribute_value = str(attribute_value)
+            if len(attribute_value) < attribute.get("MinLength", 0) or "MaxLength" in attribute and len(attribute_value) > attribute["MaxLength"]:
+                errors.append("value for attribute \"%s\" has length %s, supported length: %s to %s" % (attribute_name, len(attribute_value), attribute.get("MinLength", 0), attribute.get("MaxLength", "")))
+                continue
+            try:
+                if attribute.get("ValueExpression") and not re.search(attribute["ValueExpression"], attribute_value):
+                    warnings.append("value \"%s\" for attribute \"%s\" does not match value expression %s, iDRAC may reject the value" % (attribute_value, attribute_name, attribute["ValueExpression"]))
+            except re.error:
+                pass
+        validated_attributes[attribute_name] = attribute_value
+    attribute_values = dict(current_attributes)
+    attribute_values.update(validated_attributes)
+    for i in registry["Dependencies"]:
+        dependency = i.get("Dependency", {})
+        attribute_name = dependency.get("MapToAttribute")
+        if i.get("Type") != "Map" or attribute_name not in validated_attributes or not check_map_from(dependency.get("MapFrom", []), attribute_values):
+            continue
+        conditions = " ".join("%s %s %s %s" % (ii.get("MapTerms", ""), ii["MapFromAttribute"], ii.get("MapFromCondition", "EQU"), ii.get("MapFromValue")) for ii in dependency["MapFrom"]).strip()
+        map_to_property = dependency.get("MapToProperty")
+        map_to_value = dependency.get("MapToValue")
+        if map_to_property in ["ReadOnly", "GrayOut"] and map_to_value is True:
+            warnings.append("attribute \"%s\" may be read only when %s" % (attribute_name, conditions))
+        elif map_to_property == "CurrentValue" and validated_attributes[attribute_name] != map_to_value:
+            warnings.append("iDRAC may set attribute \"%s\" value to \"%s\" when %s" % (attribute_name, map_to_value, conditions))
+        elif map_to_property == "LowerBound" and isinstance(validated_attributes[attribute_name], int) and validated_attributes[attribute_name] < map_to_value:
+            warnings.append("value %s for attribute \"%s\" may be rejected, lower bound is %s when %s" % (validated_attributes[attribute_name], attribute_name, map_to_value, conditions))
+        elif map_to_property == "UpperBound" and isinstance(validated_attributes[attribute_name], int) and validated_attributes[attribute_name] > map_to_value:
+            warnings.append("value %s for attribute \"%s\" may be rejected, upper bound is %s when %s" % (validated_attributes[attribute_name], attribute_name, map_to_value, conditions))
+    return validated_attributes, errors, warnings
+
+def validate_bios_attributes(idrac):
+    registry = get_bios_registry(idrac)
+    response = idrac["session"].get('https://%s/redfish/v1/Systems/System.Embedded.1/Bios?$select=Attributes' % idrac["iDRAC IP"], verify=verify_cert)
+    if response.status_code != 200:
+        raise IdracJobError("GET command failed to get BIOS attributes, status code %s returned, detailed error results: %s" % (response.status_code, response.text))
+    idrac["Attributes"], errors, warnings = validate_attributes(registry, idrac["Attributes"], response.json()["Attributes"])
+    for i in warnings:
+        logging.warning("- WARNING, iDRAC %s: %s" % (idrac["iDRAC IP"], i))
+    if errors:
+        raise IdracJobError("BIOS attribute validation failed, config job not created: %s" % "; ".join(errors))
+
+def set_bios_attributes(idrac):
+    payload = {"@Redfish.SettingsApplyTime":{"ApplyTime":"OnReset"},"Attributes":idrac["Attributes"]}
+    url = 'https://%s/redfish/v1/Systems/System.Embedded.1/Bios/Settings' % idrac["iDRAC IP"]
     headers = {'content-type': 'application/json'}
-    response = requests.patch(url, data=json.dumps(payload), headers=headers, verify=verify_cert,auth=(idrac_username,idrac_password))
+    response = idrac["session"].patch(url, data=json.dumps(payload), headers=headers, verify=verify_cert)
     if response.status_code == 202 or response.status_code == 200:
         logging.debug("\n- PASS: PATCH command passed to set BIOS attribute pending values and create next reboot config job, status code %s returned" % response.status_code)
     else:
-        logging.error("\n- FAIL, PATCH command failed to set BIOS attribute pending values and create next reboot config job, status code %s returned" % response.status_code)
-        data = response.json()
-        logging.error("\n- POST command failure:\n %s" % data)
-        sys.exit(0)
+        raise IdracJobError("PATCH command failed to set BIOS attribute pending values and create next reboot config job, status code %s returned, detailed error results: %s" % (response.status_code, response.text))
     try:
-        job_id = response.headers['Location'].split("/")[-1]
+        idrac["Job ID"] = response.headers['Location'].split("/")[-1]
     except:
-        logging.error("- FAIL, unable to locate job ID in JSON headers output")
-        sys.exit(0)
-    logging.info("- PASS, BIOS config job ID %s successfully created for iDRAC %s" % (job_id, idrac_ip))
+        raise IdracJobError("unable to locate job ID in JSON headers output")
+    logging.info("- PASS, BIOS config job ID %s successfully created for iDRAC %s" % (idrac["Job ID"], idrac["iDRAC IP"]))
 
-def get_job_status_scheduled():
+def get_job_status_scheduled(idrac):
     count = 0
     while True:
         if count == 5:
-            logging.error("- FAIL, GET job status retry count of 5 has been reached, script will exit")
-            sys.exit(0)
+            raise IdracJobError("GET job status retry count of 5 has been reached")
         try:
-            response = requests.get('https://%s/redfish/v1/Managers/iDRAC.Embedded.1/Oem/Dell/Jobs/%s' % (idrac_ip, job_id), verify=verify_cert,auth=(idrac_username, idrac_password))
+            response = idrac["session"].get('https://%s/redfish/v1/Managers/iDRAC.Embedded.1/Oem/Dell/Jobs/%s' % (idrac["iDRAC IP"], idrac["Job ID"]), verify=verify_cert)
         except requests.ConnectionError as error_message:
             logging.error(error_message)
-            logging.info("\n- INFO, GET request will try again to poll job status")
+            logging.info("\n- INFO, GET request will try again to poll job status for iDRAC %s" % idrac["iDRAC IP"])
             time.sleep(5)
             count += 1
             continue
         if response.status_code == 200:
             time.sleep(5)
         else:
-            logging.error("\n- FAIL, Command failed to check job status, return code %s" % response.status_code)
-            logging.error("Extended Info Message: {0}".format(response.json()))
-            return
+            raise IdracJobError("Command failed to check job status, return code %s, detailed error results: %s" % (response.status_code, response.text))
         data = response.json()
         if data['Message'] == "Task successfully scheduled.":
-            logging.info("- INFO, job ID %s successfully marked as scheduled for iDRAC %s" % (job_id, idrac_ip))
+            logging.info("- INFO, job ID %s successfully marked as scheduled for iDRAC %s" % (idrac["Job ID"], idrac["iDRAC IP"]))
             break
         else:
-            logging.info("- INFO: job status not scheduled, current status: %s" % data['Message'])
+            logging.info("- INFO: job status not scheduled for iDRAC %s, current status: %s" % (idrac["iDRAC IP"], data['Message']))
 
-def reboot_server():
-    response = requests.get("https://%s/redfish/v1/Systems/System.Embedded.1" % idrac_ip, verify=verify_cert,auth=(idrac_username, idrac_password))
+def reboot_server(idrac):
+    response = idrac["session"].get("https://%s/redfish/v1/Systems/System.Embedded.1" % idrac["iDRAC IP"], verify=verify_cert)
+    if response.status_code != 200:
+        raise IdracJobError("GET command failed to get current server power state, status code %s returned, detailed error results: %s" % (response.status_code, response.text))
     data = response.json()
-    logging.info("- INFO, Current server power state: %s" % data["PowerState"])
-    url = "https://%s/redfish/v1/Systems/System.Embedded.1/Actions/ComputerSystem.Reset" % idrac_ip
+    logging.info("- INFO, Current server power state for iDRAC %s: %s" % (idrac["iDRAC IP"], data["PowerState"]))
+    url = "https://%s/redfish/v1/Systems/System.Embedded.1/Actions/ComputerSystem.Reset" % idrac["iDRAC IP"]
     headers = {"content-type": "application/json"}
     if data["PowerState"] == "On":
         payload = {"ResetType": "ForceRestart"}
-        response = requests.post(url, data=json.dumps(payload), headers=headers, verify=verify_cert,auth=(idrac_username,idrac_password))
+        response = idrac["session"].post(url, data=json.dumps(payload), headers=headers, verify=verify_cert)
         if response.status_code == 204:
-            logging.info("- PASS, POST command passed to reboot the server for iDRAC %s" % idrac_ip)
+            logging.info("- PASS, POST command passed to reboot the server for iDRAC %s" % idrac["iDRAC IP"])
         else:
-            logging.error("\n- FAIL, POST command failed to reboot the server, status code is: %s\n" % response.status_code)
-            logging.error("Extended Info Message: {0}".format(response.json()))
-            sys.exit(0)    
+            raise IdracJobError("POST command failed to reboot the server, status code %s returned, detailed error results: %s" % (response.status_code, response.text))
     elif data["PowerState"] == "Off":
         payload = {"ResetType": "On"}
-        response = requests.post(url, data=json.dumps(payload), headers=headers, verify=verify_cert,auth=(idrac_username,idrac_password))
+        response = idrac["session"].post(url, data=json.dumps(payload), headers=headers, verify=verify_cert)
         if response.status_code == 204:
-            logging.info("- PASS, POST command passed to power ON server for iDRAC %s" % idrac_ip)
+            logging.info("- PASS, POST command passed to power ON server for iDRAC %s" % idrac["iDRAC IP"])
         else:
-            logging.error("\n- FAIL, POST command failed to power ON server, status code is: %s\n" % response.status_code)
-            logging.error("Extended Info Message: {0}".format(response.json()))
-            sys.exit(0)
+            raise IdracJobError("POST command failed to power ON server, status code %s returned, detailed error results: %s" % (response.status_code, response.text))
     else:
-        logging.error("- FAIL, unable to get current server power state to perform either reboot or power on")
-        sys.exit(0)
-    
+        raise IdracJobError("unable to get current server power state to perform either reboot or power on")
 
-def loop_job_status_final(idrac_ip, idrac_username, idrac_password, job_id):
+def create_job_reboot_server(idrac):
+    try:
+        if not args["skip_validation"]:
+            validate_bios_attributes(idrac)
+        set_bios_attributes(idrac)
+        get_job_status_scheduled(idrac)
+        reboot_server(idrac)
+    # Any failure only stops this iDRAC, jobs already created and servers already rebooted for other iDRACs are still monitored
+    except Exception as error_message:
+        idrac["Job Status"] = "Failed"
+        idrac["Message"] = str(error_message)
+        logging.error("- FAIL, iDRAC %s: %s" % (idrac["iDRAC IP"], error_message))
+
+def check_job_status(idrac):
+    try:
+        response = idrac["session"].get('https://%s/redfish/v1/Managers/iDRAC.Embedded.1/Oem/Dell/Jobs/%s' % (idrac["iDRAC IP"], idrac["Job ID"]), verify=verify_cert, timeout=60)
+        if response.status_code == 200:
+            data = response.json()
+            job_message = str(data['Message'])
+            job_state = data['JobState']
+    except (requests.RequestException, ValueError, KeyError, TypeError) as error_message:
+        # Connection error, timeout or incomplete job payload while the server reboots or iDRAC is busy, job is checked again next loop
+        idrac["Retry Count"] = idrac.get("Retry Count", 0) + 1
+        logging.info("- INFO, GET request failed for iDRAC %s, error: %s, retry" % (idrac["iDRAC IP"], error_message))
+        if idrac["Retry Count"] == 20:
+            idrac["Job Status"] = "Failed"
+            idrac["Message"] = "GET command retry count of 20 has been reached, last error: %s" % error_message
+            logging.warning("- WARNING, GET command retry count of 20 has been reached for iDRAC %s" % idrac["iDRAC IP"])
+        return
+    if response.status_code != 200:
+        idrac["Job Status"] = "Failed"
+        idrac["Message"] = "GET command failed to check job status, return code is %s" % response.status_code
+        logging.error("\n- FAIL, GET command failed to check job status for iDRAC %s, return code is %s" % (idrac["iDRAC IP"], response.status_code))
+        logging.error("Extended Info Message: {0}".format(response.text))
+        return
+    idrac["Retry Count"] = 0
+    if "Fail" in job_message or "fail" in job_message or job_state == "Failed":
+        idrac["Job Status"] = "Failed"
+        idrac["Message"] = job_message
+        logging.error("- FAIL: job ID %s failed for iDRAC %s, failed message is: %s" % (idrac["Job ID"], idrac["iDRAC IP"], job_message))
+    elif job_state == "Completed":
+        idrac["Job Status"] = "Completed"
+        idrac["Message"] = job_message
+        logging.info("\n- PASS, Job %s successfully marked completed for iDRAC %s" % (idrac["Job ID"], idrac["iDRAC IP"]))
+    else:
+        logging.info("- INFO, job %s not completed for iDRAC %s, current status: \"%s\"" % (idrac["Job ID"], idrac["iDRAC IP"], job_message.rstrip(".")))
+
+def loop_job_status_final(idracs):
     start_time = datetime.now()
-    retry_count = 1
-    while True:
-        if retry_count == 20:
-            logging.warning("- WARNING, GET command retry count of 20 has been reached, script will exit")
-            sys.exit(0)
-        try:
-            response = requests.get('https://%s/redfish/v1/Managers/iDRAC.Embedded.1/Oem/Dell/Jobs/%s' % (idrac_ip, job_id), verify=verify_cert,auth=(idrac_username, idrac_password))
-        except requests.ConnectionError as error_message:
-            logging.info("- INFO, GET request failed due to connection error, retry")
-            if "powercyclerequest" in args["attribute_names"].lower():
+    with concurrent.futures.ThreadPoolExecutor(max_workers=args["max_workers"]) as executor:
+        while True:
+            running_jobs = [i for i in idracs if i["Job ID"] and not i["Job Status"]]
+            if running_jobs == []:
+                break
+            current_time = (datetime.now()-start_time)
+            if str(current_time)[0:7] >= "2:00:00":
+                logging.error("\n- FAIL: Timeout of 2 hours has been hit, script stopped\n")
+                for i in running_jobs:
+                    i["Job Status"] = "Timeout"
+                break
+            futures = {executor.submit(check_job_status, i): i for i in running_jobs}
+            for future in concurrent.futures.as_completed(futures):
+                # Any other failure only stops checking the job for this iDRAC, job status is still checked for all other iDRACs
+                try:
+                    future.result()
+                except Exception as error_message:
+                    futures[future]["Job Status"] = "Failed"
+                    futures[future]["Message"] = "unable to check job status, error: %s" % error_message
+                    logging.error("- FAIL, unable to check job status for iDRAC %s, error: %s" % (futures[future]["iDRAC IP"], error_message))
+            running_jobs = [i for i in running_jobs if not i["Job Status"]]
+            if running_jobs == []:
+                break
+            # Connection errors are expected while the server is virtual a/c cycled for PowerCycleRequest attribute
+            if [i for i in running_jobs if i.get("Retry Count") and "powercyclerequest" in [ii.lower() for ii in i["Attributes"]]]:
                 logging.info("- INFO, PowerCycleRequest attribute detected, virtual a/c cycle is running. Script will sleep for 180 seconds, retry")
                 time.sleep(180)
-            else:
+            elif [i for i in running_jobs if i.get("Retry Count")]:
                 time.sleep(60)
-            retry_count += 1
-            continue
-        current_time = (datetime.now()-start_time)
-        if response.status_code != 200:
-            logging.error("\n- FAIL, GET command failed to check job status, return code is %s" % response.status_code)
-            logging.error("Extended Info Message: {0}".format(req.json()))
-            return
-        data = response.json()
-        if str(current_time)[0:7] >= "2:00:00":
-            logging.error("\n- FAIL: Timeout of 2 hours has been hit, script stopped\n")
-            return
-        elif "Fail" in data['Message'] or "fail" in data['Message'] or data['JobState'] == "Failed":
-            logging.error("- FAIL: job ID %s failed, failed message is: %s" % (job_id, data['Message']))
-            return
-        elif data['JobState'] == "Completed":
-            logging.info("\n- PASS, Job %s successfully marked completed for iDRAC %s" % (job_id, idrac_ip))
-            break
-        else:
-            logging.info("- INFO, job %s not completed for iDRAC %s, current status: \"%s\"" % (job_id, idrac_ip, data['Message'].rstrip(".")))
-            time.sleep(10)
+            else:
+                time.sleep(10)
 
+def print_final_job_results(idracs):
+    logging.info("\n- Final job status results for all iDRACs -\n")
+    for i in idracs:
+        logging.info("iDRAC %s, job ID: %s, job status: %s, message: %s" % (i["iDRAC IP"], i["Job ID"], i["Job Status"], i["Message"]))
 
-            
 if __name__ == "__main__":
     verify_cert = False
     if args["script_examples"]:
@@ -209,36 +403,12 @@ if __name__ == "__main__":
     elif args["get"]:
         get_bios_attributes()
     elif args["csv_filename"]:
-        file_path = args["csv_filename"]
-        count = 1
-        idrac_config_jobs = {}
-        # Get contents from CSV file 
-        with open(file_path, 'r', newline='') as csv_file:
-            csv_reader = csv.reader(csv_file)
-            idrac_dict = {}
-            for line_number, line_data in enumerate(csv_reader, start=1):
-                try:
-                    if "idrac ip" in line_data[0].lower():
-                        csv_row_names = line_data
-                        csv_row_names[0] = "iDRAC IP"
-                        continue
-                    else:
-                        idrac_details_attribute_values = line_data
-                except:
-                    break
-                attribute_dict = {}
-                for i,ii in zip(csv_row_names, idrac_details_attribute_values):
-                    attribute_dict[i] = ii
-                idrac_name ="idrac%s" % count
-                idrac_dict[idrac_name]= {"iDRAC IP": attribute_dict["iDRAC IP"], "iDRAC Username": attribute_dict["iDRAC Username"], "iDRAC Password": attribute_dict["iDRAC Password"], "Job ID" : ""}
-                set_bios_attributes()
-                idrac_dict[idrac_name]["Job ID"] = job_id
-                get_job_status_scheduled()
-                reboot_server()
-                count += 1
-            logging.info("- INFO, script will now loop polling the job ID status for each iDRAC until the job is marked completed")
-            for i in idrac_dict.items():
-                idrac_ip = i[1]["iDRAC IP"]
-                loop_job_status_final(i[1]["iDRAC IP"], i[1]["iDRAC Username"], i[1]["iDRAC Password"], i[1]["Job ID"])     
+        idracs = get_csv_idracs(args["csv_filename"])
+        # Create BIOS config jobs and reboot multiple iDRACs at the same time so all jobs run in parallel
+        with concurrent.futures.ThreadPoolExecutor(max_workers=args["max_workers"]) as executor:
+            list(executor.map(create_job_reboot_server, idracs))
+        logging.info("- INFO, script will now loop polling the job ID status for all iDRACs until the job is marked completed")
+        loop_job_status_final(idracs)
+        print_final_job_results(idracs)
     else:
         logging.error("\n- FAIL, invalid argument values or not all required parameters passed in. See help text or argument --script-examples for more details.")
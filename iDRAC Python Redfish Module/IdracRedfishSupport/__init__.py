@@ -14,105 +14,844 @@
 #
 # Python module for iDRAC Redfish support to perform multiple workflows. 
 
+import asyncio
 import base64
+import bisect
+import concurrent.futures
+import contextlib
 import getpass
+import hashlib
 import json
 import logging
 import os
 import platform
+import random
 import re
 import requests
+import ssl
 import sys
+import tempfile
+import threading
 import time
 import warnings
+import weakref
 
 from datetime import datetime
 from pprint import pprint
 
+try:
+    import aiohttp
+except ImportError:
+    aiohttp = None
+
 warnings.filterwarnings("ignore")
 logging.basicConfig(format='%(message)s', stream=sys.stdout, level=logging.INFO)
 
+class RedfishCache(object):
+    """Class for on-disk cache of Redfish GET responses which return an ETag header. Cached response is validated with the iDRAC using If-None-Match header, if iDRAC returns status code 304 (not modified) the cached response body is used instead of downloading the resource again. Least recently used responses are deleted once cache directory size is over max_size_mb. Job and task URIs are never cached since their status changes on every poll. Supported arguments: cache_dir and max_size_mb."""
+    no_cache_uri_pattern = re.compile(r"/(Jobs|Tasks)(/|\?|$)")
+
+    def __init__(self, cache_dir="redfish_cache", max_size_mb=100):
+        self.cache_dir = cache_dir
+        self.max_size = int(max_size_mb * 1024 * 1024)
+        self.cache_size = None
+        self.lock = threading.Lock()
+        if not os.path.isdir(cache_dir):
+            os.makedirs(cache_dir)
+
+    def is_cacheable(self, url):
+        """Function to check if GET response for the URL can be cached, returns False for job and task URIs"""
+        return not self.no_cache_uri_pattern.search(url)
+
+    def get_filename(self, url):
+        return os.path.join(self.cache_dir, "%s.json" % hashlib.sha1(url.encode()).hexdigest())
+
+    def get(self, url):
+        """Function to return cached entry dictionary (url, etag, headers and body) for the URL, returns None if URL is not cached"""
+        try:
+            with open(self.get_filename(url), "r") as cache_file:
+                cache_entry = json.load(cache_file)
+        except (IOError, OSError, ValueError):
+            return None
+        if cache_entry.get("url") != url:
+            return None
+        return cache_entry
+
+    def set(self, url, response):
+        """Function to cache GET response for the URL, response must include an ETag header. Cache directory is only scanned for eviction once the tracked cache size is over max size."""
+        cache_entry = {"url": url, "etag": response.headers["ETag"], "headers": dict(response.headers), "body": response.content.decode("utf-8", "replace")}
+        filename = self.get_filename(url)
+        # Temp file name is unique across processes, cache_dir can be shared by multiple scripts
+        with tempfile.NamedTemporaryFile("w", dir=self.cache_dir, prefix=".%s." % os.path.basename(filename), suffix=".tmp", delete=False) as cache_file:
+            json.dump(cache_entry, cache_file)
+        temp_filename = cache_file.name
+        try:
+            old_size = os.path.getsize(filename)
+        except OSError:
+            old_size = 0
+        new_size = os.path.getsize(temp_filename)
+        os.replace(temp_filename, filename)
+        with self.lock:
+            if self.cache_size is not None:
+                self.cache_size += new_size - old_size
+            evict_needed = self.cache_size is None or self.cache_size > self.max_size
+        if evict_needed:
+            self.evict()
+
+    def create_response(self, url, cache_entry, not_modified_response):
+        """Function to return requests response object for a cached entry, used when iDRAC returns status code 304. File modified time is updated to mark the entry as recently used."""
+        try:
+            os.utime(self.get_filename(url), None)
+        except OSError:
+            pass
+        response = requests.models.Response()
+        response.status_code = 200
+        response.reason = "OK"
+        response.url = url
+        response.headers = requests.structures.CaseInsensitiveDict(cache_entry["headers"])
+        response.encoding = "utf-8"
+        response._content = cache_entry["body"].encode("utf-8")
+        response.request = not_modified_response.request
+        response.elapsed = not_modified_response.elapsed
+        return response
+
+    def evict(self):
+        """Function to delete least recently used cached entries until cache directory size is under 90 percent of max size, so the next writes do not trigger another scan right away"""
+        with self.lock:
+            cache_files = []
+            for i in os.listdir(self.cache_dir):
+                if not i.endswith(".json"):
+                    continue
+                try:
+                    file_stat = os.stat(os.path.join(self.cache_dir, i))
+                except OSError:
+                    continue
+                cache_files.append((file_stat.st_mtime, file_stat.st_size, os.path.join(self.cache_dir, i)))
+            cache_size = sum(i[1] for i in cache_files)
+            if cache_size > self.max_size:
+                for i in sorted(cache_files):
+                    if cache_size <= self.max_size * 0.9:
+                        break
+                    try:
+                        os.remove(i[2])
+                    except OSError:
+                        continue
+                    cache_size -= i[1]
+            self.cache_size = cache_size
+
+    def clear(self):
+        """Function to delete all cached entries"""
+        with self.lock:
+            for i in os.listdir(self.cache_dir):
+                if i.endswith(".json"):
+                    os.remove(os.path.join(self.cache_dir, i))
+            self.cache_size = 0
+
+class AttributeRegistryCache(object):
+    """Class for local cache of BIOS and iDRAC attribute registries. Attribute registry is the same for all servers with the same model and BIOS or iDRAC firmware version, registry is only downloaded once per (model, firmware version) and saved in cache_dir which can be shared by multiple iDRACs, for example a directory on a network share used for a fleet of servers. Loaded registries are kept in memory indexed by AttributeName so attribute names, types and possible values can be checked without a Redfish call. Supported argument: cache_dir."""
+    registry_uris = {"bios": "/redfish/v1/Systems/System.Embedded.1/Bios/BiosRegistry", "idrac": "/redfish/v1/Registries/ManagerAttributeRegistry/ManagerAttributeRegistry.v1_0_0.json"}
+
+    def __init__(self, cache_dir="attribute_registry_cache"):
+        self.cache_dir = cache_dir
+        self.registries = {}
+        self.registry_keys = {}
+        self.lock = threading.Lock()
+        if not os.path.isdir(cache_dir):
+            os.makedirs(cache_dir)
+
+    def get_uri(self, session, uri):
+        if session.x_auth_token == "yes":
+            response = session.client.get('https://%s%s' % (session.creds["idrac_ip"], uri),verify=session.creds["verify_cert"],headers={'X-Auth-Token': session.creds["idrac_x_auth_token"]})
+        else:
+            response = session.client.get('https://%s%s' % (session.creds["idrac_ip"], uri),verify=session.creds["verify_cert"],auth=(session.creds["idrac_username"], session.creds["idrac_password"]))
+        if response.status_code != 200:
+            raise requests.exceptions.HTTPError("GET on URI %s failed, status code %s returned" % (uri, response.status_code), response=response)
+        return response.json()
+
+    def get_registry_key(self, registry_type, session):
+        """Function to return registry key tuple (registry type, server model, BIOS or iDRAC firmware version) for the session iDRAC. Key is captured once per iDRAC, call clear_registry_keys() after a BIOS or iDRAC firmware update."""
+        with self.lock:
+            registry_key = self.registry_keys.get((session.creds["idrac_ip"], registry_type))
+        if registry_key:
+            return registry_key
+        data = self.get_uri(session, "/redfish/v1/Systems/System.Embedded.1")
+        if registry_type == "bios":
+            registry_key = (registry_type, data.get("Model", ""), data.get("BiosVersion", ""))
+        else:
+            registry_key = (registry_type, data.get("Model", ""), self.get_uri(session, "/redfish/v1/Managers/iDRAC.Embedded.1").get("FirmwareVersion", ""))
+        with self.lock:
+            self.registry_keys[(session.creds["idrac_ip"], registry_type)] = registry_key
+        return registry_key
+
+    def clear_registry_keys(self):
+        """Function to clear captured model and firmware versions for all iDRACs, next registry lookup will get them again"""
+        with self.lock:
+            self.registry_keys = {}
+
+    def get_registry(self, registry_type, session=None):
+        """Function to return attribute registry for the session iDRAC (default is current script session). Supported registry_type values: bios and idrac. Returns dictionary with keys Attributes (dictionary of attribute name and registry details), Dependencies and Menus. Registry is loaded from memory or cache_dir and only downloaded from the iDRAC if not already cached."""
+        if session is None:
+            session = get_script_session()
+        registry_key = self.get_registry_key(registry_type, session)
+        with self.lock:
+            registry = self.registries.get(registry_key)
+        if registry:
+            return registry
+        filename = os.path.join(self.cache_dir, "%s.json" % re.sub(r"[^\w.-]", "_", "_".join(registry_key)))
+        try:
+            with open(filename, "r") as registry_file:
+                registry_entries = json.load(registry_file)
+        except (IOError, OSError, ValueError):
+            registry_entries = self.get_uri(session, self.registry_uris[registry_type])["RegistryEntries"]
+            with tempfile.NamedTemporaryFile("w", dir=self.cache_dir, prefix=".%s." % os.path.basename(filename), suffix=".tmp", delete=False) as registry_file:
+                json.dump(registry_entries, registry_file)
+            os.replace(registry_file.name, filename)
+        registry = {"Attributes": {}, "Dependencies": registry_entries.get("Dependencies", []), "Menus": registry_entries.get("Menus", [])}
+        for i in registry_entries.get("Attributes", []):
+            registry["Attributes"][i["AttributeName"]] = i
+        with self.lock:
+            self.registries[registry_key] = registry
+        return registry
+
+    def get_attribute(self, registry_type, attribute_name, session=None):
+        """Function to return registry details for one attribute name, returns None if the attribute is not in the registry"""
+        return self.get_registry(registry_type, session)["Attributes"].get(attribute_name)
+
+    def check_map_from(self, map_from, attribute_values):
+        """Function to check if registry dependency MapFrom conditions are met for the attribute values, MapFrom terms are combined using MapTerms (AND or OR). Returns False if a condition can't be checked."""
+        conditions_met = None
+        for i in map_from:
+            if i.get("MapFromProperty", "CurrentValue") != "CurrentValue" or i.get("MapFromAttribute") not in attribute_values:
+                return False
+            attribute_value = attribute_values[i["MapFromAttribute"]]
+            map_from_value = i.get("MapFromValue")
+            try:
+                condition_met = {"EQU": attribute_value == map_from_value, "NEQ": attribute_value != map_from_value, "GTR": attribute_value > map_from_value, "GEQ": attribute_value >= map_from_value, "LSS": attribute_value < map_from_value, "LEQ": attribute_value <= map_from_value}[i.get("MapFromCondition", "EQU")]
+            except (KeyError, TypeError):
+                return False
+            if conditions_met is None:
+                conditions_met = condition_met
+            elif i.get("MapTerms") == "OR":
+                conditions_met = conditions_met or condition_met
+            else:
+                conditions_met = conditions_met and condition_met
+        return bool(conditions_met)
+
+    def validate_attributes(self, registry_type, attributes, current_attributes=None, session=None):
+        """Function to validate attribute names and values against the attribute registry before they are set on the iDRAC. Attribute name, ReadOnly, type, possible values, LowerBound/UpperBound and MinLength/MaxLength are validation errors. ValueExpression and registry dependencies (MapFrom conditions using current_attributes dictionary of current attribute values) are only warnings, iDRAC makes the final decision on these. Returns tuple of attributes dictionary with values converted to the registry type, list of validation errors and list of warnings."""
+        registry = self.get_registry(registry_type, session)
+        validated_attributes = {}
+        errors = []
+        warnings = []
+        for attribute_name, attribute_value in attributes.items():
+            attribute = registry["Attributes"].get(attribute_name)
+            if attribute is None:
+                errors.append("attribute \"%s\" not found in the attribute registry, attribute name is case sensitive" % attribute_name)
+                continue
+            if attribute.get("ReadOnly"):
+                errors.append("attribute \"%s\" is read only" % attribute_name)
+                continue
+            if attribute.get("Type") == "Integer":
+                try:
+                    attribute_value = int(attribute_value)
+                except (TypeError, ValueError):
+                    errors.append("value \"%s\" for attribute \"%s\" is not an integer" % (attribute_value, attribute_name))
+                    continue
+                if "LowerBound" in attribute and attribute_value < attribute["LowerBound"] or "UpperBound" in attribute and attribute_value > attribute["UpperBound"]:
+                    errors.append("value %s for attribute \"%s\" is out of range, supported range: %s to %s" % (attribute_value, attribute_name, attribute.get("LowerBound", ""), attribute.get("UpperBound", "")))
+                    continue
+            elif attribute.get("Type") == "Enumeration":
+                possible_values = [i["ValueName"] for i in attribute.get("Value", [])]
+                if possible_values and attribute_value not in possible_values:
+                    errors.append("value \"%s\" for attribute \"%s\" is not a possible value, possible values: %s" % (attribute_value, attribute_name, ", ".join(possible_values)))
+                    continue
+            elif attribute.get("Type") == "Boolean":
+                if str(attribute_value).lower() not in ["true", "false"]:
+                    errors.append("value \"%s\" for attribute \"%s\" is not a boolean, possible values: true, false" % (attribute_value, attribute_name))
+                    continue
+                attribute_value = str(attribute_value).lower() == "true"
+            elif attribute.get("Type") in ["String", "Password"]:
+                attribute_value = str(attribute_value)
+                if len(attribute_value) < attribute.get("MinLength", 0) or "MaxLength" in attribute and len(attribute_value) > attribute["MaxLength"]:
+                    errors.append("value for attribute \"%s\" has length %s, supported length: %s to %s" % (attribute_name, len(attribute_value), attribute.get("MinLength", 0), attribute.get("MaxLength", "")))
+                    continue
+                try:
+                    if attribute.get("ValueExpression") and not re.search(attribute["ValueExpression"], attribute_value):
+                        warnings.append("value \"%s\" for attribute \"%s\" does not match value expression %s, iDRAC may reject the value" % (attribute_value, attribute_name, attribute["ValueExpression"]))
+                except re.error:
+                    pass
+            validated_attributes[attribute_name] = attribute_value
+        attribute_values = dict(current_attributes or {})
+        attribute_values.update(validated_attributes)
+        for i in registry["Dependencies"]:
+            dependency = i.get("Dependency", {})
+            attribute_name = dependency.get("MapToAttribute")
+            if i.get("Type") != "Map" or attribute_name not in validated_attributes or not self.check_map_from(dependency.get("MapFrom", []), attribute_values):
+                continue
+            conditions = " ".join("%s %s %s %s" % (ii.get("MapTerms", ""), ii["MapFromAttribute"], ii.get("MapFromCondition", "EQU"), ii.get("MapFromValue")) for ii in dependency["MapFrom"]).strip()
+            map_to_property = dependency.get("MapToProperty")
+            map_to_value = dependency.get("MapToValue")
+            if map_to_property in ["ReadOnly", "GrayOut"] and map_to_value is True:
+                warnings.append("attribute \"%s\" may be read only when %s" % (attribute_name, conditions))
+            elif map_to_property == "CurrentValue" and validated_attributes[attribute_name] != map_to_value:
+                warnings.append("iDRAC may set attribute \"%s\" value to \"%s\" when %s" % (attribute_name, map_to_value, conditions))
+            elif map_to_property == "LowerBound" and isinstance(validated_attributes[attribute_name], int) and validated_attributes[attribute_name] < map_to_value:
+                warnings.append("value %s for attribute \"%s\" may be rejected, lower bound is %s when %s" % (validated_attributes[attribute_name], attribute_name, map_to_value, conditions))
+            elif map_to_property == "UpperBound" and isinstance(validated_attributes[attribute_name], int) and validated_attributes[attribute_name] > map_to_value:
+                warnings.append("value %s for attribute \"%s\" may be rejected, upper bound is %s when %s" % (validated_attributes[attribute_name], attribute_name, map_to_value, conditions))
+        return validated_attributes, errors, warnings
+
+class MessageRegistryCache(object):
+    """Class for local cache of the iDRAC message registry used to decode message IDs returned in job status, LC log entries and Redfish error messages. Registry is only downloaded once per iDRAC firmware version and saved in cache_dir which can be shared by multiple iDRACs. Loaded registry is indexed in memory by message ID with message ID prefix search and full-text search on Message and Resolution strings. Supported argument: cache_dir."""
+    def __init__(self, cache_dir="message_registry_cache"):
+        self.cache_dir = cache_dir
+        self.registries = {}
+        self.registry_keys = {}
+        self.lock = threading.Lock()
+        if not os.path.isdir(cache_dir):
+            os.makedirs(cache_dir)
+
+    def get_uri(self, session, uri):
+        if session.x_auth_token == "yes":
+            response = session.client.get('https://%s%s' % (session.creds["idrac_ip"], uri),verify=session.creds["verify_cert"],headers={'X-Auth-Token': session.creds["idrac_x_auth_token"]})
+        else:
+            response = session.client.get('https://%s%s' % (session.creds["idrac_ip"], uri),verify=session.creds["verify_cert"],auth=(session.creds["idrac_username"], session.creds["idrac_password"]))
+        if response.status_code != 200:
+            raise requests.exceptions.HTTPError("GET on URI %s failed, status code %s returned" % (uri, response.status_code), response=response)
+        return response.json()
+
+    def get_registry_key(self, session):
+        """Function to return registry key tuple (registry name, iDRAC firmware version) for the session iDRAC. 14G, 15G and 16G servers use EEMIRegistry, newer servers use iDRACMessageRegistry."""
+        with self.lock:
+            registry_key = self.registry_keys.get(session.creds["idrac_ip"])
+        if registry_key:
+            return registry_key
+        data = self.get_uri(session, "/redfish/v1/Systems/System.Embedded.1")
+        server_generation = data.get("Oem", {}).get("Dell", {}).get("DellSystem", {}).get("SystemGeneration", "")
+        if "14G" in server_generation or "15G" in server_generation or "16G" in server_generation:
+            registry_name = "EEMIRegistry"
+        else:
+            registry_name = "iDRACMessageRegistry"
+        registry_key = (registry_name, self.get_uri(session, "/redfish/v1/Managers/iDRAC.Embedded.1").get("FirmwareVersion", ""))
+        with self.lock:
+            self.registry_keys[session.creds["idrac_ip"]] = registry_key
+        return registry_key
+
+    def get_registry(self, session=None):
+        """Function to return indexed message registry for the session iDRAC (default is current script session). Returns dictionary with keys Messages (dictionary of upper case message ID and tuple of message ID and message details), MessageIds (sorted upper case message IDs), Words (dictionary of lower case word in Message and Resolution strings and set of message IDs) and SortedWords (sorted words used for search). Registry is loaded from memory or cache_dir and only downloaded from the iDRAC if not already cached."""
+        if session is None:
+            session = get_script_session()
+        registry_key = self.get_registry_key(session)
+        with self.lock:
+            registry = self.registries.get(registry_key)
+        if registry:
+            return registry
+        filename = os.path.join(self.cache_dir, "%s.json" % re.sub(r"[^\w.-]", "_", "_".join(registry_key)))
+        try:
+            with open(filename, "r") as registry_file:
+                messages = json.load(registry_file)
+        except (IOError, OSError, ValueError):
+            messages = self.get_uri(session, "/redfish/v1/Registries/Messages/%s" % registry_key[0])["Messages"]
+            with tempfile.NamedTemporaryFile("w", dir=self.cache_dir, prefix=".%s." % os.path.basename(filename), suffix=".tmp", delete=False) as registry_file:
+                json.dump(messages, registry_file)
+            os.replace(registry_file.name, filename)
+        registry = {"Messages": {}, "MessageIds": [], "Words": {}}
+        for message_id, message in messages.items():
+            registry["Messages"][message_id.upper()] = (message_id, message)
+            for word in re.findall(r"\w+", ("%s %s" % (message.get("Message", ""), message.get("Resolution", ""))).lower()):
+                registry["Words"].setdefault(word, set()).add(message_id.upper())
+        registry["MessageIds"] = sorted(registry["Messages"])
+        registry["SortedWords"] = sorted(registry["Words"])
+        with self.lock:
+            self.registries[registry_key] = registry
+        return registry
+
+    def get_message(self, message_id, session=None):
+        """Function to return message details for a message ID, returns None if the message ID is not in the registry. Message ID is case insensitive and can include the registry prefix, example: SYS409 or IDRAC.2.9.SYS409."""
+        message = self.get_registry(session)["Messages"].get(message_id.split(".")[-1].upper())
+        if message:
+            return message[1]
+        return None
+
+    def find_messages(self, message_id_prefix="", search="", session=None):
+        """Function to return list of tuples (message ID, message details) for message IDs starting with message_id_prefix and/or Message or Resolution string containing all words in search string. Search is case insensitive and each search word also matches words starting with it, example: "fail disk" matches "failed" and "disks"."""
+        registry = self.get_registry(session)
+        message_ids = registry["MessageIds"]
+        if message_id_prefix:
+            prefix = message_id_prefix.split(".")[-1].upper()
+            index = bisect.bisect_left(message_ids, prefix)
+            message_ids = []
+            while index < len(registry["MessageIds"]) and registry["MessageIds"][index].startswith(prefix):
+                message_ids.append(registry["MessageIds"][index])
+                index += 1
+        if search:
+            matches = None
+            for search_word in re.findall(r"\w+", search.lower()):
+                word_matches = set()
+                index = bisect.bisect_left(registry["SortedWords"], search_word)
+                while index < len(registry["SortedWords"]) and registry["SortedWords"][index].startswith(search_word):
+                    word_matches.update(registry["Words"][registry["SortedWords"][index]])
+                    index += 1
+                matches = word_matches if matches is None else matches & word_matches
+            message_ids = [i for i in message_ids if i in (matches or set())]
+        return [registry["Messages"][i] for i in message_ids]
+
+class TlsSessionCache(object):
+    """Class to hold the last TLS session for each iDRAC so new connections to the iDRAC resume the TLS session (abbreviated handshake using session ticket or session ID) instead of a full handshake with certificate exchange and key agreement. handshakes attribute returns number of full and resumed TLS handshakes. One cache is shared by all IdracClient objects using the same SSL cert verification setting, see get_tls_context()."""
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.sessions = {}
+        self.sockets = {}
+        self.handshakes = {"full": 0, "resumed": 0}
+
+    def save(self, key, ssl_socket):
+        """Function to store the TLS session of a connection if it can be resumed. With TLS 1.3 the session ticket is only received after the handshake, so this is also executed for open connections in get() and when the connection is closed"""
+        try:
+            session = ssl_socket.session
+            tls_version = ssl_socket.version()
+        except (OSError, ValueError):
+            return
+        if session is not None and (session.has_ticket or tls_version != "TLSv1.3"):
+            self.sessions[key] = session
+
+    def get(self, key):
+        """Function to return resumable TLS session for the iDRAC or None"""
+        with self.lock:
+            for ssl_socket in list(self.sockets.get(key, ())):
+                self.save(key, ssl_socket)
+            session = self.sessions.get(key)
+            if session is not None and time.time() > session.time + session.timeout:
+                del self.sessions[key]
+                return None
+            return session
+
+    def add(self, key, ssl_socket):
+        with self.lock:
+            self.sockets.setdefault(key, weakref.WeakSet()).add(ssl_socket)
+            if ssl_socket.session_reused:
+                self.handshakes["resumed"] += 1
+            else:
+                self.handshakes["full"] += 1
+
+    def clear(self):
+        with self.lock:
+            self.sessions = {}
+            self.sockets = {}
+
+class ResumableSSLSocket(ssl.SSLSocket):
+    """Class for SSL socket used by ResumableSSLContext, TLS session is stored in the session cache before the connection is closed"""
+    def _real_close(self):
+        if getattr(self, "tls_session_key", None) is not None:
+            with self.context.tls_session_cache.lock:
+                self.context.tls_session_cache.save(self.tls_session_key, self)
+        super()._real_close()
+
+class ResumableSSLContext(ssl.SSLContext):
+    """Class for SSL context which passes in the last TLS session to the iDRAC when a new connection is opened, see TlsSessionCache. If the iDRAC does not accept the session a full handshake is done."""
+    sslsocket_class = ResumableSSLSocket
+
+    def wrap_socket(self, sock, *args, **kwargs):
+        key = (kwargs.get("server_hostname"), sock.getpeername()[:2])
+        session = self.tls_session_cache.get(key)
+        if session is not None and kwargs.get("session") is None:
+            kwargs["session"] = session
+        ssl_socket = super().wrap_socket(sock, *args, **kwargs)
+        ssl_socket.tls_session_key = key
+        self.tls_session_cache.add(key, ssl_socket)
+        return ssl_socket
+
+_tls_contexts = {}
+_tls_contexts_lock = threading.Lock()
+
+def get_tls_context(verify_cert=False):
+    """Function to return SSL context shared by all IdracClient objects with this SSL cert verification setting, TLS sessions are stored in tls_session_cache attribute. Example: IdracRedfishSupport.get_tls_context().tls_session_cache.handshakes"""
+    with _tls_contexts_lock:
+        if verify_cert not in _tls_contexts:
+            context = ResumableSSLContext(ssl.PROTOCOL_TLS_CLIENT)
+            # urllib3 sets verify_mode for each connection based on verify argument and checks the hostname itself
+            context.check_hostname = False
+            if verify_cert:
+                context.load_default_certs()
+            else:
+                context.verify_mode = ssl.CERT_NONE
+            context.tls_session_cache = TlsSessionCache()
+            _tls_contexts[verify_cert] = context
+        return _tls_contexts[verify_cert]
+
+class IdracHTTPAdapter(requests.adapters.HTTPAdapter):
+    """Class for requests transport adapter used by IdracClient, HTTPS connections are opened using the shared SSL context returned by get_tls_context() so TLS sessions are resumed across connections and clients"""
+    __attrs__ = requests.adapters.HTTPAdapter.__attrs__ + ["verify_cert"]
+
+    def __init__(self, verify_cert=False, **kwargs):
+        self.verify_cert = verify_cert
+        super().__init__(**kwargs)
+
+    def init_poolmanager(self, *args, **kwargs):
+        kwargs["ssl_context"] = get_tls_context(self.verify_cert)
+        return super().init_poolmanager(*args, **kwargs)
+
+    def proxy_manager_for(self, *args, **kwargs):
+        kwargs["ssl_context"] = get_tls_context(self.verify_cert)
+        return super().proxy_manager_for(*args, **kwargs)
+
+class IdracClient(object):
+    """Class to hold one pooled keep-alive Redfish connection to an iDRAC. All module functions send their Redfish calls through this client so the TCP/TLS connection to the iDRAC is reused instead of being opened again for every call, connections stay open between module functions executed with the same client. New connections resume the TLS session of the last connection to the iDRAC, see TlsSessionCache and warm_up(). Supported arguments: idrac_ip, idrac_username, idrac_password, verify_cert, x_auth_token (if passed in, X-auth token is used for auth instead of username/password), pool_maxsize (max number of keep-alive connections kept open to the iDRAC), max_retries (number of connection retries) and cache (RedfishCache object, if passed in GET responses with an ETag header are cached on disk and validated using If-None-Match)."""
+    def __init__(self, idrac_ip, idrac_username="", idrac_password="", verify_cert=False, x_auth_token="", pool_maxsize=8, max_retries=0, cache=None):
+        self.idrac_ip = idrac_ip
+        self.cache = cache
+        self.session = requests.Session()
+        self.pool_maxsize = pool_maxsize
+        adapter = IdracHTTPAdapter(verify_cert=verify_cert, pool_connections=1, pool_maxsize=pool_maxsize, max_retries=max_retries)
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+        self.session.verify = verify_cert
+        self.session.headers.update({"Connection": "keep-alive"})
+        if x_auth_token:
+            self.set_x_auth_token(x_auth_token)
+        else:
+            self.session.auth = (idrac_username, idrac_password)
+
+    def set_x_auth_token(self, x_auth_token):
+        """Function to switch the client to X-auth token authentication for all following Redfish calls"""
+        self.session.auth = None
+        self.session.headers["X-Auth-Token"] = x_auth_token
+
+    def warm_up(self, connections=1):
+        """Function to open keep-alive connections to the iDRAC before the first Redfish call of a workflow. First connection does the full TLS handshake, other connections resume its TLS session. Supported function argument: connections (number of connections to open, max value is pool_maxsize). Returns seconds taken by the first request."""
+        start_time = time.time()
+        self.session.request("GET", self.url("/redfish/v1"), verify=self.session.verify).content
+        first_request_seconds = time.time() - start_time
+        # Streamed responses hold their connection until the content is read, first request reuses the connection opened above and each other request opens a new connection
+        responses = [self.session.request("GET", self.url("/redfish/v1"), verify=self.session.verify, stream=True) for i in range(min(connections, self.pool_maxsize))]
+        for response in responses:
+            response.content
+            response.close()
+        return first_request_seconds
+
+    def url(self, uri):
+        """Function to return complete URL, either pass in complete URL or only the Redfish URI starting with /redfish/v1"""
+        if uri.startswith("http"):
+            return uri
+        return "https://%s%s" % (self.idrac_ip, uri)
+
+    def request(self, method, uri, **kwargs):
+        # REQUESTS_CA_BUNDLE environment variable overrides session verify setting, always pass it per request
+        kwargs.setdefault("verify", self.session.verify)
+        url = self.url(uri)
+        if self.cache is None or method != "GET" or kwargs.get("stream") or not self.cache.is_cacheable(url):
+            return self.session.request(method, url, **kwargs)
+        cache_entry = self.cache.get(url)
+        if cache_entry:
+            headers = dict(kwargs.get("headers") or {})
+            headers["If-None-Match"] = cache_entry["etag"]
+            kwargs["headers"] = headers
+        response = self.session.request(method, url, **kwargs)
+        if response.status_code == 304 and cache_entry:
+            return self.cache.create_response(url, cache_entry, response)
+        if response.status_code == 200 and "ETag" in response.headers:
+            self.cache.set(url, response)
+        return response
+
+    def get(self, uri, **kwargs):
+        return self.request("GET", uri, **kwargs)
+
+    def post(self, uri, **kwargs):
+        return self.request("POST", uri, **kwargs)
+
+    def patch(self, uri, **kwargs):
+        return self.request("PATCH", uri, **kwargs)
+
+    def put(self, uri, **kwargs):
+        return self.request("PUT", uri, **kwargs)
+
+    def delete(self, uri, **kwargs):
+        return self.request("DELETE", uri, **kwargs)
+
+    def close(self):
+        """Function to close all pooled connections to the iDRAC"""
+        self.session.close()
+
+class AsyncRedfishResponse(object):
+    """Class to hold the results of an asyncio Redfish call, same attributes as requests response: status_code, headers, text and json()"""
+    def __init__(self, status_code, headers, text):
+        self.status_code = status_code
+        self.headers = headers
+        self.text = text
+
+    def json(self):
+        return json.loads(self.text)
+
+class AsyncIdracClient(object):
+    """Class for asyncio Redfish calls to one iDRAC, async equivalent of IdracClient. Requires aiohttp module installed (pip3 install aiohttp). iDRAC will start returning status code 503 when too many concurrent sessions are open, host_limit is the max number of concurrent Redfish calls to this iDRAC. Pass in global_semaphore and http_session to share the overall concurrent call limit and connection pool across all iDRACs. Supported arguments: idrac_ip, idrac_username, idrac_password, verify_cert, x_auth_token, host_limit, global_semaphore, http_session, timeout (seconds) and retry_count (number of retries when iDRAC returns status code 503)."""
+    def __init__(self, idrac_ip, idrac_username="", idrac_password="", verify_cert=False, x_auth_token="", host_limit=4, global_semaphore=None, http_session=None, timeout=60, retry_count=3):
+        if aiohttp is None:
+            raise ImportError("aiohttp module is required for AsyncIdracClient, install using \"pip3 install aiohttp\"")
+        self.idrac_ip = idrac_ip
+        self.verify_cert = verify_cert
+        self.headers = {}
+        self.auth = None
+        if x_auth_token:
+            self.headers["X-Auth-Token"] = x_auth_token
+        else:
+            self.auth = aiohttp.BasicAuth(idrac_username, idrac_password)
+        self.host_semaphore = asyncio.Semaphore(host_limit)
+        self.global_semaphore = global_semaphore
+        self.http_session = http_session
+        self.close_http_session = http_session is None
+        self.timeout = timeout
+        self.retry_count = retry_count
+
+    def url(self, uri):
+        if uri.startswith("http"):
+            return uri
+        return "https://%s%s" % (self.idrac_ip, uri)
+
+    async def request(self, method, uri, **kwargs):
+        if self.http_session is None:
+            self.http_session = aiohttp.ClientSession(connector=aiohttp.TCPConnector(ssl=None if self.verify_cert else False), timeout=aiohttp.ClientTimeout(total=self.timeout))
+        headers = dict(self.headers)
+        headers.update(kwargs.pop("headers", {}))
+        if "json" in kwargs or "data" in kwargs:
+            headers.setdefault("content-type", "application/json")
+        retry = 0
+        while True:
+            async with contextlib.AsyncExitStack() as stack:
+                if self.global_semaphore is not None:
+                    await stack.enter_async_context(self.global_semaphore)
+                await stack.enter_async_context(self.host_semaphore)
+                async with self.http_session.request(method, self.url(uri), headers=headers, auth=self.auth, ssl=None if self.verify_cert else False, **kwargs) as response:
+                    text = await response.text()
+                    result = AsyncRedfishResponse(response.status, response.headers, text)
+            if result.status_code != 503 or retry == self.retry_count:
+                return result
+            retry += 1
+            try:
+                retry_after = int(result.headers.get("Retry-After", 2))
+            except ValueError:
+                retry_after = 2
+            logging.debug("- INFO, status code 503 returned for iDRAC %s, retry in %s seconds" % (self.idrac_ip, retry_after))
+            await asyncio.sleep(retry_after)
+
+    async def get(self, uri, **kwargs):
+        return await self.request("GET", uri, **kwargs)
+
+    async def post(self, uri, **kwargs):
+        return await self.request("POST", uri, **kwargs)
+
+    async def patch(self, uri, **kwargs):
+        return await self.request("PATCH", uri, **kwargs)
+
+    async def put(self, uri, **kwargs):
+        return await self.request("PUT", uri, **kwargs)
+
+    async def delete(self, uri, **kwargs):
+        return await self.request("DELETE", uri, **kwargs)
+
+    async def close(self):
+        if self.close_http_session and self.http_session is not None:
+            await self.http_session.close()
+            self.http_session = None
+
+async def async_get_uri_multiple_idracs(idracs, uri, global_limit=200, host_limit=4, verify_cert=False, timeout=60):
+    """Function to GET one Redfish URI from multiple iDRACs using one asyncio event loop. Supported function arguments: idracs (list of dictionaries with keys idrac_ip, idrac_username and idrac_password), uri (Redfish URI, example: /redfish/v1/Systems/System.Embedded.1), global_limit (max number of concurrent Redfish calls across all iDRACs), host_limit (max number of concurrent Redfish calls per iDRAC), verify_cert and timeout (seconds). Returns dictionary of iDRAC IP and either JSON response data or the error message."""
+    if aiohttp is None:
+        raise ImportError("aiohttp module is required for async_get_uri_multiple_idracs, install using \"pip3 install aiohttp\"")
+    global_semaphore = asyncio.Semaphore(global_limit)
+    connector = aiohttp.TCPConnector(limit=global_limit, limit_per_host=host_limit, ssl=None if verify_cert else False)
+    results = {}
+    async with aiohttp.ClientSession(connector=connector, timeout=aiohttp.ClientTimeout(total=timeout)) as http_session:
+        async def get_uri(idrac):
+            client = AsyncIdracClient(idrac["idrac_ip"], idrac["idrac_username"], idrac["idrac_password"], verify_cert=verify_cert, host_limit=host_limit, global_semaphore=global_semaphore, http_session=http_session, timeout=timeout)
+            # Any failure is stored as the result for this iDRAC, one bad iDRAC does not stop getting the URI from the other iDRACs
+            try:
+                response = await client.get(uri)
+                if response.status_code != 200:
+                    results[idrac["idrac_ip"]] = "ERROR, status code %s returned" % response.status_code
+                else:
+                    results[idrac["idrac_ip"]] = response.json()
+            except Exception as error_message:
+                results[idrac["idrac_ip"]] = "ERROR, %s" % (str(error_message) or type(error_message).__name__)
+        await asyncio.gather(*[get_uri(idrac) for idrac in idracs])
+    return results
+
+def get_uri_multiple_idracs(idracs, uri, global_limit=200, host_limit=4, verify_cert=False, timeout=60):
+    """Function to GET one Redfish URI from multiple iDRACs at the same time using asyncio, see async_get_uri_multiple_idracs() for supported function arguments. Requires aiohttp module installed. Example: IdracRedfishSupport.get_uri_multiple_idracs([{"idrac_ip":"192.168.0.120","idrac_username":"root","idrac_password":"calvin"}], "/redfish/v1/Systems/System.Embedded.1")"""
+    return asyncio.run(async_get_uri_multiple_idracs(idracs, uri, global_limit=global_limit, host_limit=host_limit, verify_cert=verify_cert, timeout=timeout))
+
+class IdracSession(object):
+    """Class to hold all script session details for one iDRAC: credentials, SSL cert verification, X-auth token, Redfish client and the last job ID created. Create one IdracSession per iDRAC to run module functions against multiple iDRACs from the same python session. Module functions executed inside a "with session:" block run against that iDRAC, see also run_function_multiple_sessions(). Supported arguments: idrac_ip, idrac_username, idrac_password, verify_cert (supported values: True and False) and cache (RedfishCache object to cache GET responses on disk, one RedfishCache can be shared by multiple sessions)."""
+    def __init__(self, idrac_ip, idrac_username, idrac_password, verify_cert=False, cache=None):
+        self.creds = {"idrac_ip": idrac_ip, "idrac_username": idrac_username, "idrac_password": idrac_password, "verify_cert": verify_cert}
+        self.x_auth_token = "no"
+        self.client = IdracClient(idrac_ip, idrac_username, idrac_password, verify_cert=verify_cert, cache=cache)
+        self.job_id = ""
+        self.job_type = ""
+        self.concrete_job_uri = ""
+        self.sse_uri = None
+
+    def __repr__(self):
+        return "IdracSession(%s)" % self.creds["idrac_ip"]
+
+    def __enter__(self):
+        if not hasattr(_script_sessions, "stack"):
+            _script_sessions.stack = []
+        _script_sessions.stack.append(self)
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        _script_sessions.stack.pop()
+
+    def create_x_auth_token(self):
+        """Function to create iDRAC X-auth token session, all Redfish calls executed for this session will use the X-auth token for authentication instead of username/password. Returns True if the X-auth token session was created."""
+        response = self.client.get('https://%s/redfish/v1' % self.creds["idrac_ip"],verify=self.creds["verify_cert"],auth=(self.creds["idrac_username"], self.creds["idrac_password"]))
+        if response.status_code == 401:
+            logging.error("\n- ERROR, GET request failed, status code %s returned, check login credentials" % (response.status_code))
+            return False
+        if response.status_code != 200:
+            logging.warning("\n- WARNING, GET request failed to get Redfish version, status code %s returned" % response.status_code)
+            return False
+        data = response.json()
+        redfish_version = int(data["RedfishVersion"].replace(".",""))
+        if redfish_version >= 160:
+            session_uri = "redfish/v1/SessionService/Sessions"
+        else:
+            session_uri = "redfish/v1/Sessions"
+        url = 'https://%s/%s' % (self.creds["idrac_ip"], session_uri)
+        payload = {"UserName":self.creds["idrac_username"],"Password":self.creds["idrac_password"]}
+        headers = {'content-type': 'application/json'}
+        response = self.client.post(url, data=json.dumps(payload), headers=headers, verify=self.creds["verify_cert"])
+        if response.status_code == 201:
+            logging.info("\n- PASS, iDRAC X auth token successfully created. X auth sessions URI \"%s\"" % response.headers["Location"])
+        else:
+            try:
+                logging.error("\n- ERROR, unable to create X-auth_token session, status code %s returned, detailed error results:\n %s" % (response.status_code, response.json()))
+            except:
+                logging.error("\n- ERROR, unable to create X-auth_token session, status code %s returned" % (response.status_code))
+            return False
+        self.creds["idrac_x_auth_token"] = response.headers["X-Auth-Token"]
+        self.client.set_x_auth_token(self.creds["idrac_x_auth_token"])
+        self.x_auth_token = "yes"
+        return True
+
+_script_sessions = threading.local()
+_default_script_session = None
+
+def get_script_session():
+    """Function to return the iDRAC script session used by module functions in the current thread. This is the IdracSession activated with a "with session:" block or if none is active, the session created by set_iDRAC_script_session()."""
+    try:
+        return _script_sessions.stack[-1]
+    except (AttributeError, IndexError):
+        return _default_script_session
+
+def run_function_multiple_sessions(function, sessions, max_workers=10, **kwargs):
+    """Function to execute one module function against multiple iDRACs at the same time, each iDRAC is executed in its own thread using its own IdracSession. Supported function arguments: function (module function to execute), sessions (list of IdracSession objects), max_workers (max number of iDRACs executed at the same time) and any function arguments to pass to the module function. Returns dictionary of iDRAC IP and function return value."""
+    def run_function(session):
+        with session:
+            return function(**kwargs)
+    results = {}
+    with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = {executor.submit(run_function, session): session for session in sessions}
+        for future in concurrent.futures.as_completed(futures):
+            idrac_ip = futures[future].creds["idrac_ip"]
+            try:
+                results[idrac_ip] = future.result()
+            except Exception as error_message:
+                logging.error("- ERROR, function %s failed for iDRAC %s, detailed error results: %s" % (function.__name__, idrac_ip, error_message))
+                results[idrac_ip] = error_message
+    return results
+
+def warm_up_sessions(sessions, connections=1, max_workers=50):
+    """Function to open keep-alive connections to multiple iDRACs at the same time before executing module functions, so the first Redfish call of each workflow does not wait for TCP connect and TLS handshake. Connections stay open for all module functions executed with the same IdracSession objects (example: inventory, then logs, then jobs). Supported function arguments: sessions (list of IdracSession objects), connections (number of keep-alive connections opened per iDRAC, see IdracClient.warm_up()) and max_workers (max number of iDRACs warmed up at the same time). Returns dictionary of iDRAC IP and seconds taken by the first request or the error message."""
+    results = {}
+    with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = {executor.submit(session.client.warm_up, connections): session for session in sessions}
+        for future in concurrent.futures.as_completed(futures):
+            idrac_ip = futures[future].creds["idrac_ip"]
+            try:
+                results[idrac_ip] = future.result()
+            except requests.exceptions.RequestException as error_message:
+                logging.error("- ERROR, unable to connect to iDRAC %s, detailed error results: %s" % (idrac_ip, error_message))
+                results[idrac_ip] = error_message
+    return results
+
 def set_iDRAC_script_session(script_examples=""):
-    """Function to set iDRAC session used to execute all workflows for this session: pass in iDRAC IP, iDRAC username and iDRAC password. It will also prompt for SSL certificate verification for all Redfish calls and finally prompt to create X-auth token session. By creating X-auth token session, all Redfish calls executed will use this X-auth token session for authentication instead of username/password."""
-    global creds
-    global x_auth_token
+    """Function to set iDRAC session used to execute all workflows for this session: pass in iDRAC IP, iDRAC username and iDRAC password. It will also prompt for SSL certificate verification for all Redfish calls and finally prompt to create X-auth token session. By creating X-auth token session, all Redfish calls executed will use this X-auth token session for authentication instead of username/password. To run workflows against multiple iDRACs, create one IdracSession per iDRAC instead."""
+    global _default_script_session
     if script_examples:
         print("\n- IdracRedfishSupport.set_iDRAC_script_session(), this example will prompt the user to input iDRAC IP, iDRAC username, iDRAC password, SSL cert verification and create X-auth token session")
     else:
-        x_auth_token = "no"
-        creds = {}
         idrac_ip = input(str("- Enter iDRAC IP: "))
-        creds["idrac_ip"] = idrac_ip
         idrac_username = input(str("- Enter iDRAC username: "))
-        creds["idrac_username"] = idrac_username
         idrac_password = getpass.getpass("- Enter iDRAC %s password: " % idrac_username)
-        creds["idrac_password"] = idrac_password
         verify_cert = input(str("- Verify SSL certificate, pass in True to verify or False to ignore: "))
         if verify_cert.lower() == "true":
-            creds["verify_cert"] = True
+            verify_cert = True
         elif verify_cert.lower() == "false":
-            creds["verify_cert"] = False
+            verify_cert = False
         else:
             logging.info("- INFO, invalid value entered to verify SSL certificate")
             return
+        session = IdracSession(idrac_ip, idrac_username, idrac_password, verify_cert=verify_cert)
         user_response = input(str("- Create iDRAC X-auth token session? Pass in \"y\" for yes or \"n\" for no. Creating iDRAC X-auth token session, all Redfish commands will be executed using this X-auth token for auth instead of username/password: "))
         if user_response.lower() == "y":
-            x_auth_token = "yes"
-            response = requests.get('https://%s/redfish/v1' % creds["idrac_ip"],verify=creds["verify_cert"],auth=(creds["idrac_username"], creds["idrac_password"]))
-            data = response.json()
-            if response.status_code == 401:
-                logging.error("\n- ERROR, GET request failed, status code %s returned, check login credentials" % (response.status_code))
-                return
-            else:
-                data = response.json()
-            if response.status_code != 200:
-                logging.warning("\n- WARNING, GET request failed to get Redfish version, status code %s returned" % response.status_code)
-                return
-            else:
-                pass
-            redfish_version = int(data["RedfishVersion"].replace(".",""))
-            if redfish_version >= 160:
-                session_uri = "redfish/v1/SessionService/Sessions"
-            elif redfish_version < 160:
-                session_uri = "redfish/v1/Sessions"
-            else:
-                logging.info("- INFO, unable to select URI based off Redfish version")
-                return
-            url = 'https://%s/%s' % (creds["idrac_ip"], session_uri)
-            payload = {"UserName":creds["idrac_username"],"Password":creds["idrac_password"]}
-            headers = {'content-type': 'application/json'}
-            response = requests.post(url, data=json.dumps(payload), headers=headers, verify=creds["verify_cert"])
-            data = response.json()
-            if response.status_code == 201:
-                logging.info("\n- PASS, iDRAC X auth token successfully created. X auth sessions URI \"%s\"" % response.headers["Location"])
-            else:
-                try:
-                    logging.error("\n- ERROR, unable to create X-auth_token session, status code %s returned, detailed error results:\n %s" % (response.status_code, data))
-                except:
-                    logging.error("\n- ERROR, unable to create X-auth_token session, status code %s returned" % (response.status_code))
+            if not session.create_x_auth_token():
                 return
-            creds["idrac_x_auth_token"] = response.headers["X-Auth-Token"]
         elif user_response.lower() != "n":
             logging.error("- ERROR, invalid value entered to create iDRAC x-auth token session")
             return
+        _default_script_session = session
+
+def enable_redfish_cache(script_examples="", cache_dir="redfish_cache", max_size_mb=100, disable=""):
+    """Function to enable on-disk cache of Redfish GET responses for the current iDRAC script session. Resources which rarely change (firmware, PCIe and assembly inventory, storage controller details, attribute registries) are only downloaded again if changed, cached responses are validated with the iDRAC using ETag/If-None-Match. Supported function arguments: cache_dir (directory for cached responses, can be shared by multiple iDRACs), max_size_mb (least recently used responses are deleted once cache size is over this value) and disable (supported value: True)."""
+    session = get_script_session()
+    if script_examples:
+        print("""\n- IdracRedfishSupport.enable_redfish_cache(), this example will cache Redfish GET responses in directory redfish_cache, max cache size 100MB.
+        \n- IdracRedfishSupport.enable_redfish_cache(cache_dir="C:\\idrac_cache", max_size_mb=500), this example will cache Redfish GET responses in directory C:\\idrac_cache, max cache size 500MB.
+        \n- IdracRedfishSupport.enable_redfish_cache(disable=True), this example will disable Redfish cache for the current iDRAC script session.""")
+    elif disable:
+        session.client.cache = None
+        logging.info("- INFO, Redfish cache disabled for iDRAC %s" % session.creds["idrac_ip"])
+    else:
+        session.client.cache = RedfishCache(cache_dir=cache_dir, max_size_mb=max_size_mb)
+        logging.info("- INFO, Redfish cache enabled for iDRAC %s, cache directory: %s" % (session.creds["idrac_ip"], os.path.abspath(cache_dir)))
+
+_attribute_registry_cache = None
+
+def get_attribute_registry_cache(cache_dir=None):
+    """Function to return the attribute registry cache shared by all iDRAC script sessions, used by module functions to get or validate BIOS and iDRAC attributes. Default cache directory is attribute_registry_cache, pass in cache_dir to use a different directory (for example a directory on a network share used for a fleet of servers)."""
+    global _attribute_registry_cache
+    if _attribute_registry_cache is None or (cache_dir and os.path.abspath(cache_dir) != os.path.abspath(_attribute_registry_cache.cache_dir)):
+        _attribute_registry_cache = AttributeRegistryCache(cache_dir=cache_dir or "attribute_registry_cache")
+    return _attribute_registry_cache
+
+_message_registry_cache = None
+
+def get_message_registry_cache(cache_dir=None):
+    """Function to return the message registry cache shared by all iDRAC script sessions, used to decode message IDs without downloading the message registry for each lookup. Default cache directory is message_registry_cache, pass in cache_dir to use a different directory (for example a directory on a network share used for a fleet of servers)."""
+    global _message_registry_cache
+    if _message_registry_cache is None or (cache_dir and os.path.abspath(cache_dir) != os.path.abspath(_message_registry_cache.cache_dir)):
+        _message_registry_cache = MessageRegistryCache(cache_dir=cache_dir or "message_registry_cache")
+    return _message_registry_cache
 
 def return_iDRAC_script_session_details(script_examples=""):
     """Function to return iDRAC IP and iDRAC username session information that was captured by get_iDRAC_creds()"""
+    session = get_script_session()
     if script_examples:
         print("\n- IdracRedfishSupport.return_iDRAC_script_session_details(), this example will return current iDRAC session details for iDRAC IP and username only")
     else:
-        print("iDRAC IP: %s" % creds["idrac_ip"])
-        print("iDRAC username: %s" % creds["idrac_username"])
+        print("iDRAC IP: %s" % session.creds["idrac_ip"])
+        print("iDRAC username: %s" % session.creds["idrac_username"])
     
 def get_storage_controllers(script_examples=""):
     """Function to get server storage controller FQDDs"""
+    session = get_script_session()
     if script_examples:
         print("\n- IdracRedfishSupport.get_storage_controllers(), this example will return current storage controller FQDDs detected. These FQDDs can be used to execute other storage functions to get physcial disks, virtual disks, reset controller are some examples.")
     else:
-        if x_auth_token == "yes":
-            response = requests.get('https://%s/redfish/v1/Systems/System.Embedded.1/Storage' % creds["idrac_ip"],verify=creds["verify_cert"],headers={'X-Auth-Token': creds["idrac_x_auth_token"]})    
+        if session.x_auth_token == "yes":
+            response = session.client.get('https://%s/redfish/v1/Systems/System.Embedded.1/Storage' % session.creds["idrac_ip"],verify=session.creds["verify_cert"],headers={'X-Auth-Token': session.creds["idrac_x_auth_token"]})    
         else:
-            response = requests.get('https://%s/redfish/v1/Systems/System.Embedded.1/Storage' % creds["idrac_ip"],verify=creds["verify_cert"],auth=(creds["idrac_username"], creds["idrac_password"]))
+            response = session.client.get('https://%s/redfish/v1/Systems/System.Embedded.1/Storage' % session.creds["idrac_ip"],verify=session.creds["verify_cert"],auth=(session.creds["idrac_username"], session.creds["idrac_password"]))
         data = response.json()
         if response.status_code == 401:
             logging.error("- ERROR, status code 401 detected, check to make sure your iDRAC script session has correct username/password credentials or if using X-auth token, confirm the session is still active.")
@@ -130,13 +869,14 @@ def get_storage_controllers(script_examples=""):
 
 def get_storage_controller_details(script_examples="", controller_fqdd=""):
     """Function to get details for a specific storage controller. Supported function argument: controller_fqdd"""
+    session = get_script_session()
     if script_examples:
         print("\n- IdracRedfishSupport.get_storage_controller_details(controller_fqdd='RAID.Integrated.1-1'), this example will return detailed information for storage controller RAID.Integrated.1-1")
     else:
-        if x_auth_token == "yes":
-            response = requests.get('https://%s/redfish/v1/Systems/System.Embedded.1/Storage/%s' % (creds["idrac_ip"], controller_fqdd),verify=creds["verify_cert"],headers={'X-Auth-Token': creds["idrac_x_auth_token"]})    
+        if session.x_auth_token == "yes":
+            response = session.client.get('https://%s/redfish/v1/Systems/System.Embedded.1/Storage/%s' % (session.creds["idrac_ip"], controller_fqdd),verify=session.creds["verify_cert"],headers={'X-Auth-Token': session.creds["idrac_x_auth_token"]})    
         else:
-            response = requests.get('https://%s/redfish/v1/Systems/System.Embedded.1/Storage/%s' % (creds["idrac_ip"], controller_fqdd),verify=creds["verify_cert"],auth=(creds["idrac_username"], creds["idrac_password"]))
+            response = session.client.get('https://%s/redfish/v1/Systems/System.Embedded.1/Storage/%s' % (session.creds["idrac_ip"], controller_fqdd),verify=session.creds["verify_cert"],auth=(session.creds["idrac_username"], session.creds["idrac_password"]))
         data = response.json()
         if response.status_code == 401:
             logging.error("- ERROR, status code 401 detected, check to make sure your iDRAC script session has correct username/password credentials or if using X-auth token, confirm the session is still active.")
@@ -150,13 +890,14 @@ def get_storage_controller_details(script_examples="", controller_fqdd=""):
 
 def get_storage_disks(script_examples="", controller_fqdd=""):
     """Function to get drive FQDDs for storage controller. Supported function argument: controller_fqdd"""
+    session = get_script_session()
     if script_examples:
         print("\n- IdracRedfishSupport.get_storage_disks(controller_fqdd='RAID.Integrated.1-1'), this example will return disk FQDDs detected for storage controller RAID.Integrated.1-1")
     else:
-        if x_auth_token == "yes":
-            response = requests.get('https://%s/redfish/v1/Systems/System.Embedded.1/Storage/%s' % (creds["idrac_ip"], controller_fqdd),verify=creds["verify_cert"],headers={'X-Auth-Token': creds["idrac_x_auth_token"]})    
+        if session.x_auth_token == "yes":
+            response = session.client.get('https://%s/redfish/v1/Systems/System.Embedded.1/Storage/%s' % (session.creds["idrac_ip"], controller_fqdd),verify=session.creds["verify_cert"],headers={'X-Auth-Token': session.creds["idrac_x_auth_token"]})    
         else:
-            response = requests.get('https://%s/redfish/v1/Systems/System.Embedded.1/Storage/%s' % (creds["idrac_ip"], controller_fqdd),verify=creds["verify_cert"],auth=(creds["idrac_username"], creds["idrac_password"]))
+            response = session.client.get('https://%s/redfish/v1/Systems/System.Embedded.1/Storage/%s' % (session.creds["idrac_ip"], controller_fqdd),verify=session.creds["verify_cert"],auth=(session.creds["idrac_username"], session.creds["idrac_password"]))
         data = response.json()
         drive_list=[]
         if response.status_code == 401:
@@ -172,10 +913,10 @@ def get_storage_disks(script_examples="", controller_fqdd=""):
             logging.info("\n- Drive(s) detected for %s -\n" % controller_fqdd)
             for i in data['Drives']:
                 drive_list.append(i['@odata.id'].split("/")[-1])
-                if x_auth_token == "yes":
-                    response = requests.get('https://%s/redfish/v1/Systems/System.Embedded.1/Storage/Drives/%s' % (creds["idrac_ip"], i['@odata.id'].split("/")[-1]),verify=creds["verify_cert"],headers={'X-Auth-Token': creds["idrac_x_auth_token"]})    
+                if session.x_auth_token == "yes":
+                    response = session.client.get('https://%s/redfish/v1/Systems/System.Embedded.1/Storage/Drives/%s' % (session.creds["idrac_ip"], i['@odata.id'].split("/")[-1]),verify=session.creds["verify_cert"],headers={'X-Auth-Token': session.creds["idrac_x_auth_token"]})    
                 else:
-                    response = requests.get('https://%s/redfish/v1/Systems/System.Embedded.1/Storage/Drives/%s' % (creds["idrac_ip"], i['@odata.id'].split("/")[-1]),verify=creds["verify_cert"],auth=(creds["idrac_username"], creds["idrac_password"]))
+                    response = session.client.get('https://%s/redfish/v1/Systems/System.Embedded.1/Storage/Drives/%s' % (session.creds["idrac_ip"], i['@odata.id'].split("/")[-1]),verify=session.creds["verify_cert"],auth=(session.creds["idrac_username"], session.creds["idrac_password"]))
                 data = response.json()
                 if response.status_code != 200:
                     logging.error("- ERROR, GET command failed, detailed error information: %s" % data)
@@ -185,13 +926,14 @@ def get_storage_disks(script_examples="", controller_fqdd=""):
 
 def get_storage_disk_details(script_examples="", controller_fqdd=""):
     """Function to get detailed information for all drives detected behind storage controller. Supported function argument: controller_fqdd"""
+    session = get_script_session()
     if script_examples:
         print("\n- IdracRedfishSupport.get_storage_disk_details(controller_fqdd='RAID.Integrated.1-1'), this example will return detailed information for all disks behind storage controller RAID.Integrated.1-1")
     else:
-        if x_auth_token == "yes":
-            response = requests.get('https://%s/redfish/v1/Systems/System.Embedded.1/Storage/%s' % (creds["idrac_ip"], controller_fqdd),verify=creds["verify_cert"],headers={'X-Auth-Token': creds["idrac_x_auth_token"]})    
+        if session.x_auth_token == "yes":
+            response = session.client.get('https://%s/redfish/v1/Systems/System.Embedded.1/Storage/%s' % (session.creds["idrac_ip"], controller_fqdd),verify=session.creds["verify_cert"],headers={'X-Auth-Token': session.creds["idrac_x_auth_token"]})    
         else:
-            response = requests.get('https://%s/redfish/v1/Systems/System.Embedded.1/Storage/%s' % (creds["idrac_ip"], controller_fqdd),verify=creds["verify_cert"],auth=(creds["idrac_username"], creds["idrac_password"]))
+            response = session.client.get('https://%s/redfish/v1/Systems/System.Embedded.1/Storage/%s' % (session.creds["idrac_ip"], controller_fqdd),verify=session.creds["verify_cert"],auth=(session.creds["idrac_username"], session.creds["idrac_password"]))
         data = response.json()
         drive_list=[]
         if response.status_code == 401:
@@ -207,10 +949,10 @@ def get_storage_disk_details(script_examples="", controller_fqdd=""):
             logging.info("\n- Drive(s) detected for %s -\n" % controller_fqdd)
             for i in data['Drives']:
                 drive_list.append(i['@odata.id'].split("/")[-1])
-                if x_auth_token == "yes":
-                    response = requests.get('https://%s/redfish/v1/Systems/System.Embedded.1/Storage/Drives/%s' % (creds["idrac_ip"], i['@odata.id'].split("/")[-1]),verify=creds["verify_cert"],headers={'X-Auth-Token': creds["idrac_x_auth_token"]})    
+                if session.x_auth_token == "yes":
+                    response = session.client.get('https://%s/redfish/v1/Systems/System.Embedded.1/Storage/Drives/%s' % (session.creds["idrac_ip"], i['@odata.id'].split("/")[-1]),verify=session.creds["verify_cert"],headers={'X-Auth-Token': session.creds["idrac_x_auth_token"]})    
                 else:
-                    response = requests.get('https://%s/redfish/v1/Systems/System.Embedded.1/Storage/Drives/%s' % (creds["idrac_ip"], i['@odata.id'].split("/")[-1]),verify=creds["verify_cert"],auth=(creds["idrac_username"], creds["idrac_password"]))
+                    response = session.client.get('https://%s/redfish/v1/Systems/System.Embedded.1/Storage/Drives/%s' % (session.creds["idrac_ip"], i['@odata.id'].split("/")[-1]),verify=session.creds["verify_cert"],auth=(session.creds["idrac_username"], session.creds["idrac_password"]))
                 data = response.json()
                 if response.status_code != 200:
                     logging.error("- ERROR, GET command failed, detailed error information: %s" % data)
@@ -221,13 +963,14 @@ def get_storage_disk_details(script_examples="", controller_fqdd=""):
 
 def get_storage_enclosures(script_examples=""):
     """Function to get server storage enclosure(s)"""
+    session = get_script_session()
     if script_examples:
         print("\n- IdracRedfishSupport.get_storage_enclosures(), this example will return all server storage enclosures detected.")
     else:
-        if x_auth_token == "yes":
-            response = requests.get('https://%s/redfish/v1/Chassis' % (creds["idrac_ip"]),verify=creds["verify_cert"],headers={'X-Auth-Token': creds["idrac_x_auth_token"]})    
+        if session.x_auth_token == "yes":
+            response = session.client.get('https://%s/redfish/v1/Chassis' % (session.creds["idrac_ip"]),verify=session.creds["verify_cert"],headers={'X-Auth-Token': session.creds["idrac_x_auth_token"]})    
         else:
-            response = requests.get('https://%s/redfish/v1/Chassis' % (creds["idrac_ip"]),verify=creds["verify_cert"],auth=(creds["idrac_username"], creds["idrac_password"]))
+            response = session.client.get('https://%s/redfish/v1/Chassis' % (session.creds["idrac_ip"]),verify=session.creds["verify_cert"],auth=(session.creds["idrac_username"], session.creds["idrac_password"]))
         data = response.json()
         if response.status_code == 401:
             logging.error("- ERROR, status code 401 detected, check to make sure your iDRAC script session has correct username/password credentials or if using X-auth token, confirm the session is still active.")
@@ -246,10 +989,10 @@ def get_storage_enclosures(script_examples=""):
                     print(ii[1])
                     backplane_uris.append(ii[1])
         for i in backplane_uris:
-            if x_auth_token == "yes":
-                response = requests.get('https://%s%s' % (creds["idrac_ip"], i),verify=creds["verify_cert"],headers={'X-Auth-Token': creds["idrac_x_auth_token"]})
+            if session.x_auth_token == "yes":
+                response = session.client.get('https://%s%s' % (session.creds["idrac_ip"], i),verify=session.creds["verify_cert"],headers={'X-Auth-Token': session.creds["idrac_x_auth_token"]})
             else:
-                response = requests.get('https://%s%s' % (creds["idrac_ip"], i),verify=False,auth=(creds["idrac_username"], creds["idrac_password"]))
+                response = session.client.get('https://%s%s' % (session.creds["idrac_ip"], i),verify=False,auth=(session.creds["idrac_username"], session.creds["idrac_password"]))
             logging.info("\n----- Detailed information for URI \"%s\" -----\n" % i)
             data = response.json()
             if response.status_code != 200:
@@ -260,13 +1003,14 @@ def get_storage_enclosures(script_examples=""):
 
 def get_virtual_disks(script_examples="", controller_fqdd=""):
     """Function to get virtual disk FQDDs for storage controller. Supported function argument: controller_fqdd"""
+    session = get_script_session()
     if script_examples:
         print("\n- IdracRedfishSupport.get_virtual_disks(controller_fqdd='RAID.SL.3-1'), this example will return all virtual disks detected for controller RAID.SL.3-1")
     else:
-        if x_auth_token == "yes":
-            response = requests.get('https://%s/redfish/v1/Systems/System.Embedded.1/Storage/%s/Volumes' % (creds["idrac_ip"], controller_fqdd),verify=creds["verify_cert"],headers={'X-Auth-Token': creds["idrac_x_auth_token"]})    
+        if session.x_auth_token == "yes":
+            response = session.client.get('https://%s/redfish/v1/Systems/System.Embedded.1/Storage/%s/Volumes' % (session.creds["idrac_ip"], controller_fqdd),verify=session.creds["verify_cert"],headers={'X-Auth-Token': session.creds["idrac_x_auth_token"]})    
         else:
-            response = requests.get('https://%s/redfish/v1/Systems/System.Embedded.1/Storage/%s/Volumes' % (creds["idrac_ip"], controller_fqdd),verify=creds["verify_cert"],auth=(creds["idrac_username"], creds["idrac_password"]))
+            response = session.client.get('https://%s/redfish/v1/Systems/System.Embedded.1/Storage/%s/Volumes' % (session.creds["idrac_ip"], controller_fqdd),verify=session.creds["verify_cert"],auth=(session.creds["idrac_username"], session.creds["idrac_password"]))
         data = response.json()
         vd_list=[]
         if response.status_code == 401:
@@ -283,10 +1027,10 @@ def get_virtual_disks(script_examples="", controller_fqdd=""):
                 vd_list.append(i['@odata.id'].split("/")[-1])
         logging.info("\n- Volume(s) detected for %s controller -\n" % controller_fqdd)
         for ii in vd_list:
-            if x_auth_token == "yes":
-                response = requests.get('https://%s/redfish/v1/Systems/System.Embedded.1/Storage/Volumes/%s' % (creds["idrac_ip"], ii),verify=creds["verify_cert"],headers={'X-Auth-Token': creds["idrac_x_auth_token"]})    
+            if session.x_auth_token == "yes":
+                response = session.client.get('https://%s/redfish/v1/Systems/System.Embedded.1/Storage/Volumes/%s' % (session.creds["idrac_ip"], ii),verify=session.creds["verify_cert"],headers={'X-Auth-Token': session.creds["idrac_x_auth_token"]})    
             else:
-                response = requests.get('https://%s/redfish/v1/Systems/System.Embedded.1/Storage/Volumes/%s' % (creds["idrac_ip"], ii),verify=creds["verify_cert"],auth=(creds["idrac_username"], creds["idrac_password"]))
+                response = session.client.get('https://%s/redfish/v1/Systems/System.Embedded.1/Storage/Volumes/%s' % (session.creds["idrac_ip"], ii),verify=session.creds["verify_cert"],auth=(session.creds["idrac_username"], session.creds["idrac_password"]))
             data = response.json()
             try:
                 print("%s, Volume type: %s, RAID type: %s" % (ii, data["VolumeType"], data["RAIDType"]))
@@ -295,13 +1039,14 @@ def get_virtual_disks(script_examples="", controller_fqdd=""):
 
 def get_virtual_disk_details(script_examples="", controller_fqdd=""):
     """Function to get details for all virtual disks behind storage controller. Supported function argument: controller_fqdd"""
+    session = get_script_session()
     if script_examples:
         print("\n- IdracRedfishSupport.get_virtual_disks(controller_fqdd='RAID.SL.3-1'), this example will return detailed virtual disk information for all VDs detected behind controller RAID.SL.3-1")
     else:
-        if x_auth_token == "yes":
-            response = requests.get('https://%s/redfish/v1/Systems/System.Embedded.1/Storage/%s/Volumes' % (creds["idrac_ip"], controller_fqdd),verify=creds["verify_cert"],headers={'X-Auth-Token': creds["idrac_x_auth_token"]})    
+        if session.x_auth_token == "yes":
+            response = session.client.get('https://%s/redfish/v1/Systems/System.Embedded.1/Storage/%s/Volumes' % (session.creds["idrac_ip"], controller_fqdd),verify=session.creds["verify_cert"],headers={'X-Auth-Token': session.creds["idrac_x_auth_token"]})    
         else:
-            response = requests.get('https://%s/redfish/v1/Systems/System.Embedded.1/Storage/%s/Volumes' % (creds["idrac_ip"], controller_fqdd),verify=creds["verify_cert"],auth=(creds["idrac_username"], creds["idrac_password"]))
+            response = session.client.get('https://%s/redfish/v1/Systems/System.Embedded.1/Storage/%s/Volumes' % (session.creds["idrac_ip"], controller_fqdd),verify=session.creds["verify_cert"],auth=(session.creds["idrac_username"], session.creds["idrac_password"]))
         data = response.json()
         vd_list=[]
         if response.status_code == 401:
@@ -319,10 +1064,10 @@ def get_virtual_disk_details(script_examples="", controller_fqdd=""):
                 vd_list.append(i['@odata.id'].split("/")[-1])
                 print(i['@odata.id'].split("/")[-1])
         for ii in vd_list:
-            if x_auth_token == "yes":
-                response = requests.get('https://%s/redfish/v1/Systems/System.Embedded.1/Storage/Volumes/%s' % (creds["idrac_ip"], ii),verify=creds["verify_cert"],headers={'X-Auth-Token': creds["idrac_x_auth_token"]})    
+            if session.x_auth_token == "yes":
+                response = session.client.get('https://%s/redfish/v1/Systems/System.Embedded.1/Storage/Volumes/%s' % (session.creds["idrac_ip"], ii),verify=session.creds["verify_cert"],headers={'X-Auth-Token': session.creds["idrac_x_auth_token"]})    
             else:
-                response = requests.get('https://%s/redfish/v1/Systems/System.Embedded.1/Storage/Volumes/%s' % (creds["idrac_ip"], ii),verify=creds["verify_cert"],auth=(creds["idrac_username"], creds["idrac_password"]))
+                response = session.client.get('https://%s/redfish/v1/Systems/System.Embedded.1/Storage/Volumes/%s' % (session.creds["idrac_ip"], ii),verify=session.creds["verify_cert"],auth=(session.creds["idrac_username"], session.creds["idrac_password"]))
             data = response.json()
             if response.status_code != 200:
                 logging.error("- ERROR, GET command failed, detailed error information: %s" % data)
@@ -333,19 +1078,19 @@ def get_virtual_disk_details(script_examples="", controller_fqdd=""):
 
 def reset_controller(script_examples="", controller_fqdd=""):
     """Function to reset the storage controller which will delete all virtual disks. Supported function argument: controller_fqdd"""
-    global job_id
+    session = get_script_session()
     if script_examples:
         print("\n- IdracRedfishSupport.reset_controller(controller_fqdd='RAID.SL.3-1'), this example will reset controller RAID.SL.3-1")
     else:
         payload={"TargetFQDD": controller_fqdd}
-        url = 'https://%s/redfish/v1/Dell/Systems/System.Embedded.1/DellRaidService/Actions/DellRaidService.ResetConfig' % (creds["idrac_ip"])
+        url = 'https://%s/redfish/v1/Dell/Systems/System.Embedded.1/DellRaidService/Actions/DellRaidService.ResetConfig' % (session.creds["idrac_ip"])
         method = "ResetConfig"
-        if x_auth_token == "yes":
-            headers = {'content-type': 'application/json', 'X-Auth-Token': creds["idrac_x_auth_token"]}
-            response = requests.post(url, data=json.dumps(payload), headers=headers, verify=creds["verify_cert"])
+        if session.x_auth_token == "yes":
+            headers = {'content-type': 'application/json', 'X-Auth-Token': session.creds["idrac_x_auth_token"]}
+            response = session.client.post(url, data=json.dumps(payload), headers=headers, verify=session.creds["verify_cert"])
         else:
             headers = {'content-type': 'application/json'}
-            response = requests.post(url, data=json.dumps(payload), headers=headers, verify=creds["verify_cert"],auth=(creds["idrac_username"],creds["idrac_password"]))
+            response = session.client.post(url, data=json.dumps(payload), headers=headers, verify=session.creds["verify_cert"],auth=(session.creds["idrac_username"],session.creds["idrac_password"]))
         data = response.json()
         if response.status_code == 401:
             logging.error("- ERROR, status code 401 detected, check to make sure your iDRAC script session has correct username/password credentials or if using X-auth token, confirm the session is still active.")
@@ -353,21 +1098,21 @@ def reset_controller(script_examples="", controller_fqdd=""):
         elif response.status_code == 202:
             logging.info("\n- PASS: POST command passed to reset storage controller %s, status code %s returned" % (controller_fqdd, response.status_code))
             try:
-                job_id = response.headers['Location'].split("/")[-1]
+                session.job_id = response.headers['Location'].split("/")[-1]
             except:
                 logging.error("- ERROR, unable to locate job ID in JSON headers output")
                 return
-            logging.info("- INFO, Job ID %s successfully created for RAID method \"%s\"" % (job_id, method))
+            logging.info("- INFO, Job ID %s successfully created for RAID method \"%s\"" % (session.job_id, method))
         else:
             logging.error("\n- ERROR, POST command failed to reset storage controller %s, status code is %s" % (controller_fqdd, response.status_code))
             data = response.json()
             logging.info("\n- POST command failure results:\n %s" % data)
             return
         time.sleep(5)
-        if x_auth_token == "yes":
-            response = requests.get('https://%s/redfish/v1/Managers/iDRAC.Embedded.1/Jobs/%s' % (creds["idrac_ip"], job_id),verify=creds["verify_cert"],headers={'X-Auth-Token': creds["idrac_x_auth_token"]})    
+        if session.x_auth_token == "yes":
+            response = session.client.get('https://%s/redfish/v1/Managers/iDRAC.Embedded.1/Jobs/%s' % (session.creds["idrac_ip"], session.job_id),verify=session.creds["verify_cert"],headers={'X-Auth-Token': session.creds["idrac_x_auth_token"]})    
         else:
-            response = requests.get('https://%s/redfish/v1/Managers/iDRAC.Embedded.1/Jobs/%s' % (creds["idrac_ip"], job_id),verify=creds["verify_cert"],auth=(creds["idrac_username"], creds["idrac_password"]))
+            response = session.client.get('https://%s/redfish/v1/Managers/iDRAC.Embedded.1/Jobs/%s' % (session.creds["idrac_ip"], session.job_id),verify=session.creds["verify_cert"],auth=(session.creds["idrac_username"], session.creds["idrac_password"]))
         data = response.json()
         if response.status_code != 200:
             logging.error("- ERROR, GET command failed, detailed error information: %s" % data)
@@ -380,7 +1125,7 @@ def reset_controller(script_examples="", controller_fqdd=""):
 
 def change_virtual_disk_attributes(script_examples="", vd_fqdd="", diskcachepolicy="", readcachepolicy="", writecachepolicy=""):
     """Function to change virtual disk attributes. Supported function arguments: vd_fqdd (possible value: VD FQDD), diskcachepolicy (possible values: Enabled and Disabled), readcachepolicy (Off, ReadAhead and AdaptiveReadAhead), writecachepolicy (ProtectedWriteBack, UnprotectedWriteBack and WriteThrough)."""
-    global job_id
+    session = get_script_session()
     if script_examples:
         print("\n- IdracRedfishSupport.change_virtual_disk_attributes(vd_fqdd=\"Disk.Virtual.3:RAID.Mezzanine.1-1\", diskcachepolicy=\"Disabled\",writecachepolicy=\"UnprotectedWriteBack\",readcachepolicy=\"Off\"), this example shows changing VD disk, read and write cache policy attributes.")
     else:
@@ -391,34 +1136,34 @@ def change_virtual_disk_attributes(script_examples="", vd_fqdd="", diskcachepoli
             payload["ReadCachePolicy"] = readcachepolicy
         if writecachepolicy:
             payload["WriteCachePolicy"] = writecachepolicy
-        url = "https://%s/redfish/v1/Systems/System.Embedded.1/Storage/%s/Volumes/%s/Settings" % (creds["idrac_ip"], vd_fqdd.split(":")[-1], vd_fqdd)
-        if x_auth_token == "yes":
-            headers = {'content-type': 'application/json', 'X-Auth-Token': creds["idrac_x_auth_token"]}
-            response = requests.patch(url, data=json.dumps(payload), headers=headers, verify=creds["verify_cert"])
+        url = "https://%s/redfish/v1/Systems/System.Embedded.1/Storage/%s/Volumes/%s/Settings" % (session.creds["idrac_ip"], vd_fqdd.split(":")[-1], vd_fqdd)
+        if session.x_auth_token == "yes":
+            headers = {'content-type': 'application/json', 'X-Auth-Token': session.creds["idrac_x_auth_token"]}
+            response = session.client.patch(url, data=json.dumps(payload), headers=headers, verify=session.creds["verify_cert"])
         else:
             headers = {'content-type': 'application/json'}
-            response = requests.patch(url, data=json.dumps(payload), headers=headers, verify=creds["verify_cert"],auth=(creds["idrac_username"],creds["idrac_password"]))
+            response = session.client.patch(url, data=json.dumps(payload), headers=headers, verify=session.creds["verify_cert"],auth=(session.creds["idrac_username"],session.creds["idrac_password"]))
         if response.status_code == 401:
             logging.error("- ERROR, status code 401 detected, check to make sure your iDRAC script session has correct username/password credentials or if using X-auth token, confirm the session is still active.")
             return
         elif response.status_code == 202:
             logging.info("\n- PASS: PATCH command passed to change VD attributes, status code %s returned" % response.status_code)
             try:
-                job_id = response.headers['Location'].split("/")[-1]
+                session.job_id = response.headers['Location'].split("/")[-1]
             except:
                 logging.error("- ERROR, unable to locate job ID in JSON headers output")
                 return
-            logging.info("- INFO, Job ID %s successfully created" % job_id)
+            logging.info("- INFO, Job ID %s successfully created" % session.job_id)
         else:
             logging.error("\n- ERROR, PATCH command failed to change VD attributes, status code %s returned" % response.status_code)
             data = response.json()
             logging.info("\n- POST command failure results:\n %s" % data)
             return
         time.sleep(5)
-        if x_auth_token == "yes":
-            response = requests.get('https://%s/redfish/v1/Managers/iDRAC.Embedded.1/Jobs/%s' % (creds["idrac_ip"], job_id),verify=creds["verify_cert"],headers={'X-Auth-Token': creds["idrac_x_auth_token"]})    
+        if session.x_auth_token == "yes":
+            response = session.client.get('https://%s/redfish/v1/Managers/iDRAC.Embedded.1/Jobs/%s' % (session.creds["idrac_ip"], session.job_id),verify=session.creds["verify_cert"],headers={'X-Auth-Token': session.creds["idrac_x_auth_token"]})    
         else:
-            response = requests.get('https://%s/redfish/v1/Managers/iDRAC.Embedded.1/Jobs/%s' % (creds["idrac_ip"], job_id),verify=creds["verify_cert"],auth=(creds["idrac_username"], creds["idrac_password"]))
+            response = session.client.get('https://%s/redfish/v1/Managers/iDRAC.Embedded.1/Jobs/%s' % (session.creds["idrac_ip"], session.job_id),verify=session.creds["verify_cert"],auth=(session.creds["idrac_username"], session.creds["idrac_password"]))
         data = response.json()
         if response.status_code != 200:
             logging.error("- ERROR, GET command failed, detailed error information: %s" % data)
@@ -430,33 +1175,239 @@ def change_virtual_disk_attributes(script_examples="", vd_fqdd="", diskcachepoli
         loop_job_status_final()
 
 
+class JobPoller(object):
+    """Class to calculate wait time between job status GET requests. Interval starts short based on job type, backs off exponentially with jitter while PercentComplete does not change, drops back to the short interval (or the estimated time left) when progress is detected and honors Retry-After header returned by iDRAC. Supported arguments: job_type, min_interval, max_interval (seconds), backoff and jitter (fraction of interval)."""
+    # Minimum and maximum poll interval in seconds per iDRAC job type, short jobs are detected faster and long jobs poll iDRAC less often
+    job_type_intervals = {"ExportConfiguration": (1, 10), "ImportConfiguration": (2, 30), "RealTimeNoRebootConfiguration": (2, 15), "RAIDConfiguration": (3, 30), "BIOSConfiguration": (3, 30), "LCLogExport": (1, 10), "SACollectExportHealthData": (5, 60), "FirmwareUpdate": (5, 60), "RepositoryUpdate": (5, 60), "SystemErase": (10, 120), "OSDeploy": (10, 120)}
+    default_intervals = (3, 30)
+
+    def __init__(self, job_type="", min_interval=None, max_interval=None, backoff=2, jitter=0.2):
+        self.job_type = job_type
+        self.min_interval = min_interval
+        self.max_interval = max_interval
+        self.backoff = backoff
+        self.jitter = jitter
+        self.interval = None
+        self.last_percent_complete = None
+        self.last_progress_time = None
+
+    def get_intervals(self):
+        min_interval, max_interval = self.job_type_intervals.get(self.job_type, self.default_intervals)
+        if self.min_interval is not None:
+            min_interval = self.min_interval
+        if self.max_interval is not None:
+            max_interval = self.max_interval
+        return min_interval, max(min_interval, max_interval)
+
+    def next_interval(self, response=None, data=None):
+        """Function to return number of seconds to wait before next job status GET request. Pass in the last job GET response and/or job JSON data, JobType and PercentComplete are read from either the job or task (Oem Dell) properties."""
+        if response is not None:
+            retry_after = response.headers.get("Retry-After", "")
+            if retry_after.isdigit():
+                return float(retry_after)
+            if data is None:
+                try:
+                    data = response.json()
+                except ValueError:
+                    data = None
+        percent_complete = None
+        if isinstance(data, dict):
+            job_data = data.get("Oem", {}).get("Dell", data)
+            if not self.job_type:
+                self.job_type = job_data.get("JobType") or ""
+            percent_complete = job_data.get("PercentComplete", data.get("PercentComplete"))
+        min_interval, max_interval = self.get_intervals()
+        current_time = time.time()
+        if self.interval is None:
+            self.interval = min_interval
+        elif isinstance(percent_complete, (int, float)) and self.last_percent_complete is not None and percent_complete > self.last_percent_complete:
+            # Job is progressing, estimate time left from progress rate so completion is detected soon after it happens
+            seconds_per_percent = (current_time - self.last_progress_time) / (percent_complete - self.last_percent_complete)
+            self.interval = min(max(seconds_per_percent * (100 - percent_complete), min_interval), max_interval)
+        else:
+            self.interval = min(self.interval * self.backoff, max_interval)
+        if isinstance(percent_complete, (int, float)) and percent_complete != self.last_percent_complete:
+            self.last_percent_complete = percent_complete
+            self.last_progress_time = current_time
+        return max(min_interval, self.interval * random.uniform(1 - self.jitter, 1 + self.jitter))
+
+    def wait(self, response=None, data=None):
+        """Function to sleep until next job status GET request, returns number of seconds waited."""
+        interval = self.next_interval(response=response, data=data)
+        time.sleep(interval)
+        return interval
+
+class JobTracker(object):
+    """Class to track status of multiple job IDs on one or more iDRACs. Each poll cycle executes one GET on the iDRAC Jobs collection using $expand per iDRAC (iDRACs are queried at the same time) instead of one GET per job ID. Supported argument: max_workers (max number of iDRACs queried at the same time). Example: job_tracker = IdracRedfishSupport.JobTracker() then job_tracker.add_job("JID_123456789012", session) and job_tracker.wait_for_jobs()."""
+    # NotFound is set by JobTracker if the job ID is no longer in the iDRAC job queue
+    final_job_states = ("Completed", "CompletedWithErrors", "Failed", "RebootCompleted", "RebootFailed", "NotFound")
+
+    def __init__(self, max_workers=10):
+        self.max_workers = max_workers
+        self.sessions = {}
+        self.job_ids = {}
+        self.job_status = {}
+
+    def add_job(self, job_id, session=None):
+        """Function to add job ID to track, job is tracked on the iDRAC of the session passed in or if not passed in, current script session."""
+        if session is None:
+            session = get_script_session()
+        idrac_ip = session.creds["idrac_ip"]
+        self.sessions[idrac_ip] = session
+        self.job_ids.setdefault(idrac_ip, [])
+        if job_id not in self.job_ids[idrac_ip]:
+            self.job_ids[idrac_ip].append(job_id)
+        self.job_status.setdefault(idrac_ip, {})[job_id] = {"Id": job_id, "JobState": "Unknown", "Message": "", "PercentComplete": 0}
+
+    def get_idrac_jobs(self, session):
+        """Function to GET all jobs for one iDRAC with $expand, returns dictionary of job ID and job details. Follows Members@odata.nextLink if iDRAC returns the job collection in multiple pages."""
+        uri = "/redfish/v1/Managers/iDRAC.Embedded.1/Jobs?$expand=*($levels=1)"
+        jobs = {}
+        while uri:
+            if session.x_auth_token == "yes":
+                response = session.client.get('https://%s%s' % (session.creds["idrac_ip"], uri),verify=session.creds["verify_cert"],headers={'X-Auth-Token': session.creds["idrac_x_auth_token"]})
+            else:
+                response = session.client.get('https://%s%s' % (session.creds["idrac_ip"], uri),verify=session.creds["verify_cert"],auth=(session.creds["idrac_username"], session.creds["idrac_password"]))
+            if response.status_code != 200:
+                raise requests.exceptions.HTTPError("GET job queue failed, status code %s returned" % response.status_code, response=response)
+            data = response.json()
+            for i in data.get("Members", []):
+                if "Id" in i:
+                    jobs[i["Id"]] = i
+            uri = data.get("Members@odata.nextLink", "")
+        return jobs
+
+    def get_job_status(self):
+        """Function to GET current status of all tracked jobs, returns dictionary of iDRAC IP and dictionary of job ID and job details. Job ID not found in the iDRAC job queue is returned with JobState NotFound. If GET fails for an iDRAC, last known job status is returned for that iDRAC."""
+        idrac_ips = [i for i in self.job_ids if not self.is_idrac_complete(i)]
+        with concurrent.futures.ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            futures = {executor.submit(self.get_idrac_jobs, self.sessions[i]): i for i in idrac_ips}
+            for future in concurrent.futures.as_completed(futures):
+                idrac_ip = futures[future]
+                try:
+                    jobs = future.result()
+                except Exception as error_message:
+                    logging.warning("- WARNING, unable to get job queue for iDRAC %s, error: %s" % (idrac_ip, error_message))
+                    continue
+                for job_id in self.job_ids[idrac_ip]:
+                    if job_id in jobs:
+                        self.job_status[idrac_ip][job_id] = jobs[job_id]
+                    else:
+                        self.job_status[idrac_ip][job_id] = {"Id": job_id, "JobState": "NotFound", "Message": "Job ID not found in iDRAC job queue", "PercentComplete": 0}
+        return self.job_status
+
+    def is_idrac_complete(self, idrac_ip):
+        """Function to return True if all tracked jobs for the iDRAC are marked completed or failed."""
+        return all(self.job_status[idrac_ip][i].get("JobState") in self.final_job_states for i in self.job_ids[idrac_ip])
+
+    def wait_for_jobs(self, timeout=7200, poll_interval=None, max_poll_interval=None):
+        """Function to poll all tracked jobs until they are marked completed or failed, returns final job status dictionary (see get_job_status()). Poll interval is calculated using JobPoller from the average PercentComplete of jobs not completed. Supported function arguments: timeout (seconds), poll_interval and max_poll_interval (override JobPoller intervals)."""
+        job_poller = JobPoller(min_interval=poll_interval, max_interval=max_poll_interval)
+        start_time = time.time()
+        while True:
+            self.get_job_status()
+            running_jobs = [job for idrac_ip in self.job_status for job in self.job_status[idrac_ip].values() if job.get("JobState") not in self.final_job_states]
+            if running_jobs == []:
+                logging.info("- PASS, all %s tracked job(s) marked completed or failed" % sum(len(i) for i in self.job_ids.values()))
+                break
+            if time.time() - start_time >= timeout:
+                logging.error("- ERROR, timeout of %s seconds reached, %s job(s) not completed" % (timeout, len(running_jobs)))
+                break
+            logging.info("- INFO, %s tracked job(s) not completed" % len(running_jobs))
+            percent_complete = sum(i.get("PercentComplete") or 0 for i in running_jobs) / float(len(running_jobs))
+            job_poller.wait(data={"PercentComplete": percent_complete})
+        return self.job_status
+
+def get_sse_uri():
+    """Function to get iDRAC server sent event (SSE) URI from EventService, returns empty string if iDRAC version does not support SSE. The URI is cached for the script session."""
+    session = get_script_session()
+    if session.sse_uri is None:
+        if session.x_auth_token == "yes":
+            response = session.client.get('https://%s/redfish/v1/EventService' % session.creds["idrac_ip"],verify=session.creds["verify_cert"],headers={'X-Auth-Token': session.creds["idrac_x_auth_token"]})
+        else:
+            response = session.client.get('https://%s/redfish/v1/EventService' % session.creds["idrac_ip"],verify=session.creds["verify_cert"],auth=(session.creds["idrac_username"], session.creds["idrac_password"]))
+        if response.status_code == 200:
+            session.sse_uri = response.json().get("ServerSentEventUri", "")
+        else:
+            session.sse_uri = ""
+    return session.sse_uri
+
+def get_job_status_updates(job_uri, event_timeout=60, poll_interval=None, max_poll_interval=None):
+    """Function to return job status GET responses each time the job status may have changed, used by functions which wait for a job to complete. Function opens the iDRAC SSE stream and only GETs the job when iDRAC sends an event for the job ID (or every event_timeout seconds). If SSE is not supported, job is polled using JobPoller, poll_interval and max_poll_interval override the JobPoller intervals for the job type. Supported function arguments: job_uri (job URI or job ID), event_timeout, poll_interval and max_poll_interval."""
+    session = get_script_session()
+    if not job_uri.startswith("/"):
+        job_uri = "/redfish/v1/Managers/iDRAC.Embedded.1/Jobs/%s" % job_uri
+    job_id = job_uri.rstrip("/").split("/")[-1]
+    def get_job():
+        if session.x_auth_token == "yes":
+            return session.client.get('https://%s%s' % (session.creds["idrac_ip"], job_uri),verify=session.creds["verify_cert"],headers={'X-Auth-Token': session.creds["idrac_x_auth_token"]})
+        else:
+            return session.client.get('https://%s%s' % (session.creds["idrac_ip"], job_uri),verify=session.creds["verify_cert"],auth=(session.creds["idrac_username"], session.creds["idrac_password"]))
+    response = get_job()
+    yield response
+    job_poller = JobPoller(min_interval=poll_interval, max_interval=max_poll_interval)
+    while True:
+        sse_uri = get_sse_uri()
+        if sse_uri:
+            try:
+                if session.x_auth_token == "yes":
+                    sse_response = session.client.get('https://%s%s' % (session.creds["idrac_ip"], sse_uri),verify=session.creds["verify_cert"],headers={'X-Auth-Token': session.creds["idrac_x_auth_token"], 'Accept': 'text/event-stream'},stream=True,timeout=(30, event_timeout))
+                else:
+                    sse_response = session.client.get('https://%s%s' % (session.creds["idrac_ip"], sse_uri),verify=session.creds["verify_cert"],auth=(session.creds["idrac_username"], session.creds["idrac_password"]),headers={'Accept': 'text/event-stream'},stream=True,timeout=(30, event_timeout))
+            except requests.exceptions.RequestException:
+                sse_response = None
+            if sse_response is not None and sse_response.status_code == 200:
+                # Each SSE stream is only kept open for event_timeout seconds, events for other jobs or resources reset the read timeout so the job is also GET once the stream is closed in case the job event was missed
+                stream_start_time = time.time()
+                try:
+                    for line in sse_response.iter_lines(chunk_size=1, decode_unicode=True):
+                        # iDRAC job events include the job ID in MessageArgs and OriginOfCondition
+                        if line and line.startswith("data:") and job_id in line:
+                            response = get_job()
+                            yield response
+                        if time.time() - stream_start_time >= event_timeout:
+                            break
+                except requests.exceptions.RequestException:
+                    # No event received within event_timeout or stream closed, GET job status in case an event was missed
+                    pass
+                finally:
+                    sse_response.close()
+                response = get_job()
+                yield response
+                continue
+            if sse_response is not None:
+                sse_response.close()
+            logging.info("- INFO, unable to open iDRAC SSE event stream, job status will be polled")
+            session.sse_uri = ""
+        job_poller.wait(response=response)
+        response = get_job()
+        yield response
+
 def loop_job_status_final():
     """Function to loop checking final job status, this function cannot be called individually and is leveraged only by other functions after POST action is executed to create a job ID"""
+    session = get_script_session()
     start_time = datetime.now()
-    while True:
-        if x_auth_token == "yes":
-            response = requests.get('https://%s/redfish/v1/Managers/iDRAC.Embedded.1/Jobs/%s' % (creds["idrac_ip"], job_id),verify=creds["verify_cert"],headers={'X-Auth-Token': creds["idrac_x_auth_token"]})    
-        else:
-            response = requests.get('https://%s/redfish/v1/Managers/iDRAC.Embedded.1/Jobs/%s' % (creds["idrac_ip"], job_id),verify=creds["verify_cert"],auth=(creds["idrac_username"], creds["idrac_password"]))
+    job_status_updates = get_job_status_updates(session.job_id)
+    for response in job_status_updates:
         current_time=(datetime.now()-start_time)
         if response.status_code == 401:
             logging.error("- ERROR, status code 401 detected, check to make sure your iDRAC script session has correct username/password credentials or if using X-auth token, confirm the session is still active.")
-            return
+            break
         elif response.status_code != 200:
             logging.error("\n- ERROR, Command failed to check job status, return code is %s" % response.status_code)
             logging.info("Extended Info Message: {0}".format(response.json()))
-            return
+            break
         data = response.json()
         if str(current_time)[0:7] >= "2:00:00":
             logging.error("\n- ERROR: Timeout of 2 hours has been hit, script stopped\n")
-            return
+            break
         elif "Fail" in data['Message'] or "fail" in data['Message'] or data['JobState'] == "Failed":
-            logging.error("- ERROR, job ID %s failed, final job status message: %s" % (job_id, data['Message']))
+            logging.error("- ERROR, job ID %s failed, final job status message: %s" % (session.job_id, data['Message']))
             logging.info("- INFO, check iDRAC Lifecycle Logs for more details about the job failure")
-            return
+            break
         elif "Lifecycle Controller in use" in data["Message"]:
             logging.warning("- WARNING, Lifecycle Controller in use detected, job will start when Lifecycle Controller is available. Check server state to make sure it is out of POST and iDRAC job queue to confirm no jobs are already executing.")
-            return
+            break
         elif data['JobState'] == "Completed":
             logging.info("\n--- PASS, Final Detailed Job Status Results ---\n")
             for i in data.items():
@@ -465,25 +1416,25 @@ def loop_job_status_final():
             break
         else:
             logging.info("- INFO, job status not completed, current status: \"%s\"" % (data['Message'].strip(".")))
-            time.sleep(3)
+    # Close the generator so the SSE stream connection is released
+    job_status_updates.close()
             
 def create_virtual_disk(script_examples="", controller_fqdd="", disk_fqdds="", raid_level="", vd_name="", vd_size="", vd_stripesize="", secure="", diskcachepolicy="", readcachepolicy="", writecachepolicy=""):
     """Function to create virtual disk. Function arguments: controller_fqdd, disk_fqdds (if you\'re passing in multiple drives for VD creation, pass them in as a list), raid_level, supported integer values: 0, 1, 5, 6, 10, 50 and 60 (not all RAID levels are supported on each storage contoller), vd_name is optional (if not passed in, controller will set using default name), vd_size is optional (integer value in bytes) and if not passed in VD creation will use the full disk size, vd_stripesize is optional (integer value in bytes) and if not passed in controller will assign the default stripesize for the RAID level, secure is optional (pass in value of True to secure the VD during VD creation), diskcachepolicy is optional (possible values: Enabled and Disabled), readcachepolicy is optional (Off, ReadAhead and AdaptiveReadAhead), writecachepolicy (ProtectedWriteBack, UnprotectedWriteBack and WriteThrough)."""
-    global job_id
-    global job_type
+    session = get_script_session()
     if script_examples:
         print("""\n- IdracRedfishSupport.create_virtual_disk(controller_fqdd="RAID.Mezzanine.1-1", disk_fqdds="Disk.Bay.13:Enclosure.Internal.0-1:RAID.Mezzanine.1-1", raid_level=0, vd_name="RAID_ZERO", vd_size=107374182400, vd_stripesize=131072), this example will create 100GB RAID 0 with stripesize 128KB
         \n- IdracRedfishSupport.create_virtual_disk(controller_fqdd="RAID.Mezzanine.1-1", disk_fqdds=["Disk.Bay.19:Enclosure.Internal.0-1:RAID.Mezzanine.1-1","Disk.Bay.20:Enclosure.Internal.0-1:RAID.Mezzanine.1-1"],raid_level=1), this example will create RAID 1 using full disk size""")
     else:
-        if x_auth_token == "yes":
-            response = requests.get('https://%s/redfish/v1/Managers/iDRAC.Embedded.1' % (creds["idrac_ip"]),verify=creds["verify_cert"],headers={'X-Auth-Token': creds["idrac_x_auth_token"]})    
+        if session.x_auth_token == "yes":
+            response = session.client.get('https://%s/redfish/v1/Managers/iDRAC.Embedded.1' % (session.creds["idrac_ip"]),verify=session.creds["verify_cert"],headers={'X-Auth-Token': session.creds["idrac_x_auth_token"]})    
         else:
-            response = requests.get('https://%s/redfish/v1/Managers/iDRAC.Embedded.1' % (creds["idrac_ip"]),verify=creds["verify_cert"],auth=(creds["idrac_username"], creds["idrac_password"]))
+            response = session.client.get('https://%s/redfish/v1/Managers/iDRAC.Embedded.1' % (session.creds["idrac_ip"]),verify=session.creds["verify_cert"],auth=(session.creds["idrac_username"], session.creds["idrac_password"]))
         if response.status_code != 200:
             logging.error("\n- ERROR, GET command failed, status code %s returned" % response.status_code)
             logging.info("Extended Info Message: {0}".format(response.json()))
             return
-        url = 'https://%s/redfish/v1/Systems/System.Embedded.1/Storage/%s/Volumes' % (creds["idrac_ip"], controller_fqdd)
+        url = 'https://%s/redfish/v1/Systems/System.Embedded.1/Storage/%s/Volumes' % (session.creds["idrac_ip"], controller_fqdd)
         data = response.json()
         get_version = data['FirmwareVersion'].split(".")[:2]
         get_version = int("".join(get_version))
@@ -529,12 +1480,12 @@ def create_virtual_disk(script_examples="", controller_fqdd="", disk_fqdds="", r
             payload["ReadCachePolicy"] = readcachepolicy
         if writecachepolicy:
             payload["WriteCachePolicy"] = writecachepolicy
-        if x_auth_token == "yes":
-            headers = {'content-type': 'application/json', 'X-Auth-Token': creds["idrac_x_auth_token"]}
-            response = requests.post(url, data=json.dumps(payload), headers=headers, verify=creds["verify_cert"])
+        if session.x_auth_token == "yes":
+            headers = {'content-type': 'application/json', 'X-Auth-Token': session.creds["idrac_x_auth_token"]}
+            response = session.client.post(url, data=json.dumps(payload), headers=headers, verify=session.creds["verify_cert"])
         else:
             headers = {'content-type': 'application/json'}
-            response = requests.post(url, data=json.dumps(payload), headers=headers, verify=creds["verify_cert"],auth=(creds["idrac_username"],creds["idrac_password"]))
+            response = session.client.post(url, data=json.dumps(payload), headers=headers, verify=session.creds["verify_cert"],auth=(session.creds["idrac_username"],session.creds["idrac_password"]))
         if response.status_code == 401:
             logging.error("- ERROR, status code 401 detected, check to make sure your iDRAC script session has correct username/password credentials or if using X-auth token, confirm the session is still active.")
             return
@@ -548,30 +1499,31 @@ def create_virtual_disk(script_examples="", controller_fqdd="", disk_fqdds="", r
             return
         get_header_location = response.headers["Location"]
         try:
-            job_id = get_header_location.split("/")[-1]
+            session.job_id = get_header_location.split("/")[-1]
         except:
             logging.error("\n- ERROR, unable to locate job ID in the headers response, check job queue if job ID was created.")
             return
             
-        if x_auth_token == "yes":
-            response = requests.get('https://%s/redfish/v1/Managers/iDRAC.Embedded.1/Jobs/%s' % (creds["idrac_ip"], job_id),verify=creds["verify_cert"],headers={'X-Auth-Token': creds["idrac_x_auth_token"]})    
+        if session.x_auth_token == "yes":
+            response = session.client.get('https://%s/redfish/v1/Managers/iDRAC.Embedded.1/Jobs/%s' % (session.creds["idrac_ip"], session.job_id),verify=session.creds["verify_cert"],headers={'X-Auth-Token': session.creds["idrac_x_auth_token"]})    
         else:
-            response = requests.get('https://%s/redfish/v1/Managers/iDRAC.Embedded.1/Jobs/%s' % (creds["idrac_ip"], job_id),verify=creds["verify_cert"],auth=(creds["idrac_username"], creds["idrac_password"]))
+            response = session.client.get('https://%s/redfish/v1/Managers/iDRAC.Embedded.1/Jobs/%s' % (session.creds["idrac_ip"], session.job_id),verify=session.creds["verify_cert"],auth=(session.creds["idrac_username"], session.creds["idrac_password"]))
         data = response.json()
         if data['JobType'] == "RAIDConfiguration":
-            job_type = "staged"
+            session.job_type = "staged"
         elif data['JobType'] == "RealTimeNoRebootConfiguration":
-            job_type = "realtime"
-        logging.info("\n- PASS, \"%s\" %s job ID successfully created" % (job_type, job_id))
+            session.job_type = "realtime"
+        logging.info("\n- PASS, \"%s\" %s job ID successfully created" % (session.job_type, session.job_id))
 
-        if job_type == "staged":
+        if session.job_type == "staged":
             logging.info("- INFO, staged config job detected, server will validate scheduled job status before rebooting the server")
+            job_poller = JobPoller(job_type="RAIDConfiguration")
             while True:
                 try:
-                    if x_auth_token == "yes":
-                        response = requests.get('https://%s/redfish/v1/Managers/iDRAC.Embedded.1/Jobs/%s' % (creds["idrac_ip"], job_id),verify=creds["verify_cert"],headers={'X-Auth-Token': creds["idrac_x_auth_token"]})    
+                    if session.x_auth_token == "yes":
+                        response = session.client.get('https://%s/redfish/v1/Managers/iDRAC.Embedded.1/Jobs/%s' % (session.creds["idrac_ip"], session.job_id),verify=session.creds["verify_cert"],headers={'X-Auth-Token': session.creds["idrac_x_auth_token"]})    
                     else:
-                        response = requests.get('https://%s/redfish/v1/Managers/iDRAC.Embedded.1/Jobs/%s' % (creds["idrac_ip"], job_id),verify=creds["verify_cert"],auth=(creds["idrac_username"], creds["idrac_password"]))
+                        response = session.client.get('https://%s/redfish/v1/Managers/iDRAC.Embedded.1/Jobs/%s' % (session.creds["idrac_ip"], session.job_id),verify=session.creds["verify_cert"],auth=(session.creds["idrac_username"], session.creds["idrac_password"]))
                 except requests.ConnectionError as error_message:
                     print(error_message)
                     return
@@ -580,7 +1532,6 @@ def create_virtual_disk(script_examples="", controller_fqdd="", disk_fqdds="", r
                     logging.error("\n- ERROR, Command failed to check job status, return code is %s" % statusCode)
                     logging.info("Extended Info Message: {0}".format(req.json()))
                     return
-                time.sleep(5)
                 data = response.json()
                 if data['Message'] == "Task successfully scheduled.":
                     logging.info("- INFO, staged config job marked as scheduled")
@@ -595,28 +1546,30 @@ def create_virtual_disk(script_examples="", controller_fqdd="", disk_fqdds="", r
                         break
                 else:
                     print("- INFO: JobStatus not scheduled, current status: %s\n" % data['Message'])
-        if job_type == "realtime":
+                    job_poller.wait(response=response, data=data)
+        if session.job_type == "realtime":
             logging.info("- INFO, realtime config job detected, no reboot needed to create the VD")
             loop_job_status_final()
         
 
 def reboot_server():
     """Function to reboot the server to execute configuration or updates jobs that require server reboot to apply. This function cannot be called directly and will be called by other functions after POST action is executed to create a job ID"""
-    if x_auth_token == "yes":
-        response = requests.get('https://%s/redfish/v1/Systems/System.Embedded.1' % creds["idrac_ip"],verify=creds["verify_cert"],headers={'X-Auth-Token': creds["idrac_x_auth_token"]})    
+    session = get_script_session()
+    if session.x_auth_token == "yes":
+        response = session.client.get('https://%s/redfish/v1/Systems/System.Embedded.1' % session.creds["idrac_ip"],verify=session.creds["verify_cert"],headers={'X-Auth-Token': session.creds["idrac_x_auth_token"]})    
     else:
-        response = requests.get('https://%s/redfish/v1/Systems/System.Embedded.1' % creds["idrac_ip"],verify=creds["verify_cert"],auth=(creds["idrac_username"], creds["idrac_password"]))
+        response = session.client.get('https://%s/redfish/v1/Systems/System.Embedded.1' % session.creds["idrac_ip"],verify=session.creds["verify_cert"],auth=(session.creds["idrac_username"], session.creds["idrac_password"]))
     data = response.json()
     logging.info("\n- INFO, Current server power state is: %s" % data['PowerState'])
     if data['PowerState'] == "On":
-        url = 'https://%s/redfish/v1/Systems/System.Embedded.1/Actions/ComputerSystem.Reset' % creds["idrac_ip"]
+        url = 'https://%s/redfish/v1/Systems/System.Embedded.1/Actions/ComputerSystem.Reset' % session.creds["idrac_ip"]
         payload = {'ResetType': 'GracefulShutdown'}
-        if x_auth_token == "yes":
-            headers = {'content-type': 'application/json', 'X-Auth-Token': creds["idrac_x_auth_token"]}
-            response = requests.post(url, data=json.dumps(payload), headers=headers, verify=creds["verify_cert"])
+        if session.x_auth_token == "yes":
+            headers = {'content-type': 'application/json', 'X-Auth-Token': session.creds["idrac_x_auth_token"]}
+            response = session.client.post(url, data=json.dumps(payload), headers=headers, verify=session.creds["verify_cert"])
         else:
             headers = {'content-type': 'application/json'}
-            response = requests.post(url, data=json.dumps(payload), headers=headers, verify=creds["verify_cert"],auth=(creds["idrac_username"],creds["idrac_password"]))
+            response = session.client.post(url, data=json.dumps(payload), headers=headers, verify=session.creds["verify_cert"],auth=(session.creds["idrac_username"],session.creds["idrac_password"]))
         if response.status_code == 401:
             logging.error("- ERROR, status code 401 detected, check to make sure your iDRAC script session has correct username/password credentials or if using X-auth token, confirm the session is still active.")
             return
@@ -629,24 +1582,24 @@ def reboot_server():
             return
         count = 0
         while True:
-            if x_auth_token == "yes":
-                response = requests.get('https://%s/redfish/v1/Systems/System.Embedded.1' % creds["idrac_ip"],verify=creds["verify_cert"],headers={'X-Auth-Token': creds["idrac_x_auth_token"]})    
+            if session.x_auth_token == "yes":
+                response = session.client.get('https://%s/redfish/v1/Systems/System.Embedded.1' % session.creds["idrac_ip"],verify=session.creds["verify_cert"],headers={'X-Auth-Token': session.creds["idrac_x_auth_token"]})    
             else:
-                response = requests.get('https://%s/redfish/v1/Systems/System.Embedded.1' % creds["idrac_ip"],verify=creds["verify_cert"],auth=(creds["idrac_username"], creds["idrac_password"]))
+                response = session.client.get('https://%s/redfish/v1/Systems/System.Embedded.1' % session.creds["idrac_ip"],verify=session.creds["verify_cert"],auth=(session.creds["idrac_username"], session.creds["idrac_password"]))
             data = response.json()
             if data['PowerState'] == "Off":
                 logging.info("- PASS, GET command passed to verify server is in OFF state")
                 break
             elif count == 20:
                 logging.info("- INFO, unable to graceful shutdown the server, will perform forced shutdown now")
-                url = 'https://%s/redfish/v1/Systems/System.Embedded.1/Actions/ComputerSystem.Reset' % creds["idrac_ip"]
+                url = 'https://%s/redfish/v1/Systems/System.Embedded.1/Actions/ComputerSystem.Reset' % session.creds["idrac_ip"]
                 payload = {'ResetType': 'ForceOff'}
-                if x_auth_token == "yes":
-                    headers = {'content-type': 'application/json', 'X-Auth-Token': creds["idrac_x_auth_token"]}
-                    response = requests.post(url, data=json.dumps(payload), headers=headers, verify=creds["verify_cert"])
+                if session.x_auth_token == "yes":
+                    headers = {'content-type': 'application/json', 'X-Auth-Token': session.creds["idrac_x_auth_token"]}
+                    response = session.client.post(url, data=json.dumps(payload), headers=headers, verify=session.creds["verify_cert"])
                 else:
                     headers = {'content-type': 'application/json'}
-                    response = requests.post(url, data=json.dumps(payload), headers=headers, verify=creds["verify_cert"],auth=(creds["idrac_username"],creds["idrac_password"]))
+                    response = session.client.post(url, data=json.dumps(payload), headers=headers, verify=session.creds["verify_cert"],auth=(session.creds["idrac_username"],session.creds["idrac_password"]))
                 if response.status_code == 204:
                     logging.info("- PASS, POST action passed to forcefully power OFF server")
                     time.sleep(15)
@@ -660,12 +1613,12 @@ def reboot_server():
                 count+=1
                 continue
         payload = {'ResetType': 'On'}
-        if x_auth_token == "yes":
-            headers = {'content-type': 'application/json', 'X-Auth-Token': creds["idrac_x_auth_token"]}
-            response = requests.post(url, data=json.dumps(payload), headers=headers, verify=creds["verify_cert"])
+        if session.x_auth_token == "yes":
+            headers = {'content-type': 'application/json', 'X-Auth-Token': session.creds["idrac_x_auth_token"]}
+            response = session.client.post(url, data=json.dumps(payload), headers=headers, verify=session.creds["verify_cert"])
         else:
             headers = {'content-type': 'application/json'}
-            response = requests.post(url, data=json.dumps(payload), headers=headers, verify=creds["verify_cert"],auth=(creds["idrac_username"],creds["idrac_password"]))
+            response = session.client.post(url, data=json.dumps(payload), headers=headers, verify=session.creds["verify_cert"],auth=(session.creds["idrac_username"],session.creds["idrac_password"]))
         if response.status_code == 204:
             logging.info("- PASS, POST action passed to power ON server")
         else:
@@ -673,14 +1626,14 @@ def reboot_server():
             logging.info("Extended Info Message: {0}".format(response.json()))
             return
     elif data['PowerState'] == "Off":
-        url = 'https://%s/redfish/v1/Systems/System.Embedded.1/Actions/ComputerSystem.Reset' % creds["idrac_ip"]
+        url = 'https://%s/redfish/v1/Systems/System.Embedded.1/Actions/ComputerSystem.Reset' % session.creds["idrac_ip"]
         payload = {'ResetType': 'On'}
-        if x_auth_token == "yes":
-            headers = {'content-type': 'application/json', 'X-Auth-Token': creds["idrac_x_auth_token"]}
-            response = requests.post(url, data=json.dumps(payload), headers=headers, verify=creds["verify_cert"])
+        if session.x_auth_token == "yes":
+            headers = {'content-type': 'application/json', 'X-Auth-Token': session.creds["idrac_x_auth_token"]}
+            response = session.client.post(url, data=json.dumps(payload), headers=headers, verify=session.creds["verify_cert"])
         else:
             headers = {'content-type': 'application/json'}
-            response = requests.post(url, data=json.dumps(payload), headers=headers, verify=creds["verify_cert"],auth=(creds["idrac_username"],creds["idrac_password"]))
+            response = session.client.post(url, data=json.dumps(payload), headers=headers, verify=session.creds["verify_cert"],auth=(session.creds["idrac_username"],session.creds["idrac_password"]))
         if response.status_code == 204:
             logging.info("- PASS, POST action passed to power ON server")
         else:
@@ -694,13 +1647,14 @@ def reboot_server():
 
 def get_current_server_power_state(script_examples=""):
     """Function to get current server power state and supported possible values for changing server power state"""
+    session = get_script_session()
     if script_examples:
         print("\n- IdracRedfishSupport.get_current_server_power_state(), this example will get current server power state and possible supported values for executing set_server_power_state()")
     else:
-        if x_auth_token == "yes":
-            response = requests.get('https://%s/redfish/v1/Systems/System.Embedded.1' % creds["idrac_ip"],verify=creds["verify_cert"],headers={'X-Auth-Token': creds["idrac_x_auth_token"]})    
+        if session.x_auth_token == "yes":
+            response = session.client.get('https://%s/redfish/v1/Systems/System.Embedded.1' % session.creds["idrac_ip"],verify=session.creds["verify_cert"],headers={'X-Auth-Token': session.creds["idrac_x_auth_token"]})    
         else:
-            response = requests.get('https://%s/redfish/v1/Systems/System.Embedded.1' % creds["idrac_ip"],verify=creds["verify_cert"],auth=(creds["idrac_username"], creds["idrac_password"]))
+            response = session.client.get('https://%s/redfish/v1/Systems/System.Embedded.1' % session.creds["idrac_ip"],verify=session.creds["verify_cert"],auth=(session.creds["idrac_username"], session.creds["idrac_password"]))
         data = response.json()
         if response.status_code == 401:
             logging.error("- ERROR, status code 401 detected, check to make sure your iDRAC script session has correct username/password credentials or if using X-auth token, confirm the session is still active.")
@@ -717,19 +1671,20 @@ def get_current_server_power_state(script_examples=""):
 
 def set_server_power_state(script_examples="", power_state_value=""):
     """Function to change server power state to perform power operations. Supported function argument: power_state_value (supported values: execute "IdracRedfishSupport.get_current_server_power_state()" to get supported possible values)"""
+    session = get_script_session()
     if script_examples:
         print("""\n- IdracRedfishSupport.set_server_power_state(power_state_value="ForceOff"), this example will set server power state to ForceOff (force shutdown the server to off state).
         \n- IdracRedfishSupport.set_server_power_state(power_state_value="GracefulRestart"), this example will set server power state to GracefulRestart (graceful shutdown of the server and reboot)""")
     else:
         logging.info("\n- INFO, setting new server power state value: %s" % (power_state_value))
-        url = 'https://%s/redfish/v1/Systems/System.Embedded.1/Actions/ComputerSystem.Reset' % creds["idrac_ip"]
+        url = 'https://%s/redfish/v1/Systems/System.Embedded.1/Actions/ComputerSystem.Reset' % session.creds["idrac_ip"]
         payload = {'ResetType': power_state_value}
-        if x_auth_token == "yes":
-            headers = {'content-type': 'application/json', 'X-Auth-Token': creds["idrac_x_auth_token"]}
-            response = requests.post(url, data=json.dumps(payload), headers=headers, verify=creds["verify_cert"])
+        if session.x_auth_token == "yes":
+            headers = {'content-type': 'application/json', 'X-Auth-Token': session.creds["idrac_x_auth_token"]}
+            response = session.client.post(url, data=json.dumps(payload), headers=headers, verify=session.creds["verify_cert"])
         else:
             headers = {'content-type': 'application/json'}
-            response = requests.post(url, data=json.dumps(payload), headers=headers, verify=creds["verify_cert"],auth=(creds["idrac_username"],creds["idrac_password"]))
+            response = session.client.post(url, data=json.dumps(payload), headers=headers, verify=session.creds["verify_cert"],auth=(session.creds["idrac_username"],session.creds["idrac_password"]))
         if response.status_code == 401:
             logging.error("- ERROR, status code 401 detected, check to make sure your iDRAC script session has correct username/password credentials or if using X-auth token, confirm the session is still active.")
             return
@@ -743,18 +1698,19 @@ def set_server_power_state(script_examples="", power_state_value=""):
 
 def get_remote_service_api_status(script_examples=""):
     """Function to get the server remote services status. This will return: lifecycle controller(LC) status, real time monitoring (RT) status, overall server status, Telemetry status(if supported) and overall status."""
+    session = get_script_session()
     if script_examples:
         print("\n- IdracRedfishSupport.get_remote_service_api_status(), this example will return LC, RT, server and Telemetry status.")
     else:
-        url = 'https://%s/redfish/v1/Dell/Managers/iDRAC.Embedded.1/DellLCService/Actions/DellLCService.GetRemoteServicesAPIStatus' % (creds["idrac_ip"])
+        url = 'https://%s/redfish/v1/Dell/Managers/iDRAC.Embedded.1/DellLCService/Actions/DellLCService.GetRemoteServicesAPIStatus' % (session.creds["idrac_ip"])
         method = "GetRemoteServicesAPIStatus"
         payload={}
-        if x_auth_token == "yes":
-            headers = {'content-type': 'application/json', 'X-Auth-Token': creds["idrac_x_auth_token"]}
-            response = requests.post(url, data=json.dumps(payload), headers=headers, verify=creds["verify_cert"])
+        if session.x_auth_token == "yes":
+            headers = {'content-type': 'application/json', 'X-Auth-Token': session.creds["idrac_x_auth_token"]}
+            response = session.client.post(url, data=json.dumps(payload), headers=headers, verify=session.creds["verify_cert"])
         else:
             headers = {'content-type': 'application/json'}
-            response = requests.post(url, data=json.dumps(payload), headers=headers, verify=creds["verify_cert"],auth=(creds["idrac_username"],creds["idrac_password"]))
+            response = session.client.post(url, data=json.dumps(payload), headers=headers, verify=session.creds["verify_cert"],auth=(session.creds["idrac_username"],session.creds["idrac_password"]))
         data=response.json()
         if response.status_code == 401:
             logging.error("- ERROR, status code 401 detected, check to make sure your iDRAC script session has correct username/password credentials or if using X-auth token, confirm the session is still active.")
@@ -772,18 +1728,17 @@ def get_remote_service_api_status(script_examples=""):
 
 def delete_virtual_disk(script_examples="", virtual_disk_fqdd=""):
     """Function to delete storage controller virtual disk. Supported function argument: virtual_disk_fqdd (pass in virtual disk FQDD string)"""
-    global job_id
-    global job_type
+    session = get_script_session()
     if script_examples:
         print("\n- IdracRedfishSupport.delete_virtual_disk(virtual_disk_fqdd='Disk.Virtual.1:RAID.Mezzanine.1-1'), this example will delete VD 1 for controller RAID.Mezzanine.1-1")
     else:
-        url = 'https://%s/redfish/v1/Systems/System.Embedded.1/Storage/Volumes/%s' % (creds["idrac_ip"], virtual_disk_fqdd)
-        if x_auth_token == "yes":
-            headers = {'content-type': 'application/json', 'X-Auth-Token': creds["idrac_x_auth_token"]}
-            response = requests.delete(url, headers=headers, verify=creds["verify_cert"])
+        url = 'https://%s/redfish/v1/Systems/System.Embedded.1/Storage/Volumes/%s' % (session.creds["idrac_ip"], virtual_disk_fqdd)
+        if session.x_auth_token == "yes":
+            headers = {'content-type': 'application/json', 'X-Auth-Token': session.creds["idrac_x_auth_token"]}
+            response = session.client.delete(url, headers=headers, verify=session.creds["verify_cert"])
         else:
             headers = {'content-type': 'application/json'}
-            response = requests.delete(url, headers=headers, verify=creds["verify_cert"],auth=(creds["idrac_username"],creds["idrac_password"]))
+            response = session.client.delete(url, headers=headers, verify=session.creds["verify_cert"],auth=(session.creds["idrac_username"],session.creds["idrac_password"]))
         if response.status_code == 401:
             logging.error("- ERROR, status code 401 detected, check to make sure your iDRAC script session has correct username/password credentials or if using X-auth token, confirm the session is still active.")
             return
@@ -797,29 +1752,30 @@ def delete_virtual_disk(script_examples="", virtual_disk_fqdd=""):
             return
         get_header_location = response.headers["Location"]
         try:
-            job_id = get_header_location.split("/")[-1]
+            session.job_id = get_header_location.split("/")[-1]
         except:
             logging.error("\n- ERROR, unable to locate job ID in the headers response, check job queue if job ID was created.")
             return          
-        if x_auth_token == "yes":
-            response = requests.get('https://%s/redfish/v1/Managers/iDRAC.Embedded.1/Jobs/%s' % (creds["idrac_ip"], job_id),verify=creds["verify_cert"],headers={'X-Auth-Token': creds["idrac_x_auth_token"]})    
+        if session.x_auth_token == "yes":
+            response = session.client.get('https://%s/redfish/v1/Managers/iDRAC.Embedded.1/Jobs/%s' % (session.creds["idrac_ip"], session.job_id),verify=session.creds["verify_cert"],headers={'X-Auth-Token': session.creds["idrac_x_auth_token"]})    
         else:
-            response = requests.get('https://%s/redfish/v1/Managers/iDRAC.Embedded.1/Jobs/%s' % (creds["idrac_ip"], job_id),verify=creds["verify_cert"],auth=(creds["idrac_username"], creds["idrac_password"]))
+            response = session.client.get('https://%s/redfish/v1/Managers/iDRAC.Embedded.1/Jobs/%s' % (session.creds["idrac_ip"], session.job_id),verify=session.creds["verify_cert"],auth=(session.creds["idrac_username"], session.creds["idrac_password"]))
         data = response.json()
         if data['JobType'] == "RAIDConfiguration":
-            job_type = "staged"
+            session.job_type = "staged"
         elif data['JobType'] == "RealTimeNoRebootConfiguration":
-            job_type = "realtime"
-        print("\n- PASS, \"%s\" %s jid successfully created to delete virtual disk" % (job_type, job_id))
+            session.job_type = "realtime"
+        print("\n- PASS, \"%s\" %s jid successfully created to delete virtual disk" % (session.job_type, session.job_id))
 
-        if job_type == "staged":
+        if session.job_type == "staged":
             print("- INFO, staged config job detected, server will validate scheduled job status before rebooting the server")
+            job_poller = JobPoller(job_type="RAIDConfiguration")
             while True:
                 try:
-                    if x_auth_token == "yes":
-                        response = requests.get('https://%s/redfish/v1/Managers/iDRAC.Embedded.1/Jobs/%s' % (creds["idrac_ip"], job_id),verify=creds["verify_cert"],headers={'X-Auth-Token': creds["idrac_x_auth_token"]})    
+                    if session.x_auth_token == "yes":
+                        response = session.client.get('https://%s/redfish/v1/Managers/iDRAC.Embedded.1/Jobs/%s' % (session.creds["idrac_ip"], session.job_id),verify=session.creds["verify_cert"],headers={'X-Auth-Token': session.creds["idrac_x_auth_token"]})    
                     else:
-                        response = requests.get('https://%s/redfish/v1/Managers/iDRAC.Embedded.1/Jobs/%s' % (creds["idrac_ip"], job_id),verify=creds["verify_cert"],auth=(creds["idrac_username"], creds["idrac_password"]))
+                        response = session.client.get('https://%s/redfish/v1/Managers/iDRAC.Embedded.1/Jobs/%s' % (session.creds["idrac_ip"], session.job_id),verify=session.creds["verify_cert"],auth=(session.creds["idrac_username"], session.creds["idrac_password"]))
                 except requests.ConnectionError as error_message:
                     logging.error(error_message)
                     return
@@ -827,7 +1783,6 @@ def delete_virtual_disk(script_examples="", virtual_disk_fqdd=""):
                     logging.error("\n- ERROR, GET command failed to check job status, status code %s returned" % response.status_code)
                     logging.info("Extended Info Message: {0}".format(req.json()))
                     return
-                time.sleep(5)
                 data = response.json()
                 if data['Message'] == "Task successfully scheduled.":
                     logging.info("- INFO, staged config job marked as scheduled")
@@ -842,27 +1797,27 @@ def delete_virtual_disk(script_examples="", virtual_disk_fqdd=""):
                         break
                 else:
                     logging.info("- INFO: job status not marked as scheduled, current status: %s\n" % data['Message'])
-        if job_type == "realtime":
+                    job_poller.wait(response=response, data=data)
+        if session.job_type == "realtime":
             logging.info("- INFO, realtime config job detected, no reboot needed to execute storage operation")
             loop_job_status_final()
 
 
 def initialize_virtual_disk(script_examples="", virtual_disk_fqdd="", init_type=""):
     """Function to initialize virtual disk. Supported function arguments: virtual_disk_fqdd and init_type (supported values: Fast and Slow)."""
-    global job_id
-    global job_type
+    session = get_script_session()
     if script_examples:
         print("\n- IdracRedfishSupport.initialize_virtual_disk(virtual_disk_fqdd='Disk.Virtual.1:RAID.Mezzanine.1-1', init_type='Fast'), this example will run fast init on virtual disk 1.")
     else:
         controller = virtual_disk_fqdd.split(":")[-1]
         payload={"InitializeType":init_type}
-        url = 'https://%s/redfish/v1/Systems/System.Embedded.1/Storage/%s/Volumes/%s/Actions/Volume.Initialize' % (creds["idrac_ip"], controller, virtual_disk_fqdd)
-        if x_auth_token == "yes":
-            headers = {'content-type': 'application/json', 'X-Auth-Token': creds["idrac_x_auth_token"]}
-            response = requests.post(url, data=json.dumps(payload), headers=headers, verify=creds["verify_cert"])
+        url = 'https://%s/redfish/v1/Systems/System.Embedded.1/Storage/%s/Volumes/%s/Actions/Volume.Initialize' % (session.creds["idrac_ip"], controller, virtual_disk_fqdd)
+        if session.x_auth_token == "yes":
+            headers = {'content-type': 'application/json', 'X-Auth-Token': session.creds["idrac_x_auth_token"]}
+            response = session.client.post(url, data=json.dumps(payload), headers=headers, verify=session.creds["verify_cert"])
         else:
             headers = {'content-type': 'application/json'}
-            response = requests.post(url, data=json.dumps(payload), headers=headers, verify=creds["verify_cert"],auth=(creds["idrac_username"],creds["idrac_password"]))
+            response = session.client.post(url, data=json.dumps(payload), headers=headers, verify=session.creds["verify_cert"],auth=(session.creds["idrac_username"],session.creds["idrac_password"]))
         if response.status_code == 401:
             logging.error("- ERROR, status code 401 detected, check to make sure your iDRAC script session has correct username/password credentials or if using X-auth token, confirm the session is still active.")
             return
@@ -876,29 +1831,30 @@ def initialize_virtual_disk(script_examples="", virtual_disk_fqdd="", init_type=
             return
         get_header_location = response.headers["Location"]
         try:
-            job_id = get_header_location.split("/")[-1]
+            session.job_id = get_header_location.split("/")[-1]
         except:
             logging.error("\n- ERROR, unable to locate job ID in the headers response, check job queue if job ID was created.")
             return   
-        if x_auth_token == "yes":
-            response = requests.get('https://%s/redfish/v1/Managers/iDRAC.Embedded.1/Jobs/%s' % (creds["idrac_ip"], job_id),verify=creds["verify_cert"],headers={'X-Auth-Token': creds["idrac_x_auth_token"]})    
+        if session.x_auth_token == "yes":
+            response = session.client.get('https://%s/redfish/v1/Managers/iDRAC.Embedded.1/Jobs/%s' % (session.creds["idrac_ip"], session.job_id),verify=session.creds["verify_cert"],headers={'X-Auth-Token': session.creds["idrac_x_auth_token"]})    
         else:
-            response = requests.get('https://%s/redfish/v1/Managers/iDRAC.Embedded.1/Jobs/%s' % (creds["idrac_ip"], job_id),verify=creds["verify_cert"],auth=(creds["idrac_username"], creds["idrac_password"]))
+            response = session.client.get('https://%s/redfish/v1/Managers/iDRAC.Embedded.1/Jobs/%s' % (session.creds["idrac_ip"], session.job_id),verify=session.creds["verify_cert"],auth=(session.creds["idrac_username"], session.creds["idrac_password"]))
         data = response.json()
         if data['JobType'] == "RAIDConfiguration":
-            job_type = "staged"
+            session.job_type = "staged"
         elif data['JobType'] == "RealTimeNoRebootConfiguration":
-            job_type = "realtime"
-        logging.info("\n- PASS, \"%s\" %s job ID successfully created" % (job_type, job_id))
+            session.job_type = "realtime"
+        logging.info("\n- PASS, \"%s\" %s job ID successfully created" % (session.job_type, session.job_id))
 
-        if job_type == "staged":
+        if session.job_type == "staged":
             logging.info("- INFO, staged config job detected, server will validate scheduled job status before rebooting the server")
+            job_poller = JobPoller(job_type="RAIDConfiguration")
             while True:
                 try:
-                    if x_auth_token == "yes":
-                        response = requests.get('https://%s/redfish/v1/Managers/iDRAC.Embedded.1/Jobs/%s' % (creds["idrac_ip"], job_id),verify=creds["verify_cert"],headers={'X-Auth-Token': creds["idrac_x_auth_token"]})    
+                    if session.x_auth_token == "yes":
+                        response = session.client.get('https://%s/redfish/v1/Managers/iDRAC.Embedded.1/Jobs/%s' % (session.creds["idrac_ip"], session.job_id),verify=session.creds["verify_cert"],headers={'X-Auth-Token': session.creds["idrac_x_auth_token"]})    
                     else:
-                        response = requests.get('https://%s/redfish/v1/Managers/iDRAC.Embedded.1/Jobs/%s' % (creds["idrac_ip"], job_id),verify=creds["verify_cert"],auth=(creds["idrac_username"], creds["idrac_password"]))
+                        response = session.client.get('https://%s/redfish/v1/Managers/iDRAC.Embedded.1/Jobs/%s' % (session.creds["idrac_ip"], session.job_id),verify=session.creds["verify_cert"],auth=(session.creds["idrac_username"], session.creds["idrac_password"]))
                 except requests.ConnectionError as error_message:
                     logging.error(error_message)
                     return
@@ -906,7 +1862,6 @@ def initialize_virtual_disk(script_examples="", virtual_disk_fqdd="", init_type=
                     logging.error("\n- ERROR, GET command failed to check job status, return code %s" % response.status_code)
                     logging.error("Extended Info Message: {0}".format(req.json()))
                     return
-                time.sleep(5)
                 data = response.json()
                 if data['Message'] == "Task successfully scheduled.":
                     logging.info("- INFO, staged config job marked as scheduled")
@@ -921,26 +1876,26 @@ def initialize_virtual_disk(script_examples="", virtual_disk_fqdd="", init_type=
                         break
                 else:
                     logging.info("- INFO: job status not scheduled, current status: %s\n" % data['Message'])
-        if job_type == "realtime":
+                    job_poller.wait(response=response, data=data)
+        if session.job_type == "realtime":
             logging.info("- INFO, realtime config job detected, no reboot needed to execute storage operation")
             loop_job_status_final()
 
 
 def secure_erase_disk(script_examples="", controller_fqdd="", disk_fqdd=""):
     """Function to secure erase (cryptographic erase) disk (HDD/SSD or NVMe type), supported function arguments: controller_fqdd and disk_fqdd. Note: Disk must not be part of a virtual disk for secure erase to pass."""
-    global job_id
-    global job_type
+    session = get_script_session()
     if script_examples:
         print("\n- IdracRedfishSupport.secure_erase_disk(controller_fqdd='RAID.Mezzanine.1-1', disk_fqdd='Disk.Bay.0:Enclosure.Internal.0-1:RAID.Mezzanine.1-1'), this example will secure erase disk 0 behind storage controller RAID.Mezzanine.1-1")
     else:
         payload={}
-        url = 'https://%s/redfish/v1/Systems/System.Embedded.1/Storage/%s/Drives/%s/Actions/Drive.SecureErase' % (creds["idrac_ip"], controller_fqdd, disk_fqdd)
-        if x_auth_token == "yes":
-            headers = {'content-type': 'application/json', 'X-Auth-Token': creds["idrac_x_auth_token"]}
-            response = requests.post(url, data=json.dumps(payload), headers=headers, verify=creds["verify_cert"])
+        url = 'https://%s/redfish/v1/Systems/System.Embedded.1/Storage/%s/Drives/%s/Actions/Drive.SecureErase' % (session.creds["idrac_ip"], controller_fqdd, disk_fqdd)
+        if session.x_auth_token == "yes":
+            headers = {'content-type': 'application/json', 'X-Auth-Token': session.creds["idrac_x_auth_token"]}
+            response = session.client.post(url, data=json.dumps(payload), headers=headers, verify=session.creds["verify_cert"])
         else:
             headers = {'content-type': 'application/json'}
-            response = requests.post(url, data=json.dumps(payload), headers=headers, verify=creds["verify_cert"],auth=(creds["idrac_username"],creds["idrac_password"]))
+            response = session.client.post(url, data=json.dumps(payload), headers=headers, verify=session.creds["verify_cert"],auth=(session.creds["idrac_username"],session.creds["idrac_password"]))
         if response.status_code == 401:
             logging.error("- ERROR, status code 401 detected, check to make sure your iDRAC script session has correct username/password credentials or if using X-auth token, confirm the session is still active.")
             return
@@ -954,28 +1909,29 @@ def secure_erase_disk(script_examples="", controller_fqdd="", disk_fqdd=""):
             return
         get_header_location = response.headers["Location"]
         try:
-            job_id = get_header_location.split("/")[-1]
+            session.job_id = get_header_location.split("/")[-1]
         except:
             logging.error("\n- ERROR, unable to locate job ID in the headers response, check job queue if job ID was created.")
             return    
-        if x_auth_token == "yes":
-            response = requests.get('https://%s/redfish/v1/Managers/iDRAC.Embedded.1/Jobs/%s' % (creds["idrac_ip"], job_id),verify=creds["verify_cert"],headers={'X-Auth-Token': creds["idrac_x_auth_token"]})    
+        if session.x_auth_token == "yes":
+            response = session.client.get('https://%s/redfish/v1/Managers/iDRAC.Embedded.1/Jobs/%s' % (session.creds["idrac_ip"], session.job_id),verify=session.creds["verify_cert"],headers={'X-Auth-Token': session.creds["idrac_x_auth_token"]})    
         else:
-            response = requests.get('https://%s/redfish/v1/Managers/iDRAC.Embedded.1/Jobs/%s' % (creds["idrac_ip"], job_id),verify=creds["verify_cert"],auth=(creds["idrac_username"], creds["idrac_password"]))
+            response = session.client.get('https://%s/redfish/v1/Managers/iDRAC.Embedded.1/Jobs/%s' % (session.creds["idrac_ip"], session.job_id),verify=session.creds["verify_cert"],auth=(session.creds["idrac_username"], session.creds["idrac_password"]))
         data = response.json()
         if data['JobType'] == "RAIDConfiguration":
-            job_type = "staged"
+            session.job_type = "staged"
         elif data['JobType'] == "RealTimeNoRebootConfiguration":
-            job_type = "realtime"
-        logging.info("\n- PASS, \"%s\" %s job ID successfully created" % (job_type, job_id))
-        if job_type == "staged":
+            session.job_type = "realtime"
+        logging.info("\n- PASS, \"%s\" %s job ID successfully created" % (session.job_type, session.job_id))
+        if session.job_type == "staged":
             logging.info("- INFO, staged config job detected, server will validate scheduled job status before rebooting the server")
+            job_poller = JobPoller(job_type="RAIDConfiguration")
             while True:
                 try:
-                    if x_auth_token == "yes":
-                        response = requests.get('https://%s/redfish/v1/Managers/iDRAC.Embedded.1/Jobs/%s' % (creds["idrac_ip"], job_id),verify=creds["verify_cert"],headers={'X-Auth-Token': creds["idrac_x_auth_token"]})    
+                    if session.x_auth_token == "yes":
+                        response = session.client.get('https://%s/redfish/v1/Managers/iDRAC.Embedded.1/Jobs/%s' % (session.creds["idrac_ip"], session.job_id),verify=session.creds["verify_cert"],headers={'X-Auth-Token': session.creds["idrac_x_auth_token"]})    
                     else:
-                        response = requests.get('https://%s/redfish/v1/Managers/iDRAC.Embedded.1/Jobs/%s' % (creds["idrac_ip"], job_id),verify=creds["verify_cert"],auth=(creds["idrac_username"], creds["idrac_password"]))
+                        response = session.client.get('https://%s/redfish/v1/Managers/iDRAC.Embedded.1/Jobs/%s' % (session.creds["idrac_ip"], session.job_id),verify=session.creds["verify_cert"],auth=(session.creds["idrac_username"], session.creds["idrac_password"]))
                 except requests.ConnectionError as error_message:
                     logging.error(error_message)
                     return
@@ -983,7 +1939,6 @@ def secure_erase_disk(script_examples="", controller_fqdd="", disk_fqdd=""):
                     logging.error("\n- ERROR, GET command failed to check job status, return code is %s" % response.status_code)
                     logging.error("Extended Info Message: {0}".format(req.json()))
                     return
-                time.sleep(5)
                 data = response.json()
                 if data['Message'] == "Task successfully scheduled.":
                     logging.info("- INFO, staged config job marked as scheduled")
@@ -998,29 +1953,30 @@ def secure_erase_disk(script_examples="", controller_fqdd="", disk_fqdd=""):
                         break
                 else:
                     print("- INFO: JobStatus not scheduled, current status: %s\n" % data['Message'])
-        if job_type == "realtime":
+                    job_poller.wait(response=response, data=data)
+        if session.job_type == "realtime":
             logging.info("- INFO, realtime config job detected, no reboot needed to execute storage operation")
             loop_job_status_final()
 
 def assign_disk_hotspare(script_examples="", hotspare_type="", disk_fqdd="", virtual_disk_fqdd="default"):
     """Function to assign disk hotspare, global or dedicated. Supported function arguments: hotspare_type (supported values are dedicated or global), disk_fqdd and virtual_disk_fqdd (only required if assigning dedicated hotspare)."""
-    global job_id
+    session = get_script_session()
     if script_examples:
         print("""\n- IdracRedfishSupport.assign_disk_hotspare(hotspare_type="global", disk_fqdd="Disk.Bay.6:Enclosure.Internal.0-1:RAID.Mezzanine.1-1"), this example will assign disk 6 as global hotspare.
         \n- IdracRedfishSupport.assign_disk_hotspare(hotspare_type="dedicated", disk_fqdd="Disk.Bay.6:Enclosure.Internal.0-1:RAID.Mezzanine.1-1"), virtual_disk_fqdd="Disk.Virtual.0:RAID.Mezzanine.1-1"), this example will assign disk 6 as dedicated hotspare for RAID 1 virtual disk 0.""")
     else:
         method = "AssignSpare"
-        url = 'https://%s/redfish/v1/Dell/Systems/System.Embedded.1/DellRaidService/Actions/DellRaidService.AssignSpare' % (creds["idrac_ip"])
+        url = 'https://%s/redfish/v1/Dell/Systems/System.Embedded.1/DellRaidService/Actions/DellRaidService.AssignSpare' % (session.creds["idrac_ip"])
         if hotspare_type.lower() == "global":
             payload={"TargetFQDD":disk_fqdd}
         elif hotspare_type.lower() == "dedicated":
             payload={"TargetFQDD":disk_fqdd,"VirtualDiskArray":[virtual_disk_fqdd]}
-        if x_auth_token == "yes":
-            headers = {'content-type': 'application/json', 'X-Auth-Token': creds["idrac_x_auth_token"]}
-            response = requests.post(url, data=json.dumps(payload), headers=headers, verify=creds["verify_cert"])
+        if session.x_auth_token == "yes":
+            headers = {'content-type': 'application/json', 'X-Auth-Token': session.creds["idrac_x_auth_token"]}
+            response = session.client.post(url, data=json.dumps(payload), headers=headers, verify=session.creds["verify_cert"])
         else:
             headers = {'content-type': 'application/json'}
-            response = requests.post(url, data=json.dumps(payload), headers=headers, verify=creds["verify_cert"],auth=(creds["idrac_username"],creds["idrac_password"]))
+            response = session.client.post(url, data=json.dumps(payload), headers=headers, verify=session.creds["verify_cert"],auth=(session.creds["idrac_username"],session.creds["idrac_password"]))
         data = response.json()
         if response.status_code == 401:
             logging.error("- ERROR, status code 401 detected, check to make sure your iDRAC script session has correct username/password credentials or if using X-auth token, confirm the session is still active.")
@@ -1029,21 +1985,21 @@ def assign_disk_hotspare(script_examples="", hotspare_type="", disk_fqdd="", vir
             logging.info("\n- PASS: POST command passed to set disk \"%s\" as \"%s\" hot spare" % (disk_fqdd, hotspare_type))
             time.sleep(5)
             try:
-                job_id = response.headers['Location'].split("/")[-1]
+                session.job_id = response.headers['Location'].split("/")[-1]
             except:
                 logging.error("- FAIL, unable to locate job ID in JSON headers output")
                 return
-            logging.info("- Job ID %s successfully created for storage method \"%s\"" % (job_id, method))
+            logging.info("- Job ID %s successfully created for storage method \"%s\"" % (session.job_id, method))
         else:
             logging.error("\n- FAIL, POST command failed to set disk %s as %s hot spare" % (disk_fqdd, hotspare_type))
             data = response.json()
             logging.error("\n- POST command failure results:\n %s" % data)
             return
         time.sleep(5)
-        if x_auth_token == "yes":
-            response = requests.get('https://%s/redfish/v1/Managers/iDRAC.Embedded.1/Jobs/%s' % (creds["idrac_ip"], job_id),verify=creds["verify_cert"],headers={'X-Auth-Token': creds["idrac_x_auth_token"]})    
+        if session.x_auth_token == "yes":
+            response = session.client.get('https://%s/redfish/v1/Managers/iDRAC.Embedded.1/Jobs/%s' % (session.creds["idrac_ip"], session.job_id),verify=session.creds["verify_cert"],headers={'X-Auth-Token': session.creds["idrac_x_auth_token"]})    
         else:
-            response = requests.get('https://%s/redfish/v1/Managers/iDRAC.Embedded.1/Jobs/%s' % (creds["idrac_ip"], job_id),verify=creds["verify_cert"],auth=(creds["idrac_username"], creds["idrac_password"]))
+            response = session.client.get('https://%s/redfish/v1/Managers/iDRAC.Embedded.1/Jobs/%s' % (session.creds["idrac_ip"], session.job_id),verify=session.creds["verify_cert"],auth=(session.creds["idrac_username"], session.creds["idrac_password"]))
         data = response.json()
         if data['JobType'] == "RAIDConfiguration":
             logging.info("- INFO, staged config job created, server will now reboot to execute the config job")
@@ -1054,19 +2010,19 @@ def assign_disk_hotspare(script_examples="", hotspare_type="", disk_fqdd="", vir
 
 def unassign_disk_hotspare(script_examples="", disk_fqdd=""):
     """Function to unassign disk hotspare. Supported function argument: disk_fqdd."""
-    global job_id
+    session = get_script_session()
     if script_examples:
         print("""\n- IdracRedfishSupport.unassign_disk_hotspare(disk_fqdd="Disk.Bay.6:Enclosure.Internal.0-1:RAID.Mezzanine.1-1"), this example will unassign disk 6 as a hotspare.""")
     else:
         method = "UnassignSpare"
-        url = 'https://%s/redfish/v1/Dell/Systems/System.Embedded.1/DellRaidService/Actions/DellRaidService.UnassignSpare' % (creds["idrac_ip"])
+        url = 'https://%s/redfish/v1/Dell/Systems/System.Embedded.1/DellRaidService/Actions/DellRaidService.UnassignSpare' % (session.creds["idrac_ip"])
         payload={"TargetFQDD":disk_fqdd}
-        if x_auth_token == "yes":
-            headers = {'content-type': 'application/json', 'X-Auth-Token': creds["idrac_x_auth_token"]}
-            response = requests.post(url, data=json.dumps(payload), headers=headers, verify=creds["verify_cert"])
+        if session.x_auth_token == "yes":
+            headers = {'content-type': 'application/json', 'X-Auth-Token': session.creds["idrac_x_auth_token"]}
+            response = session.client.post(url, data=json.dumps(payload), headers=headers, verify=session.creds["verify_cert"])
         else:
             headers = {'content-type': 'application/json'}
-            response = requests.post(url, data=json.dumps(payload), headers=headers, verify=creds["verify_cert"],auth=(creds["idrac_username"],creds["idrac_password"]))
+            response = session.client.post(url, data=json.dumps(payload), headers=headers, verify=session.creds["verify_cert"],auth=(session.creds["idrac_username"],session.creds["idrac_password"]))
         data = response.json()
         if response.status_code == 401:
             logging.error("- ERROR, status code 401 detected, check to make sure your iDRAC script session has correct username/password credentials or if using X-auth token, confirm the session is still active.")
@@ -1075,21 +2031,21 @@ def unassign_disk_hotspare(script_examples="", disk_fqdd=""):
             logging.info("\n- PASS: POST command passed to unassign disk \"%s\" as hotspare" % (disk_fqdd))
             time.sleep(5)
             try:
-                job_id = response.headers['Location'].split("/")[-1]
+                session.job_id = response.headers['Location'].split("/")[-1]
             except:
                 print("- FAIL, unable to locate job ID in JSON headers output")
                 return
-            logging.info("- Job ID %s successfully created for storage method \"%s\"" % (job_id, method))
+            logging.info("- Job ID %s successfully created for storage method \"%s\"" % (session.job_id, method))
         else:
             logging.error("\n- FAIL, POST command failed to unassign disk \"%s\" as hot spare" % (disk_fqdd))
             data = response.json()
             logging.error("\n- POST command failure results:\n %s" % data)
             return
         time.sleep(5)
-        if x_auth_token == "yes":
-            response = requests.get('https://%s/redfish/v1/Managers/iDRAC.Embedded.1/Jobs/%s' % (creds["idrac_ip"], job_id),verify=creds["verify_cert"],headers={'X-Auth-Token': creds["idrac_x_auth_token"]})    
+        if session.x_auth_token == "yes":
+            response = session.client.get('https://%s/redfish/v1/Managers/iDRAC.Embedded.1/Jobs/%s' % (session.creds["idrac_ip"], session.job_id),verify=session.creds["verify_cert"],headers={'X-Auth-Token': session.creds["idrac_x_auth_token"]})    
         else:
-            response = requests.get('https://%s/redfish/v1/Managers/iDRAC.Embedded.1/Jobs/%s' % (creds["idrac_ip"], job_id),verify=creds["verify_cert"],auth=(creds["idrac_username"], creds["idrac_password"]))
+            response = session.client.get('https://%s/redfish/v1/Managers/iDRAC.Embedded.1/Jobs/%s' % (session.creds["idrac_ip"], session.job_id),verify=session.creds["verify_cert"],auth=(session.creds["idrac_username"], session.creds["idrac_password"]))
         data = response.json()
         if data['JobType'] == "RAIDConfiguration":
             logging.info("- INFO, staged config job created, server will now reboot to execute the config job")
@@ -1100,15 +2056,15 @@ def unassign_disk_hotspare(script_examples="", disk_fqdd=""):
 
 def set_storage_controller_key(script_examples="", controller_fqdd="", key_id=""):
     """Function to set the storage controller key \"enable encryption\" for Local Key Management (LKM). Supported function arguments: controller_fqdd and key_id (unique string value). Once function is executed, it will prompt you to enter key passphrase to set (minimum length is 8 characters, must have at least 1 upper and 1 lowercase, 1 number and 1 special character. Refer to Dell PERC documentation for more information)."""
-    global job_id
+    session = get_script_session()
     if script_examples:
         print("""\n- IdracRedfishSupport.set_storage_controller_key(controller_fqdd="RAID.Mezzanine.1-1", key_id="testkey"), this example will set controller LKM encryption. Script will prompt you to enter new passphrase.""")
     else:
         method = "SetControllerKey"
-        if x_auth_token == "yes":
-            response = requests.get('https://%s/redfish/v1/Systems/System.Embedded.1/Storage/%s' % (creds["idrac_ip"], controller_fqdd),verify=creds["verify_cert"],headers={'X-Auth-Token': creds["idrac_x_auth_token"]})    
+        if session.x_auth_token == "yes":
+            response = session.client.get('https://%s/redfish/v1/Systems/System.Embedded.1/Storage/%s' % (session.creds["idrac_ip"], controller_fqdd),verify=session.creds["verify_cert"],headers={'X-Auth-Token': session.creds["idrac_x_auth_token"]})    
         else:
-            response = requests.get('https://%s/redfish/v1/Systems/System.Embedded.1/Storage/%s' % (creds["idrac_ip"], controller_fqdd),verify=creds["verify_cert"],auth=(creds["idrac_username"], creds["idrac_password"]))
+            response = session.client.get('https://%s/redfish/v1/Systems/System.Embedded.1/Storage/%s' % (session.creds["idrac_ip"], controller_fqdd),verify=session.creds["verify_cert"],auth=(session.creds["idrac_username"], session.creds["idrac_password"]))
         data = response.json()
         if data['Oem']['Dell']['DellController']['SecurityStatus'] == "EncryptionNotCapable":
             logging.warning("\n- WARNING, storage controller %s does not support encryption" % controller_fqdd)
@@ -1116,14 +2072,14 @@ def set_storage_controller_key(script_examples="", controller_fqdd="", key_id=""
         else:
             pass
         key_passphrase = getpass.getpass("- Enter new key passphrase to set: ")
-        url = 'https://%s/redfish/v1/Dell/Systems/System.Embedded.1/DellRaidService/Actions/DellRaidService.SetControllerKey' % (creds["idrac_ip"])
+        url = 'https://%s/redfish/v1/Dell/Systems/System.Embedded.1/DellRaidService/Actions/DellRaidService.SetControllerKey' % (session.creds["idrac_ip"])
         payload={"TargetFQDD":controller_fqdd,"Key":key_passphrase,"Keyid":key_id}
-        if x_auth_token == "yes":
-            headers = {'content-type': 'application/json', 'X-Auth-Token': creds["idrac_x_auth_token"]}
-            response = requests.post(url, data=json.dumps(payload), headers=headers, verify=creds["verify_cert"])
+        if session.x_auth_token == "yes":
+            headers = {'content-type': 'application/json', 'X-Auth-Token': session.creds["idrac_x_auth_token"]}
+            response = session.client.post(url, data=json.dumps(payload), headers=headers, verify=session.creds["verify_cert"])
         else:
             headers = {'content-type': 'application/json'}
-            response = requests.post(url, data=json.dumps(payload), headers=headers, verify=creds["verify_cert"],auth=(creds["idrac_username"],creds["idrac_password"]))
+            response = session.client.post(url, data=json.dumps(payload), headers=headers, verify=session.creds["verify_cert"],auth=(session.creds["idrac_username"],session.creds["idrac_password"]))
         data = response.json()
         if response.status_code == 401:
             logging.error("- ERROR, status code 401 detected, check to make sure your iDRAC script session has correct username/password credentials or if using X-auth token, confirm the session is still active.")
@@ -1132,21 +2088,21 @@ def set_storage_controller_key(script_examples="", controller_fqdd="", key_id=""
             logging.info("\n- PASS: POST command passed to set the controller key for controller %s" % controller_fqdd)
             time.sleep(5)
             try:
-                job_id = response.headers['Location'].split("/")[-1]
+                session.job_id = response.headers['Location'].split("/")[-1]
             except:
                 print("- FAIL, unable to locate job ID in JSON headers output")
                 return
-            logging.info("- Job ID %s successfully created for storage method \"%s\"" % (job_id, method)) 
+            logging.info("- Job ID %s successfully created for storage method \"%s\"" % (session.job_id, method)) 
         else:
             logging.error("\n- FAIL, POST command failed to set the controller key for controller %s" % controller_fqdd)
             data = response.json()
             logging.error("\n- POST command failure results:\n %s" % data)
             return
         time.sleep(5)
-        if x_auth_token == "yes":
-            response = requests.get('https://%s/redfish/v1/Managers/iDRAC.Embedded.1/Jobs/%s' % (creds["idrac_ip"], job_id),verify=creds["verify_cert"],headers={'X-Auth-Token': creds["idrac_x_auth_token"]})    
+        if session.x_auth_token == "yes":
+            response = session.client.get('https://%s/redfish/v1/Managers/iDRAC.Embedded.1/Jobs/%s' % (session.creds["idrac_ip"], session.job_id),verify=session.creds["verify_cert"],headers={'X-Auth-Token': session.creds["idrac_x_auth_token"]})    
         else:
-            response = requests.get('https://%s/redfish/v1/Managers/iDRAC.Embedded.1/Jobs/%s' % (creds["idrac_ip"], job_id),verify=creds["verify_cert"],auth=(creds["idrac_username"], creds["idrac_password"]))
+            response = session.client.get('https://%s/redfish/v1/Managers/iDRAC.Embedded.1/Jobs/%s' % (session.creds["idrac_ip"], session.job_id),verify=session.creds["verify_cert"],auth=(session.creds["idrac_username"], session.creds["idrac_password"]))
         data = response.json()
         if data['JobType'] == "RAIDConfiguration":
             logging.info("- INFO, staged config job created, server will now reboot to execute the config job")
@@ -1156,21 +2112,21 @@ def set_storage_controller_key(script_examples="", controller_fqdd="", key_id=""
 
 def rekey_storage_controller_key(script_examples="", controller_fqdd="", encryption_mode="", key_id="default"):
     """Function to rekey storage controller key (Local Key Management (LKM) or Secure Enterprise Key Manager (SEKM). Supported function arguments: controller_fqdd, encryption_mode (supported values are SEKM or LKM) and key_id (only supported for LKM, you can pass in either current string value set or change to a new string value). If LKM rekey is being performed, function will prompt you to enter current key passphrase, then set new key passphrase."""
-    global job_id
+    session = get_script_session()
     if script_examples:
         print("""\n- IdracRedfishSupport.rekey_storage_controller_key(controller_fqdd="RAID.Mezzanine.1-1", encryption_mode="LKM", key_id="newkey"), this example will rekey controller key for RAID.Mezzanine.1-1. It will prompt user to enter current passphrase and new passphrase.""")
     else:
         method = "ReKey"
-        if x_auth_token == "yes":
-            response = requests.get('https://%s/redfish/v1/Systems/System.Embedded.1/Storage/%s' % (creds["idrac_ip"], controller_fqdd),verify=creds["verify_cert"],headers={'X-Auth-Token': creds["idrac_x_auth_token"]})    
+        if session.x_auth_token == "yes":
+            response = session.client.get('https://%s/redfish/v1/Systems/System.Embedded.1/Storage/%s' % (session.creds["idrac_ip"], controller_fqdd),verify=session.creds["verify_cert"],headers={'X-Auth-Token': session.creds["idrac_x_auth_token"]})    
         else:
-            response = requests.get('https://%s/redfish/v1/Systems/System.Embedded.1/Storage/%s' % (creds["idrac_ip"], controller_fqdd),verify=creds["verify_cert"],auth=(creds["idrac_username"], creds["idrac_password"]))
+            response = session.client.get('https://%s/redfish/v1/Systems/System.Embedded.1/Storage/%s' % (session.creds["idrac_ip"], controller_fqdd),verify=session.creds["verify_cert"],auth=(session.creds["idrac_username"], session.creds["idrac_password"]))
         data = response.json()
         current_key_id = data["Oem"]["Dell"]["DellController"]["KeyID"]
         if data['Oem']['Dell']['DellController']['SecurityStatus'] == "EncryptionNotCapable":
             logging.warning("\n- WARNING, storage controller %s does not support encryption" % controller_fqdd)
             return
-        url = 'https://%s/redfish/v1/Dell/Systems/System.Embedded.1/DellRaidService/Actions/DellRaidService.ReKey' % (creds["idrac_ip"])
+        url = 'https://%s/redfish/v1/Dell/Systems/System.Embedded.1/DellRaidService/Actions/DellRaidService.ReKey' % (session.creds["idrac_ip"])
         if encryption_mode.upper() == "LKM":
             old_key_passphrase = getpass.getpass("- Enter current key passphrase: ")
             new_key_passphrase = getpass.getpass("- Enter new key passphrase to set: ")
@@ -1183,12 +2139,12 @@ def rekey_storage_controller_key(script_examples="", controller_fqdd="", encrypt
         else:
             logging.error("- FAIL, invalid value or missing value for encryption_mode argument")
             return
-        if x_auth_token == "yes":
-            headers = {'content-type': 'application/json', 'X-Auth-Token': creds["idrac_x_auth_token"]}
-            response = requests.post(url, data=json.dumps(payload), headers=headers, verify=creds["verify_cert"])
+        if session.x_auth_token == "yes":
+            headers = {'content-type': 'application/json', 'X-Auth-Token': session.creds["idrac_x_auth_token"]}
+            response = session.client.post(url, data=json.dumps(payload), headers=headers, verify=session.creds["verify_cert"])
         else:
             headers = {'content-type': 'application/json'}
-            response = requests.post(url, data=json.dumps(payload), headers=headers, verify=creds["verify_cert"],auth=(creds["idrac_username"],creds["idrac_password"]))
+            response = session.client.post(url, data=json.dumps(payload), headers=headers, verify=session.creds["verify_cert"],auth=(session.creds["idrac_username"],session.creds["idrac_password"]))
         data = response.json()
         if response.status_code == 401:
             logging.error("- ERROR, status code 401 detected, check to make sure your iDRAC script session has correct username/password credentials or if using X-auth token, confirm the session is still active.")
@@ -1197,21 +2153,21 @@ def rekey_storage_controller_key(script_examples="", controller_fqdd="", encrypt
             logging.info("\n- PASS: POST command passed to rekey the controller for %s" % controller_fqdd)
             time.sleep(5)
             try:
-                job_id = response.headers['Location'].split("/")[-1]
+                session.job_id = response.headers['Location'].split("/")[-1]
             except:
                 logging.error("- FAIL, unable to locate job ID in JSON headers output")
                 return
-            logging.info("- Job ID %s successfully created for storage method \"%s\"" % (job_id, method)) 
+            logging.info("- Job ID %s successfully created for storage method \"%s\"" % (session.job_id, method)) 
         else:
             logging.error("\n- FAIL, POST command failed to set the controller key for controller %s" % controller_fqdd)
             data = response.json()
             logging.error("\n- POST command failure results:\n %s" % data)
             return
         time.sleep(5)
-        if x_auth_token == "yes":
-            response = requests.get('https://%s/redfish/v1/Managers/iDRAC.Embedded.1/Jobs/%s' % (creds["idrac_ip"], job_id),verify=creds["verify_cert"],headers={'X-Auth-Token': creds["idrac_x_auth_token"]})    
+        if session.x_auth_token == "yes":
+            response = session.client.get('https://%s/redfish/v1/Managers/iDRAC.Embedded.1/Jobs/%s' % (session.creds["idrac_ip"], session.job_id),verify=session.creds["verify_cert"],headers={'X-Auth-Token': session.creds["idrac_x_auth_token"]})    
         else:
-            response = requests.get('https://%s/redfish/v1/Managers/iDRAC.Embedded.1/Jobs/%s' % (creds["idrac_ip"], job_id),verify=creds["verify_cert"],auth=(creds["idrac_username"], creds["idrac_password"]))
+            response = session.client.get('https://%s/redfish/v1/Managers/iDRAC.Embedded.1/Jobs/%s' % (session.creds["idrac_ip"], session.job_id),verify=session.creds["verify_cert"],auth=(session.creds["idrac_username"], session.creds["idrac_password"]))
         data = response.json()
         if data['JobType'] == "RAIDConfiguration":
             logging.info("- INFO, staged config job created, server will now reboot to execute the config job")
@@ -1222,29 +2178,29 @@ def rekey_storage_controller_key(script_examples="", controller_fqdd="", encrypt
 
 def remove_storage_controller_key(script_examples="", controller_fqdd=""):
     """Function to remove storage controller key for Local Key Management (LKM) configured. Supported function argument: controller_fqdd."""
-    global job_id
+    session = get_script_session()
     if script_examples:
         print("""\n- IdracRedfishSupport.remove_storage_controller_key(controller_fqdd="RAID.Mezzanine.1-1"), this example will remove controller key for RAID.Mezzanine.1-1.""")
     else:
         method = "RemoveControllerKey"
-        if x_auth_token == "yes":
-            response = requests.get('https://%s/redfish/v1/Systems/System.Embedded.1/Storage/%s' % (creds["idrac_ip"], controller_fqdd),verify=creds["verify_cert"],headers={'X-Auth-Token': creds["idrac_x_auth_token"]})    
+        if session.x_auth_token == "yes":
+            response = session.client.get('https://%s/redfish/v1/Systems/System.Embedded.1/Storage/%s' % (session.creds["idrac_ip"], controller_fqdd),verify=session.creds["verify_cert"],headers={'X-Auth-Token': session.creds["idrac_x_auth_token"]})    
         else:
-            response = requests.get('https://%s/redfish/v1/Systems/System.Embedded.1/Storage/%s' % (creds["idrac_ip"], controller_fqdd),verify=creds["verify_cert"],auth=(creds["idrac_username"], creds["idrac_password"]))
+            response = session.client.get('https://%s/redfish/v1/Systems/System.Embedded.1/Storage/%s' % (session.creds["idrac_ip"], controller_fqdd),verify=session.creds["verify_cert"],auth=(session.creds["idrac_username"], session.creds["idrac_password"]))
         data = response.json()
         if data['Oem']['Dell']['DellController']['SecurityStatus'] == "EncryptionNotCapable":
             print("\n- WARNING, storage controller %s does not support encryption" % controller_fqdd)
             return
         else:
             pass
-        url = 'https://%s/redfish/v1/Dell/Systems/System.Embedded.1/DellRaidService/Actions/DellRaidService.RemoveControllerKey' % (creds["idrac_ip"])
+        url = 'https://%s/redfish/v1/Dell/Systems/System.Embedded.1/DellRaidService/Actions/DellRaidService.RemoveControllerKey' % (session.creds["idrac_ip"])
         payload={"TargetFQDD":controller_fqdd}
-        if x_auth_token == "yes":
-            headers = {'content-type': 'application/json', 'X-Auth-Token': creds["idrac_x_auth_token"]}
-            response = requests.post(url, data=json.dumps(payload), headers=headers, verify=creds["verify_cert"])
+        if session.x_auth_token == "yes":
+            headers = {'content-type': 'application/json', 'X-Auth-Token': session.creds["idrac_x_auth_token"]}
+            response = session.client.post(url, data=json.dumps(payload), headers=headers, verify=session.creds["verify_cert"])
         else:
             headers = {'content-type': 'application/json'}
-            response = requests.post(url, data=json.dumps(payload), headers=headers, verify=creds["verify_cert"],auth=(creds["idrac_username"],creds["idrac_password"]))
+            response = session.client.post(url, data=json.dumps(payload), headers=headers, verify=session.creds["verify_cert"],auth=(session.creds["idrac_username"],session.creds["idrac_password"]))
         data = response.json()
         if response.status_code == 401:
             logging.error("- ERROR, status code 401 detected, check to make sure your iDRAC script session has correct username/password credentials or if using X-auth token, confirm the session is still active.")
@@ -1253,21 +2209,21 @@ def remove_storage_controller_key(script_examples="", controller_fqdd=""):
             print("\n- PASS: POST command passed to remove controller key for controller %s" % controller_fqdd)
             time.sleep(5)
             try:
-                job_id = response.headers['Location'].split("/")[-1]
+                session.job_id = response.headers['Location'].split("/")[-1]
             except:
                 print("- FAIL, unable to locate job ID in JSON headers output")
                 return
-            print("- Job ID %s successfully created for storage method \"%s\"" % (job_id, method)) 
+            print("- Job ID %s successfully created for storage method \"%s\"" % (session.job_id, method)) 
         else:
             print("\n- FAIL, POST command failed to remove controller key for controller %s" % controller_fqdd)
             data = response.json()
             print("\n- POST command failure results:\n %s" % data)
             return
         time.sleep(5)
-        if x_auth_token == "yes":
-            response = requests.get('https://%s/redfish/v1/Managers/iDRAC.Embedded.1/Jobs/%s' % (creds["idrac_ip"], job_id),verify=creds["verify_cert"],headers={'X-Auth-Token': creds["idrac_x_auth_token"]})    
+        if session.x_auth_token == "yes":
+            response = session.client.get('https://%s/redfish/v1/Managers/iDRAC.Embedded.1/Jobs/%s' % (session.creds["idrac_ip"], session.job_id),verify=session.creds["verify_cert"],headers={'X-Auth-Token': session.creds["idrac_x_auth_token"]})    
         else:
-            response = requests.get('https://%s/redfish/v1/Managers/iDRAC.Embedded.1/Jobs/%s' % (creds["idrac_ip"], job_id),verify=creds["verify_cert"],auth=(creds["idrac_username"], creds["idrac_password"]))
+            response = session.client.get('https://%s/redfish/v1/Managers/iDRAC.Embedded.1/Jobs/%s' % (session.creds["idrac_ip"], session.job_id),verify=session.creds["verify_cert"],auth=(session.creds["idrac_username"], session.creds["idrac_password"]))
         data = response.json()
         if data['JobType'] == "RAIDConfiguration":
             print("- INFO, staged config job created, server will now reboot to execute the config job")
@@ -1277,15 +2233,14 @@ def remove_storage_controller_key(script_examples="", controller_fqdd=""):
 
 def check_consistency_virtual_disk(script_examples="", virtual_disk_fqdd=""):
     """Function to check consitency for a virtual disk. Supported function argument: virtual_disk_fqdd."""
-    global job_id
-    global job_type
+    session = get_script_session()
     if script_examples:
         print("""\n- IdracRedfishSupport.check_consistency_virtual_disk(virtual_disk_fqdd="Disk.Virtual.0:RAID.Mezzanine.1-1"), this example will check consistency for virtual disk 0.""")
     else:
-        if x_auth_token == "yes":
-            response = requests.get('https://%s/redfish/v1/Systems/System.Embedded.1/Storage/Volumes/%s' % (creds["idrac_ip"], virtual_disk_fqdd),verify=creds["verify_cert"],headers={'X-Auth-Token': creds["idrac_x_auth_token"]})    
+        if session.x_auth_token == "yes":
+            response = session.client.get('https://%s/redfish/v1/Systems/System.Embedded.1/Storage/Volumes/%s' % (session.creds["idrac_ip"], virtual_disk_fqdd),verify=session.creds["verify_cert"],headers={'X-Auth-Token': session.creds["idrac_x_auth_token"]})    
         else:
-            response = requests.get('https://%s/redfish/v1/Systems/System.Embedded.1/Storage/Volumes/%s' % (creds["idrac_ip"], virtual_disk_fqdd),verify=creds["verify_cert"],auth=(creds["idrac_username"], creds["idrac_password"]))
+            response = session.client.get('https://%s/redfish/v1/Systems/System.Embedded.1/Storage/Volumes/%s' % (session.creds["idrac_ip"], virtual_disk_fqdd),verify=session.creds["verify_cert"],auth=(session.creds["idrac_username"], session.creds["idrac_password"]))
         data = response.json()
         payload = {}
         for i in data.items():
@@ -1295,13 +2250,13 @@ def check_consistency_virtual_disk(script_examples="", virtual_disk_fqdd=""):
                         logging.error("\n- FAIL, Unable to run Check Consistency due to operation already executing on VD. Current operation executing: %s, PrecentComplete %s" % (ii['OperationName'],ii['PercentageComplete']))
                         return
         controller_fqdd = virtual_disk_fqdd.split(":")[-1]
-        url = 'https://%s/redfish/v1/Systems/System.Embedded.1/Storage/%s/Volumes/%s/Actions/Volume.CheckConsistency' % (creds["idrac_ip"], controller_fqdd,virtual_disk_fqdd)
-        if x_auth_token == "yes":
-            headers = {'content-type': 'application/json', 'X-Auth-Token': creds["idrac_x_auth_token"]}
-            response = requests.post(url, data=json.dumps(payload), headers=headers, verify=creds["verify_cert"])
+        url = 'https://%s/redfish/v1/Systems/System.Embedded.1/Storage/%s/Volumes/%s/Actions/Volume.CheckConsistency' % (session.creds["idrac_ip"], controller_fqdd,virtual_disk_fqdd)
+        if session.x_auth_token == "yes":
+            headers = {'content-type': 'application/json', 'X-Auth-Token': session.creds["idrac_x_auth_token"]}
+            response = session.client.post(url, data=json.dumps(payload), headers=headers, verify=session.creds["verify_cert"])
         else:
             headers = {'content-type': 'application/json'}
-            response = requests.post(url, data=json.dumps(payload), headers=headers, verify=creds["verify_cert"],auth=(creds["idrac_username"],creds["idrac_password"]))
+            response = session.client.post(url, data=json.dumps(payload), headers=headers, verify=session.creds["verify_cert"],auth=(session.creds["idrac_username"],session.creds["idrac_password"]))
         if response.status_code == 401:
             logging.error("- ERROR, status code 401 detected, check to make sure your iDRAC script session has correct username/password credentials or if using X-auth token, confirm the session is still active.")
             return
@@ -1315,28 +2270,29 @@ def check_consistency_virtual_disk(script_examples="", virtual_disk_fqdd=""):
             return
         get_header_location = response.headers["Location"]
         try:
-            job_id = get_header_location.split("/")[-1]
+            session.job_id = get_header_location.split("/")[-1]
         except:
             logging.error("\n- FAIL, unable to locate job ID in the headers response, check job queue if job ID was created.")
             return   
-        if x_auth_token == "yes":
-            response = requests.get('https://%s/redfish/v1/Managers/iDRAC.Embedded.1/Jobs/%s' % (creds["idrac_ip"], job_id),verify=creds["verify_cert"],headers={'X-Auth-Token': creds["idrac_x_auth_token"]})    
+        if session.x_auth_token == "yes":
+            response = session.client.get('https://%s/redfish/v1/Managers/iDRAC.Embedded.1/Jobs/%s' % (session.creds["idrac_ip"], session.job_id),verify=session.creds["verify_cert"],headers={'X-Auth-Token': session.creds["idrac_x_auth_token"]})    
         else:
-            response = requests.get('https://%s/redfish/v1/Managers/iDRAC.Embedded.1/Jobs/%s' % (creds["idrac_ip"], job_id),verify=creds["verify_cert"],auth=(creds["idrac_username"], creds["idrac_password"]))
+            response = session.client.get('https://%s/redfish/v1/Managers/iDRAC.Embedded.1/Jobs/%s' % (session.creds["idrac_ip"], session.job_id),verify=session.creds["verify_cert"],auth=(session.creds["idrac_username"], session.creds["idrac_password"]))
         data = response.json()
         if data['JobType'] == "RAIDConfiguration":
-            job_type = "staged"
+            session.job_type = "staged"
         elif data['JobType'] == "RealTimeNoRebootConfiguration":
-            job_type = "realtime"
-        logging.info("\n- PASS, \"%s\" %s job ID successfully created" % (job_type, job_id))
-        if job_type == "staged":
+            session.job_type = "realtime"
+        logging.info("\n- PASS, \"%s\" %s job ID successfully created" % (session.job_type, session.job_id))
+        if session.job_type == "staged":
             logging.info("- INFO, staged config job detected, server will validate scheduled job status before rebooting the server")
+            job_poller = JobPoller(job_type="RAIDConfiguration")
             while True:
                 try:
-                    if x_auth_token == "yes":
-                        response = requests.get('https://%s/redfish/v1/Managers/iDRAC.Embedded.1/Jobs/%s' % (creds["idrac_ip"], job_id),verify=creds["verify_cert"],headers={'X-Auth-Token': creds["idrac_x_auth_token"]})    
+                    if session.x_auth_token == "yes":
+                        response = session.client.get('https://%s/redfish/v1/Managers/iDRAC.Embedded.1/Jobs/%s' % (session.creds["idrac_ip"], session.job_id),verify=session.creds["verify_cert"],headers={'X-Auth-Token': session.creds["idrac_x_auth_token"]})    
                     else:
-                        response = requests.get('https://%s/redfish/v1/Managers/iDRAC.Embedded.1/Jobs/%s' % (creds["idrac_ip"], job_id),verify=creds["verify_cert"],auth=(creds["idrac_username"], creds["idrac_password"]))
+                        response = session.client.get('https://%s/redfish/v1/Managers/iDRAC.Embedded.1/Jobs/%s' % (session.creds["idrac_ip"], session.job_id),verify=session.creds["verify_cert"],auth=(session.creds["idrac_username"], session.creds["idrac_password"]))
                 except requests.ConnectionError as error_message:
                     logging.error(error_message)
                     return
@@ -1344,7 +2300,6 @@ def check_consistency_virtual_disk(script_examples="", virtual_disk_fqdd=""):
                     logging.error("\n- FAIL, Command failed to check job status, return code is %s" % response.status_code)
                     logging.error("Extended Info Message: {0}".format(req.json()))
                     return
-                time.sleep(5)
                 data = response.json()
                 if data['Message'] == "Task successfully scheduled.":
                     logging.info("- INFO, staged config job marked as scheduled")
@@ -1360,35 +2315,36 @@ def check_consistency_virtual_disk(script_examples="", virtual_disk_fqdd=""):
                         break
                 else:
                     logging.info("- INFO: job status not marked as scheduled, current status: %s\n" % data['Message'])
-        if job_type == "realtime":
+                    job_poller.wait(response=response, data=data)
+        if session.job_type == "realtime":
             logging.info("- INFO, realtime config job detected, no reboot needed to execute storage operation")
             loop_job_status_final()
             logging.info("\n- INFO, check iDRAC Lifecycle Logs for more details on check consistency process, if any errors were found")
 
 def secure_virtual_disk(script_examples="", virtual_disk_fqdd=""):
     """Function to secure virtual disk (disks part of the virtual disk must be encryption capable (SED). Supported function argument: virtual disk FQDD."""
-    global job_id
+    session = get_script_session()
     if script_examples:
         print("""\n- IdracRedfishSupport.secure_virtual_disk(virtual_disk_fqdd="Disk.Virtual.0:RAID.Mezzanine.1-1"), this example will secure virtual disk 0.""")
     else:
         method = "SecureVirtualDisk"
         controller_fqdd = virtual_disk_fqdd.split(":")[-1]
-        if x_auth_token == "yes":
-            response = requests.get('https://%s/redfish/v1/Systems/System.Embedded.1/Storage/%s' % (creds["idrac_ip"], controller_fqdd),verify=creds["verify_cert"],headers={'X-Auth-Token': creds["idrac_x_auth_token"]})    
+        if session.x_auth_token == "yes":
+            response = session.client.get('https://%s/redfish/v1/Systems/System.Embedded.1/Storage/%s' % (session.creds["idrac_ip"], controller_fqdd),verify=session.creds["verify_cert"],headers={'X-Auth-Token': session.creds["idrac_x_auth_token"]})    
         else:
-            response = requests.get('https://%s/redfish/v1/Systems/System.Embedded.1/Storage/%s' % (creds["idrac_ip"], controller_fqdd),verify=creds["verify_cert"],auth=(creds["idrac_username"], creds["idrac_password"]))
+            response = session.client.get('https://%s/redfish/v1/Systems/System.Embedded.1/Storage/%s' % (session.creds["idrac_ip"], controller_fqdd),verify=session.creds["verify_cert"],auth=(session.creds["idrac_username"], session.creds["idrac_password"]))
         data = response.json()
         if data['Oem']['Dell']['DellController']['SecurityStatus'] == "EncryptionNotCapable":
             logging.warning("\n- WARNING, storage controller %s does not support encryption" % controller_fqdd)
             return
-        url = 'https://%s/redfish/v1/Dell/Systems/System.Embedded.1/DellRaidService/Actions/DellRaidService.LockVirtualDisk' % (creds["idrac_ip"])
+        url = 'https://%s/redfish/v1/Dell/Systems/System.Embedded.1/DellRaidService/Actions/DellRaidService.LockVirtualDisk' % (session.creds["idrac_ip"])
         payload={"TargetFQDD":virtual_disk_fqdd}
-        if x_auth_token == "yes":
-            headers = {'content-type': 'application/json', 'X-Auth-Token': creds["idrac_x_auth_token"]}
-            response = requests.post(url, data=json.dumps(payload), headers=headers, verify=creds["verify_cert"])
+        if session.x_auth_token == "yes":
+            headers = {'content-type': 'application/json', 'X-Auth-Token': session.creds["idrac_x_auth_token"]}
+            response = session.client.post(url, data=json.dumps(payload), headers=headers, verify=session.creds["verify_cert"])
         else:
             headers = {'content-type': 'application/json'}
-            response = requests.post(url, data=json.dumps(payload), headers=headers, verify=creds["verify_cert"],auth=(creds["idrac_username"],creds["idrac_password"]))
+            response = session.client.post(url, data=json.dumps(payload), headers=headers, verify=session.creds["verify_cert"],auth=(session.creds["idrac_username"],session.creds["idrac_password"]))
         data = response.json()
         if response.status_code == 401:
             logging.error("- ERROR, status code 401 detected, check to make sure your iDRAC script session has correct username/password credentials or if using X-auth token, confirm the session is still active.")
@@ -1397,21 +2353,21 @@ def secure_virtual_disk(script_examples="", virtual_disk_fqdd=""):
             logging.info("\n- PASS: POST command passed to secure virtual disk %s" % virtual_disk_fqdd)
             time.sleep(5)
             try:
-                job_id = response.headers['Location'].split("/")[-1]
+                session.job_id = response.headers['Location'].split("/")[-1]
             except:
                 logging.error("- FAIL, unable to locate job ID in JSON headers output")
                 return
-            logging.info("- Job ID %s successfully created for storage method \"%s\"" % (job_id, method)) 
+            logging.info("- Job ID %s successfully created for storage method \"%s\"" % (session.job_id, method)) 
         else:
             logging.error("\n- FAIL, POST command failed to secure virtual disk %s" % virtual_disk_fqdd)
             data = response.json()
             logging.error("\n- POST command failure results:\n %s" % data)
             return
         time.sleep(5)
-        if x_auth_token == "yes":
-            response = requests.get('https://%s/redfish/v1/Managers/iDRAC.Embedded.1/Jobs/%s' % (creds["idrac_ip"], job_id),verify=creds["verify_cert"],headers={'X-Auth-Token': creds["idrac_x_auth_token"]})    
+        if session.x_auth_token == "yes":
+            response = session.client.get('https://%s/redfish/v1/Managers/iDRAC.Embedded.1/Jobs/%s' % (session.creds["idrac_ip"], session.job_id),verify=session.creds["verify_cert"],headers={'X-Auth-Token': session.creds["idrac_x_auth_token"]})    
         else:
-            response = requests.get('https://%s/redfish/v1/Managers/iDRAC.Embedded.1/Jobs/%s' % (creds["idrac_ip"], job_id),verify=creds["verify_cert"],auth=(creds["idrac_username"], creds["idrac_password"]))
+            response = session.client.get('https://%s/redfish/v1/Managers/iDRAC.Embedded.1/Jobs/%s' % (session.creds["idrac_ip"], session.job_id),verify=session.creds["verify_cert"],auth=(session.creds["idrac_username"], session.creds["idrac_password"]))
         data = response.json()
         if data['JobType'] == "RAIDConfiguration":
             logging.info("- INFO, staged config job created, server will now reboot to execute the config job")
@@ -1422,19 +2378,19 @@ def secure_virtual_disk(script_examples="", virtual_disk_fqdd=""):
 
 def set_controller_boot_virtual_disk(script_examples="", controller_fqdd="", virtual_disk_fqdd=""):
     """Function to set controller boot virtual disk. Supported function arguments: controller_fqdd and virtual_disk_fqdd"""
-    global job_id
+    session = get_script_session()
     if script_examples:
         print("""\n- IdracRedfishSupport.set_controller_boot_virtual_disk(controller_fqdd="RAID.Mezzanine.1-1",virtual_disk_fqdd="Disk.Virtual.2:RAID.Mezzanine.1-1"), this example will set VD 2 as controller boot virtual disk.""")
     else:
         method = "SetBootVD"
-        url = 'https://%s/redfish/v1/Dell/Systems/System.Embedded.1/DellRaidService/Actions/DellRaidService.SetBootVD' % (creds["idrac_ip"])
+        url = 'https://%s/redfish/v1/Dell/Systems/System.Embedded.1/DellRaidService/Actions/DellRaidService.SetBootVD' % (session.creds["idrac_ip"])
         payload={"ControllerFQDD":controller_fqdd, "VirtualDiskFQDD":virtual_disk_fqdd}
-        if x_auth_token == "yes":
-            headers = {'content-type': 'application/json', 'X-Auth-Token': creds["idrac_x_auth_token"]}
-            response = requests.post(url, data=json.dumps(payload), headers=headers, verify=creds["verify_cert"])
+        if session.x_auth_token == "yes":
+            headers = {'content-type': 'application/json', 'X-Auth-Token': session.creds["idrac_x_auth_token"]}
+            response = session.client.post(url, data=json.dumps(payload), headers=headers, verify=session.creds["verify_cert"])
         else:
             headers = {'content-type': 'application/json'}
-            response = requests.post(url, data=json.dumps(payload), headers=headers, verify=creds["verify_cert"],auth=(creds["idrac_username"],creds["idrac_password"]))
+            response = session.client.post(url, data=json.dumps(payload), headers=headers, verify=session.creds["verify_cert"],auth=(session.creds["idrac_username"],session.creds["idrac_password"]))
         data = response.json()
         if response.status_code == 401:
             logging.error("- ERROR, status code 401 detected, check to make sure your iDRAC script session has correct username/password credentials or if using X-auth token, confirm the session is still active.")
@@ -1443,21 +2399,21 @@ def set_controller_boot_virtual_disk(script_examples="", controller_fqdd="", vir
             logging.info("\n- PASS: POST command passed to set boot virtual disk %s" % virtual_disk_fqdd)
             time.sleep(5)
             try:
-                job_id = response.headers['Location'].split("/")[-1]
+                session.job_id = response.headers['Location'].split("/")[-1]
             except:
                 logging.error("- FAIL, unable to locate job ID in JSON headers output")
                 return
-            logging.info("- Job ID %s successfully created for storage method \"%s\"" % (job_id, method)) 
+            logging.info("- Job ID %s successfully created for storage method \"%s\"" % (session.job_id, method)) 
         else:
             logging.error("\n- FAIL, POST command failed to set boot virtual disk %s" % virtual_disk_fqdd)
             data = response.json()
             logging.error("\n- POST command failure results:\n %s" % data)
             return
         time.sleep(5)
-        if x_auth_token == "yes":
-            response = requests.get('https://%s/redfish/v1/Managers/iDRAC.Embedded.1/Jobs/%s' % (creds["idrac_ip"], job_id),verify=creds["verify_cert"],headers={'X-Auth-Token': creds["idrac_x_auth_token"]})    
+        if session.x_auth_token == "yes":
+            response = session.client.get('https://%s/redfish/v1/Managers/iDRAC.Embedded.1/Jobs/%s' % (session.creds["idrac_ip"], session.job_id),verify=session.creds["verify_cert"],headers={'X-Auth-Token': session.creds["idrac_x_auth_token"]})    
         else:
-            response = requests.get('https://%s/redfish/v1/Managers/iDRAC.Embedded.1/Jobs/%s' % (creds["idrac_ip"], job_id),verify=creds["verify_cert"],auth=(creds["idrac_username"], creds["idrac_password"]))
+            response = session.client.get('https://%s/redfish/v1/Managers/iDRAC.Embedded.1/Jobs/%s' % (session.creds["idrac_ip"], session.job_id),verify=session.creds["verify_cert"],auth=(session.creds["idrac_username"], session.creds["idrac_password"]))
         data = response.json()
         if data['JobType'] == "RAIDConfiguration":
             logging.info("- INFO, staged config job created, server will now reboot to execute the config job")
@@ -1467,19 +2423,19 @@ def set_controller_boot_virtual_disk(script_examples="", controller_fqdd="", vir
 
 def rename_virtual_disk(script_examples="", virtual_disk_fqdd="", vd_name=""):
     """Function to rename virtual disk. Supported function arguments: virtual_disk_fqdd and vd_name."""
-    global job_id
+    session = get_script_session()
     if script_examples:
         print("""\n- IdracRedfishSupport.rename_virtual_disk(virtual_disk_fqdd="Disk.Virtual.0:RAID.Mezzanine.1-1", vd_name="RAID0_Win2019"), this example will rename VD 0 to RAID0_Win2019""")
     else:
         method = "RenameVD"
-        url = 'https://%s/redfish/v1/Dell/Systems/System.Embedded.1/DellRaidService/Actions/DellRaidService.RenameVD' % (creds["idrac_ip"])
+        url = 'https://%s/redfish/v1/Dell/Systems/System.Embedded.1/DellRaidService/Actions/DellRaidService.RenameVD' % (session.creds["idrac_ip"])
         payload={"TargetFQDD":virtual_disk_fqdd, "Name":vd_name}
-        if x_auth_token == "yes":
-            headers = {'content-type': 'application/json', 'X-Auth-Token': creds["idrac_x_auth_token"]}
-            response = requests.post(url, data=json.dumps(payload), headers=headers, verify=creds["verify_cert"])
+        if session.x_auth_token == "yes":
+            headers = {'content-type': 'application/json', 'X-Auth-Token': session.creds["idrac_x_auth_token"]}
+            response = session.client.post(url, data=json.dumps(payload), headers=headers, verify=session.creds["verify_cert"])
         else:
             headers = {'content-type': 'application/json'}
-            response = requests.post(url, data=json.dumps(payload), headers=headers, verify=creds["verify_cert"],auth=(creds["idrac_username"],creds["idrac_password"]))
+            response = session.client.post(url, data=json.dumps(payload), headers=headers, verify=session.creds["verify_cert"],auth=(session.creds["idrac_username"],session.creds["idrac_password"]))
         data = response.json()
         if response.status_code == 401:
             logging.error("- ERROR, status code 401 detected, check to make sure your iDRAC script session has correct username/password credentials or if using X-auth token, confirm the session is still active.")
@@ -1488,21 +2444,21 @@ def rename_virtual_disk(script_examples="", virtual_disk_fqdd="", vd_name=""):
             logging.info("\n- PASS: POST command passed to rename boot virtual disk %s" % virtual_disk_fqdd)
             time.sleep(5)
             try:
-                job_id = response.headers['Location'].split("/")[-1]
+                session.job_id = response.headers['Location'].split("/")[-1]
             except:
                 logging.error("- FAIL, unable to locate job ID in JSON headers output")
                 return
-            logging.info("- Job ID %s successfully created for storage method \"%s\"" % (job_id, method)) 
+            logging.info("- Job ID %s successfully created for storage method \"%s\"" % (session.job_id, method)) 
         else:
             logging.error("\n- FAIL, POST command failed to rename boot virtual disk %s" % virtual_disk_fqdd)
             data = response.json()
             logging.error("\n- POST command failure results:\n %s" % data)
             return
         time.sleep(5)
-        if x_auth_token == "yes":
-            response = requests.get('https://%s/redfish/v1/Managers/iDRAC.Embedded.1/Jobs/%s' % (creds["idrac_ip"], job_id),verify=creds["verify_cert"],headers={'X-Auth-Token': creds["idrac_x_auth_token"]})    
+        if session.x_auth_token == "yes":
+            response = session.client.get('https://%s/redfish/v1/Managers/iDRAC.Embedded.1/Jobs/%s' % (session.creds["idrac_ip"], session.job_id),verify=session.creds["verify_cert"],headers={'X-Auth-Token': session.creds["idrac_x_auth_token"]})    
         else:
-            response = requests.get('https://%s/redfish/v1/Managers/iDRAC.Embedded.1/Jobs/%s' % (creds["idrac_ip"], job_id),verify=creds["verify_cert"],auth=(creds["idrac_username"], creds["idrac_password"]))
+            response = session.client.get('https://%s/redfish/v1/Managers/iDRAC.Embedded.1/Jobs/%s' % (session.creds["idrac_ip"], session.job_id),verify=session.creds["verify_cert"],auth=(session.creds["idrac_username"], session.creds["idrac_password"]))
         data = response.json()
         if data['JobType'] == "RAIDConfiguration":
             logging.info("- INFO, staged config job created, server will now reboot to execute the config job")
@@ -1512,13 +2468,14 @@ def rename_virtual_disk(script_examples="", virtual_disk_fqdd="", vd_name=""):
 
 def get_current_iDRAC_sessions(script_examples=""):
     """Function to get current active iDRAC sessions."""
+    session = get_script_session()
     if script_examples:
         print("""\n- IdracRedfishSupport.get_current_iDRAC_sessions(), this example will return current active running iDRAC sessions.""")
     else:
-        if x_auth_token == "yes":
-            response = requests.get('https://%s/redfish/v1/SessionService/Sessions?$expand=*($levels=1)' % creds["idrac_ip"],verify=creds["verify_cert"],headers={'X-Auth-Token': creds["idrac_x_auth_token"]})    
+        if session.x_auth_token == "yes":
+            response = session.client.get('https://%s/redfish/v1/SessionService/Sessions?$expand=*($levels=1)' % session.creds["idrac_ip"],verify=session.creds["verify_cert"],headers={'X-Auth-Token': session.creds["idrac_x_auth_token"]})    
         else:
-            response = requests.get('https://%s/redfish/v1/SessionService/Sessions?$expand=*($levels=1)' % creds["idrac_ip"],verify=creds["verify_cert"],auth=(creds["idrac_username"], creds["idrac_password"]))
+            response = session.client.get('https://%s/redfish/v1/SessionService/Sessions?$expand=*($levels=1)' % session.creds["idrac_ip"],verify=session.creds["verify_cert"],auth=(session.creds["idrac_username"], session.creds["idrac_password"]))
         data = response.json()
         if response.status_code == 401:
             logging.error("- ERROR, status code 401 detected, check to make sure your iDRAC script session has correct username/password credentials or if using X-auth token, confirm the session is still active.")
@@ -1534,16 +2491,17 @@ def get_current_iDRAC_sessions(script_examples=""):
 
 def delete_iDRAC_session(script_examples="", session_id=""):
     """Function to delete one current iDRAC session. Supported function argument: session_id (pass in integer value of the session ID to delete. If needed, execute get_current_iDRAC_sessions() to get session IDs.)"""
+    session = get_script_session()
     if script_examples:
         print("""\n- IdracRedfishSupport.delete_iDRAC_session(session_id=12), this example will delete current iDRAC session ID 12.""")
     else:
-        url = 'https://%s/redfish/v1/SessionService/Sessions/%s' % (creds["idrac_ip"], str(session_id))
-        if x_auth_token == "yes":
-            headers = {'content-type': 'application/json', 'X-Auth-Token': creds["idrac_x_auth_token"]}
-            response = requests.delete(url, headers=headers, verify=creds["verify_cert"])
+        url = 'https://%s/redfish/v1/SessionService/Sessions/%s' % (session.creds["idrac_ip"], str(session_id))
+        if session.x_auth_token == "yes":
+            headers = {'content-type': 'application/json', 'X-Auth-Token': session.creds["idrac_x_auth_token"]}
+            response = session.client.delete(url, headers=headers, verify=session.creds["verify_cert"])
         else:
             headers = {'content-type': 'application/json'}
-            response = requests.delete(url, headers=headers, verify=creds["verify_cert"],auth=(creds["idrac_username"],creds["idrac_password"]))
+            response = session.client.delete(url, headers=headers, verify=session.creds["verify_cert"],auth=(session.creds["idrac_username"],session.creds["idrac_password"]))
         if response.status_code == 401:
             logging.error("- ERROR, status code 401 detected, check to make sure your iDRAC script session has correct username/password credentials or if using X-auth token, confirm the session is still active.")
             return
@@ -1557,6 +2515,7 @@ def delete_iDRAC_session(script_examples="", session_id=""):
 
 def get_server_slot_information(script_examples=""):
     """Function to get server slot information. This includes PSUs, Fans, DIMMs, CPUs, IDSDM, vFlash, PCIe, and disks."""
+    session = get_script_session()
     if script_examples:
         print("""\n- IdracRedfishSupport.get_server_slot_information(), this example will return slot details for all hardware devices detected in the server.""")
     else:
@@ -1566,13 +2525,13 @@ def get_server_slot_information(script_examples=""):
             pass
         open_file = open("slot_collection.txt","a")
         time_now = datetime.now()
-        current_date_time = "- iDRAC IP %s, data collection timestamp: %s-%s-%s  %s:%s:%s\n" % (creds["idrac_ip"], time_now.month, time_now.day, time_now.year, time_now.hour, time_now.minute, time_now.second)
+        current_date_time = "- iDRAC IP %s, data collection timestamp: %s-%s-%s  %s:%s:%s\n" % (session.creds["idrac_ip"], time_now.month, time_now.day, time_now.year, time_now.hour, time_now.minute, time_now.second)
         open_file.writelines(current_date_time)
         open_file.writelines("\n\n")
-        if x_auth_token == "yes":
-            response = requests.get('https://%s/redfish/v1/Dell/Systems/System.Embedded.1/DellSlotCollection' % creds["idrac_ip"],verify=creds["verify_cert"],headers={'X-Auth-Token': creds["idrac_x_auth_token"]})    
+        if session.x_auth_token == "yes":
+            response = session.client.get('https://%s/redfish/v1/Dell/Systems/System.Embedded.1/DellSlotCollection' % session.creds["idrac_ip"],verify=session.creds["verify_cert"],headers={'X-Auth-Token': session.creds["idrac_x_auth_token"]})    
         else:
-            response = requests.get('https://%s/redfish/v1/Dell/Systems/System.Embedded.1/DellSlotCollection' % creds["idrac_ip"],verify=creds["verify_cert"],auth=(creds["idrac_username"], creds["idrac_password"]))
+            response = session.client.get('https://%s/redfish/v1/Dell/Systems/System.Embedded.1/DellSlotCollection' % session.creds["idrac_ip"],verify=session.creds["verify_cert"],auth=(session.creds["idrac_username"], session.creds["idrac_password"]))
         data = response.json()
         if response.status_code == 401:
             logging.error("- ERROR, status code 401 detected, check to make sure your iDRAC script session has correct username/password credentials or if using X-auth token, confirm the session is still active.")
@@ -1587,10 +2546,10 @@ def get_server_slot_information(script_examples=""):
             open_file.writelines("\n")
         number_list=[i for i in range (1,100001) if i % 50 == 0]
         for seq in number_list:
-            if x_auth_token == "yes":
-                response = requests.get('https://%s/redfish/v1/Dell/Systems/System.Embedded.1/DellSlotCollection?$skip=%s' % (creds["idrac_ip"], seq),verify=creds["verify_cert"],headers={'X-Auth-Token': creds["idrac_x_auth_token"]})    
+            if session.x_auth_token == "yes":
+                response = session.client.get('https://%s/redfish/v1/Dell/Systems/System.Embedded.1/DellSlotCollection?$skip=%s' % (session.creds["idrac_ip"], seq),verify=session.creds["verify_cert"],headers={'X-Auth-Token': session.creds["idrac_x_auth_token"]})    
             else:
-                response = requests.get('https://%s/redfish/v1/Dell/Systems/System.Embedded.1/DellSlotCollection?$skip=%s' % (creds["idrac_ip"], seq),verify=creds["verify_cert"],auth=(creds["idrac_username"], creds["idrac_password"]))
+                response = session.client.get('https://%s/redfish/v1/Dell/Systems/System.Embedded.1/DellSlotCollection?$skip=%s' % (session.creds["idrac_ip"], seq),verify=session.creds["verify_cert"],auth=(session.creds["idrac_username"], session.creds["idrac_password"]))
             data = response.json()
             if response.status_code == 400:
                 if "out of range" in data['error']['@Message.ExtendedInfo'][0]['Message']:
@@ -1615,13 +2574,14 @@ def get_server_slot_information(script_examples=""):
 
 def get_iDRAC_current_job_queue(script_examples=""):
     """Function to get current iDRAC job queue."""
+    session = get_script_session()
     if script_examples:
         print("""\n- IdracRedfishSupport.get_iDRAC_current_job_queue(), this example will return current iDRAC job queue, all job IDs completed, running, scheduled or failed.""")
     else:
-        if x_auth_token == "yes":
-            response = requests.get('https://%s/redfish/v1/Managers/iDRAC.Embedded.1/Jobs?$expand=*($levels=1)' % (creds["idrac_ip"]),verify=creds["verify_cert"],headers={'X-Auth-Token': creds["idrac_x_auth_token"]})    
+        if session.x_auth_token == "yes":
+            response = session.client.get('https://%s/redfish/v1/Managers/iDRAC.Embedded.1/Jobs?$expand=*($levels=1)' % (session.creds["idrac_ip"]),verify=session.creds["verify_cert"],headers={'X-Auth-Token': session.creds["idrac_x_auth_token"]})    
         else:
-            response = requests.get('https://%s/redfish/v1/Managers/iDRAC.Embedded.1/Jobs?$expand=*($levels=1)' % (creds["idrac_ip"]),verify=creds["verify_cert"],auth=(creds["idrac_username"], creds["idrac_password"]))
+            response = session.client.get('https://%s/redfish/v1/Managers/iDRAC.Embedded.1/Jobs?$expand=*($levels=1)' % (session.creds["idrac_ip"]),verify=session.creds["verify_cert"],auth=(session.creds["idrac_username"], session.creds["idrac_password"]))
         if response.status_code == 401:
             logging.error("- ERROR, status code 401 detected, check to make sure your iDRAC script session has correct username/password credentials or if using X-auth token, confirm the session is still active.")
             return
@@ -1634,7 +2594,7 @@ def get_iDRAC_current_job_queue(script_examples=""):
         if data["Members"] == []:
             logging.info("\n- INFO, job queue empty. No job IDs or reboot IDs detected.")
             return
-        logging.info("\n- Current job IDs in the job queue for iDRAC %s:\n" % creds["idrac_ip"])
+        logging.info("\n- Current job IDs in the job queue for iDRAC %s:\n" % session.creds["idrac_ip"])
         time.sleep(2)
         for i in data["Members"]:
             pprint(i)
@@ -1642,22 +2602,23 @@ def get_iDRAC_current_job_queue(script_examples=""):
 
 def delete_iDRAC_job_id_or_job_queue(script_examples="", job_id=""):
     """Function to either delete single job ID or clear the job queue. Supported function argument: job_id (pass in either job ID to delete single job or string \"clear\" to delete all jobs in the job queue. If needed, execute IdracRedfishSupport.get_iDRAC_current_job_queue() to get current iDRAC job queue."""
+    session = get_script_session()
     if script_examples:
         print("""\n- IdracRedfishSupport.delete_iDRAC_job_id_or_job_queue(job_id="JID_292828393894"), this example will delete a single job ID.)
         \n- IdracRedfishSupport.delete_iDRAC_job_id_or_job_queue(job_id="clear"), this example will clear iDRAC job queue, all jobs will be deleted.""")
     else:
-        url = "https://%s/redfish/v1/Dell/Managers/iDRAC.Embedded.1/DellJobService/Actions/DellJobService.DeleteJobQueue" % creds["idrac_ip"]
+        url = "https://%s/redfish/v1/Dell/Managers/iDRAC.Embedded.1/DellJobService/Actions/DellJobService.DeleteJobQueue" % session.creds["idrac_ip"]
         if job_id.lower() == "clear":
             payload = {"JobID":"JID_CLEARALL"}
             logging.info("- INFO, deleting the job queue, this may up to 1 minute to complete depending on the number of job ids")
         else:
             payload = {"JobID":job_id}    
-        if x_auth_token == "yes":
-            headers = {'content-type': 'application/json', 'X-Auth-Token': creds["idrac_x_auth_token"]}
-            response = requests.post(url, data=json.dumps(payload), headers=headers, verify=creds["verify_cert"])
+        if session.x_auth_token == "yes":
+            headers = {'content-type': 'application/json', 'X-Auth-Token': session.creds["idrac_x_auth_token"]}
+            response = session.client.post(url, data=json.dumps(payload), headers=headers, verify=session.creds["verify_cert"])
         else:
             headers = {'content-type': 'application/json'}
-            response = requests.post(url, data=json.dumps(payload), headers=headers, verify=creds["verify_cert"],auth=(creds["idrac_username"],creds["idrac_password"]))
+            response = session.client.post(url, data=json.dumps(payload), headers=headers, verify=session.creds["verify_cert"],auth=(session.creds["idrac_username"],session.creds["idrac_password"]))
         if response.status_code == 401:
             logging.error("- ERROR, status code 401 detected, check to make sure your iDRAC script session has correct username/password credentials or if using X-auth token, confirm the session is still active.")
             return
@@ -1674,6 +2635,7 @@ def delete_iDRAC_job_id_or_job_queue(script_examples="", job_id=""):
 
 def get_pcie_device_or_function_inventory(script_examples="", user_input=""):
     """Function to get either PCIe device or PCIe function inventory data. Supported function argument: user_input (supported values: "device" or "function")."""
+    session = get_script_session()
     if script_examples:
         print("""\n- IdracRedfishSupport.get_pcie_device_or_function_inventory(user_input="device"), this example will return PCIe device information.
         \n- IdracRedfishSupport.get_pcie_device_or_function_inventory(user_input="function"), this example will return PCIe function information.""")
@@ -1685,10 +2647,10 @@ def get_pcie_device_or_function_inventory(script_examples="", user_input=""):
         else:
             logging.error("- WARNING, incorrect value entered for user_input argument")
             return
-        if x_auth_token == "yes":
-            response = requests.get('https://%s/redfish/v1/Systems/System.Embedded.1' % (creds["idrac_ip"]),verify=creds["verify_cert"],headers={'X-Auth-Token': creds["idrac_x_auth_token"]})    
+        if session.x_auth_token == "yes":
+            response = session.client.get('https://%s/redfish/v1/Systems/System.Embedded.1' % (session.creds["idrac_ip"]),verify=session.creds["verify_cert"],headers={'X-Auth-Token': session.creds["idrac_x_auth_token"]})    
         else:
-            response = requests.get('https://%s/redfish/v1/Systems/System.Embedded.1' % (creds["idrac_ip"]),verify=creds["verify_cert"],auth=(creds["idrac_username"], creds["idrac_password"]))
+            response = session.client.get('https://%s/redfish/v1/Systems/System.Embedded.1' % (session.creds["idrac_ip"]),verify=session.creds["verify_cert"],auth=(session.creds["idrac_username"], session.creds["idrac_password"]))
         if response.status_code == 401:
             logging.error("- ERROR, status code 401 detected, check to make sure your iDRAC script session has correct username/password credentials or if using X-auth token, confirm the session is still active.")
             return
@@ -1709,10 +2671,10 @@ def get_pcie_device_or_function_inventory(script_examples="", user_input=""):
                 print(ii[1])
                 pcie_devices.append(ii[1])
         for i in pcie_devices:
-            if x_auth_token == "yes":
-                response = requests.get('https://%s%s' % (creds["idrac_ip"], i),verify=creds["verify_cert"],headers={'X-Auth-Token': creds["idrac_x_auth_token"]})    
+            if session.x_auth_token == "yes":
+                response = session.client.get('https://%s%s' % (session.creds["idrac_ip"], i),verify=session.creds["verify_cert"],headers={'X-Auth-Token': session.creds["idrac_x_auth_token"]})    
             else:
-                response = requests.get('https://%s%s' % (creds["idrac_ip"], i),verify=creds["verify_cert"],auth=(creds["idrac_username"], creds["idrac_password"]))
+                response = session.client.get('https://%s%s' % (session.creds["idrac_ip"], i),verify=session.creds["verify_cert"],auth=(session.creds["idrac_username"], session.creds["idrac_password"]))
             if response.status_code != 200:
                 logging.error("- FAIL, get request failed, status code %s returned" % response.status_code)
                 data = response.json()
@@ -1732,17 +2694,18 @@ def get_pcie_device_or_function_inventory(script_examples="", user_input=""):
 
 def reset_iDRAC(script_examples=""):
     """Function to reset (reboot) iDRAC. This will only reboot the iDRAC, it will not reset any iDRAC settings to default values."""
+    session = get_script_session()
     if script_examples:
         print("""\n- IdracRedfishSupport.reset_iDRAC(), this example will reset(reboot) iDRAC.""")
     else:
-        url = "https://%s/redfish/v1/Managers/iDRAC.Embedded.1/Actions/Manager.Reset/" % creds["idrac_ip"]
+        url = "https://%s/redfish/v1/Managers/iDRAC.Embedded.1/Actions/Manager.Reset/" % session.creds["idrac_ip"]
         payload={"ResetType":"GracefulRestart"}
-        if x_auth_token == "yes":
-            headers = {'content-type': 'application/json', 'X-Auth-Token': creds["idrac_x_auth_token"]}
-            response = requests.post(url, data=json.dumps(payload), headers=headers, verify=creds["verify_cert"])
+        if session.x_auth_token == "yes":
+            headers = {'content-type': 'application/json', 'X-Auth-Token': session.creds["idrac_x_auth_token"]}
+            response = session.client.post(url, data=json.dumps(payload), headers=headers, verify=session.creds["verify_cert"])
         else:
             headers = {'content-type': 'application/json'}
-            response = requests.post(url, data=json.dumps(payload), headers=headers, verify=creds["verify_cert"],auth=(creds["idrac_username"],creds["idrac_password"]))
+            response = session.client.post(url, data=json.dumps(payload), headers=headers, verify=session.creds["verify_cert"],auth=(session.creds["idrac_username"],session.creds["idrac_password"]))
         if response.status_code == 401:
             logging.error("- ERROR, status code 401 detected, check to make sure your iDRAC script session has correct username/password credentials or if using X-auth token, confirm the session is still active.")
             return
@@ -1757,17 +2720,18 @@ def reset_iDRAC(script_examples=""):
 
 def set_idrac_default_settings(script_examples="", reset_type=""):
     """Function to reset iDRAC to default settings. Supported function argument: reset_type (supported values: "All"(Reset all iDRAC's configuration to default and reset user to shipping password value.), "ResetAllWithRootDefaults"(Reset all iDRAC's configuration to default and reset user to root\calvin) and "Default"(Reset all iDRAC's configuration to default and preserve user, network settings). Note: Make sure to pass in the exact case for the value. NOTE: If you execute this function to reset iDRAC to default settings, make sure to rerun IdracRedfishSupport.set_iDRAC_script_session() to set the session again."""
+    session = get_script_session()
     if script_examples:
         print("""\n- IdracRedfishSupport.set_idrac_default_settings(reset_type="ResetAllWithRootDefaults"), this example will reset all iDRAC's configuration to default and reset user 2 to root\calvin credentials.""")
     else:
-        url = 'https://%s/redfish/v1/Managers/iDRAC.Embedded.1/Actions/Oem/DellManager.ResetToDefaults' % creds["idrac_ip"]
+        url = 'https://%s/redfish/v1/Managers/iDRAC.Embedded.1/Actions/Oem/DellManager.ResetToDefaults' % session.creds["idrac_ip"]
         payload = {"ResetType": reset_type}
-        if x_auth_token == "yes":
-            headers = {'content-type': 'application/json', 'X-Auth-Token': creds["idrac_x_auth_token"]}
-            response = requests.post(url, data=json.dumps(payload), headers=headers, verify=creds["verify_cert"])
+        if session.x_auth_token == "yes":
+            headers = {'content-type': 'application/json', 'X-Auth-Token': session.creds["idrac_x_auth_token"]}
+            response = session.client.post(url, data=json.dumps(payload), headers=headers, verify=session.creds["verify_cert"])
         else:
             headers = {'content-type': 'application/json'}
-            response = requests.post(url, data=json.dumps(payload), headers=headers, verify=creds["verify_cert"],auth=(creds["idrac_username"],creds["idrac_password"]))
+            response = session.client.post(url, data=json.dumps(payload), headers=headers, verify=session.creds["verify_cert"],auth=(session.creds["idrac_username"],session.creds["idrac_password"]))
         if response.status_code == 401:
             logging.error("- ERROR, status code 401 detected, check to make sure your iDRAC script session has correct username/password credentials or if using X-auth token, confirm the session is still active.")
             return
@@ -1779,50 +2743,43 @@ def set_idrac_default_settings(script_examples="", reset_type=""):
         time.sleep(15)
         logging.info("\n- iDRAC will now reset to default settings and restart the iDRAC. iDRAC should be back up within a few minutes.")
 
-def get_message_registry(script_examples="", message_id=""):
-    import os
-    """Function to get complete iDRAC message registry which returns message IDs and message strings or a specific entry. Supported function argument: message_id."""
+def get_message_registry(script_examples="", message_id="", message_id_prefix="", search=""):
+    """Function to get complete iDRAC message registry which returns message IDs and message strings or specific entries. Message registry is cached locally per iDRAC firmware version (see get_message_registry_cache()) so lookups after the first one do not download the registry again. Supported function arguments: message_id (exact message ID), message_id_prefix (return all message IDs starting with this value) and search (return all messages where Message or Resolution string contains all words passed in)."""
+    session = get_script_session()
     if script_examples:
         print("""\n- IdracRedfishSupport.get_message_registry(), this example will return complete iDRAC message registry.
-        \n- IdracRedfishSupport.get_message_registry(message_id="CPU0001"), this example will only return details for message ID CPU0001.""")
-    elif message_id != "":
-        if x_auth_token == "yes":
-            response = requests.get('https://%s/redfish/v1/Registries/Messages/EEMIRegistry' % (creds["idrac_ip"]),verify=creds["verify_cert"],headers={'X-Auth-Token': creds["idrac_x_auth_token"]})    
-        else:
-            response = requests.get('https://%s/redfish/v1/Registries/Messages/EEMIRegistry' % (creds["idrac_ip"]),verify=creds["verify_cert"],auth=(creds["idrac_username"], creds["idrac_password"]))
-        data = response.json()
-        if response.status_code == 401:
-            logging.error("- ERROR, status code 401 detected, check to make sure your iDRAC script session has correct username/password credentials or if using X-auth token, confirm the session is still active.")
-            return
-        elif response.status_code != 200:
-            logging.error("- FAIL, get request failed, status code %s returned" % response.status_code)
-            data = response.json()
-            logging.error(data)
+        \n- IdracRedfishSupport.get_message_registry(message_id="CPU0001"), this example will only return details for message ID CPU0001.
+        \n- IdracRedfishSupport.get_message_registry(message_id_prefix="PDR3"), this example will return details for all message IDs starting with PDR3.
+        \n- IdracRedfishSupport.get_message_registry(search="disk failed"), this example will return all messages with message or resolution string containing words disk and failed.""")
+        return
+    try:
+        registry = get_message_registry_cache().get_registry(session)
+    except requests.exceptions.RequestException as error_message:
+        logging.error("- FAIL, unable to get message registry, error: %s" % error_message)
+        return
+    if message_id != "":
+        message = get_message_registry_cache().get_message(message_id, session)
+        if message:
+            logging.info("\n- Details for message ID %s -\n" % message_id)
+            pprint(message)
             return
-        for i in data['Messages'].items():
-            if i[0].lower() == message_id.lower():
-                logging.info("\n- Details for message ID %s -\n" % message_id)
-                pprint(i)
-                #print("\nMessage ID: %s" % i[0])
-                #for ii in i[1].items():
-                #    print("%s: %s" % (ii[0], ii[1]))
-                #print("\n")
-                return
-            else:
-                pass
         logging.error("\n - FAIL, either invalid message ID was passed in or message ID does not exist on this iDRAC version")
+    elif message_id_prefix or search:
+        messages = get_message_registry_cache().find_messages(message_id_prefix=message_id_prefix, search=search, session=session)
+        if messages == []:
+            logging.error("\n - FAIL, no message IDs found matching message ID prefix or search string")
+            return
+        for i in messages:
+            pprint(i)
+            print("\n")
+        logging.info("- INFO, %s message ID(s) found" % len(messages))
     else:
         try:
             os.remove("message_registry.txt")
         except:
             pass
         open_file = open("message_registry.txt","a")
-        if x_auth_token == "yes":
-            response = requests.get('https://%s/redfish/v1/Registries/Messages/EEMIRegistry' % (creds["idrac_ip"]),verify=creds["verify_cert"],headers={'X-Auth-Token': creds["idrac_x_auth_token"]})    
-        else:
-            response = requests.get('https://%s/redfish/v1/Registries/Messages/EEMIRegistry' % (creds["idrac_ip"]),verify=creds["verify_cert"],auth=(creds["idrac_username"], creds["idrac_password"]))
-        data = response.json()
-        for i in data['Messages'].items():
+        for i in registry["Messages"].values():
             message = "Message ID: %s" % i[0]
             pprint(i)
             print("\n")
@@ -1833,13 +2790,12 @@ def get_message_registry(script_examples="", message_id=""):
             message = "\n"
             open_file.writelines("%s"% message)
         open_file.close()
-        current_dir = os.getcwd()
         logging.info("\n- INFO, output also captured in \"%s\\message_registry.txt\" file" % os.getcwd())
 
 
 def change_bios_password(script_examples="", password_type="", set_password="", change_password="", delete_password="", reboot=""):
     """Function to set, change or delete BIOS passwords. Script will prompt you to enter password strings. Supported function arguments: password_type (supported values: SysPassword, SetupPassword, PersistentMemPassphrase), set_password (supported_value: True), change_password (supported_value: True), delete_password (supported_value: True) and reboot (supported values: yes and no)."""
-    global job_id
+    session = get_script_session()
     if script_examples:
         print("""\n- IdracRedfishSupport.change_bios_password(password_type="SysPassword", set_password=True, reboot="yes"), this example will reboot the server now to set BIOS system password.).
         \n- IdracRedfishSupport.change_bios_password(password_type="SetupPassword", change_password=True, reboot="yes"), this example will reboot the server now to change BIOS setup password.
@@ -1854,7 +2810,7 @@ def change_bios_password(script_examples="", password_type="", set_password="",
         else:
             logging.error("\n- FAIL, invalid value passed in for password_type argument")
             return
-        url = "https://%s/redfish/v1/Systems/System.Embedded.1/Bios/Actions/Bios.ChangePassword" % creds["idrac_ip"]
+        url = "https://%s/redfish/v1/Systems/System.Embedded.1/Bios/Actions/Bios.ChangePassword" % session.creds["idrac_ip"]
         if delete_password:
             current_password = getpass.getpass("- Enter current %s: " % password_type)
             payload = {"PasswordName":password_name,"OldPassword":current_password,"NewPassword":""}
@@ -1871,12 +2827,12 @@ def change_bios_password(script_examples="", password_type="", set_password="",
         else:
             logging.error("- FAIL, argument not detected to set, change or delete password")
             return
-        if x_auth_token == "yes":
-            headers = {'content-type': 'application/json', 'X-Auth-Token': creds["idrac_x_auth_token"]}
-            response = requests.post(url, data=json.dumps(payload), headers=headers, verify=creds["verify_cert"])
+        if session.x_auth_token == "yes":
+            headers = {'content-type': 'application/json', 'X-Auth-Token': session.creds["idrac_x_auth_token"]}
+            response = session.client.post(url, data=json.dumps(payload), headers=headers, verify=session.creds["verify_cert"])
         else:
             headers = {'content-type': 'application/json'}
-            response = requests.post(url, data=json.dumps(payload), headers=headers, verify=creds["verify_cert"],auth=(creds["idrac_username"],creds["idrac_password"]))
+            response = session.client.post(url, data=json.dumps(payload), headers=headers, verify=session.creds["verify_cert"],auth=(session.creds["idrac_username"],session.creds["idrac_password"]))
         data = response.__dict__
         if response.status_code == 401:
             logging.error("- ERROR, status code 401 detected, check to make sure your iDRAC script session has correct username/password credentials or if using X-auth token, confirm the session is still active.")
@@ -1889,13 +2845,13 @@ def change_bios_password(script_examples="", password_type="", set_password="",
             logging.error(detail_message)
             return
         payload = {"TargetSettingsURI":"/redfish/v1/Systems/System.Embedded.1/Bios/Settings"}
-        url = 'https://%s/redfish/v1/Managers/iDRAC.Embedded.1/Jobs' % creds["idrac_ip"]
-        if x_auth_token == "yes":
-            headers = {'content-type': 'application/json', 'X-Auth-Token': creds["idrac_x_auth_token"]}
-            response = requests.post(url, data=json.dumps(payload), headers=headers, verify=creds["verify_cert"])
+        url = 'https://%s/redfish/v1/Managers/iDRAC.Embedded.1/Jobs' % session.creds["idrac_ip"]
+        if session.x_auth_token == "yes":
+            headers = {'content-type': 'application/json', 'X-Auth-Token': session.creds["idrac_x_auth_token"]}
+            response = session.client.post(url, data=json.dumps(payload), headers=headers, verify=session.creds["verify_cert"])
         else:
             headers = {'content-type': 'application/json'}
-            response = requests.post(url, data=json.dumps(payload), headers=headers, verify=creds["verify_cert"],auth=(creds["idrac_username"],creds["idrac_password"]))
+            response = session.client.post(url, data=json.dumps(payload), headers=headers, verify=session.creds["verify_cert"],auth=(session.creds["idrac_username"],session.creds["idrac_password"]))
         if response.status_code == 200:
             logging.info("- PASS: POST command passed to create target config job, status code %s returned" % response.status_code)
         else:
@@ -1905,24 +2861,24 @@ def change_bios_password(script_examples="", password_type="", set_password="",
             return
         data = response.json()
         try:
-            job_id = response.headers['Location'].split("/")[-1]
+            session.job_id = response.headers['Location'].split("/")[-1]
         except:
             logging.error("- FAIL, unable to locate job ID in JSON headers output")
             return
-        logging.info("- INFO: %s job ID successfully created" % job_id)
+        logging.info("- INFO: %s job ID successfully created" % session.job_id)
+        job_poller = JobPoller(job_type="BIOSConfiguration")
         while True:
-            if x_auth_token == "yes":
-                response = requests.get('https://%s/redfish/v1/Managers/iDRAC.Embedded.1/Jobs/%s' % (creds["idrac_ip"], job_id),verify=creds["verify_cert"],headers={'X-Auth-Token': creds["idrac_x_auth_token"]})    
+            if session.x_auth_token == "yes":
+                response = session.client.get('https://%s/redfish/v1/Managers/iDRAC.Embedded.1/Jobs/%s' % (session.creds["idrac_ip"], session.job_id),verify=session.creds["verify_cert"],headers={'X-Auth-Token': session.creds["idrac_x_auth_token"]})    
             else:
-                response = requests.get('https://%s/redfish/v1/Managers/iDRAC.Embedded.1/Jobs/%s' % (creds["idrac_ip"], job_id),verify=creds["verify_cert"],auth=(creds["idrac_username"], creds["idrac_password"]))
+                response = session.client.get('https://%s/redfish/v1/Managers/iDRAC.Embedded.1/Jobs/%s' % (session.creds["idrac_ip"], session.job_id),verify=session.creds["verify_cert"],auth=(session.creds["idrac_username"], session.creds["idrac_password"]))
             if response.status_code != 200:
                 logging.error("\n- FAIL, Command failed to check job status, return code is %s" % response.status_code)
                 logging.error("Extended Info Message: {0}".format(response.json()))
                 return
-            time.sleep(10)
             data = response.json()
             if data['Message'] == "Task successfully scheduled.":
-                logging.info("- PASS, %s job id successfully scheduled" % job_id)
+                logging.info("- PASS, %s job id successfully scheduled" % session.job_id)
                 if reboot.lower() == "yes":
                     logging.info("- INFO, user selected to reboot the server now to execute the config job")
                     if password_type.lower() == "syspassword" and set_password == True or change_password == True:
@@ -1944,22 +2900,24 @@ def change_bios_password(script_examples="", password_type="", set_password="",
                 break
             else:
                 logging.info("- INFO: JobStatus not scheduled, current status: %s" % data['Message'])
+                job_poller.wait(response=response, data=data)
 
                 
 def bios_device_recovery(script_examples=""):
     """Function to recover corrupted server BIOS. During this process, server will power OFF, power ON, recover the BIOS firmware, reboot and process will be complete. Check iDRAC Lifecycle Logs for more details/status on the recovery process."""
+    session = get_script_session()
     if script_examples:
         print("""\n- IdracRedfishSupport.bios_device_recovery(), this example will execute BIOS recovery process to recover server with corrupted BIOS.""")
     else:
-        url = 'https://%s/redfish/v1/Dell/Systems/System.Embedded.1/DellBIOSService/Actions/DellBIOSService.DeviceRecovery' % (creds["idrac_ip"])
+        url = 'https://%s/redfish/v1/Dell/Systems/System.Embedded.1/DellBIOSService/Actions/DellBIOSService.DeviceRecovery' % (session.creds["idrac_ip"])
         method = "DeviceRecovery"
         payload={"Device":"BIOS"}
-        if x_auth_token == "yes":
-            headers = {'content-type': 'application/json', 'X-Auth-Token': creds["idrac_x_auth_token"]}
-            response = requests.post(url, data=json.dumps(payload), headers=headers, verify=creds["verify_cert"])
+        if session.x_auth_token == "yes":
+            headers = {'content-type': 'application/json', 'X-Auth-Token': session.creds["idrac_x_auth_token"]}
+            response = session.client.post(url, data=json.dumps(payload), headers=headers, verify=session.creds["verify_cert"])
         else:
             headers = {'content-type': 'application/json'}
-            response = requests.post(url, data=json.dumps(payload), headers=headers, verify=creds["verify_cert"],auth=(creds["idrac_username"],creds["idrac_password"]))
+            response = session.client.post(url, data=json.dumps(payload), headers=headers, verify=session.creds["verify_cert"],auth=(session.creds["idrac_username"],session.creds["idrac_password"]))
         data = response.json()
         if response.status_code == 401:
             logging.error("- ERROR, status code 401 detected, check to make sure your iDRAC script session has correct username/password credentials or if using X-auth token, confirm the session is still active.")
@@ -1974,29 +2932,22 @@ def bios_device_recovery(script_examples=""):
 
 def get_bios_attribute_registry(script_examples="", attribute_name=""):
     """Function to get BIOS attribute registry. Getting attribute information is helpful to configure BIOS attributes (get supported possible values, dependencies, attribute type). Default behavior will get the complete BIOS attribute registry. Supported function argument: attribute_name (pass in exact BIOS string name value due to case sensitive."""
+    session = get_script_session()
     if script_examples:
         print("""\n- IdracRedfishSupport.get_bios_attribute_registry(), this example will return complete BIOS attribute registry.
         \n- IdracRedfishSupport.get_bios_attribute_registry(attribute_name="MemTest"), this example will return only attribute registry details for BIOS attribute MemTest.""")
     else:
         if attribute_name:
             print("\n")
-            if x_auth_token == "yes":
-                response = requests.get('https://%s/redfish/v1/Systems/System.Embedded.1/Bios/BiosRegistry' % (creds["idrac_ip"]),verify=creds["verify_cert"],headers={'X-Auth-Token': creds["idrac_x_auth_token"]})    
-            else:
-                response = requests.get('https://%s/redfish/v1/Systems/System.Embedded.1/Bios/BiosRegistry' % (creds["idrac_ip"]),verify=creds["verify_cert"],auth=(creds["idrac_username"], creds["idrac_password"]))
-            data = response.json()
-            if response.status_code == 401:
-                logging.error("- ERROR, status code 401 detected, check to make sure your iDRAC script session has correct username/password credentials or if using X-auth token, confirm the session is still active.")
+            try:
+                registry = get_attribute_registry_cache().get_registry("bios", session)
+            except requests.exceptions.RequestException as error_message:
+                logging.error("- FAIL, unable to get BIOS attribute registry, error: %s" % error_message)
                 return
-            elif response.status_code != 200:
-                logging.error("\n- FAIL, GET command failed, status code %s returned" % (method, response.status_code))
-                logging.error("\n- Detailed failure results:\n %s" % data)
+            if attribute_name in registry["Attributes"]:
+                logging.info("- Details for attribute %s -\n" % attribute_name)
+                pprint(registry["Attributes"][attribute_name])
                 return
-            for i in data['RegistryEntries']['Attributes']:
-                if attribute_name in i.values():
-                    logging.info("- Details for attribute %s -\n" % attribute_name)
-                    pprint(i)
-                    return
             logging.error("\n- FAIL, unable to locate attribute \"%s\" in the registry. Make sure attribute name is type correctly since its case sensitive" % attribute_name)
             return
         else:
@@ -2004,17 +2955,13 @@ def get_bios_attribute_registry(script_examples="", attribute_name=""):
                 os.remove("bios_attribute_registry.txt")
             except:
                 pass
-            open_file = open("bios_attribute_registry.txt","a")
-            if x_auth_token == "yes":
-                response = requests.get('https://%s/redfish/v1/Systems/System.Embedded.1/Bios/BiosRegistry' % (creds["idrac_ip"]),verify=creds["verify_cert"],headers={'X-Auth-Token': creds["idrac_x_auth_token"]})    
-            else:
-                response = requests.get('https://%s/redfish/v1/Systems/System.Embedded.1/Bios/BiosRegistry' % (creds["idrac_ip"]),verify=creds["verify_cert"],auth=(creds["idrac_username"], creds["idrac_password"]))
-            data = response.json()
-            if response.status_code != 200:
-                logging.error("\n- FAIL, GET command failed, status code %s returned" % (method, response.status_code))
-                logging.error("\n- Detailed failure results:\n %s" % data)
+            try:
+                registry = get_attribute_registry_cache().get_registry("bios", session)
+            except requests.exceptions.RequestException as error_message:
+                logging.error("\n- FAIL, unable to get BIOS attribute registry, error: %s" % error_message)
                 return
-            for i in data['RegistryEntries']['Attributes']:
+            open_file = open("bios_attribute_registry.txt","a")
+            for i in registry["Attributes"].values():
                 pprint(i)
                 print("\n")
                 for ii in i.items():
@@ -2030,15 +2977,16 @@ def get_bios_attribute_registry(script_examples="", attribute_name=""):
 
 def get_bios_attributes(script_examples="", attribute_name=""):
     """Function to get BIOS attributes with their current settings. Use attribute_name function argument to only return details for a specific attribute. NOTE: Make sure to pass in exact attribute name string due to case sensitive support."""
+    session = get_script_session()
     if script_examples:
         print("""\n- IdracRedfishSupport.get_bios_attributes(), this example will return all BIOS attributes detected with current values.
         \n- IdracRedfishSupport.get_bios_attributes(attribute_name="MemTest"), this example will return only current value for BIOS attribute MemTest""")
     else:
         if attribute_name:
-            if x_auth_token == "yes":
-                response = requests.get('https://%s/redfish/v1/Systems/System.Embedded.1/Bios' % (creds["idrac_ip"]),verify=creds["verify_cert"],headers={'X-Auth-Token': creds["idrac_x_auth_token"]})    
+            if session.x_auth_token == "yes":
+                response = session.client.get('https://%s/redfish/v1/Systems/System.Embedded.1/Bios' % (session.creds["idrac_ip"]),verify=session.creds["verify_cert"],headers={'X-Auth-Token': session.creds["idrac_x_auth_token"]})    
             else:
-                response = requests.get('https://%s/redfish/v1/Systems/System.Embedded.1/Bios' % (creds["idrac_ip"]),verify=creds["verify_cert"],auth=(creds["idrac_username"], creds["idrac_password"]))
+                response = session.client.get('https://%s/redfish/v1/Systems/System.Embedded.1/Bios' % (session.creds["idrac_ip"]),verify=session.creds["verify_cert"],auth=(session.creds["idrac_username"], session.creds["idrac_password"]))
             if response.status_code == 401:
                 logging.error("- ERROR, status code 401 detected, check to make sure your iDRAC script session has correct username/password credentials or if using X-auth token, confirm the session is still active.")
                 return
@@ -2060,10 +3008,10 @@ def get_bios_attributes(script_examples="", attribute_name=""):
             except:
                 pass
             open_file = open("bios_attributes.txt","a")
-            if x_auth_token == "yes":
-                response = requests.get('https://%s/redfish/v1/Systems/System.Embedded.1/Bios' % (creds["idrac_ip"]),verify=creds["verify_cert"],headers={'X-Auth-Token': creds["idrac_x_auth_token"]})    
+            if session.x_auth_token == "yes":
+                response = session.client.get('https://%s/redfish/v1/Systems/System.Embedded.1/Bios' % (session.creds["idrac_ip"]),verify=session.creds["verify_cert"],headers={'X-Auth-Token': session.creds["idrac_x_auth_token"]})    
             else:
-                response = requests.get('https://%s/redfish/v1/Systems/System.Embedded.1/Bios' % (creds["idrac_ip"]),verify=creds["verify_cert"],auth=(creds["idrac_username"], creds["idrac_password"]))
+                response = session.client.get('https://%s/redfish/v1/Systems/System.Embedded.1/Bios' % (session.creds["idrac_ip"]),verify=session.creds["verify_cert"],auth=(session.creds["idrac_username"], session.creds["idrac_password"]))
             if response.status_code != 200:
                 logging.error("\n- FAIL, GET command failed, status code %s returned" % (method, response.status_code))
                 logging.error("\n- Detailed failure results:\n %s" % data)
@@ -2082,9 +3030,9 @@ def get_bios_attributes(script_examples="", attribute_name=""):
             logging.info("\n- Attributes are also captured in \"%s\\bios_attributes.txt\" file" % current_dir)
             open_file.close()
 
-def set_bios_attributes(script_examples="", attribute_name="", attribute_value="", reboot=""):
-    """Function to set either one or multiple BIOS attributes. Supported function arguments: attribute_name, attribute_value and reboot(supported values are yes and no). Make sure to pass in attribute name exactly due to case senstive. Example: MemTest will pass but memtest will fail. If you want to configure multiple attributes, make sure to use a comma separator between each attribute name and attribute value. If needed, see examples for passing in multiple attribute names and values."""
-    global job_id
+def set_bios_attributes(script_examples="", attribute_name="", attribute_value="", reboot="", skip_validation=""):
+    """Function to set either one or multiple BIOS attributes. Supported function arguments: attribute_name, attribute_value, reboot(supported values are yes and no) and skip_validation (supported value: True, skip validating attribute names and values against the BIOS attribute registry before creating the config job). Make sure to pass in attribute name exactly due to case senstive. Example: MemTest will pass but memtest will fail. If you want to configure multiple attributes, make sure to use a comma separator between each attribute name and attribute value. If needed, see examples for passing in multiple attribute names and values."""
+    session = get_script_session()
     if script_examples:
         print("""\n- IdracRedfishSupport.set_bios_attributes(attribute_name="MemTest,EmbSata",attribute_value="Disabled,AhciMode",reboot="yes"), this example will reboot the server now to set BIOS attribute MemTest to Disabled and EmbSata to AhciMode.
         \n- IdracRedfishSupport.set_bios_attributes(attribute_name="MemTest",attribute_value="Enabled",reboot="no"), this example will not reoot the server now to set BIOS attribute MemTest to Eanbled. Config job is still scheduled and will execute on next server manual reboot.""")
@@ -2094,34 +3042,39 @@ def set_bios_attributes(script_examples="", attribute_name="", attribute_value="
         attribute_values = attribute_value.split(",")
         for i,ii in zip(attribute_names, attribute_values):
             bios_attribute_payload["Attributes"][i] = ii
-        if x_auth_token == "yes":
-            response = requests.get('https://%s/redfish/v1/Systems/System.Embedded.1/Bios/BiosRegistry' % (creds["idrac_ip"]),verify=creds["verify_cert"],headers={'X-Auth-Token': creds["idrac_x_auth_token"]})    
-        else:
-            response = requests.get('https://%s/redfish/v1/Systems/System.Embedded.1/Bios/BiosRegistry' % (creds["idrac_ip"]),verify=creds["verify_cert"],auth=(creds["idrac_username"], creds["idrac_password"]))
-        if response.status_code == 401:
-            logging.error("- ERROR, status code 401 detected, check to make sure your iDRAC script session has correct username/password credentials or if using X-auth token, confirm the session is still active.")
-            return
-        elif response.status_code != 200:
-            logging.error("\n- FAIL, GET command failed, status code %s returned" % (method, response.status_code))
-            logging.error("\n- Detailed failure results:\n %s" % data)
+        try:
+            registry = get_attribute_registry_cache().get_registry("bios", session)
+            if not skip_validation:
+                if session.x_auth_token == "yes":
+                    response = session.client.get('https://%s/redfish/v1/Systems/System.Embedded.1/Bios' % (session.creds["idrac_ip"]),verify=session.creds["verify_cert"],headers={'X-Auth-Token': session.creds["idrac_x_auth_token"]})
+                else:
+                    response = session.client.get('https://%s/redfish/v1/Systems/System.Embedded.1/Bios' % (session.creds["idrac_ip"]),verify=session.creds["verify_cert"],auth=(session.creds["idrac_username"], session.creds["idrac_password"]))
+                response.raise_for_status()
+                bios_attribute_payload["Attributes"], errors, warnings = get_attribute_registry_cache().validate_attributes("bios", bios_attribute_payload["Attributes"], response.json()["Attributes"], session)
+                for i in warnings:
+                    logging.warning("- WARNING, %s" % i)
+                if errors:
+                    logging.error("- FAIL, BIOS attribute validation failed, config job not created:")
+                    for i in errors:
+                        logging.error("  %s" % i)
+                    return
+        except requests.exceptions.RequestException as error_message:
+            logging.error("- FAIL, unable to get BIOS attribute registry, error: %s" % error_message)
             return
-        data = response.json()
         for i in bios_attribute_payload["Attributes"].items():
-            for ii in data['RegistryEntries']['Attributes']:
-                if i[0] in ii.values():
-                    if ii['Type'] == "Integer":
-                        bios_attribute_payload['Attributes'][i[0]] = int(i[1])
+            if registry["Attributes"].get(i[0], {}).get("Type") == "Integer":
+                bios_attribute_payload['Attributes'][i[0]] = int(i[1])
         for i in bios_attribute_payload["Attributes"].items():
             print("Attribute Name: %s, setting new value to: %s" % (i[0], i[1]))
-        url = 'https://%s/redfish/v1/Systems/System.Embedded.1/Bios/Settings' % creds["idrac_ip"]
+        url = 'https://%s/redfish/v1/Systems/System.Embedded.1/Bios/Settings' % session.creds["idrac_ip"]
         payload_patch = {"@Redfish.SettingsApplyTime":{"ApplyTime":"OnReset"}}
         payload_patch.update(bios_attribute_payload)
-        if x_auth_token == "yes":
-            headers = {'content-type': 'application/json', 'X-Auth-Token': creds["idrac_x_auth_token"]}
-            response = requests.patch(url, data=json.dumps(payload_patch), headers=headers, verify=creds["verify_cert"])
+        if session.x_auth_token == "yes":
+            headers = {'content-type': 'application/json', 'X-Auth-Token': session.creds["idrac_x_auth_token"]}
+            response = session.client.patch(url, data=json.dumps(payload_patch), headers=headers, verify=session.creds["verify_cert"])
         else:
             headers = {'content-type': 'application/json'}
-            response = requests.patch(url, data=json.dumps(payload_patch), headers=headers, verify=creds["verify_cert"],auth=(creds["idrac_username"],creds["idrac_password"]))
+            response = session.client.patch(url, data=json.dumps(payload_patch), headers=headers, verify=session.creds["verify_cert"],auth=(session.creds["idrac_username"],session.creds["idrac_password"]))
         statusCode = response.status_code
         if response.status_code == 202 or response.status_code == 200:
             logging.info("\n- PASS: PATCH command passed to set BIOS attribute pending values and create config job, status code %s returned" % response.status_code)
@@ -2131,24 +3084,24 @@ def set_bios_attributes(script_examples="", attribute_name="", attribute_value="
             logging.error("\n- POST command failure is:\n %s" % data)
             return
         try:
-            job_id = response.headers['Location'].split("/")[-1]
+            session.job_id = response.headers['Location'].split("/")[-1]
         except:
             logging.error("- FAIL, unable to locate job ID in JSON headers output")
             return
-        logging.info("- INFO: %s job ID successfully created" % job_id)
+        logging.info("- INFO: %s job ID successfully created" % session.job_id)
+        job_poller = JobPoller(job_type="BIOSConfiguration")
         while True:
-            if x_auth_token == "yes":
-                response = requests.get('https://%s/redfish/v1/Managers/iDRAC.Embedded.1/Jobs/%s' % (creds["idrac_ip"], job_id),verify=creds["verify_cert"],headers={'X-Auth-Token': creds["idrac_x_auth_token"]})    
+            if session.x_auth_token == "yes":
+                response = session.client.get('https://%s/redfish/v1/Managers/iDRAC.Embedded.1/Jobs/%s' % (session.creds["idrac_ip"], session.job_id),verify=session.creds["verify_cert"],headers={'X-Auth-Token': session.creds["idrac_x_auth_token"]})    
             else:
-                response = requests.get('https://%s/redfish/v1/Managers/iDRAC.Embedded.1/Jobs/%s' % (creds["idrac_ip"], job_id),verify=creds["verify_cert"],auth=(creds["idrac_username"], creds["idrac_password"]))
+                response = session.client.get('https://%s/redfish/v1/Managers/iDRAC.Embedded.1/Jobs/%s' % (session.creds["idrac_ip"], session.job_id),verify=session.creds["verify_cert"],auth=(session.creds["idrac_username"], session.creds["idrac_password"]))
             if response.status_code != 200:
                 logging.error("\n- FAIL, Command failed to check job status, return code is %s" % response.status_code)
                 logging.error("Extended Info Message: {0}".format(response.json()))
                 return
-            time.sleep(10)
             data = response.json()
             if data['Message'] == "Task successfully scheduled.":
-                logging.info("- PASS, %s job id successfully scheduled" % job_id)
+                logging.info("- PASS, %s job id successfully scheduled" % session.job_id)
                 if reboot.lower() == "yes":
                     logging.info("- INFO, user selected to reboot the server now to execute the config job")
                     reboot_server()
@@ -2162,10 +3115,11 @@ def set_bios_attributes(script_examples="", attribute_name="", attribute_value="
                 break
             else:
                 logging.info("- INFO: job status not marked as scheduled, current status: %s" % data['Message'])
+                job_poller.wait(response=response, data=data)
 
 def boot_to_network_iso(script_examples="", attach_iso="", detach_iso="", get_attach_status="", share_ip="", share_type="", share_name="", image_name="", share_username=""):
     """Function to either get network ISO attach status, boot to network ISO or detach network ISO. When you execute function to attach ISO and attach is successful, server will automatically reboot. Supported function arguments: attach_iso (supported value: True), detach_iso (supported value: True), get_attach_status (supported value: True), share_ip, share_name, image_name, share_username (only required for CIFS share) and share_type (supported values: NFS and CIFS. Note: If using CIFS share it will prompt you to enter CIFS share password)."""
-    global concrete_job_uri
+    session = get_script_session()
     if script_examples:
         print("""\n- IdracRedfishSupport.boot_to_network_iso(attach_iso=True, share_ip="192.168.0.130", share_type="NFS", share_name="/nfs", image_name="VMware-VMvisor-7.iso"), this example will attach ISO on NFS share and reboot the server to boot to it.
         \n- IdracRedfishSupport.boot_to_network_iso(get_attach_status=True), this example will get current attach ISO status.
@@ -2173,14 +3127,14 @@ def boot_to_network_iso(script_examples="", attach_iso="", detach_iso="", get_at
         \n- IdracRedfishSupport.boot_to_network_iso(attach_iso=True, share_ip="192.168.0.140", share_type="CIFS", share_name="cifs_share", image_name="VMware-VMvisor-7.iso"), share_username="administrator", this example will first prompt to enter CIFS username password, then boot from ISO on CIFS share.""")
     else:
         if get_attach_status:
-            url = 'https://%s/redfish/v1/Dell/Systems/System.Embedded.1/DellOSDeploymentService/Actions/DellOSDeploymentService.GetAttachStatus' % (creds["idrac_ip"])
+            url = 'https://%s/redfish/v1/Dell/Systems/System.Embedded.1/DellOSDeploymentService/Actions/DellOSDeploymentService.GetAttachStatus' % (session.creds["idrac_ip"])
             payload={}
-            if x_auth_token == "yes":
-                headers = {'content-type': 'application/json', 'X-Auth-Token': creds["idrac_x_auth_token"]}
-                response = requests.post(url, data=json.dumps(payload), headers=headers, verify=creds["verify_cert"])
+            if session.x_auth_token == "yes":
+                headers = {'content-type': 'application/json', 'X-Auth-Token': session.creds["idrac_x_auth_token"]}
+                response = session.client.post(url, data=json.dumps(payload), headers=headers, verify=session.creds["verify_cert"])
             else:
                 headers = {'content-type': 'application/json'}
-                response = requests.post(url, data=json.dumps(payload), headers=headers, verify=creds["verify_cert"],auth=(creds["idrac_username"],creds["idrac_password"]))
+                response = session.client.post(url, data=json.dumps(payload), headers=headers, verify=session.creds["verify_cert"],auth=(session.creds["idrac_username"],session.creds["idrac_password"]))
             data = response.json()
             if response.status_code == 401:
                 logging.error("- ERROR, status code 401 detected, check to make sure your iDRAC script session has correct username/password credentials or if using X-auth token, confirm the session is still active.")
@@ -2192,14 +3146,14 @@ def boot_to_network_iso(script_examples="", attach_iso="", detach_iso="", get_at
                 return
             logging.info("\n- INFO, Current ISO attach status: %s" % data['ISOAttachStatus'])
         elif detach_iso:
-            url = 'https://%s/redfish/v1/Dell/Systems/System.Embedded.1/DellOSDeploymentService/Actions/DellOSDeploymentService.DetachISOImage' % (creds["idrac_ip"])
+            url = 'https://%s/redfish/v1/Dell/Systems/System.Embedded.1/DellOSDeploymentService/Actions/DellOSDeploymentService.DetachISOImage' % (session.creds["idrac_ip"])
             payload={}
-            if x_auth_token == "yes":
-                headers = {'content-type': 'application/json', 'X-Auth-Token': creds["idrac_x_auth_token"]}
-                response = requests.post(url, data=json.dumps(payload), headers=headers, verify=creds["verify_cert"])
+            if session.x_auth_token == "yes":
+                headers = {'content-type': 'application/json', 'X-Auth-Token': session.creds["idrac_x_auth_token"]}
+                response = session.client.post(url, data=json.dumps(payload), headers=headers, verify=session.creds["verify_cert"])
             else:
                 headers = {'content-type': 'application/json'}
-                response = requests.post(url, data=json.dumps(payload), headers=headers, verify=creds["verify_cert"],auth=(creds["idrac_username"],creds["idrac_password"]))
+                response = session.client.post(url, data=json.dumps(payload), headers=headers, verify=session.creds["verify_cert"],auth=(session.creds["idrac_username"],session.creds["idrac_password"]))
             data = response.json()
             if response.status_code == 200 or response.status_code == 202:
                 logging.info("\n- PASS: POST command passed to detach ISO image, status code %s returned" % response.status_code)
@@ -2209,7 +3163,7 @@ def boot_to_network_iso(script_examples="", attach_iso="", detach_iso="", get_at
                 logging.error("\n-POST command failure results:\n %s" % data)
                 return
         elif attach_iso:
-            url = 'https://%s/redfish/v1/Dell/Systems/System.Embedded.1/DellOSDeploymentService/Actions/DellOSDeploymentService.BootToNetworkISO' % (creds["idrac_ip"])
+            url = 'https://%s/redfish/v1/Dell/Systems/System.Embedded.1/DellOSDeploymentService/Actions/DellOSDeploymentService.BootToNetworkISO' % (session.creds["idrac_ip"])
             method = "BootToNetworkISO"
             headers = {'content-type': 'application/json'}
             payload={}
@@ -2225,21 +3179,21 @@ def boot_to_network_iso(script_examples="", attach_iso="", detach_iso="", get_at
                 cifs_password = getpass.getpass("- Enter CIFS share password: ")
                 payload["UserName"] = share_username
                 payload["Password"] = cifs_password
-            if x_auth_token == "yes":
-                headers = {'content-type': 'application/json', 'X-Auth-Token': creds["idrac_x_auth_token"]}
-                response = requests.post(url, data=json.dumps(payload), headers=headers, verify=creds["verify_cert"])
+            if session.x_auth_token == "yes":
+                headers = {'content-type': 'application/json', 'X-Auth-Token': session.creds["idrac_x_auth_token"]}
+                response = session.client.post(url, data=json.dumps(payload), headers=headers, verify=session.creds["verify_cert"])
             else:
                 headers = {'content-type': 'application/json'}
-                response = requests.post(url, data=json.dumps(payload), headers=headers, verify=creds["verify_cert"],auth=(creds["idrac_username"],creds["idrac_password"]))
+                response = session.client.post(url, data=json.dumps(payload), headers=headers, verify=session.creds["verify_cert"],auth=(session.creds["idrac_username"],session.creds["idrac_password"]))
             data = response.json()
             if response.status_code == 202 or response.status_code == 200:
                 logging.info("\n- PASS: POST command passed for %s method, status code %s returned" % (method, response.status_code))
                 try:
-                    concrete_job_uri = response.headers['Location']
+                    session.concrete_job_uri = response.headers['Location']
                 except:
                     logging.error("- FAIL, unable to locate concrete job URI in JSON headers output")
                     return
-                logging.info("- INFO, task service URI created for method %s: %s\n" % (method, concrete_job_uri))
+                logging.info("- INFO, task service URI created for method %s: %s\n" % (method, session.concrete_job_uri))
                 check_concrete_job_uri_status()
             else:
                 logging.error("\n- FAIL, POST command failed for %s method, status code is %s" % (method, response.status_code))
@@ -2249,13 +3203,15 @@ def boot_to_network_iso(script_examples="", attach_iso="", detach_iso="", get_at
 
 def check_concrete_job_uri_status():
     """Function to check URI concrete job ID status for OEM Operating System Deployment (OSD) actions. The function will only be called by functions who execute an action to perform OSD operations. This function cannot be executed as a standalone function to perform an operation."""
+    session = get_script_session()
     from datetime import datetime
     start_time=datetime.now()
+    job_poller = JobPoller(job_type="OSDeploy")
     while True:
-        if x_auth_token == "yes":
-            response = requests.get('https://%s%s' % (creds["idrac_ip"], concrete_job_uri),verify=creds["verify_cert"],headers={'X-Auth-Token': creds["idrac_x_auth_token"]})    
+        if session.x_auth_token == "yes":
+            response = session.client.get('https://%s%s' % (session.creds["idrac_ip"], session.concrete_job_uri),verify=session.creds["verify_cert"],headers={'X-Auth-Token': session.creds["idrac_x_auth_token"]})    
         else:
-            response = requests.get('https://%s%s' % (creds["idrac_ip"], concrete_job_uri),verify=creds["verify_cert"],auth=(creds["idrac_username"], creds["idrac_password"]))
+            response = session.client.get('https://%s%s' % (session.creds["idrac_ip"], session.concrete_job_uri),verify=session.creds["verify_cert"],auth=(session.creds["idrac_username"], session.creds["idrac_password"]))
         current_time=str((datetime.now()-start_time))[0:7]
         if response.status_code == 401:
             logging.error("- ERROR, status code 401 detected, check to make sure your iDRAC script session has correct username/password credentials or if using X-auth token, confirm the session is still active.")
@@ -2302,10 +3258,11 @@ def check_concrete_job_uri_status():
             return
         else:
             logging.info("- INFO, task not completed, current status: \"%s\"" % (data['TaskState']))
-            time.sleep(10)
+            job_poller.wait(response=response, data=data)
 
 def unpack_and_attach_driver_pack(script_examples="", get_driver_packs="", get_attach_status="", attach_driver_pack="", detach_driver_pack=""):
     """Function to get either supported OS driver packs, attach status, attach driver pack or detach driver pack. Supported function arguments: get_driver_packs (supported value: True), get_attach_status (supported value: True), attach_driver_pack (supported value: Pass in OS driver pack string name) and detach_driver_pack (supported_value: True)."""
+    session = get_script_session()
     if script_examples:
         print("""\n- IdracRedfishSupport.unpack_and_attach_driver_pack(attach_driver_pack="Microsoft Windows Server 2022"), this example will attach Windows Server 2022 driver pack.
         \n- IdracRedfishSupport.unpack_and_attach_driver_pack(get_attach_status=True), this example will get current attach driver pack status.
@@ -2313,14 +3270,14 @@ def unpack_and_attach_driver_pack(script_examples="", get_driver_packs="", get_a
         \n- IdracRedfishSupport..unpack_and_attach_driver_pack(get_driver_packs=True), this example will get driver pack details for supported operating systems.""")
     else:
         if get_driver_packs:
-            url = 'https://%s/redfish/v1/Dell/Systems/System.Embedded.1/DellOSDeploymentService/Actions/DellOSDeploymentService.GetDriverPackInfo' % (creds["idrac_ip"])
+            url = 'https://%s/redfish/v1/Dell/Systems/System.Embedded.1/DellOSDeploymentService/Actions/DellOSDeploymentService.GetDriverPackInfo' % (session.creds["idrac_ip"])
             payload={}
-            if x_auth_token == "yes":
-                headers = {'content-type': 'application/json', 'X-Auth-Token': creds["idrac_x_auth_token"]}
-                response = requests.post(url, data=json.dumps(payload), headers=headers, verify=creds["verify_cert"])
+            if session.x_auth_token == "yes":
+                headers = {'content-type': 'application/json', 'X-Auth-Token': session.creds["idrac_x_auth_token"]}
+                response = session.client.post(url, data=json.dumps(payload), headers=headers, verify=session.creds["verify_cert"])
             else:
                 headers = {'content-type': 'application/json'}
-                response = requests.post(url, data=json.dumps(payload), headers=headers, verify=creds["verify_cert"],auth=(creds["idrac_username"],creds["idrac_password"]))
+                response = session.client.post(url, data=json.dumps(payload), headers=headers, verify=session.creds["verify_cert"],auth=(session.creds["idrac_username"],session.creds["idrac_password"]))
             data = response.json()
             if response.status_code == 401:
                 logging.error("- ERROR, status code 401 detected, check to make sure your iDRAC script session has correct username/password credentials or if using X-auth token, confirm the session is still active.")
@@ -2330,20 +3287,20 @@ def unpack_and_attach_driver_pack(script_examples="", get_driver_packs="", get_a
                 data = response.json()
                 logging.error("\n-POST command failure results:\n %s" % data)
                 return
-            logging.info("\n- Driver packs supported for iDRAC %s\n" % creds["idrac_ip"])
+            logging.info("\n- Driver packs supported for iDRAC %s\n" % session.creds["idrac_ip"])
             for i in data['OSList']:
                 i = i.replace("\n","")
                 print(i)
         elif get_attach_status:
-            url = 'https://%s/redfish/v1/Dell/Systems/System.Embedded.1/DellOSDeploymentService/Actions/DellOSDeploymentService.GetAttachStatus' % (creds["idrac_ip"])
+            url = 'https://%s/redfish/v1/Dell/Systems/System.Embedded.1/DellOSDeploymentService/Actions/DellOSDeploymentService.GetAttachStatus' % (session.creds["idrac_ip"])
             headers = {'content-type': 'application/json'}
             payload={}
-            if x_auth_token == "yes":
-                headers = {'content-type': 'application/json', 'X-Auth-Token': creds["idrac_x_auth_token"]}
-                response = requests.post(url, data=json.dumps(payload), headers=headers, verify=creds["verify_cert"])
+            if session.x_auth_token == "yes":
+                headers = {'content-type': 'application/json', 'X-Auth-Token': session.creds["idrac_x_auth_token"]}
+                response = session.client.post(url, data=json.dumps(payload), headers=headers, verify=session.creds["verify_cert"])
             else:
                 headers = {'content-type': 'application/json'}
-                response = requests.post(url, data=json.dumps(payload), headers=headers, verify=creds["verify_cert"],auth=(creds["idrac_username"],creds["idrac_password"]))
+                response = session.client.post(url, data=json.dumps(payload), headers=headers, verify=session.creds["verify_cert"],auth=(session.creds["idrac_username"],session.creds["idrac_password"]))
             data = response.json()
             if response.status_code != 200:
                 logging.error("\n- FAIL, POST command failed to get driver pack attach status, status code: %s" % (response.status_code))
@@ -2352,25 +3309,24 @@ def unpack_and_attach_driver_pack(script_examples="", get_driver_packs="", get_a
                 return
             logging.info("\n- INFO, Current driver pack attach status: %s" % data['DriversAttachStatus'])
         elif attach_driver_pack:
-            global concrete_job_uri
-            url = 'https://%s/redfish/v1/Dell/Systems/System.Embedded.1/DellOSDeploymentService/Actions/DellOSDeploymentService.UnpackAndAttach' % (creds["idrac_ip"])
+            url = 'https://%s/redfish/v1/Dell/Systems/System.Embedded.1/DellOSDeploymentService/Actions/DellOSDeploymentService.UnpackAndAttach' % (session.creds["idrac_ip"])
             method = "UnpackAndAttach"
             payload={"OSName":attach_driver_pack}
-            if x_auth_token == "yes":
-                headers = {'content-type': 'application/json', 'X-Auth-Token': creds["idrac_x_auth_token"]}
-                response = requests.post(url, data=json.dumps(payload), headers=headers, verify=creds["verify_cert"])
+            if session.x_auth_token == "yes":
+                headers = {'content-type': 'application/json', 'X-Auth-Token': session.creds["idrac_x_auth_token"]}
+                response = session.client.post(url, data=json.dumps(payload), headers=headers, verify=session.creds["verify_cert"])
             else:
                 headers = {'content-type': 'application/json'}
-                response = requests.post(url, data=json.dumps(payload), headers=headers, verify=creds["verify_cert"],auth=(creds["idrac_username"],creds["idrac_password"]))
+                response = session.client.post(url, data=json.dumps(payload), headers=headers, verify=session.creds["verify_cert"],auth=(session.creds["idrac_username"],session.creds["idrac_password"]))
             data = response.json()
             if response.status_code == 202 or response.status_code == 200:
                 logging.info("\n- PASS: POST command passed for %s method, status code %s returned" % (method, response.status_code))
                 try:
-                    concrete_job_uri = response.headers['Location']
+                    session.concrete_job_uri = response.headers['Location']
                 except:
                     logging.error("- FAIL, unable to locate task URI in JSON headers output")
                     return
-                logging.info("- INFO, task URI created for method %s: %s\n" % (method, concrete_job_uri))
+                logging.info("- INFO, task URI created for method %s: %s\n" % (method, session.concrete_job_uri))
                 check_concrete_job_uri_status()
             else:
                 logging.error("\n- FAIL, POST command failed for %s method, status code is %s" % (method, response.status_code))
@@ -2378,14 +3334,14 @@ def unpack_and_attach_driver_pack(script_examples="", get_driver_packs="", get_a
                 logging.error("\n- POST command failure results:\n %s" % data)
                 return
         elif detach_driver_pack:
-            url = 'https://%s/redfish/v1/Dell/Systems/System.Embedded.1/DellOSDeploymentService/Actions/DellOSDeploymentService.DetachDrivers' % (creds["idrac_ip"])
+            url = 'https://%s/redfish/v1/Dell/Systems/System.Embedded.1/DellOSDeploymentService/Actions/DellOSDeploymentService.DetachDrivers' % (session.creds["idrac_ip"])
             payload={}
-            if x_auth_token == "yes":
-                headers = {'content-type': 'application/json', 'X-Auth-Token': creds["idrac_x_auth_token"]}
-                response = requests.post(url, data=json.dumps(payload), headers=headers, verify=creds["verify_cert"])
+            if session.x_auth_token == "yes":
+                headers = {'content-type': 'application/json', 'X-Auth-Token': session.creds["idrac_x_auth_token"]}
+                response = session.client.post(url, data=json.dumps(payload), headers=headers, verify=session.creds["verify_cert"])
             else:
                 headers = {'content-type': 'application/json'}
-                response = requests.post(url, data=json.dumps(payload), headers=headers, verify=creds["verify_cert"],auth=(creds["idrac_username"],creds["idrac_password"]))
+                response = session.client.post(url, data=json.dumps(payload), headers=headers, verify=session.creds["verify_cert"],auth=(session.creds["idrac_username"],session.creds["idrac_password"]))
             data = response.json()
             if response.status_code == 200 or response.status_code == 202:
                 logging.info("\n- PASS: POST command passed to detach driver pack, status code %s returned" % response.status_code)
@@ -2397,20 +3353,21 @@ def unpack_and_attach_driver_pack(script_examples="", get_driver_packs="", get_a
 
 def manage_iDRAC_time(script_examples="", get_time="", set_time=""):
     """Function to either get or set iDRAC time. Supported function arguments: get_time (supported value: True) and set_time (NOTE: execute get_time argument to see the correct date/time format to use)."""
+    session = get_script_session()
     if script_examples:
         print("""\n- IdracRedfishSupport.manage_iDRAC_time(get_time=True), this example will return current iDRAC date and time.
         \n- IdracRedfishSupport.manage_iDRAC_time(set_time="2022-01-07T16:15:05-06:00"), this example will set new iDRAC date and time.""")
     else:
         if get_time:
-            url = 'https://%s/redfish/v1/Dell/Managers/iDRAC.Embedded.1/DellTimeService/Actions/DellTimeService.ManageTime' % (creds["idrac_ip"])
+            url = 'https://%s/redfish/v1/Dell/Managers/iDRAC.Embedded.1/DellTimeService/Actions/DellTimeService.ManageTime' % (session.creds["idrac_ip"])
             method = "ManageTime"
             payload={"GetRequest":True}
-            if x_auth_token == "yes":
-                headers = {'content-type': 'application/json', 'X-Auth-Token': creds["idrac_x_auth_token"]}
-                response = requests.post(url, data=json.dumps(payload), headers=headers, verify=creds["verify_cert"])
+            if session.x_auth_token == "yes":
+                headers = {'content-type': 'application/json', 'X-Auth-Token': session.creds["idrac_x_auth_token"]}
+                response = session.client.post(url, data=json.dumps(payload), headers=headers, verify=session.creds["verify_cert"])
             else:
                 headers = {'content-type': 'application/json'}
-                response = requests.post(url, data=json.dumps(payload), headers=headers, verify=creds["verify_cert"],auth=(creds["idrac_username"],creds["idrac_password"]))
+                response = session.client.post(url, data=json.dumps(payload), headers=headers, verify=session.creds["verify_cert"],auth=(session.creds["idrac_username"],session.creds["idrac_password"]))
             data=response.json()
             if response.status_code == 401:
                 logging.error("- ERROR, status code 401 detected, check to make sure your iDRAC script session has correct username/password credentials or if using X-auth token, confirm the session is still active.")
@@ -2424,15 +3381,15 @@ def manage_iDRAC_time(script_examples="", get_time="", set_time=""):
                 if i[0] != "@Message.ExtendedInfo":
                     print("\n- %s: %s" % (i[0], i[1]))
         elif set_time:
-            url = 'https://%s/redfish/v1/Dell/Managers/iDRAC.Embedded.1/DellTimeService/Actions/DellTimeService.ManageTime' % (creds["idrac_ip"])
+            url = 'https://%s/redfish/v1/Dell/Managers/iDRAC.Embedded.1/DellTimeService/Actions/DellTimeService.ManageTime' % (session.creds["idrac_ip"])
             method = "ManageTime"
             payload={"GetRequest":False, "TimeData":set_time}
-            if x_auth_token == "yes":
-                headers = {'content-type': 'application/json', 'X-Auth-Token': creds["idrac_x_auth_token"]}
-                response = requests.post(url, data=json.dumps(payload), headers=headers, verify=creds["verify_cert"])
+            if session.x_auth_token == "yes":
+                headers = {'content-type': 'application/json', 'X-Auth-Token': session.creds["idrac_x_auth_token"]}
+                response = session.client.post(url, data=json.dumps(payload), headers=headers, verify=session.creds["verify_cert"])
             else:
                 headers = {'content-type': 'application/json'}
-                response = requests.post(url, data=json.dumps(payload), headers=headers, verify=creds["verify_cert"],auth=(creds["idrac_username"],creds["idrac_password"]))
+                response = session.client.post(url, data=json.dumps(payload), headers=headers, verify=session.creds["verify_cert"],auth=(session.creds["idrac_username"],session.creds["idrac_password"]))
             data=response.json()
             if response.status_code == 200:
                 logging.info("\n- PASS: POST command passed for %s action to SET iDRAC time, status code 200 returned\n" % method)
@@ -2444,19 +3401,19 @@ def manage_iDRAC_time(script_examples="", get_time="", set_time=""):
 
 def clear_foreign_config_controller(script_examples="", controller_fqdd=""):
     """Function to clear foreign configuration for storage controller. Supported function argument: controller_fqdd."""
-    global job_id
+    session = get_script_session()
     if script_examples:
         print("""\n- IdracRedfishSupport.clear_foreign_config_controller(controller_fqdd="RAID.Integrated.1-1"), this example will clear foreign configuration for controller RAID.integrated.1-1""")
     else:
         payload={"TargetFQDD": controller_fqdd}
-        url = 'https://%s/redfish/v1/Dell/Systems/System.Embedded.1/DellRaidService/Actions/DellRaidService.ClearForeignConfig' % (creds["idrac_ip"])
+        url = 'https://%s/redfish/v1/Dell/Systems/System.Embedded.1/DellRaidService/Actions/DellRaidService.ClearForeignConfig' % (session.creds["idrac_ip"])
         method = "ClearForeignConfig"
-        if x_auth_token == "yes":
-            headers = {'content-type': 'application/json', 'X-Auth-Token': creds["idrac_x_auth_token"]}
-            response = requests.post(url, data=json.dumps(payload), headers=headers, verify=creds["verify_cert"])
+        if session.x_auth_token == "yes":
+            headers = {'content-type': 'application/json', 'X-Auth-Token': session.creds["idrac_x_auth_token"]}
+            response = session.client.post(url, data=json.dumps(payload), headers=headers, verify=session.creds["verify_cert"])
         else:
             headers = {'content-type': 'application/json'}
-            response = requests.post(url, data=json.dumps(payload), headers=headers, verify=creds["verify_cert"],auth=(creds["idrac_username"],creds["idrac_password"]))
+            response = session.client.post(url, data=json.dumps(payload), headers=headers, verify=session.creds["verify_cert"],auth=(session.creds["idrac_username"],session.creds["idrac_password"]))
         data = response.json()
         if response.status_code == 401:
             logging.error("- ERROR, status code 401 detected, check to make sure your iDRAC script session has correct username/password credentials or if using X-auth token, confirm the session is still active.")
@@ -2464,21 +3421,21 @@ def clear_foreign_config_controller(script_examples="", controller_fqdd=""):
         elif response.status_code == 202:
             logging.info("\n- PASS: POST command passed to clear foreign config for controller %s, status code %s returned" % (controller_fqdd, response.status_code))
             try:
-                job_id = response.headers['Location'].split("/")[-1]
+                session.job_id = response.headers['Location'].split("/")[-1]
             except:
                 logging.error("- FAIL, unable to locate job ID in JSON headers output")
                 return
-            logging.info("- Job ID %s successfully created for RAID method \"%s\"" % (job_id, method))
+            logging.info("- Job ID %s successfully created for RAID method \"%s\"" % (session.job_id, method))
         else:
             logging.error("\n- FAIL, POST command failed to clear foreign config for storage controller %s, status code is %s" % (controller_fqdd, response.status_code))
             data = response.json()
             logging.error("\n- POST command failure results:\n %s" % data)
             return
         time.sleep(5)
-        if x_auth_token == "yes":
-            response = requests.get('https://%s/redfish/v1/Managers/iDRAC.Embedded.1/Jobs/%s' % (creds["idrac_ip"], job_id),verify=creds["verify_cert"],headers={'X-Auth-Token': creds["idrac_x_auth_token"]})    
+        if session.x_auth_token == "yes":
+            response = session.client.get('https://%s/redfish/v1/Managers/iDRAC.Embedded.1/Jobs/%s' % (session.creds["idrac_ip"], session.job_id),verify=session.creds["verify_cert"],headers={'X-Auth-Token': session.creds["idrac_x_auth_token"]})    
         else:
-            response = requests.get('https://%s/redfish/v1/Managers/iDRAC.Embedded.1/Jobs/%s' % (creds["idrac_ip"], job_id),verify=creds["verify_cert"],auth=(creds["idrac_username"], creds["idrac_password"]))
+            response = session.client.get('https://%s/redfish/v1/Managers/iDRAC.Embedded.1/Jobs/%s' % (session.creds["idrac_ip"], session.job_id),verify=session.creds["verify_cert"],auth=(session.creds["idrac_username"], session.creds["idrac_password"]))
         data = response.json()
         if data['JobType'] == "RAIDConfiguration":
             logging.info("- INFO, staged config job created, server will now reboot to execute the config job")
@@ -2489,19 +3446,19 @@ def clear_foreign_config_controller(script_examples="", controller_fqdd=""):
 
 def import_foreign_config_controller(script_examples="", controller_fqdd=""):
     """Function to import foreign configuration for storage controller. Supported function argument: controller_fqdd."""
-    global job_id
+    session = get_script_session()
     if script_examples:
         print("""\n- IdracRedfishSupport.import_foreign_config_controller(controller_fqdd="RAID.Integrated.1-1"), this example will import foreign configuration for controller RAID.integrated.1-1""")
     else:
         payload={"TargetFQDD": controller_fqdd}
-        url = 'https://%s/redfish/v1/Dell/Systems/System.Embedded.1/DellRaidService/Actions/DellRaidService.ImportForeignConfig' % (creds["idrac_ip"])
+        url = 'https://%s/redfish/v1/Dell/Systems/System.Embedded.1/DellRaidService/Actions/DellRaidService.ImportForeignConfig' % (session.creds["idrac_ip"])
         method = "ImportForeignConfig"
-        if x_auth_token == "yes":
-            headers = {'content-type': 'application/json', 'X-Auth-Token': creds["idrac_x_auth_token"]}
-            response = requests.post(url, data=json.dumps(payload), headers=headers, verify=creds["verify_cert"])
+        if session.x_auth_token == "yes":
+            headers = {'content-type': 'application/json', 'X-Auth-Token': session.creds["idrac_x_auth_token"]}
+            response = session.client.post(url, data=json.dumps(payload), headers=headers, verify=session.creds["verify_cert"])
         else:
             headers = {'content-type': 'application/json'}
-            response = requests.post(url, data=json.dumps(payload), headers=headers, verify=creds["verify_cert"],auth=(creds["idrac_username"],creds["idrac_password"]))
+            response = session.client.post(url, data=json.dumps(payload), headers=headers, verify=session.creds["verify_cert"],auth=(session.creds["idrac_username"],session.creds["idrac_password"]))
         data = response.json()
         if response.status_code == 401:
             logging.error("- ERROR, status code 401 detected, check to make sure your iDRAC script session has correct username/password credentials or if using X-auth token, confirm the session is still active.")
@@ -2509,21 +3466,21 @@ def import_foreign_config_controller(script_examples="", controller_fqdd=""):
         elif response.status_code == 202:
             logging.info("\n- PASS: POST command passed to import foreign config for controller %s, status code %s returned" % (controller_fqdd, response.status_code))
             try:
-                job_id = response.headers['Location'].split("/")[-1]
+                session.job_id = response.headers['Location'].split("/")[-1]
             except:
                 logging.error("- FAIL, unable to locate job ID in JSON headers output")
                 return
-            logging.info("- Job ID %s successfully created for RAID method \"%s\"" % (job_id, method))
+            logging.info("- Job ID %s successfully created for RAID method \"%s\"" % (session.job_id, method))
         else:
             logging.error("\n- FAIL, POST command failed to import foreign config for storage controller %s, status code %s" % (controller_fqdd, response.status_code))
             data = response.json()
             logging.error("\n- POST command failure results:\n %s" % data)
             return
         time.sleep(5)
-        if x_auth_token == "yes":
-            response = requests.get('https://%s/redfish/v1/Managers/iDRAC.Embedded.1/Jobs/%s' % (creds["idrac_ip"], job_id),verify=creds["verify_cert"],headers={'X-Auth-Token': creds["idrac_x_auth_token"]})    
+        if session.x_auth_token == "yes":
+            response = session.client.get('https://%s/redfish/v1/Managers/iDRAC.Embedded.1/Jobs/%s' % (session.creds["idrac_ip"], session.job_id),verify=session.creds["verify_cert"],headers={'X-Auth-Token': session.creds["idrac_x_auth_token"]})    
         else:
-            response = requests.get('https://%s/redfish/v1/Managers/iDRAC.Embedded.1/Jobs/%s' % (creds["idrac_ip"], job_id),verify=creds["verify_cert"],auth=(creds["idrac_username"], creds["idrac_password"]))
+            response = session.client.get('https://%s/redfish/v1/Managers/iDRAC.Embedded.1/Jobs/%s' % (session.creds["idrac_ip"], session.job_id),verify=session.creds["verify_cert"],auth=(session.creds["idrac_username"], session.creds["idrac_password"]))
         data = response.json()
         if data['JobType'] == "RAIDConfiguration":
             logging.info("- INFO, staged config job created, server will now reboot to execute the config job")
@@ -2534,17 +3491,18 @@ def import_foreign_config_controller(script_examples="", controller_fqdd=""):
 
 def reset_bios_default_settings(script_examples="", reboot=""):
     """Function to reset BIOS to default settings. Supported function argument: reboot (supported_values: yes and no). Reboot server is needed to execute the operation. If you pass in no for reboot, operation is still scheduled and will execute on next server reboot."""
+    session = get_script_session()
     if script_examples:
         print("""\n- IdracRedfishSupport.reset_bios_default_settings(reboot="yes"), this example will reboot the server now to reset BIOS to default settings.""")
     else:
-        url = "https://%s/redfish/v1/Systems/System.Embedded.1/Bios/Actions/Bios.ResetBios" % creds["idrac_ip"]
+        url = "https://%s/redfish/v1/Systems/System.Embedded.1/Bios/Actions/Bios.ResetBios" % session.creds["idrac_ip"]
         payload = {}
-        if x_auth_token == "yes":
-            headers = {'content-type': 'application/json', 'X-Auth-Token': creds["idrac_x_auth_token"]}
-            response = requests.post(url, data=json.dumps(payload), headers=headers, verify=creds["verify_cert"])
+        if session.x_auth_token == "yes":
+            headers = {'content-type': 'application/json', 'X-Auth-Token': session.creds["idrac_x_auth_token"]}
+            response = session.client.post(url, data=json.dumps(payload), headers=headers, verify=session.creds["verify_cert"])
         else:
             headers = {'content-type': 'application/json'}
-            response = requests.post(url, data=json.dumps(payload), headers=headers, verify=creds["verify_cert"],auth=(creds["idrac_username"],creds["idrac_password"]))
+            response = session.client.post(url, data=json.dumps(payload), headers=headers, verify=session.creds["verify_cert"],auth=(session.creds["idrac_username"],session.creds["idrac_password"]))
         data = response.__dict__
         if response.status_code == 401:
             logging.error("- ERROR, status code 401 detected, check to make sure your iDRAC script session has correct username/password credentials or if using X-auth token, confirm the session is still active.")
@@ -2569,13 +3527,14 @@ def reset_bios_default_settings(script_examples="", reboot=""):
         
 def get_current_bios_boot_order(script_examples=""):
     """Function to get current BIOS boot mode and boot order."""
+    session = get_script_session()
     if script_examples:
         print("""\n- IdracRedfishSupport.get_current_bios_boot_order(), this example will return current BIOS boot mode and the boot order.""")
     else:
-        if x_auth_token == "yes":
-            response = requests.get('https://%s/redfish/v1/Systems/System.Embedded.1/Bios?$select=Attributes/BootMode' % (creds["idrac_ip"]),verify=creds["verify_cert"],headers={'X-Auth-Token': creds["idrac_x_auth_token"]})    
+        if session.x_auth_token == "yes":
+            response = session.client.get('https://%s/redfish/v1/Systems/System.Embedded.1/Bios?$select=Attributes/BootMode' % (session.creds["idrac_ip"]),verify=session.creds["verify_cert"],headers={'X-Auth-Token': session.creds["idrac_x_auth_token"]})    
         else:
-            response = requests.get('https://%s/redfish/v1/Systems/System.Embedded.1/Bios?$select=Attributes/BootMode' % (creds["idrac_ip"]),verify=creds["verify_cert"],auth=(creds["idrac_username"], creds["idrac_password"]))
+            response = session.client.get('https://%s/redfish/v1/Systems/System.Embedded.1/Bios?$select=Attributes/BootMode' % (session.creds["idrac_ip"]),verify=session.creds["verify_cert"],auth=(session.creds["idrac_username"], session.creds["idrac_password"]))
         data = response.json()
         if response.status_code == 401:
             logging.error("- ERROR, status code 401 detected, check to make sure your iDRAC script session has correct username/password credentials or if using X-auth token, confirm the session is still active.")
@@ -2585,10 +3544,10 @@ def get_current_bios_boot_order(script_examples=""):
         else:
             logging.error("- ERROR, GET command failed to get current boot mode, status code %s returned" % response.status_code)
             return
-        if x_auth_token == "yes":
-            response = requests.get('https://%s/redfish/v1/Systems/System.Embedded.1/BootOptions?$expand=*($levels=1)' % (creds["idrac_ip"]),verify=creds["verify_cert"],headers={'X-Auth-Token': creds["idrac_x_auth_token"]})    
+        if session.x_auth_token == "yes":
+            response = session.client.get('https://%s/redfish/v1/Systems/System.Embedded.1/BootOptions?$expand=*($levels=1)' % (session.creds["idrac_ip"]),verify=session.creds["verify_cert"],headers={'X-Auth-Token': session.creds["idrac_x_auth_token"]})    
         else:
-            response = requests.get('https://%s/redfish/v1/Systems/System.Embedded.1/BootOptions?$expand=*($levels=1)' % (creds["idrac_ip"]),verify=creds["verify_cert"],auth=(creds["idrac_username"], creds["idrac_password"]))
+            response = session.client.get('https://%s/redfish/v1/Systems/System.Embedded.1/BootOptions?$expand=*($levels=1)' % (session.creds["idrac_ip"]),verify=session.creds["verify_cert"],auth=(session.creds["idrac_username"], session.creds["idrac_password"]))
         data = response.json()
         if response.status_code != 200:
             logging.error("- ERROR, GET command failed to get current boot order, status code %s returned" % response.status_code)
@@ -2605,15 +3564,15 @@ def get_current_bios_boot_order(script_examples=""):
 
 def change_bios_boot_order(script_examples="", boot_order_devices="", reboot=""):
     """Function to change BIOS boot order. Supported function arguments: boot_order_devices (possible value: pass in one or multiple boot order device IDs. If passing in multiple devices, use a comma separator. NOTE: If needed, execute IdracRedfishSupport.get_current_bios_boot_order() to get boot order devices). reboot (possible values: yes and no. If you pass in no for reboot, the config job is still created and will execute on next server manual reboot)."""
-    global job_id
+    session = get_script_session()
     if script_examples:
         print("""\n- IdracRedfishSupport.change_bios_boot_order(boot_order_devices="Boot0000", reboot="yes"), this example will reboot the server now to set Boot0000 entry as first device in the boot order.")
         \n - IdracRedfishSupport.change_bios_boot_order(boot_order_devices="Boot0004,Boot0009,Boot0000", reboot="no"), this examples shows setting the boot order passing in multipe devices. Server will not reboot now but the job will execute on next server manual reboot.""")
     else:
-        if x_auth_token == "yes":
-            response = requests.get('https://%s/redfish/v1/Systems/System.Embedded.1/Bios?$select=Attributes/BootMode' % (creds["idrac_ip"]),verify=creds["verify_cert"],headers={'X-Auth-Token': creds["idrac_x_auth_token"]})    
+        if session.x_auth_token == "yes":
+            response = session.client.get('https://%s/redfish/v1/Systems/System.Embedded.1/Bios?$select=Attributes/BootMode' % (session.creds["idrac_ip"]),verify=session.creds["verify_cert"],headers={'X-Auth-Token': session.creds["idrac_x_auth_token"]})    
         else:
-            response = requests.get('https://%s/redfish/v1/Systems/System.Embedded.1/Bios?$select=Attributes/BootMode' % (creds["idrac_ip"]),verify=creds["verify_cert"],auth=(creds["idrac_username"], creds["idrac_password"]))
+            response = session.client.get('https://%s/redfish/v1/Systems/System.Embedded.1/Bios?$select=Attributes/BootMode' % (session.creds["idrac_ip"]),verify=session.creds["verify_cert"],auth=(session.creds["idrac_username"], session.creds["idrac_password"]))
         data = response.json()
         if response.status_code == 401:
             logging.error("- ERROR, status code 401 detected, check to make sure your iDRAC script session has correct username/password credentials or if using X-auth token, confirm the session is still active.")
@@ -2623,18 +3582,18 @@ def change_bios_boot_order(script_examples="", boot_order_devices="", reboot="")
         else:
             logging.error("- ERROR, GET command failed to get current boot mode, status code %s returned" % response.status_code)
             return
-        url = 'https://%s/redfish/v1/Systems/System.Embedded.1' % creds["idrac_ip"]
+        url = 'https://%s/redfish/v1/Systems/System.Embedded.1' % session.creds["idrac_ip"]
         if "," in boot_order_devices:
             boot_order_ids = boot_order_devices.split(",")
         else:
             boot_order_ids = [boot_order_devices]
         payload = {"Boot":{"BootOrder":boot_order_ids}}
-        if x_auth_token == "yes":
-            headers = {'content-type': 'application/json', 'X-Auth-Token': creds["idrac_x_auth_token"]}
-            response = requests.patch(url, data=json.dumps(payload), headers=headers, verify=creds["verify_cert"])
+        if session.x_auth_token == "yes":
+            headers = {'content-type': 'application/json', 'X-Auth-Token': session.creds["idrac_x_auth_token"]}
+            response = session.client.patch(url, data=json.dumps(payload), headers=headers, verify=session.creds["verify_cert"])
         else:
             headers = {'content-type': 'application/json'}
-            response = requests.patch(url, data=json.dumps(payload), headers=headers, verify=creds["verify_cert"],auth=(creds["idrac_username"],creds["idrac_password"]))
+            response = session.client.patch(url, data=json.dumps(payload), headers=headers, verify=session.creds["verify_cert"],auth=(session.creds["idrac_username"],session.creds["idrac_password"]))
         data = response.json()
         if response.status_code == 200 or response.status_code == 202:
             logging.info("\n- PASS: PATCH command passed to change %s boot order sequence" % current_boot_mode)
@@ -2644,26 +3603,26 @@ def change_bios_boot_order(script_examples="", boot_order_devices="", reboot="")
             logging.error(detail_message)
             return
         try:
-            job_id = response.headers['Location'].split("/")[-1]
+            session.job_id = response.headers['Location'].split("/")[-1]
         except:
             logging.error("- FAIL, unable to find job ID in headers PATCH response, headers output is:\n%s" % response.headers)
             return
-        logging.info("- PASS, job ID \"%s\" successfully created" % (job_id))
+        logging.info("- PASS, job ID \"%s\" successfully created" % (session.job_id))
+        job_poller = JobPoller(job_type="BIOSConfiguration")
         while True:
-            if x_auth_token == "yes":
-                response = requests.get('https://%s/redfish/v1/Managers/iDRAC.Embedded.1/Jobs/%s' % (creds["idrac_ip"], job_id),verify=creds["verify_cert"],headers={'X-Auth-Token': creds["idrac_x_auth_token"]})    
+            if session.x_auth_token == "yes":
+                response = session.client.get('https://%s/redfish/v1/Managers/iDRAC.Embedded.1/Jobs/%s' % (session.creds["idrac_ip"], session.job_id),verify=session.creds["verify_cert"],headers={'X-Auth-Token': session.creds["idrac_x_auth_token"]})    
             else:
-                response = requests.get('https://%s/redfish/v1/Managers/iDRAC.Embedded.1/Jobs/%s' % (creds["idrac_ip"], job_id),verify=creds["verify_cert"],auth=(creds["idrac_username"], creds["idrac_password"]))
+                response = session.client.get('https://%s/redfish/v1/Managers/iDRAC.Embedded.1/Jobs/%s' % (session.creds["idrac_ip"], session.job_id),verify=session.creds["verify_cert"],auth=(session.creds["idrac_username"], session.creds["idrac_password"]))
             if response.status_code == 200:
                 pass
-                time.sleep(10)
             else:
                 logging.error("\n- FAIL, Command failed to check job status, return code is %s" % response.status_code)
                 logging.error("Extended Info Message: {0}".format(response.json()))
                 return
             data = response.json()
             if data['Message'] == "Task successfully scheduled.":
-                logging.info("- PASS, %s job id successfully scheduled" % job_id)
+                logging.info("- PASS, %s job id successfully scheduled" % session.job_id)
                 if reboot.lower() == "yes":
                     print("- INFO, user selected to reboot the server now to execute the config job")
                     reboot_server()
@@ -2677,18 +3636,20 @@ def change_bios_boot_order(script_examples="", boot_order_devices="", reboot="")
                 break
             else:
                 logging.info("- INFO: job status not scheduled, current status: %s" % data['Message'])
+                job_poller.wait(response=response, data=data)
 
 def system_erase(script_examples="", get_supported_components="", erase_components=""):
     """Function to execute iDRAC system erase operation. System Erase feature allows you to reset BIOS or iDRAC to default settings, erase ISE drives, HDD drives, diags, driver pack, Lifecycle controller data, NVDIMMs, PERC NV cache or vFlash. Supported function arguments: get_supported_components (possible value: True), erase_components (pass in one or more multiple component values and make sure to pass in exact string case. If passing in multiple component values, use a comma separator. Once system erase job is completed, server will power off and reset the iDRAC, stay in off state once the iDRAC is back up."""
+    session = get_script_session()
     if script_examples:
         print("""\n- IdracRedfishSupport.system_erase(get_supported_components=True), this example will return supported component values to perform system erase operation.")
         \n - IdracRedfishSupport.system_erase(erase_components="LCData,CryptographicErasePD,IDRAC"), this example will excute system erase to erase Lifecycle Controller data, crypto erase drives and reset iDRAC to default settings.""")
     else:
         if get_supported_components:
-            if x_auth_token == "yes":
-                response = requests.get('https://%s/redfish/v1/Dell/Managers/iDRAC.Embedded.1/DellLCService' % (creds["idrac_ip"]),verify=creds["verify_cert"],headers={'X-Auth-Token': creds["idrac_x_auth_token"]})    
+            if session.x_auth_token == "yes":
+                response = session.client.get('https://%s/redfish/v1/Dell/Managers/iDRAC.Embedded.1/DellLCService' % (session.creds["idrac_ip"]),verify=session.creds["verify_cert"],headers={'X-Auth-Token': session.creds["idrac_x_auth_token"]})    
             else:
-                response = requests.get('https://%s/redfish/v1/Dell/Managers/iDRAC.Embedded.1/DellLCService' % (creds["idrac_ip"]),verify=creds["verify_cert"],auth=(creds["idrac_username"], creds["idrac_password"]))
+                response = session.client.get('https://%s/redfish/v1/Dell/Managers/iDRAC.Embedded.1/DellLCService' % (session.creds["idrac_ip"]),verify=session.creds["verify_cert"],auth=(session.creds["idrac_username"], session.creds["idrac_password"]))
             data = response.json()
             if response.status_code == 401:
                 logging.error("- ERROR, status code 401 detected, check to make sure your iDRAC script session has correct username/password credentials or if using X-auth token, confirm the session is still active.")
@@ -2701,7 +3662,7 @@ def system_erase(script_examples="", get_supported_components="", erase_componen
                 print(i)
         elif erase_components:
             method = "SystemErase"
-            url = 'https://%s/redfish/v1/Dell/Managers/iDRAC.Embedded.1/DellLCService/Actions/DellLCService.SystemErase' % (creds["idrac_ip"])    
+            url = 'https://%s/redfish/v1/Dell/Managers/iDRAC.Embedded.1/DellLCService/Actions/DellLCService.SystemErase' % (session.creds["idrac_ip"])    
             headers = {'content-type': 'application/json'}
             if "," in erase_components:
                 component_list = erase_components.split(",")
@@ -2711,12 +3672,12 @@ def system_erase(script_examples="", get_supported_components="", erase_componen
             logging.info("\n- INFO, component(s) selected for System Erase operation -\n")
             for i in payload["Component"]:
                 print(i)
-            if x_auth_token == "yes":
-                headers = {'content-type': 'application/json', 'X-Auth-Token': creds["idrac_x_auth_token"]}
-                response = requests.post(url, data=json.dumps(payload), headers=headers, verify=creds["verify_cert"])
+            if session.x_auth_token == "yes":
+                headers = {'content-type': 'application/json', 'X-Auth-Token': session.creds["idrac_x_auth_token"]}
+                response = session.client.post(url, data=json.dumps(payload), headers=headers, verify=session.creds["verify_cert"])
             else:
                 headers = {'content-type': 'application/json'}
-                response = requests.post(url, data=json.dumps(payload), headers=headers, verify=creds["verify_cert"],auth=(creds["idrac_username"],creds["idrac_password"]))
+                response = session.client.post(url, data=json.dumps(payload), headers=headers, verify=session.creds["verify_cert"],auth=(session.creds["idrac_username"],session.creds["idrac_password"]))
             data = response.json()
             if response.status_code == 202:
                 logging.info("\n- PASS: POST command passed for %s method, status code 202 returned" % method)
@@ -2733,28 +3694,29 @@ def system_erase(script_examples="", get_supported_components="", erase_componen
             logging.info("- PASS, job ID %s successfuly created for %s method" % (job_id, method))
             start_time=datetime.now()
             count_number = 0
-            if x_auth_token == "yes":
-                response = requests.get('https://%s/redfish/v1/Managers/iDRAC.Embedded.1/Jobs/%s' % (creds["idrac_ip"], job_id),verify=creds["verify_cert"],headers={'X-Auth-Token': creds["idrac_x_auth_token"]})    
+            if session.x_auth_token == "yes":
+                response = session.client.get('https://%s/redfish/v1/Managers/iDRAC.Embedded.1/Jobs/%s' % (session.creds["idrac_ip"], job_id),verify=session.creds["verify_cert"],headers={'X-Auth-Token': session.creds["idrac_x_auth_token"]})    
             else:
-                response = requests.get('https://%s/redfish/v1/Managers/iDRAC.Embedded.1/Jobs/%s' % (creds["idrac_ip"], job_id),verify=creds["verify_cert"],auth=(creds["idrac_username"], creds["idrac_password"]))
+                response = session.client.get('https://%s/redfish/v1/Managers/iDRAC.Embedded.1/Jobs/%s' % (session.creds["idrac_ip"], job_id),verify=session.creds["verify_cert"],auth=(session.creds["idrac_username"], session.creds["idrac_password"]))
             data = response.json()
             logging.info("- INFO, job status not completed, current status: \"%s\"" % (data['Message']))
             start_job_status_message = data['Message']
             retry_count = 1
+            job_poller = JobPoller(job_type="SystemErase")
             while True:
                 try:
-                    if x_auth_token == "yes":
-                        response = requests.get('https://%s/redfish/v1/Managers/iDRAC.Embedded.1/Jobs/%s' % (creds["idrac_ip"], job_id),verify=creds["verify_cert"],headers={'X-Auth-Token': creds["idrac_x_auth_token"]})    
+                    if session.x_auth_token == "yes":
+                        response = session.client.get('https://%s/redfish/v1/Managers/iDRAC.Embedded.1/Jobs/%s' % (session.creds["idrac_ip"], job_id),verify=session.creds["verify_cert"],headers={'X-Auth-Token': session.creds["idrac_x_auth_token"]})    
                     else:
-                        response = requests.get('https://%s/redfish/v1/Managers/iDRAC.Embedded.1/Jobs/%s' % (creds["idrac_ip"], job_id),verify=creds["verify_cert"],auth=(creds["idrac_username"], creds["idrac_password"]))
+                        response = session.client.get('https://%s/redfish/v1/Managers/iDRAC.Embedded.1/Jobs/%s' % (session.creds["idrac_ip"], job_id),verify=session.creds["verify_cert"],auth=(session.creds["idrac_username"], session.creds["idrac_password"]))
                 except:
                     if retry_count == 10:
                         logging.info("- INFO, retry count of 10 has been reached to communicate with iDRAC, script will exit")
                         return
                     else:
-                        logging.info("- INFO, lost iDRAC network connection, retry GET request after 10 second sleep delay")
+                        logging.info("- INFO, lost iDRAC network connection, retry GET request")
                         retry_count += 1
-                        time.sleep(15)
+                        job_poller.wait()
                         continue    
                 current_time = (datetime.now()-start_time)
                 if response.status_code == 200:
@@ -2788,35 +3750,27 @@ def system_erase(script_examples="", get_supported_components="", erase_componen
                         start_job_status_message = new_job_status_message
                     else:
                         pass
+                    job_poller.wait(response=response, data=data)
                     continue
 
 def get_iDRAC_attribute_registry(script_examples="", attribute_name=""):
     """Function to get iDRAC attribute registry. Getting attribute information is helpful to configure iDRAC attributes (get supported possible values, dependencies, attribute type). Supported function argument: attribute_name."""
+    session = get_script_session()
     if script_examples:
         print("""\n- IdracRedfishSupport.get_iDRAC_attribute_registry(), this example will return complete iDRAC attribute registry.")
         \n - IdracRedfishSupport.get_iDRAC_attribute_registry(attribute_name="SNMPAlert.8.SNMPv3UserID"), this example will return attribute registry details for only this attribute.""")
     else:
         if attribute_name:
             print("\n")
-            if x_auth_token == "yes":
-                response = requests.get('https://%s/redfish/v1/Registries/ManagerAttributeRegistry/ManagerAttributeRegistry.v1_0_0.json' % (creds["idrac_ip"]),verify=creds["verify_cert"],headers={'X-Auth-Token': creds["idrac_x_auth_token"]})    
-            else:
-                response = requests.get('https://%s/redfish/v1/Registries/ManagerAttributeRegistry/ManagerAttributeRegistry.v1_0_0.json' % (creds["idrac_ip"]),verify=creds["verify_cert"],auth=(creds["idrac_username"], creds["idrac_password"]))
-            data = response.json()
-            if response.status_code == 401:
-                    logging.error("- ERROR, status code 401 detected, check to make sure your iDRAC script session has correct username/password credentials or if using X-auth token, confirm the session is still active.")
-                    return
-            elif response.status_code != 200:
-                logging.error("\n- FAIL, GET command failed, status code %s returned" % (method, response.status_code))
-                logging.error("\n- Detailed failure results:\n %s" % data)
+            try:
+                registry = get_attribute_registry_cache().get_registry("idrac", session)
+            except requests.exceptions.RequestException as error_message:
+                logging.error("- FAIL, unable to get iDRAC attribute registry, error: %s" % error_message)
                 return
-            found = ""
-            for i in data['RegistryEntries']['Attributes']:
-                if attribute_name in i.values():
-                    found = "yes"
-                    for ii in i.items():
-                        print("%s: %s" % (ii[0],ii[1]))
-            if found != "yes":
+            if attribute_name in registry["Attributes"]:
+                for i in registry["Attributes"][attribute_name].items():
+                    print("%s: %s" % (i[0],i[1]))
+            else:
                 logging.error("\n- FAIL, unable to locate attribute \"%s\" in the registry. Make sure you typed the attribute name correct since its case sensitive" % attribute_name)
                 return
         else:
@@ -2824,17 +3778,13 @@ def get_iDRAC_attribute_registry(script_examples="", attribute_name=""):
                 os.remove("iDRAC_attribute_registry.txt")
             except:
                 pass
-            open_file = open("iDRAC_attribute_registry.txt","a")
-            if x_auth_token == "yes":
-                response = requests.get('https://%s/redfish/v1/Registries/ManagerAttributeRegistry/ManagerAttributeRegistry.v1_0_0.json' % (creds["idrac_ip"]),verify=creds["verify_cert"],headers={'X-Auth-Token': creds["idrac_x_auth_token"]})    
-            else:
-                response = requests.get('https://%s/redfish/v1/Registries/ManagerAttributeRegistry/ManagerAttributeRegistry.v1_0_0.json' % (creds["idrac_ip"]),verify=creds["verify_cert"],auth=(creds["idrac_username"], creds["idrac_password"]))
-            data = response.json()
-            if response.status_code != 200:
-                logging.error("\n- FAIL, GET command failed, status code %s returned" % (method, response.status_code))
-                logging.error("\n- Detailed failure results:\n %s" % data)
+            try:
+                registry = get_attribute_registry_cache().get_registry("idrac", session)
+            except requests.exceptions.RequestException as error_message:
+                logging.error("\n- FAIL, unable to get iDRAC attribute registry, error: %s" % error_message)
                 return
-            for i in data['RegistryEntries']['Attributes']:
+            open_file = open("iDRAC_attribute_registry.txt","a")
+            for i in registry["Attributes"].values():
                 pprint(i)
                 print("\n")
                 for ii in i.items():
@@ -2850,23 +3800,24 @@ def get_iDRAC_attribute_registry(script_examples="", attribute_name=""):
 
 def get_iDRAC_attributes(script_examples="", group_name="", attribute_name=""):
     """Function to get iDRAC attributes which also includes Lifecycle Controller and System attributes. Supported function arguments: group_name (supported values: idrac, lc and system) and attribute_name (pass in attribute name if you only want to return details for a specific attribute."""
+    session = get_script_session()
     if script_examples:
         print("""\n- IdracRedfishSupport.get_iDRAC_attributes(group_name="idrac"), this example will return all iDRAC attributes and their current values.")
         \n - IdracRedfishSupport.get_iDRAC_attributes(group_name="idrac", attribute_name="SupportAssist.1.HostOSProxyPassword"), this example will return details for only this attribute.""")
     elif group_name:
             if group_name.lower() == "idrac":
-                uri = 'https://%s/redfish/v1/Managers/iDRAC.Embedded.1/Attributes' % creds["idrac_ip"]
+                uri = 'https://%s/redfish/v1/Managers/iDRAC.Embedded.1/Attributes' % session.creds["idrac_ip"]
             elif group_name.lower() == "lc":
-                uri = 'https://%s/redfish/v1/Managers/LifecycleController.Embedded.1/Attributes' % creds["idrac_ip"]
+                uri = 'https://%s/redfish/v1/Managers/LifecycleController.Embedded.1/Attributes' % session.creds["idrac_ip"]
             elif group_name.lower() == "system":
-                uri = 'https://%s/redfish/v1/Managers/System.Embedded.1/Attributes' % creds["idrac_ip"]
+                uri = 'https://%s/redfish/v1/Managers/System.Embedded.1/Attributes' % session.creds["idrac_ip"]
             else:
                 print("- INFO, either missing or incorrect value for group_name argument")
                 return
-            if x_auth_token == "yes":
-                response = requests.get(uri,verify=creds["verify_cert"],headers={'X-Auth-Token': creds["idrac_x_auth_token"]})    
+            if session.x_auth_token == "yes":
+                response = session.client.get(uri,verify=session.creds["verify_cert"],headers={'X-Auth-Token': session.creds["idrac_x_auth_token"]})    
             else:
-                response = requests.get(uri,verify=creds["verify_cert"],auth=(creds["idrac_username"], creds["idrac_password"]))
+                response = session.client.get(uri,verify=session.creds["verify_cert"],auth=(session.creds["idrac_username"], session.creds["idrac_password"]))
             data = response.json()
             if response.status_code == 401:
                 logging.error("- ERROR, status code 401 detected, check to make sure your iDRAC script session has correct username/password credentials or if using X-auth token, confirm the session is still active.")
@@ -2910,25 +3861,26 @@ def get_iDRAC_attributes(script_examples="", group_name="", attribute_name=""):
         logging.warning("- WARNING, missing arguments or incorrect argument values passed in. Check help text and script examples for more details")
         return
     
-def set_iDRAC_attributes(script_examples="", group_name="", attribute_names="", attribute_values=""):
-    """Function to set iDRAC, Lifecycle Controller or System attributes. Supported function arguments: group_name (supported values: idrac, lc and system), attribute_names (pass in one or more attribute name. If passing in multiple names use comma separator) and attribute values (make sure the values you pass in match the number of attribute names)."""
+def set_iDRAC_attributes(script_examples="", group_name="", attribute_names="", attribute_values="", skip_validation=""):
+    """Function to set iDRAC, Lifecycle Controller or System attributes. Supported function arguments: group_name (supported values: idrac, lc and system), attribute_names (pass in one or more attribute name. If passing in multiple names use comma separator), attribute values (make sure the values you pass in match the number of attribute names) and skip_validation (supported value: True, skip validating attribute names and values against the attribute registry before setting them)."""
+    session = get_script_session()
     if script_examples:
         print("""\n- IdracRedfishSupport.set_iDRAC_attributes(group_name="idrac", attribute_names="SNMPAlert.1.State,SNMPAlert.2.State",attribute_values="Enabled,Enabled"), this example shows configuring multiple iDRAC attributes.
         \n - IdracRedfishSupport.set_iDRAC_attributes(group_name="system", attribute_names="ServerPwr.1.PSRapidOn", attribute_values="Enabled"), this example shows configuring one system attribute.""")
     else:
         if group_name.lower() == "idrac":
-            uri = 'https://%s/redfish/v1/Managers/iDRAC.Embedded.1/Attributes' % creds["idrac_ip"]
+            uri = 'https://%s/redfish/v1/Managers/iDRAC.Embedded.1/Attributes' % session.creds["idrac_ip"]
         elif group_name.lower() == "lc":
-            uri = 'https://%s/redfish/v1/Managers/LifecycleController.Embedded.1/Attributes' % creds["idrac_ip"]
+            uri = 'https://%s/redfish/v1/Managers/LifecycleController.Embedded.1/Attributes' % session.creds["idrac_ip"]
         elif group_name.lower() == "system":
-            uri = 'https://%s/redfish/v1/Managers/System.Embedded.1/Attributes' % creds["idrac_ip"]
+            uri = 'https://%s/redfish/v1/Managers/System.Embedded.1/Attributes' % session.creds["idrac_ip"]
         else:
             print("- INFO, either missing or incorrect value for group_name argument")
             return
-        if x_auth_token == "yes":
-            response = requests.get(uri,verify=creds["verify_cert"],headers={'X-Auth-Token': creds["idrac_x_auth_token"]})    
+        if session.x_auth_token == "yes":
+            response = session.client.get(uri,verify=session.creds["verify_cert"],headers={'X-Auth-Token': session.creds["idrac_x_auth_token"]})    
         else:
-            response = requests.get(uri,verify=creds["verify_cert"],auth=(creds["idrac_username"], creds["idrac_password"]))
+            response = session.client.get(uri,verify=session.creds["verify_cert"],auth=(session.creds["idrac_username"], session.creds["idrac_password"]))
         data = response.json()
         if response.status_code == 401:
             logging.error("- ERROR, status code 401 detected, check to make sure your iDRAC script session has correct username/password credentials or if using X-auth token, confirm the session is still active.")
@@ -2937,36 +3889,38 @@ def set_iDRAC_attributes(script_examples="", group_name="", attribute_names="",
             logging.error("\n- FAIL, GET command failed, status code %s returned" % (response.status_code))
             logging.error("\n- Detailed failure results:\n %s" % data)
             return
+        current_attributes = data["Attributes"]
         payload = {"Attributes":{}}
         attribute_names_list = attribute_names.split(",")
         attribute_values_list = attribute_values.split(",")
         for i,ii in zip(attribute_names_list, attribute_values_list):
             payload["Attributes"][i] = ii
         print("\n- INFO, configuring \"%s\" attributes\n" % group_name.upper())
-        for i in payload["Attributes"].items():
-            if x_auth_token == "yes":
-                response = requests.get('https://%s/redfish/v1/Registries/ManagerAttributeRegistry/ManagerAttributeRegistry.v1_0_0.json' % (creds["idrac_ip"]),verify=creds["verify_cert"],headers={'X-Auth-Token': creds["idrac_x_auth_token"]})    
-            else:
-                response = requests.get('https://%s/redfish/v1/Registries/ManagerAttributeRegistry/ManagerAttributeRegistry.v1_0_0.json' % (creds["idrac_ip"]),verify=creds["verify_cert"],auth=(creds["idrac_username"], creds["idrac_password"]))
-            data = response.json()
-            if response.status_code != 200:
-                logging.error("\n- FAIL, GET command failed, status code %s returned" % (response.status_code))
-                logging.error("\n- Detailed failure results:\n %s" % data)
+        try:
+            registry = get_attribute_registry_cache().get_registry("idrac", session)
+        except requests.exceptions.RequestException as error_message:
+            logging.error("\n- FAIL, unable to get iDRAC attribute registry, error: %s" % error_message)
+            return
+        if not skip_validation:
+            payload["Attributes"], errors, warnings = get_attribute_registry_cache().validate_attributes("idrac", payload["Attributes"], current_attributes, session)
+            for i in warnings:
+                logging.warning("- WARNING, %s" % i)
+            if errors:
+                logging.error("- FAIL, %s attribute validation failed, attributes not set:" % group_name.upper())
+                for i in errors:
+                    logging.error("  %s" % i)
                 return
-            for ii in data['RegistryEntries']['Attributes']:
-                if i[0] in ii.values():
-                    for iii in ii.items():
-                        if iii[0] == "Type":
-                            if iii[1] == "Integer":
-                                payload["Attributes"][i[0]] = int(i[1])
+        for i in payload["Attributes"].items():
+            if registry["Attributes"].get(i[0], {}).get("Type") == "Integer":
+                payload["Attributes"][i[0]] = int(i[1])
         for i in payload["Attributes"].items():
             print(" Attribute Name: %s, setting new value to: %s" % (i[0], i[1]))
-        if x_auth_token == "yes":
-            headers = {'content-type': 'application/json', 'X-Auth-Token': creds["idrac_x_auth_token"]}
-            response = requests.patch(uri, data=json.dumps(payload), headers=headers, verify=creds["verify_cert"])
+        if session.x_auth_token == "yes":
+            headers = {'content-type': 'application/json', 'X-Auth-Token': session.creds["idrac_x_auth_token"]}
+            response = session.client.patch(uri, data=json.dumps(payload), headers=headers, verify=session.creds["verify_cert"])
         else:
             headers = {'content-type': 'application/json'}
-            response = requests.patch(uri, data=json.dumps(payload), headers=headers, verify=creds["verify_cert"],auth=(creds["idrac_username"],creds["idrac_password"]))
+            response = session.client.patch(uri, data=json.dumps(payload), headers=headers, verify=session.creds["verify_cert"],auth=(session.creds["idrac_username"],session.creds["idrac_password"]))
         data = response.json()
         if response.status_code == 200:
             logging.info("\n- PASS, PATCH command passed to successfully set \"%s\" attribute(s), status code %s returned\n" % (group_name.upper(), response.status_code))
@@ -2980,16 +3934,17 @@ def set_iDRAC_attributes(script_examples="", group_name="", attribute_names="",
         
 def export_hardware_inventory(script_examples="", get_supported_share_types="", export_hw_inventory="", share_ip="", share_type="", share_name="", share_username="", share_password="", ignore_cert_warning="", filename=""):
     """Function to export server hardware inventory locally or network shares. Supported function arguments: get_supported_share_types (possible value: True, export_hw_inventory (possible value: True), share_type (execute IdracRedfishSupport.export_hardware_inventory(get_supported_share_types=True) to get supported share type values), share_ip, share_name, share_username (required for CIFS or auth enabled for HTTP/HTTPS), share_userpassword (required for CIFS or auth enabled for HTTP/HTTPS), ignore_cert_warning (possible values: Off and On). This argument is only supported for HTTPS share) and filename (pass in an unique string name with .xml extension (HW inventory will only be exported in XML format) filename argument is optional, if you do not pass in this argument default filename hwinv.xml will be used."""
+    session = get_script_session()
     method = "ExportHWInventory"
     if script_examples:
         print("""\n- IdracRedfishSupport.export_hardware_inventory(get_supported_share_types=True), this example will return supported share types for export HW inventory.
         \n- IdracRedfishSupport.export_hardware_inventory(export_hw_inventory=True, share_type="local", filename="R740_HW_inv.xml"), this example will export server HW inventory locally.
         \n- IdracRedfishSupport.export_hardware_inventory(export_hw_inventory=True, share_type="NFS", filename="R650_HW_inv.xml", share_ip="192.168.0.130", share_name="/nfs"), this example will export HW inventory to NFS share.""")
     elif get_supported_share_types:
-        if x_auth_token == "yes":
-            response = requests.get('https://%s/redfish/v1/Dell/Managers/iDRAC.Embedded.1/DellLCService' % (creds["idrac_ip"]),verify=creds["verify_cert"],headers={'X-Auth-Token': creds["idrac_x_auth_token"]})    
+        if session.x_auth_token == "yes":
+            response = session.client.get('https://%s/redfish/v1/Dell/Managers/iDRAC.Embedded.1/DellLCService' % (session.creds["idrac_ip"]),verify=session.creds["verify_cert"],headers={'X-Auth-Token': session.creds["idrac_x_auth_token"]})    
         else:
-            response = requests.get('https://%s/redfish/v1/Dell/Managers/iDRAC.Embedded.1/DellLCService' % (creds["idrac_ip"]),verify=creds["verify_cert"],auth=(creds["idrac_username"], creds["idrac_password"]))
+            response = session.client.get('https://%s/redfish/v1/Dell/Managers/iDRAC.Embedded.1/DellLCService' % (session.creds["idrac_ip"]),verify=session.creds["verify_cert"],auth=(session.creds["idrac_username"], session.creds["idrac_password"]))
         data = response.json()
         if response.status_code == 401:
             logging.error("- ERROR, status code 401 detected, check to make sure your iDRAC script session has correct username/password credentials or if using X-auth token, confirm the session is still active.")
@@ -3005,9 +3960,8 @@ def export_hardware_inventory(script_examples="", get_supported_share_types="",
                     print(ii)
         return
     elif export_hw_inventory and share_type:
-        global job_id
         payload = {}
-        url = 'https://%s/redfish/v1/Dell/Managers/iDRAC.Embedded.1/DellLCService/Actions/DellLCService.ExportHWInventory' % (creds["idrac_ip"])
+        url = 'https://%s/redfish/v1/Dell/Managers/iDRAC.Embedded.1/DellLCService/Actions/DellLCService.ExportHWInventory' % (session.creds["idrac_ip"])
         if share_ip:
             payload["IPAddress"] = share_ip
         if share_type:
@@ -3025,12 +3979,12 @@ def export_hardware_inventory(script_examples="", get_supported_share_types="",
             payload["Password"] = share_password
         if ignore_cert_warning:
             payload["IgnoreCertWarning"] = ignore_cert_warning
-        if x_auth_token == "yes":
-            headers = {'content-type': 'application/json', 'X-Auth-Token': creds["idrac_x_auth_token"]}
-            response = requests.post(url, data=json.dumps(payload), headers=headers, verify=creds["verify_cert"])
+        if session.x_auth_token == "yes":
+            headers = {'content-type': 'application/json', 'X-Auth-Token': session.creds["idrac_x_auth_token"]}
+            response = session.client.post(url, data=json.dumps(payload), headers=headers, verify=session.creds["verify_cert"])
         else:
             headers = {'content-type': 'application/json'}
-            response = requests.post(url, data=json.dumps(payload), headers=headers, verify=creds["verify_cert"],auth=(creds["idrac_username"],creds["idrac_password"]))
+            response = session.client.post(url, data=json.dumps(payload), headers=headers, verify=session.creds["verify_cert"],auth=(session.creds["idrac_username"],session.creds["idrac_password"]))
         data = response.json()
         if response.status_code == 202:
             logging.info("\n- PASS: POST command passed for %s method, status code 202 returned" % method)
@@ -3041,10 +3995,10 @@ def export_hardware_inventory(script_examples="", get_supported_share_types="",
             return
         if share_type.lower() == "local":
             if response.headers['Location'] == "/redfish/v1/Dell/hwinv.xml":
-                if x_auth_token == "yes":
-                    response = requests.get('https://%s%s' % (creds["idrac_ip"], response.headers['Location']),verify=creds["verify_cert"],headers={'X-Auth-Token': creds["idrac_x_auth_token"]})    
+                if session.x_auth_token == "yes":
+                    response = session.client.get('https://%s%s' % (session.creds["idrac_ip"], response.headers['Location']),verify=session.creds["verify_cert"],headers={'X-Auth-Token': session.creds["idrac_x_auth_token"]})    
                 else:
-                    response = requests.get('https://%s%s' % (creds["idrac_ip"], response.headers['Location']),verify=creds["verify_cert"],auth=(creds["idrac_username"], creds["idrac_password"]))
+                    response = session.client.get('https://%s%s' % (session.creds["idrac_ip"], response.headers['Location']),verify=session.creds["verify_cert"],auth=(session.creds["idrac_username"], session.creds["idrac_password"]))
                 if filename:
                     export_filename = filename
                 else:
@@ -3058,18 +4012,18 @@ def export_hardware_inventory(script_examples="", get_supported_share_types="",
                 return
         else:
             try:
-                job_id = response.headers['Location'].split("/")[-1]
+                session.job_id = response.headers['Location'].split("/")[-1]
             except:
                 logging.error("- FAIL, unable to find job ID in headers POST response, headers output is:\n%s" % response.headers)
                 return
-            logging.info("- PASS, job ID %s successfuly created for %s method\n" % (job_id, method))
+            logging.info("- PASS, job ID %s successfuly created for %s method\n" % (session.job_id, method))
             from datetime import datetime
             start_time=datetime.now()
             while True:
-                if x_auth_token == "yes":
-                    response = requests.get('https://%s/redfish/v1/Managers/iDRAC.Embedded.1/Jobs/%s' % (creds["idrac_ip"], job_id),verify=creds["verify_cert"],headers={'X-Auth-Token': creds["idrac_x_auth_token"]})    
+                if session.x_auth_token == "yes":
+                    response = session.client.get('https://%s/redfish/v1/Managers/iDRAC.Embedded.1/Jobs/%s' % (session.creds["idrac_ip"], session.job_id),verify=session.creds["verify_cert"],headers={'X-Auth-Token': session.creds["idrac_x_auth_token"]})    
                 else:
-                    response = requests.get('https://%s/redfish/v1/Managers/iDRAC.Embedded.1/Jobs/%s' % (creds["idrac_ip"], job_id),verify=creds["verify_cert"],auth=(creds["idrac_username"], creds["idrac_password"]))
+                    response = session.client.get('https://%s/redfish/v1/Managers/iDRAC.Embedded.1/Jobs/%s' % (session.creds["idrac_ip"], session.job_id),verify=session.creds["verify_cert"],auth=(session.creds["idrac_username"], session.creds["idrac_password"]))
                 current_time=(datetime.now()-start_time)
                 if response.status_code != 200:
                     logging.error("\n- FAIL, Command failed to check job status, return code %s" % statusCode)
@@ -3080,7 +4034,7 @@ def export_hardware_inventory(script_examples="", get_supported_share_types="",
                     logging.error("\n- FAIL: Timeout of 5 minutes has been hit, script stopped\n")
                     return
                 elif "Fail" in data['Message'] or "fail" in data['Message'] or data['JobState'] == "Failed" or "Unable" in data['Message']:
-                    logging.error("- FAIL: job ID %s failed, failed message is: %s" % (job_id, data['Message']))
+                    logging.error("- FAIL: job ID %s failed, failed message is: %s" % (session.job_id, data['Message']))
                     return
                 elif data['JobState'] == "Completed":
                     if data['Message'] == "Hardware Inventory Export was successful":
@@ -3099,15 +4053,16 @@ def export_hardware_inventory(script_examples="", get_supported_share_types="",
 
 def export_iDRAC_lifecycle_logs(script_examples="", get_supported_share_types="", export_lc_logs="", share_ip="", share_type="", share_name="", share_username="", share_password="", ignore_cert_warning="", filename=""):
     """Function to export iDRAC Lifecycle (LC) logs locally or network shares. Supported function arguments: get_supported_share_types (possible value: True, export_lc_logs (possible value: True), share_type (execute IdracRedfishSupport.export_iDRAC_lifecycle_logs(get_supported_share_types=True), share_ip, share_name, share_username (if auth is enabled), share_userpassword (if auth is enabled), ignore_cert_warning (possible values: Off and On). This argument is only supported for HTTPS share) and filename (pass in an unique string name with .xml extension (iDRAC LC logs will only be exported in XML format). Filename is optional, if you do not pass in this argument default filename lclog.xml will be used."""
+    session = get_script_session()
     if script_examples:
         print("""\n- IdracRedfishSupport.export_iDRAC_lifecycle_logs(get_supported_share_types=True), this example will return supported share types for export iDRAC LC logs.
         \n- IdracRedfishSupport.export_iDRAC_lifecycle_logs(export_lc_logs=True, share_type="local", filename="R740_LC_logs.xml"), this example will export iDRAC LC logs locally.
         \n- IdracRedfishSupport.export_iDRAC_lifecycle_logs(export_lc_logs=true, share_type="NFS", filename="R650_LC_logs.xml", share_ip="192.168.0.130", share_name="/nfs"), this example will export iDRAC LC logs to NFS share.""")
     elif get_supported_share_types:
-        if x_auth_token == "yes":
-            response = requests.get('https://%s/redfish/v1/Dell/Managers/iDRAC.Embedded.1/DellLCService' % (creds["idrac_ip"]),verify=creds["verify_cert"],headers={'X-Auth-Token': creds["idrac_x_auth_token"]})    
+        if session.x_auth_token == "yes":
+            response = session.client.get('https://%s/redfish/v1/Dell/Managers/iDRAC.Embedded.1/DellLCService' % (session.creds["idrac_ip"]),verify=session.creds["verify_cert"],headers={'X-Auth-Token': session.creds["idrac_x_auth_token"]})    
         else:
-            response = requests.get('https://%s/redfish/v1/Dell/Managers/iDRAC.Embedded.1/DellLCService' % (creds["idrac_ip"]),verify=creds["verify_cert"],auth=(creds["idrac_username"], creds["idrac_password"]))
+            response = session.client.get('https://%s/redfish/v1/Dell/Managers/iDRAC.Embedded.1/DellLCService' % (session.creds["idrac_ip"]),verify=session.creds["verify_cert"],auth=(session.creds["idrac_username"], session.creds["idrac_password"]))
         data = response.json()
         if response.status_code == 401:
             logging.error("- ERROR, status code 401 detected, check to make sure your iDRAC script session has correct username/password credentials or if using X-auth token, confirm the session is still active.")
@@ -3122,8 +4077,7 @@ def export_iDRAC_lifecycle_logs(script_examples="", get_supported_share_types=""
                 for ii in i[1]['ShareType@Redfish.AllowableValues']:
                     print(ii)
     elif export_lc_logs and share_type:
-        global job_id
-        url = 'https://%s/redfish/v1/Dell/Managers/iDRAC.Embedded.1/DellLCService/Actions/DellLCService.ExportLCLog' % (creds["idrac_ip"])
+        url = 'https://%s/redfish/v1/Dell/Managers/iDRAC.Embedded.1/DellLCService/Actions/DellLCService.ExportLCLog' % (session.creds["idrac_ip"])
         method = "ExportLCLog"
         payload = {}
         if share_ip:
@@ -3143,12 +4097,12 @@ def export_iDRAC_lifecycle_logs(script_examples="", get_supported_share_types=""
             payload["Password"] = share_password
         if ignore_cert_warning:
             payload["IgnoreCertWarning"] = ignore_cert_warning
-        if x_auth_token == "yes":
-            headers = {'content-type': 'application/json', 'X-Auth-Token': creds["idrac_x_auth_token"]}
-            response = requests.post(url, data=json.dumps(payload), headers=headers, verify=creds["verify_cert"])
+        if session.x_auth_token == "yes":
+            headers = {'content-type': 'application/json', 'X-Auth-Token': session.creds["idrac_x_auth_token"]}
+            response = session.client.post(url, data=json.dumps(payload), headers=headers, verify=session.creds["verify_cert"])
         else:
             headers = {'content-type': 'application/json'}
-            response = requests.post(url, data=json.dumps(payload), headers=headers, verify=creds["verify_cert"],auth=(creds["idrac_username"],creds["idrac_password"]))
+            response = session.client.post(url, data=json.dumps(payload), headers=headers, verify=session.creds["verify_cert"],auth=(session.creds["idrac_username"],session.creds["idrac_password"]))
         data = response.json()
         if response.status_code == 202:
             logging.info("\n- PASS: POST command passed for %s method, status code 202 returned" % method)
@@ -3159,10 +4113,10 @@ def export_iDRAC_lifecycle_logs(script_examples="", get_supported_share_types=""
             return
         if share_type.lower() == "local":
             if response.headers['Location'] == "/redfish/v1/Dell/lclog.xml":
-                if x_auth_token == "yes":
-                    response = requests.get('https://%s%s' % (creds["idrac_ip"], response.headers['Location']),verify=creds["verify_cert"],headers={'X-Auth-Token': creds["idrac_x_auth_token"]})    
+                if session.x_auth_token == "yes":
+                    response = session.client.get('https://%s%s' % (session.creds["idrac_ip"], response.headers['Location']),verify=session.creds["verify_cert"],headers={'X-Auth-Token': session.creds["idrac_x_auth_token"]})    
                 else:
-                    response = requests.get('https://%s%s' % (creds["idrac_ip"], response.headers['Location']),verify=creds["verify_cert"],auth=(creds["idrac_username"], creds["idrac_password"]))
+                    response = session.client.get('https://%s%s' % (session.creds["idrac_ip"], response.headers['Location']),verify=session.creds["verify_cert"],auth=(session.creds["idrac_username"], session.creds["idrac_password"]))
                 if filename:
                     export_filename = filename
                 else:
@@ -3176,17 +4130,17 @@ def export_iDRAC_lifecycle_logs(script_examples="", get_supported_share_types=""
                 return
         else:
             try:
-                job_id = response.headers['Location'].split("/")[-1]
+                session.job_id = response.headers['Location'].split("/")[-1]
             except:
                 logging.error("- FAIL, unable to find job ID in headers POST response, headers output is:\n%s" % response.headers)
                 return
-            logging.info("- PASS, job ID %s successfuly created for %s method\n" % (job_id, method))
+            logging.info("- PASS, job ID %s successfuly created for %s method\n" % (session.job_id, method))
             start_time = datetime.now()
             while True:
-                if x_auth_token == "yes":
-                    response = requests.get('https://%s/redfish/v1/Managers/iDRAC.Embedded.1/Jobs/%s' % (creds["idrac_ip"], job_id),verify=creds["verify_cert"],headers={'X-Auth-Token': creds["idrac_x_auth_token"]})    
+                if session.x_auth_token == "yes":
+                    response = session.client.get('https://%s/redfish/v1/Managers/iDRAC.Embedded.1/Jobs/%s' % (session.creds["idrac_ip"], session.job_id),verify=session.creds["verify_cert"],headers={'X-Auth-Token': session.creds["idrac_x_auth_token"]})    
                 else:
-                    response = requests.get('https://%s/redfish/v1/Managers/iDRAC.Embedded.1/Jobs/%s' % (creds["idrac_ip"], job_id),verify=creds["verify_cert"],auth=(creds["idrac_username"], creds["idrac_password"]))
+                    response = session.client.get('https://%s/redfish/v1/Managers/iDRAC.Embedded.1/Jobs/%s' % (session.creds["idrac_ip"], session.job_id),verify=session.creds["verify_cert"],auth=(session.creds["idrac_username"], session.creds["idrac_password"]))
                 current_time = (datetime.now()-start_time)
                 if response.status_code != 200:
                     logging.error("\n- FAIL, Command failed to check job status, return code %s" % response.status_code)
@@ -3197,7 +4151,7 @@ def export_iDRAC_lifecycle_logs(script_examples="", get_supported_share_types=""
                     logging.error("\n- FAIL: Timeout of 5 minutes has been hit, script stopped\n")
                     return
                 elif "Fail" in data['Message'] or "fail" in data['Message'] or data['JobState'] == "Failed" or "Unable" in data['Message']:
-                    logging.error("- FAIL: job ID %s failed, failed message is: %s" % (job_id, data['Message']))
+                    logging.error("- FAIL: job ID %s failed, failed message is: %s" % (session.job_id, data['Message']))
                     return
                 elif data['JobState'] == "Completed":
                     if data['Message'] == "LCL Export was successful":
@@ -3216,15 +4170,16 @@ def export_iDRAC_lifecycle_logs(script_examples="", get_supported_share_types=""
     
 def export_server_factory_configuration(script_examples="", get_supported_share_types="", export_factory_config="", share_ip="", share_type="", share_name="", share_username="", share_password="", ignore_cert_warning="", filename=""):
     """Function to export server factory configuration to a network share. Supported function arguments: get_supported_share_types (possible value: True, export_factory_config (possible value: True), share_type, share_ip, share_name, share_username (required for CIFS and HTTP/HTTPS if auth is enabled), share_userpassword (required for CIFS and HTTP/HTTPS if auth is enabled), ignore_cert_warning (possible values: Off and On). This argument is only supported for HTTPS share) and filename (pass in an unique string name with .xml extension (factory inventory will only be exported in XML format)."""
+    session = get_script_session()
     if script_examples:
         print("""\n- IdracRedfishSupport.export_server_factory_configuration(get_supported_share_types=True), this example will return supported share types for export factory configuration.
         \n- IdracRedfishSupport.export_server_factory_configuration(export_factory_config=True, share_type="local"), this example will export factory configuration XML file locally. 
         \n- IdracRedfishSupport.export_server_factory_configuration(export_factory_config=True, share_type="NFS", filename="R740_factory_config.xml", share_ip="192.168.0.130), this example will export server factory configuration to NFS share.""")
     elif get_supported_share_types:
-        if x_auth_token == "yes":
-            response = requests.get('https://%s/redfish/v1/Dell/Managers/iDRAC.Embedded.1/DellLCService' % (creds["idrac_ip"]),verify=creds["verify_cert"],headers={'X-Auth-Token': creds["idrac_x_auth_token"]})    
+        if session.x_auth_token == "yes":
+            response = session.client.get('https://%s/redfish/v1/Dell/Managers/iDRAC.Embedded.1/DellLCService' % (session.creds["idrac_ip"]),verify=session.creds["verify_cert"],headers={'X-Auth-Token': session.creds["idrac_x_auth_token"]})    
         else:
-            response = requests.get('https://%s/redfish/v1/Dell/Managers/iDRAC.Embedded.1/DellLCService' % (creds["idrac_ip"]),verify=creds["verify_cert"],auth=(creds["idrac_username"], creds["idrac_password"]))
+            response = session.client.get('https://%s/redfish/v1/Dell/Managers/iDRAC.Embedded.1/DellLCService' % (session.creds["idrac_ip"]),verify=session.creds["verify_cert"],auth=(session.creds["idrac_username"], session.creds["idrac_password"]))
         data = response.json()
         if response.status_code == 401:
             logging.error("- ERROR, status code 401 detected, check to make sure your iDRAC script session has correct username/password credentials or if using X-auth token, confirm the session is still active.")
@@ -3239,8 +4194,7 @@ def export_server_factory_configuration(script_examples="", get_supported_share_
                 for ii in i[1]['ShareType@Redfish.AllowableValues']:
                     print(ii)
     elif export_factory_config and share_type:
-        global job_id
-        url = 'https://%s/redfish/v1/Dell/Managers/iDRAC.Embedded.1/DellLCService/Actions/DellLCService.ExportFactoryConfiguration' % (creds["idrac_ip"])
+        url = 'https://%s/redfish/v1/Dell/Managers/iDRAC.Embedded.1/DellLCService/Actions/DellLCService.ExportFactoryConfiguration' % (session.creds["idrac_ip"])
         method = "ExportFactoryConfiguration"
         payload = {}
         if share_ip:
@@ -3260,12 +4214,12 @@ def export_server_factory_configuration(script_examples="", get_supported_share_
             payload["Password"] = share_password
         if ignore_cert_warning:
             payload["IgnoreCertWarning"] = ignore_cert_warning
-        if x_auth_token == "yes":
-            headers = {'content-type': 'application/json', 'X-Auth-Token': creds["idrac_x_auth_token"]}
-            response = requests.post(url, data=json.dumps(payload), headers=headers, verify=creds["verify_cert"])
+        if session.x_auth_token == "yes":
+            headers = {'content-type': 'application/json', 'X-Auth-Token': session.creds["idrac_x_auth_token"]}
+            response = session.client.post(url, data=json.dumps(payload), headers=headers, verify=session.creds["verify_cert"])
         else:
             headers = {'content-type': 'application/json'}
-            response = requests.post(url, data=json.dumps(payload), headers=headers, verify=creds["verify_cert"],auth=(creds["idrac_username"],creds["idrac_password"]))
+            response = session.client.post(url, data=json.dumps(payload), headers=headers, verify=session.creds["verify_cert"],auth=(session.creds["idrac_username"],session.creds["idrac_password"]))
         data = response.json()
         if response.status_code == 202:
             logging.info("\n- PASS: POST command passed for %s method, status code 202 returned" % method)
@@ -3277,10 +4231,10 @@ def export_server_factory_configuration(script_examples="", get_supported_share_
         if share_type.lower() == "local":
             if response.headers['Location'] == "/redfish/v1/Dell/factoryconfig.xml":
                 while True:
-                    if x_auth_token == "yes":
-                        response = requests.get('https://%s%s' % (creds["idrac_ip"], response.headers['Location']), verify=creds["verify_cert"], headers={'X-Auth-Token': creds["idrac_x_auth_token"]})   
+                    if session.x_auth_token == "yes":
+                        response = session.client.get('https://%s%s' % (session.creds["idrac_ip"], response.headers['Location']), verify=session.creds["verify_cert"], headers={'X-Auth-Token': session.creds["idrac_x_auth_token"]})   
                     else:
-                        response = requests.get('https://%s%s' % (creds["idrac_ip"], response.headers['Location']), verify=creds["verify_cert"],auth=(creds["idrac_username"], creds["idrac_password"]))
+                        response = session.client.get('https://%s%s' % (session.creds["idrac_ip"], response.headers['Location']), verify=session.creds["verify_cert"],auth=(session.creds["idrac_username"], session.creds["idrac_password"]))
                     export_filename = "factoryconfig.xml"    
                     with open(export_filename, "wb") as output:
                         output.write(response.content)
@@ -3292,17 +4246,17 @@ def export_server_factory_configuration(script_examples="", get_supported_share_
                 return                      
         else:
             try:
-                job_id = response.headers['Location'].split("/")[-1]
+                session.job_id = response.headers['Location'].split("/")[-1]
             except:
                 logging.error("- FAIL, unable to find job ID in headers POST response, headers output is:\n%s" % response.headers)
                 return
-            logging.info("- PASS, job ID %s successfuly created for %s method\n" % (job_id, method))
+            logging.info("- PASS, job ID %s successfuly created for %s method\n" % (session.job_id, method))
             start_time = datetime.now()
             while True:
-                if x_auth_token == "yes":
-                    response = requests.get('https://%s/redfish/v1/Managers/iDRAC.Embedded.1/Jobs/%s' % (creds["idrac_ip"], job_id),verify=creds["verify_cert"],headers={'X-Auth-Token': creds["idrac_x_auth_token"]})    
+                if session.x_auth_token == "yes":
+                    response = session.client.get('https://%s/redfish/v1/Managers/iDRAC.Embedded.1/Jobs/%s' % (session.creds["idrac_ip"], session.job_id),verify=session.creds["verify_cert"],headers={'X-Auth-Token': session.creds["idrac_x_auth_token"]})    
                 else:
-                    response = requests.get('https://%s/redfish/v1/Managers/iDRAC.Embedded.1/Jobs/%s' % (creds["idrac_ip"], job_id),verify=creds["verify_cert"],auth=(creds["idrac_username"], creds["idrac_password"]))
+                    response = session.client.get('https://%s/redfish/v1/Managers/iDRAC.Embedded.1/Jobs/%s' % (session.creds["idrac_ip"], session.job_id),verify=session.creds["verify_cert"],auth=(session.creds["idrac_username"], session.creds["idrac_password"]))
                 current_time = (datetime.now()-start_time)
                 if response.status_code == 401:
                     logging.error("- ERROR, status code 401 detected, check to make sure your iDRAC script session has correct username/password credentials or if using X-auth token, confirm the session is still active.")
@@ -3316,7 +4270,7 @@ def export_server_factory_configuration(script_examples="", get_supported_share_
                     logging.error("\n- FAIL: Timeout of 5 minutes has been hit, script stopped\n")
                     return
                 elif "Fail" in data['Message'] or "fail" in data['Message'] or data['JobState'] == "Failed" or "Unable" in data['Message']:
-                    logging.error("- FAIL: job ID %s failed, failed message is: %s" % (job_id, data['Message']))
+                    logging.error("- FAIL: job ID %s failed, failed message is: %s" % (session.job_id, data['Message']))
                     return
                 elif data['JobState'] == "Completed":
                     if data['Message'] == "Factory Configuration Export was successful":
@@ -3335,21 +4289,21 @@ def export_server_factory_configuration(script_examples="", get_supported_share_
 
 def export_server_screen_shot(script_examples="", file_type=""):
     """Function to export server screenshot saved by iDRAC. This image will be exported in base64 format to a file. You will need to take this content and use a utility which can convert base64 to PNG for viewing the image. Supported function argument: file_type (supported values: LastCrashScreenShot, Preview and ServerScreenShot. NOTE: Make sure to pass in the exact case value)."""
-    global job_id
+    session = get_script_session()
     if script_examples:
         print("""\n- IdracRedfishSupport.export_server_screen_shot(file_type="LastCrashScreenShot"), this example will export last server crash screenshot.
         \n- IdracRedfishSupport.export_server_screen_shot(file_type="ServerScreenShot"), this example will export current server screenshot.""")
     elif file_type:
         payload={}
-        url = 'https://%s/redfish/v1/Dell/Managers/iDRAC.Embedded.1/DellLCService/Actions/DellLCService.ExportServerScreenShot' % (creds["idrac_ip"])
+        url = 'https://%s/redfish/v1/Dell/Managers/iDRAC.Embedded.1/DellLCService/Actions/DellLCService.ExportServerScreenShot' % (session.creds["idrac_ip"])
         method = "ExportServerScreenShot"
         payload["FileType"] = file_type
-        if x_auth_token == "yes":
-            headers = {'content-type': 'application/json', 'X-Auth-Token': creds["idrac_x_auth_token"]}
-            response = requests.post(url, data=json.dumps(payload), headers=headers, verify=creds["verify_cert"])
+        if session.x_auth_token == "yes":
+            headers = {'content-type': 'application/json', 'X-Auth-Token': session.creds["idrac_x_auth_token"]}
+            response = session.client.post(url, data=json.dumps(payload), headers=headers, verify=session.creds["verify_cert"])
         else:
             headers = {'content-type': 'application/json'}
-            response = requests.post(url, data=json.dumps(payload), headers=headers, verify=creds["verify_cert"],auth=(creds["idrac_username"],creds["idrac_password"]))
+            response = session.client.post(url, data=json.dumps(payload), headers=headers, verify=session.creds["verify_cert"],auth=(session.creds["idrac_username"],session.creds["idrac_password"]))
         data = response.json()
         if response.status_code == 401:
             logging.error("- ERROR, status code 401 detected, check to make sure your iDRAC script session has correct username/password credentials or if using X-auth token, confirm the session is still active.")
@@ -3374,19 +4328,20 @@ def export_server_screen_shot(script_examples="", file_type=""):
     
 def export_server_video_log(script_examples="", file_type=""):
     """Function to export server video log saved by iDRAC. Supported function argument: file_type(supported values: BootCaptureVideo and CrashCaptureVideo. NOTE: make sure to pass in the exact case value). Extract the video files(dvc format) from the zip to view them."""
+    session = get_script_session()
     if script_examples:
         print("""\n- IdracRedfishSupport.export_server_video_log(file_type="BootCaptureVideo"), this example will export latest boot capture video.
         \n- IdracRedfishSupport.export_server_video_log(file_type="CrashCaptureVideo"), this example will export latest crash capture video.""")
     elif file_type:
-        url = 'https://%s/redfish/v1/Dell/Managers/iDRAC.Embedded.1/DellLCService/Actions/DellLCService.ExportVideoLog' % (creds["idrac_ip"])
+        url = 'https://%s/redfish/v1/Dell/Managers/iDRAC.Embedded.1/DellLCService/Actions/DellLCService.ExportVideoLog' % (session.creds["idrac_ip"])
         method = "ExportVideoLog"
         payload={"ShareType":"Local","FileType":file_type}
-        if x_auth_token == "yes":
-            headers = {'content-type': 'application/json', 'X-Auth-Token': creds["idrac_x_auth_token"]}
-            response = requests.post(url, data=json.dumps(payload), headers=headers, verify=creds["verify_cert"])
+        if session.x_auth_token == "yes":
+            headers = {'content-type': 'application/json', 'X-Auth-Token': session.creds["idrac_x_auth_token"]}
+            response = session.client.post(url, data=json.dumps(payload), headers=headers, verify=session.creds["verify_cert"])
         else:
             headers = {'content-type': 'application/json'}
-            response = requests.post(url, data=json.dumps(payload), headers=headers, verify=creds["verify_cert"],auth=(creds["idrac_username"],creds["idrac_password"]))
+            response = session.client.post(url, data=json.dumps(payload), headers=headers, verify=session.creds["verify_cert"],auth=(session.creds["idrac_username"],session.creds["idrac_password"]))
         data = response.json()
         if response.status_code == 401:
             logging.error("- ERROR, status code 401 detected, check to make sure your iDRAC script session has correct username/password credentials or if using X-auth token, confirm the session is still active.")
@@ -3405,10 +4360,10 @@ def export_server_video_log(script_examples="", file_type=""):
             logging.error("- FAIL, unable to locate video capture URI in POST response output")
             return
         while True:
-            if x_auth_token == "yes":
-                response = requests.get('https://%s%s' % (creds["idrac_ip"], response.headers['Location']), verify=creds["verify_cert"], headers={'X-Auth-Token': creds["idrac_x_auth_token"]})   
+            if session.x_auth_token == "yes":
+                response = session.client.get('https://%s%s' % (session.creds["idrac_ip"], response.headers['Location']), verify=session.creds["verify_cert"], headers={'X-Auth-Token': session.creds["idrac_x_auth_token"]})   
             else:
-                response = requests.get('https://%s%s' % (creds["idrac_ip"], response.headers['Location']), verify=creds["verify_cert"],auth=(creds["idrac_username"], creds["idrac_password"]))
+                response = session.client.get('https://%s%s' % (session.creds["idrac_ip"], response.headers['Location']), verify=session.creds["verify_cert"],auth=(session.creds["idrac_username"], session.creds["idrac_password"]))
             export_filename = "bootlogs.zip"    
             with open(export_filename, "wb") as output:
                 output.write(response.content)
@@ -3420,14 +4375,15 @@ def export_server_video_log(script_examples="", file_type=""):
 
 def export_server_thermal_history(script_examples="", get_supported_share_types="", export_thermal_history="", share_ip="", share_type="", share_name="", share_username="", share_password="", filename="", file_type=""):
     """Function to export server thermal history to a network share. Supported function arguments: get_supported_share_types (possible value: True), export_thermal_history (possible value: True), share_type, share_ip, share_name, share_username (required for CIFS only), share_userpassword (required for CIFS only), filename (pass in unique failename), file_type (pass in file type for exported file, either CSV or XML."""
+    session = get_script_session()
     if script_examples:
         print("""\n- IdracRedfishSupport.export_server_thermal_history(get_supported_share_types=True), this example will get supported share types for export.
         \n- IdracRedfishSupport.export_server_thermal_history(export_thermal_history=True, share_ip="192.168.0.130", share_type="NFS", share_name="/nfs", filename="r740_thermal_history.csv", file_type="CSV"), this example will export thermal history to NFS share in CSV file format.""")
     elif get_supported_share_types:
-        if x_auth_token == "yes":
-            response = requests.get('https://%s/redfish/v1/Dell/Systems/System.Embedded.1/DellMetricService' % (creds["idrac_ip"]),verify=creds["verify_cert"],headers={'X-Auth-Token': creds["idrac_x_auth_token"]})    
+        if session.x_auth_token == "yes":
+            response = session.client.get('https://%s/redfish/v1/Dell/Systems/System.Embedded.1/DellMetricService' % (session.creds["idrac_ip"]),verify=session.creds["verify_cert"],headers={'X-Auth-Token': session.creds["idrac_x_auth_token"]})    
         else:
-            response = requests.get('https://%s/redfish/v1/Dell/Systems/System.Embedded.1/DellMetricService' % (creds["idrac_ip"]),verify=creds["verify_cert"],auth=(creds["idrac_username"], creds["idrac_password"]))
+            response = session.client.get('https://%s/redfish/v1/Dell/Systems/System.Embedded.1/DellMetricService' % (session.creds["idrac_ip"]),verify=session.creds["verify_cert"],auth=(session.creds["idrac_username"], session.creds["idrac_password"]))
         data = response.json()
         if response.status_code == 401:
             logging.error("- ERROR, status code 401 detected, check to make sure your iDRAC script session has correct username/password credentials or if using X-auth token, confirm the session is still active.")
@@ -3442,8 +4398,7 @@ def export_server_thermal_history(script_examples="", get_supported_share_types=
                 for ii in i[1]['ShareType@Redfish.AllowableValues']:
                     print(ii)
     elif export_thermal_history and share_ip and share_type and share_name:
-        global job_id
-        url = 'https://%s/redfish/v1/Dell/Systems/System.Embedded.1/DellMetricService/Actions/DellMetricService.ExportThermalHistory' % (creds["idrac_ip"])
+        url = 'https://%s/redfish/v1/Dell/Systems/System.Embedded.1/DellMetricService/Actions/DellMetricService.ExportThermalHistory' % (session.creds["idrac_ip"])
         method = "ExportThermalHistory"
         payload = {}
         if share_ip:
@@ -3460,12 +4415,12 @@ def export_server_thermal_history(script_examples="", get_supported_share_types=
             payload["UserName"] = share_username
         if share_password:
             payload["Password"] = share_password
-        if x_auth_token == "yes":
-            headers = {'content-type': 'application/json', 'X-Auth-Token': creds["idrac_x_auth_token"]}
-            response = requests.post(url, data=json.dumps(payload), headers=headers, verify=creds["verify_cert"])
+        if session.x_auth_token == "yes":
+            headers = {'content-type': 'application/json', 'X-Auth-Token': session.creds["idrac_x_auth_token"]}
+            response = session.client.post(url, data=json.dumps(payload), headers=headers, verify=session.creds["verify_cert"])
         else:
             headers = {'content-type': 'application/json'}
-            response = requests.post(url, data=json.dumps(payload), headers=headers, verify=creds["verify_cert"],auth=(creds["idrac_username"],creds["idrac_password"]))
+            response = session.client.post(url, data=json.dumps(payload), headers=headers, verify=session.creds["verify_cert"],auth=(session.creds["idrac_username"],session.creds["idrac_password"]))
         data = response.json()
         if response.status_code == 202:
             logging.info("\n- PASS: POST command passed for %s method, status code 202 returned" % method)
@@ -3475,17 +4430,18 @@ def export_server_thermal_history(script_examples="", get_supported_share_types=
             logging.error("\n- POST command failure results:\n %s" % data)
             return 
         try:
-            job_id = response.headers['Location'].split("/")[-1]
+            session.job_id = response.headers['Location'].split("/")[-1]
         except:
             logging.error("- FAIL, unable to find job ID in headers POST response, headers output is:\n%s" % response.headers)
             return
-        logging.info("- PASS, job ID %s successfuly created for %s method\n" % (job_id, method))
+        logging.info("- PASS, job ID %s successfuly created for %s method\n" % (session.job_id, method))
         start_time = datetime.now()
+        job_poller = JobPoller()
         while True:
-            if x_auth_token == "yes":
-                response = requests.get('https://%s/redfish/v1/Managers/iDRAC.Embedded.1/Jobs/%s' % (creds["idrac_ip"], job_id),verify=creds["verify_cert"],headers={'X-Auth-Token': creds["idrac_x_auth_token"]})    
+            if session.x_auth_token == "yes":
+                response = session.client.get('https://%s/redfish/v1/Managers/iDRAC.Embedded.1/Jobs/%s' % (session.creds["idrac_ip"], session.job_id),verify=session.creds["verify_cert"],headers={'X-Auth-Token': session.creds["idrac_x_auth_token"]})    
             else:
-                response = requests.get('https://%s/redfish/v1/Managers/iDRAC.Embedded.1/Jobs/%s' % (creds["idrac_ip"], job_id),verify=creds["verify_cert"],auth=(creds["idrac_username"], creds["idrac_password"]))
+                response = session.client.get('https://%s/redfish/v1/Managers/iDRAC.Embedded.1/Jobs/%s' % (session.creds["idrac_ip"], session.job_id),verify=session.creds["verify_cert"],auth=(session.creds["idrac_username"], session.creds["idrac_password"]))
             current_time=(datetime.now()-start_time)
             if response.status_code != 200:
                 logging.error("\n- FAIL, Command failed to check job status, return code %s" % response.status_code)
@@ -3496,7 +4452,7 @@ def export_server_thermal_history(script_examples="", get_supported_share_types=
                 logging.error("\n- FAIL: Timeout of 5 minutes has been hit, script stopped\n")
                 return
             elif "Fail" in data['Message'] or "fail" in data['Message'] or data['JobState'] == "Failed" or "Unable" in data['Message']:
-                logging.error("- FAIL: job ID %s failed, failed message is: %s" % (job_id, data['Message']))
+                logging.error("- FAIL: job ID %s failed, failed message is: %s" % (session.job_id, data['Message']))
                 return
             elif data['JobState'] == "Completed":
                 if data['Message'] == "The command was successful":
@@ -3509,30 +4465,30 @@ def export_server_thermal_history(script_examples="", get_supported_share_types=
                 break
             else:
                 logging.info("- INFO, job state not marked completed, current job status is running, polling again")
-                time.sleep(5)
+                job_poller.wait(response=response, data=data)
     else:
         logging.warning("- WARNING, missing arguments or incorrect argument values passed in. Check help text and script examples for more details")
         return
 
 def convert_drives_RAID(script_examples="", drives=""):
     """Function to convert drives from non RAID(non ready) to RAID(ready) state. Supported function argument: drives (possible values: pass in one more multiple disk FQDDs. If passing in multiple disk FQDDs, use comma separator)."""
-    global job_id
+    session = get_script_session()
     if script_examples:
         print("""\n- IdracRedfishSupport.convert_drives_RAID(drives="Disk.Bay.2:Enclosure.Internal.0-1,Disk.Bay.3:Enclosure.Internal.0-1"), this example shows converting multiple drives to RAID(ready) state.""")
     elif drives:
         method = "ConvertToRAID"
-        url = 'https://%s/redfish/v1/Dell/Systems/System.Embedded.1/DellRaidService/Actions/DellRaidService.ConvertToRAID' % (creds["idrac_ip"])
+        url = 'https://%s/redfish/v1/Dell/Systems/System.Embedded.1/DellRaidService/Actions/DellRaidService.ConvertToRAID' % (session.creds["idrac_ip"])
         if "," in drives:
             convert_drives = drives.split(",")
         else:
             convert_drives = [drives]
         payload={"PDArray": convert_drives}
-        if x_auth_token == "yes":
-            headers = {'content-type': 'application/json', 'X-Auth-Token': creds["idrac_x_auth_token"]}
-            response = requests.post(url, data=json.dumps(payload), headers=headers, verify=creds["verify_cert"])
+        if session.x_auth_token == "yes":
+            headers = {'content-type': 'application/json', 'X-Auth-Token': session.creds["idrac_x_auth_token"]}
+            response = session.client.post(url, data=json.dumps(payload), headers=headers, verify=session.creds["verify_cert"])
         else:
             headers = {'content-type': 'application/json'}
-            response = requests.post(url, data=json.dumps(payload), headers=headers, verify=creds["verify_cert"],auth=(creds["idrac_username"],creds["idrac_password"]))
+            response = session.client.post(url, data=json.dumps(payload), headers=headers, verify=session.creds["verify_cert"],auth=(session.creds["idrac_username"],session.creds["idrac_password"]))
         data = response.json()
         if response.status_code == 401:
             logging.error("- ERROR, status code 401 detected, check to make sure your iDRAC script session has correct username/password credentials or if using X-auth token, confirm the session is still active.")
@@ -3540,11 +4496,11 @@ def convert_drives_RAID(script_examples="", drives=""):
         elif response.status_code == 200 or response.status_code == 202:
             logging.info("\n- PASS: POST command passed for %s, status code %s returned" % (method, response.status_code))
             try:
-                job_id = response.headers['Location'].split("/")[-1]
+                session.job_id = response.headers['Location'].split("/")[-1]
             except:
                 logging.error("- FAIL, unable to locate job ID in JSON headers output")
                 return
-            logging.info("- Job ID %s successfully created for storage method \"%s\"" % (job_id, method))
+            logging.info("- Job ID %s successfully created for storage method \"%s\"" % (session.job_id, method))
             loop_job_status_final()
         else:
             logging.error("\n- FAIL, POST command failed for %s, status code %s returned" % (method, response.status_code))
@@ -3557,23 +4513,23 @@ def convert_drives_RAID(script_examples="", drives=""):
 
 def convert_drives_nonRAID(script_examples="", drives=""):
     """Function to convert drives from RAID(ready) to non RAID(not ready) state. Support function argument: drives (possible values: pass in one more multiple disk FQDDs. If passing in multiple disk FQDDs, use comma separator)."""
-    global job_id
+    session = get_script_session()
     if script_examples:
         print("""\n- IdracRedfishSupport.convert_drives_nonRAID(drives="Disk.Bay.2:Enclosure.Internal.0-1,Disk.Bay.3:Enclosure.Internal.0-1"), this example shows converting multiple drives to nonRAID(not ready) state.""")
     elif drives:
         method = "ConvertToNonRAID"
-        url = 'https://%s/redfish/v1/Dell/Systems/System.Embedded.1/DellRaidService/Actions/DellRaidService.ConvertToNonRAID' % (creds["idrac_ip"])
+        url = 'https://%s/redfish/v1/Dell/Systems/System.Embedded.1/DellRaidService/Actions/DellRaidService.ConvertToNonRAID' % (session.creds["idrac_ip"])
         if "," in drives:
             convert_drives = drives.split(",")
         else:
             convert_drives = [drives]
         payload={"PDArray": convert_drives}
-        if x_auth_token == "yes":
-            headers = {'content-type': 'application/json', 'X-Auth-Token': creds["idrac_x_auth_token"]}
-            response = requests.post(url, data=json.dumps(payload), headers=headers, verify=creds["verify_cert"])
+        if session.x_auth_token == "yes":
+            headers = {'content-type': 'application/json', 'X-Auth-Token': session.creds["idrac_x_auth_token"]}
+            response = session.client.post(url, data=json.dumps(payload), headers=headers, verify=session.creds["verify_cert"])
         else:
             headers = {'content-type': 'application/json'}
-            response = requests.post(url, data=json.dumps(payload), headers=headers, verify=creds["verify_cert"],auth=(creds["idrac_username"],creds["idrac_password"]))
+            response = session.client.post(url, data=json.dumps(payload), headers=headers, verify=session.creds["verify_cert"],auth=(session.creds["idrac_username"],session.creds["idrac_password"]))
         data = response.json()
         if response.status_code == 401:
             logging.error("- ERROR, status code 401 detected, check to make sure your iDRAC script session has correct username/password credentials or if using X-auth token, confirm the session is still active.")
@@ -3581,11 +4537,11 @@ def convert_drives_nonRAID(script_examples="", drives=""):
         elif response.status_code == 200 or response.status_code == 202:
             logging.info("\n- PASS: POST command passed for %s, status code %s returned" % (method, response.status_code))
             try:
-                job_id = response.headers['Location'].split("/")[-1]
+                session.job_id = response.headers['Location'].split("/")[-1]
             except:
                 logging.error("- FAIL, unable to locate job ID in JSON headers output")
                 return
-            logging.info("- Job ID %s successfully created for storage method \"%s\"" % (job_id, method))
+            logging.info("- Job ID %s successfully created for storage method \"%s\"" % (session.job_id, method))
             loop_job_status_final()
         else:
             logging.error("\n- FAIL, POST command failed for %s, status code %s returned" % (method, response.status_code))
@@ -3598,20 +4554,21 @@ def convert_drives_nonRAID(script_examples="", drives=""):
     
 def export_clear_serial_datalogs(script_examples="", enable_capture_serial="", export_serial_data="", clear_serial_data="", disable_capture_serial=""):
     """Function to either enable serial data capture, export serial data or clear serial data. NOTE: This feature requires iDRAC Datacenter license. Supported function arguments: enable_capture_serial (possible value: True), export_serial_data (possible value: True), clear_serial_data (possible value: True), disable_capture_serial (possible value: True)."""
+    session = get_script_session()
     if script_examples:
         print("""\n- IdracRedfishSupport.export_clear_serial_datalogs(enable_capture_serial=True), this example shows enabling serial capture for iDRAC.
         \n- IdracRedfishSupport.export_clear_serial_datalogs(export_serial_data=True), this example shows export iDRAC captured serial data.
         \n- IdracRedfishSupport.export_clear_serial_datalogs(clear_serial_data=True), this example show clearing iDRAC cached serial data.
         \n- IdracRedfishSupport.export_clear_serial_datalogs(disabled_capture_data=True), this example shows disabling iDRAC serial capture feature.""")
     elif enable_capture_serial:
-        url = 'https://%s/redfish/v1/Managers/iDRAC.Embedded.1/Attributes' % creds["idrac_ip"]
+        url = 'https://%s/redfish/v1/Managers/iDRAC.Embedded.1/Attributes' % session.creds["idrac_ip"]
         payload = {"Attributes":{"SerialCapture.1.Enable":"Enabled","Serial.1.Enable":"Enabled"}}
-        if x_auth_token == "yes":
-            headers = {'content-type': 'application/json', 'X-Auth-Token': creds["idrac_x_auth_token"]}
-            response = requests.patch(url, data=json.dumps(payload), headers=headers, verify=creds["verify_cert"])
+        if session.x_auth_token == "yes":
+            headers = {'content-type': 'application/json', 'X-Auth-Token': session.creds["idrac_x_auth_token"]}
+            response = session.client.patch(url, data=json.dumps(payload), headers=headers, verify=session.creds["verify_cert"])
         else:
             headers = {'content-type': 'application/json'}
-            response = requests.patch(url, data=json.dumps(payload), headers=headers, verify=creds["verify_cert"],auth=(creds["idrac_username"],creds["idrac_password"]))
+            response = session.client.patch(url, data=json.dumps(payload), headers=headers, verify=session.creds["verify_cert"],auth=(session.creds["idrac_username"],session.creds["idrac_password"]))
         data = response.json()
         if response.status_code == 401:
             logging.error("- ERROR, status code 401 detected, check to make sure your iDRAC script session has correct username/password credentials or if using X-auth token, confirm the session is still active.")
@@ -3629,14 +4586,14 @@ def export_clear_serial_datalogs(script_examples="", enable_capture_serial="", e
             return
     elif export_serial_data:
         method = "SerialDataExport"
-        url = 'https://%s/redfish/v1/Managers/iDRAC.Embedded.1/SerialInterfaces/Serial.1/Actions/Oem/DellSerialInterface.SerialDataExport' % (creds["idrac_ip"])
+        url = 'https://%s/redfish/v1/Managers/iDRAC.Embedded.1/SerialInterfaces/Serial.1/Actions/Oem/DellSerialInterface.SerialDataExport' % (session.creds["idrac_ip"])
         payload={}
-        if x_auth_token == "yes":
-            headers = {'content-type': 'application/json', 'X-Auth-Token': creds["idrac_x_auth_token"]}
-            response = requests.post(url, data=json.dumps(payload), headers=headers, verify=creds["verify_cert"])
+        if session.x_auth_token == "yes":
+            headers = {'content-type': 'application/json', 'X-Auth-Token': session.creds["idrac_x_auth_token"]}
+            response = session.client.post(url, data=json.dumps(payload), headers=headers, verify=session.creds["verify_cert"])
         else:
             headers = {'content-type': 'application/json'}
-            response = requests.post(url, data=json.dumps(payload), headers=headers, verify=creds["verify_cert"],auth=(creds["idrac_username"],creds["idrac_password"]))
+            response = session.client.post(url, data=json.dumps(payload), headers=headers, verify=session.creds["verify_cert"],auth=(session.creds["idrac_username"],session.creds["idrac_password"]))
         if response.status_code == 200:
             logging.info("\n- PASS: POST command passed for %s method, status code %s returned" % (method, response.status_code))
         else:
@@ -3662,14 +4619,14 @@ def export_clear_serial_datalogs(script_examples="", enable_capture_serial="", e
         logging.info("- INFO, Exported serial logs captured to file \"%s\\%s\"" % (os.getcwd(), "serial_data_logs.txt"))
     elif clear_serial_data:
         method = "SerialDataClear"
-        url = 'https://%s/redfish/v1/Managers/iDRAC.Embedded.1/SerialInterfaces/Serial.1/Actions/Oem/DellSerialInterface.SerialDataClear' % (creds["idrac_ip"])
+        url = 'https://%s/redfish/v1/Managers/iDRAC.Embedded.1/SerialInterfaces/Serial.1/Actions/Oem/DellSerialInterface.SerialDataClear' % (session.creds["idrac_ip"])
         payload={}
-        if x_auth_token == "yes":
-            headers = {'content-type': 'application/json', 'X-Auth-Token': creds["idrac_x_auth_token"]}
-            response = requests.post(url, data=json.dumps(payload), headers=headers, verify=creds["verify_cert"])
+        if session.x_auth_token == "yes":
+            headers = {'content-type': 'application/json', 'X-Auth-Token': session.creds["idrac_x_auth_token"]}
+            response = session.client.post(url, data=json.dumps(payload), headers=headers, verify=session.creds["verify_cert"])
         else:
             headers = {'content-type': 'application/json'}
-            response = requests.post(url, data=json.dumps(payload), headers=headers, verify=creds["verify_cert"],auth=(creds["idrac_username"],creds["idrac_password"]))
+            response = session.client.post(url, data=json.dumps(payload), headers=headers, verify=session.creds["verify_cert"],auth=(session.creds["idrac_username"],session.creds["idrac_password"]))
         if response.status_code == 204:
             logging.info("\n- PASS: POST command passed for %s method, status code %s returned" % (method, response.status_code))
         else:
@@ -3677,14 +4634,14 @@ def export_clear_serial_datalogs(script_examples="", enable_capture_serial="", e
             logging.error("\n- POST command failure results:\n %s" % response.__dict__)
             return
     elif disable_capture_serial:
-        url = 'https://%s/redfish/v1/Managers/iDRAC.Embedded.1/Attributes' % creds["idrac_ip"]
+        url = 'https://%s/redfish/v1/Managers/iDRAC.Embedded.1/Attributes' % session.creds["idrac_ip"]
         payload = {"Attributes":{"SerialCapture.1.Enable":"Disabled"}}
-        if x_auth_token == "yes":
-            headers = {'content-type': 'application/json', 'X-Auth-Token': creds["idrac_x_auth_token"]}
-            response = requests.patch(url, data=json.dumps(payload), headers=headers, verify=creds["verify_cert"])
+        if session.x_auth_token == "yes":
+            headers = {'content-type': 'application/json', 'X-Auth-Token': session.creds["idrac_x_auth_token"]}
+            response = session.client.patch(url, data=json.dumps(payload), headers=headers, verify=session.creds["verify_cert"])
         else:
             headers = {'content-type': 'application/json'}
-            response = requests.patch(url, data=json.dumps(payload), headers=headers, verify=creds["verify_cert"],auth=(creds["idrac_username"],creds["idrac_password"]))
+            response = session.client.patch(url, data=json.dumps(payload), headers=headers, verify=session.creds["verify_cert"],auth=(session.creds["idrac_username"],session.creds["idrac_password"]))
         data = response.json()
         if response.status_code == 200:
             logging.info("\n- PASS, PATCH command passed to successfully disable attribute for serial data capture, status code %s returned\n" % response.status_code)
@@ -3701,19 +4658,20 @@ def export_clear_serial_datalogs(script_examples="", enable_capture_serial="", e
 
 def supportassist_status_accept_EULA(script_examples="", get_EULA_status="", accept_EULA=""):
     """Function to manage SupportAssist End User License Agreement (EULA). Supported function arguments: get_EULA_status (supported value: True) and accept_EULA (supported value: True)"""
+    session = get_script_session()
     if script_examples:
         print("""\n- IdracRedfishSupport.supportassist_status_accept_EULA(get_EULA_status=True), this example will get current SupportAssist EULA status.
         \n- IdracRedfishSupport.supportassist_status_accept_EULA(accept_EULA=True), this example will accept SupportAssist EULA.""")
     elif accept_EULA:
-        url = 'https://%s/redfish/v1/Dell/Managers/iDRAC.Embedded.1/DellLCService/Actions/DellLCService.SupportAssistAcceptEULA' % (creds["idrac_ip"])
+        url = 'https://%s/redfish/v1/Dell/Managers/iDRAC.Embedded.1/DellLCService/Actions/DellLCService.SupportAssistAcceptEULA' % (session.creds["idrac_ip"])
         method = "SupportAssistAcceptEULA"
         payload = {}
-        if x_auth_token == "yes":
-            headers = {'content-type': 'application/json', 'X-Auth-Token': creds["idrac_x_auth_token"]}
-            response = requests.post(url, data=json.dumps(payload), headers=headers, verify=creds["verify_cert"])
+        if session.x_auth_token == "yes":
+            headers = {'content-type': 'application/json', 'X-Auth-Token': session.creds["idrac_x_auth_token"]}
+            response = session.client.post(url, data=json.dumps(payload), headers=headers, verify=session.creds["verify_cert"])
         else:
             headers = {'content-type': 'application/json'}
-            response = requests.post(url, data=json.dumps(payload), headers=headers, verify=creds["verify_cert"],auth=(creds["idrac_username"],creds["idrac_password"]))
+            response = session.client.post(url, data=json.dumps(payload), headers=headers, verify=session.creds["verify_cert"],auth=(session.creds["idrac_username"],session.creds["idrac_password"]))
         data = response.json()
         if response.status_code == 401:
             logging.error("- ERROR, status code 401 detected, check to make sure your iDRAC script session has correct username/password credentials or if using X-auth token, confirm the session is still active.")
@@ -3725,15 +4683,15 @@ def supportassist_status_accept_EULA(script_examples="", get_EULA_status="", acc
             logging.error("\n- FAIL, status code %s returned, detailed error information:\n %s" % (response.status_code, data))
             return
     elif get_EULA_status:
-        url = 'https://%s/redfish/v1/Dell/Managers/iDRAC.Embedded.1/DellLCService/Actions/DellLCService.SupportAssistGetEULAStatus' % (creds["idrac_ip"])
+        url = 'https://%s/redfish/v1/Dell/Managers/iDRAC.Embedded.1/DellLCService/Actions/DellLCService.SupportAssistGetEULAStatus' % (session.creds["idrac_ip"])
         method = "SupportAssistGetEULAStatus"
         payload = {}
-        if x_auth_token == "yes":
-            headers = {'content-type': 'application/json', 'X-Auth-Token': creds["idrac_x_auth_token"]}
-            response = requests.post(url, data=json.dumps(payload), headers=headers, verify=creds["verify_cert"])
+        if session.x_auth_token == "yes":
+            headers = {'content-type': 'application/json', 'X-Auth-Token': session.creds["idrac_x_auth_token"]}
+            response = session.client.post(url, data=json.dumps(payload), headers=headers, verify=session.creds["verify_cert"])
         else:
             headers = {'content-type': 'application/json'}
-            response = requests.post(url, data=json.dumps(payload), headers=headers, verify=creds["verify_cert"],auth=(creds["idrac_username"],creds["idrac_password"]))
+            response = session.client.post(url, data=json.dumps(payload), headers=headers, verify=session.creds["verify_cert"],auth=(session.creds["idrac_username"],session.creds["idrac_password"]))
         data = response.json()
         if response.status_code == 401:
             logging.error("- ERROR, status code 401 detected, check to make sure your iDRAC script session has correct username/password credentials or if using X-auth token, confirm the session is still active.")
@@ -3754,18 +4712,19 @@ def supportassist_status_accept_EULA(script_examples="", get_EULA_status="", acc
 
 def supportassist_register(script_examples="", get_register_status="", register="", city="", companyname="", country="", email="", firstname="", lastname="", phonenumber="", state="", street="", zipcode=""):
     """Function to register SupportAssist, either get current register status or register SupportAssist. Supported function arguments: get_register_status (supported value: True), register (supported value: True), city, companyname, country, email (optional for register), firstname, lastname, phonenumber, state, street and zipcode."""
+    session = get_script_session()
     if script_examples:
         print("""\n- IdracRedfishSupport.supportassist_register(get_register_status=True), this example shows getting SupportAssist register status.
         \n- IdracRedfishSupport.supportassist_register(register=True, city="Austin", companyname="Dell Inc", country="US",email="test@dell.com", firstname="lab", lastname="tester", phonenumber="512-123-1234", state="Texas", street="1234 1st street", zipcode="78758"), this example shows registering SupportAssist feature.""")
     elif get_register_status:
-        url = 'https://%s/redfish/v1/Dell/Managers/iDRAC.Embedded.1/DellLCService/Actions/DellLCService.SupportAssistGetEULAStatus' % (creds["idrac_ip"])
+        url = 'https://%s/redfish/v1/Dell/Managers/iDRAC.Embedded.1/DellLCService/Actions/DellLCService.SupportAssistGetEULAStatus' % (session.creds["idrac_ip"])
         payload = {}
-        if x_auth_token == "yes":
-            headers = {'content-type': 'application/json', 'X-Auth-Token': creds["idrac_x_auth_token"]}
-            response = requests.post(url, data=json.dumps(payload), headers=headers, verify=creds["verify_cert"])
+        if session.x_auth_token == "yes":
+            headers = {'content-type': 'application/json', 'X-Auth-Token': session.creds["idrac_x_auth_token"]}
+            response = session.client.post(url, data=json.dumps(payload), headers=headers, verify=session.creds["verify_cert"])
         else:
             headers = {'content-type': 'application/json'}
-            response = requests.post(url, data=json.dumps(payload), headers=headers, verify=creds["verify_cert"],auth=(creds["idrac_username"],creds["idrac_password"]))
+            response = session.client.post(url, data=json.dumps(payload), headers=headers, verify=session.creds["verify_cert"],auth=(session.creds["idrac_username"],session.creds["idrac_password"]))
         data = response.json()
         if response.status_code == 401:
             logging.error("- ERROR, status code 401 detected, check to make sure your iDRAC script session has correct username/password credentials or if using X-auth token, confirm the session is still active.")
@@ -3776,16 +4735,16 @@ def supportassist_register(script_examples="", get_register_status="", register=
             data = response.json()
             logging.error("\n- FAIL, status code %s returned, detailed error information:\n %s" % (response.status_code, data))
             return
-        logging.info("- INFO, current SupportAssist registered status for iDRAC %s: %s" % (creds["idrac_ip"], data["IsRegistered"]))     
+        logging.info("- INFO, current SupportAssist registered status for iDRAC %s: %s" % (session.creds["idrac_ip"], data["IsRegistered"]))     
     elif register and city and companyname and country and firstname and lastname and phonenumber and state and street and zipcode:            
-        url = 'https://%s/redfish/v1/Managers/iDRAC.Embedded.1/Attributes' % creds["idrac_ip"]
+        url = 'https://%s/redfish/v1/Managers/iDRAC.Embedded.1/Attributes' % session.creds["idrac_ip"]
         payload = {"Attributes":{"OS-BMC.1.AdminState":"Enabled"}}
-        if x_auth_token == "yes":
-            headers = {'content-type': 'application/json', 'X-Auth-Token': creds["idrac_x_auth_token"]}
-            response = requests.patch(url, data=json.dumps(payload), headers=headers, verify=creds["verify_cert"])
+        if session.x_auth_token == "yes":
+            headers = {'content-type': 'application/json', 'X-Auth-Token': session.creds["idrac_x_auth_token"]}
+            response = session.client.patch(url, data=json.dumps(payload), headers=headers, verify=session.creds["verify_cert"])
         else:
             headers = {'content-type': 'application/json'}
-            response = requests.patch(url, data=json.dumps(payload), headers=headers, verify=creds["verify_cert"],auth=(creds["idrac_username"],creds["idrac_password"]))
+            response = session.client.patch(url, data=json.dumps(payload), headers=headers, verify=session.creds["verify_cert"],auth=(session.creds["idrac_username"],session.creds["idrac_password"]))
         data = response.json()
         if response.status_code == 401:
             logging.error("- ERROR, status code 401 detected, check to make sure your iDRAC script session has correct username/password credentials or if using X-auth token, confirm the session is still active.")
@@ -3796,18 +4755,18 @@ def supportassist_register(script_examples="", get_register_status="", register=
             logging.error("\n- FAIL, POST command failed, status code %s returned" % response.status_code)
             logging.error("Extended Info Message: {0}".format(response.json()))
             return
-        url = 'https://%s/redfish/v1/Dell/Managers/iDRAC.Embedded.1/DellLCService/Actions/DellLCService.SupportAssistRegister' % (creds["idrac_ip"])
+        url = 'https://%s/redfish/v1/Dell/Managers/iDRAC.Embedded.1/DellLCService/Actions/DellLCService.SupportAssistRegister' % (session.creds["idrac_ip"])
         method = "SupportAssistRegister"
         payload = {"City":city, "CompanyName":companyname, "Country":country, "PrimaryEmail":email, "PrimaryFirstName":firstname, "PrimaryLastName":lastname, "PrimaryPhoneNumber":phonenumber, "State":state, "Street1": street,"Zip":zipcode}
         print("\n- Parameters passed in for SupportAssistRegister action -\n")
         for i in payload.items():
             print ("%s: %s" % (i[0], i[1]))
-        if x_auth_token == "yes":
-            headers = {'content-type': 'application/json', 'X-Auth-Token': creds["idrac_x_auth_token"]}
-            response = requests.post(url, data=json.dumps(payload), headers=headers, verify=creds["verify_cert"])
+        if session.x_auth_token == "yes":
+            headers = {'content-type': 'application/json', 'X-Auth-Token': session.creds["idrac_x_auth_token"]}
+            response = session.client.post(url, data=json.dumps(payload), headers=headers, verify=session.creds["verify_cert"])
         else:
             headers = {'content-type': 'application/json'}
-            response = requests.post(url, data=json.dumps(payload), headers=headers, verify=creds["verify_cert"],auth=(creds["idrac_username"],creds["idrac_password"]))
+            response = session.client.post(url, data=json.dumps(payload), headers=headers, verify=session.creds["verify_cert"],auth=(session.creds["idrac_username"],session.creds["idrac_password"]))
         if response.status_code == 200 or response.status_code == 202:
             logging.info("\n- PASS, SupportAssistRegister action passed, status code %s returned" % response.status_code)
         else:
@@ -3821,15 +4780,16 @@ def supportassist_register(script_examples="", get_register_status="", register=
     
 def export_support_assist_collection(script_examples="", get_supported_share_types="", export_collection="", share_ip="", share_type="", share_name="", share_username="", share_password="", filter_pii="", data_selector=""):
     """Function to export SupportAssist collection either locally or to a network share. Supported function arguments: get_supported_share_types (supported value: True), export_collection (supported value: True), share_ip, share_type, share_name, share_username, share_password, filter_pii (supported values: No and Yes) and data_selector (supported values: DebugLogs, HWData, OSAppData, TTYLogs and TelemetryReports. You can pass in one or multiple values. If passing in multiple, use a comma separator. Supported values are also case sensitive)."""
+    session = get_script_session()
     if script_examples:
         print("""\n- IdracRedfishSupport.export_support_assist_collection(get_supported_share_types=True), this example shows getting supported share types for exporting SupportAssist collection.
         \n- IdracRedfishSupport.export_support_assist_collection(export_collection=True, share_type="Local",data_selector="HWData"), this example shows exporting SupportAssist collection locally.
         \n- IdracRedfishSupport.export_support_assist_collection(export_collection=True, share_type="NFS",data_selector="HWData,TTYLogs",share_name="/nfs",share_ip="192.168.0.130"), this example shows exporting SupportAssist collection to NFS share.""")
     elif get_supported_share_types:
-        if x_auth_token == "yes":
-            response = requests.get('https://%s/redfish/v1/Dell/Managers/iDRAC.Embedded.1/DellLCService' % (creds["idrac_ip"]),verify=creds["verify_cert"],headers={'X-Auth-Token': creds["idrac_x_auth_token"]})    
+        if session.x_auth_token == "yes":
+            response = session.client.get('https://%s/redfish/v1/Dell/Managers/iDRAC.Embedded.1/DellLCService' % (session.creds["idrac_ip"]),verify=session.creds["verify_cert"],headers={'X-Auth-Token': session.creds["idrac_x_auth_token"]})    
         else:
-            response = requests.get('https://%s/redfish/v1/Dell/Managers/iDRAC.Embedded.1/DellLCService' % (creds["idrac_ip"]),verify=creds["verify_cert"],auth=(creds["idrac_username"], creds["idrac_password"]))
+            response = session.client.get('https://%s/redfish/v1/Dell/Managers/iDRAC.Embedded.1/DellLCService' % (session.creds["idrac_ip"]),verify=session.creds["verify_cert"],auth=(session.creds["idrac_username"], session.creds["idrac_password"]))
         data = response.json()
         if response.status_code == 401:
             logging.error("- ERROR, status code 401 detected, check to make sure your iDRAC script session has correct username/password credentials or if using X-auth token, confirm the session is still active.")
@@ -3846,7 +4806,7 @@ def export_support_assist_collection(script_examples="", get_supported_share_typ
                 for ii in i[1]['ShareType@Redfish.AllowableValues']:
                     print(ii)
     elif export_collection and share_type:
-        url = 'https://%s/redfish/v1/Dell/Managers/iDRAC.Embedded.1/DellLCService/Actions/DellLCService.SupportAssistCollection' % (creds["idrac_ip"])
+        url = 'https://%s/redfish/v1/Dell/Managers/iDRAC.Embedded.1/DellLCService/Actions/DellLCService.SupportAssistCollection' % (session.creds["idrac_ip"])
         method = "SupportAssistCollection"    
         payload={}
         if filter_pii:
@@ -3870,12 +4830,12 @@ def export_support_assist_collection(script_examples="", get_supported_share_typ
                 payload["DataSelectorArrayIn"] = data_selector
             else:
                 payload["DataSelectorArrayIn"] = [data_selector]
-        if x_auth_token == "yes":
-            headers = {'content-type': 'application/json', 'X-Auth-Token': creds["idrac_x_auth_token"]}
-            response = requests.post(url, data=json.dumps(payload), headers=headers, verify=creds["verify_cert"])
+        if session.x_auth_token == "yes":
+            headers = {'content-type': 'application/json', 'X-Auth-Token': session.creds["idrac_x_auth_token"]}
+            response = session.client.post(url, data=json.dumps(payload), headers=headers, verify=session.creds["verify_cert"])
         else:
             headers = {'content-type': 'application/json'}
-            response = requests.post(url, data=json.dumps(payload), headers=headers, verify=creds["verify_cert"],auth=(creds["idrac_username"],creds["idrac_password"]))
+            response = session.client.post(url, data=json.dumps(payload), headers=headers, verify=session.creds["verify_cert"],auth=(session.creds["idrac_username"],session.creds["idrac_password"]))
         data = response.json()
         if response.status_code == 401:
             logging.error("- ERROR, status code 401 detected, check to make sure your iDRAC script session has correct username/password credentials or if using X-auth token, confirm the session is still active.")
@@ -3894,11 +4854,12 @@ def export_support_assist_collection(script_examples="", get_supported_share_typ
             return
         logging.info("- PASS, job ID %s successfuly created for %s method\n" % (job_id, method))
         start_time = datetime.now()
+        job_poller = JobPoller(job_type="SACollectExportHealthData")
         while True:
-            if x_auth_token == "yes":
-                response = requests.get('https://%s/redfish/v1/Managers/iDRAC.Embedded.1/Jobs/%s' % (creds["idrac_ip"], job_id),verify=creds["verify_cert"],headers={'X-Auth-Token': creds["idrac_x_auth_token"]})    
+            if session.x_auth_token == "yes":
+                response = session.client.get('https://%s/redfish/v1/Managers/iDRAC.Embedded.1/Jobs/%s' % (session.creds["idrac_ip"], job_id),verify=session.creds["verify_cert"],headers={'X-Auth-Token': session.creds["idrac_x_auth_token"]})    
             else:
-                response = requests.get('https://%s/redfish/v1/Managers/iDRAC.Embedded.1/Jobs/%s' % (creds["idrac_ip"], job_id),verify=creds["verify_cert"],auth=(creds["idrac_username"], creds["idrac_password"]))
+                response = session.client.get('https://%s/redfish/v1/Managers/iDRAC.Embedded.1/Jobs/%s' % (session.creds["idrac_ip"], job_id),verify=session.creds["verify_cert"],auth=(session.creds["idrac_username"], session.creds["idrac_password"]))
             current_time=(datetime.now()-start_time)
             if response.status_code != 200:
                 logging.error("\n- FAIL, Command failed to check job status, return code %s" % response.status_code)
@@ -3908,10 +4869,10 @@ def export_support_assist_collection(script_examples="", get_supported_share_typ
             try:
                 if response.headers['Location'] == "/redfish/v1/Dell/sacollect.zip" or response.headers['Location'] == "/redfish/v1/Oem/Dell/sacollect.zip":
                     logging.info("- PASS, job ID %s successfully marked completed" % job_id)
-                    if x_auth_token == "yes":
-                        response = requests.get('https://%s%s' % (creds["idrac_ip"], response.headers['Location']), verify=creds["verify_cert"], headers={'X-Auth-Token': creds["idrac_x_auth_token"]})   
+                    if session.x_auth_token == "yes":
+                        response = session.client.get('https://%s%s' % (session.creds["idrac_ip"], response.headers['Location']), verify=session.creds["verify_cert"], headers={'X-Auth-Token': session.creds["idrac_x_auth_token"]})   
                     else:
-                        response = requests.get('https://%s%s' % (creds["idrac_ip"], response.headers['Location']), verify=creds["verify_cert"],auth=(creds["idrac_username"], creds["idrac_password"]))
+                        response = session.client.get('https://%s%s' % (session.creds["idrac_ip"], response.headers['Location']), verify=session.creds["verify_cert"],auth=(session.creds["idrac_username"], session.creds["idrac_password"]))
                     SA_export_filename = "sacollect.zip"    
                     with open(SA_export_filename, "wb") as output:
                         output.write(response.content)
@@ -3941,34 +4902,34 @@ def export_support_assist_collection(script_examples="", get_supported_share_typ
                             pass
                         else:
                             print("%s: %s" % (i[0],i[1]))
-                    if x_auth_token == "yes":
-                        response = requests.get('https://%s/redfish/v1/Systems/System.Embedded.1' % (creds["idrac_ip"]),verify=creds["verify_cert"],headers={'X-Auth-Token': creds["idrac_x_auth_token"]})    
+                    if session.x_auth_token == "yes":
+                        response = session.client.get('https://%s/redfish/v1/Systems/System.Embedded.1' % (session.creds["idrac_ip"]),verify=session.creds["verify_cert"],headers={'X-Auth-Token': session.creds["idrac_x_auth_token"]})    
                     else:
-                        response = requests.get('https://%s/redfish/v1/Systems/System.Embedded.1' % (creds["idrac_ip"]),verify=creds["verify_cert"],auth=(creds["idrac_username"], creds["idrac_password"]))
+                        response = session.client.get('https://%s/redfish/v1/Systems/System.Embedded.1' % (session.creds["idrac_ip"]),verify=session.creds["verify_cert"],auth=(session.creds["idrac_username"], session.creds["idrac_password"]))
                     data = response.json()
                     service_tag = data['Oem']['Dell']['DellSystem']['NodeID']
                     logging.info("\n- SA exported log file located on your network share should be in ZIP format with server service tag \"%s\" in the file name" % service_tag)
                     break
                 else:
-                    logging.info("- INFO, job status not complete, check status again in 30 seconds")
-                    time.sleep(30)
+                    logging.info("- INFO, job status not complete, check status again")
+                    job_poller.wait(response=response, data=data)
     else:
         logging.warning("- WARNING, missing arguments or incorrect argument values passed in. Check help text and script examples for more details")
         return
     
 def firmware_update_multipart_upload(script_examples="", get_fw_inventory="", fw_image_path="", reboot=""):
     """Function to either get current firmware inventory or update firmware for one supported device. Supported function arguments: (get_fw_inventory (possible value: True), firmware_image_path (pass in the complete directory path with firmware image name. Firmware image must be Windows Dell Update Package EXE file) and reboot (supported values: yes and no). Reboot server is required for certain devices to apply the firmware (Examples: BIOS, NIC, PERC). Refer to iDRAC user guide update section for more details."""
-    global job_id
+    session = get_script_session()
     if script_examples:
         print("""\n- IdracRedfishSupport.firmware_update_multipart_upload(fw_image_path="C:\\Users\\administrator\\Downloads\\Diags_R650.EXE"), this example will update DIAGS. This device is an immediate update so no reboot argument is needed.
         \n- IdracRedfishSupport.firmware_update_multipart_upload(fw_image_path="C:\\Users\\administrator\\Downloads\\H745_A16.EXE",reboot="no"), this example shows updating H745 storage controller. Update job is scehduled but will not auto reboot. Update job will execute on next server manual reboot.
         \n- IdracRedfishSupport.firmware_update_multipart_upload(fw_image_path="C:\\Users\\administrator\\Downloads\\H745_A16.EXE",reboot="yes"), this example will reboot the server now to update H745 storage controller.""")
     elif get_fw_inventory:
-        logging.info("\n- INFO, getting current firmware inventory for iDRAC %s -\n" % creds["idrac_ip"])
-        if x_auth_token == "yes":
-            response = requests.get('https://%s/redfish/v1/UpdateService/FirmwareInventory?$expand=*($levels=1)' % creds["idrac_ip"],verify=creds["verify_cert"],headers={'X-Auth-Token': creds["idrac_x_auth_token"]})    
+        logging.info("\n- INFO, getting current firmware inventory for iDRAC %s -\n" % session.creds["idrac_ip"])
+        if session.x_auth_token == "yes":
+            response = session.client.get('https://%s/redfish/v1/UpdateService/FirmwareInventory?$expand=*($levels=1)' % session.creds["idrac_ip"],verify=session.creds["verify_cert"],headers={'X-Auth-Token': session.creds["idrac_x_auth_token"]})    
         else:
-            response = requests.get('https://%s/redfish/v1/UpdateService/FirmwareInventory?$expand=*($levels=1)' % creds["idrac_ip"],verify=creds["verify_cert"],auth=(creds["idrac_username"], creds["idrac_password"]))
+            response = session.client.get('https://%s/redfish/v1/UpdateService/FirmwareInventory?$expand=*($levels=1)' % session.creds["idrac_ip"],verify=session.creds["verify_cert"],auth=(session.creds["idrac_username"], session.creds["idrac_password"]))
         if response.status_code == 401:
             logging.error("- ERROR, status code 401 detected, check to make sure your iDRAC script session has correct username/password credentials or if using X-auth token, confirm the session is still active.")
             return
@@ -3985,7 +4946,7 @@ def firmware_update_multipart_upload(script_examples="", get_fw_inventory="", fw
     elif fw_image_path:
         start_time = datetime.now()
         print("\n- INFO, downloading update package to create update job, this may take a few minutes depending on firmware image size")
-        url = "https://%s/redfish/v1/UpdateService/MultipartUpload" % creds["idrac_ip"]
+        url = "https://%s/redfish/v1/UpdateService/MultipartUpload" % session.creds["idrac_ip"]
         if reboot.lower() == "yes":
             payload = {"Targets": [], "@Redfish.OperationApplyTime": "Immediate", "Oem": {}}
         elif reboot.lower() == "no":
@@ -3994,11 +4955,11 @@ def firmware_update_multipart_upload(script_examples="", get_fw_inventory="", fw
             payload = {"Targets": [], "@Redfish.OperationApplyTime": "OnReset", "Oem": {}}
         files = {"UpdateParameters": (None, json.dumps(payload), "application/json"),
              "UpdateFile": (os.path.basename(fw_image_path), open(fw_image_path, "rb"), "application/octet-stream")}
-        if x_auth_token == "yes":
-            headers = {'X-Auth-Token': creds["idrac_x_auth_token"]}
-            response = requests.post(url, files=files, headers=headers, verify=creds["verify_cert"])
+        if session.x_auth_token == "yes":
+            headers = {'X-Auth-Token': session.creds["idrac_x_auth_token"]}
+            response = session.client.post(url, files=files, headers=headers, verify=session.creds["verify_cert"])
         else:
-            response = requests.post(url, files=files, verify=creds["verify_cert"],auth=(creds["idrac_username"],creds["idrac_password"]))
+            response = session.client.post(url, files=files, verify=session.creds["verify_cert"],auth=(session.creds["idrac_username"],session.creds["idrac_password"]))
         if response.status_code == 401:
             logging.error("- ERROR, status code 401 detected, check to make sure your iDRAC script session has correct username/password credentials or if using X-auth token, confirm the session is still active.")
             return
@@ -4009,21 +4970,22 @@ def firmware_update_multipart_upload(script_examples="", get_fw_inventory="", fw
             logging.error("- FAIL, status code %s returned, detailed error: %s" % (response.status_code,data))
             return
         try:
-            job_id = response.headers['Location'].split("/")[-1]
+            session.job_id = response.headers['Location'].split("/")[-1]
         except:
             logging.error("- FAIL, unable to locate job ID in header")
             return
-        logging.info("- PASS, update job ID %s successfully created, script will now loop polling the job status\n" % job_id)
+        logging.info("- PASS, update job ID %s successfully created, script will now loop polling the job status\n" % session.job_id)
         retry_count = 1
+        job_poller = JobPoller(job_type="FirmwareUpdate")
         while True:
             if retry_count == 20:
                 logging.warning("- WARNING, GET command retry count of 20 has been reached, script will exit")
                 return
             try:
-                if x_auth_token == "yes":
-                    response = requests.get('https://%s/redfish/v1/TaskService/Tasks/%s' % (creds["idrac_ip"], job_id),verify=creds["verify_cert"],headers={'X-Auth-Token': creds["idrac_x_auth_token"]})    
+                if session.x_auth_token == "yes":
+                    response = session.client.get('https://%s/redfish/v1/TaskService/Tasks/%s' % (session.creds["idrac_ip"], session.job_id),verify=session.creds["verify_cert"],headers={'X-Auth-Token': session.creds["idrac_x_auth_token"]})    
                 else:
-                    response = requests.get('https://%s/redfish/v1/TaskService/Tasks/%s' % (creds["idrac_ip"], job_id),verify=creds["verify_cert"],auth=(creds["idrac_username"], creds["idrac_password"]))
+                    response = session.client.get('https://%s/redfish/v1/TaskService/Tasks/%s' % (session.creds["idrac_ip"], session.job_id),verify=session.creds["verify_cert"],auth=(session.creds["idrac_username"], session.creds["idrac_password"]))
             except requests.ConnectionError as error_message:
                 logging.info("- INFO, GET request failed due to connection error, retry")
                 time.sleep(10)
@@ -4039,7 +5001,7 @@ def firmware_update_multipart_upload(script_examples="", get_fw_inventory="", fw
                 logging.info("\n- INFO, job ID marked completed, detailed final job status results:\n")
                 for i in data['Oem']['Dell'].items():
                     print("%s: %s" % (i[0],i[1]))
-                logging.info("\n- JOB ID %s completed in %s" % (job_id, current_time))
+                logging.info("\n- JOB ID %s completed in %s" % (session.job_id, current_time))
                 return
             current_time = str(datetime.now()-start_time)[0:7]   
             data = response.json()
@@ -4066,11 +5028,11 @@ def firmware_update_multipart_upload(script_examples="", get_fw_inventory="", fw
                 logging.info("\n- PASS, job ID %s successfully marked completed, detailed final job status results:\n" % data["Id"])
                 for i in data['Oem']['Dell'].items():
                     print("%s: %s" % (i[0],i[1]))
-                logging.info("\n- %s completed in: %s" % (job_id, str(current_time)[0:7]))
+                logging.info("\n- %s completed in: %s" % (session.job_id, str(current_time)[0:7]))
                 break
             else:
                 logging.info("- INFO, job status: %s" % message_string[0]["Message"].rstrip("."))
-                time.sleep(1)
+                job_poller.wait(response=response, data=data)
                 continue
     else:
         logging.warning("- WARNING, missing arguments or incorrect argument values passed in. Check help text and script examples for more details")
@@ -4078,15 +5040,16 @@ def firmware_update_multipart_upload(script_examples="", get_fw_inventory="", fw
             
 def set_next_onetime_boot_device(script_examples="", get_supported_devices="", set_onetime_boot="", uefi_device_path="", get_uefi_device_paths="", reboot=""):
     """Function to either get supported onetime boot devices or set next onetime boot device. Supported function arguments: get_supported_devices (supported value: True), set_onetime_boot (pass in device string name and make sure to use exact case as returned from get_supported_devices), uefi_device_path (pass in uefi device target string), get_uefi_device_paths (supported value: True) and reboot (supported values: yes and no). If you do not reboot the now, onetime boot flag is still set and will boot to this device on next manual server reboot."""
+    session = get_script_session()
     if script_examples:
         print("""\n- IdracRedfishSupport.set_next_onetime_boot_device(get_supported_devices=True), this example will return supported devices for setting next onetime boot device along with current onetime boot setting.
         \n- IdracRedfishSupport.set_next_onetime_boot_device(set_onetime_boot="Cd", reboot="yes"), this example will set next onetime boot device to Cd and reboot the server now.
         \n- IdracRedfishSupport.set_next_onetime_boot_device(set_onetime_boot="UefiTarget", uefi_device_path="3A191845-5F86-4E78-8FCE-C4CFF59F9DAA", reboot="no"), this example will set next onetime boot to UEFI device target path. Server will not reboot now but flag is still set, onetime boot will occur on next server manual reboot.""")
     elif get_supported_devices:
-        if x_auth_token == "yes":
-            response = requests.get('https://%s/redfish/v1/Systems/System.Embedded.1' % creds["idrac_ip"],verify=creds["verify_cert"],headers={'X-Auth-Token': creds["idrac_x_auth_token"]})    
+        if session.x_auth_token == "yes":
+            response = session.client.get('https://%s/redfish/v1/Systems/System.Embedded.1' % session.creds["idrac_ip"],verify=session.creds["verify_cert"],headers={'X-Auth-Token': session.creds["idrac_x_auth_token"]})    
         else:
-            response = requests.get('https://%s/redfish/v1/Systems/System.Embedded.1' % creds["idrac_ip"],verify=creds["verify_cert"],auth=(creds["idrac_username"], creds["idrac_password"]))
+            response = session.client.get('https://%s/redfish/v1/Systems/System.Embedded.1' % session.creds["idrac_ip"],verify=session.creds["verify_cert"],auth=(session.creds["idrac_username"], session.creds["idrac_password"]))
         if response.status_code == 401:
             logging.error("- ERROR, status code 401 detected, check to make sure your iDRAC script session has correct username/password credentials or if using X-auth token, confirm the session is still active.")
             return
@@ -4103,10 +5066,10 @@ def set_next_onetime_boot_device(script_examples="", get_supported_devices="", s
         logging.info("\n- INFO, next server reboot onetime boot setting currently set to \"%s\"" % data['Boot']['BootSourceOverrideTarget'])
         return
     elif get_uefi_device_paths:
-        if x_auth_token == "yes":
-            response = requests.get('https://%s/redfish/v1/Systems/System.Embedded.1/BootOptions?$expand=*($levels=1)' % creds["idrac_ip"],verify=creds["verify_cert"],headers={'X-Auth-Token': creds["idrac_x_auth_token"]})    
+        if session.x_auth_token == "yes":
+            response = session.client.get('https://%s/redfish/v1/Systems/System.Embedded.1/BootOptions?$expand=*($levels=1)' % session.creds["idrac_ip"],verify=session.creds["verify_cert"],headers={'X-Auth-Token': session.creds["idrac_x_auth_token"]})    
         else:
-            response = requests.get('https://%s/redfish/v1/Systems/System.Embedded.1/BootOptions?$expand=*($levels=1)' % creds["idrac_ip"],verify=creds["verify_cert"],auth=(creds["idrac_username"], creds["idrac_password"]))
+            response = session.client.get('https://%s/redfish/v1/Systems/System.Embedded.1/BootOptions?$expand=*($levels=1)' % session.creds["idrac_ip"],verify=session.creds["verify_cert"],auth=(session.creds["idrac_username"], session.creds["idrac_password"]))
         if response.status_code == 401:
             logging.error("- ERROR, status code 401 detected, check to make sure your iDRAC script session has correct username/password credentials or if using X-auth token, confirm the session is still active.")
             return
@@ -4126,17 +5089,17 @@ def set_next_onetime_boot_device(script_examples="", get_supported_devices="", s
                     print("%s: %s" % (ii[0], ii[1]))
             print("\n")
     elif set_onetime_boot:
-        url = "https://%s/redfish/v1/Systems/System.Embedded.1" % creds["idrac_ip"]
+        url = "https://%s/redfish/v1/Systems/System.Embedded.1" % session.creds["idrac_ip"]
         if set_onetime_boot == "UefiTarget" and uefi_device_path:
           payload = {"Boot":{"BootSourceOverrideTarget":set_onetime_boot,"UefiTargetBootSourceOverride":uefi_device_path}}
         else:
           payload = {"Boot":{"BootSourceOverrideTarget":set_onetime_boot}}
-        if x_auth_token == "yes":
-            headers = {'content-type': 'application/json', 'X-Auth-Token': creds["idrac_x_auth_token"]}
-            response = requests.patch(url, data=json.dumps(payload), headers=headers, verify=creds["verify_cert"])
+        if session.x_auth_token == "yes":
+            headers = {'content-type': 'application/json', 'X-Auth-Token': session.creds["idrac_x_auth_token"]}
+            response = session.client.patch(url, data=json.dumps(payload), headers=headers, verify=session.creds["verify_cert"])
         else:
             headers = {'content-type': 'application/json'}
-            response = requests.patch(url, data=json.dumps(payload), headers=headers, verify=creds["verify_cert"],auth=(creds["idrac_username"],creds["idrac_password"]))
+            response = session.client.patch(url, data=json.dumps(payload), headers=headers, verify=session.creds["verify_cert"],auth=(session.creds["idrac_username"],session.creds["idrac_password"]))
         data = response.json()
         time.sleep(5)
         if response.status_code == 401:
@@ -4165,6 +5128,7 @@ def set_next_onetime_boot_device(script_examples="", get_supported_devices="", s
     
 def export_import_iDRAC_license(script_examples="", get_license_info="", get_network_share_types="", license_id="", export_license="", import_license="", delete_license="", share_ip="", share_type="", share_name="", share_username="", share_password="", license_filename="", ignore_certwarning=""):
     """Function to manage iDRAC licenses, either get license info, export/import license using local/network share or delete license. Supported function arguments: get_license_info (supported value: True), get_network_share_types (supported value: True), export_license (supported value: True). Note: Export locally, license will be in base64 string format. Export to network share, license will be in XML format., import_license (supported value: True). Note: If you import license locally, the license file must be either in base64 string format or XML extension. If you import from network share license must be in XML format, delete_license (supportd value: True), license_id (pass in license ID string which is needed for export and delete), share_ip, share_type, share_name, share_username (only required for CIFS and HTTP/HTTPS using auth), share_password (only required for CIFS and HTTP/HTTPS using auth), ignore_certwarning (only optional for HTTPS) and license_filename (required for import local, export to network share pass in an unique string name for the license file)."""
+    session = get_script_session()
     if script_examples:
         print("""\n- IdracRedfishSupport.export_import_iDRAC_license(get_license_info=True), this example will return installed iDRAC license details. Id details for each license will be returned which this Id will be needed for export or delete operations.
         \n- IdracRedfishSupport.export_import_iDRAC_license(get_network_share_types=True), this example will return supported network share types for export/import licenses.
@@ -4173,10 +5137,10 @@ def export_import_iDRAC_license(script_examples="", get_license_info="", get_net
         \n- IdracRedfishSupport.export_import_iDRAC_license(import_license=True, share_type="NFS", share_ip="192.168.0.121", share_name="/nfs",license_filename="iDRAC_Enterprise_license.xml"), this example will import iDRAC license from NFS share.
         \n- IdracRedfishSupport.export_import_iDRAC_license(license_id="FD00000021942269", delete_license=True), this example will delete iDRAC license with Id FD00000021942269.""")
     elif get_license_info:
-        if x_auth_token == "yes":
-            response = requests.get('https://%s/redfish/v1/Dell/Managers/iDRAC.Embedded.1/DellLicenseCollection' % creds["idrac_ip"],verify=creds["verify_cert"],headers={'X-Auth-Token': creds["idrac_x_auth_token"]})    
+        if session.x_auth_token == "yes":
+            response = session.client.get('https://%s/redfish/v1/Dell/Managers/iDRAC.Embedded.1/DellLicenseCollection' % session.creds["idrac_ip"],verify=session.creds["verify_cert"],headers={'X-Auth-Token': session.creds["idrac_x_auth_token"]})    
         else:
-            response = requests.get('https://%s/redfish/v1/Dell/Managers/iDRAC.Embedded.1/DellLicenseCollection' % creds["idrac_ip"],verify=creds["verify_cert"],auth=(creds["idrac_username"], creds["idrac_password"]))
+            response = session.client.get('https://%s/redfish/v1/Dell/Managers/iDRAC.Embedded.1/DellLicenseCollection' % session.creds["idrac_ip"],verify=session.creds["verify_cert"],auth=(session.creds["idrac_username"], session.creds["idrac_password"]))
         if response.status_code == 401:
             logging.error("- ERROR, status code 401 detected, check to make sure your iDRAC script session has correct username/password credentials or if using X-auth token, confirm the session is still active.")
             return
@@ -4185,17 +5149,17 @@ def export_import_iDRAC_license(script_examples="", get_license_info="", get_net
             return
         data = response.json()
         if data['Members'] == []:
-            logging.warning("\n- WARNING, no licenses detected for iDRAC %s" % creds["idrac_ip"])
+            logging.warning("\n- WARNING, no licenses detected for iDRAC %s" % session.creds["idrac_ip"])
         else:
-            print("\n- License(s) detected for iDRAC %s -\n" % creds["idrac_ip"])
+            print("\n- License(s) detected for iDRAC %s -\n" % session.creds["idrac_ip"])
             for i in (data['Members']):
                 pprint(i)
                 print("\n")
     elif get_network_share_types:
-        if x_auth_token == "yes":
-            response = requests.get('https://%s/redfish/v1/Dell/Managers/iDRAC.Embedded.1/DellLicenseManagementService' % creds["idrac_ip"],verify=creds["verify_cert"],headers={'X-Auth-Token': creds["idrac_x_auth_token"]})    
+        if session.x_auth_token == "yes":
+            response = session.client.get('https://%s/redfish/v1/Dell/Managers/iDRAC.Embedded.1/DellLicenseManagementService' % session.creds["idrac_ip"],verify=session.creds["verify_cert"],headers={'X-Auth-Token': session.creds["idrac_x_auth_token"]})    
         else:
-            response = requests.get('https://%s/redfish/v1/Dell/Managers/iDRAC.Embedded.1/DellLicenseManagementService' % creds["idrac_ip"],verify=creds["verify_cert"],auth=(creds["idrac_username"], creds["idrac_password"]))
+            response = session.client.get('https://%s/redfish/v1/Dell/Managers/iDRAC.Embedded.1/DellLicenseManagementService' % session.creds["idrac_ip"],verify=session.creds["verify_cert"],auth=(session.creds["idrac_username"], session.creds["idrac_password"]))
         if response.status_code == 401:
             logging.error("- ERROR, status code 401 detected, check to make sure your iDRAC script session has correct username/password credentials or if using X-auth token, confirm the session is still active.")
             return
@@ -4208,15 +5172,15 @@ def export_import_iDRAC_license(script_examples="", get_license_info="", get_net
             print(i)
         print("LOCAL")
     elif share_type.lower() == "local" and export_license and license_id:
-        url = 'https://%s/redfish/v1/Dell/Managers/iDRAC.Embedded.1/DellLicenseManagementService/Actions/DellLicenseManagementService.ExportLicense' % (creds["idrac_ip"])
+        url = 'https://%s/redfish/v1/Dell/Managers/iDRAC.Embedded.1/DellLicenseManagementService/Actions/DellLicenseManagementService.ExportLicense' % (session.creds["idrac_ip"])
         method = "ExportLicense"
         payload={"EntitlementID":license_id}
-        if x_auth_token == "yes":
-            headers = {'content-type': 'application/json', 'X-Auth-Token': creds["idrac_x_auth_token"]}
-            response = requests.post(url, data=json.dumps(payload), headers=headers, verify=creds["verify_cert"])
+        if session.x_auth_token == "yes":
+            headers = {'content-type': 'application/json', 'X-Auth-Token': session.creds["idrac_x_auth_token"]}
+            response = session.client.post(url, data=json.dumps(payload), headers=headers, verify=session.creds["verify_cert"])
         else:
             headers = {'content-type': 'application/json'}
-            response = requests.post(url, data=json.dumps(payload), headers=headers, verify=creds["verify_cert"],auth=(creds["idrac_username"],creds["idrac_password"]))
+            response = session.client.post(url, data=json.dumps(payload), headers=headers, verify=session.creds["verify_cert"],auth=(session.creds["idrac_username"],session.creds["idrac_password"]))
         data = response.json()
         if response.status_code == 401:
             logging.error("- ERROR, status code 401 detected, check to make sure your iDRAC script session has correct username/password credentials or if using X-auth token, confirm the session is still active.")
@@ -4247,14 +5211,14 @@ def export_import_iDRAC_license(script_examples="", get_license_info="", get_net
         else:
             read_file = filename_open.read()
         filename_open.close()
-        url = 'https://%s/redfish/v1/Dell/Managers/iDRAC.Embedded.1/DellLicenseManagementService/Actions/DellLicenseManagementService.ImportLicense' % (creds["idrac_ip"])
+        url = 'https://%s/redfish/v1/Dell/Managers/iDRAC.Embedded.1/DellLicenseManagementService/Actions/DellLicenseManagementService.ImportLicense' % (session.creds["idrac_ip"])
         payload = {"FQDD":"iDRAC.Embedded.1","ImportOptions":"Force","LicenseFile":read_file}
-        if x_auth_token == "yes":
-            headers = {'content-type': 'application/json', 'X-Auth-Token': creds["idrac_x_auth_token"]}
-            response = requests.post(url, data=json.dumps(payload), headers=headers, verify=creds["verify_cert"])
+        if session.x_auth_token == "yes":
+            headers = {'content-type': 'application/json', 'X-Auth-Token': session.creds["idrac_x_auth_token"]}
+            response = session.client.post(url, data=json.dumps(payload), headers=headers, verify=session.creds["verify_cert"])
         else:
             headers = {'content-type': 'application/json'}
-            response = requests.post(url, data=json.dumps(payload), headers=headers, verify=creds["verify_cert"],auth=(creds["idrac_username"],creds["idrac_password"]))
+            response = session.client.post(url, data=json.dumps(payload), headers=headers, verify=session.creds["verify_cert"],auth=(session.creds["idrac_username"],session.creds["idrac_password"]))
         if response.status_code == 401:
             logging.error("- ERROR, status code 401 detected, check to make sure your iDRAC script session has correct username/password credentials or if using X-auth token, confirm the session is still active.")
             return
@@ -4265,15 +5229,15 @@ def export_import_iDRAC_license(script_examples="", get_license_info="", get_net
             logging.error("\n- FAIL, unable to import license filename \"%s\", status code %s, error results: \n%s" % (license_filename, response.status_code, data))
             return
     elif delete_license and license_id:
-        url = 'https://%s/redfish/v1/Dell/Managers/iDRAC.Embedded.1/DellLicenseManagementService/Actions/DellLicenseManagementService.DeleteLicense' % (creds["idrac_ip"])
+        url = 'https://%s/redfish/v1/Dell/Managers/iDRAC.Embedded.1/DellLicenseManagementService/Actions/DellLicenseManagementService.DeleteLicense' % (session.creds["idrac_ip"])
         method = "DeleteLicense"
         payload={"EntitlementID":license_id,"DeleteOptions":"Force"}
-        if x_auth_token == "yes":
-            headers = {'content-type': 'application/json', 'X-Auth-Token': creds["idrac_x_auth_token"]}
-            response = requests.post(url, data=json.dumps(payload), headers=headers, verify=creds["verify_cert"])
+        if session.x_auth_token == "yes":
+            headers = {'content-type': 'application/json', 'X-Auth-Token': session.creds["idrac_x_auth_token"]}
+            response = session.client.post(url, data=json.dumps(payload), headers=headers, verify=session.creds["verify_cert"])
         else:
             headers = {'content-type': 'application/json'}
-            response = requests.post(url, data=json.dumps(payload), headers=headers, verify=creds["verify_cert"],auth=(creds["idrac_username"],creds["idrac_password"]))
+            response = session.client.post(url, data=json.dumps(payload), headers=headers, verify=session.creds["verify_cert"],auth=(session.creds["idrac_username"],session.creds["idrac_password"]))
         data = response.json()
         if response.status_code == 401:
             logging.error("- ERROR, status code 401 detected, check to make sure your iDRAC script session has correct username/password credentials or if using X-auth token, confirm the session is still active.")
@@ -4288,11 +5252,11 @@ def export_import_iDRAC_license(script_examples="", get_license_info="", get_net
     else:
         if export_license:
             method = "ExportLicenseToNetworkShare"
-            url = 'https://%s/redfish/v1/Dell/Managers/iDRAC.Embedded.1/DellLicenseManagementService/Actions/DellLicenseManagementService.ExportLicenseToNetworkShare' % (creds["idrac_ip"])
+            url = 'https://%s/redfish/v1/Dell/Managers/iDRAC.Embedded.1/DellLicenseManagementService/Actions/DellLicenseManagementService.ExportLicenseToNetworkShare' % (session.creds["idrac_ip"])
             payload = {"EntitlementID":license_id}
         elif import_license:
             method = "ImportLicenseFromNetworkShare"
-            url = 'https://%s/redfish/v1/Dell/Managers/iDRAC.Embedded.1/DellLicenseManagementService/Actions/DellLicenseManagementService.ImportLicenseFromNetworkShare' % (creds["idrac_ip"])
+            url = 'https://%s/redfish/v1/Dell/Managers/iDRAC.Embedded.1/DellLicenseManagementService/Actions/DellLicenseManagementService.ImportLicenseFromNetworkShare' % (session.creds["idrac_ip"])
             payload = {"FQDD":"iDRAC.Embedded.1","ImportOptions":"Force"}
         if license_filename:
             payload["LicenseName"] = license_filename
@@ -4308,12 +5272,12 @@ def export_import_iDRAC_license(script_examples="", get_license_info="", get_net
             payload["Password"] = share_password
         if ignore_certwarning:
             payload["IgnoreCertificateWarning"] = ignore_certwarning
-        if x_auth_token == "yes":
-            headers = {'content-type': 'application/json', 'X-Auth-Token': creds["idrac_x_auth_token"]}
-            response = requests.post(url, data=json.dumps(payload), headers=headers, verify=creds["verify_cert"])
+        if session.x_auth_token == "yes":
+            headers = {'content-type': 'application/json', 'X-Auth-Token': session.creds["idrac_x_auth_token"]}
+            response = session.client.post(url, data=json.dumps(payload), headers=headers, verify=session.creds["verify_cert"])
         else:
             headers = {'content-type': 'application/json'}
-            response = requests.post(url, data=json.dumps(payload), headers=headers, verify=creds["verify_cert"],auth=(creds["idrac_username"],creds["idrac_password"]))
+            response = session.client.post(url, data=json.dumps(payload), headers=headers, verify=session.creds["verify_cert"],auth=(session.creds["idrac_username"],session.creds["idrac_password"]))
         data = response.json()
         if response.status_code == 401:
             logging.error("- ERROR, status code 401 detected, check to make sure your iDRAC script session has correct username/password credentials or if using X-auth token, confirm the session is still active.")
@@ -4333,11 +5297,12 @@ def export_import_iDRAC_license(script_examples="", get_license_info="", get_net
         logging.info("- PASS, job ID %s successfuly created for %s method\n" % (job_id, method))
         start_time = datetime.now()
         time.sleep(3)
+        job_poller = JobPoller()
         while True:
-            if x_auth_token == "yes":
-                response = requests.get('https://%s/redfish/v1/Managers/iDRAC.Embedded.1/Jobs/%s' % (creds["idrac_ip"], job_id),verify=creds["verify_cert"],headers={'X-Auth-Token': creds["idrac_x_auth_token"]})    
+            if session.x_auth_token == "yes":
+                response = session.client.get('https://%s/redfish/v1/Managers/iDRAC.Embedded.1/Jobs/%s' % (session.creds["idrac_ip"], job_id),verify=session.creds["verify_cert"],headers={'X-Auth-Token': session.creds["idrac_x_auth_token"]})    
             else:
-                response = requests.get('https://%s/redfish/v1/Managers/iDRAC.Embedded.1/Jobs/%s' % (creds["idrac_ip"], job_id),verify=creds["verify_cert"],auth=(creds["idrac_username"], creds["idrac_password"]))
+                response = session.client.get('https://%s/redfish/v1/Managers/iDRAC.Embedded.1/Jobs/%s' % (session.creds["idrac_ip"], job_id),verify=session.creds["verify_cert"],auth=(session.creds["idrac_username"], session.creds["idrac_password"]))
             current_time=(datetime.now()-start_time)
             if response.status_code == 200:
                 logging.info("- PASS, GET command passed to get job status details")
@@ -4363,18 +5328,20 @@ def export_import_iDRAC_license(script_examples="", get_license_info="", get_net
                 break
             else:
                 logging.info("- INFO, job status not completed, current job status execution time: \"%s\"" % (str(current_time)[0:7]))
+                job_poller.wait(response=response, data=data)
                 
 def generate_replace_iDRAC_CSR(script_examples="", get_current_certs="", generate_CSR="", city="", state="", country="", common_name="", org="", orgunit="", email="", replace_CSR="", CSR_filename=""):
     """Function to either get current iDRAC certs or generate new CSR. Supported function arguments: get_current_certs (possible value: True), generate_CSR (possible value: True), city, state, country, common_name, org, orgunit, email (optional), replace_CSR (pass in the cert ID of the cert you want to replace. If needed, execute IdracRedfishSupport.generate_iDRAC_CSR(get_current_certs=True) to get the cert ID. Example: SecurityCertificate.1), CSR_filename (pass in name of signed CSR filename)."""
+    session = get_script_session()
     if script_examples:
         print("""\n- IdracRedfishSupport.generate_replace_iDRAC_CSR(get_current_certs=True), this example will return current iDRAC certificates.
         \n- IdracRedfishSupport.generate_replace_iDRAC_CSR(generate_CSR=True, city="Austin", state="Texas", country="US", email="tester@dell.com", org="PG", orgunit="test", common_name="product test"), this example shows generating new iDRAC CSR.
         \n- IdracRedfishSupport.generate_replace_iDRAC_CSR(replace_CSR="SecurityCertificate.1", CSR_filename="signed_CSR_cert.cer"), this example will replace cert Id SecurityCertificate.1 with new signed CSR cert file.""")
     elif get_current_certs:
-        if x_auth_token == "yes":
-            response = requests.get('https://%s/redfish/v1/Managers/iDRAC.Embedded.1/NetworkProtocol/HTTPS/Certificates' % creds["idrac_ip"], verify=creds["verify_cert"],headers={'X-Auth-Token': creds["idrac_x_auth_token"]})    
+        if session.x_auth_token == "yes":
+            response = session.client.get('https://%s/redfish/v1/Managers/iDRAC.Embedded.1/NetworkProtocol/HTTPS/Certificates' % session.creds["idrac_ip"], verify=session.creds["verify_cert"],headers={'X-Auth-Token': session.creds["idrac_x_auth_token"]})    
         else:
-            response = requests.get('https://%s/redfish/v1/Managers/iDRAC.Embedded.1/NetworkProtocol/HTTPS/Certificates' % creds["idrac_ip"], verify=creds["verify_cert"],auth=(creds["idrac_username"], creds["idrac_password"]))
+            response = session.client.get('https://%s/redfish/v1/Managers/iDRAC.Embedded.1/NetworkProtocol/HTTPS/Certificates' % session.creds["idrac_ip"], verify=session.creds["verify_cert"],auth=(session.creds["idrac_username"], session.creds["idrac_password"]))
         data = response.json()
         if response.status_code == 401:
             logging.error("- ERROR, status code 401 detected, check to make sure your iDRAC script session has correct username/password credentials or if using X-auth token, confirm the session is still active.")
@@ -4390,20 +5357,20 @@ def generate_replace_iDRAC_CSR(script_examples="", get_current_certs="", generat
             for i in data["Members"]:
                 for ii in i.items():
                     print("\n- Details for cert \"%s\"\n" % ii[1].split("/")[-1])
-                    if x_auth_token == "yes":
-                        response = requests.get('https://%s%s' % (creds["idrac_ip"], ii[1]), verify=creds["verify_cert"],headers={'X-Auth-Token': creds["idrac_x_auth_token"]})    
+                    if session.x_auth_token == "yes":
+                        response = session.client.get('https://%s%s' % (session.creds["idrac_ip"], ii[1]), verify=session.creds["verify_cert"],headers={'X-Auth-Token': session.creds["idrac_x_auth_token"]})    
                     else:
-                        response = requests.get('https://%s%s' % (creds["idrac_ip"], ii[1]), verify=creds["verify_cert"],auth=(creds["idrac_username"], creds["idrac_password"]))
+                        response = session.client.get('https://%s%s' % (session.creds["idrac_ip"], ii[1]), verify=session.creds["verify_cert"],auth=(session.creds["idrac_username"], session.creds["idrac_password"]))
                     data = response.json()
                     for i in data.items():
                         pprint(i)
                     print("\n")
     elif generate_CSR:
-        logging.info("\n- INFO, generating CSR for iDRAC %s, this may take a few seconds to complete\n" % creds["idrac_ip"])
-        if x_auth_token == "yes":
-            response = requests.get('https://%s/redfish/v1/Managers/iDRAC.Embedded.1?$select=FirmwareVersion' % creds["idrac_ip"], verify=creds["verify_cert"],headers={'X-Auth-Token': creds["idrac_x_auth_token"]})    
+        logging.info("\n- INFO, generating CSR for iDRAC %s, this may take a few seconds to complete\n" % session.creds["idrac_ip"])
+        if session.x_auth_token == "yes":
+            response = session.client.get('https://%s/redfish/v1/Managers/iDRAC.Embedded.1?$select=FirmwareVersion' % session.creds["idrac_ip"], verify=session.creds["verify_cert"],headers={'X-Auth-Token': session.creds["idrac_x_auth_token"]})    
         else:
-            response = requests.get('https://%s/redfish/v1/Managers/iDRAC.Embedded.1?$select=FirmwareVersion' % creds["idrac_ip"], verify=creds["verify_cert"],auth=(creds["idrac_username"], creds["idrac_password"]))
+            response = session.client.get('https://%s/redfish/v1/Managers/iDRAC.Embedded.1?$select=FirmwareVersion' % session.creds["idrac_ip"], verify=session.creds["verify_cert"],auth=(session.creds["idrac_username"], session.creds["idrac_password"]))
         data = response.json()
         if response.status_code == 401:
             logging.error("- ERROR, status code 401 detected, check to make sure your iDRAC script session has correct username/password credentials or if using X-auth token, confirm the session is still active.")
@@ -4411,29 +5378,29 @@ def generate_replace_iDRAC_CSR(script_examples="", get_current_certs="", generat
         elif response.status_code != 200:
             logging.warning("\n- WARNING, unable to get iDRAC version, status code %s detected, detailed error results: \n%s" % (response.status_code, data))
             return
-        url = 'https://%s/redfish/v1/CertificateService/Actions/CertificateService.GenerateCSR' % creds["idrac_ip"]
+        url = 'https://%s/redfish/v1/CertificateService/Actions/CertificateService.GenerateCSR' % session.creds["idrac_ip"]
         if int(data["FirmwareVersion"].replace(".","")) >= 5000000:
             payload = {"CertificateCollection":{"@odata.id":"/redfish/v1/Managers/iDRAC.Embedded.1/NetworkProtocol/HTTPS/Certificates"},"City":city,"CommonName":common_name,"Country":country,"Organization":org,"OrganizationalUnit":orgunit,"State":state}
         else:
             payload = {"CertificateCollection":"/redfish/v1/Managers/iDRAC.Embedded.1/NetworkProtocol/HTTPS/Certificates","City":city,"CommonName":common_name,"Country":country,"Organization":org,"OrganizationalUnit":orgunit,"State":state}   
         if email:
             payload["Email"] = email
-        if x_auth_token == "yes":
-            headers = {'content-type': 'application/json', 'X-Auth-Token': creds["idrac_x_auth_token"]}
-            response = requests.post(url, data=json.dumps(payload), headers=headers, verify=creds["verify_cert"])
+        if session.x_auth_token == "yes":
+            headers = {'content-type': 'application/json', 'X-Auth-Token': session.creds["idrac_x_auth_token"]}
+            response = session.client.post(url, data=json.dumps(payload), headers=headers, verify=session.creds["verify_cert"])
         else:
             headers = {'content-type': 'application/json'}
-            response = requests.post(url, data=json.dumps(payload), headers=headers, verify=creds["verify_cert"],auth=(creds["idrac_username"],creds["idrac_password"]))
+            response = session.client.post(url, data=json.dumps(payload), headers=headers, verify=session.creds["verify_cert"],auth=(session.creds["idrac_username"],session.creds["idrac_password"]))
         data_post = response.json()
         if response.status_code != 200:
             logging.error("- FAIL, generate CSR failed, status code %s returned, detailed error results: \n%s" % (response.status_code, data_post))
             return
-        logging.info("\n- INFO, CSR generated for iDRAC %s\n" % creds["idrac_ip"])
+        logging.info("\n- INFO, CSR generated for iDRAC %s\n" % session.creds["idrac_ip"])
         logging.info(data_post["CSRString"])
-        if x_auth_token == "yes":
-            response = requests.get('https://%s/redfish/v1/Chassis/System.Embedded.1' % creds["idrac_ip"], verify=creds["verify_cert"],headers={'X-Auth-Token': creds["idrac_x_auth_token"]})    
+        if session.x_auth_token == "yes":
+            response = session.client.get('https://%s/redfish/v1/Chassis/System.Embedded.1' % session.creds["idrac_ip"], verify=session.creds["verify_cert"],headers={'X-Auth-Token': session.creds["idrac_x_auth_token"]})    
         else:
-            response = requests.get('https://%s/redfish/v1/Chassis/System.Embedded.1' % creds["idrac_ip"], verify=creds["verify_cert"],auth=(creds["idrac_username"], creds["idrac_password"]))
+            response = session.client.get('https://%s/redfish/v1/Chassis/System.Embedded.1' % session.creds["idrac_ip"], verify=session.creds["verify_cert"],auth=(session.creds["idrac_username"], session.creds["idrac_password"]))
         data_get = response.json()
         if response.status_code == 200:
             model_name = data_get["Model"].replace(" ","")
@@ -4441,7 +5408,7 @@ def generate_replace_iDRAC_CSR(script_examples="", get_current_certs="", generat
             filename = model_name+"_"+service_tag+".csr"
         else:
             logging.info("-INFO, unable to get model and service tag information, using iDRAC IP for filename")
-            filename = "%s.csr" % creds["idrac_ip"]
+            filename = "%s.csr" % session.creds["idrac_ip"]
         try:
             os.remove(filename)
         except:
@@ -4450,10 +5417,10 @@ def generate_replace_iDRAC_CSR(script_examples="", get_current_certs="", generat
             x.writelines(data_post["CSRString"])
         logging.info("\n- Generated CSR also copied to file \"%s\"" % filename)
     elif replace_CSR:
-        if x_auth_token == "yes":
-            response = requests.get('https://%s/redfish/v1/Managers/iDRAC.Embedded.1?$select=FirmwareVersion' % creds["idrac_ip"], verify=creds["verify_cert"],headers={'X-Auth-Token': creds["idrac_x_auth_token"]})    
+        if session.x_auth_token == "yes":
+            response = session.client.get('https://%s/redfish/v1/Managers/iDRAC.Embedded.1?$select=FirmwareVersion' % session.creds["idrac_ip"], verify=session.creds["verify_cert"],headers={'X-Auth-Token': session.creds["idrac_x_auth_token"]})    
         else:
-            response = requests.get('https://%s/redfish/v1/Managers/iDRAC.Embedded.1?$select=FirmwareVersion' % creds["idrac_ip"], verify=creds["verify_cert"],auth=(creds["idrac_username"], creds["idrac_password"]))
+            response = session.client.get('https://%s/redfish/v1/Managers/iDRAC.Embedded.1?$select=FirmwareVersion' % session.creds["idrac_ip"], verify=session.creds["verify_cert"],auth=(session.creds["idrac_username"], session.creds["idrac_password"]))
         data = response.json()
         if response.status_code == 401:
             logging.error("- ERROR, status code 401 detected, check to make sure your iDRAC script session has correct username/password credentials or if using X-auth token, confirm the session is still active.")
@@ -4461,7 +5428,7 @@ def generate_replace_iDRAC_CSR(script_examples="", get_current_certs="", generat
         elif response.status_code != 200:
             logging.warning("\n- WARNING, unable to get iDRAC version, status code %s detected, detailed error results: \n%s" % (response.status_code, data))
             return
-        url = 'https://%s/redfish/v1/CertificateService/Actions/CertificateService.ReplaceCertificate' % (creds["idrac_ip"])
+        url = 'https://%s/redfish/v1/CertificateService/Actions/CertificateService.ReplaceCertificate' % (session.creds["idrac_ip"])
         try:
             open_filename = open(CSR_filename,"r")
         except:
@@ -4473,12 +5440,12 @@ def generate_replace_iDRAC_CSR(script_examples="", get_current_certs="", generat
             payload = {"CertificateType": "PEM","CertificateUri":{"@odata.id":"/redfish/v1/Managers/iDRAC.Embedded.1/NetworkProtocol/HTTPS/Certificates/%s" % replace_CSR},"CertificateString":read_file}
         else:
             payload = {"CertificateType": "PEM","CertificateUri":"/redfish/v1/Managers/iDRAC.Embedded.1/NetworkProtocol/HTTPS/Certificates/%s" % replace_CSR,"CertificateString":read_file}   
-        if x_auth_token == "yes":
-            headers = {'content-type': 'application/json', 'X-Auth-Token': creds["idrac_x_auth_token"]}
-            response = requests.post(url, data=json.dumps(payload), headers=headers, verify=creds["verify_cert"])
+        if session.x_auth_token == "yes":
+            headers = {'content-type': 'application/json', 'X-Auth-Token': session.creds["idrac_x_auth_token"]}
+            response = session.client.post(url, data=json.dumps(payload), headers=headers, verify=session.creds["verify_cert"])
         else:
             headers = {'content-type': 'application/json'}
-            response = requests.post(url, data=json.dumps(payload), headers=headers, verify=creds["verify_cert"],auth=(creds["idrac_username"],creds["idrac_password"]))
+            response = session.client.post(url, data=json.dumps(payload), headers=headers, verify=session.creds["verify_cert"],auth=(session.creds["idrac_username"],session.creds["idrac_password"]))
         data = response.json()
         if response.status_code == 202:
             logging.info("\n- PASS, replace CSR cert passed. iDRAC reset is needed for new cert to get applied.")
@@ -4490,14 +5457,14 @@ def generate_replace_iDRAC_CSR(script_examples="", get_current_certs="", generat
             logging.warning("- WARNING, iDRAC will not reboot now to replace CSR. Next iDRAC manual reboot CSR will be replaced")
             return
         else:   
-            url = "https://%s/redfish/v1/Managers/iDRAC.Embedded.1/Actions/Manager.Reset/" % creds["idrac_ip"]
+            url = "https://%s/redfish/v1/Managers/iDRAC.Embedded.1/Actions/Manager.Reset/" % session.creds["idrac_ip"]
             payload={"ResetType":"GracefulRestart"}
-            if x_auth_token == "yes":
-                headers = {'content-type': 'application/json', 'X-Auth-Token': creds["idrac_x_auth_token"]}
-                response = requests.post(url, data=json.dumps(payload), headers=headers, verify=creds["verify_cert"])
+            if session.x_auth_token == "yes":
+                headers = {'content-type': 'application/json', 'X-Auth-Token': session.creds["idrac_x_auth_token"]}
+                response = session.client.post(url, data=json.dumps(payload), headers=headers, verify=session.creds["verify_cert"])
             else:
                 headers = {'content-type': 'application/json'}
-                response = requests.post(url, data=json.dumps(payload), headers=headers, verify=creds["verify_cert"],auth=(creds["idrac_username"],creds["idrac_password"]))
+                response = session.client.post(url, data=json.dumps(payload), headers=headers, verify=session.creds["verify_cert"],auth=(session.creds["idrac_username"],session.creds["idrac_password"]))
             if response.status_code == 204:
                 logging.info("\n- PASS, status code %s returned for POST command to reset iDRAC\n" % response.status_code)
             else:
@@ -4512,16 +5479,17 @@ def generate_replace_iDRAC_CSR(script_examples="", get_current_certs="", generat
 
 def export_import_iDRAC_certs(script_examples="", get_current_certs="", get_cert_types="", export_cert="", import_cert="", cert_filename="", cert_passphrase=""):
     """Function to either get current iDRAC certificates or export/import certificates. Supported function arguments: export_cert (get possible values from get_cert_types argument), import_cert (get possible values from get_cert_types argument), cert_filename (pass in the name of the cert file to import which must be in base64 string format) and cert_passphrase (pass in passphrase if cert is protected for import)."""
+    session = get_script_session()
     if script_examples:
         print("""\n- IdracRedfishSupport.export_import_iDRAC_certs(get_current_certs=True), this example will return current iDRAC certs installed.
         \n- IdracRedfishSupport.export_import_iDRAC_certs(get_cert_types=True), this example will return current supported cert type values for export/import cert operations. 
         \n- IdracRedfishSupport.export_import_iDRAC_certs(export_cert="Server"), this example will export iDRAC server cert.
         \n- IdracRedfishSupport.export_import_iDRAC_certs(import_cert="ClientTrustCertificate", cert_filename="signed_cert.pem"), this example will import client trust cert signed pem file.""")
     elif get_current_certs:
-        if x_auth_token == "yes":
-            response = requests.get('https://%s/redfish/v1/Managers/iDRAC.Embedded.1/NetworkProtocol/HTTPS/Certificates' % creds["idrac_ip"], verify=creds["verify_cert"],headers={'X-Auth-Token': creds["idrac_x_auth_token"]})    
+        if session.x_auth_token == "yes":
+            response = session.client.get('https://%s/redfish/v1/Managers/iDRAC.Embedded.1/NetworkProtocol/HTTPS/Certificates' % session.creds["idrac_ip"], verify=session.creds["verify_cert"],headers={'X-Auth-Token': session.creds["idrac_x_auth_token"]})    
         else:
-            response = requests.get('https://%s/redfish/v1/Managers/iDRAC.Embedded.1/NetworkProtocol/HTTPS/Certificates' % creds["idrac_ip"], verify=creds["verify_cert"],auth=(creds["idrac_username"], creds["idrac_password"]))
+            response = session.client.get('https://%s/redfish/v1/Managers/iDRAC.Embedded.1/NetworkProtocol/HTTPS/Certificates' % session.creds["idrac_ip"], verify=session.creds["verify_cert"],auth=(session.creds["idrac_username"], session.creds["idrac_password"]))
         data = response.json()
         if response.status_code == 401:
             logging.error("- ERROR, status code 401 detected, check to make sure your iDRAC script session has correct username/password credentials or if using X-auth token, confirm the session is still active.")
@@ -4537,18 +5505,18 @@ def export_import_iDRAC_certs(script_examples="", get_current_certs="", get_cert
             for i in data["Members"]:
                 for ii in i.items():
                     print("\n- Details for cert \"%s\"\n" % ii[1].split("/")[-1])
-                    if x_auth_token == "yes":
-                        response = requests.get('https://%s%s' % (creds["idrac_ip"], ii[1]), verify=creds["verify_cert"],headers={'X-Auth-Token': creds["idrac_x_auth_token"]})    
+                    if session.x_auth_token == "yes":
+                        response = session.client.get('https://%s%s' % (session.creds["idrac_ip"], ii[1]), verify=session.creds["verify_cert"],headers={'X-Auth-Token': session.creds["idrac_x_auth_token"]})    
                     else:
-                        response = requests.get('https://%s%s' % (creds["idrac_ip"], ii[1]), verify=creds["verify_cert"],auth=(creds["idrac_username"], creds["idrac_password"]))
+                        response = session.client.get('https://%s%s' % (session.creds["idrac_ip"], ii[1]), verify=session.creds["verify_cert"],auth=(session.creds["idrac_username"], session.creds["idrac_password"]))
                     data = response.json()
                     for i in data.items():
                         pprint(i)
     elif get_cert_types:
-        if x_auth_token == "yes":
-            response = requests.get('https://%s/redfish/v1/Dell/Managers/iDRAC.Embedded.1/DelliDRACCardService' % creds["idrac_ip"], verify=creds["verify_cert"],headers={'X-Auth-Token': creds["idrac_x_auth_token"]})    
+        if session.x_auth_token == "yes":
+            response = session.client.get('https://%s/redfish/v1/Dell/Managers/iDRAC.Embedded.1/DelliDRACCardService' % session.creds["idrac_ip"], verify=session.creds["verify_cert"],headers={'X-Auth-Token': session.creds["idrac_x_auth_token"]})    
         else:
-            response = requests.get('https://%s/redfish/v1/Dell/Managers/iDRAC.Embedded.1/DelliDRACCardService' % creds["idrac_ip"], verify=creds["verify_cert"],auth=(creds["idrac_username"], creds["idrac_password"]))
+            response = session.client.get('https://%s/redfish/v1/Dell/Managers/iDRAC.Embedded.1/DelliDRACCardService' % session.creds["idrac_ip"], verify=session.creds["verify_cert"],auth=(session.creds["idrac_username"], session.creds["idrac_password"]))
         data = response.json()
         if response.status_code != 200:
             logging.error("\n- ERROR, GET commmand failed to get cert types supported for export/import cert operations, status code %s returned" % response.status_code)
@@ -4566,15 +5534,15 @@ def export_import_iDRAC_certs(script_examples="", get_current_certs="", get_cert
                     if ii[0] == "CertificateType@Redfish.AllowableValues":
                         print(ii[1])
     elif export_cert:
-        url = 'https://%s/redfish/v1/Dell/Managers/iDRAC.Embedded.1/DelliDRACCardService/Actions/DelliDRACCardService.ExportSSLCertificate' % (creds["idrac_ip"])
+        url = 'https://%s/redfish/v1/Dell/Managers/iDRAC.Embedded.1/DelliDRACCardService/Actions/DelliDRACCardService.ExportSSLCertificate' % (session.creds["idrac_ip"])
         method = "ExportSSLCertificate"
         payload={"SSLCertType":export_cert}
-        if x_auth_token == "yes":
-            headers = {'content-type': 'application/json', 'X-Auth-Token': creds["idrac_x_auth_token"]}
-            response = requests.post(url, data=json.dumps(payload), headers=headers, verify=creds["verify_cert"])
+        if session.x_auth_token == "yes":
+            headers = {'content-type': 'application/json', 'X-Auth-Token': session.creds["idrac_x_auth_token"]}
+            response = session.client.post(url, data=json.dumps(payload), headers=headers, verify=session.creds["verify_cert"])
         else:
             headers = {'content-type': 'application/json'}
-            response = requests.post(url, data=json.dumps(payload), headers=headers, verify=creds["verify_cert"],auth=(creds["idrac_username"],creds["idrac_password"]))
+            response = session.client.post(url, data=json.dumps(payload), headers=headers, verify=session.creds["verify_cert"],auth=(session.creds["idrac_username"],session.creds["idrac_password"]))
         data = response.json()
         if response.status_code == 401:
             logging.error("- ERROR, status code 401 detected, check to make sure your iDRAC script session has correct username/password credentials or if using X-auth token, confirm the session is still active.")
@@ -4595,7 +5563,7 @@ def export_import_iDRAC_certs(script_examples="", get_current_certs="", get_cert
             x.writelines(data['CertificateFile'])
         logging.info("\n - SSL certificate information also copied to \"%s\%s_certificate.txt\" file" % (os.getcwd(), export_cert))
     elif import_cert:
-        url = 'https://%s/redfish/v1/Dell/Managers/iDRAC.Embedded.1/DelliDRACCardService/Actions/DelliDRACCardService.ImportSSLCertificate' % (creds["idrac_ip"])
+        url = 'https://%s/redfish/v1/Dell/Managers/iDRAC.Embedded.1/DelliDRACCardService/Actions/DelliDRACCardService.ImportSSLCertificate' % (session.creds["idrac_ip"])
         method = "ImportSSLCertificate"
         if "p12" in cert_filename:
             with open(cert_filename, 'rb') as cert:
@@ -4608,12 +5576,12 @@ def export_import_iDRAC_certs(script_examples="", get_current_certs="", get_cert
         payload={"CertificateType":import_cert,"SSLCertificateFile":read_file}
         if cert_passphrase:
             payload["Passphrase"] = cert_passphrase
-        if x_auth_token == "yes":
-            headers = {'content-type': 'application/json', 'X-Auth-Token': creds["idrac_x_auth_token"]}
-            response = requests.post(url, data=json.dumps(payload), headers=headers, verify=creds["verify_cert"])
+        if session.x_auth_token == "yes":
+            headers = {'content-type': 'application/json', 'X-Auth-Token': session.creds["idrac_x_auth_token"]}
+            response = session.client.post(url, data=json.dumps(payload), headers=headers, verify=session.creds["verify_cert"])
         else:
             headers = {'content-type': 'application/json'}
-            response = requests.post(url, data=json.dumps(payload), headers=headers, verify=creds["verify_cert"],auth=(creds["idrac_username"],creds["idrac_password"]))
+            response = session.client.post(url, data=json.dumps(payload), headers=headers, verify=session.creds["verify_cert"],auth=(session.creds["idrac_username"],session.creds["idrac_password"]))
         data = response.json()
         if response.status_code == 401:
             logging.error("- ERROR, status code 401 detected, check to make sure your iDRAC script session has correct username/password credentials or if using X-auth token, confirm the session is still active.")
@@ -4624,15 +5592,15 @@ def export_import_iDRAC_certs(script_examples="", get_current_certs="", get_cert
             if user_response.lower() == "n":
                 return
             elif user_response.lower() == "y":
-                url = "https://%s/redfish/v1/Managers/iDRAC.Embedded.1/Actions/Manager.Reset/" % creds["idrac_ip"]
+                url = "https://%s/redfish/v1/Managers/iDRAC.Embedded.1/Actions/Manager.Reset/" % session.creds["idrac_ip"]
                 payload={"ResetType":"GracefulRestart"}
                 headers = {'content-type': 'application/json'}
-                if x_auth_token == "yes":
-                    headers = {'content-type': 'application/json', 'X-Auth-Token': creds["idrac_x_auth_token"]}
-                    response = requests.post(url, data=json.dumps(payload), headers=headers, verify=creds["verify_cert"])
+                if session.x_auth_token == "yes":
+                    headers = {'content-type': 'application/json', 'X-Auth-Token': session.creds["idrac_x_auth_token"]}
+                    response = session.client.post(url, data=json.dumps(payload), headers=headers, verify=session.creds["verify_cert"])
                 else:
                     headers = {'content-type': 'application/json'}
-                    response = requests.post(url, data=json.dumps(payload), headers=headers, verify=creds["verify_cert"],auth=(creds["idrac_username"],creds["idrac_password"]))
+                    response = session.client.post(url, data=json.dumps(payload), headers=headers, verify=session.creds["verify_cert"],auth=(session.creds["idrac_username"],session.creds["idrac_password"]))
                 if response.status_code == 204:
                     logging.info("\n- PASS, status code %s returned for POST command to reboot iDRAC\n" % response.status_code)
                 else:
@@ -4655,16 +5623,17 @@ def export_import_iDRAC_certs(script_examples="", get_current_certs="", get_cert
 
 def create_delete_iDRAC_subscriptions(script_examples="", get_subscriptions="", create_subscription="", destination_uri="", event_format_type="", event_type="", submit_test_event="", delete_subscription_uri="", message_id=""):
     """Function to either get current iDRAC subscriptions, create new subscription, submit test event to a location or delete subscription. Supported function arguments: get_subscriptions(supported value: True), create_subscription(supported value: True), destination_uri (pass in complete HTTPS URI path), event_format_type(supported values: Event, MetricReport or None), event_type(supported values: StatusChange, ResourceUpdated, ResourceAdded, ResourceRemoved, Alert, MetricReport), submit_test_event(possible value: True), message_id (pass in the message ID to submit test event, example: PDR1101) and delete_subscription_uri (pass in complete subscription URI. If needed execute IdracRedfishSupport.create_delete_iDRAC_subscriptions(get_subscriptions=True) to get subscription URIs). """
+    session = get_script_session()
     if script_examples:
         print("""\n- IdracRedfishSupport.create_delete_iDRAC_subscriptions(get_subscriptions=True), this example will return current iDRAC subscription details.
         \n- IdracRedfishSupport.create_delete_iDRAC_subscriptions(create_subscription=True, destination_uri="https://192.168.0.140", event_format_type="Event", event_type="Alert"), this example shows creating a subscription.
         \n- IdracRedfishSupport.create_delete_iDRAC_subscriptions(submit_test_event=True, destination_uri="https://192.168.0.140", event_type="Alert", message_id="TMP0118"), this example shows submitting a test event to subscription destination https://192.168.0.140.
         \n- IdracRedfishSupport.create_delete_iDRAC_subscriptions(delete_subscription_uri="/redfish/v1/EventService/Subscriptions/e507a4bc-ac8a-11ec-ad0d-b07b25d2e318"), this example shows deleting subscription.""")
     elif get_subscriptions:
-        if x_auth_token == "yes":
-            response = requests.get('https://%s/redfish/v1/EventService/Subscriptions?$expand=*($levels=1)' % creds["idrac_ip"], verify=creds["verify_cert"],headers={'X-Auth-Token': creds["idrac_x_auth_token"]})    
+        if session.x_auth_token == "yes":
+            response = session.client.get('https://%s/redfish/v1/EventService/Subscriptions?$expand=*($levels=1)' % session.creds["idrac_ip"], verify=session.creds["verify_cert"],headers={'X-Auth-Token': session.creds["idrac_x_auth_token"]})    
         else:
-            response = requests.get('https://%s/redfish/v1/EventService/Subscriptions?$expand=*($levels=1)' % creds["idrac_ip"], verify=creds["verify_cert"],auth=(creds["idrac_username"], creds["idrac_password"]))
+            response = session.client.get('https://%s/redfish/v1/EventService/Subscriptions?$expand=*($levels=1)' % session.creds["idrac_ip"], verify=session.creds["verify_cert"],auth=(session.creds["idrac_username"], session.creds["idrac_password"]))
         if response.status_code == 401:
             logging.error("- ERROR, status code 401 detected, check to make sure your iDRAC script session has correct username/password credentials or if using X-auth token, confirm the session is still active.")
             return
@@ -4676,19 +5645,19 @@ def create_delete_iDRAC_subscriptions(script_examples="", get_subscriptions="",
             return
         data = response.json()
         if data["Members"] == []:
-            loggin.warning("\n- WARNING, no subscriptions detected for iDRAC %s" % creds["idrac_ip"])
+            loggin.warning("\n- WARNING, no subscriptions detected for iDRAC %s" % session.creds["idrac_ip"])
             return
         else:
-            logging.info("\n- INFO, subscriptions detected for iDRAC ip %s\n" % creds["idrac_ip"])
+            logging.info("\n- INFO, subscriptions detected for iDRAC ip %s\n" % session.creds["idrac_ip"])
         for i in data["Members"]:
             pprint(i)
             print("\n")
 
     elif create_subscription:
-        if x_auth_token == "yes":
-            response = requests.get('https://%s/redfish/v1/Managers/iDRAC.Embedded.1/Attributes' % creds["idrac_ip"], verify=creds["verify_cert"],headers={'X-Auth-Token': creds["idrac_x_auth_token"]})    
+        if session.x_auth_token == "yes":
+            response = session.client.get('https://%s/redfish/v1/Managers/iDRAC.Embedded.1/Attributes' % session.creds["idrac_ip"], verify=session.creds["verify_cert"],headers={'X-Auth-Token': session.creds["idrac_x_auth_token"]})    
         else:
-            response = requests.get('https://%s/redfish/v1/Managers/iDRAC.Embedded.1/Attributes' % creds["idrac_ip"], verify=creds["verify_cert"],auth=(creds["idrac_username"], creds["idrac_password"]))
+            response = session.client.get('https://%s/redfish/v1/Managers/iDRAC.Embedded.1/Attributes' % session.creds["idrac_ip"], verify=session.creds["verify_cert"],auth=(session.creds["idrac_username"], session.creds["idrac_password"]))
         if response.status_code == 401:
             logging.error("- ERROR, status code 401 detected, check to make sure your iDRAC script session has correct username/password credentials or if using X-auth token, confirm the session is still active.")
             return
@@ -4706,12 +5675,12 @@ def create_delete_iDRAC_subscriptions(script_examples="", get_subscriptions="",
                 logging.info("\n- INFO, iDRAC version detected does not support PATCH to set iDRAC attributes, executing Server Configuration Profile feature set iDRAC attribute \"IPMILan.1#AlertEnable\" locally\n")
                 url = 'https://%s/redfish/v1/Managers/iDRAC.Embedded.1/Actions/Oem/EID_674_Manager.ImportSystemConfiguration' % idrac_ip
                 payload = {"ImportBuffer":"<SystemConfiguration><Component FQDD=\"iDRAC.Embedded.1\"><Attribute Name=\"IPMILan.1#AlertEnable\">Enabled</Attribute></Component></SystemConfiguration>","ShareParameters":{"Target":"All"}}
-                if x_auth_token == "yes":
-                    headers = {'content-type': 'application/json', 'X-Auth-Token': creds["idrac_x_auth_token"]}
-                    response = requests.post(url, data=json.dumps(payload), headers=headers, verify=creds["verify_cert"])
+                if session.x_auth_token == "yes":
+                    headers = {'content-type': 'application/json', 'X-Auth-Token': session.creds["idrac_x_auth_token"]}
+                    response = session.client.post(url, data=json.dumps(payload), headers=headers, verify=session.creds["verify_cert"])
                 else:
                     headers = {'content-type': 'application/json'}
-                    response = requests.post(url, data=json.dumps(payload), headers=headers, verify=creds["verify_cert"],auth=(creds["idrac_username"],creds["idrac_password"]))
+                    response = session.client.post(url, data=json.dumps(payload), headers=headers, verify=session.creds["verify_cert"],auth=(session.creds["idrac_username"],session.creds["idrac_password"]))
                 create_dict = str(response.__dict__)
                 try:
                     job_id_search = re.search("JID_.+?,",create_dict).group()
@@ -4728,17 +5697,17 @@ def create_delete_iDRAC_subscriptions(script_examples="", get_subscriptions="",
                 response_output = response.__dict__
                 job_id = response_output["headers"]["Location"]
                 job_id = re.search("JID_.+",job_id).group()
+                job_poller = JobPoller(job_type="ImportConfiguration")
                 while True:
-                    if x_auth_token == "yes":
-                        response = requests.get('https://%s/redfish/v1/TaskService/Tasks/%s' % (creds["idrac_ip"], job_id), verify=creds["verify_cert"],headers={'X-Auth-Token': creds["idrac_x_auth_token"]})    
+                    if session.x_auth_token == "yes":
+                        response = session.client.get('https://%s/redfish/v1/TaskService/Tasks/%s' % (session.creds["idrac_ip"], job_id), verify=session.creds["verify_cert"],headers={'X-Auth-Token': session.creds["idrac_x_auth_token"]})    
                     else:
-                        response = requests.get('https://%s/redfish/v1/TaskService/Tasks/%s' % (creds["idrac_ip"], job_id), verify=creds["verify_cert"],auth=(creds["idrac_username"], creds["idrac_password"]))
+                        response = session.client.get('https://%s/redfish/v1/TaskService/Tasks/%s' % (session.creds["idrac_ip"], job_id), verify=session.creds["verify_cert"],auth=(session.creds["idrac_username"], session.creds["idrac_password"]))
                     data = req.json()
                     message_string = data["Messages"]
                     final_message_string = str(message_string)
                     if statusCode == 202 or statusCode == 200:
                         logging.info("- INFO, GET command passed to get job ID details")
-                        time.sleep(1)
                     else:
                         logging.error("- FAIL, GET job ID command failed, status code %s returned" % response.status_code)
                         return
@@ -4765,25 +5734,25 @@ def create_delete_iDRAC_subscriptions(script_examples="", get_subscriptions="",
                     else:
                         logging.info("- Job not marked completed, current status is: %s" % data["TaskState"])
                         logging.info("- Message: %s\n" % message_string[0]["Message"])
-                        time.sleep(1)
+                        job_poller.wait(response=response, data=data)
                         continue
             logging.info("- INFO, checking current value for iDRAC attribute \"IPMILan.1.AlertEnable\"")
             if attributes_dict["IPMILan.1.AlertEnable"] == "Disabled":
                 logging.info("- INFO, current value for iDRAC attribute \"IPMILan.1.AlertEnable\" is set to Disabled, setting value to Enabled")
                 payload = {"Attributes":{"IPMILan.1.AlertEnable":"Enabled"}}
-                url = 'https://%s/redfish/v1/Managers/iDRAC.Embedded.1/Attributes' % creds["idrac_ip"]
-                if x_auth_token == "yes":
-                    headers = {'content-type': 'application/json', 'X-Auth-Token': creds["idrac_x_auth_token"]}
-                    response = requests.patch(url, data=json.dumps(payload), headers=headers, verify=creds["verify_cert"])
+                url = 'https://%s/redfish/v1/Managers/iDRAC.Embedded.1/Attributes' % session.creds["idrac_ip"]
+                if session.x_auth_token == "yes":
+                    headers = {'content-type': 'application/json', 'X-Auth-Token': session.creds["idrac_x_auth_token"]}
+                    response = session.client.patch(url, data=json.dumps(payload), headers=headers, verify=session.creds["verify_cert"])
                 else:
                     headers = {'content-type': 'application/json'}
-                    response = requests.patch(url, data=json.dumps(payload), headers=headers, verify=creds["verify_cert"],auth=(creds["idrac_username"],creds["idrac_password"]))
+                    response = session.client.patch(url, data=json.dumps(payload), headers=headers, verify=session.creds["verify_cert"],auth=(session.creds["idrac_username"],session.creds["idrac_password"]))
                 if response.status_code == 200:
                     logging.error("- PASS, PATCH command passed to set iDRAC attribute \"IPMILan.1.AlertEnable\" to enabled")
                 else:
                     logging.error("- FAIL, PATCH command failed to set iDRAC attribute \"IPMILan.1.AlertEnable\" to enabled")
                     return
-                response = requests.get('https://%s/redfish/v1/Managers/iDRAC.Embedded.1/Attributes' % idrac_ip,verify=False,auth=(idrac_username, idrac_password))
+                response = session.client.get('https://%s/redfish/v1/Managers/iDRAC.Embedded.1/Attributes' % idrac_ip,verify=False,auth=(idrac_username, idrac_password))
                 data = response.json()
                 attributes_dict=data['Attributes']
                 if attributes_dict["IPMILan.1.AlertEnable"] == "Enabled":
@@ -4795,14 +5764,14 @@ def create_delete_iDRAC_subscriptions(script_examples="", get_subscriptions="",
             else:
                 logging.info("- INFO, current value for iDRAC attribute \"IPMILan.1.AlertEnable\" already set to Enabled, ignore PATCH command")
                 break
-        url = "https://%s/redfish/v1/EventService/Subscriptions" % creds["idrac_ip"]
+        url = "https://%s/redfish/v1/EventService/Subscriptions" % session.creds["idrac_ip"]
         payload = {"Destination": destination_uri,"EventTypes": [event_type],"Context": "root","Protocol": "Redfish", "EventFormatType":event_format_type}
-        if x_auth_token == "yes":
-            headers = {'content-type': 'application/json', 'X-Auth-Token': creds["idrac_x_auth_token"]}
-            response = requests.post(url, data=json.dumps(payload), headers=headers, verify=creds["verify_cert"])
+        if session.x_auth_token == "yes":
+            headers = {'content-type': 'application/json', 'X-Auth-Token': session.creds["idrac_x_auth_token"]}
+            response = session.client.post(url, data=json.dumps(payload), headers=headers, verify=session.creds["verify_cert"])
         else:
             headers = {'content-type': 'application/json'}
-            response = requests.post(url, data=json.dumps(payload), headers=headers, verify=creds["verify_cert"],auth=(creds["idrac_username"],creds["idrac_password"]))
+            response = session.client.post(url, data=json.dumps(payload), headers=headers, verify=session.creds["verify_cert"],auth=(session.creds["idrac_username"],session.creds["idrac_password"]))
         if response.__dict__["status_code"] == 201:
             logging.info("- PASS, POST command passed to create iDRAC subscription")
         else:
@@ -4810,13 +5779,13 @@ def create_delete_iDRAC_subscriptions(script_examples="", get_subscriptions="",
             return
     elif submit_test_event:
         payload = {"Destination": destination_uri,"EventTypes": event_type,"Context": "Root","Protocol": "Redfish","MessageId":message_id}
-        url = "https://%s/redfish/v1/EventService/Actions/EventService.SubmitTestEvent" % creds["idrac_ip"]
-        if x_auth_token == "yes":
-            headers = {'content-type': 'application/json', 'X-Auth-Token': creds["idrac_x_auth_token"]}
-            response = requests.post(url, data=json.dumps(payload), headers=headers, verify=creds["verify_cert"])
+        url = "https://%s/redfish/v1/EventService/Actions/EventService.SubmitTestEvent" % session.creds["idrac_ip"]
+        if session.x_auth_token == "yes":
+            headers = {'content-type': 'application/json', 'X-Auth-Token': session.creds["idrac_x_auth_token"]}
+            response = session.client.post(url, data=json.dumps(payload), headers=headers, verify=session.creds["verify_cert"])
         else:
             headers = {'content-type': 'application/json'}
-            response = requests.post(url, data=json.dumps(payload), headers=headers, verify=creds["verify_cert"],auth=(creds["idrac_username"],creds["idrac_password"]))
+            response = session.client.post(url, data=json.dumps(payload), headers=headers, verify=session.creds["verify_cert"],auth=(session.creds["idrac_username"],session.creds["idrac_password"]))
         if response.__dict__["status_code"] == 401:
             logging.error("- ERROR, status code 401 detected, check to make sure your iDRAC script session has correct username/password credentials or if using X-auth token, confirm the session is still active.")
             return
@@ -4826,14 +5795,14 @@ def create_delete_iDRAC_subscriptions(script_examples="", get_subscriptions="",
             logging.error("\n- FAIL, POST command failed to submit subscription test event, status code %s returned, error: %s" % (response.__dict__["status_code"], response.__dict__["_content"]))
             return
     elif delete_subscription_uri:
-        url = "https://%s%s" % (creds["idrac_ip"], delete_subscription_uri)
+        url = "https://%s%s" % (session.creds["idrac_ip"], delete_subscription_uri)
         headers = {'content-type': 'application/json'}
-        if x_auth_token == "yes":
-            headers = {'content-type': 'application/json', 'X-Auth-Token': creds["idrac_x_auth_token"]}
-            response = requests.delete(url, headers=headers, verify=creds["verify_cert"])
+        if session.x_auth_token == "yes":
+            headers = {'content-type': 'application/json', 'X-Auth-Token': session.creds["idrac_x_auth_token"]}
+            response = session.client.delete(url, headers=headers, verify=session.creds["verify_cert"])
         else:
             headers = {'content-type': 'application/json'}
-            response = requests.delete(url, headers=headers, verify=creds["verify_cert"],auth=(creds["idrac_username"],creds["idrac_password"]))
+            response = session.client.delete(url, headers=headers, verify=session.creds["verify_cert"],auth=(session.creds["idrac_username"],session.creds["idrac_password"]))
         if response.__dict__["status_code"] == 401:
             logging.error("- ERROR, status code 401 detected, check to make sure your iDRAC script session has correct username/password credentials or if using X-auth token, confirm the session is still active.")
             return
@@ -4846,6 +5815,7 @@ def create_delete_iDRAC_subscriptions(script_examples="", get_subscriptions="",
 
 def export_import_server_configuration_profile_local(script_examples="", export_profile="", export_format="", targets="", export_use="", include_in_export="", import_profile="", import_filename="", shutdown_type="", end_host_powerstate=""):
     """Function to export or import server configuration profile (SCP) locally. Supported function arguments: export_profile (supported value: True), export_format (supported values: XML or JSON), targets (supported values: ALL, IDRAC, BIOS, NIC, FC, RAID, System, LifecycleController, EventFilters) Note, you can pass in one or multiple values. If passing in multiple values, use comma separator with no whitespace. export_use (supported value: Clone) Note: Argument is optional, if not used iDRAC will export as default. include_in_export (supported_values: IncludeReadOnly or IncludePasswordHashValues) Note: If you pass in multiple values, use comma separator with no whitespace. Argument is optional, if not used iDRAC will export as default. import_profile (supported value: True), import_filename (pass in SCP filename), shutdown_type (supported values: Forced, Graceful and NoReboot). Note: optional, if not passed in server will perform graceful. end_host_powerstate (possible values: On and Off). Note: optional, if not used default value is On."""
+    session = get_script_session()
     if script_examples:
         print("""\n- IdracRedfishSupport.export_import_server_configuration_profile_local(export_profile=True, export_format=\"JSON\", targets=\"IDRAC\"), this example will export normal SCP file in JSON format which only includes iDRAC attributes.
         \n- IdracRedfishSupport.export_import_server_configuration_profile_local(export_profile=True, export_format=\"XML\", targets=\"LifecycleController,System\", export_use=\"Clone\"), this example will export clone SCP file in XML format which only includes LifecycleController and Syatem attributes.  
@@ -4855,18 +5825,18 @@ def export_import_server_configuration_profile_local(script_examples="", export_
         return
     if export_profile and export_format and targets:
         targets = targets.replace(" ","")
-        url = 'https://%s/redfish/v1/Managers/iDRAC.Embedded.1/Actions/Oem/EID_674_Manager.ExportSystemConfiguration' % creds["idrac_ip"]
+        url = 'https://%s/redfish/v1/Managers/iDRAC.Embedded.1/Actions/Oem/EID_674_Manager.ExportSystemConfiguration' % session.creds["idrac_ip"]
         payload = {"ExportFormat":export_format.upper(),"ShareParameters":{"Target":targets}}
         if export_use:
             payload["ExportUse"] = export_use
         if include_in_export:
             payload["IncludeInExport"] = include_in_export
-        if x_auth_token == "yes":
-            headers = {'content-type': 'application/json', 'X-Auth-Token': creds["idrac_x_auth_token"]}
-            response = requests.post(url, data=json.dumps(payload), headers=headers, verify=creds["verify_cert"])
+        if session.x_auth_token == "yes":
+            headers = {'content-type': 'application/json', 'X-Auth-Token': session.creds["idrac_x_auth_token"]}
+            response = session.client.post(url, data=json.dumps(payload), headers=headers, verify=session.creds["verify_cert"])
         else:
             headers = {'content-type': 'application/json'}
-            response = requests.post(url, data=json.dumps(payload), headers=headers, verify=creds["verify_cert"],auth=(creds["idrac_username"],creds["idrac_password"]))
+            response = session.client.post(url, data=json.dumps(payload), headers=headers, verify=session.creds["verify_cert"],auth=(session.creds["idrac_username"],session.creds["idrac_password"]))
         if response.status_code == 202:
             logging.info("- PASS, POST command passed for ExportSystemConfiguration action")
         else:
@@ -4881,12 +5851,13 @@ def export_import_server_configuration_profile_local(script_examples="", export_
             return
         logging.info("- PASS, job ID %s successfully created" % job_id)
         start_time = datetime.now()
+        job_poller = JobPoller(job_type="ExportConfiguration")
         while True:
             current_time = (datetime.now()-start_time)
-            if x_auth_token == "yes":
-                response = requests.get('https://%s/redfish/v1/TaskService/Tasks/%s' % (creds["idrac_ip"], job_id), verify=creds["verify_cert"],headers={'X-Auth-Token': creds["idrac_x_auth_token"]})    
+            if session.x_auth_token == "yes":
+                response = session.client.get('https://%s/redfish/v1/TaskService/Tasks/%s' % (session.creds["idrac_ip"], job_id), verify=session.creds["verify_cert"],headers={'X-Auth-Token': session.creds["idrac_x_auth_token"]})    
             else:
-                response = requests.get('https://%s/redfish/v1/TaskService/Tasks/%s' % (creds["idrac_ip"], job_id), verify=creds["verify_cert"],auth=(creds["idrac_username"], creds["idrac_password"]))
+                response = session.client.get('https://%s/redfish/v1/TaskService/Tasks/%s' % (session.creds["idrac_ip"], job_id), verify=session.creds["verify_cert"],auth=(session.creds["idrac_username"], session.creds["idrac_password"]))
             dict_output = response.__dict__
             if export_format.upper() == "XML":
                 if "<SystemConfiguration Model" in str(dict_output):
@@ -4924,10 +5895,10 @@ def export_import_server_configuration_profile_local(script_examples="", export_
                     for i in export_xml:
                         print(i)
                     print("\n")
-                    if x_auth_token == "yes":
-                        response = requests.get('https://%s/redfish/v1/Managers/iDRAC.Embedded.1/Jobs/%s' % (creds["idrac_ip"], job_id), verify=creds["verify_cert"],headers={'X-Auth-Token': creds["idrac_x_auth_token"]})    
+                    if session.x_auth_token == "yes":
+                        response = session.client.get('https://%s/redfish/v1/Managers/iDRAC.Embedded.1/Jobs/%s' % (session.creds["idrac_ip"], job_id), verify=session.creds["verify_cert"],headers={'X-Auth-Token': session.creds["idrac_x_auth_token"]})    
                     else:
-                        response = requests.get('https://%s/redfish/v1/Managers/iDRAC.Embedded.1/Jobs/%s' % (creds["idrac_ip"], job_id), verify=creds["verify_cert"],auth=(creds["idrac_username"], creds["idrac_password"]))
+                        response = session.client.get('https://%s/redfish/v1/Managers/iDRAC.Embedded.1/Jobs/%s' % (session.creds["idrac_ip"], job_id), verify=session.creds["verify_cert"],auth=(session.creds["idrac_username"], session.creds["idrac_password"]))
                     data = response.json()
                     logging.info("\n- PASS, final detailed job status results for job ID %s -\n" % job_id)
                     for i in data.items():
@@ -4945,10 +5916,10 @@ def export_import_server_configuration_profile_local(script_examples="", export_
                     open_file = open(filename,"w")
                     open_file.write(json.dumps(json.loads(json_format), indent=4))
                     open_file.close()
-                    if x_auth_token == "yes":
-                        response = requests.get('https://%s/redfish/v1/Managers/iDRAC.Embedded.1/Jobs/%s' % (creds["idrac_ip"], job_id), verify=creds["verify_cert"],headers={'X-Auth-Token': creds["idrac_x_auth_token"]})    
+                    if session.x_auth_token == "yes":
+                        response = session.client.get('https://%s/redfish/v1/Managers/iDRAC.Embedded.1/Jobs/%s' % (session.creds["idrac_ip"], job_id), verify=session.creds["verify_cert"],headers={'X-Auth-Token': session.creds["idrac_x_auth_token"]})    
                     else:
-                        response = requests.get('https://%s/redfish/v1/Managers/iDRAC.Embedded.1/Jobs/%s' % (creds["idrac_ip"], job_id), verify=creds["verify_cert"],auth=(creds["idrac_username"], creds["idrac_password"]))
+                        response = session.client.get('https://%s/redfish/v1/Managers/iDRAC.Embedded.1/Jobs/%s' % (session.creds["idrac_ip"], job_id), verify=session.creds["verify_cert"],auth=(session.creds["idrac_username"], session.creds["idrac_password"]))
                     data = response.json()
                     logging.info("\n- PASS, final detailed job status results for job ID %s -\n" % job_id)
                     for i in data.items():
@@ -4978,16 +5949,15 @@ def export_import_server_configuration_profile_local(script_examples="", export_
             else:
                 try:
                     logging.info("- INFO, job ID not completed, current status: \"%s\", percent complete: \"%s\"" % (data['Oem']['Dell']['Message'],data['Oem']['Dell']['PercentComplete']))
-                    time.sleep(1)
                 except:
                     logging.info("- INFO, unable to print job status message, trying again")
-                    time.sleep(1)
+                job_poller.wait(response=response, data=data)
                 continue
     elif import_profile and import_filename:
-        if x_auth_token == "yes":
-            response = requests.get('https://%s/redfish/v1/Managers/iDRAC.Embedded.1' % creds["idrac_ip"], verify=creds["verify_cert"],headers={'X-Auth-Token': creds["idrac_x_auth_token"]})    
+        if session.x_auth_token == "yes":
+            response = session.client.get('https://%s/redfish/v1/Managers/iDRAC.Embedded.1' % session.creds["idrac_ip"], verify=session.creds["verify_cert"],headers={'X-Auth-Token': session.creds["idrac_x_auth_token"]})    
         else:
-            response = requests.get('https://%s/redfish/v1/Managers/iDRAC.Embedded.1' % creds["idrac_ip"], verify=creds["verify_cert"],auth=(creds["idrac_username"], creds["idrac_password"]))
+            response = session.client.get('https://%s/redfish/v1/Managers/iDRAC.Embedded.1' % session.creds["idrac_ip"], verify=session.creds["verify_cert"],auth=(session.creds["idrac_username"], session.creds["idrac_password"]))
         data = response.json()
         get_version = data['FirmwareVersion'].split(".")[:2]
         get_version = int("".join(get_version))
@@ -4996,7 +5966,7 @@ def export_import_server_configuration_profile_local(script_examples="", export_
         except:
             print("\n-FAIL, \"%s\" file doesn't exist" % import_filename)
             return    
-        url = 'https://%s/redfish/v1/Managers/iDRAC.Embedded.1/Actions/Oem/EID_674_Manager.ImportSystemConfiguration' % creds["idrac_ip"]
+        url = 'https://%s/redfish/v1/Managers/iDRAC.Embedded.1/Actions/Oem/EID_674_Manager.ImportSystemConfiguration' % session.creds["idrac_ip"]
         # Code needed to modify the SCP file to one string to pass in for POST command
         modify_file = open_file.read()
         modify_file = re.sub(" \n ","",modify_file)
@@ -5010,12 +5980,12 @@ def export_import_server_configuration_profile_local(script_examples="", export_
         if end_host_powerstate:
             payload["HostPowerState"] = end_host_powerstate
         payload["ImportBuffer"] = file_string
-        if x_auth_token == "yes":
-            headers = {'content-type': 'application/json', 'X-Auth-Token': creds["idrac_x_auth_token"]}
-            response = requests.post(url, data=json.dumps(payload), headers=headers, verify=creds["verify_cert"])
+        if session.x_auth_token == "yes":
+            headers = {'content-type': 'application/json', 'X-Auth-Token': session.creds["idrac_x_auth_token"]}
+            response = session.client.post(url, data=json.dumps(payload), headers=headers, verify=session.creds["verify_cert"])
         else:
             headers = {'content-type': 'application/json'}
-            response = requests.post(url, data=json.dumps(payload), headers=headers, verify=creds["verify_cert"],auth=(creds["idrac_username"],creds["idrac_password"]))
+            response = session.client.post(url, data=json.dumps(payload), headers=headers, verify=session.creds["verify_cert"],auth=(session.creds["idrac_username"],session.creds["idrac_password"]))
         response_output = response.__dict__
         if response.status_code == 202:
             logging.info("- PASS, POST command passed for ImportSystemConfiguration action")
@@ -5033,6 +6003,7 @@ def export_import_server_configuration_profile_local(script_examples="", export_
         start_time = datetime.now()
         count = 1
         get_job_status_count = 1
+        job_poller = JobPoller(job_type="ImportConfiguration")
         while True:
             if count == 10:
                 logging.error("- FAIL, 10 attempts at getting job status failed, script will exit")
@@ -5041,14 +6012,14 @@ def export_import_server_configuration_profile_local(script_examples="", export_
                 logging.info("- INFO, retry count of 10 has been hit for retry job status GET request, script will exit")
                 return
             try:
-                if x_auth_token == "yes":
-                    response = requests.get('https://%s/redfish/v1/TaskService/Tasks/%s' % (creds["idrac_ip"], job_id), verify=creds["verify_cert"],headers={'X-Auth-Token': creds["idrac_x_auth_token"]})    
+                if session.x_auth_token == "yes":
+                    response = session.client.get('https://%s/redfish/v1/TaskService/Tasks/%s' % (session.creds["idrac_ip"], job_id), verify=session.creds["verify_cert"],headers={'X-Auth-Token': session.creds["idrac_x_auth_token"]})    
                 else:
-                    response = requests.get('https://%s/redfish/v1/TaskService/Tasks/%s' % (creds["idrac_ip"], job_id), verify=creds["verify_cert"],auth=(creds["idrac_username"], creds["idrac_password"]))
+                    response = session.client.get('https://%s/redfish/v1/TaskService/Tasks/%s' % (session.creds["idrac_ip"], job_id), verify=session.creds["verify_cert"],auth=(session.creds["idrac_username"], session.creds["idrac_password"]))
                     data = response.json()
             except requests.ConnectionError as error_message:
                 logging.error("- FAIL, requests command failed to GET job status, detailed error information: \n%s" % error_message)
-                time.sleep(10)
+                job_poller.wait()
                 logging.info("- INFO, script will now attempt to get job status again")
                 count += 1
                 continue
@@ -5065,16 +6036,15 @@ def export_import_server_configuration_profile_local(script_examples="", export_
             current_time = (datetime.now()-start_time)
             if response.status_code == 202 or response.status_code == 200:
                 logging.info("- INFO, GET command passed to get job ID details")
-                time.sleep(1)
             else:
                 logging.error("- ERROR, query job ID command failed, error code: %s, retry" % statusCode)
                 count += 1
-                time.sleep(5)
+                job_poller.wait(response=response)
                 continue
             if "Oem" not in data:
                 logging.info("- INFO, unable to locate OEM data in JSON response, retry")
                 get_job_status_count += 1
-                time.sleep(5)
+                job_poller.wait(response=response)
                 continue
             if data['Oem']['Dell']['JobState'] == "Failed" or data['Oem']['Dell']['JobState'] == "CompletedWithErrors":
                 logging.info("\n- INFO, job ID %s status marked as \"%s\"" % (job_id, data['Oem']['Dell']['JobState']))
@@ -5157,7 +6127,7 @@ def export_import_server_configuration_profile_local(script_examples="", export_
                 return
             else:
                 logging.info("- INFO, job not completed, current status: \"%s\", percent complete: \"%s\"" % (data['Oem']['Dell']['Message'],data['Oem']['Dell']['PercentComplete']))
-                time.sleep(1)
+                job_poller.wait(response=response, data=data)
                 continue   
     else:
         logging.error("- ERROR, either incorrect or missing function arguments detected. Check doc help for more details or execute examples")
@@ -5165,6 +6135,7 @@ def export_import_server_configuration_profile_local(script_examples="", export_
 
 def export_import_server_configuration_profile_network_share(script_examples="", export_profile="", export_format="", targets="", export_use="", include_in_export="", share_type="", share_ip="", share_name="", share_username="", share_password="", ignore_certwarning="", import_profile="", filename="", shutdown_type="", end_host_powerstate=""):
     """Function to export or import server configuration profile (SCP) using a network share. Supported function arguments: export_profile (supported value: True), export_format (supported values: XML or JSON), targets (supported values: ALL, IDRAC, BIOS, NIC, FC, RAID, System, LifecycleController, EventFilters) Note, you can pass in one or multiple values. If passing in multiple values, use comma separator with no whitespace. export_use (supported value: Clone) Note: Argument is optional, if not used iDRAC will export as default. include_in_export (supported_values: IncludeReadOnly or IncludePasswordHashValues) Note: If you pass in multiple values, use comma separator with no whitespace. Argument is optional, if not used iDRAC will export as default. share_type (supported values: NFS, CIFS, HTTP and HTTPS), share_ip, share_name, share_username, share_password, ignore_certwarning (only valid for HTTPS and is optional, supported values On and Off), import_profile (supported value: True), filename (pass in unique SCP filename), shutdown_type (supported values: Forced, Graceful and NoReboot). Note: optional, if not passed in server will perform graceful. end_host_powerstate (possible values: On and Off). Note: optional, if not used default value is On."""
+    session = get_script_session()
     if script_examples:
         print("""\n- IdracRedfishSupport.export_import_server_configuration_profile_network_share(export_profile=True, filename="R640_scp.json", export_format=\"JSON\", targets=\"IDRAC\", share_ip="192.168.0.130", share_name="/nfs", share_type="NFS"), this examples shows export normal SCP file in JSON format which only includes iDRAC attributes to NFS share.
         \n- IdracRedfishSupport.export_import_server_configuration_profile_network_share(export_profile=True, filename="R640_scp.xml", export_format=\"XML\", targets=\"LifecycleController,System\", export_use=\"Clone\", share_ip="192.168.0.130", share_name="cifs_share", share_type="CIFS", share_username="admin", share_password="password"), this example shows export clone SCP file in XML format which only includes LifecycleController and Syatem attributes to CIFS share.  
@@ -5174,7 +6145,7 @@ def export_import_server_configuration_profile_network_share(script_examples="",
         return
     if export_profile and export_format and targets and share_name and share_ip and share_type and filename:
         targets = targets.replace(" ","")
-        url = 'https://%s/redfish/v1/Managers/iDRAC.Embedded.1/Actions/Oem/EID_674_Manager.ExportSystemConfiguration' % creds["idrac_ip"]
+        url = 'https://%s/redfish/v1/Managers/iDRAC.Embedded.1/Actions/Oem/EID_674_Manager.ExportSystemConfiguration' % session.creds["idrac_ip"]
         payload = {"ExportFormat":export_format.upper(),"ShareParameters":{"Target":targets}}
         if export_use:
             payload["ExportUse"] = export_use
@@ -5194,12 +6165,12 @@ def export_import_server_configuration_profile_network_share(script_examples="",
             payload["ShareParameters"]["Password"] = share_password
         if ignore_certwarning:
             payload["ShareParameters"]["IgnoreCertificateWarning"] = ignore_certwarning
-        if x_auth_token == "yes":
-            headers = {'content-type': 'application/json', 'X-Auth-Token': creds["idrac_x_auth_token"]}
-            response = requests.post(url, data=json.dumps(payload), headers=headers, verify=creds["verify_cert"])
+        if session.x_auth_token == "yes":
+            headers = {'content-type': 'application/json', 'X-Auth-Token': session.creds["idrac_x_auth_token"]}
+            response = session.client.post(url, data=json.dumps(payload), headers=headers, verify=session.creds["verify_cert"])
         else:
             headers = {'content-type': 'application/json'}
-            response = requests.post(url, data=json.dumps(payload), headers=headers, verify=creds["verify_cert"],auth=(creds["idrac_username"],creds["idrac_password"]))
+            response = session.client.post(url, data=json.dumps(payload), headers=headers, verify=session.creds["verify_cert"],auth=(session.creds["idrac_username"],session.creds["idrac_password"]))
         if response.status_code == 401:
                 logging.info("- INFO, status code 401 detected, iDRAC username password changed while applying configuration changes. Access the iDRAC using new password to check job status")
                 return
@@ -5217,11 +6188,12 @@ def export_import_server_configuration_profile_network_share(script_examples="",
             return
         logging.info("- PASS, job ID %s successfully created" % job_id)
         start_time = datetime.now()
+        job_poller = JobPoller(job_type="ExportConfiguration")
         while True:
-            if x_auth_token == "yes":
-                response = requests.get('https://%s/redfish/v1/Managers/iDRAC.Embedded.1/Jobs/%s' % (creds["idrac_ip"], job_id), verify=creds["verify_cert"],headers={'X-Auth-Token': creds["idrac_x_auth_token"]})    
+            if session.x_auth_token == "yes":
+                response = session.client.get('https://%s/redfish/v1/Managers/iDRAC.Embedded.1/Jobs/%s' % (session.creds["idrac_ip"], job_id), verify=session.creds["verify_cert"],headers={'X-Auth-Token': session.creds["idrac_x_auth_token"]})    
             else:
-                response = requests.get('https://%s/redfish/v1/Managers/iDRAC.Embedded.1/Jobs/%s' % (creds["idrac_ip"], job_id), verify=creds["verify_cert"],auth=(creds["idrac_username"], creds["idrac_password"]))
+                response = session.client.get('https://%s/redfish/v1/Managers/iDRAC.Embedded.1/Jobs/%s' % (session.creds["idrac_ip"], job_id), verify=session.creds["verify_cert"],auth=(session.creds["idrac_username"], session.creds["idrac_password"]))
                 data = response.json()
             current_time = (datetime.now()-start_time)
             if response.status_code != 200:
@@ -5246,16 +6218,16 @@ def export_import_server_configuration_profile_network_share(script_examples="",
                 break
             else:
                 logging.info("- INFO, job not completed, current status: \"%s\", percent complete: \"%s\"" % (data['Message'],data['PercentComplete']))
-                time.sleep(1)
+                job_poller.wait(response=response, data=data)
     elif import_profile and filename and share_name and share_ip and share_type:
-        if x_auth_token == "yes":
-            response = requests.get('https://%s/redfish/v1/Managers/iDRAC.Embedded.1' % creds["idrac_ip"], verify=creds["verify_cert"],headers={'X-Auth-Token': creds["idrac_x_auth_token"]})    
+        if session.x_auth_token == "yes":
+            response = session.client.get('https://%s/redfish/v1/Managers/iDRAC.Embedded.1' % session.creds["idrac_ip"], verify=session.creds["verify_cert"],headers={'X-Auth-Token': session.creds["idrac_x_auth_token"]})    
         else:
-            response = requests.get('https://%s/redfish/v1/Managers/iDRAC.Embedded.1' % creds["idrac_ip"], verify=creds["verify_cert"],auth=(creds["idrac_username"], creds["idrac_password"]))
+            response = session.client.get('https://%s/redfish/v1/Managers/iDRAC.Embedded.1' % session.creds["idrac_ip"], verify=session.creds["verify_cert"],auth=(session.creds["idrac_username"], session.creds["idrac_password"]))
         data = response.json()
         get_version = data['FirmwareVersion'].split(".")[:2]
         get_version = int("".join(get_version)) 
-        url = 'https://%s/redfish/v1/Managers/iDRAC.Embedded.1/Actions/Oem/EID_674_Manager.ImportSystemConfiguration' % creds["idrac_ip"]
+        url = 'https://%s/redfish/v1/Managers/iDRAC.Embedded.1/Actions/Oem/EID_674_Manager.ImportSystemConfiguration' % session.creds["idrac_ip"]
         payload = {"ShareParameters":{"Target":targets}}
         if shutdown_type:
             payload["ShutdownType"] = shutdown_type
@@ -5277,12 +6249,12 @@ def export_import_server_configuration_profile_network_share(script_examples="",
             payload["ShareParameters"]["Password"] = share_password
         if ignore_certwarning:
             payload["ShareParameters"]["IgnoreCertificateWarning"] = ignore_certwarning
-        if x_auth_token == "yes":
-            headers = {'content-type': 'application/json', 'X-Auth-Token': creds["idrac_x_auth_token"]}
-            response = requests.post(url, data=json.dumps(payload), headers=headers, verify=creds["verify_cert"])
+        if session.x_auth_token == "yes":
+            headers = {'content-type': 'application/json', 'X-Auth-Token': session.creds["idrac_x_auth_token"]}
+            response = session.client.post(url, data=json.dumps(payload), headers=headers, verify=session.creds["verify_cert"])
         else:
             headers = {'content-type': 'application/json'}
-            response = requests.post(url, data=json.dumps(payload), headers=headers, verify=creds["verify_cert"],auth=(creds["idrac_username"],creds["idrac_password"]))
+            response = session.client.post(url, data=json.dumps(payload), headers=headers, verify=session.creds["verify_cert"],auth=(session.creds["idrac_username"],session.creds["idrac_password"]))
         response_output = response.__dict__
         if response.status_code == 401:
                 logging.info("- INFO, status code 401 detected, iDRAC username password changed while applying configuration changes. Access the iDRAC using new password to check job status")
@@ -5303,6 +6275,7 @@ def export_import_server_configuration_profile_network_share(script_examples="",
         start_time = datetime.now()
         count = 1
         get_job_status_count = 1
+        job_poller = JobPoller(job_type="ImportConfiguration")
         while True:
             if count == 10:
                 logging.error("- FAIL, 10 attempts at getting job status failed, script will exit")
@@ -5311,14 +6284,14 @@ def export_import_server_configuration_profile_network_share(script_examples="",
                 logging.info("- INFO, retry count of 10 has been hit for retry job status GET request, script will exit")
                 return
             try:
-                if x_auth_token == "yes":
-                    response = requests.get('https://%s/redfish/v1/TaskService/Tasks/%s' % (creds["idrac_ip"], job_id), verify=creds["verify_cert"],headers={'X-Auth-Token': creds["idrac_x_auth_token"]})    
+                if session.x_auth_token == "yes":
+                    response = session.client.get('https://%s/redfish/v1/TaskService/Tasks/%s' % (session.creds["idrac_ip"], job_id), verify=session.creds["verify_cert"],headers={'X-Auth-Token': session.creds["idrac_x_auth_token"]})    
                 else:
-                    response = requests.get('https://%s/redfish/v1/TaskService/Tasks/%s' % (creds["idrac_ip"], job_id), verify=creds["verify_cert"],auth=(creds["idrac_username"], creds["idrac_password"]))
+                    response = session.client.get('https://%s/redfish/v1/TaskService/Tasks/%s' % (session.creds["idrac_ip"], job_id), verify=session.creds["verify_cert"],auth=(session.creds["idrac_username"], session.creds["idrac_password"]))
                     data = response.json()
             except requests.ConnectionError as error_message:
                 logging.error("- FAIL, requests command failed to GET job status, detailed error information: \n%s" % error_message)
-                time.sleep(10)
+                job_poller.wait()
                 logging.info("- INFO, script will now attempt to get job status again")
                 count += 1
                 continue
@@ -5338,12 +6311,12 @@ def export_import_server_configuration_profile_network_share(script_examples="",
             else:
                 logging.error("- ERROR, query job ID command failed, error code: %s, retry" % response.status_code)
                 count += 1
-                time.sleep(5)
+                job_poller.wait(response=response)
                 continue
             if "Oem" not in data:
                 logging.info("- INFO, unable to locate OEM data in JSON response, retry")
                 get_job_status_count += 1
-                time.sleep(5)
+                job_poller.wait(response=response)
                 continue
             if data['Oem']['Dell']['JobState'] == "Failed" or data['Oem']['Dell']['JobState'] == "CompletedWithErrors":
                 logging.info("\n- INFO, job ID %s status marked as \"%s\"" % (job_id, data['Oem']['Dell']['JobState']))
@@ -5426,7 +6399,7 @@ def export_import_server_configuration_profile_network_share(script_examples="",
                 return
             else:
                 logging.info("- INFO, job not completed, current status: \"%s\", percent complete: \"%s\"" % (data['Oem']['Dell']['Message'],data['Oem']['Dell']['PercentComplete']))
-                time.sleep(2)
+                job_poller.wait(response=response, data=data)
                 continue
     else:
         logging.error("- ERROR, either incorrect or missing function arguments detected. Check doc help for more details or execute examples")
@@ -5434,6 +6407,7 @@ def export_import_server_configuration_profile_network_share(script_examples="",
 
 def preview_server_configuration_profile_local(script_examples="", profile_name=""):
     """Function to preview server configuration profile locally. Supported function parameters: script_examples (supported value: True) and profile_name (pass in the string name of your profile)."""
+    session = get_script_session()
     if script_examples:
         print("""\n- IdracRedfishSupport.preview_server_configuration_profile_local(profile_name="R640_SCP_export.xml"), this example will preview server configuration profile.\n""")
         return
@@ -5444,7 +6418,7 @@ def preview_server_configuration_profile_local(script_examples="", profile_name=
         except:
             logging.error("\n-FAIL, \"%s\" file doesn't exist" % profile_name)
             return
-    url = 'https://%s/redfish/v1/Managers/iDRAC.Embedded.1/Actions/Oem/EID_674_Manager.ImportSystemConfigurationPreview' % creds["idrac_ip"]
+    url = 'https://%s/redfish/v1/Managers/iDRAC.Embedded.1/Actions/Oem/EID_674_Manager.ImportSystemConfigurationPreview' % session.creds["idrac_ip"]
     
     # Code needed to modify XML or JSON to one string to pass in for POST command
     modify_file = file_open.read()
@@ -5455,12 +6429,12 @@ def preview_server_configuration_profile_local(script_examples="", profile_name=
     
     payload = {"ImportBuffer":"","ShareParameters":{"Target":"ALL"}}
     payload["ImportBuffer"] = scp_file_string
-    if x_auth_token == "yes":
-        headers = {'content-type': 'application/json', 'X-Auth-Token': creds["idrac_x_auth_token"]}
-        response = requests.post(url, data=json.dumps(payload), headers=headers, verify=creds["verify_cert"])
+    if session.x_auth_token == "yes":
+        headers = {'content-type': 'application/json', 'X-Auth-Token': session.creds["idrac_x_auth_token"]}
+        response = session.client.post(url, data=json.dumps(payload), headers=headers, verify=session.creds["verify_cert"])
     else:
         headers = {'content-type': 'application/json'}
-        response = requests.post(url, data=json.dumps(payload), headers=headers, verify=creds["verify_cert"],auth=(creds["idrac_username"],creds["idrac_password"]))
+        response = session.client.post(url, data=json.dumps(payload), headers=headers, verify=session.creds["verify_cert"],auth=(session.creds["idrac_username"],session.creds["idrac_password"]))
     if response.status_code == 401:
         logging.info("- INFO, status code 401 detected, iDRAC username password changed while applying configuration changes. Access the iDRAC using new password to check job status")
         return
@@ -5475,11 +6449,12 @@ def preview_server_configuration_profile_local(script_examples="", profile_name=
         return
     logging.info("\n- %s successfully created for ImportSystemConfigurationPreview method\n" % (job_id) )
     start_time = datetime.now()
+    job_poller = JobPoller(job_type="ImportConfiguration")
     while True:
-        if x_auth_token == "yes":
-            response = requests.get('https://%s/redfish/v1/TaskService/Tasks/%s' % (creds["idrac_ip"], job_id), verify=creds["verify_cert"],headers={'X-Auth-Token': creds["idrac_x_auth_token"]})    
+        if session.x_auth_token == "yes":
+            response = session.client.get('https://%s/redfish/v1/TaskService/Tasks/%s' % (session.creds["idrac_ip"], job_id), verify=session.creds["verify_cert"],headers={'X-Auth-Token': session.creds["idrac_x_auth_token"]})    
         else:
-            response = requests.get('https://%s/redfish/v1/TaskService/Tasks/%s' % (creds["idrac_ip"], job_id), verify=creds["verify_cert"],auth=(creds["idrac_username"], creds["idrac_password"]))
+            response = session.client.get('https://%s/redfish/v1/TaskService/Tasks/%s' % (session.creds["idrac_ip"], job_id), verify=session.creds["verify_cert"],auth=(session.creds["idrac_username"], session.creds["idrac_password"]))
         data = response.json()
         message_string = data["Messages"]
         final_message_string = str(message_string)
@@ -5529,7 +6504,7 @@ def preview_server_configuration_profile_local(script_examples="", profile_name=
             return
         else:
             logging.info("- INFO, job not marked completed, current status: %s" % data["TaskState"])
-            time.sleep(3)
+            job_poller.wait(response=response, data=data)
             continue
     else:
         logging.error("- ERROR, either incorrect or missing function arguments detected. Check doc help for more details or execute examples")
@@ -5537,12 +6512,13 @@ def preview_server_configuration_profile_local(script_examples="", profile_name=
 
 def preview_server_configuration_profile_network_share(script_examples="", profile_name="", share_ip="", share_name="", share_type="", share_username="", share_password="", ignore_certwarning=""):
     """Function to preview server configuration profile (SCP) from a network share. Supported function arguments: profile_name (pass in name of profile), share_type (supported values: NFS, CIFS, HTTP and HTTPS), share_ip, share_name, share_username, share_password, ignore_certwarning (only valid for HTTPS and is optional, supported values On and Off)"""
+    session = get_script_session()
     if script_examples:
         print("""\n- IdracRedfishSupport.preview_server_configuration_profile_network_share(profile_name="R640_scp_file.xml", share_ip="192.168.0.130", share_name="/nfs", share_type="NFS"), this example will preview SCP profile on NFS share.
         \n- IdracRedfishSupport.preview_server_configuration_profile_network_share(profile_name="R750_scp_file.json", share_ip="192.168.0.140", share_name="cifs_share", share_type="CIFS, share_username="admin", share_password="password"), this example will preview SCP profile on a CIFS share.""")
         return
     elif profile_name:
-        url = 'https://%s/redfish/v1/Managers/iDRAC.Embedded.1/Actions/Oem/EID_674_Manager.ImportSystemConfigurationPreview' % creds["idrac_ip"]
+        url = 'https://%s/redfish/v1/Managers/iDRAC.Embedded.1/Actions/Oem/EID_674_Manager.ImportSystemConfigurationPreview' % session.creds["idrac_ip"]
         payload = {"ShareParameters":{"Target":"ALL"}}
         if share_ip:
             payload["ShareParameters"]["IPAddress"] = share_ip
@@ -5558,12 +6534,12 @@ def preview_server_configuration_profile_network_share(script_examples="", profi
             payload["ShareParameters"]["Password"] = share_password
         if ignore_certwarning:
             payload["ShareParameters"]["IgnoreCertificateWarning"] = ignore_certwarning
-        if x_auth_token == "yes":
-            headers = {'content-type': 'application/json', 'X-Auth-Token': creds["idrac_x_auth_token"]}
-            response = requests.post(url, data=json.dumps(payload), headers=headers, verify=creds["verify_cert"])
+        if session.x_auth_token == "yes":
+            headers = {'content-type': 'application/json', 'X-Auth-Token': session.creds["idrac_x_auth_token"]}
+            response = session.client.post(url, data=json.dumps(payload), headers=headers, verify=session.creds["verify_cert"])
         else:
             headers = {'content-type': 'application/json'}
-            response = requests.post(url, data=json.dumps(payload), headers=headers, verify=creds["verify_cert"],auth=(creds["idrac_username"],creds["idrac_password"]))
+            response = session.client.post(url, data=json.dumps(payload), headers=headers, verify=session.creds["verify_cert"],auth=(session.creds["idrac_username"],session.creds["idrac_password"]))
         if response.status_code == 401:
             logging.info("- INFO, status code 401 detected, iDRAC username password changed while applying configuration changes. Access the iDRAC using new password to check job status")
             return
@@ -5577,11 +6553,12 @@ def preview_server_configuration_profile_network_share(script_examples="", profi
             return
         logging.info("\n- %s successfully created for ImportSystemConfigurationPreview method\n" % (job_id) )
         start_time = datetime.now()
+        job_poller = JobPoller(job_type="ImportConfiguration")
         while True:
-            if x_auth_token == "yes":
-                response = requests.get('https://%s/redfish/v1/TaskService/Tasks/%s' % (creds["idrac_ip"], job_id), verify=creds["verify_cert"],headers={'X-Auth-Token': creds["idrac_x_auth_token"]})    
+            if session.x_auth_token == "yes":
+                response = session.client.get('https://%s/redfish/v1/TaskService/Tasks/%s' % (session.creds["idrac_ip"], job_id), verify=session.creds["verify_cert"],headers={'X-Auth-Token': session.creds["idrac_x_auth_token"]})    
             else:
-                response = requests.get('https://%s/redfish/v1/TaskService/Tasks/%s' % (creds["idrac_ip"], job_id), verify=creds["verify_cert"],auth=(creds["idrac_username"], creds["idrac_password"]))
+                response = session.client.get('https://%s/redfish/v1/TaskService/Tasks/%s' % (session.creds["idrac_ip"], job_id), verify=session.creds["verify_cert"],auth=(session.creds["idrac_username"], session.creds["idrac_password"]))
             data = response.json()
             message_string = data["Messages"]
             final_message_string = str(message_string)
@@ -5631,7 +6608,7 @@ def preview_server_configuration_profile_network_share(script_examples="", profi
                 return
             else:
                 logging.info("- INFO, job not marked completed, current status: %s" % data["TaskState"])
-                time.sleep(3)
+                job_poller.wait(response=response, data=data)
                 continue
     else:
         logging.error("- ERROR, either incorrect or missing function arguments detected. Check doc help for more details or execute examples")
@@ -5640,14 +6617,15 @@ def preview_server_configuration_profile_network_share(script_examples="", profi
 
 def get_set_chassis_indicator_LED(script_examples="", get_LED_status="", set_LED=""):
     """Function to either get current chassis LED status or blink chassis LED. Supported function arguments: script_examples (supported value: True), get_LED_status (supported value: True) and set_LED (supported values: Blinking and Lit)."""
+    session = get_script_session()
     if script_examples:
         print("""\n- IdracRedfishSupport.get_set_chassis_indicator_LED(get_LED_status=True), this example will get current chassis LED status.
         \n- IdracRedfishSupport.get_set_chassis_indicator_LED(set_LED="Blinking"), this example will blink chassis LED.""")    
     elif get_LED_status:
-        if x_auth_token == "yes":
-            response = requests.get('https://%s/redfish/v1/Chassis/System.Embedded.1' % creds["idrac_ip"], verify=creds["verify_cert"],headers={'X-Auth-Token': creds["idrac_x_auth_token"]})    
+        if session.x_auth_token == "yes":
+            response = session.client.get('https://%s/redfish/v1/Chassis/System.Embedded.1' % session.creds["idrac_ip"], verify=session.creds["verify_cert"],headers={'X-Auth-Token': session.creds["idrac_x_auth_token"]})    
         else:
-            response = requests.get('https://%s/redfish/v1/Chassis/System.Embedded.1' % creds["idrac_ip"], verify=creds["verify_cert"],auth=(creds["idrac_username"], creds["idrac_password"]))
+            response = session.client.get('https://%s/redfish/v1/Chassis/System.Embedded.1' % session.creds["idrac_ip"], verify=session.creds["verify_cert"],auth=(session.creds["idrac_username"], session.creds["idrac_password"]))
         data = response.json()
         if response.status_code == 401:
             logging.warning("\n- WARNING, status code 401 detected, check iDRAC username / password credentials")
@@ -5657,14 +6635,14 @@ def get_set_chassis_indicator_LED(script_examples="", get_LED_status="", set_LED
             return
         logging.info("\n- INFO, current chassis indicator LED state: %s" % data['IndicatorLED'])
     elif set_LED:
-        url = 'https://%s/redfish/v1/Chassis/System.Embedded.1' % creds["idrac_ip"]
+        url = 'https://%s/redfish/v1/Chassis/System.Embedded.1' % session.creds["idrac_ip"]
         payload = {'IndicatorLED': set_LED}
-        if x_auth_token == "yes":
-            headers = {'content-type': 'application/json', 'X-Auth-Token': creds["idrac_x_auth_token"]}
-            response = requests.patch(url, data=json.dumps(payload), headers=headers, verify=creds["verify_cert"])
+        if session.x_auth_token == "yes":
+            headers = {'content-type': 'application/json', 'X-Auth-Token': session.creds["idrac_x_auth_token"]}
+            response = session.client.patch(url, data=json.dumps(payload), headers=headers, verify=session.creds["verify_cert"])
         else:
             headers = {'content-type': 'application/json'}
-            response = requests.patch(url, data=json.dumps(payload), headers=headers, verify=creds["verify_cert"],auth=(creds["idrac_username"],creds["idrac_password"]))
+            response = session.client.patch(url, data=json.dumps(payload), headers=headers, verify=session.creds["verify_cert"],auth=(session.creds["idrac_username"],session.creds["idrac_password"]))
         if response.status_code == 200:
             logging.info("\n- PASS, PATCH command successfully completed \"%s\" request for chassis indicator LED" % set_LED)
         else:
@@ -5676,20 +6654,21 @@ def get_set_chassis_indicator_LED(script_examples="", get_LED_status="", set_LED
 
 def supportassist_schedule_auto_collection(script_examples="", get_supportassist_auto_collection_details="", clear_supportassist_auto_collection="", set_supportassist_auto_collection="", recurrence="", time="", dayofweek="", dayofmonth=""):
     """Function to either get, clear or set SupportAssist scheduled collection. Supported function arguments: script_examples (supported value: True), get_supportassist_auto_collection_details (supported value: True), clear_supportassist_auto_collection (supported value: True), set_supportassist_auto_collection_details (supported value: True), recurrence (supported values: Weekly, Monthly and Quarterly), time (supported time format: HH:MMAM/PM, example: \"06:00PM\"), dayofweek (supported values: Mon, Tue, Wed, Thu, Fri, Sat, Sun or * for all days of the week) and dayofmonth (supported values: 1 through 32 or L for last day or * for all days of the month)."""
+    session = get_script_session()
     if script_examples:
         print("""\n- IdracRedfishSupport.supportassist_schedule_auto_collection(get_supportassist_auto_collection_details=True), this example will get current SupportAssist scheduled collection details.
         \n- IdracRedfishSupport.supportassist_schedule_auto_collection(clear_supportassist_auto_collection=True), this example will clear current SupportAssist scheduled collection.
         \n- IdracRedfishSupport.supportassist_schedule_auto_collection(set_supportassist_auto_collection=True, recurrence="Monthly", time="06:00PM", dayofweek="Sat", dayofmonth="L"), this example shows setting SupportAssist auto collection schedule which will run monthly at 6PM on the last Saturday of the month. NOTE: Once you create scheduled SA collection, you can also check the job queue to see this scheduled task.""")
     
     elif get_supportassist_auto_collection_details:
-        url = 'https://%s/redfish/v1/Dell/Managers/iDRAC.Embedded.1/DellLCService/Actions/DellLCService.SupportAssistGetAutoCollectSchedule' % creds["idrac_ip"]
+        url = 'https://%s/redfish/v1/Dell/Managers/iDRAC.Embedded.1/DellLCService/Actions/DellLCService.SupportAssistGetAutoCollectSchedule' % session.creds["idrac_ip"]
         payload = {}
-        if x_auth_token == "yes":
-            headers = {'content-type': 'application/json', 'X-Auth-Token': creds["idrac_x_auth_token"]}
-            response = requests.post(url, data=json.dumps(payload), headers=headers, verify=creds["verify_cert"])
+        if session.x_auth_token == "yes":
+            headers = {'content-type': 'application/json', 'X-Auth-Token': session.creds["idrac_x_auth_token"]}
+            response = session.client.post(url, data=json.dumps(payload), headers=headers, verify=session.creds["verify_cert"])
         else:
             headers = {'content-type': 'application/json'}
-            response = requests.post(url, data=json.dumps(payload), headers=headers, verify=creds["verify_cert"],auth=(creds["idrac_username"],creds["idrac_password"]))
+            response = session.client.post(url, data=json.dumps(payload), headers=headers, verify=session.creds["verify_cert"],auth=(session.creds["idrac_username"],session.creds["idrac_password"]))
         data = response.json()
         if response.status_code == 200:
             logging.info("\n- PASS, POST command passed to get SupportAssist auto collection details\n")
@@ -5701,14 +6680,14 @@ def supportassist_schedule_auto_collection(script_examples="", get_supportassist
                 print("%s: %s" % (i[0], i[1]))
 
     elif clear_supportassist_auto_collection:
-        url = 'https://%s/redfish/v1/Dell/Managers/iDRAC.Embedded.1/DellLCService/Actions/DellLCService.SupportAssistClearAutoCollectSchedule' % creds["idrac_ip"]
+        url = 'https://%s/redfish/v1/Dell/Managers/iDRAC.Embedded.1/DellLCService/Actions/DellLCService.SupportAssistClearAutoCollectSchedule' % session.creds["idrac_ip"]
         payload = {}
-        if x_auth_token == "yes":
-            headers = {'content-type': 'application/json', 'X-Auth-Token': creds["idrac_x_auth_token"]}
-            response = requests.post(url, data=json.dumps(payload), headers=headers, verify=creds["verify_cert"])
+        if session.x_auth_token == "yes":
+            headers = {'content-type': 'application/json', 'X-Auth-Token': session.creds["idrac_x_auth_token"]}
+            response = session.client.post(url, data=json.dumps(payload), headers=headers, verify=session.creds["verify_cert"])
         else:
             headers = {'content-type': 'application/json'}
-            response = requests.post(url, data=json.dumps(payload), headers=headers, verify=creds["verify_cert"],auth=(creds["idrac_username"],creds["idrac_password"]))
+            response = session.client.post(url, data=json.dumps(payload), headers=headers, verify=session.creds["verify_cert"],auth=(session.creds["idrac_username"],session.creds["idrac_password"]))
         data = response.json()
         if response.status_code == 200:
             logging.info("\n- PASS, POST command passed to clear SupportAssist auto collection details\n")
@@ -5717,7 +6696,7 @@ def supportassist_schedule_auto_collection(script_examples="", get_supportassist
             return
 
     elif set_supportassist_auto_collection:
-        url = 'https://%s/redfish/v1/Dell/Managers/iDRAC.Embedded.1/DellLCService/Actions/DellLCService.SupportAssistSetAutoCollectSchedule' % creds["idrac_ip"]
+        url = 'https://%s/redfish/v1/Dell/Managers/iDRAC.Embedded.1/DellLCService/Actions/DellLCService.SupportAssistSetAutoCollectSchedule' % session.creds["idrac_ip"]
         payload = {}
         if recurrence:
             payload["Recurrence"] = recurrence
@@ -5727,12 +6706,12 @@ def supportassist_schedule_auto_collection(script_examples="", get_supportassist
             payload["DayOfWeek"] = dayofweek
         if dayofmonth:
             payload["DayOfMonth"] = dayofmonth       
-        if x_auth_token == "yes":
-            headers = {'content-type': 'application/json', 'X-Auth-Token': creds["idrac_x_auth_token"]}
-            response = requests.post(url, data=json.dumps(payload), headers=headers, verify=creds["verify_cert"])
+        if session.x_auth_token == "yes":
+            headers = {'content-type': 'application/json', 'X-Auth-Token': session.creds["idrac_x_auth_token"]}
+            response = session.client.post(url, data=json.dumps(payload), headers=headers, verify=session.creds["verify_cert"])
         else:
             headers = {'content-type': 'application/json'}
-            response = requests.post(url, data=json.dumps(payload), headers=headers, verify=creds["verify_cert"],auth=(creds["idrac_username"],creds["idrac_password"]))
+            response = session.client.post(url, data=json.dumps(payload), headers=headers, verify=session.creds["verify_cert"],auth=(session.creds["idrac_username"],session.creds["idrac_password"]))
         data = response.json()
         if response.status_code == 200:
             logging.info("\n- PASS, POST command passed to set SupportAssist auto collection details\n")
@@ -5746,6 +6725,7 @@ def supportassist_schedule_auto_collection(script_examples="", get_supportassist
 
 def create_modify_delete_iDRAC_users(script_examples="", get_current_users="", create_user="", new_username="", user_id="", role_id="", enable_user="", disable_user="", modify_user="", delete_user="", change_password=""):
     """Function to create, modify or delete iDRAC user accounts. Supported function arguments: script_examples (supported value: True), get_current_users (supported value: True), create_user (supported value: True), new_username, user_id (possible values: 2 thru 16), role_id (supported values: Administrator, Operator, ReadOnly and None), enable_user (supported value: True), disable_user (supported_value: True), modify_user (supported value: pass in user ID you want to modify, 2 thru 16), delete_user (supported value: pass in the user ID you want to delete, 2 thru 16) and change_password."""
+    session = get_script_session()
     if script_examples:
         print("""\n-IdracRedfishSupport.create_modify_delete_iDRAC_users(get_current_users=True), this example will get current iDRAC user account details.
         \n- IdracRedfishSupport.create_modify_delete_iDRAC_users(create_user=True, new_username=\"tester\", user_id=\"16\", role_id=\"Administrator\", enable_user=True), this example will create new user for ID 16 with administrator privileges and enabled. You will be prompted to enter password which will not be echoed to the screen.
@@ -5756,10 +6736,10 @@ def create_modify_delete_iDRAC_users(script_examples="", get_current_users="", c
         \n- IdracRedfishSupport.create_modify_delete_iDRAC_users(delete_user=\"16\"), this example shows deleting user ID 16""")
     
     elif get_current_users:
-        if x_auth_token == "yes":
-            response = requests.get('https://%s/redfish/v1/Managers/iDRAC.Embedded.1/Accounts?$expand=*($levels=1)' % creds["idrac_ip"], verify=creds["verify_cert"],headers={'X-Auth-Token': creds["idrac_x_auth_token"]})    
+        if session.x_auth_token == "yes":
+            response = session.client.get('https://%s/redfish/v1/Managers/iDRAC.Embedded.1/Accounts?$expand=*($levels=1)' % session.creds["idrac_ip"], verify=session.creds["verify_cert"],headers={'X-Auth-Token': session.creds["idrac_x_auth_token"]})    
         else:
-            response = requests.get('https://%s/redfish/v1/Managers/iDRAC.Embedded.1/Accounts?$expand=*($levels=1)' % creds["idrac_ip"], verify=creds["verify_cert"],auth=(creds["idrac_username"], creds["idrac_password"]))
+            response = session.client.get('https://%s/redfish/v1/Managers/iDRAC.Embedded.1/Accounts?$expand=*($levels=1)' % session.creds["idrac_ip"], verify=session.creds["verify_cert"],auth=(session.creds["idrac_username"], session.creds["idrac_password"]))
         data = response.json()
         if response.status_code != 200:
             logging.error("- ERROR, GET command failed, status code %s returned, error results: %s" % (response.status_code, data))
@@ -5772,14 +6752,14 @@ def create_modify_delete_iDRAC_users(script_examples="", get_current_users="", c
         
     elif create_user:
         new_iDRAC_username_password = getpass.getpass("\n- Pass in new password to create new iDRAC user %s: " % new_username)
-        url = 'https://%s/redfish/v1/Managers/iDRAC.Embedded.1/Accounts/%s' % (creds["idrac_ip"], user_id)
+        url = 'https://%s/redfish/v1/Managers/iDRAC.Embedded.1/Accounts/%s' % (session.creds["idrac_ip"], user_id)
         payload = {"UserName":new_username, "Password":new_iDRAC_username_password, "RoleId":str(role_id), "Enabled":enable_user}        
-        if x_auth_token == "yes":
-            headers = {'content-type': 'application/json', 'X-Auth-Token': creds["idrac_x_auth_token"]}
-            response = requests.patch(url, data=json.dumps(payload), headers=headers, verify=creds["verify_cert"])
+        if session.x_auth_token == "yes":
+            headers = {'content-type': 'application/json', 'X-Auth-Token': session.creds["idrac_x_auth_token"]}
+            response = session.client.patch(url, data=json.dumps(payload), headers=headers, verify=session.creds["verify_cert"])
         else:
             headers = {'content-type': 'application/json'}
-            response = requests.patch(url, data=json.dumps(payload), headers=headers, verify=creds["verify_cert"],auth=(creds["idrac_username"],creds["idrac_password"]))
+            response = session.client.patch(url, data=json.dumps(payload), headers=headers, verify=session.creds["verify_cert"],auth=(session.creds["idrac_username"],session.creds["idrac_password"]))
         data = response.json()
         if response.status_code == 200:
             logging.info("\n- PASS, PATCH command passed to create new iDRAC user %s\n" % new_username)
@@ -5788,7 +6768,7 @@ def create_modify_delete_iDRAC_users(script_examples="", get_current_users="", c
             return
        
     elif modify_user:
-        url = 'https://%s/redfish/v1/Managers/iDRAC.Embedded.1/Accounts/%s' % (creds["idrac_ip"], str(modify_user))
+        url = 'https://%s/redfish/v1/Managers/iDRAC.Embedded.1/Accounts/%s' % (session.creds["idrac_ip"], str(modify_user))
         payload = {}
         if disable_user:
             payload["Enabled"] = False
@@ -5802,12 +6782,12 @@ def create_modify_delete_iDRAC_users(script_examples="", get_current_users="", c
             payload["UserName"] = new_username
         if role_id:
             payload["RoleId"] = role_id
-        if x_auth_token == "yes":
-            headers = {'content-type': 'application/json', 'X-Auth-Token': creds["idrac_x_auth_token"]}
-            response = requests.patch(url, data=json.dumps(payload), headers=headers, verify=creds["verify_cert"])
+        if session.x_auth_token == "yes":
+            headers = {'content-type': 'application/json', 'X-Auth-Token': session.creds["idrac_x_auth_token"]}
+            response = session.client.patch(url, data=json.dumps(payload), headers=headers, verify=session.creds["verify_cert"])
         else:
             headers = {'content-type': 'application/json'}
-            response = requests.patch(url, data=json.dumps(payload), headers=headers, verify=creds["verify_cert"],auth=(creds["idrac_username"],creds["idrac_password"]))
+            response = session.client.patch(url, data=json.dumps(payload), headers=headers, verify=session.creds["verify_cert"],auth=(session.creds["idrac_username"],session.creds["idrac_password"]))
         data = response.json()
         if response.status_code == 200:
             logging.info("\n- PASS, PATCH command passed to modify iDRAC user ID %s" % str(modify_user))
@@ -5816,14 +6796,14 @@ def create_modify_delete_iDRAC_users(script_examples="", get_current_users="", c
             return
     
     elif delete_user:
-        url = 'https://%s/redfish/v1/Managers/iDRAC.Embedded.1/Accounts/%s' % (creds["idrac_ip"], str(delete_user))
+        url = 'https://%s/redfish/v1/Managers/iDRAC.Embedded.1/Accounts/%s' % (session.creds["idrac_ip"], str(delete_user))
         payload = {"Enabled":False,"RoleId":"None"}
-        if x_auth_token == "yes":
-            headers = {'content-type': 'application/json', 'X-Auth-Token': creds["idrac_x_auth_token"]}
-            response = requests.patch(url, data=json.dumps(payload), headers=headers, verify=creds["verify_cert"])
+        if session.x_auth_token == "yes":
+            headers = {'content-type': 'application/json', 'X-Auth-Token': session.creds["idrac_x_auth_token"]}
+            response = session.client.patch(url, data=json.dumps(payload), headers=headers, verify=session.creds["verify_cert"])
         else:
             headers = {'content-type': 'application/json'}
-            response = requests.patch(url, data=json.dumps(payload), headers=headers, verify=creds["verify_cert"],auth=(creds["idrac_username"],creds["idrac_password"]))
+            response = session.client.patch(url, data=json.dumps(payload), headers=headers, verify=session.creds["verify_cert"],auth=(session.creds["idrac_username"],session.creds["idrac_password"]))
         data=response.json()
         if response.status_code == 200:
             logging.info("\n- PASS, PATCH command passed to delete iDRAC user ID %s\n" % str(delete_user))
@@ -5831,12 +6811,12 @@ def create_modify_delete_iDRAC_users(script_examples="", get_current_users="", c
             logging.error("\n- ERROR, status code %s returned, detailed error information:\n %s" % (response.status_code, data))
             return
         payload = {"UserName":""}
-        if x_auth_token == "yes":
-            headers = {'content-type': 'application/json', 'X-Auth-Token': creds["idrac_x_auth_token"]}
-            response = requests.patch(url, data=json.dumps(payload), headers=headers, verify=creds["verify_cert"])
+        if session.x_auth_token == "yes":
+            headers = {'content-type': 'application/json', 'X-Auth-Token': session.creds["idrac_x_auth_token"]}
+            response = session.client.patch(url, data=json.dumps(payload), headers=headers, verify=session.creds["verify_cert"])
         else:
             headers = {'content-type': 'application/json'}
-            response = requests.patch(url, data=json.dumps(payload), headers=headers, verify=creds["verify_cert"],auth=(creds["idrac_username"],creds["idrac_password"]))
+            response = session.client.patch(url, data=json.dumps(payload), headers=headers, verify=session.creds["verify_cert"],auth=(session.creds["idrac_username"],session.creds["idrac_password"]))
         data=response.json()
         if response.status_code != 200:
             logging.error("\n- ERROR, status code %s returned, detailed error information:\n %s" % (response.status_code, data))
@@ -5848,6 +6828,7 @@ def create_modify_delete_iDRAC_users(script_examples="", get_current_users="", c
 
 def install_from_repository(script_examples="", get_fw_inventory="", get_repo_update_list="", get_device_name_criticality_info= "", repository_update="", share_ip="", share_type="", share_name="", share_username="", share_password="", apply_update="", reboot_needed="", catalog_file="", ignore_certwarning=""):
     """Function to either get current firmware inventory, get repository update list details, criticality repository details or perform install from repository. Supported arguments and possible values: get_fw_inventory (supported value: True), get_repo_update_list (supported value: True), get_device_name_criticality_info (supported_value: True), repository_update (supported value: True), share_ip, share_type (supported values: NFS, CIFS, HTTP and HTTPS), share_name, share_username (only required if using CIFS or secure HTTP/HTTPS), share_password (only required if using CIFS or secured HTTP/HTTPS), apply_update (supported values: yes and no), reboot_needed (supported values: yes and no), catalog_file (only required if default catalog name is not used (Catalog.xml)), ignore_certwarning (supported values: On and Off, only valid to use with HTTPS. If not passed in, default value is On)""" 
+    session = get_script_session()
     if script_examples:
         print("""\n- IdracRedfishSupport.install_from_repository(get_fw_inventory=True), this example will get current firmware inventory for all supported devices
         \n- IdracRedfishSupport.install_from_repository(get_repo_update_list=True), this example will get current repository list details, versions that are listed on the repository that can be updated. Before running this command, you need to perform install from repository first with reboot_needed = no and apply_update = no.
@@ -5856,11 +6837,11 @@ def install_from_repository(script_examples="", get_fw_inventory="", get_repo_up
         \n- IdracRedfishSupport.install_from_repository(repository_update=True, share_ip="downloads.dell.com", share_type="HTTPS", apply_update="yes", reboot_needed="yes"). this example shows using HTTPS share "downloads.dell.com" to perform repository update. Any updates which do not require a server reboot will get installed first, then reboot the server to apply any updates which require a server reboot. Note: If iDRAC update is detected, this will always get updated last due to iDRAC reboots after the update is complete.""")   
     
     elif get_fw_inventory:
-        logging.info("\n- INFO, getting current firmware inventory for iDRAC %s -\n" % creds["idrac_ip"])
-        if x_auth_token == "yes":
-            response = requests.get('https://%s/redfish/v1/UpdateService/FirmwareInventory?$expand=*($levels=1)' % creds["idrac_ip"],verify=creds["verify_cert"],headers={'X-Auth-Token': creds["idrac_x_auth_token"]})    
+        logging.info("\n- INFO, getting current firmware inventory for iDRAC %s -\n" % session.creds["idrac_ip"])
+        if session.x_auth_token == "yes":
+            response = session.client.get('https://%s/redfish/v1/UpdateService/FirmwareInventory?$expand=*($levels=1)' % session.creds["idrac_ip"],verify=session.creds["verify_cert"],headers={'X-Auth-Token': session.creds["idrac_x_auth_token"]})    
         else:
-            response = requests.get('https://%s/redfish/v1/UpdateService/FirmwareInventory?$expand=*($levels=1)' % creds["idrac_ip"],verify=creds["verify_cert"],auth=(creds["idrac_username"], creds["idrac_password"]))
+            response = session.client.get('https://%s/redfish/v1/UpdateService/FirmwareInventory?$expand=*($levels=1)' % session.creds["idrac_ip"],verify=session.creds["verify_cert"],auth=(session.creds["idrac_username"], session.creds["idrac_password"]))
         if response.status_code == 200:
             logging.info("- INFO, GET command passed to get firmware inventory")
         else:
@@ -5884,14 +6865,14 @@ def install_from_repository(script_examples="", get_fw_inventory="", get_repo_up
         except:
             pass
         open_file = open("repo_based_update_list.xml","a")
-        url = 'https://%s/redfish/v1/Dell/Systems/System.Embedded.1/DellSoftwareInstallationService/Actions/DellSoftwareInstallationService.GetRepoBasedUpdateList' % (creds["idrac_ip"])
+        url = 'https://%s/redfish/v1/Dell/Systems/System.Embedded.1/DellSoftwareInstallationService/Actions/DellSoftwareInstallationService.GetRepoBasedUpdateList' % (session.creds["idrac_ip"])
         payload={}
-        if x_auth_token == "yes":
-            headers = {'content-type': 'application/json', 'X-Auth-Token': creds["idrac_x_auth_token"]}
-            response = requests.post(url, data=json.dumps(payload), headers=headers, verify=creds["verify_cert"])
+        if session.x_auth_token == "yes":
+            headers = {'content-type': 'application/json', 'X-Auth-Token': session.creds["idrac_x_auth_token"]}
+            response = session.client.post(url, data=json.dumps(payload), headers=headers, verify=session.creds["verify_cert"])
         else:
             headers = {'content-type': 'application/json'}
-            response = requests.post(url, data=json.dumps(payload), headers=headers, verify=creds["verify_cert"],auth=(creds["idrac_username"],creds["idrac_password"]))
+            response = session.client.post(url, data=json.dumps(payload), headers=headers, verify=session.creds["verify_cert"],auth=(session.creds["idrac_username"],session.creds["idrac_password"]))
         data = response.json()
         if response.status_code == 200:
             logging.info("\n- PASS: POST command passed to get repo update list, status code 200 returned")
@@ -5908,14 +6889,14 @@ def install_from_repository(script_examples="", get_fw_inventory="", get_repo_up
 
     elif get_device_name_criticality_info:
         logging.info("\n- Device Name and Criticality Details for Updatable Devices -\n")
-        url = 'https://%s/redfish/v1/Dell/Systems/System.Embedded.1/DellSoftwareInstallationService/Actions/DellSoftwareInstallationService.GetRepoBasedUpdateList' % (creds["idrac_ip"])
+        url = 'https://%s/redfish/v1/Dell/Systems/System.Embedded.1/DellSoftwareInstallationService/Actions/DellSoftwareInstallationService.GetRepoBasedUpdateList' % (session.creds["idrac_ip"])
         payload={}
-        if x_auth_token == "yes":
-            headers = {'content-type': 'application/json', 'X-Auth-Token': creds["idrac_x_auth_token"]}
-            response = requests.post(url, data=json.dumps(payload), headers=headers, verify=creds["verify_cert"])
+        if session.x_auth_token == "yes":
+            headers = {'content-type': 'application/json', 'X-Auth-Token': session.creds["idrac_x_auth_token"]}
+            response = session.client.post(url, data=json.dumps(payload), headers=headers, verify=session.creds["verify_cert"])
         else:
             headers = {'content-type': 'application/json'}
-            response = requests.post(url, data=json.dumps(payload), headers=headers, verify=creds["verify_cert"],auth=(creds["idrac_username"],creds["idrac_password"]))
+            response = session.client.post(url, data=json.dumps(payload), headers=headers, verify=session.creds["verify_cert"],auth=(session.creds["idrac_username"],session.creds["idrac_password"]))
         data = response.json()
         try:
             get_all_devices = re.findall("Criticality.+BaseLocation",data["PackageList"])
@@ -5945,10 +6926,10 @@ def install_from_repository(script_examples="", get_fw_inventory="", get_repo_up
             print("\n")
       
     elif repository_update and reboot_needed == "yes" or reboot_needed == "no" and apply_update == "yes" or apply_update == "no":
-        if x_auth_token == "yes":
-            response = requests.get('https://%s/redfish/v1/Managers/iDRAC.Embedded.1/Jobs' % creds["idrac_ip"], verify=creds["verify_cert"],headers={'X-Auth-Token': creds["idrac_x_auth_token"]})    
+        if session.x_auth_token == "yes":
+            response = session.client.get('https://%s/redfish/v1/Managers/iDRAC.Embedded.1/Jobs' % session.creds["idrac_ip"], verify=session.creds["verify_cert"],headers={'X-Auth-Token': session.creds["idrac_x_auth_token"]})    
         else:
-            response = requests.get('https://%s/redfish/v1/Managers/iDRAC.Embedded.1/Jobs' % creds["idrac_ip"], verify=creds["verify_cert"],auth=(creds["idrac_username"], creds["idrac_password"]))
+            response = session.client.get('https://%s/redfish/v1/Managers/iDRAC.Embedded.1/Jobs' % session.creds["idrac_ip"], verify=session.creds["verify_cert"],auth=(session.creds["idrac_username"], session.creds["idrac_password"]))
         data = str(response.json())
         if response.status_code != 200:
             logging.error("\n- ERROR, GET command failed to get job queue details, status code %s returned, detailed error information:\n %s" % (response.status_code, data))
@@ -5958,7 +6939,7 @@ def install_from_repository(script_examples="", get_fw_inventory="", get_repo_up
         for i in jobid_search:
             i = i.strip("'")
             current_jobstore_job_ids.append(i)
-        url = 'https://%s/redfish/v1/Dell/Systems/System.Embedded.1/DellSoftwareInstallationService/Actions/DellSoftwareInstallationService.InstallFromRepository' % (creds["idrac_ip"])
+        url = 'https://%s/redfish/v1/Dell/Systems/System.Embedded.1/DellSoftwareInstallationService/Actions/DellSoftwareInstallationService.InstallFromRepository' % (session.creds["idrac_ip"])
         method = "InstallFromRepository"
         payload={}
         if apply_update.lower() == "yes":
@@ -5983,12 +6964,12 @@ def install_from_repository(script_examples="", get_fw_inventory="", get_repo_up
             payload["Password"] = share_password
         if ignore_certwarning:
             payload["IgnoreCertWarning"] = ignore_certwarning
-        if x_auth_token == "yes":
-            headers = {'content-type': 'application/json', 'X-Auth-Token': creds["idrac_x_auth_token"]}
-            response = requests.post(url, data=json.dumps(payload), headers=headers, verify=creds["verify_cert"])
+        if session.x_auth_token == "yes":
+            headers = {'content-type': 'application/json', 'X-Auth-Token': session.creds["idrac_x_auth_token"]}
+            response = session.client.post(url, data=json.dumps(payload), headers=headers, verify=session.creds["verify_cert"])
         else:
             headers = {'content-type': 'application/json'}
-            response = requests.post(url, data=json.dumps(payload), headers=headers, verify=creds["verify_cert"],auth=(creds["idrac_username"],creds["idrac_password"]))
+            response = session.client.post(url, data=json.dumps(payload), headers=headers, verify=session.creds["verify_cert"],auth=(session.creds["idrac_username"],session.creds["idrac_password"]))
         data = response.json()
         if response.status_code == 202:
             logging.info("\n- PASS: POST command passed for method \"%s\", status code %s returned" % (method, response.status_code))
@@ -6008,20 +6989,21 @@ def install_from_repository(script_examples="", get_fw_inventory="", get_repo_up
             print_message_count = 1
             start_time = datetime.now()
             time.sleep(1)
+            job_poller = JobPoller()
             while True:
                 count = 0
                 while count != 5:
                     try:
-                        if x_auth_token == "yes":
-                            response = requests.get('https://%s/redfish/v1/Managers/iDRAC.Embedded.1/Jobs/%s' % (creds["idrac_ip"], job_id_to_query), verify=creds["verify_cert"],headers={'X-Auth-Token': creds["idrac_x_auth_token"]})    
+                        if session.x_auth_token == "yes":
+                            response = session.client.get('https://%s/redfish/v1/Managers/iDRAC.Embedded.1/Jobs/%s' % (session.creds["idrac_ip"], job_id_to_query), verify=session.creds["verify_cert"],headers={'X-Auth-Token': session.creds["idrac_x_auth_token"]})    
                         else:
-                            response = requests.get('https://%s/redfish/v1/Managers/iDRAC.Embedded.1/Jobs/%s' % (creds["idrac_ip"], job_id_to_query), verify=creds["verify_cert"],auth=(creds["idrac_username"], creds["idrac_password"]))
+                            response = session.client.get('https://%s/redfish/v1/Managers/iDRAC.Embedded.1/Jobs/%s' % (session.creds["idrac_ip"], job_id_to_query), verify=session.creds["verify_cert"],auth=(session.creds["idrac_username"], session.creds["idrac_password"]))
                         break
                     except requests.ConnectionError as error_message:
                         logging.error("- ERROR, requests command failed to GET job status, detailed error information: \n%s" % error_message)
                         count += 1
-                        logging.info("- INFO, Script will wait 10 seconds and try to check job status again")
-                        time.sleep(10)
+                        logging.info("- INFO, script will wait and try to check job status again")
+                        job_poller.wait()
                         continue
                 if count == 5:
                     logging.error("- ERROR, unable to get job status after 5 attempts, script will exit")
@@ -6048,7 +7030,7 @@ def install_from_repository(script_examples="", get_fw_inventory="", get_repo_up
                     return
                 elif "Package successfully downloaded" in data['Message'] and print_message_count == 1:
                     logging.info("\n- INFO, repository package successfully downloaded. If version changed detected for any device, update job ID(s) will get created\n")
-                    time.sleep(5)
+                    job_poller.wait(response=response, data=data)
                     print_message_count = 2
                     
                 elif "completed successfully" in data['Message']:
@@ -6074,21 +7056,21 @@ def install_from_repository(script_examples="", get_fw_inventory="", get_repo_up
                     print("* Name: %s" % data['Name'])
                     print("* Job Status: %s" % data['Message'])
                     print("* Current job execution time: %s\n" % str(current_time)[0:7])
-                    time.sleep(15)
+                    job_poller.wait(response=response, data=data)
                     continue
         # Call function to check repo update job ID status
         loop_job_status(repo_job_id)
         if apply_update == "no":
             return
         # Code to get newly created update job ids
-        url = 'https://%s/redfish/v1/Dell/Systems/System.Embedded.1/DellSoftwareInstallationService/Actions/DellSoftwareInstallationService.GetRepoBasedUpdateList' % (creds["idrac_ip"])
+        url = 'https://%s/redfish/v1/Dell/Systems/System.Embedded.1/DellSoftwareInstallationService/Actions/DellSoftwareInstallationService.GetRepoBasedUpdateList' % (session.creds["idrac_ip"])
         payload={}
-        if x_auth_token == "yes":
-            headers = {'content-type': 'application/json', 'X-Auth-Token': creds["idrac_x_auth_token"]}
-            response = requests.post(url, data=json.dumps(payload), headers=headers, verify=creds["verify_cert"])
+        if session.x_auth_token == "yes":
+            headers = {'content-type': 'application/json', 'X-Auth-Token': session.creds["idrac_x_auth_token"]}
+            response = session.client.post(url, data=json.dumps(payload), headers=headers, verify=session.creds["verify_cert"])
         else:
             headers = {'content-type': 'application/json'}
-            response = requests.post(url, data=json.dumps(payload), headers=headers, verify=creds["verify_cert"],auth=(creds["idrac_username"],creds["idrac_password"]))
+            response = session.client.post(url, data=json.dumps(payload), headers=headers, verify=session.creds["verify_cert"],auth=(session.creds["idrac_username"],session.creds["idrac_password"]))
         data = response.json()
         if response.status_code == 200:
             logging.info("- PASS, GET command passed to get repo update list details")
@@ -6101,10 +7083,10 @@ def install_from_repository(script_examples="", get_fw_inventory="", get_repo_up
                 data = response.json()
                 logging.info("\n- Failure results:\n %s" % data)
                 return
-        if x_auth_token == "yes":
-            response = requests.get('https://%s/redfish/v1/Managers/iDRAC.Embedded.1/Jobs' % creds["idrac_ip"], verify=creds["verify_cert"],headers={'X-Auth-Token': creds["idrac_x_auth_token"]})    
+        if session.x_auth_token == "yes":
+            response = session.client.get('https://%s/redfish/v1/Managers/iDRAC.Embedded.1/Jobs' % session.creds["idrac_ip"], verify=session.creds["verify_cert"],headers={'X-Auth-Token': session.creds["idrac_x_auth_token"]})    
         else:
-            response = requests.get('https://%s/redfish/v1/Managers/iDRAC.Embedded.1/Jobs' % creds["idrac_ip"], verify=creds["verify_cert"],auth=(creds["idrac_username"], creds["idrac_password"]))
+            response = session.client.get('https://%s/redfish/v1/Managers/iDRAC.Embedded.1/Jobs' % session.creds["idrac_ip"], verify=session.creds["verify_cert"],auth=(session.creds["idrac_username"], session.creds["idrac_password"]))
         data = str(response.json())
         jobid_search = re.findall("JID_.+?'",data)
         if jobid_search == []:
@@ -6125,10 +7107,10 @@ def install_from_repository(script_examples="", get_fw_inventory="", get_repo_up
         time.sleep(30)
         # Code to check for scheduled update jobs
         for i in new_job_ids:
-            if x_auth_token == "yes":
-                response = requests.get('https://%s/redfish/v1/Managers/iDRAC.Embedded.1/Jobs/%s' % (creds["idrac_ip"], i), verify=creds["verify_cert"],headers={'X-Auth-Token': creds["idrac_x_auth_token"]})    
+            if session.x_auth_token == "yes":
+                response = session.client.get('https://%s/redfish/v1/Managers/iDRAC.Embedded.1/Jobs/%s' % (session.creds["idrac_ip"], i), verify=session.creds["verify_cert"],headers={'X-Auth-Token': session.creds["idrac_x_auth_token"]})    
             else:
-                response = requests.get('https://%s/redfish/v1/Managers/iDRAC.Embedded.1/Jobs/%s' % (creds["idrac_ip"], i), verify=creds["verify_cert"],auth=(creds["idrac_username"], creds["idrac_password"]))
+                response = session.client.get('https://%s/redfish/v1/Managers/iDRAC.Embedded.1/Jobs/%s' % (session.creds["idrac_ip"], i), verify=session.creds["verify_cert"],auth=(session.creds["idrac_username"], session.creds["idrac_password"]))
             if response.status_code != 200:
                 logging.error("\n- ERROR, GET command failed to check job status, status code %s returned" % response.status_code)
                 logging.error("Extended Info Message: {0}".format(req.json()))
@@ -6159,6 +7141,7 @@ def install_from_repository(script_examples="", get_fw_inventory="", get_repo_up
 
 def insert_eject_virtual_media(script_examples="", get_attach_status="", insert_virtual_media="", eject_virtual_media="", image_path=""):
     """Function to either get current virtual media attach status or insert/eject virtual media. With iDRAC 6.00.00 or newer you can now attach multiple virtual media devices at the same time based off index ID (see script examples for more help). Supported arguments and possible values: get_attach_status (supported value: True), insert_virtual_media (supported values: cd and removeabledisk (iDRAC 5.10.10 or older), 1 and 2 (iDRAC 6.00.00 or newer)), eject_virtual_media (supported values: cd and removeabledisk (iDRAC 5.10.10 or older), 1 and 2 (iDRAC 6.00.00 or newer)) and image_path (pass in image path location of the virtual device to insert. Supported network share types: HTTP, HTTPS, NFS and CIFS.""" 
+    session = get_script_session()
     if script_examples:
         print("""\n- IdracRedfishSupport.insert_eject_virtual_media(get_attach_status=True), this example will return current attach status details all virtual media devices.)
         \n- IdracRedfishSupport.insert_eject_virtual_media(insert_virtual_media="cd", image_path="192.168.0.120:/nfs/ESXi7.iso"), this example using iDRAC 5.10.10 will insert(attach) virtual media ISO image using NFS share.
@@ -6172,10 +7155,10 @@ def insert_eject_virtual_media(script_examples="", get_attach_status="", insert_
         \n- IdracRedfishSupport.insert_eject_virtual_media(eject_virtual_media=1), this example using iDRAC 6.00.00 shows ejecting virtual media index 1 device.
         \n- IdracRedfishSupport.insert_eject_virtual_media(eject_virtual_media=2), this example using iDRAC 6.00.00 shows ejecting virtual media index 2 device.""")
     else:
-        if x_auth_token == "yes":
-            response = requests.get('https://%s/redfish/v1/Managers/iDRAC.Embedded.1?$select=FirmwareVersion' % creds["idrac_ip"], verify=creds["verify_cert"],headers={'X-Auth-Token': creds["idrac_x_auth_token"]})    
+        if session.x_auth_token == "yes":
+            response = session.client.get('https://%s/redfish/v1/Managers/iDRAC.Embedded.1?$select=FirmwareVersion' % session.creds["idrac_ip"], verify=session.creds["verify_cert"],headers={'X-Auth-Token': session.creds["idrac_x_auth_token"]})    
         else:
-            response = requests.get('https://%s/redfish/v1/Managers/iDRAC.Embedded.1?$select=FirmwareVersion' % creds["idrac_ip"], verify=creds["verify_cert"],auth=(creds["idrac_username"], creds["idrac_password"]))
+            response = session.client.get('https://%s/redfish/v1/Managers/iDRAC.Embedded.1?$select=FirmwareVersion' % session.creds["idrac_ip"], verify=session.creds["verify_cert"],auth=(session.creds["idrac_username"], session.creds["idrac_password"]))
         data = response.json()
         if response.status_code == 401:
             logging.error("- ERROR, status code 401 detected, check to make sure your iDRAC script session has correct username/password credentials or if using X-auth token, confirm the session is still active.")
@@ -6191,15 +7174,15 @@ def insert_eject_virtual_media(script_examples="", get_attach_status="", insert_
     if get_attach_status:
         virtual_media_uris = []
         if iDRAC_version == "old":
-            if x_auth_token == "yes":
-                response = requests.get('https://%s/redfish/v1/Managers/iDRAC.Embedded.1/VirtualMedia?$expand=*($levels=1)' % creds["idrac_ip"], verify=creds["verify_cert"],headers={'X-Auth-Token': creds["idrac_x_auth_token"]})    
+            if session.x_auth_token == "yes":
+                response = session.client.get('https://%s/redfish/v1/Managers/iDRAC.Embedded.1/VirtualMedia?$expand=*($levels=1)' % session.creds["idrac_ip"], verify=session.creds["verify_cert"],headers={'X-Auth-Token': session.creds["idrac_x_auth_token"]})    
             else:
-                response = requests.get('https://%s/redfish/v1/Managers/iDRAC.Embedded.1/VirtualMedia?$expand=*($levels=1)' % creds["idrac_ip"], verify=creds["verify_cert"],auth=(creds["idrac_username"], creds["idrac_password"]))
+                response = session.client.get('https://%s/redfish/v1/Managers/iDRAC.Embedded.1/VirtualMedia?$expand=*($levels=1)' % session.creds["idrac_ip"], verify=session.creds["verify_cert"],auth=(session.creds["idrac_username"], session.creds["idrac_password"]))
         if iDRAC_version == "new":
-            if x_auth_token == "yes":
-                response = requests.get('https://%s/redfish/v1/Systems/System.Embedded.1/VirtualMedia?$expand=*($levels=1)' % creds["idrac_ip"], verify=creds["verify_cert"],headers={'X-Auth-Token': creds["idrac_x_auth_token"]})    
+            if session.x_auth_token == "yes":
+                response = session.client.get('https://%s/redfish/v1/Systems/System.Embedded.1/VirtualMedia?$expand=*($levels=1)' % session.creds["idrac_ip"], verify=session.creds["verify_cert"],headers={'X-Auth-Token': session.creds["idrac_x_auth_token"]})    
             else:
-                response = requests.get('https://%s/redfish/v1/Systems/System.Embedded.1/VirtualMedia?$expand=*($levels=1)' % creds["idrac_ip"], verify=creds["verify_cert"],auth=(creds["idrac_username"], creds["idrac_password"]))   
+                response = session.client.get('https://%s/redfish/v1/Systems/System.Embedded.1/VirtualMedia?$expand=*($levels=1)' % session.creds["idrac_ip"], verify=session.creds["verify_cert"],auth=(session.creds["idrac_username"], session.creds["idrac_password"]))   
         data = response.json()
         if response.status_code != 200:
             logging.error("\n- ERROR, GET command failed to get virtual media attach status details, status code %s returned" % response.status_code)
@@ -6213,21 +7196,21 @@ def insert_eject_virtual_media(script_examples="", get_attach_status="", insert_
     elif insert_virtual_media:
         if iDRAC_version == "old":
             if insert_virtual_media.lower() == "cd":
-                url = "https://%s/redfish/v1/Managers/iDRAC.Embedded.1/VirtualMedia/CD/Actions/VirtualMedia.InsertMedia" % creds["idrac_ip"]
+                url = "https://%s/redfish/v1/Managers/iDRAC.Embedded.1/VirtualMedia/CD/Actions/VirtualMedia.InsertMedia" % session.creds["idrac_ip"]
             elif insert_virtual_media.lower() == "removeabledisk":
-                url = "https://%s/redfish/v1/Managers/iDRAC.Embedded.1/VirtualMedia/RemovableDisk/Actions/VirtualMedia.InsertMedia" % creds["idrac_ip"]
+                url = "https://%s/redfish/v1/Managers/iDRAC.Embedded.1/VirtualMedia/RemovableDisk/Actions/VirtualMedia.InsertMedia" % session.creds["idrac_ip"]
             else:
                 logging.error("- FAIL, invalid value passed in for argument insert_virtual_media.")
                 return
         if iDRAC_version == "new":
-            url = "https://%s/redfish/v1/Systems/System.Embedded.1/VirtualMedia/%s/Actions/VirtualMedia.InsertMedia" % (creds["idrac_ip"], insert_virtual_media)
+            url = "https://%s/redfish/v1/Systems/System.Embedded.1/VirtualMedia/%s/Actions/VirtualMedia.InsertMedia" % (session.creds["idrac_ip"], insert_virtual_media)
         payload = {'Image': image_path, 'Inserted':True,'WriteProtected':True}
-        if x_auth_token == "yes":
-            headers = {'content-type': 'application/json', 'X-Auth-Token': creds["idrac_x_auth_token"]}
-            response = requests.post(url, data=json.dumps(payload), headers=headers, verify=creds["verify_cert"])
+        if session.x_auth_token == "yes":
+            headers = {'content-type': 'application/json', 'X-Auth-Token': session.creds["idrac_x_auth_token"]}
+            response = session.client.post(url, data=json.dumps(payload), headers=headers, verify=session.creds["verify_cert"])
         else:
             headers = {'content-type': 'application/json'}
-            response = requests.post(url, data=json.dumps(payload), headers=headers, verify=creds["verify_cert"],auth=(creds["idrac_username"],creds["idrac_password"]))
+            response = session.client.post(url, data=json.dumps(payload), headers=headers, verify=session.creds["verify_cert"],auth=(session.creds["idrac_username"],session.creds["idrac_password"]))
         data = response.__dict__
         if response.status_code != 204:
             logging.error("\n- FAIL, POST command failed to insert virtual media, detailed error message: %s" % response._content)
@@ -6238,21 +7221,21 @@ def insert_eject_virtual_media(script_examples="", get_attach_status="", insert_
     elif eject_virtual_media:
         if iDRAC_version == "old":
             if insert_virtual_media.lower() == "cd":
-                url = "https://%s/redfish/v1/Managers/iDRAC.Embedded.1/VirtualMedia/CD/Actions/VirtualMedia.EjectMedia" % creds["idrac_ip"]
+                url = "https://%s/redfish/v1/Managers/iDRAC.Embedded.1/VirtualMedia/CD/Actions/VirtualMedia.EjectMedia" % session.creds["idrac_ip"]
             elif insert_virtual_media.lower() == "removeabledisk":
-                url = "https://%s/redfish/v1/Managers/iDRAC.Embedded.1/VirtualMedia/RemovableDisk/Actions/VirtualMedia.EjectMedia" % creds["idrac_ip"]
+                url = "https://%s/redfish/v1/Managers/iDRAC.Embedded.1/VirtualMedia/RemovableDisk/Actions/VirtualMedia.EjectMedia" % session.creds["idrac_ip"]
             else:
                 logging.error("- FAIL, invalid value passed in for argument insert_virtual_media.")
                 return
         if iDRAC_version == "new":
-            url = "https://%s/redfish/v1/Systems/System.Embedded.1/VirtualMedia/%s/Actions/VirtualMedia.EjectMedia" % (creds["idrac_ip"], eject_virtual_media)
+            url = "https://%s/redfish/v1/Systems/System.Embedded.1/VirtualMedia/%s/Actions/VirtualMedia.EjectMedia" % (session.creds["idrac_ip"], eject_virtual_media)
         payload = {}
-        if x_auth_token == "yes":
-            headers = {'content-type': 'application/json', 'X-Auth-Token': creds["idrac_x_auth_token"]}
-            response = requests.post(url, data=json.dumps(payload), headers=headers, verify=creds["verify_cert"])
+        if session.x_auth_token == "yes":
+            headers = {'content-type': 'application/json', 'X-Auth-Token': session.creds["idrac_x_auth_token"]}
+            response = session.client.post(url, data=json.dumps(payload), headers=headers, verify=session.creds["verify_cert"])
         else:
             headers = {'content-type': 'application/json'}
-            response = requests.post(url, data=json.dumps(payload), headers=headers, verify=creds["verify_cert"],auth=(creds["idrac_username"],creds["idrac_password"]))
+            response = session.client.post(url, data=json.dumps(payload), headers=headers, verify=session.creds["verify_cert"],auth=(session.creds["idrac_username"],session.creds["idrac_password"]))
         data = response.__dict__
         if response.status_code != 204:
             logging.error("\n- FAIL, POST command failed to eject virtual media, detailed error message: %s" % response._content)
@@ -6262,21 +7245,21 @@ def insert_eject_virtual_media(script_examples="", get_attach_status="", insert_
 
 def change_disk_state_virtualdisk(script_examples="", disk="", state=""):
     """Function to change the PD state of a disk part of a virtual disk, either set the disk to offline or bring back online. NOTE: Only RAID volumes which support parity are supported for this feature. Supported function arguments: disk (possible value: pass in disk FQDD) and state (possible values: offline and online)."""
-    global job_id
+    session = get_script_session()
     if script_examples:
         print("""\n- IdracRedfishSupport.change_disk_state_virtualdisk(disk="Disk.Bay.0:Enclosure.Internal.0-1:RAID.SL.3-1",state="offline"), this example shows converting disk 0 to offline which is part of a RAID 5 volume.
         \n- IdracRedfishSupport.change_disk_state_virtualdisk(disk="Disk.Bay.1:Enclosure.Internal.0-1:RAID.SL.3-1",state="online"), this example shows converting disk 1 to online which is part of a RAID 5 volume.""")
         return
     elif disk and state:
         method = "ChangePDState"
-        url = 'https://%s/redfish/v1/Dell/Systems/System.Embedded.1/DellRaidService/Actions/DellRaidService.ChangePDState' % (creds["idrac_ip"])
+        url = 'https://%s/redfish/v1/Dell/Systems/System.Embedded.1/DellRaidService/Actions/DellRaidService.ChangePDState' % (session.creds["idrac_ip"])
         payload = {"State":state.title(),"TargetFQDD":disk}
-        if x_auth_token == "yes":
-            headers = {'content-type': 'application/json', 'X-Auth-Token': creds["idrac_x_auth_token"]}
-            response = requests.post(url, data=json.dumps(payload), headers=headers, verify=creds["verify_cert"])
+        if session.x_auth_token == "yes":
+            headers = {'content-type': 'application/json', 'X-Auth-Token': session.creds["idrac_x_auth_token"]}
+            response = session.client.post(url, data=json.dumps(payload), headers=headers, verify=session.creds["verify_cert"])
         else:
             headers = {'content-type': 'application/json'}
-            response = requests.post(url, data=json.dumps(payload), headers=headers, verify=creds["verify_cert"],auth=(creds["idrac_username"],creds["idrac_password"]))
+            response = session.client.post(url, data=json.dumps(payload), headers=headers, verify=session.creds["verify_cert"],auth=(session.creds["idrac_username"],session.creds["idrac_password"]))
         data = response.json()
         if response.status_code == 401:
             logging.error("- ERROR, status code 401 detected, check to make sure your iDRAC script session has correct username/password credentials or if using X-auth token, confirm the session is still active.")
@@ -6284,11 +7267,11 @@ def change_disk_state_virtualdisk(script_examples="", disk="", state=""):
         elif response.status_code == 200 or response.status_code == 202:
             logging.info("\n- PASS: POST command passed for %s, status code %s returned" % (method, response.status_code))
             try:
-                job_id = response.headers['Location'].split("/")[-1]
+                session.job_id = response.headers['Location'].split("/")[-1]
             except:
                 logging.error("- FAIL, unable to locate job ID in JSON headers output")
                 return
-            logging.info("- Job ID %s successfully created" % job_id)
+            logging.info("- Job ID %s successfully created" % session.job_id)
             loop_job_status_final()
         else:
             logging.error("\n- FAIL, POST command failed for %s, status code %s returned" % (method, response.status_code))
@@ -6301,28 +7284,28 @@ def change_disk_state_virtualdisk(script_examples="", disk="", state=""):
 
 def blink_unblink_storage_device(script_examples="", blink="", unblink=""):
     """Function to blink or unblink either hard drive or virtual disk. Possible function arguments: blink (pass in drive or virtual disk FQDD string) and unblink (pass in drive or virtual disk FQDD string)."""
-    global job_id
+    session = get_script_session()
     if script_examples:
         print("""\n- IdracRedfishSupport.blink_unblink_storage_device(blink="Disk.Bay.3:Enclosure.Internal.0-1:RAID.SL.3-1"), this example shows blinking disk 3.
         \n- IdracRedfishSupport.blink_unblink_storage_device(unblink="Disk.Virtual.0:RAID.SL.3-1"), this example shows unblink virtual disk 0.""")
         return
     elif blink:
-        url = 'https://%s/redfish/v1/Dell/Systems/System.Embedded.1/DellRaidService/Actions/DellRaidService.BlinkTarget' % (creds["idrac_ip"])
+        url = 'https://%s/redfish/v1/Dell/Systems/System.Embedded.1/DellRaidService/Actions/DellRaidService.BlinkTarget' % (session.creds["idrac_ip"])
         method = "BlinkTarget"
         payload = {"TargetFQDD":blink}
     elif unblink:
-        url = 'https://%s/redfish/v1/Dell/Systems/System.Embedded.1/DellRaidService/Actions/DellRaidService.UnBlinkTarget' % (creds["idrac_ip"])
+        url = 'https://%s/redfish/v1/Dell/Systems/System.Embedded.1/DellRaidService/Actions/DellRaidService.UnBlinkTarget' % (session.creds["idrac_ip"])
         method = "UnBlinkTarget"
         payload = {"TargetFQDD":unblink}
     else:
         logging.warning("- WARNING, missing arguments or incorrect argument values passed in. Check help text and script examples for more details")
         return
-    if x_auth_token == "yes":
-        headers = {'content-type': 'application/json', 'X-Auth-Token': creds["idrac_x_auth_token"]}
-        response = requests.post(url, data=json.dumps(payload), headers=headers, verify=creds["verify_cert"])
+    if session.x_auth_token == "yes":
+        headers = {'content-type': 'application/json', 'X-Auth-Token': session.creds["idrac_x_auth_token"]}
+        response = session.client.post(url, data=json.dumps(payload), headers=headers, verify=session.creds["verify_cert"])
     else:
         headers = {'content-type': 'application/json'}
-        response = requests.post(url, data=json.dumps(payload), headers=headers, verify=creds["verify_cert"],auth=(creds["idrac_username"],creds["idrac_password"]))
+        response = session.client.post(url, data=json.dumps(payload), headers=headers, verify=session.creds["verify_cert"],auth=(session.creds["idrac_username"],session.creds["idrac_password"]))
     data = response.json()
     if response.status_code == 200 or response.status_code == 202:
         logging.info("\n- PASS: POST command passed for %s, status code %s returned" % (method, response.status_code))
@@ -6334,20 +7317,20 @@ def blink_unblink_storage_device(script_examples="", blink="", unblink=""):
 
 def cancel_check_consistency_virtual_disk(script_examples="", virtual_disk_fqdd=""):
     """Function to cancel check consistency operation running on a virtual disk. Supported function argument: virtual_disk_fqdd (pass in virtual disk FQDD)."""
-    global job_id
+    session = get_script_session()
     if script_examples:
         print("""\n- IdracRedfishSupport.cancel_check_consistency_virtual_disk(virtual_disk_fqdd="Disk.Virtual.0:RAID.SL.3-1"), this example will cancel check consistency operation running on VD 0.""")
         return
     elif virtual_disk_fqdd:
         method = "CancelCheckConsistency"
-        url = 'https://%s/redfish/v1/Dell/Systems/System.Embedded.1/DellRaidService/Actions/DellRaidService.CancelCheckConsistency' % (creds["idrac_ip"])
+        url = 'https://%s/redfish/v1/Dell/Systems/System.Embedded.1/DellRaidService/Actions/DellRaidService.CancelCheckConsistency' % (session.creds["idrac_ip"])
         payload = {"TargetFQDD":virtual_disk_fqdd}
-        if x_auth_token == "yes":
-            headers = {'content-type': 'application/json', 'X-Auth-Token': creds["idrac_x_auth_token"]}
-            response = requests.post(url, data=json.dumps(payload), headers=headers, verify=creds["verify_cert"])
+        if session.x_auth_token == "yes":
+            headers = {'content-type': 'application/json', 'X-Auth-Token': session.creds["idrac_x_auth_token"]}
+            response = session.client.post(url, data=json.dumps(payload), headers=headers, verify=session.creds["verify_cert"])
         else:
             headers = {'content-type': 'application/json'}
-            response = requests.post(url, data=json.dumps(payload), headers=headers, verify=creds["verify_cert"],auth=(creds["idrac_username"],creds["idrac_password"]))
+            response = session.client.post(url, data=json.dumps(payload), headers=headers, verify=session.creds["verify_cert"],auth=(session.creds["idrac_username"],session.creds["idrac_password"]))
         data = response.json()
         if response.status_code == 401:
             logging.error("- ERROR, status code 401 detected, check to make sure your iDRAC script session has correct username/password credentials or if using X-auth token, confirm the session is still active.")
@@ -6355,11 +7338,11 @@ def cancel_check_consistency_virtual_disk(script_examples="", virtual_disk_fqdd=
         elif response.status_code == 200 or response.status_code == 202:
             logging.info("\n- PASS: POST command passed for %s, status code %s returned" % (method, response.status_code))
             try:
-                job_id = response.headers['Location'].split("/")[-1]
+                session.job_id = response.headers['Location'].split("/")[-1]
             except:
                 logging.error("- FAIL, unable to locate job ID in JSON headers output")
                 return
-            logging.info("- Job ID %s successfully created" % job_id)
+            logging.info("- Job ID %s successfully created" % session.job_id)
             loop_job_status_final()
         else:
             logging.error("\n- FAIL, POST command failed for %s, status code %s returned" % (method, response.status_code))
@@ -6372,14 +7355,14 @@ def cancel_check_consistency_virtual_disk(script_examples="", virtual_disk_fqdd=
 
 def expand_virtualdisk(script_examples="", pdisks="", expand="", size=""):
     """Function to expand storage virtual disk, either add a disk or expand current size. Supported function arguments: expand (pass in virtual disk FQDD), pdisks (possible value: Pass in disk(s) you want to add to the virtual disk. If you pass in multiple disk FQDDs use a comma separator between FQDDs.) and size (possible value: Pass in new VD size you want to expand to in MB)."""
-    global job_id
+    session = get_script_session()
     if script_examples:
         print("""\n- IdracRedfishSupport.expand_virtualdisk(expand="Disk.Virtual.0:RAID.SL.3-1", size="400000"), this example shows expanding VD 0 to 400GB in size. 
         \n- IdracRedfishSupport.expand_virtualdisk(expand="Disk.Virtual.2:RAID.SL.3-1", pdisks="Disk.Bay.3:Enclosure.Internal.0-1:RAID.SL.3-1"), this example shows expanding VD 2 by adding disk 3 to the VD.""")
         return
     elif expand:
         method = "OnlineCapacityExpansion"
-        url = 'https://%s/redfish/v1/Dell/Systems/System.Embedded.1/DellRaidService/Actions/DellRaidService.OnlineCapacityExpansion' % (creds["idrac_ip"])
+        url = 'https://%s/redfish/v1/Dell/Systems/System.Embedded.1/DellRaidService/Actions/DellRaidService.OnlineCapacityExpansion' % (session.creds["idrac_ip"])
         if pdisks:
             if "," in pdisks:
                 disk_list = pdisks.split(",")
@@ -6388,12 +7371,12 @@ def expand_virtualdisk(script_examples="", pdisks="", expand="", size=""):
                 payload = {"TargetFQDD": expand,  "PDArray": [pdisks]}   
         elif size:
             payload = {"TargetFQDD": expand,  "Size": int(size)}
-        if x_auth_token == "yes":
-            headers = {'content-type': 'application/json', 'X-Auth-Token': creds["idrac_x_auth_token"]}
-            response = requests.post(url, data=json.dumps(payload), headers=headers, verify=creds["verify_cert"])
+        if session.x_auth_token == "yes":
+            headers = {'content-type': 'application/json', 'X-Auth-Token': session.creds["idrac_x_auth_token"]}
+            response = session.client.post(url, data=json.dumps(payload), headers=headers, verify=session.creds["verify_cert"])
         else:
             headers = {'content-type': 'application/json'}
-            response = requests.post(url, data=json.dumps(payload), headers=headers, verify=creds["verify_cert"],auth=(creds["idrac_username"],creds["idrac_password"]))
+            response = session.client.post(url, data=json.dumps(payload), headers=headers, verify=session.creds["verify_cert"],auth=(session.creds["idrac_username"],session.creds["idrac_password"]))
         data = response.json()
         if response.status_code == 401:
             logging.error("- ERROR, status code 401 detected, check to make sure your iDRAC script session has correct username/password credentials or if using X-auth token, confirm the session is still active.")
@@ -6401,11 +7384,11 @@ def expand_virtualdisk(script_examples="", pdisks="", expand="", size=""):
         elif response.status_code == 200 or response.status_code == 202:
             logging.info("\n- PASS: POST command passed for %s, status code %s returned" % (method, response.status_code))
             try:
-                job_id = response.headers['Location'].split("/")[-1]
+                session.job_id = response.headers['Location'].split("/")[-1]
             except:
                 logging.error("- FAIL, unable to locate job ID in JSON headers output")
                 return
-            logging.info("- Job ID %s successfully created" % job_id)
+            logging.info("- Job ID %s successfully created" % session.job_id)
             loop_job_status_final()
         else:
             logging.error("\n- FAIL, POST command failed for %s, status code %s returned" % (method, response.status_code))
@@ -6418,25 +7401,25 @@ def expand_virtualdisk(script_examples="", pdisks="", expand="", size=""):
 
 def raidlevel_migration(script_examples="", pdisks="", migrate="", new_raid_level=""):
     """Function to add additional hard drive(s) to the existing RAID Level to migrate to a new RAID level. Supported function arguments: migrate (pass in virtual disk FQDD), pdisks (possible value: Pass in disk(s) you want to add to the virtual disk. If you pass in multiple disk FQDDs use a comma separator between FQDDs.) and new_raid_level (possible values: RAID0, RAID1, RAID5, RAID6, RAID10, RAID50 and RAID60)."""
-    global job_id
+    session = get_script_session()
     if script_examples:
         print("""\n- IdracRedfishSupport.raidlevel_migration(migrate="Disk.Virtual.0:RAID.SL.3-1", pdisks="Disk.Bay.3:Enclosure.Internal.0-1:RAID.SL.3-1", new_raid_level="RAID1"), this example shows adding disk 3 to VD 0 (RAID 0), migrate to create RAID 1 volume.""")
         return
     elif migrate:
         method = "RAIDLevelMigration"
-        url = 'https://%s/redfish/v1/Dell/Systems/System.Embedded.1/DellRaidService/Actions/DellRaidService.RAIDLevelMigration' % (creds["idrac_ip"])
+        url = 'https://%s/redfish/v1/Dell/Systems/System.Embedded.1/DellRaidService/Actions/DellRaidService.RAIDLevelMigration' % (session.creds["idrac_ip"])
         if pdisks:
             if "," in pdisks:
                 disk_list = pdisks.split(",")
                 payload = {"TargetFQDD": migrate, "PDArray": disk_list, "NewRaidLevel":new_raid_level.upper()}
             else:
                 payload = {"TargetFQDD": migrate, "PDArray": [pdisks], "NewRaidLevel":new_raid_level.upper()}   
-        if x_auth_token == "yes":
-            headers = {'content-type': 'application/json', 'X-Auth-Token': creds["idrac_x_auth_token"]}
-            response = requests.post(url, data=json.dumps(payload), headers=headers, verify=creds["verify_cert"])
+        if session.x_auth_token == "yes":
+            headers = {'content-type': 'application/json', 'X-Auth-Token': session.creds["idrac_x_auth_token"]}
+            response = session.client.post(url, data=json.dumps(payload), headers=headers, verify=session.creds["verify_cert"])
         else:
             headers = {'content-type': 'application/json'}
-            response = requests.post(url, data=json.dumps(payload), headers=headers, verify=creds["verify_cert"],auth=(creds["idrac_username"],creds["idrac_password"]))
+            response = session.client.post(url, data=json.dumps(payload), headers=headers, verify=session.creds["verify_cert"],auth=(session.creds["idrac_username"],session.creds["idrac_password"]))
         data = response.json()
         if response.status_code == 401:
             logging.error("- ERROR, status code 401 detected, check to make sure your iDRAC script session has correct username/password credentials or if using X-auth token, confirm the session is still active.")
@@ -6444,11 +7427,11 @@ def raidlevel_migration(script_examples="", pdisks="", migrate="", new_raid_leve
         elif response.status_code == 200 or response.status_code == 202:
             logging.info("\n- PASS: POST command passed for %s, status code %s returned" % (method, response.status_code))
             try:
-                job_id = response.headers['Location'].split("/")[-1]
+                session.job_id = response.headers['Location'].split("/")[-1]
             except:
                 logging.error("- FAIL, unable to locate job ID in JSON headers output")
                 return
-            logging.info("- Job ID %s successfully created" % job_id)
+            logging.info("- Job ID %s successfully created" % session.job_id)
             loop_job_status_final()
         else:
             logging.error("\n- FAIL, POST command failed for %s, status code %s returned" % (method, response.status_code))
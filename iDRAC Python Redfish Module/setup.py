@@ -13,7 +13,7 @@ LONG_DESCRIPTION = "Python module for iDRAC Redfish support to allow the user to
 # Setting up
 setup(
         name="IdracRedfishSupport", 
-        version="0.0.8",
+        version="0.0.9",
         license="GPLv2",
         author="Texas Roemer",
         author_email="texas_roemer@dell.com",
@@ -23,6 +23,7 @@ setup(
         packages=find_packages(),
         url="https://github.com/dell/iDRAC-Redfish-Scripting",
         install_requires=["requests",],
+        extras_require={"async": ["aiohttp"]},
         keywords=["python", "Redfish", "IDRAC"],
         scripts=["AssignHotSpareREDFISH.py","BiosChangePasswordREDFISH.py","BiosDeviceRecoveryREDFISH.py",
                  "BiosResetToDefaultsREDFISH.py","BlinkUnBlinkTargetREDFISH.py","BootToNetworkIsoOsdREDFISH.py",
@@ -39,7 +40,7 @@ setup(
                  "ExportSystemConfigurationLocalREDFISH.py","ExportSystemConfigurationNetworkShareREDFISH.py","ExportThermalHistoryREDFISH.py",
                  "ExportVideoLogREDFISH.py","FirmwareUpdateLocalRepoREDFISH.py","GenerateCsrREDFISH.py",
                  "GetAssemblyInventoryREDFISH.py","GetDHSDisksREDFISH.py","GetDeleteiDRACSessionsREDFISH.py",
-                 "GetDiskOperationREDFISH.py","GetEthernetInterfacesREDFISH.py","GetFirmwareInventoryREDFISH.py",
+                 "GetDiskOperationREDFISH.py","GetEthernetInterfacesREDFISH.py","GetFirmwareInventoryREDFISH.py","GetFleetInventoryREDFISH.py",
                  "GetIdracLcLogsREDFISH.py","GetIdracLcSystemAttributesREDFISH.py","GetIdracMessageRegistryREDFISH.py",
                  "GetIdracSelLogsREDFISH.py","GetIdracServerSlotInformationREDFISH.py","GetIdracServiceRootDetailsNoCredsREDFISH.py",
                  "GetNvDimmInventoryREDFISH.py","GetOSInformationREDFISH.py","GetOSNetworkInformationREDFISH.py",
@@ -52,10 +53,10 @@ setup(
                  "ImportSystemConfigurationNetworkShareREDFISH.py","ImportSystemConfigurationPreviewLocalFilenameREDFISH.py","InitializeVirtualDiskREDFISH.py",
                  "InsertEjectVirtualMediaREDFISH.py","InsertLclogCommentREDFISH.py","InstallFromRepositoryREDFISH.py",
                  "LCWipeREDFISH.py","LaunchIdracRemoteKvmHtmlSessionREDFISH.py","LockVirtualDiskREDFISH.py",
-                 "ManageIdracTimeREDFISH.py","PrepareToRemoveREDFISH.py","RaidLevelMigrationREDFISH.py",
+                 "ManageIdracTimeREDFISH.py","PrepareToRemoveREDFISH.py","QueryIdracLogsDatabaseREDFISH.py","RaidLevelMigrationREDFISH.py",
                  "ReKeyREDFISH.py","RemoveControllerKeyREDFISH.py","RenameVdREDFISH.py",
                  "ReplaceCsrREDFISH.py","ResetConfigStorageREDFISH.py","ResetIdracREDFISH.py",
-                 "ResetSslConfigREDFISH.py","RunDiagnosticsREDFISH.py","SecureBootCertificatesDbxREDFISH.py",
+                 "ResetSslConfigREDFISH.py","RunDiagnosticsREDFISH.py","RunScriptMultipleIdracsREDFISH.py","SecureBootCertificatesDbxREDFISH.py",
                  "SecureBootResetKeysREDFISH.py","SecureEraseDevicesREDFISH.py","SensorCollectionREDFISH.py",
                  "ServerVirtualAcPowerCycleREDFISH.py","SetBiosDefaultSettingsREDFISH.py","SetBootVdREDFISH.py",
                  "SetChassisIndicatorLedREDFISH.py","SetControllerKeyREDFISH.py","SetIdracLcSystemAttributesREDFISH.py",